@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Times `"key" in update` and `"key" in message`, the checks handlers do for every update,
+compared to the `__contains__` generated for every class before,
+which looked the key up in a list literal of all the fields and then did `hasattr` and `getattr`.
+
+The corpus are the recorded updates in `tests/data/updates.json`.
+Run from the repository root:
+
+    python -m benchmarks.contains [repeats]
+"""
+import json
+import os
+import sys
+import timeit
+
+from pytgbot.api_types import lazy_parsing
+from pytgbot.api_types.receivable.updates import Update
+
+__author__ = 'luckydonald'
+
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'updates.json')
+UPDATE_KEYS = ("callback_query", "inline_query", "edited_message", "message")
+MESSAGE_KEYS = ("sticker", "voice", "document", "location", "photo", "text", "reply_to_message", "from_peer")
+
+
+def old_contains(obj, key):
+    """ What the generated `__contains__` did. Python compiles its `key in [...]` list literal to a tuple like `_fields`. """
+    return (
+        key in obj._fields
+        and hasattr(obj, key)
+        and bool(getattr(obj, key, None))
+    )
+# end def
+
+
+def load_updates(lazy):
+    with open(CORPUS_PATH, 'r') as f:
+        corpus = json.load(f)
+    # end with
+    if not lazy:
+        return [Update.from_array(data) for data in corpus]
+    # end if
+    with lazy_parsing():
+        return [Update.from_array(data) for data in corpus]
+    # end with
+# end def
+
+
+def main(repeats=10000):
+    for lazy in (False, True):
+        updates = load_updates(lazy)
+        messages = [update.message for update in load_updates(lazy) if update.message is not None]
+        checks = len(updates) * len(UPDATE_KEYS) + len(messages) * len(MESSAGE_KEYS)
+
+        def new():
+            for update in updates:
+                for key in UPDATE_KEYS:
+                    key in update
+                # end for
+            # end for
+            for message in messages:
+                for key in MESSAGE_KEYS:
+                    key in message
+                # end for
+            # end for
+        # end def
+
+        def old():
+            for update in updates:
+                for key in UPDATE_KEYS:
+                    old_contains(update, key)
+                # end for
+            # end for
+            for message in messages:
+                for key in MESSAGE_KEYS:
+                    old_contains(message, key)
+                # end for
+            # end for
+        # end def
+
+        old()  # parses the lazy ones, so both time the same objects.
+        new_ns = min(timeit.repeat(new, number=repeats, repeat=3)) / repeats / checks * 1e9
+        old_ns = min(timeit.repeat(old, number=repeats, repeat=3)) / repeats / checks * 1e9
+        print("{mode} objects, {checks} checks:".format(mode="lazy parsed" if lazy else "parsed", checks=checks))
+        print("  list + hasattr + getattr: {ns:6.1f} ns per check".format(ns=old_ns))
+        print("  _field_set:               {ns:6.1f} ns per check ({factor:.1f}x)".format(ns=new_ns, factor=old_ns / new_ns))
+    # end for
+
+    with lazy_parsing():
+        update = Update.from_array({"update_id": 1, "message": {"message_id": 1, "date": 0, "chat": {"id": 1, "type": "private"}, "text": "Hi"}})
+    # end with
+    unparsed_ns = min(timeit.repeat(lambda: "message" in update, number=repeats * 100, repeat=3)) / (repeats * 100) * 1e9
+    print("still unparsed lazy update: {ns:6.1f} ns per check, parsed: {parsed}".format(ns=unparsed_ns, parsed=not update._lazy))
+# end def
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
+# end if
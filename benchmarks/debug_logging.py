@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Profiles the processing of a decoded `getUpdates` response with 100 updates, repeated from `tests/data/updates.json`,
+with debug logging disabled, as in production.
+Also shows what building the `"Trying to parse …"` debug message, like the bots did before without checking the log level,
+would add to that, as it is the `repr` of the whole result.
+Run from the repository root:
+
+    python -m benchmarks.debug_logging [repeats]
+"""
+import logging
+import sys
+import timeit
+
+from pytgbot.bot.synchronous import SyncBot
+from benchmarks.response_processing import load_response, UPDATES
+
+__author__ = 'luckydonald'
+
+
+def main(repeats=100):
+    logging.getLogger('pytgbot').setLevel(logging.INFO)
+    response = load_response()
+    bot = SyncBot('123:ABC')
+
+    def process():
+        bot._get_updates__process_result(bot._postprocess_request(None, None, response))
+    # end def
+
+    def debug_message():
+        "Trying to parse {data}".format(data=repr(response['result']))
+    # end def
+
+    process_us = min(timeit.repeat(process, number=repeats, repeat=3)) / repeats * 1e6
+    message_us = min(timeit.repeat(debug_message, number=repeats, repeat=3)) / repeats * 1e6
+    print("getUpdates with {n} updates, debug logging disabled:".format(n=UPDATES))
+    print("  processing:                 {us:8.1f} µs".format(us=process_us))
+    print("  building the debug message: {us:8.1f} µs (+{percent:.0f}%, no longer done)".format(
+        us=message_us, percent=message_us / process_us * 100,
+    ))
+# end def
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
+# end if
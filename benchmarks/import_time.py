@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Measures the cold start import time of the pytgbot entry points with `python -X importtime`, each in a new interpreter,
+and which of the heavy modules (the bot functions, the received types and the http transports) they load.
+`import pytgbot` and the api types alone shouldn't pull in any bot or transport.
+Run from the repository root:
+
+    python -m benchmarks.import_time [repeats]
+"""
+import subprocess
+import sys
+
+__author__ = 'luckydonald'
+
+
+ENTRY_POINTS = (
+    "pytgbot",
+    "pytgbot.api_types.sendable.reply_markup",
+    "pytgbot.api_types.receivable.updates",
+    "pytgbot.bot.synchronous",
+    "pytgbot.bot.asynchronous",
+)
+HEAVY_MODULES = ("pytgbot.bot.base", "pytgbot.api_types.receivable.updates", "requests", "httpx")
+
+
+def import_time(module):
+    """
+    :return: The cumulative import time in µs, and the heavy modules imported. `None, None` if it can't be imported.
+    :rtype: tuple
+    """
+    code = "import sys, {module}; print(','.join(m for m in {heavy!r} if m in sys.modules))".format(module=module, heavy=HEAVY_MODULES)
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True)
+    if process.returncode != 0:
+        return None, None
+    # end if
+    for line in reversed(process.stderr.splitlines()):
+        if line.endswith("| " + module):
+            return int(line.split("|")[1]), process.stdout.strip()
+        # end if
+    # end for
+    return None, None
+# end def
+
+
+def main(repeats=5):
+    print("cold start import time, best of {n}:".format(n=repeats))
+    for module in ENTRY_POINTS:
+        results = [import_time(module) for _ in range(repeats)]
+        if results[0][0] is None:
+            print("  {module:40} not importable here".format(module=module))
+            continue
+        # end if
+        print("  {module:40} {ms:6.1f} ms, loads: {heavy}".format(
+            module=module, ms=min(us for us, _ in results) / 1000, heavy=results[0][1] or "-",
+        ))
+    # end for
+# end def
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
+# end if
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the json codecs (see :mod:`pytgbot.json_codec`) installed here, for
+encoding the parameters of a big `answerInlineQuery` request (50 articles with keyboards, converted with `as_array(…)`),
+and decoding a `getUpdates` response with 100 updates, repeated from the recorded updates in `tests/data/updates.json`.
+Run from the repository root:
+
+    python -m benchmarks.json_codec [repeats]
+"""
+import json
+import os
+import sys
+import timeit
+
+from pytgbot.api_types import as_array
+from pytgbot.api_types.sendable.inline import InlineQueryResultArticle, InputTextMessageContent
+from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup, InlineKeyboardButton
+from pytgbot.json_codec import StdlibJsonCodec, OrjsonCodec, UjsonCodec
+
+__author__ = 'luckydonald'
+
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'updates.json')
+INLINE_RESULTS = 50  # the maximum `answerInlineQuery` takes
+UPDATES = 100  # the maximum `getUpdates` returns at once
+
+
+def get_codecs():
+    codecs = [StdlibJsonCodec()]
+    for codec_class in (UjsonCodec, OrjsonCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            print("{name}: not installed".format(name=codec_class.name))
+        # end try
+    # end for
+    return codecs
+# end def
+
+
+def inline_query_answer():
+    return {
+        'inline_query_id': '1234567890',
+        'results': [
+            InlineQueryResultArticle(
+                id=str(i), title='Result #{i} – „{i}“'.format(i=i),
+                input_message_content=InputTextMessageContent('<b>Result</b> #{i}: '.format(i=i) + 'lorem ipsum dolor ' * 20, parse_mode='HTML'),
+                reply_markup=InlineKeyboardMarkup([
+                    [InlineKeyboardButton('👍', callback_data='vote:{i}:up'.format(i=i)), InlineKeyboardButton('👎', callback_data='vote:{i}:down'.format(i=i))],
+                    [InlineKeyboardButton('Open', url='https://example.com/results/{i}'.format(i=i))],
+                ]),
+                description='The description of result #{i}'.format(i=i), thumb_url='https://example.com/thumbs/{i}.jpg'.format(i=i),
+            ) for i in range(INLINE_RESULTS)
+        ],
+        'cache_time': 300,
+    }
+# end def
+
+
+def get_updates_response():
+    with open(CORPUS_PATH, 'r') as f:
+        corpus = json.load(f)
+    # end with
+    result = [dict(corpus[i % len(corpus)], update_id=i) for i in range(UPDATES)]
+    return json.dumps({'ok': True, 'result': result}, ensure_ascii=False).encode('utf-8')
+# end def
+
+
+def main(repeats=200):
+    query = inline_query_answer()
+    response = get_updates_response()
+    print("answerInlineQuery with {n} results, getUpdates with {m} updates ({kb:.0f} KiB):".format(
+        n=INLINE_RESULTS, m=UPDATES, kb=len(response) / 1024.0,
+    ))
+    for codec in get_codecs():
+        encode = min(timeit.repeat(lambda: codec.dumps(as_array(query)), number=repeats, repeat=3))  # not cached, unlike `Sendable.to_json(…)`.
+        decode = min(timeit.repeat(lambda: codec.loads(response), number=repeats, repeat=3))
+        print("{name:>7}: encode {encode:8.1f} µs, decode {decode:8.1f} µs".format(
+            name=codec.name, encode=encode / repeats * 1e6, decode=decode / repeats * 1e6,
+        ))
+    # end for
+# end def
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
+# end if
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Compares parsing a `getUpdates` result eagerly, the default, against `lazy_updates=True`,
+for a handler only looking at `update.message.text` and the chat id, like most command handlers do.
+
+The corpus are the recorded updates in `tests/data/updates.json`
+(commands, messages with entities, photos, replies, callback queries, inline queries, member updates, channel posts),
+repeated to get a `getUpdates` sized batch.
+Run from the repository root:
+
+    python -m benchmarks.lazy_updates [batches]
+"""
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+from pytgbot.api_types import lazy_parsing
+from pytgbot.api_types.receivable.updates import Update
+
+__author__ = 'luckydonald'
+
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'updates.json')
+BATCH_SIZE = 100  # the maximum `getUpdates` returns at once
+
+
+def load_batch():
+    with open(CORPUS_PATH, 'r') as f:
+        corpus = json.load(f)
+    # end with
+    return [corpus[i % len(corpus)] for i in range(BATCH_SIZE)]
+# end def
+
+
+def handle(updates):
+    """
+    What a typical handler touches.
+    """
+    for update in updates:
+        message = update.message or update.edited_message or update.channel_post
+        if message is not None:
+            (message.text, message.chat.id)
+        # end if
+    # end for
+# end def
+
+
+def parse_eager(batch):
+    handle(Update.from_array_list(batch, list_level=1))
+# end def
+
+
+def parse_lazy(batch):
+    with lazy_parsing():
+        updates = Update.from_array_list(batch, list_level=1)
+    # end with
+    handle(updates)
+# end def
+
+
+def measure_allocations(function, batch):
+    """
+    :return: Peak of the memory allocated while parsing and handling, in KiB.
+    """
+    tracemalloc.start()
+    try:
+        function(batch)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # end try
+    return peak / 1024.0
+# end def
+
+
+def main(batches=200):
+    batch = load_batch()
+    for name, function in (("eager", parse_eager), ("lazy", parse_lazy)):
+        seconds = min(timeit.repeat(lambda: function(batch), number=batches, repeat=3))
+        print("{name:>6}: {us:8.1f} µs per batch of {size} updates, {kb:7.1f} KiB peak allocations".format(
+            name=name, us=seconds / batches * 1e6, size=len(batch), kb=measure_allocations(function, batch),
+        ))
+    # end for
+# end def
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
+# end if
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Shows how much memory an instance of every api type takes, with its fields in `__slots__`,
+compared to the same fields in a per-instance `__dict__`, how the types were stored before.
+
+Every field is set, as the generated `__init__` always sets all of them, even if only to `None`.
+The size is measured with `tracemalloc`, creating a lot of instances to average out the allocator.
+Run from the repository root:
+
+    python -m benchmarks.object_memory [instances]
+"""
+import inspect
+import sys
+import tracemalloc
+
+from pytgbot.api_types import TgBotApiObject
+from pytgbot.api_types.receivable import game, inline, media, passport, payments, peer, responses, service, stickers, updates
+from pytgbot.api_types.sendable import command, input_media, reply_markup
+from pytgbot.api_types.sendable import inline as sendable_inline, passport as sendable_passport, payments as sendable_payments
+
+__author__ = 'luckydonald'
+
+
+MODULES = [
+    game, inline, media, passport, payments, peer, responses, service, stickers, updates,
+    command, input_media, reply_markup, sendable_inline, sendable_passport, sendable_payments,
+]
+
+
+def get_fields(cls):
+    fields = []
+    for parent in reversed(cls.__mro__):
+        for name in parent.__dict__.get('__slots__', ()):
+            if name not in fields and name != '_lazy':  # `_lazy` is only set for lazily parsed objects.
+                fields.append(name)
+            # end if
+        # end for
+    # end for
+    return fields
+# end def
+
+
+def create_slotted(cls, fields):
+    instance = cls.__new__(cls)
+    for name in fields:
+        object.__setattr__(instance, name, None)
+    # end for
+    return instance
+# end def
+
+
+def create_with_dict(cls, fields):
+    instance = cls()
+    for name in fields:  # always the same order, like in `__init__`, so the instances share their dict keys.
+        setattr(instance, name, None)
+    # end for
+    return instance
+# end def
+
+
+def measure(create, cls, fields, instances):
+    """
+    :return: bytes per instance
+    """
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        keep = [create(cls, fields) for _ in range(instances)]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # end try
+    del keep
+    return (after - before) / float(instances)
+# end def
+
+
+def main(instances=10000):
+    classes = sorted({
+        cls for module in MODULES for cls in vars(module).values()
+        if inspect.isclass(cls) and issubclass(cls, TgBotApiObject) and cls.__module__ == module.__name__
+    }, key=lambda cls: (cls.__module__, cls.__name__))
+    print("{:<45} {:>6} {:>10} {:>10} {:>7}".format("class", "fields", "__dict__", "__slots__", "saved"))
+    total_dict = total_slots = 0.0
+    for cls in classes:
+        fields = get_fields(cls)
+        with_dict = type(cls.__name__, (object,), {})  # a fresh class, so the shared keys are those of this type only.
+        dict_size = measure(create_with_dict, with_dict, fields, instances)
+        slots_size = measure(create_slotted, cls, fields, instances)
+        total_dict += dict_size
+        total_slots += slots_size
+        print("{:<45} {:>6} {:>8.0f} B {:>8.0f} B {:>6.0%}".format(
+            cls.__module__.split('api_types.', 1)[-1] + '.' + cls.__name__, len(fields),
+            dict_size, slots_size, 1 - slots_size / dict_size,
+        ))
+    # end for
+    print("{:<45} {:>6} {:>8.0f} B {:>8.0f} B {:>6.0%}".format(
+        "average", "", total_dict / len(classes), total_slots / len(classes), 1 - total_slots / total_dict,
+    ))
+# end def
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
+# end if
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Compares serializing received messages again, as when forwarding their `entities` and `reply_markup` with a new message,
+building the json-like data field by field or reusing the data they were parsed from (`prefer_original=True`).
+
+The corpus are the recorded messages in `tests/data/updates.json`.
+Run from the repository root:
+
+    python -m benchmarks.prefer_original [repeats]
+"""
+import json
+import os
+import sys
+import timeit
+
+from pytgbot.api_types import as_array
+from pytgbot.api_types.receivable.updates import Update
+
+__author__ = 'luckydonald'
+
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'updates.json')
+
+
+def load_messages():
+    with open(CORPUS_PATH, 'r') as f:
+        corpus = json.load(f)
+    # end with
+    updates = [Update.from_array(update) for update in corpus]
+    return [update.message for update in updates if update.message]
+# end def
+
+
+def main(repeats=2000):
+    messages = load_messages()
+    baseline = None
+    for prefer_original in (False, True):
+        seconds = min(timeit.repeat(lambda: as_array(messages, prefer_original=prefer_original), number=repeats, repeat=3))
+        per_message = seconds / repeats / len(messages) * 1e6
+        baseline = baseline or per_message
+        print("prefer_original={prefer_original!s:5}: {us:6.2f} µs per message ({factor:.1f}x)".format(
+            prefer_original=prefer_original, us=per_message, factor=baseline / per_message,
+        ))
+    # end for
+# end def
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
+# end if
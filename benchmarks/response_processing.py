@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Profiles the processing of a decoded `getUpdates` response with 100 updates, repeated from `tests/data/updates.json`:
+Checking the response and parsing the result into `Update` objects, as the bot does after every request.
+Also shows what wrapping the whole response into a `DictObject` first, like the bots did before, would add to that.
+Run from the repository root:
+
+    python -m benchmarks.response_processing [repeats]
+"""
+import json
+import os
+import sys
+import timeit
+
+from DictObject import DictObject
+
+from pytgbot.bot.synchronous import SyncBot
+
+__author__ = 'luckydonald'
+
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'updates.json')
+UPDATES = 100  # the maximum `getUpdates` returns at once
+
+
+def load_response():
+    with open(CORPUS_PATH, 'r') as f:
+        corpus = json.load(f)
+    # end with
+    return {'ok': True, 'result': [dict(corpus[i % len(corpus)], update_id=i) for i in range(UPDATES)]}
+# end def
+
+
+def main(repeats=100):
+    response = load_response()
+    bot = SyncBot('123:ABC')
+
+    def process():
+        bot._get_updates__process_result(bot._postprocess_request(None, None, response))
+    # end def
+
+    def objectify():
+        DictObject.objectify(response)
+    # end def
+
+    process_us = min(timeit.repeat(process, number=repeats, repeat=3)) / repeats * 1e6
+    objectify_us = min(timeit.repeat(objectify, number=repeats, repeat=3)) / repeats * 1e6
+    print("getUpdates with {n} updates:".format(n=UPDATES))
+    print("  processing:                   {us:8.1f} µs".format(us=process_us))
+    print("  DictObject.objectify(…) pass: {us:8.1f} µs (+{percent:.0f}%, no longer done)".format(
+        us=objectify_us, percent=objectify_us / process_us * 100,
+    ))
+# end def
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
+# end if
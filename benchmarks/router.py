@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Compares routing updates with the `UpdateRouter` to checking one handler after another,
+like a chain of `if "message" in update and "photo" in update.message: …` does.
+There are 24 handlers: 8 commands, 10 message content types and 6 update types.
+
+The corpus are the recorded updates in `tests/data/updates.json`, repeated to get a `getUpdates` sized batch.
+Run from the repository root:
+
+    python -m benchmarks.router [batches]
+"""
+import json
+import os
+import sys
+import timeit
+
+from pytgbot.api_types.receivable.updates import Update
+from pytgbot.router import UpdateRouter, get_message_command
+
+__author__ = 'luckydonald'
+
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'updates.json')
+BATCH_SIZE = 100  # the maximum `getUpdates` returns at once
+
+COMMANDS = ("help", "settings", "about", "stats", "cancel", "stop", "language", "start")
+CONTENT_TYPES = ("sticker", "voice", "video", "document", "audio", "location", "contact", "poll", "photo", "text")
+UPDATE_TYPES = ("inline_query", "chosen_inline_result", "poll_answer", "my_chat_member", "callback_query", "message")
+
+
+def handle(update):
+    return update
+# end def
+
+
+def get_handlers():
+    """
+    :return: list of `(update_type, content_type, command)`, in the order a chain of `if`s would check them.
+    """
+    return (
+        [("message", None, command) for command in COMMANDS]
+        + [("message", content_type, None) for content_type in CONTENT_TYPES]
+        + [(update_type, None, None) for update_type in UPDATE_TYPES]
+    )
+# end def
+
+
+def check_each(handlers, update):
+    for update_type, content_type, command in handlers:
+        if update_type not in update:
+            continue
+        # end if
+        message = getattr(update, update_type)
+        if command is not None and get_message_command(message) != command:
+            continue
+        # end if
+        if content_type is not None and content_type not in message:
+            continue
+        # end if
+        return handle(update)
+    # end for
+    return None
+# end def
+
+
+def main(batches=200):
+    with open(CORPUS_PATH, 'r') as f:
+        corpus = json.load(f)
+    # end with
+    updates = [Update.from_array(corpus[i % len(corpus)]) for i in range(BATCH_SIZE)]
+    handlers = get_handlers()
+    router = UpdateRouter()
+    for update_type, content_type, command in handlers:
+        router.add_handler(handle, update_type, content_type=content_type, command=command)
+    # end for
+    assert [check_each(handlers, update) for update in updates] == [router(update) for update in updates]
+
+    def route_checking():
+        for update in updates:
+            check_each(handlers, update)
+        # end for
+    # end def
+
+    def route_router():
+        for update in updates:
+            router(update)
+        # end for
+    # end def
+
+    checking = min(timeit.repeat(route_checking, number=batches, repeat=3)) / batches / len(updates) * 1e6
+    routed = min(timeit.repeat(route_router, number=batches, repeat=3)) / batches / len(updates) * 1e6
+    print("{n} handlers:".format(n=len(handlers)))
+    print("  checking one after another: {us:6.2f} µs per update".format(us=checking))
+    print("  UpdateRouter:               {us:6.2f} µs per update ({factor:.1f}x)".format(us=routed, factor=checking / routed))
+# end def
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
+# end if
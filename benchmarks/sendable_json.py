@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Compares encoding the same keyboard (and a page of inline query results) for every request, as the bot did before,
+with the json cached by `Sendable.to_json(…)`, which is only checked for changes, and the one of a frozen keyboard.
+Run from the repository root:
+
+    python -m benchmarks.sendable_json [repeats]
+"""
+import sys
+import timeit
+
+from pytgbot.api_types import as_array
+from pytgbot.api_types.sendable.inline import InlineQueryResultArticle, InputTextMessageContent
+from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup, InlineKeyboardButton
+from pytgbot.bot.synchronous import SyncBot
+
+__author__ = 'luckydonald'
+
+
+INLINE_RESULTS = 50  # the maximum `answerInlineQuery` takes
+
+
+def keyboard():
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton(str(i * 4 + j), callback_data='page:{n}'.format(n=i * 4 + j)) for j in range(4)]
+        for i in range(3)
+    ] + [[InlineKeyboardButton('Open', url='https://example.com/')]])
+# end def
+
+
+def inline_results():
+    return [
+        InlineQueryResultArticle(
+            id=str(i), title='Result #{i}'.format(i=i), reply_markup=keyboard(),
+            input_message_content=InputTextMessageContent('<b>Result</b> #{i}'.format(i=i), parse_mode='HTML'),
+        ) for i in range(INLINE_RESULTS)
+    ]
+# end def
+
+
+def main(repeats=2000):
+    bot = SyncBot('123:ABC')
+    codec = bot.json_codec
+    for name, value in (('keyboard', keyboard()), ('{n} inline results'.format(n=INLINE_RESULTS), inline_results())):
+        encode = min(timeit.repeat(lambda: codec.dumps(as_array(value)), number=repeats, repeat=3))
+        cached = min(timeit.repeat(lambda: bot._encode_json(value), number=repeats, repeat=3))
+        frozen_value = [item.freeze() for item in value] if isinstance(value, list) else value.freeze()
+        frozen = min(timeit.repeat(lambda: bot._encode_json(frozen_value), number=repeats, repeat=3))
+        print("{name}: encoded {encode:8.1f} µs, cached {cached:8.1f} µs ({cached_factor:.0f}x), frozen {frozen:8.1f} µs ({frozen_factor:.0f}x)".format(
+            name=name, encode=encode / repeats * 1e6,
+            cached=cached / repeats * 1e6, cached_factor=encode / cached,
+            frozen=frozen / repeats * 1e6, frozen_factor=encode / frozen,
+        ))
+    # end for
+# end def
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
+# end if
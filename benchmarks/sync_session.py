@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Compares api calls per second of a fresh connection per request (the old `requests.post(…)`)
+against the pooled keep-alive session of the `SyncBot`, using a local stand-in server.
+
+Run from the repository root:
+
+    python -m benchmarks.sync_session [calls]
+"""
+import sys
+import timeit
+
+import requests
+
+from pytgbot.bot.synchronous import SyncBot
+from tests.fake_api_server import FakeApiServer
+
+__author__ = 'luckydonald'
+
+
+def main(calls=1000):
+    with FakeApiServer() as server:
+        bot = SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url)
+        url, params, files = bot._prepare_request('sendChatAction', {'chat_id': 1234, 'action': 'typing'})
+
+        def without_pool():
+            requests.post(url, params=params, files=files, verify=True, timeout=10).json()
+        # end def
+
+        def with_pool():
+            bot.do('sendChatAction', chat_id=1234, action='typing')
+        # end def
+
+        for name, func in (("requests.post", without_pool), ("SyncBot.session", with_pool)):
+            connections_before = server.connection_count
+            seconds = timeit.timeit(func, number=calls)
+            print("{name:>16}: {rate:8.1f} calls/s, {conn:5d} connections".format(
+                name=name, rate=calls / seconds, conn=server.connection_count - connections_before,
+            ))
+        # end for
+        bot.close()
+    # end with
+# end def
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
+# end if
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the peak memory (RSS) of uploading a big file with `requests.post(…, files=…)`,
+which builds the whole multipart body in memory, against the streaming upload of the `SyncBot`,
+using a local stand-in server.
+
+Every upload runs in a fresh process, as the peak RSS of a process never goes down again.
+Run from the repository root:
+
+    python -m benchmarks.upload_memory [megabytes]
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+__author__ = 'luckydonald'
+
+
+def get_peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0  # kilobytes on linux
+# end def
+
+
+def upload(mode, base_url, download_url, path):
+    """
+    Runs in the child process.
+    """
+    import requests
+
+    from pytgbot.api_types.sendable.files import InputFileFromDisk
+    from pytgbot.bot.synchronous import SyncBot
+
+    bot = SyncBot('123:ABC', base_url=base_url, download_url=download_url)
+    document = InputFileFromDisk(path, mime='application/octet-stream')
+    before = get_peak_rss_mb()
+    if mode == 'files':
+        url, params, files = bot._prepare_request('sendDocument', {'chat_id': 1234, 'document': document})
+        requests.post(url, params=params, files=files, timeout=60).json()
+    else:
+        bot.do('sendDocument', chat_id=1234, document=document)
+    # end if
+    print(get_peak_rss_mb() - before)
+# end def
+
+
+def main(megabytes=50):
+    from tests.fake_api_server import FakeApiServer
+
+    with tempfile.NamedTemporaryFile(suffix='.bin') as f:
+        chunk = os.urandom(1024 * 1024)
+        for _ in range(megabytes):
+            f.write(chunk)
+        # end for
+        f.flush()
+
+        with FakeApiServer(results={"sendDocument": True}) as server:
+            for name, mode in (("requests files=", "files"), ("SyncBot stream", "stream")):
+                output = subprocess.check_output([
+                    sys.executable, '-m', 'benchmarks.upload_memory', '--child', mode,
+                    server.base_url, server.download_url, f.name,
+                ])
+                print("{name:>16}: {mb:7.1f} MB peak RSS increase for a {size} MB file".format(
+                    name=name, mb=float(output), size=megabytes,
+                ))
+            # end for
+        # end with
+    # end with
+# end def
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        upload(*sys.argv[2:])
+    else:
+        main(*[int(arg) for arg in sys.argv[1:]])
+    # end if
+# end if
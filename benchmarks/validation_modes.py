@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the throughput of `Update.from_array(…)` with the different validation modes,
+see :func:`pytgbot.api_types.set_validation_mode`.
+Without the checks, the single pass `_from_array_trusted(…)` parsers are used instead of `validate_array(…)` and the constructor.
+
+The corpus are the recorded updates in `tests/data/updates.json`, repeated to get a `getUpdates` sized batch.
+Run from the repository root:
+
+    python -m benchmarks.validation_modes [batches]
+"""
+import json
+import os
+import sys
+import timeit
+
+from pytgbot.api_types import validation_mode, VALIDATION_STRICT, VALIDATION_TRUSTED, VALIDATION_OFF
+from pytgbot.api_types.receivable.updates import Update
+
+__author__ = 'luckydonald'
+
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'updates.json')
+BATCH_SIZE = 100  # the maximum `getUpdates` returns at once
+
+
+def load_batch():
+    with open(CORPUS_PATH, 'r') as f:
+        corpus = json.load(f)
+    # end with
+    return [corpus[i % len(corpus)] for i in range(BATCH_SIZE)]
+# end def
+
+
+def parse(batch):
+    for update in batch:
+        Update.from_array(update)
+    # end for
+# end def
+
+
+def main(batches=200):
+    batch = load_batch()
+    baseline = None
+    for mode in (VALIDATION_STRICT, VALIDATION_TRUSTED, VALIDATION_OFF):
+        with validation_mode(mode):
+            seconds = min(timeit.repeat(lambda: parse(batch), number=batches, repeat=3))
+        # end with
+        per_second = batches * len(batch) / seconds
+        baseline = baseline or per_second
+        print("{mode:>8}: {per_second:9.0f} updates per second ({factor:.2f}x)".format(
+            mode=mode, per_second=per_second, factor=per_second / baseline,
+        ))
+    # end for
+# end def
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
+# end if
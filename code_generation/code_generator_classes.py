@@ -972,6 +972,7 @@ class ReplacementBody(object):
     # noinspection PyShadowingBuiltins
     def __init__(
         self,
+        slots: Union[None, List[str]] = None,  # None: keep, empty list: remove, filled list: print every line
         before: Union[None, List[str]] = None,  # None: keep, empty list: remove, filled list: print every line
         init: Union[None, List[str]] = None,  # None: keep, empty list: remove, filled list: print every line
         to_array: Union[None, List[str]] = None,  # None: keep, empty list: remove, filled list: print every line
@@ -982,6 +983,7 @@ class ReplacementBody(object):
         contains: Union[None, List[str]] = None,  # None: keep, empty list: remove, filled list: print every line
         after: Union[None, List[str]] = None,  # None: keep, empty list: remove, filled list: print every line
     ):
+        self.slots = slots
         self.before = before
         self.init = init
         self.to_array = to_array
@@ -10,6 +10,7 @@ from luckydonaldUtils.interactions import answer, confirm
 from luckydonaldUtils.logger import logging
 
 from code_generator_settings import CLASS_TYPE_PATHS, CLASS_TYPE_PATHS__PARENT, WHITELISTED_FUNCS, WHITELISTED_CLASSES, CUSTOM_CLASSES
+from code_generator_settings import CLASS_BODY_ADDITIONS, SUBCLASS_DISCRIMINATORS
 from code_generator_template import path_to_import_text, split_path
 from jinja2.exceptions import TemplateError, TemplateSyntaxError
 
@@ -531,10 +532,43 @@ def preprocess_results(results: List[Union[Clazz, Function]], additional_items:
             logger.warning(f'Could not resolve parent class: {result.parent_clazz}')
         # end if
     # end for
+
+    logger.info('Calculating shared_to_array.')
+    for result in results:
+        if isinstance(result, Clazz):
+            result.shared_to_array = can_share_to_array(result, clazzes_by_name)
+        # end if
+    # end for
     return results
 # end def
 
 
+def can_share_to_array(clazz: Clazz, clazzes_by_name: Dict[str, Clazz]) -> bool:
+    """
+    If the class can use the `to_array` of `TgBotApiObject`, serializing the fields listed in its `_array_fields`,
+    instead of generating one with an `if` for every field.
+    That's not possible for fields with more than one type, as those need an `isinstance` check,
+    and for classes with a custom `to_array`, here or in a parent class, as the shared one serializes all the fields itself.
+
+    :param clazz: The class to check.
+    :param clazzes_by_name: All the classes by name, to look up the parent classes.
+    """
+    for variable in clazz.variables:
+        if len(variable.types) != 1 or variable.types[0].string == 'None':
+            return False
+        # end if
+    # end for
+    while clazz is not None:
+        body = getattr(clazz, 'body', None) or CLASS_BODY_ADDITIONS.get(clazz.clazz)
+        if body and body.to_array:
+            return False
+        # end if
+        clazz = clazzes_by_name.get(clazz.parent_clazz.string) if clazz.parent_clazz else None
+    # end while
+    return True
+# end def
+
+
 def output(folder, results, html_content=None):
     can_quit = False
     do_delete_first = confirm("Can the folder {path} be deleted before writing?".format(path=folder))
@@ -661,6 +695,9 @@ def safe_to_file(folder, results):
         if isinstance(result, Clazz):
             result.import_path = result.calculate_import_path()
             result.filepath = result.calculate_filepath(folder)
+            if result.clazz in CLASS_BODY_ADDITIONS:
+                result.body = CLASS_BODY_ADDITIONS[result.clazz]
+            # end if
             file_path = result.filepath
             if file_path not in clazzes:
                 clazzes[file_path] = []
@@ -722,7 +759,7 @@ def safe_to_file(folder, results):
         clazz_imports.sort()
         is_sendable = ("sendable" in path)
         try:
-            txt = clazzfile_template.render(clazzes=clazz_list, manual_clazzes=[], imports=clazz_imports, is_sendable=is_sendable)
+            txt = clazzfile_template.render(clazzes=clazz_list, manual_clazzes=[], imports=clazz_imports, is_sendable=is_sendable, discriminators=SUBCLASS_DISCRIMINATORS)
             txt = txt.replace("\t", "    ")
             render_file_to_disk(path, txt)
         except IOError:
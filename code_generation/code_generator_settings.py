@@ -259,7 +259,7 @@ Function "sendMessage" => "Message" will be replaced with "TextMessage".
 """
 
 from code_generator_classes import Clazz, Variable, Type, Import, CustomClazz, ReplacementBody
-from typing import Dict
+from typing import Dict, Tuple
 
 # noinspection PyCompatibility,PyDictCreation
 CUSTOM_CLASSES: Dict[str, CustomClazz] = {}
@@ -427,7 +427,7 @@ CUSTOM_CLASSES["pytgbot.api_types.receivable.updates.CallbackGame"] = CustomClaz
         before=[],
         init=None,
         to_array=[
-            'def to_array(self):',
+            'def to_array(self, prefer_original=False):',
             '    return {}',
             '# end def',
         ],
@@ -469,6 +469,9 @@ CUSTOM_CLASSES["pytgbot.api_types.receivable.sendable.inline.InlineQueryResult"]
         'Telegram clients currently support results of 20 types.'
     ),
     body=ReplacementBody(
+        slots=[
+            "__slots__ = ('id', 'type')",
+        ],
         before=[],
         init=[
             'def __init__(self, id, type):',
@@ -481,14 +484,7 @@ CUSTOM_CLASSES["pytgbot.api_types.receivable.sendable.inline.InlineQueryResult"]
             '    super(InlineQueryResult, self).__init__()',
             '# end def',
         ],
-        to_array=[
-            'def to_array(self):',
-            '    return {',
-            '        "type": u(self.type),',
-            '        "id": u(self.id),',
-            '    }',
-            '# end def to_array',
-        ],
+        to_array=[],  # the subclasses list `type` and `id` in their `_array_fields`.
         validate_array=[],
         from_array=[],
         str=[],
@@ -680,7 +676,7 @@ CUSTOM_CLASSES["pytgbot.api_types.receivable.sendable.input_media.InputMedia"] =
             '    :return: dictionary representation of this object.',
             '    :rtype: dict',
             '    """',
-            '    if prefer_original and self._raw:',
+            '    if prefer_original and self._raw and self._is_unmodified():',
             '        return self._raw',
             '    # end if',                                                                                                                                                                                             '    array = super(InputMedia, self).to_array()',
             '',
@@ -693,7 +689,7 @@ CUSTOM_CLASSES["pytgbot.api_types.receivable.sendable.input_media.InputMedia"] =
             '        array[\'parse_mode\'] = u(self.parse_mode)  # py2: type unicode, py3: type str',
             '    # end if',
             '    if self.caption_entities is not None:',
-            '        array[\'caption_entities\'] = self._as_array(self.caption_entities)  # type list of MessageEntity',
+            '        array[\'caption_entities\'] = self._as_array(self.caption_entities, prefer_original=prefer_original)  # type list of MessageEntity',
             '    # end if',
             '',
             '    return array',
@@ -848,14 +844,14 @@ CUSTOM_CLASSES["pytgbot.api_types.receivable.sendable.input_media.InputMediaWith
         ],
         init=None,
         to_array=[
-            'def to_array(self):',
+            'def to_array(self, prefer_original=False):',
             '    """',
             '    Serializes this InputMediaWithThumb to a dictionary.',
             '',
             '    :return: dictionary representation of this object.',
             '    :rtype: dict',
             '    """',
-            '    array = super(InputMediaWithThumb, self).to_array()',
+            '    array = super(InputMediaWithThumb, self).to_array(prefer_original=prefer_original)',
             '    # \'type\' is handled by superclass',
             '    array[\'media\'] = u(self.media)  # py2: type unicode, py3: type str',
             '    if self.caption is not None:',
@@ -1028,13 +1024,11 @@ CUSTOM_CLASSES["pytgbot.api_types.receivable.sendable.passport.PassportElementEr
     parameters=[],
     keywords=[],
     body=ReplacementBody(
-        before=[
-            'pass',
-        ],
+        before=[],
         init=[],
         to_array=[],
         validate_array=[],
-        from_array=[],
+        from_array=None,  # see SUBCLASS_DISCRIMINATORS
         str=[],
         repr=[],
         contains=[],
@@ -1294,13 +1288,16 @@ CUSTOM_CLASSES["pytgbot.api_types.TgBotApiObject"] = CustomClazz(
     parameters=[],
     keywords=[],
     body=ReplacementBody(
+        slots=[
+            "__slots__ = ('_raw', '_lazy')",
+        ],
         before=[
             'def __init__(self):',
             '    self._raw = None',
             '    super(TgBotApiObject, self).__init__()',
             '# end def __init__',
             '',
-            'def to_array(self):',
+            'def to_array(self, prefer_original=False):',
             '    array = dict()',
             '    return array',
             '# end def to_array',
@@ -1405,38 +1402,86 @@ CUSTOM_CLASSES["pytgbot.api_types.receivable.peer.ChatMember"] = CustomClazz(
         init=None,
         to_array=None,
         validate_array=None,
-        from_array=[
-            '@staticmethod',
-            'def from_array(array):',
-            '    """',
-            '    Deserialize the matching ChatMember subclass from a given dictionary.',
-            '',
-            '    :return: new ChatMember instance.',
-            '    :rtype: ChatMember',
-            '    """',
-            '    if not array:  # None or {}',
-            '        return None',
-            '    # end if',
-            '',
-            '    STATUS_TO_SUBCLASS_MAPPING = {',
-            '        "creator": ChatMemberOwner,',
-            '        "administrator": ChatMemberAdministrator,',
-            '        "member": ChatMemberMember,',
-            '        "restricted": ChatMemberRestricted,',
-            '        "left": ChatMemberLeft,',
-            '        "kicked": ChatMemberBanned,',
-            '    }',
-            '    assert "status" in array',
-            '    status = array["status"]',
-            '    assert status in STATUS_TO_SUBCLASS_MAPPING',
-            '    cls = STATUS_TO_SUBCLASS_MAPPING[status]',
-            '    instance = cls.from_array(array)',
-            '    return instance',
-            '# end def from_array',
-        ],
+        from_array=None,  # see SUBCLASS_DISCRIMINATORS
         str=None,
         repr=None,
         contains=None,
         after=None,
     ),
 )
+
+# Union types, where `from_array(…)` parses into the subclass given by the value of one field, with a single dict lookup:
+# {"Class": ("field", {"value": "Subclass"})}
+# `InlineQueryResult` isn't one, as e.g. the cached and the normal photo results both have the `type` "photo".
+SUBCLASS_DISCRIMINATORS: Dict[str, Tuple[str, Dict[str, str]]] = {
+    "ChatMember": ("status", {
+        "creator": "ChatMemberOwner",
+        "administrator": "ChatMemberAdministrator",
+        "member": "ChatMemberMember",
+        "restricted": "ChatMemberRestricted",
+        "left": "ChatMemberLeft",
+        "kicked": "ChatMemberBanned",
+    }),
+    "BotCommandScope": ("type", {
+        "default": "BotCommandScopeDefault",
+        "all_private_chats": "BotCommandScopeAllPrivateChats",
+        "all_group_chats": "BotCommandScopeAllGroupChats",
+        "all_chat_administrators": "BotCommandScopeAllChatAdministrators",
+        "chat": "BotCommandScopeChat",
+        "chat_administrators": "BotCommandScopeChatAdministrators",
+        "chat_member": "BotCommandScopeChatMember",
+    }),
+    "InputMedia": ("type", {
+        "photo": "InputMediaPhoto",
+        "video": "InputMediaVideo",
+        "animation": "InputMediaAnimation",
+        "audio": "InputMediaAudio",
+        "document": "InputMediaDocument",
+    }),
+    "PassportElementError": ("source", {
+        "data": "PassportElementErrorDataField",
+        "front_side": "PassportElementErrorFrontSide",
+        "reverse_side": "PassportElementErrorReverseSide",
+        "selfie": "PassportElementErrorSelfie",
+        "file": "PassportElementErrorFile",
+        "files": "PassportElementErrorFiles",
+        "translation_file": "PassportElementErrorTranslationFile",
+        "translation_files": "PassportElementErrorTranslationFiles",
+        "unspecified": "PassportElementErrorUnspecified",
+    }),
+}
+
+# Code added to classes generated from the api documentation, by class name. `None` keeps the generated parts, like with `CUSTOM_CLASSES`.
+CLASS_BODY_ADDITIONS: Dict[str, ReplacementBody] = {}
+
+CLASS_BODY_ADDITIONS["Update"] = ReplacementBody(
+    before=[],  # nothing, as there's nothing generated there either.
+    after=[
+        '@property',
+        'def update_type(self):',
+        '    """',
+        '    The type of this update, that\'s the name of the one optional field set, e.g. `"message"` or `"callback_query"`.',
+        '    `None` if none is set.',
+        '',
+        '    Received updates take it from the data they were parsed from, which has only that key besides `update_id`,',
+        '    instead of looking at every field. Lazily parsed updates aren\'t parsed for it.',
+        '',
+        '    :rtype: str | None',
+        '    """',
+        '    if self._raw:',
+        '        for key in self._raw:',
+        '            if key != \'update_id\':',
+        '                return key',
+        '            # end if',
+        '        # end for',
+        '        return None',
+        '    # end if',
+        '    for key in Update.__slots__:',
+        '        if key != \'update_id\' and getattr(self, key) is not None:',
+        '            return key',
+        '        # end if',
+        '    # end for',
+        '    return None',
+        '# end def update_type',
+    ],
+)
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 import logging
-from .bot import Bot
+from importlib import import_module
 
 __author__ = 'luckydonald'
 __version__ = "5.7"
@@ -14,3 +14,20 @@ logger = logging.getLogger(__name__)
 logger.debug('pytgbot version {pytgbot} (API {api}, {api_date})'.format(
     pytgbot=__version__, api=API_VERSION, api_date=API_DATE
 ))
+
+
+def __getattr__(name):
+    """
+    Imports `Bot` and the subpackages only on first access, so `import pytgbot` (or just `pytgbot.api_types`)
+    doesn't load all the bot functions and the `requests` transport with them.
+    """
+    if name == 'Bot':
+        from .bot import Bot
+        globals()['Bot'] = Bot
+        return Bot
+    # end if
+    if name in ('api_types', 'bot'):
+        return import_module('.' + name, __name__)
+    # end if
+    raise AttributeError('module {module!r} has no attribute {name!r}'.format(module=__name__, name=name))
+# end def
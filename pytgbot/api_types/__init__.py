@@ -1,17 +1,37 @@
 # -*- coding: utf-8 -*-
 import logging
+from contextlib import contextmanager
+from importlib import import_module
+from itertools import count
+from contextvars import ContextVar
 from json import dumps as _json_dumps
 from luckydonaldUtils.encoding import unicode_type, to_unicode as u
-# NOTE: `from . import receivable` import at the bottom of this file
 
 __author__ = 'luckydonald'
 __all__ = [
     'TgBotApiObject',
 ]
-__all__ += ["from_array_list", "as_array", "receivable"]
+__all__ += ["from_array_list", "as_array", "lazy_parsing", "receivable", "sendable"]
+__all__ += ["VALIDATION_STRICT", "VALIDATION_TRUSTED", "VALIDATION_OFF", "set_validation_mode", "get_validation_mode", "validation_mode"]
 logger = logging.getLogger(__name__)
 
 
+_parse_lazily = ContextVar('pytgbot_parse_lazily', default=False)  # see `lazy_parsing()`.
+_set_attribute = object.__setattr__  # skipping `TgBotApiObject.__setattr__`.
+_get_attribute = object.__getattribute__  # skipping `TgBotApiObject.__getattr__`, which parses lazy objects.
+_JSON_LEAF_TYPES = frozenset((str, int, float, bool))  # exact types only, e.g. `IntEnum`s still get checked by `_json_dumps`.
+_change_counter = count(1)  # stamps for `TgBotApiObject._changed`, see `_is_changed_since(…)`.
+_FROZEN = -1  # the `_changed` of frozen objects, older than any stamp.
+
+VALIDATION_STRICT = 'strict'  # check the types of all the values given to the constructors. The default.
+VALIDATION_TRUSTED = 'trusted'  # skip the checks for objects created by `from_array(…)`, `validate_array(…)` already converted those values.
+VALIDATION_OFF = 'off'  # never check, not even the objects you create yourself.
+VALIDATION_MODES = (VALIDATION_STRICT, VALIDATION_TRUSTED, VALIDATION_OFF)
+
+_validation_mode = VALIDATION_STRICT  # see `set_validation_mode(…)`.
+_validation_mode_override = ContextVar('pytgbot_validation_mode', default=None)  # see `validation_mode(…)`.
+
+
 class TgBotApiObject(object):
     """
     Base class for every api object class.
@@ -22,13 +42,49 @@ class TgBotApiObject(object):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('_raw', '_lazy', '_changed')  # every subclass lists its fields too, so the instances don't need a `__dict__`.
+
+    _set_field = staticmethod(_set_attribute)  # for the generated `_from_array_trusted(…)`, skipping `__setattr__`.
+    _fields = ()  # the names of all the fields, in api order. Generated for every class with fields, used by `__str__`.
+    _field_set = frozenset()  # the same, for `__contains__`. Also generated.
+    _api_names = {}  # the fields with a different name in the api data, like `{'from_peer': 'from'}`. Also generated.
+    _array_fields = ()  # for `to_array`, like `(('from_peer', 'from', None, True), …)`. Generated, if it can be shared.
+
     def __init__(self):
         self._raw = None
+        self._changed = None
         super(TgBotApiObject, self).__init__()
     # end def __init__
 
-    def to_array(self):
-        array = dict()
+    def to_array(self, prefer_original=False):
+        """
+        Serializes this object to a dictionary, with the fields listed in the generated `_array_fields`.
+        Those are `(name, api_name, conversion, optional)`, where `conversion` is `u`, `int`, `float` or `bool` for builtins,
+        `list` for lists (serialized with :func:`as_array`) and `None` for api objects (serialized with their `to_array`).
+        The few classes which need more (like fields with more than one type) still have their own generated `to_array`.
+
+        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
+        :type  prefer_original: bool
+
+        :return: dictionary representation of this object.
+        :rtype: dict
+        """
+        if prefer_original and self._raw and self._is_unmodified():
+            return self._raw
+        # end if
+        array = {}
+        for key, api_name, conversion, optional in self._array_fields:
+            value = getattr(self, key)
+            if value is None and optional:
+                continue
+            elif conversion is None:
+                array[api_name] = value.to_array(prefer_original=prefer_original)
+            elif conversion is list:
+                array[api_name] = as_array(value, prefer_original)
+            else:
+                array[api_name] = conversion(value)
+            # end if
+        # end for
         return array
     # end def to_array
 
@@ -50,6 +106,92 @@ class TgBotApiObject(object):
         return TgBotApiObject()
     # end def from_array
 
+    @classmethod
+    def from_array_lazy(cls, array):
+        """
+        Like `from_array(…)`, but the fields are only parsed from the given dictionary when they are first used,
+        and so are the fields of the objects in there.
+        A handler which only looks at `update.message.text` never spends any time on the users, entities or photos.
+
+            update = Update.from_array_lazy(data)  # nothing parsed yet
+            update.message.text  # parses the update, and then the message
+
+        :return: new instance, or a subclass of it, like `from_array(…)` would give.
+        """
+        with lazy_parsing():
+            return cls.from_array(array)
+        # end with
+    # end def from_array_lazy
+
+    @staticmethod
+    def _must_validate(raw=None):
+        """
+        If the constructor should check the types of the values it got, see :func:`set_validation_mode`.
+
+        :param raw: The `_raw` the constructor got. It's set when called by `from_array(…)`.
+        :type  raw: None | dict
+
+        :rtype: bool
+        """
+        mode = _validation_mode_override.get() or _validation_mode
+        if mode == VALIDATION_STRICT:
+            return True
+        # end if
+        if mode == VALIDATION_OFF:
+            return False
+        # end if
+        return raw is None
+    # end def
+
+    @staticmethod
+    def _is_parsing_lazily():
+        """
+        If `from_array(…)` should only create the object, but not parse the fields yet, see :func:`lazy_parsing`.
+        """
+        return _parse_lazily.get()
+    # end def
+
+    @classmethod
+    def _from_array_lazily(cls, array):
+        """
+        Creates an instance holding nothing but `_raw`, the fields are parsed on first access by :meth:`__getattr__`.
+        """
+        instance = cls.__new__(cls)
+        _set_attribute(instance, '_raw', array)
+        _set_attribute(instance, '_lazy', True)
+        return instance
+    # end def
+
+    def _parse_lazy(self):
+        """
+        Parses the fields of an instance created by :meth:`_from_array_lazily`, creating the contained objects lazily again.
+        """
+        _set_attribute(self, '_lazy', False)  # first, so nothing in here triggers parsing again.
+        array = self._raw
+        try:
+            with lazy_parsing():
+                data = self.validate_array(array)
+            # end with
+            data['_raw'] = array
+            self.__init__(**data)
+        except Exception:
+            _set_attribute(self, '_raw', array)  # `__init__` might have reset it already.
+            _set_attribute(self, '_lazy', True)
+            raise
+        # end try
+    # end def
+
+    def __getattr__(self, key):
+        """
+        Only called for attributes not set (yet). For lazily created instances those are the fields, so now is the time to parse them.
+        """
+        if key[0] != '_' and getattr(self, '_lazy', False):
+            self._parse_lazy()
+            return getattr(self, key)
+        # end if
+        raise AttributeError("{cls!r} object has no attribute {key!r}".format(cls=self.__class__.__name__, key=key))
+    # end def
+
     # # # # # # # # # # # # # #
     # helper functions below #
     # # # # # # # # # # # # #
@@ -88,21 +230,173 @@ class TgBotApiObject(object):
     # end def _builtin_from_array_list
 
     @staticmethod
-    def _as_array(obj):
+    def _as_array(obj, prefer_original=False):
         """
         Helper method to make :func:`as_array` available to all classes extending this,
         without the need for additional imports.
         """
-        return as_array(obj)
+        return as_array(obj, prefer_original)
     # end def
 
+    def _is_unmodified(self):
+        """
+        If this object still holds exactly the `_raw` data it was parsed from, so that can be sent as it is.
+
+        It doesn't, after any field was set (see :meth:`__setattr__`), here or in any object in here.
+        Changes inside a list (like `keyboard.inline_keyboard.pop()`) are found by comparing it to the list in `_raw`.
+
+        :rtype: bool
+        """
+        if getattr(self, '_raw', None) is None:
+            return False
+        # end if
+        try:
+            if _get_lazy(self):
+                return True  # the fields weren't even parsed yet.
+            # end if
+        except AttributeError:
+            pass  # not created lazily. Read from the slot directly, as `getattr(…)` would go through `__getattr__`.
+        # end try
+        raw = self._raw
+        for key in _get_field_names(self.__class__):
+            value = getattr(self, key, None)
+            if value is not None and type(value) not in _JSON_LEAF_TYPES and not _is_unmodified_value(value, raw.get(self._api_names.get(key, key))):
+                return False
+            # end if
+        # end for
+        return True
+    # end def
+
+    def freeze(self):
+        """
+        Makes this object, and all the objects in it, immutable.
+        Lists become tuples, and setting any field raises an `AttributeError`.
+
+        Frozen objects can be shared between threads, and are hashable by their values,
+        e.g. to use them as keys of a cache. The json of frozen :class:`pytgbot.api_types.sendable.Sendable` objects
+        is cached without any further checks, see :meth:`pytgbot.api_types.sendable.Sendable.to_json`.
+
+        :return: the object itself, for `KEYBOARD = InlineKeyboardMarkup(…).freeze()`.
+        :rtype: TgBotApiObject
+        """
+        if self._is_frozen():
+            return self
+        # end if
+        for key in _get_field_names(self.__class__):
+            value = getattr(self, key, None)  # this parses lazy objects.
+            frozen = _freeze_value(value)
+            if frozen is not value:
+                _set_attribute(self, key, frozen)
+            # end if
+        # end for
+        _set_attribute(self, '_changed', _FROZEN)
+        return self
+    # end def
+
+    def _is_frozen(self):
+        """
+        If :meth:`freeze` was called.
+
+        :rtype: bool
+        """
+        return getattr(self, '_changed', None) == _FROZEN
+    # end def
+
+    def _get_values(self):
+        """
+        :return: The values of all the fields.
+        :rtype: tuple
+        """
+        return tuple(getattr(self, key, None) for key in _get_field_names(self.__class__))
+    # end def
+
+    def __eq__(self, other):
+        """
+        Frozen objects are equal if their values are. The others only to themselves, like before.
+        """
+        if self is other:
+            return True
+        # end if
+        if type(other) is not type(self) or not self._is_frozen() or not other._is_frozen():
+            return NotImplemented
+        # end if
+        return self._get_values() == other._get_values()
+    # end def
+
+    def __hash__(self):
+        if not self._is_frozen():
+            return object.__hash__(self)
+        # end if
+        return hash((self.__class__, self._get_values()))
+    # end def
+
+    def __str__(self):
+        """
+        Implements `str(instance)`, listing all the `_fields`, e.g. `MessageEntity(type='bold', offset=0, length=4, url=None, user=None, language=None)`.
+        """
+        return "{clazz}({fields})".format(
+            clazz=self.__class__.__name__,
+            fields=", ".join("{key}={value!r}".format(key=key, value=getattr(self, key)) for key in self._fields),
+        )
+    # end def __str__
+
+    def __repr__(self):
+        """
+        Implements `repr(instance)`, with the `from_array(…)` of the data it was parsed from, if any.
+        """
+        if self._raw:
+            return "{clazz}.from_array({raw})".format(clazz=self.__class__.__name__, raw=self._raw)
+        # end if
+        return TgBotApiObject.__str__(self)
+    # end def __repr__
+
+    def __contains__(self, key):
+        """
+        Implements `"key" in instance`: If it's one of the `_fields`, and set to anything but `None`, `False`, `0` or empty.
+        Lazily parsed objects look into the data they'd be parsed from instead, so `"message" in update` doesn't parse anything.
+        """
+        if key not in self._field_set:
+            return False
+        # end if
+        try:
+            return bool(_get_attribute(self, key))
+        except AttributeError:  # not set, which skipped `__getattr__`, so lazy objects aren't parsed for that.
+            if getattr(self, '_lazy', False):
+                return bool(self._raw.get(self._api_names.get(key, key)))  # `from_array` gives the same truthiness, e.g. `None` for `{}`.
+            # end if
+            return False
+        # end try
+    # end def __contains__
+
     def __setattr__(self, key, value):
         """
         Remove `self._raw` if any other value is set.
+        So :meth:`to_array` with `prefer_original=True` and :func:`as_array` with `prefer_original=True`
+        only use `_raw` for objects (and the objects in there) which weren't changed, see :meth:`_is_unmodified`.
+
+        For objects which are part of a cached json (see :func:`_watch`) the change is stamped in `_changed`,
+        and frozen objects (see :meth:`freeze`) can't be changed at all.
         """
-        super(TgBotApiObject, self).__setattr__(key, value)
-        if not key.startswith('_') and hasattr(self, '_raw') and self._raw is not None:
-            self._raw = None
+        if key[0] == '_':
+            _set_attribute(self, key, value)
+            return
+        # end if
+        changed = getattr(self, '_changed', None)
+        if changed == _FROZEN:
+            raise AttributeError("{cls!r} object is frozen, can't set {key!r}".format(cls=self.__class__.__name__, key=key))
+        # end if
+        if getattr(self, '_raw', None) is None:
+            # nothing to invalidate, e.g. all the fields set in `__init__` before `_raw`.
+            _set_attribute(self, key, value)
+        else:
+            if getattr(self, '_lazy', False):
+                self._parse_lazy()  # the other fields still need the `_raw` data.
+            # end if
+            _set_attribute(self, key, value)
+            _set_attribute(self, '_raw', None)
+        # end if
+        if changed is not None:
+            _set_attribute(self, '_changed', next(_change_counter))  # after setting it, so no newer json has the old value.
         # end if
     # end def
 # end class
@@ -113,6 +407,159 @@ class TgBotApiObject(object):
 # # # # # # #
 
 
+_get_lazy = TgBotApiObject._lazy.__get__  # raises an `AttributeError` if not set.
+_field_names = {}  # class: tuple of the field names, see `_get_field_names(…)`.
+
+
+def _get_field_names(cls):
+    """
+    :return: The names of the fields of the given api type, from the `__slots__` of it and its parents.
+    :rtype: tuple of str
+    """
+    names = _field_names.get(cls)
+    if names is None:
+        names = tuple(
+            name for klass in reversed(cls.__mro__) for name in klass.__dict__.get('__slots__', ())
+            if name[0] != '_'
+        )
+        _field_names[cls] = names
+    # end if
+    return names
+# end def
+
+
+def _is_unmodified_value(value, raw):
+    """
+    If a field value has no api type object in it which was changed, see :meth:`TgBotApiObject._is_unmodified`.
+    Lists must still have the same items as the list in the `raw` data they were parsed from,
+    so objects must still be the ones parsed from there, and anything else equal.
+
+    :param raw: The part of the `_raw` data this value was parsed from.
+    """
+    if isinstance(value, TgBotApiObject):
+        return value._raw is raw and value._is_unmodified()
+    # end if
+    if isinstance(value, (list, tuple)):
+        if not isinstance(raw, list) or len(value) != len(raw):
+            return False
+        # end if
+        for item, raw_item in zip(value, raw):
+            if type(item) in _JSON_LEAF_TYPES:
+                if item != raw_item:
+                    return False
+                # end if
+            elif not _is_unmodified_value(item, raw_item):
+                return False
+            # end if
+        # end for
+    # end if
+    return True
+# end def
+
+
+def _freeze_value(value):
+    """
+    Freezes the api type objects in a field value, turning lists into tuples. See :meth:`TgBotApiObject.freeze`.
+    """
+    if isinstance(value, TgBotApiObject):
+        return value.freeze()
+    # end if
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_value(item) for item in value)
+    # end if
+    return value
+# end def
+
+
+def _watch(value, lists):
+    """
+    Makes the api type objects in that value (and the ones in those) stamp any change in `_changed`,
+    so a json cached for them can be checked with :func:`_is_changed_since`.
+    Changes inside of lists (`keyboard.inline_keyboard.pop()`) can't be stamped,
+    so the lists in there are added to `lists`, together with a copy of their items, for :func:`_is_any_list_changed`.
+
+    :type  lists: list of (list, tuple)
+    """
+    if isinstance(value, TgBotApiObject):
+        if value._is_frozen():
+            return  # those don't change.
+        # end if
+        for key in _get_field_names(value.__class__):
+            item = getattr(value, key, None)  # first, as this parses lazy objects, resetting `_changed`.
+            if item is not None and type(item) not in _JSON_LEAF_TYPES:
+                _watch(item, lists)
+            # end if
+        # end for
+        if getattr(value, '_changed', None) is None:
+            _set_attribute(value, '_changed', 0)
+        # end if
+    elif isinstance(value, (list, tuple)):
+        if isinstance(value, list):
+            lists.append((value, tuple(value)))
+        # end if
+        for item in value:
+            _watch(item, lists)
+        # end for
+    # end if
+# end def
+
+
+def _is_changed_since(value, stamp):
+    """
+    If any api type object in that value was changed after `stamp = next(_change_counter)` was taken.
+    Objects not watched (see :func:`_watch`) count as changed, they are new in there.
+    Changes inside of lists are checked by :func:`_is_any_list_changed` instead.
+
+    :type  stamp: int
+    :rtype: bool
+    """
+    if isinstance(value, TgBotApiObject):
+        changed = getattr(value, '_changed', None)
+        if changed == _FROZEN:
+            return False  # so is everything in there.
+        # end if
+        if changed is None or changed > stamp:
+            return True
+        # end if
+        for key in _get_field_names(value.__class__):
+            item = getattr(value, key, None)
+            if item is not None and type(item) not in _JSON_LEAF_TYPES and _is_changed_since(item, stamp):
+                return True
+            # end if
+        # end for
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            if _is_changed_since(item, stamp):
+                return True
+            # end if
+        # end for
+    # end if
+    return False
+# end def
+
+
+def _is_any_list_changed(lists):
+    """
+    If any of the lists collected by :func:`_watch` no longer holds exactly the same items, in the same order.
+    That's items added, removed, replaced or reordered.
+
+    :type  lists: list of (list, tuple)
+    :rtype: bool
+    """
+    for value, items in lists:
+        if len(value) != len(items):
+            return True
+        # end if
+        for item, old_item in zip(value, items):
+            if item is not old_item:
+                return True
+            # end if
+        # end for
+    # end for
+    return False
+# end def
+
+
 def from_array_list(required_type, result, list_level, is_builtin):
     """
     Tries to parse the `result` as type given in `required_type`, while traversing into lists as often as specified in `list_level`.
@@ -130,9 +577,11 @@ def from_array_list(required_type, result, list_level, is_builtin):
 
     :return: the result as `required_type` type
     """
-    logger.debug("Trying parsing as {type}, list_level={list_level}, is_builtin={is_builtin}".format(
-        type=required_type.__name__, list_level=list_level, is_builtin=is_builtin
-    ))
+    if logger.isEnabledFor(logging.DEBUG):  # called for every element of the lists.
+        logger.debug("Trying parsing as {type}, list_level={list_level}, is_builtin={is_builtin}".format(
+            type=required_type.__name__, list_level=list_level, is_builtin=is_builtin
+        ))
+    # end if
     if list_level > 0:
         assert isinstance(result, (list, tuple))
         return [from_array_list(required_type, obj, list_level-1, is_builtin) for obj in result]
@@ -154,18 +603,109 @@ def from_array_list(required_type, result, list_level, is_builtin):
 # end def _parse_builtin_type
 
 
-def as_array(obj):
+@contextmanager
+def lazy_parsing():
+    """
+    Within this context, `from_array(…)` of the received types creates objects parsing their fields only on first access.
+    See :meth:`TgBotApiObject.from_array_lazy`.
+
+        with lazy_parsing():
+            updates = Update.from_array_list(result, list_level=1)
+        # end with
+    """
+    token = _parse_lazily.set(True)
+    try:
+        yield
+    finally:
+        _parse_lazily.reset(token)
+    # end try
+# end def
+
+
+def _check_validation_mode(mode):
+    if mode not in VALIDATION_MODES:
+        raise ValueError("Unknown validation mode {mode!r}, must be one of {modes!r}.".format(mode=mode, modes=VALIDATION_MODES))
+    # end if
+    return mode
+# end def
+
+
+def set_validation_mode(mode):
+    """
+    Sets how much the constructors of the api types check the types of the values they get, for the whole program:
+
+    - `VALIDATION_STRICT` (`"strict"`): Always check, the default.
+    - `VALIDATION_TRUSTED` (`"trusted"`): Don't check the objects parsed from telegram's data with `from_array(…)`,
+      as `validate_array(…)` converts every value to the right type already. Objects you create yourself are checked.
+    - `VALIDATION_OFF` (`"off"`): Never check.
+
+    Use :func:`validation_mode` or the `validation_mode` of a bot to change it only for some code.
+
+    :param mode: One of `"strict"`, `"trusted"` or `"off"`.
+    :type  mode: str
+    """
+    global _validation_mode
+    _validation_mode = _check_validation_mode(mode)
+# end def
+
+
+def get_validation_mode():
+    """
+    :return: The validation mode used right now, see :func:`set_validation_mode`.
+    :rtype: str
+    """
+    return _validation_mode_override.get() or _validation_mode
+# end def
+
+
+@contextmanager
+def validation_mode(mode):
+    """
+    Within this context, the given validation mode is used instead of the one set by :func:`set_validation_mode`.
+
+        with validation_mode(VALIDATION_TRUSTED):
+            update = Update.from_array(data)
+        # end with
+
+    :param mode: One of `"strict"`, `"trusted"` or `"off"`, or `None` to not change anything.
+    :type  mode: None | str
+    """
+    if mode is None:
+        yield
+        return
+    # end if
+    token = _validation_mode_override.set(_check_validation_mode(mode))
+    try:
+        yield
+    finally:
+        _validation_mode_override.reset(token)
+    # end try
+# end def
+
+
+def as_array(obj, prefer_original=False):
     """
     Creates an json-like representation of a variable, supporting types with a `.to_array()` function.
 
+    :param prefer_original: If received objects which weren't changed (see :meth:`TgBotApiObject._is_unmodified`)
+                            should be represented by the `_raw` data they were parsed from, without building it again.
+                            That's the very same dictionary, don't modify it.
+    :type  prefer_original: bool
+
     :rtype: dict|list|str|int|float|bool|None
     """
-    if hasattr(obj, "to_array"):
+    if prefer_original and isinstance(obj, TgBotApiObject) and obj._is_unmodified():
+        return obj._raw
+    elif isinstance(obj, TgBotApiObject):
+        return obj.to_array(prefer_original=prefer_original)  # the unchanged objects in there can still use their `_raw`.
+    elif hasattr(obj, "to_array"):
         return obj.to_array()
     elif isinstance(obj, (list, tuple)):
-        return [as_array(x) for x in obj]
+        return [as_array(x, prefer_original) for x in obj]
     elif isinstance(obj, dict):
-        return {key: as_array(obj[key]) for key in obj.keys()}
+        return {key: as_array(obj[key], prefer_original) for key in obj.keys()}
+    elif obj is None or type(obj) in _JSON_LEAF_TYPES:  # the common case, nothing to check.
+        return obj
     else:
         _json_dumps(obj)  # raises error if is wrong json
         return obj
@@ -173,4 +713,13 @@ def as_array(obj):
 # end def
 
 
-from . import receivable  # bottom of file so TgBotApiObject is already defined.
+def __getattr__(name):
+    """
+    Imports the `receivable` and `sendable` subpackages on first access,
+    so e.g. using only the keyboards doesn't load all the received types.
+    """
+    if name in ('receivable', 'sendable'):
+        return import_module('.' + name, __name__)
+    # end if
+    raise AttributeError('module {module!r} has no attribute {name!r}'.format(module=__name__, name=name))
+# end def
@@ -2,10 +2,16 @@
 from luckydonaldUtils.exceptions import assert_type_or_raise
 from luckydonaldUtils.encoding import unicode_type, to_unicode as u
 from luckydonaldUtils.typing import JSONType
-from typing import TypeVar, Type, Union
+from typing import TypeVar, Type, Union, ContextManager
 
 __author__ = 'luckydonald'
 
+REQUIRED_TYPE = TypeVar('REQUIRED_TYPE')
+
+VALIDATION_STRICT: str
+VALIDATION_TRUSTED: str
+VALIDATION_OFF: str
+
 
 class TgBotApiObject(object):
     """
@@ -16,10 +22,26 @@ class TgBotApiObject(object):
     :param _raw: Optional. Original data this object was generated from. Could be `None`.
     :type  _raw: None | dict
     """
+    @classmethod
+    def from_array_lazy(cls: Type[REQUIRED_TYPE], array: JSONType) -> REQUIRED_TYPE: pass
+
+    @staticmethod
+    def _must_validate(raw: Union[None, dict] = None) -> bool: pass
+
+    def _is_unmodified(self) -> bool: pass
+
+    def freeze(self: REQUIRED_TYPE) -> REQUIRED_TYPE: pass
 # end class TgBotApiObject
 
 
-REQUIRED_TYPE = TypeVar('REQUIRED_TYPE')
 def from_array_list(required_type: Type[REQUIRED_TYPE], result: JSONType, list_level: int, is_builtin: bool) -> REQUIRED_TYPE: pass
 
-def as_array(obj: Union[TgBotApiObject, list, tuple, dict, JSONType]) -> JSONType: pass
+def lazy_parsing() -> ContextManager[None]: pass
+
+def set_validation_mode(mode: str) -> None: pass
+
+def get_validation_mode() -> str: pass
+
+def validation_mode(mode: Union[None, str]) -> ContextManager[None]: pass
+
+def as_array(obj: Union[TgBotApiObject, list, tuple, dict, JSONType], prefer_original: bool = False) -> JSONType: pass
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from importlib import import_module
 from luckydonaldUtils.encoding import unicode_type, to_unicode as u
 from luckydonaldUtils.exceptions import assert_type_or_raise
 from .. import TgBotApiObject
@@ -21,6 +22,8 @@ class Receivable(TgBotApiObject):
     :type  _raw: None | dict
     """
 
+    __slots__ = ()
+
     pass
 # end class Receivable
 
@@ -35,7 +38,25 @@ class Result(Receivable):
     :type  _raw: None | dict
     """
 
+    __slots__ = ()
+
     pass
 # end class Result
 
-from .updates import WebhookInfo
+_SUBMODULES = ("game", "inline", "media", "passport", "payments", "peer", "responses", "service", "stickers", "updates")
+
+
+def __getattr__(name):
+    """
+    Imports the submodules (and `WebhookInfo`) on first access only.
+    Importing one of them still imports the modules it needs for parsing, but not the others.
+    """
+    if name in _SUBMODULES:
+        return import_module('.' + name, __name__)
+    # end if
+    if name == 'WebhookInfo':
+        from .updates import WebhookInfo
+        return WebhookInfo
+    # end if
+    raise AttributeError('module {module!r} has no attribute {name!r}'.format(module=__name__, name=name))
+# end def
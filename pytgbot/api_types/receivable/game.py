@@ -34,6 +34,15 @@ class GameHighScore(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('position', 'user', 'score')
+    _fields = ('position', 'user', 'score')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('position', 'position', int, False),
+        ('user', 'user', None, False),
+        ('score', 'score', int, False),
+    )
+
     def __init__(self, position, user, score, _raw=None):
         """
         This object represents one row of the high scores table for a game.
@@ -59,40 +68,19 @@ class GameHighScore(Result):
         :type  _raw: None | dict
         """
         super(GameHighScore, self).__init__()
-        from .peer import User
-        assert_type_or_raise(position, int, parameter_name="position")
+        if self._must_validate(_raw):
+            from .peer import User
+            assert_type_or_raise(position, int, parameter_name="position")
+            assert_type_or_raise(user, User, parameter_name="user")
+            assert_type_or_raise(score, int, parameter_name="score")
+        # end if
         self.position = position
-        assert_type_or_raise(user, User, parameter_name="user")
         self.user = user
-        assert_type_or_raise(score, int, parameter_name="score")
         self.score = score
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this GameHighScore to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .peer import User
-        array = super(GameHighScore, self).to_array()
-
-        array['position'] = int(self.position)  # type int
-        array['user'] = self.user.to_array()  # type User
-        array['score'] = int(self.score)  # type int
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -121,37 +109,38 @@ class GameHighScore(Result):
         if not array:  # None or {}
             return None
         # end if
+        if GameHighScore._is_parsing_lazily():
+            return GameHighScore._from_array_lazily(array)
+        # end if
+        if not GameHighScore._must_validate(array):
+            return GameHighScore._from_array_trusted(array)
+        # end if
 
         data = GameHighScore.validate_array(array)
         data['_raw'] = array
         return GameHighScore(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(gamehighscore_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        return "GameHighScore(position={self.position!r}, user={self.user!r}, score={self.score!r})".format(self=self)
-    # end def __str__
+        Single pass version of :meth:`from_array`, building the GameHighScore without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __repr__(self):
-        """
-        Implements `repr(gamehighscore_instance)`
-        """
-        if self._raw:
-            return "GameHighScore.from_array({self._raw})".format(self=self)
-        # end if
-        return "GameHighScore(position={self.position!r}, user={self.user!r}, score={self.score!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in gamehighscore_instance`
+        :return: new GameHighScore instance.
+        :rtype: GameHighScore
         """
-        return (
-            key in ["position", "user", "score"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = GameHighScore._set_field
+        instance = GameHighScore.__new__(GameHighScore)
+        set_field(instance, 'position', int(get('position')))
+        set_field(instance, 'user', User.from_array(get('user')))
+        set_field(instance, 'score', int(get('score')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class GameHighScore
+
+
+# bottom of file, as those modules import this one too. Used by the `_from_array_trusted(…)` functions.
+from .peer import User
@@ -48,6 +48,19 @@ class InlineQuery(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('id', 'from_peer', 'query', 'offset', 'chat_type', 'location')
+    _fields = ('id', 'from_peer', 'query', 'offset', 'chat_type', 'location')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _api_names = {'from_peer': 'from'}  # the fields with a different name in the api data.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('id', 'id', u, False),
+        ('from_peer', 'from', None, False),
+        ('query', 'query', u, False),
+        ('offset', 'offset', u, False),
+        ('chat_type', 'chat_type', u, True),
+        ('location', 'location', None, True),
+    )
+
     def __init__(self, id, from_peer, query, offset, chat_type=None, location=None, _raw=None):
         """
         This object represents an incoming inline query.
@@ -85,55 +98,26 @@ class InlineQuery(Result):
         :type  _raw: None | dict
         """
         super(InlineQuery, self).__init__()
-        from .media import Location
-        from .peer import User
-        assert_type_or_raise(id, unicode_type, parameter_name="id")
+        if self._must_validate(_raw):
+            from .media import Location
+            from .peer import User
+            assert_type_or_raise(id, unicode_type, parameter_name="id")
+            assert_type_or_raise(from_peer, User, parameter_name="from_peer")
+            assert_type_or_raise(query, unicode_type, parameter_name="query")
+            assert_type_or_raise(offset, unicode_type, parameter_name="offset")
+            assert_type_or_raise(chat_type, None, unicode_type, parameter_name="chat_type")
+            assert_type_or_raise(location, None, Location, parameter_name="location")
+        # end if
         self.id = id
-        assert_type_or_raise(from_peer, User, parameter_name="from_peer")
         self.from_peer = from_peer
-        assert_type_or_raise(query, unicode_type, parameter_name="query")
         self.query = query
-        assert_type_or_raise(offset, unicode_type, parameter_name="offset")
         self.offset = offset
-        assert_type_or_raise(chat_type, None, unicode_type, parameter_name="chat_type")
         self.chat_type = chat_type
-        assert_type_or_raise(location, None, Location, parameter_name="location")
         self.location = location
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQuery to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .media import Location
-        from .peer import User
-        array = super(InlineQuery, self).to_array()
-
-        array['id'] = u(self.id)  # py2: type unicode, py3: type str
-        array['from'] = self.from_peer.to_array()  # type User
-        array['query'] = u(self.query)  # py2: type unicode, py3: type str
-        array['offset'] = u(self.offset)  # py2: type unicode, py3: type str
-        if self.chat_type is not None:
-            array['chat_type'] = u(self.chat_type)  # py2: type unicode, py3: type str
-        # end if
-        if self.location is not None:
-            array['location'] = self.location.to_array()  # type Location
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -166,39 +150,41 @@ class InlineQuery(Result):
         if not array:  # None or {}
             return None
         # end if
+        if InlineQuery._is_parsing_lazily():
+            return InlineQuery._from_array_lazily(array)
+        # end if
+        if not InlineQuery._must_validate(array):
+            return InlineQuery._from_array_trusted(array)
+        # end if
 
         data = InlineQuery.validate_array(array)
         data['_raw'] = array
         return InlineQuery(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(inlinequery_instance)`
-        """
-        return "InlineQuery(id={self.id!r}, from_peer={self.from_peer!r}, query={self.query!r}, offset={self.offset!r}, chat_type={self.chat_type!r}, location={self.location!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequery_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "InlineQuery.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQuery(id={self.id!r}, from_peer={self.from_peer!r}, query={self.query!r}, offset={self.offset!r}, chat_type={self.chat_type!r}, location={self.location!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the InlineQuery without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequery_instance`
+        :return: new InlineQuery instance.
+        :rtype: InlineQuery
         """
-        return (
-            key in ["id", "from_peer", "query", "offset", "chat_type", "location"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = InlineQuery._set_field
+        instance = InlineQuery.__new__(InlineQuery)
+        set_field(instance, 'id', u(get('id')))
+        set_field(instance, 'from_peer', User.from_array(get('from')))
+        set_field(instance, 'query', u(get('query')))
+        set_field(instance, 'offset', u(get('offset')))
+        value = get('chat_type')
+        set_field(instance, 'chat_type', u(value) if value is not None else None)
+        value = get('location')
+        set_field(instance, 'location', Location.from_array(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class InlineQuery
 
 
@@ -236,6 +222,18 @@ class ChosenInlineResult(UpdateType):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('result_id', 'from_peer', 'query', 'location', 'inline_message_id')
+    _fields = ('result_id', 'from_peer', 'query', 'location', 'inline_message_id')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _api_names = {'from_peer': 'from'}  # the fields with a different name in the api data.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('result_id', 'result_id', u, False),
+        ('from_peer', 'from', None, False),
+        ('query', 'query', u, False),
+        ('location', 'location', None, True),
+        ('inline_message_id', 'inline_message_id', u, True),
+    )
+
     def __init__(self, result_id, from_peer, query, location=None, inline_message_id=None, _raw=None):
         """
         Represents a result of an inline query that was chosen by the user and sent to their chat partner.
@@ -271,52 +269,24 @@ class ChosenInlineResult(UpdateType):
         :type  _raw: None | dict
         """
         super(ChosenInlineResult, self).__init__()
-        from .media import Location
-        from .peer import User
-        assert_type_or_raise(result_id, unicode_type, parameter_name="result_id")
+        if self._must_validate(_raw):
+            from .media import Location
+            from .peer import User
+            assert_type_or_raise(result_id, unicode_type, parameter_name="result_id")
+            assert_type_or_raise(from_peer, User, parameter_name="from_peer")
+            assert_type_or_raise(query, unicode_type, parameter_name="query")
+            assert_type_or_raise(location, None, Location, parameter_name="location")
+            assert_type_or_raise(inline_message_id, None, unicode_type, parameter_name="inline_message_id")
+        # end if
         self.result_id = result_id
-        assert_type_or_raise(from_peer, User, parameter_name="from_peer")
         self.from_peer = from_peer
-        assert_type_or_raise(query, unicode_type, parameter_name="query")
         self.query = query
-        assert_type_or_raise(location, None, Location, parameter_name="location")
         self.location = location
-        assert_type_or_raise(inline_message_id, None, unicode_type, parameter_name="inline_message_id")
         self.inline_message_id = inline_message_id
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ChosenInlineResult to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .media import Location
-        from .peer import User
-        array = super(ChosenInlineResult, self).to_array()
-
-        array['result_id'] = u(self.result_id)  # py2: type unicode, py3: type str
-        array['from'] = self.from_peer.to_array()  # type User
-        array['query'] = u(self.query)  # py2: type unicode, py3: type str
-        if self.location is not None:
-            array['location'] = self.location.to_array()  # type Location
-        # end if
-        if self.inline_message_id is not None:
-            array['inline_message_id'] = u(self.inline_message_id)  # py2: type unicode, py3: type str
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -348,37 +318,43 @@ class ChosenInlineResult(UpdateType):
         if not array:  # None or {}
             return None
         # end if
+        if ChosenInlineResult._is_parsing_lazily():
+            return ChosenInlineResult._from_array_lazily(array)
+        # end if
+        if not ChosenInlineResult._must_validate(array):
+            return ChosenInlineResult._from_array_trusted(array)
+        # end if
 
         data = ChosenInlineResult.validate_array(array)
         data['_raw'] = array
         return ChosenInlineResult(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(choseninlineresult_instance)`
-        """
-        return "ChosenInlineResult(result_id={self.result_id!r}, from_peer={self.from_peer!r}, query={self.query!r}, location={self.location!r}, inline_message_id={self.inline_message_id!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(choseninlineresult_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "ChosenInlineResult.from_array({self._raw})".format(self=self)
-        # end if
-        return "ChosenInlineResult(result_id={self.result_id!r}, from_peer={self.from_peer!r}, query={self.query!r}, location={self.location!r}, inline_message_id={self.inline_message_id!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the ChosenInlineResult without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in choseninlineresult_instance`
+        :return: new ChosenInlineResult instance.
+        :rtype: ChosenInlineResult
         """
-        return (
-            key in ["result_id", "from_peer", "query", "location", "inline_message_id"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = ChosenInlineResult._set_field
+        instance = ChosenInlineResult.__new__(ChosenInlineResult)
+        set_field(instance, 'result_id', u(get('result_id')))
+        set_field(instance, 'from_peer', User.from_array(get('from')))
+        set_field(instance, 'query', u(get('query')))
+        value = get('location')
+        set_field(instance, 'location', Location.from_array(value) if value is not None else None)
+        value = get('inline_message_id')
+        set_field(instance, 'inline_message_id', u(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class ChosenInlineResult
+
+
+# bottom of file, as those modules import this one too. Used by the `_from_array_trusted(…)` functions.
+from .media import Location
+from .peer import User
@@ -41,6 +41,8 @@ class Media(Receivable):
     :type  _raw: None | dict
     """
 
+    __slots__ = ()
+
     pass
 # end class Media
 
@@ -80,6 +82,18 @@ class MessageEntity(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('type', 'offset', 'length', 'url', 'user', 'language')
+    _fields = ('type', 'offset', 'length', 'url', 'user', 'language')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('offset', 'offset', int, False),
+        ('length', 'length', int, False),
+        ('url', 'url', u, True),
+        ('user', 'user', None, True),
+        ('language', 'language', u, True),
+    )
+
     def __init__(self, type, offset, length, url=None, user=None, language=None, _raw=None):
         """
         This object represents one special entity in a text message.
@@ -115,55 +129,25 @@ class MessageEntity(Result):
         :type  _raw: None | dict
         """
         super(MessageEntity, self).__init__()
-        from .peer import User
-        assert_type_or_raise(type, unicode_type, parameter_name="type")
+        if self._must_validate(_raw):
+            from .peer import User
+            assert_type_or_raise(type, unicode_type, parameter_name="type")
+            assert_type_or_raise(offset, int, parameter_name="offset")
+            assert_type_or_raise(length, int, parameter_name="length")
+            assert_type_or_raise(url, None, unicode_type, parameter_name="url")
+            assert_type_or_raise(user, None, User, parameter_name="user")
+            assert_type_or_raise(language, None, unicode_type, parameter_name="language")
+        # end if
         self.type = type
-        assert_type_or_raise(offset, int, parameter_name="offset")
         self.offset = offset
-        assert_type_or_raise(length, int, parameter_name="length")
         self.length = length
-        assert_type_or_raise(url, None, unicode_type, parameter_name="url")
         self.url = url
-        assert_type_or_raise(user, None, User, parameter_name="user")
         self.user = user
-        assert_type_or_raise(language, None, unicode_type, parameter_name="language")
         self.language = language
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this MessageEntity to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .peer import User
-        array = super(MessageEntity, self).to_array()
-
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        array['offset'] = int(self.offset)  # type int
-        array['length'] = int(self.length)  # type int
-        if self.url is not None:
-            array['url'] = u(self.url)  # py2: type unicode, py3: type str
-        # end if
-        if self.user is not None:
-            array['user'] = self.user.to_array()  # type User
-        # end if
-        if self.language is not None:
-            array['language'] = u(self.language)  # py2: type unicode, py3: type str
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -195,43 +179,48 @@ class MessageEntity(Result):
         if not array:  # None or {}
             return None
         # end if
+        if MessageEntity._is_parsing_lazily():
+            return MessageEntity._from_array_lazily(array)
+        # end if
+        if not MessageEntity._must_validate(array):
+            return MessageEntity._from_array_trusted(array)
+        # end if
 
         data = MessageEntity.validate_array(array)
         data['_raw'] = array
         return MessageEntity(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(messageentity_instance)`
-        """
-        return "MessageEntity(type={self.type!r}, offset={self.offset!r}, length={self.length!r}, url={self.url!r}, user={self.user!r}, language={self.language!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(messageentity_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "MessageEntity.from_array({self._raw})".format(self=self)
-        # end if
-        return "MessageEntity(type={self.type!r}, offset={self.offset!r}, length={self.length!r}, url={self.url!r}, user={self.user!r}, language={self.language!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the MessageEntity without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in messageentity_instance`
+        :return: new MessageEntity instance.
+        :rtype: MessageEntity
         """
-        return (
-            key in ["type", "offset", "length", "url", "user", "language"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = MessageEntity._set_field
+        instance = MessageEntity.__new__(MessageEntity)
+        set_field(instance, 'type', u(get('type')))
+        set_field(instance, 'offset', int(get('offset')))
+        set_field(instance, 'length', int(get('length')))
+        value = get('url')
+        set_field(instance, 'url', u(value) if value is not None else None)
+        value = get('user')
+        set_field(instance, 'user', User.from_array(value) if value is not None else None)
+        value = get('language')
+        set_field(instance, 'language', u(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class MessageEntity
 
 
 class DownloadableMedia(Media):
+    __slots__ = ()
+
     @staticmethod
     def validate_array(array):
         """
@@ -279,6 +268,17 @@ class PhotoSize(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'width', 'height', 'file_size')
+    _fields = ('file_id', 'file_unique_id', 'width', 'height', 'file_size')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('file_id', 'file_id', u, False),
+        ('file_unique_id', 'file_unique_id', u, False),
+        ('width', 'width', int, False),
+        ('height', 'height', int, False),
+        ('file_size', 'file_size', int, True),
+    )
+
     def __init__(self, file_id, file_unique_id, width, height, file_size=None, _raw=None):
         """
         This object represents one size of a photo or a file / sticker thumbnail.
@@ -310,46 +310,22 @@ class PhotoSize(Result):
         :type  _raw: None | dict
         """
         super(PhotoSize, self).__init__()
-        assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+        if self._must_validate(_raw):
+            assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+            assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
+            assert_type_or_raise(width, int, parameter_name="width")
+            assert_type_or_raise(height, int, parameter_name="height")
+            assert_type_or_raise(file_size, None, int, parameter_name="file_size")
+        # end if
         self.file_id = file_id
-        assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
         self.file_unique_id = file_unique_id
-        assert_type_or_raise(width, int, parameter_name="width")
         self.width = width
-        assert_type_or_raise(height, int, parameter_name="height")
         self.height = height
-        assert_type_or_raise(file_size, None, int, parameter_name="file_size")
         self.file_size = file_size
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this PhotoSize to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(PhotoSize, self).to_array()
-
-        array['file_id'] = u(self.file_id)  # py2: type unicode, py3: type str
-        array['file_unique_id'] = u(self.file_unique_id)  # py2: type unicode, py3: type str
-        array['width'] = int(self.width)  # type int
-        array['height'] = int(self.height)  # type int
-        if self.file_size is not None:
-            array['file_size'] = int(self.file_size)  # type int
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -379,39 +355,39 @@ class PhotoSize(Result):
         if not array:  # None or {}
             return None
         # end if
+        if PhotoSize._is_parsing_lazily():
+            return PhotoSize._from_array_lazily(array)
+        # end if
+        if not PhotoSize._must_validate(array):
+            return PhotoSize._from_array_trusted(array)
+        # end if
 
         data = PhotoSize.validate_array(array)
         data['_raw'] = array
         return PhotoSize(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(photosize_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        return "PhotoSize(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, width={self.width!r}, height={self.height!r}, file_size={self.file_size!r})".format(self=self)
-    # end def __str__
+        Single pass version of :meth:`from_array`, building the PhotoSize without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __repr__(self):
-        """
-        Implements `repr(photosize_instance)`
-        """
-        if self._raw:
-            return "PhotoSize.from_array({self._raw})".format(self=self)
-        # end if
-        return "PhotoSize(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, width={self.width!r}, height={self.height!r}, file_size={self.file_size!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in photosize_instance`
+        :return: new PhotoSize instance.
+        :rtype: PhotoSize
         """
-        return (
-            key in ["file_id", "file_unique_id", "width", "height", "file_size"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = PhotoSize._set_field
+        instance = PhotoSize.__new__(PhotoSize)
+        set_field(instance, 'file_id', u(get('file_id')))
+        set_field(instance, 'file_unique_id', u(get('file_unique_id')))
+        set_field(instance, 'width', int(get('width')))
+        set_field(instance, 'height', int(get('height')))
+        value = get('file_size')
+        set_field(instance, 'file_size', int(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class PhotoSize
 
 
@@ -458,6 +434,21 @@ class Animation(Media):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'width', 'height', 'duration', 'thumb', 'file_name', 'mime_type', 'file_size')
+    _fields = ('file_id', 'file_unique_id', 'width', 'height', 'duration', 'thumb', 'file_name', 'mime_type', 'file_size')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('file_id', 'file_id', u, False),
+        ('file_unique_id', 'file_unique_id', u, False),
+        ('width', 'width', int, False),
+        ('height', 'height', int, False),
+        ('duration', 'duration', int, False),
+        ('thumb', 'thumb', None, True),
+        ('file_name', 'file_name', u, True),
+        ('mime_type', 'mime_type', u, True),
+        ('file_size', 'file_size', int, True),
+    )
+
     def __init__(self, file_id, file_unique_id, width, height, duration, thumb=None, file_name=None, mime_type=None, file_size=None, _raw=None):
         """
         This object represents an animation file (GIF or H.264/MPEG-4 AVC video without sound).
@@ -501,64 +492,30 @@ class Animation(Media):
         :type  _raw: None | dict
         """
         super(Animation, self).__init__()
-        assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+        if self._must_validate(_raw):
+            assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+            assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
+            assert_type_or_raise(width, int, parameter_name="width")
+            assert_type_or_raise(height, int, parameter_name="height")
+            assert_type_or_raise(duration, int, parameter_name="duration")
+            assert_type_or_raise(thumb, None, PhotoSize, parameter_name="thumb")
+            assert_type_or_raise(file_name, None, unicode_type, parameter_name="file_name")
+            assert_type_or_raise(mime_type, None, unicode_type, parameter_name="mime_type")
+            assert_type_or_raise(file_size, None, int, parameter_name="file_size")
+        # end if
         self.file_id = file_id
-        assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
         self.file_unique_id = file_unique_id
-        assert_type_or_raise(width, int, parameter_name="width")
         self.width = width
-        assert_type_or_raise(height, int, parameter_name="height")
         self.height = height
-        assert_type_or_raise(duration, int, parameter_name="duration")
         self.duration = duration
-        assert_type_or_raise(thumb, None, PhotoSize, parameter_name="thumb")
         self.thumb = thumb
-        assert_type_or_raise(file_name, None, unicode_type, parameter_name="file_name")
         self.file_name = file_name
-        assert_type_or_raise(mime_type, None, unicode_type, parameter_name="mime_type")
         self.mime_type = mime_type
-        assert_type_or_raise(file_size, None, int, parameter_name="file_size")
         self.file_size = file_size
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this Animation to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(Animation, self).to_array()
-
-        array['file_id'] = u(self.file_id)  # py2: type unicode, py3: type str
-        array['file_unique_id'] = u(self.file_unique_id)  # py2: type unicode, py3: type str
-        array['width'] = int(self.width)  # type int
-        array['height'] = int(self.height)  # type int
-        array['duration'] = int(self.duration)  # type int
-        if self.thumb is not None:
-            array['thumb'] = self.thumb.to_array()  # type PhotoSize
-        # end if
-        if self.file_name is not None:
-            array['file_name'] = u(self.file_name)  # py2: type unicode, py3: type str
-        # end if
-        if self.mime_type is not None:
-            array['mime_type'] = u(self.mime_type)  # py2: type unicode, py3: type str
-        # end if
-        if self.file_size is not None:
-            array['file_size'] = int(self.file_size)  # type int
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -592,39 +549,46 @@ class Animation(Media):
         if not array:  # None or {}
             return None
         # end if
+        if Animation._is_parsing_lazily():
+            return Animation._from_array_lazily(array)
+        # end if
+        if not Animation._must_validate(array):
+            return Animation._from_array_trusted(array)
+        # end if
 
         data = Animation.validate_array(array)
         data['_raw'] = array
         return Animation(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(animation_instance)`
-        """
-        return "Animation(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, width={self.width!r}, height={self.height!r}, duration={self.duration!r}, thumb={self.thumb!r}, file_name={self.file_name!r}, mime_type={self.mime_type!r}, file_size={self.file_size!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(animation_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "Animation.from_array({self._raw})".format(self=self)
-        # end if
-        return "Animation(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, width={self.width!r}, height={self.height!r}, duration={self.duration!r}, thumb={self.thumb!r}, file_name={self.file_name!r}, mime_type={self.mime_type!r}, file_size={self.file_size!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the Animation without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in animation_instance`
+        :return: new Animation instance.
+        :rtype: Animation
         """
-        return (
-            key in ["file_id", "file_unique_id", "width", "height", "duration", "thumb", "file_name", "mime_type", "file_size"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = Animation._set_field
+        instance = Animation.__new__(Animation)
+        set_field(instance, 'file_id', u(get('file_id')))
+        set_field(instance, 'file_unique_id', u(get('file_unique_id')))
+        set_field(instance, 'width', int(get('width')))
+        set_field(instance, 'height', int(get('height')))
+        set_field(instance, 'duration', int(get('duration')))
+        value = get('thumb')
+        set_field(instance, 'thumb', PhotoSize.from_array(value) if value is not None else None)
+        value = get('file_name')
+        set_field(instance, 'file_name', u(value) if value is not None else None)
+        value = get('mime_type')
+        set_field(instance, 'mime_type', u(value) if value is not None else None)
+        value = get('file_size')
+        set_field(instance, 'file_size', int(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class Animation
 
 
@@ -671,6 +635,21 @@ class Audio(Media):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'duration', 'performer', 'title', 'file_name', 'mime_type', 'file_size', 'thumb')
+    _fields = ('file_id', 'file_unique_id', 'duration', 'performer', 'title', 'file_name', 'mime_type', 'file_size', 'thumb')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('file_id', 'file_id', u, False),
+        ('file_unique_id', 'file_unique_id', u, False),
+        ('duration', 'duration', int, False),
+        ('performer', 'performer', u, True),
+        ('title', 'title', u, True),
+        ('file_name', 'file_name', u, True),
+        ('mime_type', 'mime_type', u, True),
+        ('file_size', 'file_size', int, True),
+        ('thumb', 'thumb', None, True),
+    )
+
     def __init__(self, file_id, file_unique_id, duration, performer=None, title=None, file_name=None, mime_type=None, file_size=None, thumb=None, _raw=None):
         """
         This object represents an audio file to be treated as music by the Telegram clients.
@@ -714,68 +693,30 @@ class Audio(Media):
         :type  _raw: None | dict
         """
         super(Audio, self).__init__()
-        assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+        if self._must_validate(_raw):
+            assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+            assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
+            assert_type_or_raise(duration, int, parameter_name="duration")
+            assert_type_or_raise(performer, None, unicode_type, parameter_name="performer")
+            assert_type_or_raise(title, None, unicode_type, parameter_name="title")
+            assert_type_or_raise(file_name, None, unicode_type, parameter_name="file_name")
+            assert_type_or_raise(mime_type, None, unicode_type, parameter_name="mime_type")
+            assert_type_or_raise(file_size, None, int, parameter_name="file_size")
+            assert_type_or_raise(thumb, None, PhotoSize, parameter_name="thumb")
+        # end if
         self.file_id = file_id
-        assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
         self.file_unique_id = file_unique_id
-        assert_type_or_raise(duration, int, parameter_name="duration")
         self.duration = duration
-        assert_type_or_raise(performer, None, unicode_type, parameter_name="performer")
         self.performer = performer
-        assert_type_or_raise(title, None, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(file_name, None, unicode_type, parameter_name="file_name")
         self.file_name = file_name
-        assert_type_or_raise(mime_type, None, unicode_type, parameter_name="mime_type")
         self.mime_type = mime_type
-        assert_type_or_raise(file_size, None, int, parameter_name="file_size")
         self.file_size = file_size
-        assert_type_or_raise(thumb, None, PhotoSize, parameter_name="thumb")
         self.thumb = thumb
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this Audio to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(Audio, self).to_array()
-
-        array['file_id'] = u(self.file_id)  # py2: type unicode, py3: type str
-        array['file_unique_id'] = u(self.file_unique_id)  # py2: type unicode, py3: type str
-        array['duration'] = int(self.duration)  # type int
-        if self.performer is not None:
-            array['performer'] = u(self.performer)  # py2: type unicode, py3: type str
-        # end if
-        if self.title is not None:
-            array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        # end if
-        if self.file_name is not None:
-            array['file_name'] = u(self.file_name)  # py2: type unicode, py3: type str
-        # end if
-        if self.mime_type is not None:
-            array['mime_type'] = u(self.mime_type)  # py2: type unicode, py3: type str
-        # end if
-        if self.file_size is not None:
-            array['file_size'] = int(self.file_size)  # type int
-        # end if
-        if self.thumb is not None:
-            array['thumb'] = self.thumb.to_array()  # type PhotoSize
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -809,39 +750,48 @@ class Audio(Media):
         if not array:  # None or {}
             return None
         # end if
+        if Audio._is_parsing_lazily():
+            return Audio._from_array_lazily(array)
+        # end if
+        if not Audio._must_validate(array):
+            return Audio._from_array_trusted(array)
+        # end if
 
         data = Audio.validate_array(array)
         data['_raw'] = array
         return Audio(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(audio_instance)`
-        """
-        return "Audio(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, duration={self.duration!r}, performer={self.performer!r}, title={self.title!r}, file_name={self.file_name!r}, mime_type={self.mime_type!r}, file_size={self.file_size!r}, thumb={self.thumb!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(audio_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "Audio.from_array({self._raw})".format(self=self)
-        # end if
-        return "Audio(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, duration={self.duration!r}, performer={self.performer!r}, title={self.title!r}, file_name={self.file_name!r}, mime_type={self.mime_type!r}, file_size={self.file_size!r}, thumb={self.thumb!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the Audio without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in audio_instance`
+        :return: new Audio instance.
+        :rtype: Audio
         """
-        return (
-            key in ["file_id", "file_unique_id", "duration", "performer", "title", "file_name", "mime_type", "file_size", "thumb"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = Audio._set_field
+        instance = Audio.__new__(Audio)
+        set_field(instance, 'file_id', u(get('file_id')))
+        set_field(instance, 'file_unique_id', u(get('file_unique_id')))
+        set_field(instance, 'duration', int(get('duration')))
+        value = get('performer')
+        set_field(instance, 'performer', u(value) if value is not None else None)
+        value = get('title')
+        set_field(instance, 'title', u(value) if value is not None else None)
+        value = get('file_name')
+        set_field(instance, 'file_name', u(value) if value is not None else None)
+        value = get('mime_type')
+        set_field(instance, 'mime_type', u(value) if value is not None else None)
+        value = get('file_size')
+        set_field(instance, 'file_size', int(value) if value is not None else None)
+        value = get('thumb')
+        set_field(instance, 'thumb', PhotoSize.from_array(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class Audio
 
 
@@ -879,6 +829,18 @@ class Document(Media):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'thumb', 'file_name', 'mime_type', 'file_size')
+    _fields = ('file_id', 'file_unique_id', 'thumb', 'file_name', 'mime_type', 'file_size')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('file_id', 'file_id', u, False),
+        ('file_unique_id', 'file_unique_id', u, False),
+        ('thumb', 'thumb', None, True),
+        ('file_name', 'file_name', u, True),
+        ('mime_type', 'mime_type', u, True),
+        ('file_size', 'file_size', int, True),
+    )
+
     def __init__(self, file_id, file_unique_id, thumb=None, file_name=None, mime_type=None, file_size=None, _raw=None):
         """
         This object represents a general file (as opposed to photos, voice messages and audio files).
@@ -913,55 +875,24 @@ class Document(Media):
         :type  _raw: None | dict
         """
         super(Document, self).__init__()
-        assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+        if self._must_validate(_raw):
+            assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+            assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
+            assert_type_or_raise(thumb, None, PhotoSize, parameter_name="thumb")
+            assert_type_or_raise(file_name, None, unicode_type, parameter_name="file_name")
+            assert_type_or_raise(mime_type, None, unicode_type, parameter_name="mime_type")
+            assert_type_or_raise(file_size, None, int, parameter_name="file_size")
+        # end if
         self.file_id = file_id
-        assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
         self.file_unique_id = file_unique_id
-        assert_type_or_raise(thumb, None, PhotoSize, parameter_name="thumb")
         self.thumb = thumb
-        assert_type_or_raise(file_name, None, unicode_type, parameter_name="file_name")
         self.file_name = file_name
-        assert_type_or_raise(mime_type, None, unicode_type, parameter_name="mime_type")
         self.mime_type = mime_type
-        assert_type_or_raise(file_size, None, int, parameter_name="file_size")
         self.file_size = file_size
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this Document to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(Document, self).to_array()
-
-        array['file_id'] = u(self.file_id)  # py2: type unicode, py3: type str
-        array['file_unique_id'] = u(self.file_unique_id)  # py2: type unicode, py3: type str
-        if self.thumb is not None:
-            array['thumb'] = self.thumb.to_array()  # type PhotoSize
-        # end if
-        if self.file_name is not None:
-            array['file_name'] = u(self.file_name)  # py2: type unicode, py3: type str
-        # end if
-        if self.mime_type is not None:
-            array['mime_type'] = u(self.mime_type)  # py2: type unicode, py3: type str
-        # end if
-        if self.file_size is not None:
-            array['file_size'] = int(self.file_size)  # type int
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -992,39 +923,43 @@ class Document(Media):
         if not array:  # None or {}
             return None
         # end if
+        if Document._is_parsing_lazily():
+            return Document._from_array_lazily(array)
+        # end if
+        if not Document._must_validate(array):
+            return Document._from_array_trusted(array)
+        # end if
 
         data = Document.validate_array(array)
         data['_raw'] = array
         return Document(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(document_instance)`
-        """
-        return "Document(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, thumb={self.thumb!r}, file_name={self.file_name!r}, mime_type={self.mime_type!r}, file_size={self.file_size!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(document_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "Document.from_array({self._raw})".format(self=self)
-        # end if
-        return "Document(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, thumb={self.thumb!r}, file_name={self.file_name!r}, mime_type={self.mime_type!r}, file_size={self.file_size!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the Document without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in document_instance`
+        :return: new Document instance.
+        :rtype: Document
         """
-        return (
-            key in ["file_id", "file_unique_id", "thumb", "file_name", "mime_type", "file_size"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = Document._set_field
+        instance = Document.__new__(Document)
+        set_field(instance, 'file_id', u(get('file_id')))
+        set_field(instance, 'file_unique_id', u(get('file_unique_id')))
+        value = get('thumb')
+        set_field(instance, 'thumb', PhotoSize.from_array(value) if value is not None else None)
+        value = get('file_name')
+        set_field(instance, 'file_name', u(value) if value is not None else None)
+        value = get('mime_type')
+        set_field(instance, 'mime_type', u(value) if value is not None else None)
+        value = get('file_size')
+        set_field(instance, 'file_size', int(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class Document
 
 
@@ -1071,6 +1006,21 @@ class Video(Media):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'width', 'height', 'duration', 'thumb', 'file_name', 'mime_type', 'file_size')
+    _fields = ('file_id', 'file_unique_id', 'width', 'height', 'duration', 'thumb', 'file_name', 'mime_type', 'file_size')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('file_id', 'file_id', u, False),
+        ('file_unique_id', 'file_unique_id', u, False),
+        ('width', 'width', int, False),
+        ('height', 'height', int, False),
+        ('duration', 'duration', int, False),
+        ('thumb', 'thumb', None, True),
+        ('file_name', 'file_name', u, True),
+        ('mime_type', 'mime_type', u, True),
+        ('file_size', 'file_size', int, True),
+    )
+
     def __init__(self, file_id, file_unique_id, width, height, duration, thumb=None, file_name=None, mime_type=None, file_size=None, _raw=None):
         """
         This object represents a video file.
@@ -1114,64 +1064,30 @@ class Video(Media):
         :type  _raw: None | dict
         """
         super(Video, self).__init__()
-        assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+        if self._must_validate(_raw):
+            assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+            assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
+            assert_type_or_raise(width, int, parameter_name="width")
+            assert_type_or_raise(height, int, parameter_name="height")
+            assert_type_or_raise(duration, int, parameter_name="duration")
+            assert_type_or_raise(thumb, None, PhotoSize, parameter_name="thumb")
+            assert_type_or_raise(file_name, None, unicode_type, parameter_name="file_name")
+            assert_type_or_raise(mime_type, None, unicode_type, parameter_name="mime_type")
+            assert_type_or_raise(file_size, None, int, parameter_name="file_size")
+        # end if
         self.file_id = file_id
-        assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
         self.file_unique_id = file_unique_id
-        assert_type_or_raise(width, int, parameter_name="width")
         self.width = width
-        assert_type_or_raise(height, int, parameter_name="height")
         self.height = height
-        assert_type_or_raise(duration, int, parameter_name="duration")
         self.duration = duration
-        assert_type_or_raise(thumb, None, PhotoSize, parameter_name="thumb")
         self.thumb = thumb
-        assert_type_or_raise(file_name, None, unicode_type, parameter_name="file_name")
         self.file_name = file_name
-        assert_type_or_raise(mime_type, None, unicode_type, parameter_name="mime_type")
         self.mime_type = mime_type
-        assert_type_or_raise(file_size, None, int, parameter_name="file_size")
         self.file_size = file_size
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this Video to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(Video, self).to_array()
-
-        array['file_id'] = u(self.file_id)  # py2: type unicode, py3: type str
-        array['file_unique_id'] = u(self.file_unique_id)  # py2: type unicode, py3: type str
-        array['width'] = int(self.width)  # type int
-        array['height'] = int(self.height)  # type int
-        array['duration'] = int(self.duration)  # type int
-        if self.thumb is not None:
-            array['thumb'] = self.thumb.to_array()  # type PhotoSize
-        # end if
-        if self.file_name is not None:
-            array['file_name'] = u(self.file_name)  # py2: type unicode, py3: type str
-        # end if
-        if self.mime_type is not None:
-            array['mime_type'] = u(self.mime_type)  # py2: type unicode, py3: type str
-        # end if
-        if self.file_size is not None:
-            array['file_size'] = int(self.file_size)  # type int
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1205,39 +1121,46 @@ class Video(Media):
         if not array:  # None or {}
             return None
         # end if
+        if Video._is_parsing_lazily():
+            return Video._from_array_lazily(array)
+        # end if
+        if not Video._must_validate(array):
+            return Video._from_array_trusted(array)
+        # end if
 
         data = Video.validate_array(array)
         data['_raw'] = array
         return Video(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(video_instance)`
-        """
-        return "Video(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, width={self.width!r}, height={self.height!r}, duration={self.duration!r}, thumb={self.thumb!r}, file_name={self.file_name!r}, mime_type={self.mime_type!r}, file_size={self.file_size!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(video_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "Video.from_array({self._raw})".format(self=self)
-        # end if
-        return "Video(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, width={self.width!r}, height={self.height!r}, duration={self.duration!r}, thumb={self.thumb!r}, file_name={self.file_name!r}, mime_type={self.mime_type!r}, file_size={self.file_size!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the Video without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in video_instance`
+        :return: new Video instance.
+        :rtype: Video
         """
-        return (
-            key in ["file_id", "file_unique_id", "width", "height", "duration", "thumb", "file_name", "mime_type", "file_size"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = Video._set_field
+        instance = Video.__new__(Video)
+        set_field(instance, 'file_id', u(get('file_id')))
+        set_field(instance, 'file_unique_id', u(get('file_unique_id')))
+        set_field(instance, 'width', int(get('width')))
+        set_field(instance, 'height', int(get('height')))
+        set_field(instance, 'duration', int(get('duration')))
+        value = get('thumb')
+        set_field(instance, 'thumb', PhotoSize.from_array(value) if value is not None else None)
+        value = get('file_name')
+        set_field(instance, 'file_name', u(value) if value is not None else None)
+        value = get('mime_type')
+        set_field(instance, 'mime_type', u(value) if value is not None else None)
+        value = get('file_size')
+        set_field(instance, 'file_size', int(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class Video
 
 
@@ -1275,6 +1198,18 @@ class VideoNote(Media):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'length', 'duration', 'thumb', 'file_size')
+    _fields = ('file_id', 'file_unique_id', 'length', 'duration', 'thumb', 'file_size')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('file_id', 'file_id', u, False),
+        ('file_unique_id', 'file_unique_id', u, False),
+        ('length', 'length', int, False),
+        ('duration', 'duration', int, False),
+        ('thumb', 'thumb', None, True),
+        ('file_size', 'file_size', int, True),
+    )
+
     def __init__(self, file_id, file_unique_id, length, duration, thumb=None, file_size=None, _raw=None):
         """
         This object represents a video message (available in Telegram apps as of v.4.0).
@@ -1309,51 +1244,24 @@ class VideoNote(Media):
         :type  _raw: None | dict
         """
         super(VideoNote, self).__init__()
-        assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+        if self._must_validate(_raw):
+            assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+            assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
+            assert_type_or_raise(length, int, parameter_name="length")
+            assert_type_or_raise(duration, int, parameter_name="duration")
+            assert_type_or_raise(thumb, None, PhotoSize, parameter_name="thumb")
+            assert_type_or_raise(file_size, None, int, parameter_name="file_size")
+        # end if
         self.file_id = file_id
-        assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
         self.file_unique_id = file_unique_id
-        assert_type_or_raise(length, int, parameter_name="length")
         self.length = length
-        assert_type_or_raise(duration, int, parameter_name="duration")
         self.duration = duration
-        assert_type_or_raise(thumb, None, PhotoSize, parameter_name="thumb")
         self.thumb = thumb
-        assert_type_or_raise(file_size, None, int, parameter_name="file_size")
         self.file_size = file_size
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this VideoNote to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(VideoNote, self).to_array()
-
-        array['file_id'] = u(self.file_id)  # py2: type unicode, py3: type str
-        array['file_unique_id'] = u(self.file_unique_id)  # py2: type unicode, py3: type str
-        array['length'] = int(self.length)  # type int
-        array['duration'] = int(self.duration)  # type int
-        if self.thumb is not None:
-            array['thumb'] = self.thumb.to_array()  # type PhotoSize
-        # end if
-        if self.file_size is not None:
-            array['file_size'] = int(self.file_size)  # type int
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1384,39 +1292,41 @@ class VideoNote(Media):
         if not array:  # None or {}
             return None
         # end if
+        if VideoNote._is_parsing_lazily():
+            return VideoNote._from_array_lazily(array)
+        # end if
+        if not VideoNote._must_validate(array):
+            return VideoNote._from_array_trusted(array)
+        # end if
 
         data = VideoNote.validate_array(array)
         data['_raw'] = array
         return VideoNote(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(videonote_instance)`
-        """
-        return "VideoNote(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, length={self.length!r}, duration={self.duration!r}, thumb={self.thumb!r}, file_size={self.file_size!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(videonote_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "VideoNote.from_array({self._raw})".format(self=self)
-        # end if
-        return "VideoNote(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, length={self.length!r}, duration={self.duration!r}, thumb={self.thumb!r}, file_size={self.file_size!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the VideoNote without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in videonote_instance`
+        :return: new VideoNote instance.
+        :rtype: VideoNote
         """
-        return (
-            key in ["file_id", "file_unique_id", "length", "duration", "thumb", "file_size"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = VideoNote._set_field
+        instance = VideoNote.__new__(VideoNote)
+        set_field(instance, 'file_id', u(get('file_id')))
+        set_field(instance, 'file_unique_id', u(get('file_unique_id')))
+        set_field(instance, 'length', int(get('length')))
+        set_field(instance, 'duration', int(get('duration')))
+        value = get('thumb')
+        set_field(instance, 'thumb', PhotoSize.from_array(value) if value is not None else None)
+        value = get('file_size')
+        set_field(instance, 'file_size', int(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class VideoNote
 
 
@@ -1451,6 +1361,17 @@ class Voice(Media):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'duration', 'mime_type', 'file_size')
+    _fields = ('file_id', 'file_unique_id', 'duration', 'mime_type', 'file_size')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('file_id', 'file_id', u, False),
+        ('file_unique_id', 'file_unique_id', u, False),
+        ('duration', 'duration', int, False),
+        ('mime_type', 'mime_type', u, True),
+        ('file_size', 'file_size', int, True),
+    )
+
     def __init__(self, file_id, file_unique_id, duration, mime_type=None, file_size=None, _raw=None):
         """
         This object represents a voice note.
@@ -1482,48 +1403,22 @@ class Voice(Media):
         :type  _raw: None | dict
         """
         super(Voice, self).__init__()
-        assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+        if self._must_validate(_raw):
+            assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+            assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
+            assert_type_or_raise(duration, int, parameter_name="duration")
+            assert_type_or_raise(mime_type, None, unicode_type, parameter_name="mime_type")
+            assert_type_or_raise(file_size, None, int, parameter_name="file_size")
+        # end if
         self.file_id = file_id
-        assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
         self.file_unique_id = file_unique_id
-        assert_type_or_raise(duration, int, parameter_name="duration")
         self.duration = duration
-        assert_type_or_raise(mime_type, None, unicode_type, parameter_name="mime_type")
         self.mime_type = mime_type
-        assert_type_or_raise(file_size, None, int, parameter_name="file_size")
         self.file_size = file_size
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this Voice to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(Voice, self).to_array()
-
-        array['file_id'] = u(self.file_id)  # py2: type unicode, py3: type str
-        array['file_unique_id'] = u(self.file_unique_id)  # py2: type unicode, py3: type str
-        array['duration'] = int(self.duration)  # type int
-        if self.mime_type is not None:
-            array['mime_type'] = u(self.mime_type)  # py2: type unicode, py3: type str
-        # end if
-        if self.file_size is not None:
-            array['file_size'] = int(self.file_size)  # type int
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1553,39 +1448,40 @@ class Voice(Media):
         if not array:  # None or {}
             return None
         # end if
+        if Voice._is_parsing_lazily():
+            return Voice._from_array_lazily(array)
+        # end if
+        if not Voice._must_validate(array):
+            return Voice._from_array_trusted(array)
+        # end if
 
         data = Voice.validate_array(array)
         data['_raw'] = array
         return Voice(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(voice_instance)`
-        """
-        return "Voice(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, duration={self.duration!r}, mime_type={self.mime_type!r}, file_size={self.file_size!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(voice_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "Voice.from_array({self._raw})".format(self=self)
-        # end if
-        return "Voice(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, duration={self.duration!r}, mime_type={self.mime_type!r}, file_size={self.file_size!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the Voice without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in voice_instance`
+        :return: new Voice instance.
+        :rtype: Voice
         """
-        return (
-            key in ["file_id", "file_unique_id", "duration", "mime_type", "file_size"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = Voice._set_field
+        instance = Voice.__new__(Voice)
+        set_field(instance, 'file_id', u(get('file_id')))
+        set_field(instance, 'file_unique_id', u(get('file_unique_id')))
+        set_field(instance, 'duration', int(get('duration')))
+        value = get('mime_type')
+        set_field(instance, 'mime_type', u(value) if value is not None else None)
+        value = get('file_size')
+        set_field(instance, 'file_size', int(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class Voice
 
 
@@ -1622,6 +1518,17 @@ class Contact(Media):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('phone_number', 'first_name', 'last_name', 'user_id', 'vcard')
+    _fields = ('phone_number', 'first_name', 'last_name', 'user_id', 'vcard')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('phone_number', 'phone_number', u, False),
+        ('first_name', 'first_name', u, False),
+        ('last_name', 'last_name', u, True),
+        ('user_id', 'user_id', int, True),
+        ('vcard', 'vcard', u, True),
+    )
+
     def __init__(self, phone_number, first_name, last_name=None, user_id=None, vcard=None, _raw=None):
         """
         This object represents a phone contact.
@@ -1655,50 +1562,22 @@ class Contact(Media):
         :type  _raw: None | dict
         """
         super(Contact, self).__init__()
-        assert_type_or_raise(phone_number, unicode_type, parameter_name="phone_number")
+        if self._must_validate(_raw):
+            assert_type_or_raise(phone_number, unicode_type, parameter_name="phone_number")
+            assert_type_or_raise(first_name, unicode_type, parameter_name="first_name")
+            assert_type_or_raise(last_name, None, unicode_type, parameter_name="last_name")
+            assert_type_or_raise(user_id, None, int, parameter_name="user_id")
+            assert_type_or_raise(vcard, None, unicode_type, parameter_name="vcard")
+        # end if
         self.phone_number = phone_number
-        assert_type_or_raise(first_name, unicode_type, parameter_name="first_name")
         self.first_name = first_name
-        assert_type_or_raise(last_name, None, unicode_type, parameter_name="last_name")
         self.last_name = last_name
-        assert_type_or_raise(user_id, None, int, parameter_name="user_id")
         self.user_id = user_id
-        assert_type_or_raise(vcard, None, unicode_type, parameter_name="vcard")
         self.vcard = vcard
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this Contact to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(Contact, self).to_array()
-
-        array['phone_number'] = u(self.phone_number)  # py2: type unicode, py3: type str
-        array['first_name'] = u(self.first_name)  # py2: type unicode, py3: type str
-        if self.last_name is not None:
-            array['last_name'] = u(self.last_name)  # py2: type unicode, py3: type str
-        # end if
-        if self.user_id is not None:
-            array['user_id'] = int(self.user_id)  # type int
-        # end if
-        if self.vcard is not None:
-            array['vcard'] = u(self.vcard)  # py2: type unicode, py3: type str
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1728,39 +1607,41 @@ class Contact(Media):
         if not array:  # None or {}
             return None
         # end if
+        if Contact._is_parsing_lazily():
+            return Contact._from_array_lazily(array)
+        # end if
+        if not Contact._must_validate(array):
+            return Contact._from_array_trusted(array)
+        # end if
 
         data = Contact.validate_array(array)
         data['_raw'] = array
         return Contact(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(contact_instance)`
-        """
-        return "Contact(phone_number={self.phone_number!r}, first_name={self.first_name!r}, last_name={self.last_name!r}, user_id={self.user_id!r}, vcard={self.vcard!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(contact_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "Contact.from_array({self._raw})".format(self=self)
-        # end if
-        return "Contact(phone_number={self.phone_number!r}, first_name={self.first_name!r}, last_name={self.last_name!r}, user_id={self.user_id!r}, vcard={self.vcard!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the Contact without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in contact_instance`
+        :return: new Contact instance.
+        :rtype: Contact
         """
-        return (
-            key in ["phone_number", "first_name", "last_name", "user_id", "vcard"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = Contact._set_field
+        instance = Contact.__new__(Contact)
+        set_field(instance, 'phone_number', u(get('phone_number')))
+        set_field(instance, 'first_name', u(get('first_name')))
+        value = get('last_name')
+        set_field(instance, 'last_name', u(value) if value is not None else None)
+        value = get('user_id')
+        set_field(instance, 'user_id', int(value) if value is not None else None)
+        value = get('vcard')
+        set_field(instance, 'vcard', u(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class Contact
 
 
@@ -1786,6 +1667,14 @@ class Dice(Media):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('emoji', 'value')
+    _fields = ('emoji', 'value')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('emoji', 'emoji', u, False),
+        ('value', 'value', int, False),
+    )
+
     def __init__(self, emoji, value, _raw=None):
         """
         This object represents an animated emoji that displays a random value.
@@ -1808,35 +1697,16 @@ class Dice(Media):
         :type  _raw: None | dict
         """
         super(Dice, self).__init__()
-        assert_type_or_raise(emoji, unicode_type, parameter_name="emoji")
+        if self._must_validate(_raw):
+            assert_type_or_raise(emoji, unicode_type, parameter_name="emoji")
+            assert_type_or_raise(value, int, parameter_name="value")
+        # end if
         self.emoji = emoji
-        assert_type_or_raise(value, int, parameter_name="value")
         self.value = value
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this Dice to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(Dice, self).to_array()
-
-        array['emoji'] = u(self.emoji)  # py2: type unicode, py3: type str
-        array['value'] = int(self.value)  # type int
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1863,39 +1733,35 @@ class Dice(Media):
         if not array:  # None or {}
             return None
         # end if
+        if Dice._is_parsing_lazily():
+            return Dice._from_array_lazily(array)
+        # end if
+        if not Dice._must_validate(array):
+            return Dice._from_array_trusted(array)
+        # end if
 
         data = Dice.validate_array(array)
         data['_raw'] = array
         return Dice(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(dice_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        return "Dice(emoji={self.emoji!r}, value={self.value!r})".format(self=self)
-    # end def __str__
+        Single pass version of :meth:`from_array`, building the Dice without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __repr__(self):
-        """
-        Implements `repr(dice_instance)`
-        """
-        if self._raw:
-            return "Dice.from_array({self._raw})".format(self=self)
-        # end if
-        return "Dice(emoji={self.emoji!r}, value={self.value!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in dice_instance`
+        :return: new Dice instance.
+        :rtype: Dice
         """
-        return (
-            key in ["emoji", "value"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = Dice._set_field
+        instance = Dice.__new__(Dice)
+        set_field(instance, 'emoji', u(get('emoji')))
+        set_field(instance, 'value', int(get('value')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class Dice
 
 
@@ -1921,6 +1787,14 @@ class PollOption(Receivable):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('text', 'voter_count')
+    _fields = ('text', 'voter_count')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('text', 'text', u, False),
+        ('voter_count', 'voter_count', int, False),
+    )
+
     def __init__(self, text, voter_count, _raw=None):
         """
         This object contains information about one answer option in a poll.
@@ -1943,35 +1817,16 @@ class PollOption(Receivable):
         :type  _raw: None | dict
         """
         super(PollOption, self).__init__()
-        assert_type_or_raise(text, unicode_type, parameter_name="text")
+        if self._must_validate(_raw):
+            assert_type_or_raise(text, unicode_type, parameter_name="text")
+            assert_type_or_raise(voter_count, int, parameter_name="voter_count")
+        # end if
         self.text = text
-        assert_type_or_raise(voter_count, int, parameter_name="voter_count")
         self.voter_count = voter_count
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this PollOption to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(PollOption, self).to_array()
-
-        array['text'] = u(self.text)  # py2: type unicode, py3: type str
-        array['voter_count'] = int(self.voter_count)  # type int
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1998,39 +1853,35 @@ class PollOption(Receivable):
         if not array:  # None or {}
             return None
         # end if
+        if PollOption._is_parsing_lazily():
+            return PollOption._from_array_lazily(array)
+        # end if
+        if not PollOption._must_validate(array):
+            return PollOption._from_array_trusted(array)
+        # end if
 
         data = PollOption.validate_array(array)
         data['_raw'] = array
         return PollOption(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(polloption_instance)`
-        """
-        return "PollOption(text={self.text!r}, voter_count={self.voter_count!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(polloption_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "PollOption.from_array({self._raw})".format(self=self)
-        # end if
-        return "PollOption(text={self.text!r}, voter_count={self.voter_count!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the PollOption without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in polloption_instance`
+        :return: new PollOption instance.
+        :rtype: PollOption
         """
-        return (
-            key in ["text", "voter_count"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = PollOption._set_field
+        instance = PollOption.__new__(PollOption)
+        set_field(instance, 'text', u(get('text')))
+        set_field(instance, 'voter_count', int(get('voter_count')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class PollOption
 
 
@@ -2059,6 +1910,15 @@ class PollAnswer(Receivable):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('poll_id', 'user', 'option_ids')
+    _fields = ('poll_id', 'user', 'option_ids')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('poll_id', 'poll_id', u, False),
+        ('user', 'user', None, False),
+        ('option_ids', 'option_ids', list, False),
+    )
+
     def __init__(self, poll_id, user, option_ids, _raw=None):
         """
         This object represents an answer of a user in a non-anonymous poll.
@@ -2084,40 +1944,19 @@ class PollAnswer(Receivable):
         :type  _raw: None | dict
         """
         super(PollAnswer, self).__init__()
-        from .peer import User
-        assert_type_or_raise(poll_id, unicode_type, parameter_name="poll_id")
+        if self._must_validate(_raw):
+            from .peer import User
+            assert_type_or_raise(poll_id, unicode_type, parameter_name="poll_id")
+            assert_type_or_raise(user, User, parameter_name="user")
+            assert_type_or_raise(option_ids, list, parameter_name="option_ids")
+        # end if
         self.poll_id = poll_id
-        assert_type_or_raise(user, User, parameter_name="user")
         self.user = user
-        assert_type_or_raise(option_ids, list, parameter_name="option_ids")
         self.option_ids = option_ids
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this PollAnswer to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .peer import User
-        array = super(PollAnswer, self).to_array()
-
-        array['poll_id'] = u(self.poll_id)  # py2: type unicode, py3: type str
-        array['user'] = self.user.to_array()  # type User
-        array['option_ids'] = self._as_array(self.option_ids)  # type list of int
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -2146,39 +1985,36 @@ class PollAnswer(Receivable):
         if not array:  # None or {}
             return None
         # end if
+        if PollAnswer._is_parsing_lazily():
+            return PollAnswer._from_array_lazily(array)
+        # end if
+        if not PollAnswer._must_validate(array):
+            return PollAnswer._from_array_trusted(array)
+        # end if
 
         data = PollAnswer.validate_array(array)
         data['_raw'] = array
         return PollAnswer(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(pollanswer_instance)`
-        """
-        return "PollAnswer(poll_id={self.poll_id!r}, user={self.user!r}, option_ids={self.option_ids!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(pollanswer_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "PollAnswer.from_array({self._raw})".format(self=self)
-        # end if
-        return "PollAnswer(poll_id={self.poll_id!r}, user={self.user!r}, option_ids={self.option_ids!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the PollAnswer without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in pollanswer_instance`
+        :return: new PollAnswer instance.
+        :rtype: PollAnswer
         """
-        return (
-            key in ["poll_id", "user", "option_ids"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = PollAnswer._set_field
+        instance = PollAnswer.__new__(PollAnswer)
+        set_field(instance, 'poll_id', u(get('poll_id')))
+        set_field(instance, 'user', User.from_array(get('user')))
+        set_field(instance, 'option_ids', PollAnswer._builtin_from_array_list(required_type=int, value=get('option_ids'), list_level=1))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class PollAnswer
 
 
@@ -2239,6 +2075,25 @@ class Poll(Media):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('id', 'question', 'options', 'total_voter_count', 'is_closed', 'is_anonymous', 'type', 'allows_multiple_answers', 'correct_option_id', 'explanation', 'explanation_entities', 'open_period', 'close_date')
+    _fields = ('id', 'question', 'options', 'total_voter_count', 'is_closed', 'is_anonymous', 'type', 'allows_multiple_answers', 'correct_option_id', 'explanation', 'explanation_entities', 'open_period', 'close_date')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('id', 'id', u, False),
+        ('question', 'question', u, False),
+        ('options', 'options', list, False),
+        ('total_voter_count', 'total_voter_count', int, False),
+        ('is_closed', 'is_closed', bool, False),
+        ('is_anonymous', 'is_anonymous', bool, False),
+        ('type', 'type', u, False),
+        ('allows_multiple_answers', 'allows_multiple_answers', bool, False),
+        ('correct_option_id', 'correct_option_id', int, True),
+        ('explanation', 'explanation', u, True),
+        ('explanation_entities', 'explanation_entities', list, True),
+        ('open_period', 'open_period', int, True),
+        ('close_date', 'close_date', int, True),
+    )
+
     def __init__(self, id, question, options, total_voter_count, is_closed, is_anonymous, type, allows_multiple_answers, correct_option_id=None, explanation=None, explanation_entities=None, open_period=None, close_date=None, _raw=None):
         """
         This object contains information about a poll.
@@ -2296,78 +2151,38 @@ class Poll(Media):
         :type  _raw: None | dict
         """
         super(Poll, self).__init__()
-        assert_type_or_raise(id, unicode_type, parameter_name="id")
+        if self._must_validate(_raw):
+            assert_type_or_raise(id, unicode_type, parameter_name="id")
+            assert_type_or_raise(question, unicode_type, parameter_name="question")
+            assert_type_or_raise(options, list, parameter_name="options")
+            assert_type_or_raise(total_voter_count, int, parameter_name="total_voter_count")
+            assert_type_or_raise(is_closed, bool, parameter_name="is_closed")
+            assert_type_or_raise(is_anonymous, bool, parameter_name="is_anonymous")
+            assert_type_or_raise(type, unicode_type, parameter_name="type")
+            assert_type_or_raise(allows_multiple_answers, bool, parameter_name="allows_multiple_answers")
+            assert_type_or_raise(correct_option_id, None, int, parameter_name="correct_option_id")
+            assert_type_or_raise(explanation, None, unicode_type, parameter_name="explanation")
+            assert_type_or_raise(explanation_entities, None, list, parameter_name="explanation_entities")
+            assert_type_or_raise(open_period, None, int, parameter_name="open_period")
+            assert_type_or_raise(close_date, None, int, parameter_name="close_date")
+        # end if
         self.id = id
-        assert_type_or_raise(question, unicode_type, parameter_name="question")
         self.question = question
-        assert_type_or_raise(options, list, parameter_name="options")
         self.options = options
-        assert_type_or_raise(total_voter_count, int, parameter_name="total_voter_count")
         self.total_voter_count = total_voter_count
-        assert_type_or_raise(is_closed, bool, parameter_name="is_closed")
         self.is_closed = is_closed
-        assert_type_or_raise(is_anonymous, bool, parameter_name="is_anonymous")
         self.is_anonymous = is_anonymous
-        assert_type_or_raise(type, unicode_type, parameter_name="type")
         self.type = type
-        assert_type_or_raise(allows_multiple_answers, bool, parameter_name="allows_multiple_answers")
         self.allows_multiple_answers = allows_multiple_answers
-        assert_type_or_raise(correct_option_id, None, int, parameter_name="correct_option_id")
         self.correct_option_id = correct_option_id
-        assert_type_or_raise(explanation, None, unicode_type, parameter_name="explanation")
         self.explanation = explanation
-        assert_type_or_raise(explanation_entities, None, list, parameter_name="explanation_entities")
         self.explanation_entities = explanation_entities
-        assert_type_or_raise(open_period, None, int, parameter_name="open_period")
         self.open_period = open_period
-        assert_type_or_raise(close_date, None, int, parameter_name="close_date")
         self.close_date = close_date
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this Poll to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(Poll, self).to_array()
-
-        array['id'] = u(self.id)  # py2: type unicode, py3: type str
-        array['question'] = u(self.question)  # py2: type unicode, py3: type str
-        array['options'] = self._as_array(self.options)  # type list of PollOption
-        array['total_voter_count'] = int(self.total_voter_count)  # type int
-        array['is_closed'] = bool(self.is_closed)  # type bool
-        array['is_anonymous'] = bool(self.is_anonymous)  # type bool
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        array['allows_multiple_answers'] = bool(self.allows_multiple_answers)  # type bool
-        if self.correct_option_id is not None:
-            array['correct_option_id'] = int(self.correct_option_id)  # type int
-        # end if
-        if self.explanation is not None:
-            array['explanation'] = u(self.explanation)  # py2: type unicode, py3: type str
-        # end if
-        if self.explanation_entities is not None:
-            array['explanation_entities'] = self._as_array(self.explanation_entities)  # type list of MessageEntity
-        # end if
-        if self.open_period is not None:
-            array['open_period'] = int(self.open_period)  # type int
-        # end if
-        if self.close_date is not None:
-            array['close_date'] = int(self.close_date)  # type int
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -2405,39 +2220,51 @@ class Poll(Media):
         if not array:  # None or {}
             return None
         # end if
+        if Poll._is_parsing_lazily():
+            return Poll._from_array_lazily(array)
+        # end if
+        if not Poll._must_validate(array):
+            return Poll._from_array_trusted(array)
+        # end if
 
         data = Poll.validate_array(array)
         data['_raw'] = array
         return Poll(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(poll_instance)`
-        """
-        return "Poll(id={self.id!r}, question={self.question!r}, options={self.options!r}, total_voter_count={self.total_voter_count!r}, is_closed={self.is_closed!r}, is_anonymous={self.is_anonymous!r}, type={self.type!r}, allows_multiple_answers={self.allows_multiple_answers!r}, correct_option_id={self.correct_option_id!r}, explanation={self.explanation!r}, explanation_entities={self.explanation_entities!r}, open_period={self.open_period!r}, close_date={self.close_date!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(poll_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "Poll.from_array({self._raw})".format(self=self)
-        # end if
-        return "Poll(id={self.id!r}, question={self.question!r}, options={self.options!r}, total_voter_count={self.total_voter_count!r}, is_closed={self.is_closed!r}, is_anonymous={self.is_anonymous!r}, type={self.type!r}, allows_multiple_answers={self.allows_multiple_answers!r}, correct_option_id={self.correct_option_id!r}, explanation={self.explanation!r}, explanation_entities={self.explanation_entities!r}, open_period={self.open_period!r}, close_date={self.close_date!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the Poll without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in poll_instance`
+        :return: new Poll instance.
+        :rtype: Poll
         """
-        return (
-            key in ["id", "question", "options", "total_voter_count", "is_closed", "is_anonymous", "type", "allows_multiple_answers", "correct_option_id", "explanation", "explanation_entities", "open_period", "close_date"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = Poll._set_field
+        instance = Poll.__new__(Poll)
+        set_field(instance, 'id', u(get('id')))
+        set_field(instance, 'question', u(get('question')))
+        set_field(instance, 'options', PollOption.from_array_list(get('options'), list_level=1))
+        set_field(instance, 'total_voter_count', int(get('total_voter_count')))
+        set_field(instance, 'is_closed', bool(get('is_closed')))
+        set_field(instance, 'is_anonymous', bool(get('is_anonymous')))
+        set_field(instance, 'type', u(get('type')))
+        set_field(instance, 'allows_multiple_answers', bool(get('allows_multiple_answers')))
+        value = get('correct_option_id')
+        set_field(instance, 'correct_option_id', int(value) if value is not None else None)
+        value = get('explanation')
+        set_field(instance, 'explanation', u(value) if value is not None else None)
+        value = get('explanation_entities')
+        set_field(instance, 'explanation_entities', MessageEntity.from_array_list(value, list_level=1) if value is not None else None)
+        value = get('open_period')
+        set_field(instance, 'open_period', int(value) if value is not None else None)
+        value = get('close_date')
+        set_field(instance, 'close_date', int(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class Poll
 
 
@@ -2478,6 +2305,18 @@ class Location(Media):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('longitude', 'latitude', 'horizontal_accuracy', 'live_period', 'heading', 'proximity_alert_radius')
+    _fields = ('longitude', 'latitude', 'horizontal_accuracy', 'live_period', 'heading', 'proximity_alert_radius')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('longitude', 'longitude', float, False),
+        ('latitude', 'latitude', float, False),
+        ('horizontal_accuracy', 'horizontal_accuracy', float, True),
+        ('live_period', 'live_period', int, True),
+        ('heading', 'heading', int, True),
+        ('proximity_alert_radius', 'proximity_alert_radius', int, True),
+    )
+
     def __init__(self, longitude, latitude, horizontal_accuracy=None, live_period=None, heading=None, proximity_alert_radius=None, _raw=None):
         """
         This object represents a point on the map.
@@ -2515,55 +2354,24 @@ class Location(Media):
         :type  _raw: None | dict
         """
         super(Location, self).__init__()
-        assert_type_or_raise(longitude, float, parameter_name="longitude")
+        if self._must_validate(_raw):
+            assert_type_or_raise(longitude, float, parameter_name="longitude")
+            assert_type_or_raise(latitude, float, parameter_name="latitude")
+            assert_type_or_raise(horizontal_accuracy, None, float, parameter_name="horizontal_accuracy")
+            assert_type_or_raise(live_period, None, int, parameter_name="live_period")
+            assert_type_or_raise(heading, None, int, parameter_name="heading")
+            assert_type_or_raise(proximity_alert_radius, None, int, parameter_name="proximity_alert_radius")
+        # end if
         self.longitude = longitude
-        assert_type_or_raise(latitude, float, parameter_name="latitude")
         self.latitude = latitude
-        assert_type_or_raise(horizontal_accuracy, None, float, parameter_name="horizontal_accuracy")
         self.horizontal_accuracy = horizontal_accuracy
-        assert_type_or_raise(live_period, None, int, parameter_name="live_period")
         self.live_period = live_period
-        assert_type_or_raise(heading, None, int, parameter_name="heading")
         self.heading = heading
-        assert_type_or_raise(proximity_alert_radius, None, int, parameter_name="proximity_alert_radius")
         self.proximity_alert_radius = proximity_alert_radius
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this Location to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(Location, self).to_array()
-
-        array['longitude'] = float(self.longitude)  # type float
-        array['latitude'] = float(self.latitude)  # type float
-        if self.horizontal_accuracy is not None:
-            array['horizontal_accuracy'] = float(self.horizontal_accuracy)  # type float
-        # end if
-        if self.live_period is not None:
-            array['live_period'] = int(self.live_period)  # type int
-        # end if
-        if self.heading is not None:
-            array['heading'] = int(self.heading)  # type int
-        # end if
-        if self.proximity_alert_radius is not None:
-            array['proximity_alert_radius'] = int(self.proximity_alert_radius)  # type int
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -2594,39 +2402,43 @@ class Location(Media):
         if not array:  # None or {}
             return None
         # end if
+        if Location._is_parsing_lazily():
+            return Location._from_array_lazily(array)
+        # end if
+        if not Location._must_validate(array):
+            return Location._from_array_trusted(array)
+        # end if
 
         data = Location.validate_array(array)
         data['_raw'] = array
         return Location(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(location_instance)`
-        """
-        return "Location(longitude={self.longitude!r}, latitude={self.latitude!r}, horizontal_accuracy={self.horizontal_accuracy!r}, live_period={self.live_period!r}, heading={self.heading!r}, proximity_alert_radius={self.proximity_alert_radius!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(location_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "Location.from_array({self._raw})".format(self=self)
-        # end if
-        return "Location(longitude={self.longitude!r}, latitude={self.latitude!r}, horizontal_accuracy={self.horizontal_accuracy!r}, live_period={self.live_period!r}, heading={self.heading!r}, proximity_alert_radius={self.proximity_alert_radius!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the Location without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in location_instance`
+        :return: new Location instance.
+        :rtype: Location
         """
-        return (
-            key in ["longitude", "latitude", "horizontal_accuracy", "live_period", "heading", "proximity_alert_radius"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = Location._set_field
+        instance = Location.__new__(Location)
+        set_field(instance, 'longitude', float(get('longitude')))
+        set_field(instance, 'latitude', float(get('latitude')))
+        value = get('horizontal_accuracy')
+        set_field(instance, 'horizontal_accuracy', float(value) if value is not None else None)
+        value = get('live_period')
+        set_field(instance, 'live_period', int(value) if value is not None else None)
+        value = get('heading')
+        set_field(instance, 'heading', int(value) if value is not None else None)
+        value = get('proximity_alert_radius')
+        set_field(instance, 'proximity_alert_radius', int(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class Location
 
 
@@ -2669,6 +2481,19 @@ class Venue(Media):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('location', 'title', 'address', 'foursquare_id', 'foursquare_type', 'google_place_id', 'google_place_type')
+    _fields = ('location', 'title', 'address', 'foursquare_id', 'foursquare_type', 'google_place_id', 'google_place_type')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('location', 'location', None, False),
+        ('title', 'title', u, False),
+        ('address', 'address', u, False),
+        ('foursquare_id', 'foursquare_id', u, True),
+        ('foursquare_type', 'foursquare_type', u, True),
+        ('google_place_id', 'google_place_id', u, True),
+        ('google_place_type', 'google_place_type', u, True),
+    )
+
     def __init__(self, location, title, address, foursquare_id=None, foursquare_type=None, google_place_id=None, google_place_type=None, _raw=None):
         """
         This object represents a venue.
@@ -2708,58 +2533,26 @@ class Venue(Media):
         :type  _raw: None | dict
         """
         super(Venue, self).__init__()
-        assert_type_or_raise(location, Location, parameter_name="location")
+        if self._must_validate(_raw):
+            assert_type_or_raise(location, Location, parameter_name="location")
+            assert_type_or_raise(title, unicode_type, parameter_name="title")
+            assert_type_or_raise(address, unicode_type, parameter_name="address")
+            assert_type_or_raise(foursquare_id, None, unicode_type, parameter_name="foursquare_id")
+            assert_type_or_raise(foursquare_type, None, unicode_type, parameter_name="foursquare_type")
+            assert_type_or_raise(google_place_id, None, unicode_type, parameter_name="google_place_id")
+            assert_type_or_raise(google_place_type, None, unicode_type, parameter_name="google_place_type")
+        # end if
         self.location = location
-        assert_type_or_raise(title, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(address, unicode_type, parameter_name="address")
         self.address = address
-        assert_type_or_raise(foursquare_id, None, unicode_type, parameter_name="foursquare_id")
         self.foursquare_id = foursquare_id
-        assert_type_or_raise(foursquare_type, None, unicode_type, parameter_name="foursquare_type")
         self.foursquare_type = foursquare_type
-        assert_type_or_raise(google_place_id, None, unicode_type, parameter_name="google_place_id")
         self.google_place_id = google_place_id
-        assert_type_or_raise(google_place_type, None, unicode_type, parameter_name="google_place_type")
         self.google_place_type = google_place_type
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this Venue to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(Venue, self).to_array()
-
-        array['location'] = self.location.to_array()  # type Location
-        array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        array['address'] = u(self.address)  # py2: type unicode, py3: type str
-        if self.foursquare_id is not None:
-            array['foursquare_id'] = u(self.foursquare_id)  # py2: type unicode, py3: type str
-        # end if
-        if self.foursquare_type is not None:
-            array['foursquare_type'] = u(self.foursquare_type)  # py2: type unicode, py3: type str
-        # end if
-        if self.google_place_id is not None:
-            array['google_place_id'] = u(self.google_place_id)  # py2: type unicode, py3: type str
-        # end if
-        if self.google_place_type is not None:
-            array['google_place_type'] = u(self.google_place_type)  # py2: type unicode, py3: type str
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -2791,45 +2584,47 @@ class Venue(Media):
         if not array:  # None or {}
             return None
         # end if
+        if Venue._is_parsing_lazily():
+            return Venue._from_array_lazily(array)
+        # end if
+        if not Venue._must_validate(array):
+            return Venue._from_array_trusted(array)
+        # end if
 
         data = Venue.validate_array(array)
         data['_raw'] = array
         return Venue(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(venue_instance)`
-        """
-        return "Venue(location={self.location!r}, title={self.title!r}, address={self.address!r}, foursquare_id={self.foursquare_id!r}, foursquare_type={self.foursquare_type!r}, google_place_id={self.google_place_id!r}, google_place_type={self.google_place_type!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(venue_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "Venue.from_array({self._raw})".format(self=self)
-        # end if
-        return "Venue(location={self.location!r}, title={self.title!r}, address={self.address!r}, foursquare_id={self.foursquare_id!r}, foursquare_type={self.foursquare_type!r}, google_place_id={self.google_place_id!r}, google_place_type={self.google_place_type!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the Venue without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in venue_instance`
+        :return: new Venue instance.
+        :rtype: Venue
         """
-        return (
-            key in ["location", "title", "address", "foursquare_id", "foursquare_type", "google_place_id", "google_place_type"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = Venue._set_field
+        instance = Venue.__new__(Venue)
+        set_field(instance, 'location', Location.from_array(get('location')))
+        set_field(instance, 'title', u(get('title')))
+        set_field(instance, 'address', u(get('address')))
+        value = get('foursquare_id')
+        set_field(instance, 'foursquare_id', u(value) if value is not None else None)
+        value = get('foursquare_type')
+        set_field(instance, 'foursquare_type', u(value) if value is not None else None)
+        value = get('google_place_id')
+        set_field(instance, 'google_place_id', u(value) if value is not None else None)
+        value = get('google_place_type')
+        set_field(instance, 'google_place_type', u(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class Venue
 
 
-from .service import ProximityAlertTriggered
-
-
 class UserProfilePhotos(Result):
     """
     This object represent a user's profile pictures.
@@ -2852,6 +2647,14 @@ class UserProfilePhotos(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('total_count', 'photos')
+    _fields = ('total_count', 'photos')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('total_count', 'total_count', int, False),
+        ('photos', 'photos', list, False),
+    )
+
     def __init__(self, total_count, photos, _raw=None):
         """
         This object represent a user's profile pictures.
@@ -2874,35 +2677,16 @@ class UserProfilePhotos(Result):
         :type  _raw: None | dict
         """
         super(UserProfilePhotos, self).__init__()
-        assert_type_or_raise(total_count, int, parameter_name="total_count")
+        if self._must_validate(_raw):
+            assert_type_or_raise(total_count, int, parameter_name="total_count")
+            assert_type_or_raise(photos, list, parameter_name="photos")
+        # end if
         self.total_count = total_count
-        assert_type_or_raise(photos, list, parameter_name="photos")
         self.photos = photos
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this UserProfilePhotos to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(UserProfilePhotos, self).to_array()
-
-        array['total_count'] = int(self.total_count)  # type int
-        array['photos'] = self._as_array(self.photos)  # type list of list of PhotoSize
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -2929,39 +2713,35 @@ class UserProfilePhotos(Result):
         if not array:  # None or {}
             return None
         # end if
+        if UserProfilePhotos._is_parsing_lazily():
+            return UserProfilePhotos._from_array_lazily(array)
+        # end if
+        if not UserProfilePhotos._must_validate(array):
+            return UserProfilePhotos._from_array_trusted(array)
+        # end if
 
         data = UserProfilePhotos.validate_array(array)
         data['_raw'] = array
         return UserProfilePhotos(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(userprofilephotos_instance)`
-        """
-        return "UserProfilePhotos(total_count={self.total_count!r}, photos={self.photos!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(userprofilephotos_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "UserProfilePhotos.from_array({self._raw})".format(self=self)
-        # end if
-        return "UserProfilePhotos(total_count={self.total_count!r}, photos={self.photos!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the UserProfilePhotos without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in userprofilephotos_instance`
+        :return: new UserProfilePhotos instance.
+        :rtype: UserProfilePhotos
         """
-        return (
-            key in ["total_count", "photos"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = UserProfilePhotos._set_field
+        instance = UserProfilePhotos.__new__(UserProfilePhotos)
+        set_field(instance, 'total_count', int(get('total_count')))
+        set_field(instance, 'photos', PhotoSize.from_array_list(get('photos'), list_level=2))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class UserProfilePhotos
 
 
@@ -2999,6 +2779,16 @@ class File(Receivable):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'file_size', 'file_path')
+    _fields = ('file_id', 'file_unique_id', 'file_size', 'file_path')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('file_id', 'file_id', u, False),
+        ('file_unique_id', 'file_unique_id', u, False),
+        ('file_size', 'file_size', int, True),
+        ('file_path', 'file_path', u, True),
+    )
+
     def __init__(self, file_id, file_unique_id, file_size=None, file_path=None, _raw=None):
         """
         This object represents a file ready to be downloaded.
@@ -3033,13 +2823,15 @@ class File(Receivable):
         :type  _raw: None | dict
         """
         super(File, self).__init__()
-        assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+        if self._must_validate(_raw):
+            assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+            assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
+            assert_type_or_raise(file_size, None, int, parameter_name="file_size")
+            assert_type_or_raise(file_path, None, unicode_type, parameter_name="file_path")
+        # end if
         self.file_id = file_id
-        assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
         self.file_unique_id = file_unique_id
-        assert_type_or_raise(file_size, None, int, parameter_name="file_size")
         self.file_size = file_size
-        assert_type_or_raise(file_path, None, unicode_type, parameter_name="file_path")
         self.file_path = file_path
 
         self._raw = _raw
@@ -3060,33 +2852,6 @@ class File(Receivable):
         return "https://api.telegram.org/file/bot{token}/{file_path}".format(token=token, file_path=self.file_path)
     # end def get_download_url
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this File to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(File, self).to_array()
-
-        array['file_id'] = u(self.file_id)  # py2: type unicode, py3: type str
-        array['file_unique_id'] = u(self.file_unique_id)  # py2: type unicode, py3: type str
-        if self.file_size is not None:
-            array['file_size'] = int(self.file_size)  # type int
-        # end if
-        if self.file_path is not None:
-            array['file_path'] = u(self.file_path)  # py2: type unicode, py3: type str
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -3115,39 +2880,39 @@ class File(Receivable):
         if not array:  # None or {}
             return None
         # end if
+        if File._is_parsing_lazily():
+            return File._from_array_lazily(array)
+        # end if
+        if not File._must_validate(array):
+            return File._from_array_trusted(array)
+        # end if
 
         data = File.validate_array(array)
         data['_raw'] = array
         return File(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(file_instance)`
-        """
-        return "File(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, file_size={self.file_size!r}, file_path={self.file_path!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(file_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "File.from_array({self._raw})".format(self=self)
-        # end if
-        return "File(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, file_size={self.file_size!r}, file_path={self.file_path!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the File without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in file_instance`
+        :return: new File instance.
+        :rtype: File
         """
-        return (
-            key in ["file_id", "file_unique_id", "file_size", "file_path"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = File._set_field
+        instance = File.__new__(File)
+        set_field(instance, 'file_id', u(get('file_id')))
+        set_field(instance, 'file_unique_id', u(get('file_unique_id')))
+        value = get('file_size')
+        set_field(instance, 'file_size', int(value) if value is not None else None)
+        value = get('file_path')
+        set_field(instance, 'file_path', u(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class File
 
 
@@ -3179,6 +2944,16 @@ class ChatPhoto(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('small_file_id', 'small_file_unique_id', 'big_file_id', 'big_file_unique_id')
+    _fields = ('small_file_id', 'small_file_unique_id', 'big_file_id', 'big_file_unique_id')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('small_file_id', 'small_file_id', u, False),
+        ('small_file_unique_id', 'small_file_unique_id', u, False),
+        ('big_file_id', 'big_file_id', u, False),
+        ('big_file_unique_id', 'big_file_unique_id', u, False),
+    )
+
     def __init__(self, small_file_id, small_file_unique_id, big_file_id, big_file_unique_id, _raw=None):
         """
         This object represents a chat photo.
@@ -3207,41 +2982,20 @@ class ChatPhoto(Result):
         :type  _raw: None | dict
         """
         super(ChatPhoto, self).__init__()
-        assert_type_or_raise(small_file_id, unicode_type, parameter_name="small_file_id")
+        if self._must_validate(_raw):
+            assert_type_or_raise(small_file_id, unicode_type, parameter_name="small_file_id")
+            assert_type_or_raise(small_file_unique_id, unicode_type, parameter_name="small_file_unique_id")
+            assert_type_or_raise(big_file_id, unicode_type, parameter_name="big_file_id")
+            assert_type_or_raise(big_file_unique_id, unicode_type, parameter_name="big_file_unique_id")
+        # end if
         self.small_file_id = small_file_id
-        assert_type_or_raise(small_file_unique_id, unicode_type, parameter_name="small_file_unique_id")
         self.small_file_unique_id = small_file_unique_id
-        assert_type_or_raise(big_file_id, unicode_type, parameter_name="big_file_id")
         self.big_file_id = big_file_id
-        assert_type_or_raise(big_file_unique_id, unicode_type, parameter_name="big_file_unique_id")
         self.big_file_unique_id = big_file_unique_id
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ChatPhoto to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ChatPhoto, self).to_array()
-
-        array['small_file_id'] = u(self.small_file_id)  # py2: type unicode, py3: type str
-        array['small_file_unique_id'] = u(self.small_file_unique_id)  # py2: type unicode, py3: type str
-        array['big_file_id'] = u(self.big_file_id)  # py2: type unicode, py3: type str
-        array['big_file_unique_id'] = u(self.big_file_unique_id)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -3270,39 +3024,37 @@ class ChatPhoto(Result):
         if not array:  # None or {}
             return None
         # end if
+        if ChatPhoto._is_parsing_lazily():
+            return ChatPhoto._from_array_lazily(array)
+        # end if
+        if not ChatPhoto._must_validate(array):
+            return ChatPhoto._from_array_trusted(array)
+        # end if
 
         data = ChatPhoto.validate_array(array)
         data['_raw'] = array
         return ChatPhoto(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(chatphoto_instance)`
-        """
-        return "ChatPhoto(small_file_id={self.small_file_id!r}, small_file_unique_id={self.small_file_unique_id!r}, big_file_id={self.big_file_id!r}, big_file_unique_id={self.big_file_unique_id!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(chatphoto_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "ChatPhoto.from_array({self._raw})".format(self=self)
-        # end if
-        return "ChatPhoto(small_file_id={self.small_file_id!r}, small_file_unique_id={self.small_file_unique_id!r}, big_file_id={self.big_file_id!r}, big_file_unique_id={self.big_file_unique_id!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the ChatPhoto without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in chatphoto_instance`
+        :return: new ChatPhoto instance.
+        :rtype: ChatPhoto
         """
-        return (
-            key in ["small_file_id", "small_file_unique_id", "big_file_id", "big_file_unique_id"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = ChatPhoto._set_field
+        instance = ChatPhoto.__new__(ChatPhoto)
+        set_field(instance, 'small_file_id', u(get('small_file_id')))
+        set_field(instance, 'small_file_unique_id', u(get('small_file_unique_id')))
+        set_field(instance, 'big_file_id', u(get('big_file_id')))
+        set_field(instance, 'big_file_unique_id', u(get('big_file_unique_id')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class ChatPhoto
 
 
@@ -3355,6 +3107,23 @@ class Sticker(Media):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'width', 'height', 'is_animated', 'is_video', 'thumb', 'emoji', 'set_name', 'mask_position', 'file_size')
+    _fields = ('file_id', 'file_unique_id', 'width', 'height', 'is_animated', 'is_video', 'thumb', 'emoji', 'set_name', 'mask_position', 'file_size')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('file_id', 'file_id', u, False),
+        ('file_unique_id', 'file_unique_id', u, False),
+        ('width', 'width', int, False),
+        ('height', 'height', int, False),
+        ('is_animated', 'is_animated', bool, False),
+        ('is_video', 'is_video', bool, False),
+        ('thumb', 'thumb', None, True),
+        ('emoji', 'emoji', u, True),
+        ('set_name', 'set_name', u, True),
+        ('mask_position', 'mask_position', None, True),
+        ('file_size', 'file_size', int, True),
+    )
+
     def __init__(self, file_id, file_unique_id, width, height, is_animated, is_video, thumb=None, emoji=None, set_name=None, mask_position=None, file_size=None, _raw=None):
         """
         This object represents a sticker.
@@ -3404,74 +3173,35 @@ class Sticker(Media):
         :type  _raw: None | dict
         """
         super(Sticker, self).__init__()
-        from .stickers import MaskPosition
-        assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+        if self._must_validate(_raw):
+            from .stickers import MaskPosition
+            assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+            assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
+            assert_type_or_raise(width, int, parameter_name="width")
+            assert_type_or_raise(height, int, parameter_name="height")
+            assert_type_or_raise(is_animated, bool, parameter_name="is_animated")
+            assert_type_or_raise(is_video, bool, parameter_name="is_video")
+            assert_type_or_raise(thumb, None, PhotoSize, parameter_name="thumb")
+            assert_type_or_raise(emoji, None, unicode_type, parameter_name="emoji")
+            assert_type_or_raise(set_name, None, unicode_type, parameter_name="set_name")
+            assert_type_or_raise(mask_position, None, MaskPosition, parameter_name="mask_position")
+            assert_type_or_raise(file_size, None, int, parameter_name="file_size")
+        # end if
         self.file_id = file_id
-        assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
         self.file_unique_id = file_unique_id
-        assert_type_or_raise(width, int, parameter_name="width")
         self.width = width
-        assert_type_or_raise(height, int, parameter_name="height")
         self.height = height
-        assert_type_or_raise(is_animated, bool, parameter_name="is_animated")
         self.is_animated = is_animated
-        assert_type_or_raise(is_video, bool, parameter_name="is_video")
         self.is_video = is_video
-        assert_type_or_raise(thumb, None, PhotoSize, parameter_name="thumb")
         self.thumb = thumb
-        assert_type_or_raise(emoji, None, unicode_type, parameter_name="emoji")
         self.emoji = emoji
-        assert_type_or_raise(set_name, None, unicode_type, parameter_name="set_name")
         self.set_name = set_name
-        assert_type_or_raise(mask_position, None, MaskPosition, parameter_name="mask_position")
         self.mask_position = mask_position
-        assert_type_or_raise(file_size, None, int, parameter_name="file_size")
         self.file_size = file_size
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this Sticker to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .stickers import MaskPosition
-        array = super(Sticker, self).to_array()
-
-        array['file_id'] = u(self.file_id)  # py2: type unicode, py3: type str
-        array['file_unique_id'] = u(self.file_unique_id)  # py2: type unicode, py3: type str
-        array['width'] = int(self.width)  # type int
-        array['height'] = int(self.height)  # type int
-        array['is_animated'] = bool(self.is_animated)  # type bool
-        array['is_video'] = bool(self.is_video)  # type bool
-        if self.thumb is not None:
-            array['thumb'] = self.thumb.to_array()  # type PhotoSize
-        # end if
-        if self.emoji is not None:
-            array['emoji'] = u(self.emoji)  # py2: type unicode, py3: type str
-        # end if
-        if self.set_name is not None:
-            array['set_name'] = u(self.set_name)  # py2: type unicode, py3: type str
-        # end if
-        if self.mask_position is not None:
-            array['mask_position'] = self.mask_position.to_array()  # type MaskPosition
-        # end if
-        if self.file_size is not None:
-            array['file_size'] = int(self.file_size)  # type int
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -3508,39 +3238,49 @@ class Sticker(Media):
         if not array:  # None or {}
             return None
         # end if
+        if Sticker._is_parsing_lazily():
+            return Sticker._from_array_lazily(array)
+        # end if
+        if not Sticker._must_validate(array):
+            return Sticker._from_array_trusted(array)
+        # end if
 
         data = Sticker.validate_array(array)
         data['_raw'] = array
         return Sticker(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(sticker_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        return "Sticker(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, width={self.width!r}, height={self.height!r}, is_animated={self.is_animated!r}, is_video={self.is_video!r}, thumb={self.thumb!r}, emoji={self.emoji!r}, set_name={self.set_name!r}, mask_position={self.mask_position!r}, file_size={self.file_size!r})".format(self=self)
-    # end def __str__
+        Single pass version of :meth:`from_array`, building the Sticker without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __repr__(self):
-        """
-        Implements `repr(sticker_instance)`
-        """
-        if self._raw:
-            return "Sticker.from_array({self._raw})".format(self=self)
-        # end if
-        return "Sticker(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, width={self.width!r}, height={self.height!r}, is_animated={self.is_animated!r}, is_video={self.is_video!r}, thumb={self.thumb!r}, emoji={self.emoji!r}, set_name={self.set_name!r}, mask_position={self.mask_position!r}, file_size={self.file_size!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in sticker_instance`
+        :return: new Sticker instance.
+        :rtype: Sticker
         """
-        return (
-            key in ["file_id", "file_unique_id", "width", "height", "is_animated", "is_video", "thumb", "emoji", "set_name", "mask_position", "file_size"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = Sticker._set_field
+        instance = Sticker.__new__(Sticker)
+        set_field(instance, 'file_id', u(get('file_id')))
+        set_field(instance, 'file_unique_id', u(get('file_unique_id')))
+        set_field(instance, 'width', int(get('width')))
+        set_field(instance, 'height', int(get('height')))
+        set_field(instance, 'is_animated', bool(get('is_animated')))
+        set_field(instance, 'is_video', bool(get('is_video')))
+        value = get('thumb')
+        set_field(instance, 'thumb', PhotoSize.from_array(value) if value is not None else None)
+        value = get('emoji')
+        set_field(instance, 'emoji', u(value) if value is not None else None)
+        value = get('set_name')
+        set_field(instance, 'set_name', u(value) if value is not None else None)
+        value = get('mask_position')
+        set_field(instance, 'mask_position', MaskPosition.from_array(value) if value is not None else None)
+        value = get('file_size')
+        set_field(instance, 'file_size', int(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class Sticker
 
 
@@ -3582,6 +3322,18 @@ class Game(Media):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('title', 'description', 'photo', 'text', 'text_entities', 'animation')
+    _fields = ('title', 'description', 'photo', 'text', 'text_entities', 'animation')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('title', 'title', u, False),
+        ('description', 'description', u, False),
+        ('photo', 'photo', list, False),
+        ('text', 'text', u, True),
+        ('text_entities', 'text_entities', list, True),
+        ('animation', 'animation', None, True),
+    )
+
     def __init__(self, title, description, photo, text=None, text_entities=None, animation=None, _raw=None):
         """
         This object represents a game.
@@ -3620,53 +3372,24 @@ class Game(Media):
         :type  _raw: None | dict
         """
         super(Game, self).__init__()
-        assert_type_or_raise(title, unicode_type, parameter_name="title")
+        if self._must_validate(_raw):
+            assert_type_or_raise(title, unicode_type, parameter_name="title")
+            assert_type_or_raise(description, unicode_type, parameter_name="description")
+            assert_type_or_raise(photo, list, parameter_name="photo")
+            assert_type_or_raise(text, None, unicode_type, parameter_name="text")
+            assert_type_or_raise(text_entities, None, list, parameter_name="text_entities")
+            assert_type_or_raise(animation, None, Animation, parameter_name="animation")
+        # end if
         self.title = title
-        assert_type_or_raise(description, unicode_type, parameter_name="description")
         self.description = description
-        assert_type_or_raise(photo, list, parameter_name="photo")
         self.photo = photo
-        assert_type_or_raise(text, None, unicode_type, parameter_name="text")
         self.text = text
-        assert_type_or_raise(text_entities, None, list, parameter_name="text_entities")
         self.text_entities = text_entities
-        assert_type_or_raise(animation, None, Animation, parameter_name="animation")
         self.animation = animation
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this Game to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(Game, self).to_array()
-
-        array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        array['description'] = u(self.description)  # py2: type unicode, py3: type str
-        array['photo'] = self._as_array(self.photo)  # type list of PhotoSize
-        if self.text is not None:
-            array['text'] = u(self.text)  # py2: type unicode, py3: type str
-        # end if
-        if self.text_entities is not None:
-            array['text_entities'] = self._as_array(self.text_entities)  # type list of MessageEntity
-        # end if
-        if self.animation is not None:
-            array['animation'] = self.animation.to_array()  # type Animation
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -3697,37 +3420,46 @@ class Game(Media):
         if not array:  # None or {}
             return None
         # end if
+        if Game._is_parsing_lazily():
+            return Game._from_array_lazily(array)
+        # end if
+        if not Game._must_validate(array):
+            return Game._from_array_trusted(array)
+        # end if
 
         data = Game.validate_array(array)
         data['_raw'] = array
         return Game(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(game_instance)`
-        """
-        return "Game(title={self.title!r}, description={self.description!r}, photo={self.photo!r}, text={self.text!r}, text_entities={self.text_entities!r}, animation={self.animation!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(game_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "Game.from_array({self._raw})".format(self=self)
-        # end if
-        return "Game(title={self.title!r}, description={self.description!r}, photo={self.photo!r}, text={self.text!r}, text_entities={self.text_entities!r}, animation={self.animation!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the Game without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in game_instance`
+        :return: new Game instance.
+        :rtype: Game
         """
-        return (
-            key in ["title", "description", "photo", "text", "text_entities", "animation"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = Game._set_field
+        instance = Game.__new__(Game)
+        set_field(instance, 'title', u(get('title')))
+        set_field(instance, 'description', u(get('description')))
+        set_field(instance, 'photo', PhotoSize.from_array_list(get('photo'), list_level=1))
+        value = get('text')
+        set_field(instance, 'text', u(value) if value is not None else None)
+        value = get('text_entities')
+        set_field(instance, 'text_entities', MessageEntity.from_array_list(value, list_level=1) if value is not None else None)
+        value = get('animation')
+        set_field(instance, 'animation', Animation.from_array(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class Game
+
+
+# bottom of file, as those modules import this one too. Used by the `_from_array_trusted(…)` functions.
+from .peer import User
+from .service import ProximityAlertTriggered  # was imported here before as well, kept for backwards compatibility.
+from .stickers import MaskPosition
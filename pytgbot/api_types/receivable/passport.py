@@ -34,6 +34,14 @@ class PassportData(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('data', 'credentials')
+    _fields = ('data', 'credentials')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('data', 'data', list, False),
+        ('credentials', 'credentials', None, False),
+    )
+
     def __init__(self, data, credentials, _raw=None):
         """
         Contains information about Telegram Passport data shared with the bot by the user.
@@ -56,35 +64,16 @@ class PassportData(Result):
         :type  _raw: None | dict
         """
         super(PassportData, self).__init__()
-        assert_type_or_raise(data, list, parameter_name="data")
+        if self._must_validate(_raw):
+            assert_type_or_raise(data, list, parameter_name="data")
+            assert_type_or_raise(credentials, EncryptedCredentials, parameter_name="credentials")
+        # end if
         self.data = data
-        assert_type_or_raise(credentials, EncryptedCredentials, parameter_name="credentials")
         self.credentials = credentials
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this PassportData to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(PassportData, self).to_array()
-
-        array['data'] = self._as_array(self.data)  # type list of EncryptedPassportElement
-        array['credentials'] = self.credentials.to_array()  # type EncryptedCredentials
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -111,39 +100,35 @@ class PassportData(Result):
         if not array:  # None or {}
             return None
         # end if
+        if PassportData._is_parsing_lazily():
+            return PassportData._from_array_lazily(array)
+        # end if
+        if not PassportData._must_validate(array):
+            return PassportData._from_array_trusted(array)
+        # end if
 
         data = PassportData.validate_array(array)
         data['_raw'] = array
         return PassportData(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(passportdata_instance)`
-        """
-        return "PassportData(data={self.data!r}, credentials={self.credentials!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(passportdata_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "PassportData.from_array({self._raw})".format(self=self)
-        # end if
-        return "PassportData(data={self.data!r}, credentials={self.credentials!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the PassportData without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in passportdata_instance`
+        :return: new PassportData instance.
+        :rtype: PassportData
         """
-        return (
-            key in ["data", "credentials"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = PassportData._set_field
+        instance = PassportData.__new__(PassportData)
+        set_field(instance, 'data', EncryptedPassportElement.from_array_list(get('data'), list_level=1))
+        set_field(instance, 'credentials', EncryptedCredentials.from_array(get('credentials')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class PassportData
 
 
@@ -176,6 +161,16 @@ class PassportFile(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'file_size', 'file_date')
+    _fields = ('file_id', 'file_unique_id', 'file_size', 'file_date')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('file_id', 'file_id', u, False),
+        ('file_unique_id', 'file_unique_id', u, False),
+        ('file_size', 'file_size', int, False),
+        ('file_date', 'file_date', int, False),
+    )
+
     def __init__(self, file_id, file_unique_id, file_size, file_date, _raw=None):
         """
         This object represents a file uploaded to Telegram Passport.
@@ -205,41 +200,20 @@ class PassportFile(Result):
         :type  _raw: None | dict
         """
         super(PassportFile, self).__init__()
-        assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+        if self._must_validate(_raw):
+            assert_type_or_raise(file_id, unicode_type, parameter_name="file_id")
+            assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
+            assert_type_or_raise(file_size, int, parameter_name="file_size")
+            assert_type_or_raise(file_date, int, parameter_name="file_date")
+        # end if
         self.file_id = file_id
-        assert_type_or_raise(file_unique_id, unicode_type, parameter_name="file_unique_id")
         self.file_unique_id = file_unique_id
-        assert_type_or_raise(file_size, int, parameter_name="file_size")
         self.file_size = file_size
-        assert_type_or_raise(file_date, int, parameter_name="file_date")
         self.file_date = file_date
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this PassportFile to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(PassportFile, self).to_array()
-
-        array['file_id'] = u(self.file_id)  # py2: type unicode, py3: type str
-        array['file_unique_id'] = u(self.file_unique_id)  # py2: type unicode, py3: type str
-        array['file_size'] = int(self.file_size)  # type int
-        array['file_date'] = int(self.file_date)  # type int
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -268,39 +242,37 @@ class PassportFile(Result):
         if not array:  # None or {}
             return None
         # end if
+        if PassportFile._is_parsing_lazily():
+            return PassportFile._from_array_lazily(array)
+        # end if
+        if not PassportFile._must_validate(array):
+            return PassportFile._from_array_trusted(array)
+        # end if
 
         data = PassportFile.validate_array(array)
         data['_raw'] = array
         return PassportFile(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(passportfile_instance)`
-        """
-        return "PassportFile(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, file_size={self.file_size!r}, file_date={self.file_date!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(passportfile_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "PassportFile.from_array({self._raw})".format(self=self)
-        # end if
-        return "PassportFile(file_id={self.file_id!r}, file_unique_id={self.file_unique_id!r}, file_size={self.file_size!r}, file_date={self.file_date!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the PassportFile without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in passportfile_instance`
+        :return: new PassportFile instance.
+        :rtype: PassportFile
         """
-        return (
-            key in ["file_id", "file_unique_id", "file_size", "file_date"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = PassportFile._set_field
+        instance = PassportFile.__new__(PassportFile)
+        set_field(instance, 'file_id', u(get('file_id')))
+        set_field(instance, 'file_unique_id', u(get('file_unique_id')))
+        set_field(instance, 'file_size', int(get('file_size')))
+        set_field(instance, 'file_date', int(get('file_date')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class PassportFile
 
 
@@ -359,6 +331,22 @@ class EncryptedPassportElement(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('type', 'hash', 'data', 'phone_number', 'email', 'files', 'front_side', 'reverse_side', 'selfie', 'translation')
+    _fields = ('type', 'hash', 'data', 'phone_number', 'email', 'files', 'front_side', 'reverse_side', 'selfie', 'translation')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('hash', 'hash', u, False),
+        ('data', 'data', u, True),
+        ('phone_number', 'phone_number', u, True),
+        ('email', 'email', u, True),
+        ('files', 'files', list, True),
+        ('front_side', 'front_side', None, True),
+        ('reverse_side', 'reverse_side', None, True),
+        ('selfie', 'selfie', None, True),
+        ('translation', 'translation', list, True),
+    )
+
     def __init__(self, type, hash, data=None, phone_number=None, email=None, files=None, front_side=None, reverse_side=None, selfie=None, translation=None, _raw=None):
         """
         Contains information about documents or other Telegram Passport elements shared with the bot by the user.
@@ -414,75 +402,32 @@ class EncryptedPassportElement(Result):
         :type  _raw: None | dict
         """
         super(EncryptedPassportElement, self).__init__()
-        assert_type_or_raise(type, unicode_type, parameter_name="type")
+        if self._must_validate(_raw):
+            assert_type_or_raise(type, unicode_type, parameter_name="type")
+            assert_type_or_raise(hash, unicode_type, parameter_name="hash")
+            assert_type_or_raise(data, None, unicode_type, parameter_name="data")
+            assert_type_or_raise(phone_number, None, unicode_type, parameter_name="phone_number")
+            assert_type_or_raise(email, None, unicode_type, parameter_name="email")
+            assert_type_or_raise(files, None, list, parameter_name="files")
+            assert_type_or_raise(front_side, None, PassportFile, parameter_name="front_side")
+            assert_type_or_raise(reverse_side, None, PassportFile, parameter_name="reverse_side")
+            assert_type_or_raise(selfie, None, PassportFile, parameter_name="selfie")
+            assert_type_or_raise(translation, None, list, parameter_name="translation")
+        # end if
         self.type = type
-        assert_type_or_raise(hash, unicode_type, parameter_name="hash")
         self.hash = hash
-        assert_type_or_raise(data, None, unicode_type, parameter_name="data")
         self.data = data
-        assert_type_or_raise(phone_number, None, unicode_type, parameter_name="phone_number")
         self.phone_number = phone_number
-        assert_type_or_raise(email, None, unicode_type, parameter_name="email")
         self.email = email
-        assert_type_or_raise(files, None, list, parameter_name="files")
         self.files = files
-        assert_type_or_raise(front_side, None, PassportFile, parameter_name="front_side")
         self.front_side = front_side
-        assert_type_or_raise(reverse_side, None, PassportFile, parameter_name="reverse_side")
         self.reverse_side = reverse_side
-        assert_type_or_raise(selfie, None, PassportFile, parameter_name="selfie")
         self.selfie = selfie
-        assert_type_or_raise(translation, None, list, parameter_name="translation")
         self.translation = translation
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this EncryptedPassportElement to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(EncryptedPassportElement, self).to_array()
-
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        array['hash'] = u(self.hash)  # py2: type unicode, py3: type str
-        if self.data is not None:
-            array['data'] = u(self.data)  # py2: type unicode, py3: type str
-        # end if
-        if self.phone_number is not None:
-            array['phone_number'] = u(self.phone_number)  # py2: type unicode, py3: type str
-        # end if
-        if self.email is not None:
-            array['email'] = u(self.email)  # py2: type unicode, py3: type str
-        # end if
-        if self.files is not None:
-            array['files'] = self._as_array(self.files)  # type list of PassportFile
-        # end if
-        if self.front_side is not None:
-            array['front_side'] = self.front_side.to_array()  # type PassportFile
-        # end if
-        if self.reverse_side is not None:
-            array['reverse_side'] = self.reverse_side.to_array()  # type PassportFile
-        # end if
-        if self.selfie is not None:
-            array['selfie'] = self.selfie.to_array()  # type PassportFile
-        # end if
-        if self.translation is not None:
-            array['translation'] = self._as_array(self.translation)  # type list of PassportFile
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -517,39 +462,51 @@ class EncryptedPassportElement(Result):
         if not array:  # None or {}
             return None
         # end if
+        if EncryptedPassportElement._is_parsing_lazily():
+            return EncryptedPassportElement._from_array_lazily(array)
+        # end if
+        if not EncryptedPassportElement._must_validate(array):
+            return EncryptedPassportElement._from_array_trusted(array)
+        # end if
 
         data = EncryptedPassportElement.validate_array(array)
         data['_raw'] = array
         return EncryptedPassportElement(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(encryptedpassportelement_instance)`
-        """
-        return "EncryptedPassportElement(type={self.type!r}, hash={self.hash!r}, data={self.data!r}, phone_number={self.phone_number!r}, email={self.email!r}, files={self.files!r}, front_side={self.front_side!r}, reverse_side={self.reverse_side!r}, selfie={self.selfie!r}, translation={self.translation!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(encryptedpassportelement_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "EncryptedPassportElement.from_array({self._raw})".format(self=self)
-        # end if
-        return "EncryptedPassportElement(type={self.type!r}, hash={self.hash!r}, data={self.data!r}, phone_number={self.phone_number!r}, email={self.email!r}, files={self.files!r}, front_side={self.front_side!r}, reverse_side={self.reverse_side!r}, selfie={self.selfie!r}, translation={self.translation!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the EncryptedPassportElement without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in encryptedpassportelement_instance`
+        :return: new EncryptedPassportElement instance.
+        :rtype: EncryptedPassportElement
         """
-        return (
-            key in ["type", "hash", "data", "phone_number", "email", "files", "front_side", "reverse_side", "selfie", "translation"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = EncryptedPassportElement._set_field
+        instance = EncryptedPassportElement.__new__(EncryptedPassportElement)
+        set_field(instance, 'type', u(get('type')))
+        set_field(instance, 'hash', u(get('hash')))
+        value = get('data')
+        set_field(instance, 'data', u(value) if value is not None else None)
+        value = get('phone_number')
+        set_field(instance, 'phone_number', u(value) if value is not None else None)
+        value = get('email')
+        set_field(instance, 'email', u(value) if value is not None else None)
+        value = get('files')
+        set_field(instance, 'files', PassportFile.from_array_list(value, list_level=1) if value is not None else None)
+        value = get('front_side')
+        set_field(instance, 'front_side', PassportFile.from_array(value) if value is not None else None)
+        value = get('reverse_side')
+        set_field(instance, 'reverse_side', PassportFile.from_array(value) if value is not None else None)
+        value = get('selfie')
+        set_field(instance, 'selfie', PassportFile.from_array(value) if value is not None else None)
+        value = get('translation')
+        set_field(instance, 'translation', PassportFile.from_array_list(value, list_level=1) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class EncryptedPassportElement
 
 
@@ -579,6 +536,15 @@ class EncryptedCredentials(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('data', 'hash', 'secret')
+    _fields = ('data', 'hash', 'secret')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('data', 'data', u, False),
+        ('hash', 'hash', u, False),
+        ('secret', 'secret', u, False),
+    )
+
     def __init__(self, data, hash, secret, _raw=None):
         """
         Contains data required for decrypting and authenticating EncryptedPassportElement.
@@ -605,38 +571,18 @@ class EncryptedCredentials(Result):
         :type  _raw: None | dict
         """
         super(EncryptedCredentials, self).__init__()
-        assert_type_or_raise(data, unicode_type, parameter_name="data")
+        if self._must_validate(_raw):
+            assert_type_or_raise(data, unicode_type, parameter_name="data")
+            assert_type_or_raise(hash, unicode_type, parameter_name="hash")
+            assert_type_or_raise(secret, unicode_type, parameter_name="secret")
+        # end if
         self.data = data
-        assert_type_or_raise(hash, unicode_type, parameter_name="hash")
         self.hash = hash
-        assert_type_or_raise(secret, unicode_type, parameter_name="secret")
         self.secret = secret
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this EncryptedCredentials to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(EncryptedCredentials, self).to_array()
-
-        array['data'] = u(self.data)  # py2: type unicode, py3: type str
-        array['hash'] = u(self.hash)  # py2: type unicode, py3: type str
-        array['secret'] = u(self.secret)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -664,37 +610,34 @@ class EncryptedCredentials(Result):
         if not array:  # None or {}
             return None
         # end if
+        if EncryptedCredentials._is_parsing_lazily():
+            return EncryptedCredentials._from_array_lazily(array)
+        # end if
+        if not EncryptedCredentials._must_validate(array):
+            return EncryptedCredentials._from_array_trusted(array)
+        # end if
 
         data = EncryptedCredentials.validate_array(array)
         data['_raw'] = array
         return EncryptedCredentials(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(encryptedcredentials_instance)`
-        """
-        return "EncryptedCredentials(data={self.data!r}, hash={self.hash!r}, secret={self.secret!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(encryptedcredentials_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "EncryptedCredentials.from_array({self._raw})".format(self=self)
-        # end if
-        return "EncryptedCredentials(data={self.data!r}, hash={self.hash!r}, secret={self.secret!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the EncryptedCredentials without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in encryptedcredentials_instance`
+        :return: new EncryptedCredentials instance.
+        :rtype: EncryptedCredentials
         """
-        return (
-            key in ["data", "hash", "secret"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = EncryptedCredentials._set_field
+        instance = EncryptedCredentials.__new__(EncryptedCredentials)
+        set_field(instance, 'data', u(get('data')))
+        set_field(instance, 'hash', u(get('hash')))
+        set_field(instance, 'secret', u(get('secret')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class EncryptedCredentials
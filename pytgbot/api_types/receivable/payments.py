@@ -46,6 +46,17 @@ class Invoice(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('title', 'description', 'start_parameter', 'currency', 'total_amount')
+    _fields = ('title', 'description', 'start_parameter', 'currency', 'total_amount')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('title', 'title', u, False),
+        ('description', 'description', u, False),
+        ('start_parameter', 'start_parameter', u, False),
+        ('currency', 'currency', u, False),
+        ('total_amount', 'total_amount', int, False),
+    )
+
     def __init__(self, title, description, start_parameter, currency, total_amount, _raw=None):
         """
         This object contains basic information about an invoice.
@@ -77,44 +88,22 @@ class Invoice(Result):
         :type  _raw: None | dict
         """
         super(Invoice, self).__init__()
-        assert_type_or_raise(title, unicode_type, parameter_name="title")
+        if self._must_validate(_raw):
+            assert_type_or_raise(title, unicode_type, parameter_name="title")
+            assert_type_or_raise(description, unicode_type, parameter_name="description")
+            assert_type_or_raise(start_parameter, unicode_type, parameter_name="start_parameter")
+            assert_type_or_raise(currency, unicode_type, parameter_name="currency")
+            assert_type_or_raise(total_amount, int, parameter_name="total_amount")
+        # end if
         self.title = title
-        assert_type_or_raise(description, unicode_type, parameter_name="description")
         self.description = description
-        assert_type_or_raise(start_parameter, unicode_type, parameter_name="start_parameter")
         self.start_parameter = start_parameter
-        assert_type_or_raise(currency, unicode_type, parameter_name="currency")
         self.currency = currency
-        assert_type_or_raise(total_amount, int, parameter_name="total_amount")
         self.total_amount = total_amount
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this Invoice to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(Invoice, self).to_array()
-
-        array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        array['description'] = u(self.description)  # py2: type unicode, py3: type str
-        array['start_parameter'] = u(self.start_parameter)  # py2: type unicode, py3: type str
-        array['currency'] = u(self.currency)  # py2: type unicode, py3: type str
-        array['total_amount'] = int(self.total_amount)  # type int
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -144,39 +133,38 @@ class Invoice(Result):
         if not array:  # None or {}
             return None
         # end if
+        if Invoice._is_parsing_lazily():
+            return Invoice._from_array_lazily(array)
+        # end if
+        if not Invoice._must_validate(array):
+            return Invoice._from_array_trusted(array)
+        # end if
 
         data = Invoice.validate_array(array)
         data['_raw'] = array
         return Invoice(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(invoice_instance)`
-        """
-        return "Invoice(title={self.title!r}, description={self.description!r}, start_parameter={self.start_parameter!r}, currency={self.currency!r}, total_amount={self.total_amount!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(invoice_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "Invoice.from_array({self._raw})".format(self=self)
-        # end if
-        return "Invoice(title={self.title!r}, description={self.description!r}, start_parameter={self.start_parameter!r}, currency={self.currency!r}, total_amount={self.total_amount!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the Invoice without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in invoice_instance`
+        :return: new Invoice instance.
+        :rtype: Invoice
         """
-        return (
-            key in ["title", "description", "start_parameter", "currency", "total_amount"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = Invoice._set_field
+        instance = Invoice.__new__(Invoice)
+        set_field(instance, 'title', u(get('title')))
+        set_field(instance, 'description', u(get('description')))
+        set_field(instance, 'start_parameter', u(get('start_parameter')))
+        set_field(instance, 'currency', u(get('currency')))
+        set_field(instance, 'total_amount', int(get('total_amount')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class Invoice
 
 
@@ -214,6 +202,18 @@ class ShippingAddress(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('country_code', 'state', 'city', 'street_line1', 'street_line2', 'post_code')
+    _fields = ('country_code', 'state', 'city', 'street_line1', 'street_line2', 'post_code')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('country_code', 'country_code', u, False),
+        ('state', 'state', u, False),
+        ('city', 'city', u, False),
+        ('street_line1', 'street_line1', u, False),
+        ('street_line2', 'street_line2', u, False),
+        ('post_code', 'post_code', u, False),
+    )
+
     def __init__(self, country_code, state, city, street_line1, street_line2, post_code, _raw=None):
         """
         This object represents a shipping address.
@@ -248,47 +248,24 @@ class ShippingAddress(Result):
         :type  _raw: None | dict
         """
         super(ShippingAddress, self).__init__()
-        assert_type_or_raise(country_code, unicode_type, parameter_name="country_code")
+        if self._must_validate(_raw):
+            assert_type_or_raise(country_code, unicode_type, parameter_name="country_code")
+            assert_type_or_raise(state, unicode_type, parameter_name="state")
+            assert_type_or_raise(city, unicode_type, parameter_name="city")
+            assert_type_or_raise(street_line1, unicode_type, parameter_name="street_line1")
+            assert_type_or_raise(street_line2, unicode_type, parameter_name="street_line2")
+            assert_type_or_raise(post_code, unicode_type, parameter_name="post_code")
+        # end if
         self.country_code = country_code
-        assert_type_or_raise(state, unicode_type, parameter_name="state")
         self.state = state
-        assert_type_or_raise(city, unicode_type, parameter_name="city")
         self.city = city
-        assert_type_or_raise(street_line1, unicode_type, parameter_name="street_line1")
         self.street_line1 = street_line1
-        assert_type_or_raise(street_line2, unicode_type, parameter_name="street_line2")
         self.street_line2 = street_line2
-        assert_type_or_raise(post_code, unicode_type, parameter_name="post_code")
         self.post_code = post_code
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ShippingAddress to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ShippingAddress, self).to_array()
-
-        array['country_code'] = u(self.country_code)  # py2: type unicode, py3: type str
-        array['state'] = u(self.state)  # py2: type unicode, py3: type str
-        array['city'] = u(self.city)  # py2: type unicode, py3: type str
-        array['street_line1'] = u(self.street_line1)  # py2: type unicode, py3: type str
-        array['street_line2'] = u(self.street_line2)  # py2: type unicode, py3: type str
-        array['post_code'] = u(self.post_code)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -319,39 +296,39 @@ class ShippingAddress(Result):
         if not array:  # None or {}
             return None
         # end if
+        if ShippingAddress._is_parsing_lazily():
+            return ShippingAddress._from_array_lazily(array)
+        # end if
+        if not ShippingAddress._must_validate(array):
+            return ShippingAddress._from_array_trusted(array)
+        # end if
 
         data = ShippingAddress.validate_array(array)
         data['_raw'] = array
         return ShippingAddress(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(shippingaddress_instance)`
-        """
-        return "ShippingAddress(country_code={self.country_code!r}, state={self.state!r}, city={self.city!r}, street_line1={self.street_line1!r}, street_line2={self.street_line2!r}, post_code={self.post_code!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(shippingaddress_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "ShippingAddress.from_array({self._raw})".format(self=self)
-        # end if
-        return "ShippingAddress(country_code={self.country_code!r}, state={self.state!r}, city={self.city!r}, street_line1={self.street_line1!r}, street_line2={self.street_line2!r}, post_code={self.post_code!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the ShippingAddress without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in shippingaddress_instance`
+        :return: new ShippingAddress instance.
+        :rtype: ShippingAddress
         """
-        return (
-            key in ["country_code", "state", "city", "street_line1", "street_line2", "post_code"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = ShippingAddress._set_field
+        instance = ShippingAddress.__new__(ShippingAddress)
+        set_field(instance, 'country_code', u(get('country_code')))
+        set_field(instance, 'state', u(get('state')))
+        set_field(instance, 'city', u(get('city')))
+        set_field(instance, 'street_line1', u(get('street_line1')))
+        set_field(instance, 'street_line2', u(get('street_line2')))
+        set_field(instance, 'post_code', u(get('post_code')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class ShippingAddress
 
 
@@ -379,6 +356,16 @@ class OrderInfo(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('name', 'phone_number', 'email', 'shipping_address')
+    _fields = ('name', 'phone_number', 'email', 'shipping_address')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('name', 'name', u, True),
+        ('phone_number', 'phone_number', u, True),
+        ('email', 'email', u, True),
+        ('shipping_address', 'shipping_address', None, True),
+    )
+
     def __init__(self, name=None, phone_number=None, email=None, shipping_address=None, _raw=None):
         """
         This object represents information about an order.
@@ -403,49 +390,20 @@ class OrderInfo(Result):
         :type  _raw: None | dict
         """
         super(OrderInfo, self).__init__()
-        assert_type_or_raise(name, None, unicode_type, parameter_name="name")
+        if self._must_validate(_raw):
+            assert_type_or_raise(name, None, unicode_type, parameter_name="name")
+            assert_type_or_raise(phone_number, None, unicode_type, parameter_name="phone_number")
+            assert_type_or_raise(email, None, unicode_type, parameter_name="email")
+            assert_type_or_raise(shipping_address, None, ShippingAddress, parameter_name="shipping_address")
+        # end if
         self.name = name
-        assert_type_or_raise(phone_number, None, unicode_type, parameter_name="phone_number")
         self.phone_number = phone_number
-        assert_type_or_raise(email, None, unicode_type, parameter_name="email")
         self.email = email
-        assert_type_or_raise(shipping_address, None, ShippingAddress, parameter_name="shipping_address")
         self.shipping_address = shipping_address
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this OrderInfo to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(OrderInfo, self).to_array()
-
-        if self.name is not None:
-            array['name'] = u(self.name)  # py2: type unicode, py3: type str
-        # end if
-        if self.phone_number is not None:
-            array['phone_number'] = u(self.phone_number)  # py2: type unicode, py3: type str
-        # end if
-        if self.email is not None:
-            array['email'] = u(self.email)  # py2: type unicode, py3: type str
-        # end if
-        if self.shipping_address is not None:
-            array['shipping_address'] = self.shipping_address.to_array()  # type ShippingAddress
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -474,39 +432,41 @@ class OrderInfo(Result):
         if not array:  # None or {}
             return None
         # end if
+        if OrderInfo._is_parsing_lazily():
+            return OrderInfo._from_array_lazily(array)
+        # end if
+        if not OrderInfo._must_validate(array):
+            return OrderInfo._from_array_trusted(array)
+        # end if
 
         data = OrderInfo.validate_array(array)
         data['_raw'] = array
         return OrderInfo(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(orderinfo_instance)`
-        """
-        return "OrderInfo(name={self.name!r}, phone_number={self.phone_number!r}, email={self.email!r}, shipping_address={self.shipping_address!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(orderinfo_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "OrderInfo.from_array({self._raw})".format(self=self)
-        # end if
-        return "OrderInfo(name={self.name!r}, phone_number={self.phone_number!r}, email={self.email!r}, shipping_address={self.shipping_address!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the OrderInfo without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in orderinfo_instance`
+        :return: new OrderInfo instance.
+        :rtype: OrderInfo
         """
-        return (
-            key in ["name", "phone_number", "email", "shipping_address"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = OrderInfo._set_field
+        instance = OrderInfo.__new__(OrderInfo)
+        value = get('name')
+        set_field(instance, 'name', u(value) if value is not None else None)
+        value = get('phone_number')
+        set_field(instance, 'phone_number', u(value) if value is not None else None)
+        value = get('email')
+        set_field(instance, 'email', u(value) if value is not None else None)
+        value = get('shipping_address')
+        set_field(instance, 'shipping_address', ShippingAddress.from_array(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class OrderInfo
 
 
@@ -547,6 +507,19 @@ class SuccessfulPayment(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('currency', 'total_amount', 'invoice_payload', 'telegram_payment_charge_id', 'provider_payment_charge_id', 'shipping_option_id', 'order_info')
+    _fields = ('currency', 'total_amount', 'invoice_payload', 'telegram_payment_charge_id', 'provider_payment_charge_id', 'shipping_option_id', 'order_info')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('currency', 'currency', u, False),
+        ('total_amount', 'total_amount', int, False),
+        ('invoice_payload', 'invoice_payload', u, False),
+        ('telegram_payment_charge_id', 'telegram_payment_charge_id', u, False),
+        ('provider_payment_charge_id', 'provider_payment_charge_id', u, False),
+        ('shipping_option_id', 'shipping_option_id', u, True),
+        ('order_info', 'order_info', None, True),
+    )
+
     def __init__(self, currency, total_amount, invoice_payload, telegram_payment_charge_id, provider_payment_charge_id, shipping_option_id=None, order_info=None, _raw=None):
         """
         This object contains basic information about a successful payment.
@@ -584,54 +557,26 @@ class SuccessfulPayment(Result):
         :type  _raw: None | dict
         """
         super(SuccessfulPayment, self).__init__()
-        assert_type_or_raise(currency, unicode_type, parameter_name="currency")
+        if self._must_validate(_raw):
+            assert_type_or_raise(currency, unicode_type, parameter_name="currency")
+            assert_type_or_raise(total_amount, int, parameter_name="total_amount")
+            assert_type_or_raise(invoice_payload, unicode_type, parameter_name="invoice_payload")
+            assert_type_or_raise(telegram_payment_charge_id, unicode_type, parameter_name="telegram_payment_charge_id")
+            assert_type_or_raise(provider_payment_charge_id, unicode_type, parameter_name="provider_payment_charge_id")
+            assert_type_or_raise(shipping_option_id, None, unicode_type, parameter_name="shipping_option_id")
+            assert_type_or_raise(order_info, None, OrderInfo, parameter_name="order_info")
+        # end if
         self.currency = currency
-        assert_type_or_raise(total_amount, int, parameter_name="total_amount")
         self.total_amount = total_amount
-        assert_type_or_raise(invoice_payload, unicode_type, parameter_name="invoice_payload")
         self.invoice_payload = invoice_payload
-        assert_type_or_raise(telegram_payment_charge_id, unicode_type, parameter_name="telegram_payment_charge_id")
         self.telegram_payment_charge_id = telegram_payment_charge_id
-        assert_type_or_raise(provider_payment_charge_id, unicode_type, parameter_name="provider_payment_charge_id")
         self.provider_payment_charge_id = provider_payment_charge_id
-        assert_type_or_raise(shipping_option_id, None, unicode_type, parameter_name="shipping_option_id")
         self.shipping_option_id = shipping_option_id
-        assert_type_or_raise(order_info, None, OrderInfo, parameter_name="order_info")
         self.order_info = order_info
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this SuccessfulPayment to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(SuccessfulPayment, self).to_array()
-
-        array['currency'] = u(self.currency)  # py2: type unicode, py3: type str
-        array['total_amount'] = int(self.total_amount)  # type int
-        array['invoice_payload'] = u(self.invoice_payload)  # py2: type unicode, py3: type str
-        array['telegram_payment_charge_id'] = u(self.telegram_payment_charge_id)  # py2: type unicode, py3: type str
-        array['provider_payment_charge_id'] = u(self.provider_payment_charge_id)  # py2: type unicode, py3: type str
-        if self.shipping_option_id is not None:
-            array['shipping_option_id'] = u(self.shipping_option_id)  # py2: type unicode, py3: type str
-        # end if
-        if self.order_info is not None:
-            array['order_info'] = self.order_info.to_array()  # type OrderInfo
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -663,39 +608,42 @@ class SuccessfulPayment(Result):
         if not array:  # None or {}
             return None
         # end if
+        if SuccessfulPayment._is_parsing_lazily():
+            return SuccessfulPayment._from_array_lazily(array)
+        # end if
+        if not SuccessfulPayment._must_validate(array):
+            return SuccessfulPayment._from_array_trusted(array)
+        # end if
 
         data = SuccessfulPayment.validate_array(array)
         data['_raw'] = array
         return SuccessfulPayment(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(successfulpayment_instance)`
-        """
-        return "SuccessfulPayment(currency={self.currency!r}, total_amount={self.total_amount!r}, invoice_payload={self.invoice_payload!r}, telegram_payment_charge_id={self.telegram_payment_charge_id!r}, provider_payment_charge_id={self.provider_payment_charge_id!r}, shipping_option_id={self.shipping_option_id!r}, order_info={self.order_info!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(successfulpayment_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "SuccessfulPayment.from_array({self._raw})".format(self=self)
-        # end if
-        return "SuccessfulPayment(currency={self.currency!r}, total_amount={self.total_amount!r}, invoice_payload={self.invoice_payload!r}, telegram_payment_charge_id={self.telegram_payment_charge_id!r}, provider_payment_charge_id={self.provider_payment_charge_id!r}, shipping_option_id={self.shipping_option_id!r}, order_info={self.order_info!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the SuccessfulPayment without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in successfulpayment_instance`
+        :return: new SuccessfulPayment instance.
+        :rtype: SuccessfulPayment
         """
-        return (
-            key in ["currency", "total_amount", "invoice_payload", "telegram_payment_charge_id", "provider_payment_charge_id", "shipping_option_id", "order_info"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = SuccessfulPayment._set_field
+        instance = SuccessfulPayment.__new__(SuccessfulPayment)
+        set_field(instance, 'currency', u(get('currency')))
+        set_field(instance, 'total_amount', int(get('total_amount')))
+        set_field(instance, 'invoice_payload', u(get('invoice_payload')))
+        set_field(instance, 'telegram_payment_charge_id', u(get('telegram_payment_charge_id')))
+        set_field(instance, 'provider_payment_charge_id', u(get('provider_payment_charge_id')))
+        value = get('shipping_option_id')
+        set_field(instance, 'shipping_option_id', u(value) if value is not None else None)
+        value = get('order_info')
+        set_field(instance, 'order_info', OrderInfo.from_array(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class SuccessfulPayment
 
 
@@ -727,6 +675,17 @@ class ShippingQuery(UpdateType):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('id', 'from_peer', 'invoice_payload', 'shipping_address')
+    _fields = ('id', 'from_peer', 'invoice_payload', 'shipping_address')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _api_names = {'from_peer': 'from'}  # the fields with a different name in the api data.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('id', 'id', u, False),
+        ('from_peer', 'from', None, False),
+        ('invoice_payload', 'invoice_payload', u, False),
+        ('shipping_address', 'shipping_address', None, False),
+    )
+
     def __init__(self, id, from_peer, invoice_payload, shipping_address, _raw=None):
         """
         This object contains information about an incoming shipping query.
@@ -755,43 +714,21 @@ class ShippingQuery(UpdateType):
         :type  _raw: None | dict
         """
         super(ShippingQuery, self).__init__()
-        from .peer import User
-        assert_type_or_raise(id, unicode_type, parameter_name="id")
+        if self._must_validate(_raw):
+            from .peer import User
+            assert_type_or_raise(id, unicode_type, parameter_name="id")
+            assert_type_or_raise(from_peer, User, parameter_name="from_peer")
+            assert_type_or_raise(invoice_payload, unicode_type, parameter_name="invoice_payload")
+            assert_type_or_raise(shipping_address, ShippingAddress, parameter_name="shipping_address")
+        # end if
         self.id = id
-        assert_type_or_raise(from_peer, User, parameter_name="from_peer")
         self.from_peer = from_peer
-        assert_type_or_raise(invoice_payload, unicode_type, parameter_name="invoice_payload")
         self.invoice_payload = invoice_payload
-        assert_type_or_raise(shipping_address, ShippingAddress, parameter_name="shipping_address")
         self.shipping_address = shipping_address
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ShippingQuery to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .peer import User
-        array = super(ShippingQuery, self).to_array()
-
-        array['id'] = u(self.id)  # py2: type unicode, py3: type str
-        array['from'] = self.from_peer.to_array()  # type User
-        array['invoice_payload'] = u(self.invoice_payload)  # py2: type unicode, py3: type str
-        array['shipping_address'] = self.shipping_address.to_array()  # type ShippingAddress
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -821,39 +758,37 @@ class ShippingQuery(UpdateType):
         if not array:  # None or {}
             return None
         # end if
+        if ShippingQuery._is_parsing_lazily():
+            return ShippingQuery._from_array_lazily(array)
+        # end if
+        if not ShippingQuery._must_validate(array):
+            return ShippingQuery._from_array_trusted(array)
+        # end if
 
         data = ShippingQuery.validate_array(array)
         data['_raw'] = array
         return ShippingQuery(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(shippingquery_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        return "ShippingQuery(id={self.id!r}, from_peer={self.from_peer!r}, invoice_payload={self.invoice_payload!r}, shipping_address={self.shipping_address!r})".format(self=self)
-    # end def __str__
+        Single pass version of :meth:`from_array`, building the ShippingQuery without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __repr__(self):
-        """
-        Implements `repr(shippingquery_instance)`
-        """
-        if self._raw:
-            return "ShippingQuery.from_array({self._raw})".format(self=self)
-        # end if
-        return "ShippingQuery(id={self.id!r}, from_peer={self.from_peer!r}, invoice_payload={self.invoice_payload!r}, shipping_address={self.shipping_address!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in shippingquery_instance`
+        :return: new ShippingQuery instance.
+        :rtype: ShippingQuery
         """
-        return (
-            key in ["id", "from_peer", "invoice_payload", "shipping_address"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = ShippingQuery._set_field
+        instance = ShippingQuery.__new__(ShippingQuery)
+        set_field(instance, 'id', u(get('id')))
+        set_field(instance, 'from_peer', User.from_array(get('from')))
+        set_field(instance, 'invoice_payload', u(get('invoice_payload')))
+        set_field(instance, 'shipping_address', ShippingAddress.from_array(get('shipping_address')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class ShippingQuery
 
 
@@ -894,6 +829,20 @@ class PreCheckoutQuery(UpdateType):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('id', 'from_peer', 'currency', 'total_amount', 'invoice_payload', 'shipping_option_id', 'order_info')
+    _fields = ('id', 'from_peer', 'currency', 'total_amount', 'invoice_payload', 'shipping_option_id', 'order_info')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _api_names = {'from_peer': 'from'}  # the fields with a different name in the api data.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('id', 'id', u, False),
+        ('from_peer', 'from', None, False),
+        ('currency', 'currency', u, False),
+        ('total_amount', 'total_amount', int, False),
+        ('invoice_payload', 'invoice_payload', u, False),
+        ('shipping_option_id', 'shipping_option_id', u, True),
+        ('order_info', 'order_info', None, True),
+    )
+
     def __init__(self, id, from_peer, currency, total_amount, invoice_payload, shipping_option_id=None, order_info=None, _raw=None):
         """
         This object contains information about an incoming pre-checkout query.
@@ -931,56 +880,27 @@ class PreCheckoutQuery(UpdateType):
         :type  _raw: None | dict
         """
         super(PreCheckoutQuery, self).__init__()
-        from .peer import User
-        assert_type_or_raise(id, unicode_type, parameter_name="id")
+        if self._must_validate(_raw):
+            from .peer import User
+            assert_type_or_raise(id, unicode_type, parameter_name="id")
+            assert_type_or_raise(from_peer, User, parameter_name="from_peer")
+            assert_type_or_raise(currency, unicode_type, parameter_name="currency")
+            assert_type_or_raise(total_amount, int, parameter_name="total_amount")
+            assert_type_or_raise(invoice_payload, unicode_type, parameter_name="invoice_payload")
+            assert_type_or_raise(shipping_option_id, None, unicode_type, parameter_name="shipping_option_id")
+            assert_type_or_raise(order_info, None, OrderInfo, parameter_name="order_info")
+        # end if
         self.id = id
-        assert_type_or_raise(from_peer, User, parameter_name="from_peer")
         self.from_peer = from_peer
-        assert_type_or_raise(currency, unicode_type, parameter_name="currency")
         self.currency = currency
-        assert_type_or_raise(total_amount, int, parameter_name="total_amount")
         self.total_amount = total_amount
-        assert_type_or_raise(invoice_payload, unicode_type, parameter_name="invoice_payload")
         self.invoice_payload = invoice_payload
-        assert_type_or_raise(shipping_option_id, None, unicode_type, parameter_name="shipping_option_id")
         self.shipping_option_id = shipping_option_id
-        assert_type_or_raise(order_info, None, OrderInfo, parameter_name="order_info")
         self.order_info = order_info
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this PreCheckoutQuery to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .peer import User
-        array = super(PreCheckoutQuery, self).to_array()
-
-        array['id'] = u(self.id)  # py2: type unicode, py3: type str
-        array['from'] = self.from_peer.to_array()  # type User
-        array['currency'] = u(self.currency)  # py2: type unicode, py3: type str
-        array['total_amount'] = int(self.total_amount)  # type int
-        array['invoice_payload'] = u(self.invoice_payload)  # py2: type unicode, py3: type str
-        if self.shipping_option_id is not None:
-            array['shipping_option_id'] = u(self.shipping_option_id)  # py2: type unicode, py3: type str
-        # end if
-        if self.order_info is not None:
-            array['order_info'] = self.order_info.to_array()  # type OrderInfo
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1013,37 +933,44 @@ class PreCheckoutQuery(UpdateType):
         if not array:  # None or {}
             return None
         # end if
+        if PreCheckoutQuery._is_parsing_lazily():
+            return PreCheckoutQuery._from_array_lazily(array)
+        # end if
+        if not PreCheckoutQuery._must_validate(array):
+            return PreCheckoutQuery._from_array_trusted(array)
+        # end if
 
         data = PreCheckoutQuery.validate_array(array)
         data['_raw'] = array
         return PreCheckoutQuery(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(precheckoutquery_instance)`
-        """
-        return "PreCheckoutQuery(id={self.id!r}, from_peer={self.from_peer!r}, currency={self.currency!r}, total_amount={self.total_amount!r}, invoice_payload={self.invoice_payload!r}, shipping_option_id={self.shipping_option_id!r}, order_info={self.order_info!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(precheckoutquery_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "PreCheckoutQuery.from_array({self._raw})".format(self=self)
-        # end if
-        return "PreCheckoutQuery(id={self.id!r}, from_peer={self.from_peer!r}, currency={self.currency!r}, total_amount={self.total_amount!r}, invoice_payload={self.invoice_payload!r}, shipping_option_id={self.shipping_option_id!r}, order_info={self.order_info!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the PreCheckoutQuery without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in precheckoutquery_instance`
+        :return: new PreCheckoutQuery instance.
+        :rtype: PreCheckoutQuery
         """
-        return (
-            key in ["id", "from_peer", "currency", "total_amount", "invoice_payload", "shipping_option_id", "order_info"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = PreCheckoutQuery._set_field
+        instance = PreCheckoutQuery.__new__(PreCheckoutQuery)
+        set_field(instance, 'id', u(get('id')))
+        set_field(instance, 'from_peer', User.from_array(get('from')))
+        set_field(instance, 'currency', u(get('currency')))
+        set_field(instance, 'total_amount', int(get('total_amount')))
+        set_field(instance, 'invoice_payload', u(get('invoice_payload')))
+        value = get('shipping_option_id')
+        set_field(instance, 'shipping_option_id', u(value) if value is not None else None)
+        value = get('order_info')
+        set_field(instance, 'order_info', OrderInfo.from_array(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class PreCheckoutQuery
+
+
+# bottom of file, as those modules import this one too. Used by the `_from_array_trusted(…)` functions.
+from .peer import User
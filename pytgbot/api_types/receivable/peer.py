@@ -33,6 +33,8 @@ class Peer(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ()
+
     pass
 # end class Peer
 
@@ -50,6 +52,8 @@ class ChatMember(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ()
+
 
 
     def __init__(self, _raw=None):
@@ -69,25 +73,6 @@ class ChatMember(Result):
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ChatMember to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ChatMember, self).to_array()
-
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -104,58 +89,22 @@ class ChatMember(Result):
     @staticmethod
     def from_array(array):
         """
-        Deserialize the matching ChatMember subclass from a given dictionary.
+        Deserialize the matching ChatMember subclass from a given dictionary, looked up by its `status`.
 
-        :return: new ChatMember instance.
+        :return: new ChatMember subclass instance.
         :rtype: ChatMember
         """
         if not array:  # None or {}
             return None
         # end if
 
-        STATUS_TO_SUBCLASS_MAPPING = {
-            "creator": ChatMemberOwner,
-            "administrator": ChatMemberAdministrator,
-            "member": ChatMemberMember,
-            "restricted": ChatMemberRestricted,
-            "left": ChatMemberLeft,
-            "kicked": ChatMemberBanned,
-        }
-        assert "status" in array
-        status = array["status"]
-        assert status in STATUS_TO_SUBCLASS_MAPPING
-        cls = STATUS_TO_SUBCLASS_MAPPING[status]
-        instance = cls.from_array(array)
-        return instance
-    # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(chatmember_instance)`
-        """
-        return "ChatMember()".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(chatmember_instance)`
-        """
-        if self._raw:
-            return "ChatMember.from_array({self._raw})".format(self=self)
+        clazz = ChatMember._subclasses.get(array.get('status'))
+        if clazz is None:
+            from ...exceptions import TgApiParseException
+            raise TgApiParseException('Unknown ChatMember status {value!r}.'.format(value=array.get('status')))
         # end if
-        return "ChatMember()".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in chatmember_instance`
-        """
-        return (
-            key in []
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        return clazz.from_array(array)
+    # end def from_array
 
 
 # end class ChatMember
@@ -207,6 +156,21 @@ class User(Peer):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('id', 'is_bot', 'first_name', 'last_name', 'username', 'language_code', 'can_join_groups', 'can_read_all_group_messages', 'supports_inline_queries')
+    _fields = ('id', 'is_bot', 'first_name', 'last_name', 'username', 'language_code', 'can_join_groups', 'can_read_all_group_messages', 'supports_inline_queries')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('id', 'id', int, False),
+        ('is_bot', 'is_bot', bool, False),
+        ('first_name', 'first_name', u, False),
+        ('last_name', 'last_name', u, True),
+        ('username', 'username', u, True),
+        ('language_code', 'language_code', u, True),
+        ('can_join_groups', 'can_join_groups', bool, True),
+        ('can_read_all_group_messages', 'can_read_all_group_messages', bool, True),
+        ('supports_inline_queries', 'supports_inline_queries', bool, True),
+    )
+
     def __init__(self, id, is_bot, first_name, last_name=None, username=None, language_code=None, can_join_groups=None, can_read_all_group_messages=None, supports_inline_queries=None, _raw=None):
         """
         This object represents a Telegram user or bot.
@@ -253,68 +217,30 @@ class User(Peer):
         :type  _raw: None | dict
         """
         super(User, self).__init__()
-        assert_type_or_raise(id, int, parameter_name="id")
+        if self._must_validate(_raw):
+            assert_type_or_raise(id, int, parameter_name="id")
+            assert_type_or_raise(is_bot, bool, parameter_name="is_bot")
+            assert_type_or_raise(first_name, unicode_type, parameter_name="first_name")
+            assert_type_or_raise(last_name, None, unicode_type, parameter_name="last_name")
+            assert_type_or_raise(username, None, unicode_type, parameter_name="username")
+            assert_type_or_raise(language_code, None, unicode_type, parameter_name="language_code")
+            assert_type_or_raise(can_join_groups, None, bool, parameter_name="can_join_groups")
+            assert_type_or_raise(can_read_all_group_messages, None, bool, parameter_name="can_read_all_group_messages")
+            assert_type_or_raise(supports_inline_queries, None, bool, parameter_name="supports_inline_queries")
+        # end if
         self.id = id
-        assert_type_or_raise(is_bot, bool, parameter_name="is_bot")
         self.is_bot = is_bot
-        assert_type_or_raise(first_name, unicode_type, parameter_name="first_name")
         self.first_name = first_name
-        assert_type_or_raise(last_name, None, unicode_type, parameter_name="last_name")
         self.last_name = last_name
-        assert_type_or_raise(username, None, unicode_type, parameter_name="username")
         self.username = username
-        assert_type_or_raise(language_code, None, unicode_type, parameter_name="language_code")
         self.language_code = language_code
-        assert_type_or_raise(can_join_groups, None, bool, parameter_name="can_join_groups")
         self.can_join_groups = can_join_groups
-        assert_type_or_raise(can_read_all_group_messages, None, bool, parameter_name="can_read_all_group_messages")
         self.can_read_all_group_messages = can_read_all_group_messages
-        assert_type_or_raise(supports_inline_queries, None, bool, parameter_name="supports_inline_queries")
         self.supports_inline_queries = supports_inline_queries
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this User to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(User, self).to_array()
-
-        array['id'] = int(self.id)  # type int
-        array['is_bot'] = bool(self.is_bot)  # type bool
-        array['first_name'] = u(self.first_name)  # py2: type unicode, py3: type str
-        if self.last_name is not None:
-            array['last_name'] = u(self.last_name)  # py2: type unicode, py3: type str
-        # end if
-        if self.username is not None:
-            array['username'] = u(self.username)  # py2: type unicode, py3: type str
-        # end if
-        if self.language_code is not None:
-            array['language_code'] = u(self.language_code)  # py2: type unicode, py3: type str
-        # end if
-        if self.can_join_groups is not None:
-            array['can_join_groups'] = bool(self.can_join_groups)  # type bool
-        # end if
-        if self.can_read_all_group_messages is not None:
-            array['can_read_all_group_messages'] = bool(self.can_read_all_group_messages)  # type bool
-        # end if
-        if self.supports_inline_queries is not None:
-            array['supports_inline_queries'] = bool(self.supports_inline_queries)  # type bool
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -348,39 +274,48 @@ class User(Peer):
         if not array:  # None or {}
             return None
         # end if
+        if User._is_parsing_lazily():
+            return User._from_array_lazily(array)
+        # end if
+        if not User._must_validate(array):
+            return User._from_array_trusted(array)
+        # end if
 
         data = User.validate_array(array)
         data['_raw'] = array
         return User(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(user_instance)`
-        """
-        return "User(id={self.id!r}, is_bot={self.is_bot!r}, first_name={self.first_name!r}, last_name={self.last_name!r}, username={self.username!r}, language_code={self.language_code!r}, can_join_groups={self.can_join_groups!r}, can_read_all_group_messages={self.can_read_all_group_messages!r}, supports_inline_queries={self.supports_inline_queries!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(user_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "User.from_array({self._raw})".format(self=self)
-        # end if
-        return "User(id={self.id!r}, is_bot={self.is_bot!r}, first_name={self.first_name!r}, last_name={self.last_name!r}, username={self.username!r}, language_code={self.language_code!r}, can_join_groups={self.can_join_groups!r}, can_read_all_group_messages={self.can_read_all_group_messages!r}, supports_inline_queries={self.supports_inline_queries!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the User without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in user_instance`
+        :return: new User instance.
+        :rtype: User
         """
-        return (
-            key in ["id", "is_bot", "first_name", "last_name", "username", "language_code", "can_join_groups", "can_read_all_group_messages", "supports_inline_queries"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = User._set_field
+        instance = User.__new__(User)
+        set_field(instance, 'id', int(get('id')))
+        set_field(instance, 'is_bot', bool(get('is_bot')))
+        set_field(instance, 'first_name', u(get('first_name')))
+        value = get('last_name')
+        set_field(instance, 'last_name', u(value) if value is not None else None)
+        value = get('username')
+        set_field(instance, 'username', u(value) if value is not None else None)
+        value = get('language_code')
+        set_field(instance, 'language_code', u(value) if value is not None else None)
+        value = get('can_join_groups')
+        set_field(instance, 'can_join_groups', bool(value) if value is not None else None)
+        value = get('can_read_all_group_messages')
+        set_field(instance, 'can_read_all_group_messages', bool(value) if value is not None else None)
+        value = get('supports_inline_queries')
+        set_field(instance, 'supports_inline_queries', bool(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class User
 
 
@@ -477,6 +412,32 @@ class Chat(Peer):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('id', 'type', 'title', 'username', 'first_name', 'last_name', 'photo', 'bio', 'has_private_forwards', 'description', 'invite_link', 'pinned_message', 'permissions', 'slow_mode_delay', 'message_auto_delete_time', 'has_protected_content', 'sticker_set_name', 'can_set_sticker_set', 'linked_chat_id', 'location')
+    _fields = ('id', 'type', 'title', 'username', 'first_name', 'last_name', 'photo', 'bio', 'has_private_forwards', 'description', 'invite_link', 'pinned_message', 'permissions', 'slow_mode_delay', 'message_auto_delete_time', 'has_protected_content', 'sticker_set_name', 'can_set_sticker_set', 'linked_chat_id', 'location')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('id', 'id', int, False),
+        ('type', 'type', u, False),
+        ('title', 'title', u, True),
+        ('username', 'username', u, True),
+        ('first_name', 'first_name', u, True),
+        ('last_name', 'last_name', u, True),
+        ('photo', 'photo', None, True),
+        ('bio', 'bio', u, True),
+        ('has_private_forwards', 'has_private_forwards', bool, True),
+        ('description', 'description', u, True),
+        ('invite_link', 'invite_link', u, True),
+        ('pinned_message', 'pinned_message', None, True),
+        ('permissions', 'permissions', None, True),
+        ('slow_mode_delay', 'slow_mode_delay', int, True),
+        ('message_auto_delete_time', 'message_auto_delete_time', int, True),
+        ('has_protected_content', 'has_protected_content', bool, True),
+        ('sticker_set_name', 'sticker_set_name', u, True),
+        ('can_set_sticker_set', 'can_set_sticker_set', bool, True),
+        ('linked_chat_id', 'linked_chat_id', int, True),
+        ('location', 'location', None, True),
+    )
+
     def __init__(self, id, type, title=None, username=None, first_name=None, last_name=None, photo=None, bio=None, has_private_forwards=None, description=None, invite_link=None, pinned_message=None, permissions=None, slow_mode_delay=None, message_auto_delete_time=None, has_protected_content=None, sticker_set_name=None, can_set_sticker_set=None, linked_chat_id=None, location=None, _raw=None):
         """
         This object represents a chat.
@@ -570,129 +531,54 @@ class Chat(Peer):
         :type  _raw: None | dict
         """
         super(Chat, self).__init__()
-        from .media import ChatPhoto
-        from .updates import Message
-        assert_type_or_raise(id, int, parameter_name="id")
+        if self._must_validate(_raw):
+            from .media import ChatPhoto
+            from .updates import Message
+            assert_type_or_raise(id, int, parameter_name="id")
+            assert_type_or_raise(type, unicode_type, parameter_name="type")
+            assert_type_or_raise(title, None, unicode_type, parameter_name="title")
+            assert_type_or_raise(username, None, unicode_type, parameter_name="username")
+            assert_type_or_raise(first_name, None, unicode_type, parameter_name="first_name")
+            assert_type_or_raise(last_name, None, unicode_type, parameter_name="last_name")
+            assert_type_or_raise(photo, None, ChatPhoto, parameter_name="photo")
+            assert_type_or_raise(bio, None, unicode_type, parameter_name="bio")
+            assert_type_or_raise(has_private_forwards, None, bool, parameter_name="has_private_forwards")
+            assert_type_or_raise(description, None, unicode_type, parameter_name="description")
+            assert_type_or_raise(invite_link, None, unicode_type, parameter_name="invite_link")
+            assert_type_or_raise(pinned_message, None, Message, parameter_name="pinned_message")
+            assert_type_or_raise(permissions, None, ChatPermissions, parameter_name="permissions")
+            assert_type_or_raise(slow_mode_delay, None, int, parameter_name="slow_mode_delay")
+            assert_type_or_raise(message_auto_delete_time, None, int, parameter_name="message_auto_delete_time")
+            assert_type_or_raise(has_protected_content, None, bool, parameter_name="has_protected_content")
+            assert_type_or_raise(sticker_set_name, None, unicode_type, parameter_name="sticker_set_name")
+            assert_type_or_raise(can_set_sticker_set, None, bool, parameter_name="can_set_sticker_set")
+            assert_type_or_raise(linked_chat_id, None, int, parameter_name="linked_chat_id")
+            assert_type_or_raise(location, None, ChatLocation, parameter_name="location")
+        # end if
         self.id = id
-        assert_type_or_raise(type, unicode_type, parameter_name="type")
         self.type = type
-        assert_type_or_raise(title, None, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(username, None, unicode_type, parameter_name="username")
         self.username = username
-        assert_type_or_raise(first_name, None, unicode_type, parameter_name="first_name")
         self.first_name = first_name
-        assert_type_or_raise(last_name, None, unicode_type, parameter_name="last_name")
         self.last_name = last_name
-        assert_type_or_raise(photo, None, ChatPhoto, parameter_name="photo")
         self.photo = photo
-        assert_type_or_raise(bio, None, unicode_type, parameter_name="bio")
         self.bio = bio
-        assert_type_or_raise(has_private_forwards, None, bool, parameter_name="has_private_forwards")
         self.has_private_forwards = has_private_forwards
-        assert_type_or_raise(description, None, unicode_type, parameter_name="description")
         self.description = description
-        assert_type_or_raise(invite_link, None, unicode_type, parameter_name="invite_link")
         self.invite_link = invite_link
-        assert_type_or_raise(pinned_message, None, Message, parameter_name="pinned_message")
         self.pinned_message = pinned_message
-        assert_type_or_raise(permissions, None, ChatPermissions, parameter_name="permissions")
         self.permissions = permissions
-        assert_type_or_raise(slow_mode_delay, None, int, parameter_name="slow_mode_delay")
         self.slow_mode_delay = slow_mode_delay
-        assert_type_or_raise(message_auto_delete_time, None, int, parameter_name="message_auto_delete_time")
         self.message_auto_delete_time = message_auto_delete_time
-        assert_type_or_raise(has_protected_content, None, bool, parameter_name="has_protected_content")
         self.has_protected_content = has_protected_content
-        assert_type_or_raise(sticker_set_name, None, unicode_type, parameter_name="sticker_set_name")
         self.sticker_set_name = sticker_set_name
-        assert_type_or_raise(can_set_sticker_set, None, bool, parameter_name="can_set_sticker_set")
         self.can_set_sticker_set = can_set_sticker_set
-        assert_type_or_raise(linked_chat_id, None, int, parameter_name="linked_chat_id")
         self.linked_chat_id = linked_chat_id
-        assert_type_or_raise(location, None, ChatLocation, parameter_name="location")
         self.location = location
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this Chat to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .media import ChatPhoto
-        from .updates import Message
-        array = super(Chat, self).to_array()
-
-        array['id'] = int(self.id)  # type int
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        if self.title is not None:
-            array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        # end if
-        if self.username is not None:
-            array['username'] = u(self.username)  # py2: type unicode, py3: type str
-        # end if
-        if self.first_name is not None:
-            array['first_name'] = u(self.first_name)  # py2: type unicode, py3: type str
-        # end if
-        if self.last_name is not None:
-            array['last_name'] = u(self.last_name)  # py2: type unicode, py3: type str
-        # end if
-        if self.photo is not None:
-            array['photo'] = self.photo.to_array()  # type ChatPhoto
-        # end if
-        if self.bio is not None:
-            array['bio'] = u(self.bio)  # py2: type unicode, py3: type str
-        # end if
-        if self.has_private_forwards is not None:
-            array['has_private_forwards'] = bool(self.has_private_forwards)  # type bool
-        # end if
-        if self.description is not None:
-            array['description'] = u(self.description)  # py2: type unicode, py3: type str
-        # end if
-        if self.invite_link is not None:
-            array['invite_link'] = u(self.invite_link)  # py2: type unicode, py3: type str
-        # end if
-        if self.pinned_message is not None:
-            array['pinned_message'] = self.pinned_message.to_array()  # type Message
-        # end if
-        if self.permissions is not None:
-            array['permissions'] = self.permissions.to_array()  # type ChatPermissions
-        # end if
-        if self.slow_mode_delay is not None:
-            array['slow_mode_delay'] = int(self.slow_mode_delay)  # type int
-        # end if
-        if self.message_auto_delete_time is not None:
-            array['message_auto_delete_time'] = int(self.message_auto_delete_time)  # type int
-        # end if
-        if self.has_protected_content is not None:
-            array['has_protected_content'] = bool(self.has_protected_content)  # type bool
-        # end if
-        if self.sticker_set_name is not None:
-            array['sticker_set_name'] = u(self.sticker_set_name)  # py2: type unicode, py3: type str
-        # end if
-        if self.can_set_sticker_set is not None:
-            array['can_set_sticker_set'] = bool(self.can_set_sticker_set)  # type bool
-        # end if
-        if self.linked_chat_id is not None:
-            array['linked_chat_id'] = int(self.linked_chat_id)  # type int
-        # end if
-        if self.location is not None:
-            array['location'] = self.location.to_array()  # type ChatLocation
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -739,39 +625,71 @@ class Chat(Peer):
         if not array:  # None or {}
             return None
         # end if
+        if Chat._is_parsing_lazily():
+            return Chat._from_array_lazily(array)
+        # end if
+        if not Chat._must_validate(array):
+            return Chat._from_array_trusted(array)
+        # end if
 
         data = Chat.validate_array(array)
         data['_raw'] = array
         return Chat(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(chat_instance)`
-        """
-        return "Chat(id={self.id!r}, type={self.type!r}, title={self.title!r}, username={self.username!r}, first_name={self.first_name!r}, last_name={self.last_name!r}, photo={self.photo!r}, bio={self.bio!r}, has_private_forwards={self.has_private_forwards!r}, description={self.description!r}, invite_link={self.invite_link!r}, pinned_message={self.pinned_message!r}, permissions={self.permissions!r}, slow_mode_delay={self.slow_mode_delay!r}, message_auto_delete_time={self.message_auto_delete_time!r}, has_protected_content={self.has_protected_content!r}, sticker_set_name={self.sticker_set_name!r}, can_set_sticker_set={self.can_set_sticker_set!r}, linked_chat_id={self.linked_chat_id!r}, location={self.location!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(chat_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "Chat.from_array({self._raw})".format(self=self)
-        # end if
-        return "Chat(id={self.id!r}, type={self.type!r}, title={self.title!r}, username={self.username!r}, first_name={self.first_name!r}, last_name={self.last_name!r}, photo={self.photo!r}, bio={self.bio!r}, has_private_forwards={self.has_private_forwards!r}, description={self.description!r}, invite_link={self.invite_link!r}, pinned_message={self.pinned_message!r}, permissions={self.permissions!r}, slow_mode_delay={self.slow_mode_delay!r}, message_auto_delete_time={self.message_auto_delete_time!r}, has_protected_content={self.has_protected_content!r}, sticker_set_name={self.sticker_set_name!r}, can_set_sticker_set={self.can_set_sticker_set!r}, linked_chat_id={self.linked_chat_id!r}, location={self.location!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the Chat without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in chat_instance`
+        :return: new Chat instance.
+        :rtype: Chat
         """
-        return (
-            key in ["id", "type", "title", "username", "first_name", "last_name", "photo", "bio", "has_private_forwards", "description", "invite_link", "pinned_message", "permissions", "slow_mode_delay", "message_auto_delete_time", "has_protected_content", "sticker_set_name", "can_set_sticker_set", "linked_chat_id", "location"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = Chat._set_field
+        instance = Chat.__new__(Chat)
+        set_field(instance, 'id', int(get('id')))
+        set_field(instance, 'type', u(get('type')))
+        value = get('title')
+        set_field(instance, 'title', u(value) if value is not None else None)
+        value = get('username')
+        set_field(instance, 'username', u(value) if value is not None else None)
+        value = get('first_name')
+        set_field(instance, 'first_name', u(value) if value is not None else None)
+        value = get('last_name')
+        set_field(instance, 'last_name', u(value) if value is not None else None)
+        value = get('photo')
+        set_field(instance, 'photo', ChatPhoto.from_array(value) if value is not None else None)
+        value = get('bio')
+        set_field(instance, 'bio', u(value) if value is not None else None)
+        value = get('has_private_forwards')
+        set_field(instance, 'has_private_forwards', bool(value) if value is not None else None)
+        value = get('description')
+        set_field(instance, 'description', u(value) if value is not None else None)
+        value = get('invite_link')
+        set_field(instance, 'invite_link', u(value) if value is not None else None)
+        value = get('pinned_message')
+        set_field(instance, 'pinned_message', Message.from_array(value) if value is not None else None)
+        value = get('permissions')
+        set_field(instance, 'permissions', ChatPermissions.from_array(value) if value is not None else None)
+        value = get('slow_mode_delay')
+        set_field(instance, 'slow_mode_delay', int(value) if value is not None else None)
+        value = get('message_auto_delete_time')
+        set_field(instance, 'message_auto_delete_time', int(value) if value is not None else None)
+        value = get('has_protected_content')
+        set_field(instance, 'has_protected_content', bool(value) if value is not None else None)
+        value = get('sticker_set_name')
+        set_field(instance, 'sticker_set_name', u(value) if value is not None else None)
+        value = get('can_set_sticker_set')
+        set_field(instance, 'can_set_sticker_set', bool(value) if value is not None else None)
+        value = get('linked_chat_id')
+        set_field(instance, 'linked_chat_id', int(value) if value is not None else None)
+        value = get('location')
+        set_field(instance, 'location', ChatLocation.from_array(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class Chat
 
 
@@ -818,6 +736,21 @@ class ChatInviteLink(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('invite_link', 'creator', 'creates_join_request', 'is_primary', 'is_revoked', 'name', 'expire_date', 'member_limit', 'pending_join_request_count')
+    _fields = ('invite_link', 'creator', 'creates_join_request', 'is_primary', 'is_revoked', 'name', 'expire_date', 'member_limit', 'pending_join_request_count')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('invite_link', 'invite_link', u, False),
+        ('creator', 'creator', None, False),
+        ('creates_join_request', 'creates_join_request', bool, False),
+        ('is_primary', 'is_primary', bool, False),
+        ('is_revoked', 'is_revoked', bool, False),
+        ('name', 'name', u, True),
+        ('expire_date', 'expire_date', int, True),
+        ('member_limit', 'member_limit', int, True),
+        ('pending_join_request_count', 'pending_join_request_count', int, True),
+    )
+
     def __init__(self, invite_link, creator, creates_join_request, is_primary, is_revoked, name=None, expire_date=None, member_limit=None, pending_join_request_count=None, _raw=None):
         """
         Represents an invite link for a chat.
@@ -861,64 +794,30 @@ class ChatInviteLink(Result):
         :type  _raw: None | dict
         """
         super(ChatInviteLink, self).__init__()
-        assert_type_or_raise(invite_link, unicode_type, parameter_name="invite_link")
+        if self._must_validate(_raw):
+            assert_type_or_raise(invite_link, unicode_type, parameter_name="invite_link")
+            assert_type_or_raise(creator, User, parameter_name="creator")
+            assert_type_or_raise(creates_join_request, bool, parameter_name="creates_join_request")
+            assert_type_or_raise(is_primary, bool, parameter_name="is_primary")
+            assert_type_or_raise(is_revoked, bool, parameter_name="is_revoked")
+            assert_type_or_raise(name, None, unicode_type, parameter_name="name")
+            assert_type_or_raise(expire_date, None, int, parameter_name="expire_date")
+            assert_type_or_raise(member_limit, None, int, parameter_name="member_limit")
+            assert_type_or_raise(pending_join_request_count, None, int, parameter_name="pending_join_request_count")
+        # end if
         self.invite_link = invite_link
-        assert_type_or_raise(creator, User, parameter_name="creator")
         self.creator = creator
-        assert_type_or_raise(creates_join_request, bool, parameter_name="creates_join_request")
         self.creates_join_request = creates_join_request
-        assert_type_or_raise(is_primary, bool, parameter_name="is_primary")
         self.is_primary = is_primary
-        assert_type_or_raise(is_revoked, bool, parameter_name="is_revoked")
         self.is_revoked = is_revoked
-        assert_type_or_raise(name, None, unicode_type, parameter_name="name")
         self.name = name
-        assert_type_or_raise(expire_date, None, int, parameter_name="expire_date")
         self.expire_date = expire_date
-        assert_type_or_raise(member_limit, None, int, parameter_name="member_limit")
         self.member_limit = member_limit
-        assert_type_or_raise(pending_join_request_count, None, int, parameter_name="pending_join_request_count")
         self.pending_join_request_count = pending_join_request_count
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ChatInviteLink to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ChatInviteLink, self).to_array()
-
-        array['invite_link'] = u(self.invite_link)  # py2: type unicode, py3: type str
-        array['creator'] = self.creator.to_array()  # type User
-        array['creates_join_request'] = bool(self.creates_join_request)  # type bool
-        array['is_primary'] = bool(self.is_primary)  # type bool
-        array['is_revoked'] = bool(self.is_revoked)  # type bool
-        if self.name is not None:
-            array['name'] = u(self.name)  # py2: type unicode, py3: type str
-        # end if
-        if self.expire_date is not None:
-            array['expire_date'] = int(self.expire_date)  # type int
-        # end if
-        if self.member_limit is not None:
-            array['member_limit'] = int(self.member_limit)  # type int
-        # end if
-        if self.pending_join_request_count is not None:
-            array['pending_join_request_count'] = int(self.pending_join_request_count)  # type int
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -952,39 +851,46 @@ class ChatInviteLink(Result):
         if not array:  # None or {}
             return None
         # end if
+        if ChatInviteLink._is_parsing_lazily():
+            return ChatInviteLink._from_array_lazily(array)
+        # end if
+        if not ChatInviteLink._must_validate(array):
+            return ChatInviteLink._from_array_trusted(array)
+        # end if
 
         data = ChatInviteLink.validate_array(array)
         data['_raw'] = array
         return ChatInviteLink(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(chatinvitelink_instance)`
-        """
-        return "ChatInviteLink(invite_link={self.invite_link!r}, creator={self.creator!r}, creates_join_request={self.creates_join_request!r}, is_primary={self.is_primary!r}, is_revoked={self.is_revoked!r}, name={self.name!r}, expire_date={self.expire_date!r}, member_limit={self.member_limit!r}, pending_join_request_count={self.pending_join_request_count!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(chatinvitelink_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "ChatInviteLink.from_array({self._raw})".format(self=self)
-        # end if
-        return "ChatInviteLink(invite_link={self.invite_link!r}, creator={self.creator!r}, creates_join_request={self.creates_join_request!r}, is_primary={self.is_primary!r}, is_revoked={self.is_revoked!r}, name={self.name!r}, expire_date={self.expire_date!r}, member_limit={self.member_limit!r}, pending_join_request_count={self.pending_join_request_count!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the ChatInviteLink without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in chatinvitelink_instance`
+        :return: new ChatInviteLink instance.
+        :rtype: ChatInviteLink
         """
-        return (
-            key in ["invite_link", "creator", "creates_join_request", "is_primary", "is_revoked", "name", "expire_date", "member_limit", "pending_join_request_count"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = ChatInviteLink._set_field
+        instance = ChatInviteLink.__new__(ChatInviteLink)
+        set_field(instance, 'invite_link', u(get('invite_link')))
+        set_field(instance, 'creator', User.from_array(get('creator')))
+        set_field(instance, 'creates_join_request', bool(get('creates_join_request')))
+        set_field(instance, 'is_primary', bool(get('is_primary')))
+        set_field(instance, 'is_revoked', bool(get('is_revoked')))
+        value = get('name')
+        set_field(instance, 'name', u(value) if value is not None else None)
+        value = get('expire_date')
+        set_field(instance, 'expire_date', int(value) if value is not None else None)
+        value = get('member_limit')
+        set_field(instance, 'member_limit', int(value) if value is not None else None)
+        value = get('pending_join_request_count')
+        set_field(instance, 'pending_join_request_count', int(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class ChatInviteLink
 
 
@@ -1016,6 +922,16 @@ class ChatMemberOwner(ChatMember):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('status', 'user', 'is_anonymous', 'custom_title')
+    _fields = ('status', 'user', 'is_anonymous', 'custom_title')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('status', 'status', u, False),
+        ('user', 'user', None, False),
+        ('is_anonymous', 'is_anonymous', bool, False),
+        ('custom_title', 'custom_title', u, True),
+    )
+
     def __init__(self, status, user, is_anonymous, custom_title=None, _raw=None):
         """
         Represents a chat member that owns the chat and has all administrator privileges.
@@ -1044,43 +960,20 @@ class ChatMemberOwner(ChatMember):
         :type  _raw: None | dict
         """
         super(ChatMemberOwner, self).__init__()
-        assert_type_or_raise(status, unicode_type, parameter_name="status")
+        if self._must_validate(_raw):
+            assert_type_or_raise(status, unicode_type, parameter_name="status")
+            assert_type_or_raise(user, User, parameter_name="user")
+            assert_type_or_raise(is_anonymous, bool, parameter_name="is_anonymous")
+            assert_type_or_raise(custom_title, None, unicode_type, parameter_name="custom_title")
+        # end if
         self.status = status
-        assert_type_or_raise(user, User, parameter_name="user")
         self.user = user
-        assert_type_or_raise(is_anonymous, bool, parameter_name="is_anonymous")
         self.is_anonymous = is_anonymous
-        assert_type_or_raise(custom_title, None, unicode_type, parameter_name="custom_title")
         self.custom_title = custom_title
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ChatMemberOwner to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ChatMemberOwner, self).to_array()
-
-        array['status'] = u(self.status)  # py2: type unicode, py3: type str
-        array['user'] = self.user.to_array()  # type User
-        array['is_anonymous'] = bool(self.is_anonymous)  # type bool
-        if self.custom_title is not None:
-            array['custom_title'] = u(self.custom_title)  # py2: type unicode, py3: type str
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1109,39 +1002,38 @@ class ChatMemberOwner(ChatMember):
         if not array:  # None or {}
             return None
         # end if
+        if ChatMemberOwner._is_parsing_lazily():
+            return ChatMemberOwner._from_array_lazily(array)
+        # end if
+        if not ChatMemberOwner._must_validate(array):
+            return ChatMemberOwner._from_array_trusted(array)
+        # end if
 
         data = ChatMemberOwner.validate_array(array)
         data['_raw'] = array
         return ChatMemberOwner(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(chatmemberowner_instance)`
-        """
-        return "ChatMemberOwner(status={self.status!r}, user={self.user!r}, is_anonymous={self.is_anonymous!r}, custom_title={self.custom_title!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(chatmemberowner_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "ChatMemberOwner.from_array({self._raw})".format(self=self)
-        # end if
-        return "ChatMemberOwner(status={self.status!r}, user={self.user!r}, is_anonymous={self.is_anonymous!r}, custom_title={self.custom_title!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the ChatMemberOwner without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in chatmemberowner_instance`
+        :return: new ChatMemberOwner instance.
+        :rtype: ChatMemberOwner
         """
-        return (
-            key in ["status", "user", "is_anonymous", "custom_title"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = ChatMemberOwner._set_field
+        instance = ChatMemberOwner.__new__(ChatMemberOwner)
+        set_field(instance, 'status', u(get('status')))
+        set_field(instance, 'user', User.from_array(get('user')))
+        set_field(instance, 'is_anonymous', bool(get('is_anonymous')))
+        value = get('custom_title')
+        set_field(instance, 'custom_title', u(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class ChatMemberOwner
 
 
@@ -1206,6 +1098,27 @@ class ChatMemberAdministrator(ChatMember):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('status', 'user', 'can_be_edited', 'is_anonymous', 'can_manage_chat', 'can_delete_messages', 'can_manage_voice_chats', 'can_restrict_members', 'can_promote_members', 'can_change_info', 'can_invite_users', 'can_post_messages', 'can_edit_messages', 'can_pin_messages', 'custom_title')
+    _fields = ('status', 'user', 'can_be_edited', 'is_anonymous', 'can_manage_chat', 'can_delete_messages', 'can_manage_voice_chats', 'can_restrict_members', 'can_promote_members', 'can_change_info', 'can_invite_users', 'can_post_messages', 'can_edit_messages', 'can_pin_messages', 'custom_title')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('status', 'status', u, False),
+        ('user', 'user', None, False),
+        ('can_be_edited', 'can_be_edited', bool, False),
+        ('is_anonymous', 'is_anonymous', bool, False),
+        ('can_manage_chat', 'can_manage_chat', bool, False),
+        ('can_delete_messages', 'can_delete_messages', bool, False),
+        ('can_manage_voice_chats', 'can_manage_voice_chats', bool, False),
+        ('can_restrict_members', 'can_restrict_members', bool, False),
+        ('can_promote_members', 'can_promote_members', bool, False),
+        ('can_change_info', 'can_change_info', bool, False),
+        ('can_invite_users', 'can_invite_users', bool, False),
+        ('can_post_messages', 'can_post_messages', bool, True),
+        ('can_edit_messages', 'can_edit_messages', bool, True),
+        ('can_pin_messages', 'can_pin_messages', bool, True),
+        ('custom_title', 'custom_title', u, True),
+    )
+
     def __init__(self, status, user, can_be_edited, is_anonymous, can_manage_chat, can_delete_messages, can_manage_voice_chats, can_restrict_members, can_promote_members, can_change_info, can_invite_users, can_post_messages=None, can_edit_messages=None, can_pin_messages=None, custom_title=None, _raw=None):
         """
         Represents a chat member that has some additional privileges.
@@ -1267,82 +1180,42 @@ class ChatMemberAdministrator(ChatMember):
         :type  _raw: None | dict
         """
         super(ChatMemberAdministrator, self).__init__()
-        assert_type_or_raise(status, unicode_type, parameter_name="status")
+        if self._must_validate(_raw):
+            assert_type_or_raise(status, unicode_type, parameter_name="status")
+            assert_type_or_raise(user, User, parameter_name="user")
+            assert_type_or_raise(can_be_edited, bool, parameter_name="can_be_edited")
+            assert_type_or_raise(is_anonymous, bool, parameter_name="is_anonymous")
+            assert_type_or_raise(can_manage_chat, bool, parameter_name="can_manage_chat")
+            assert_type_or_raise(can_delete_messages, bool, parameter_name="can_delete_messages")
+            assert_type_or_raise(can_manage_voice_chats, bool, parameter_name="can_manage_voice_chats")
+            assert_type_or_raise(can_restrict_members, bool, parameter_name="can_restrict_members")
+            assert_type_or_raise(can_promote_members, bool, parameter_name="can_promote_members")
+            assert_type_or_raise(can_change_info, bool, parameter_name="can_change_info")
+            assert_type_or_raise(can_invite_users, bool, parameter_name="can_invite_users")
+            assert_type_or_raise(can_post_messages, None, bool, parameter_name="can_post_messages")
+            assert_type_or_raise(can_edit_messages, None, bool, parameter_name="can_edit_messages")
+            assert_type_or_raise(can_pin_messages, None, bool, parameter_name="can_pin_messages")
+            assert_type_or_raise(custom_title, None, unicode_type, parameter_name="custom_title")
+        # end if
         self.status = status
-        assert_type_or_raise(user, User, parameter_name="user")
         self.user = user
-        assert_type_or_raise(can_be_edited, bool, parameter_name="can_be_edited")
         self.can_be_edited = can_be_edited
-        assert_type_or_raise(is_anonymous, bool, parameter_name="is_anonymous")
         self.is_anonymous = is_anonymous
-        assert_type_or_raise(can_manage_chat, bool, parameter_name="can_manage_chat")
         self.can_manage_chat = can_manage_chat
-        assert_type_or_raise(can_delete_messages, bool, parameter_name="can_delete_messages")
         self.can_delete_messages = can_delete_messages
-        assert_type_or_raise(can_manage_voice_chats, bool, parameter_name="can_manage_voice_chats")
         self.can_manage_voice_chats = can_manage_voice_chats
-        assert_type_or_raise(can_restrict_members, bool, parameter_name="can_restrict_members")
         self.can_restrict_members = can_restrict_members
-        assert_type_or_raise(can_promote_members, bool, parameter_name="can_promote_members")
         self.can_promote_members = can_promote_members
-        assert_type_or_raise(can_change_info, bool, parameter_name="can_change_info")
         self.can_change_info = can_change_info
-        assert_type_or_raise(can_invite_users, bool, parameter_name="can_invite_users")
         self.can_invite_users = can_invite_users
-        assert_type_or_raise(can_post_messages, None, bool, parameter_name="can_post_messages")
         self.can_post_messages = can_post_messages
-        assert_type_or_raise(can_edit_messages, None, bool, parameter_name="can_edit_messages")
         self.can_edit_messages = can_edit_messages
-        assert_type_or_raise(can_pin_messages, None, bool, parameter_name="can_pin_messages")
         self.can_pin_messages = can_pin_messages
-        assert_type_or_raise(custom_title, None, unicode_type, parameter_name="custom_title")
         self.custom_title = custom_title
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ChatMemberAdministrator to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ChatMemberAdministrator, self).to_array()
-
-        array['status'] = u(self.status)  # py2: type unicode, py3: type str
-        array['user'] = self.user.to_array()  # type User
-        array['can_be_edited'] = bool(self.can_be_edited)  # type bool
-        array['is_anonymous'] = bool(self.is_anonymous)  # type bool
-        array['can_manage_chat'] = bool(self.can_manage_chat)  # type bool
-        array['can_delete_messages'] = bool(self.can_delete_messages)  # type bool
-        array['can_manage_voice_chats'] = bool(self.can_manage_voice_chats)  # type bool
-        array['can_restrict_members'] = bool(self.can_restrict_members)  # type bool
-        array['can_promote_members'] = bool(self.can_promote_members)  # type bool
-        array['can_change_info'] = bool(self.can_change_info)  # type bool
-        array['can_invite_users'] = bool(self.can_invite_users)  # type bool
-        if self.can_post_messages is not None:
-            array['can_post_messages'] = bool(self.can_post_messages)  # type bool
-        # end if
-        if self.can_edit_messages is not None:
-            array['can_edit_messages'] = bool(self.can_edit_messages)  # type bool
-        # end if
-        if self.can_pin_messages is not None:
-            array['can_pin_messages'] = bool(self.can_pin_messages)  # type bool
-        # end if
-        if self.custom_title is not None:
-            array['custom_title'] = u(self.custom_title)  # py2: type unicode, py3: type str
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1382,39 +1255,52 @@ class ChatMemberAdministrator(ChatMember):
         if not array:  # None or {}
             return None
         # end if
+        if ChatMemberAdministrator._is_parsing_lazily():
+            return ChatMemberAdministrator._from_array_lazily(array)
+        # end if
+        if not ChatMemberAdministrator._must_validate(array):
+            return ChatMemberAdministrator._from_array_trusted(array)
+        # end if
 
         data = ChatMemberAdministrator.validate_array(array)
         data['_raw'] = array
         return ChatMemberAdministrator(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(chatmemberadministrator_instance)`
-        """
-        return "ChatMemberAdministrator(status={self.status!r}, user={self.user!r}, can_be_edited={self.can_be_edited!r}, is_anonymous={self.is_anonymous!r}, can_manage_chat={self.can_manage_chat!r}, can_delete_messages={self.can_delete_messages!r}, can_manage_voice_chats={self.can_manage_voice_chats!r}, can_restrict_members={self.can_restrict_members!r}, can_promote_members={self.can_promote_members!r}, can_change_info={self.can_change_info!r}, can_invite_users={self.can_invite_users!r}, can_post_messages={self.can_post_messages!r}, can_edit_messages={self.can_edit_messages!r}, can_pin_messages={self.can_pin_messages!r}, custom_title={self.custom_title!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(chatmemberadministrator_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "ChatMemberAdministrator.from_array({self._raw})".format(self=self)
-        # end if
-        return "ChatMemberAdministrator(status={self.status!r}, user={self.user!r}, can_be_edited={self.can_be_edited!r}, is_anonymous={self.is_anonymous!r}, can_manage_chat={self.can_manage_chat!r}, can_delete_messages={self.can_delete_messages!r}, can_manage_voice_chats={self.can_manage_voice_chats!r}, can_restrict_members={self.can_restrict_members!r}, can_promote_members={self.can_promote_members!r}, can_change_info={self.can_change_info!r}, can_invite_users={self.can_invite_users!r}, can_post_messages={self.can_post_messages!r}, can_edit_messages={self.can_edit_messages!r}, can_pin_messages={self.can_pin_messages!r}, custom_title={self.custom_title!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the ChatMemberAdministrator without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in chatmemberadministrator_instance`
+        :return: new ChatMemberAdministrator instance.
+        :rtype: ChatMemberAdministrator
         """
-        return (
-            key in ["status", "user", "can_be_edited", "is_anonymous", "can_manage_chat", "can_delete_messages", "can_manage_voice_chats", "can_restrict_members", "can_promote_members", "can_change_info", "can_invite_users", "can_post_messages", "can_edit_messages", "can_pin_messages", "custom_title"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = ChatMemberAdministrator._set_field
+        instance = ChatMemberAdministrator.__new__(ChatMemberAdministrator)
+        set_field(instance, 'status', u(get('status')))
+        set_field(instance, 'user', User.from_array(get('user')))
+        set_field(instance, 'can_be_edited', bool(get('can_be_edited')))
+        set_field(instance, 'is_anonymous', bool(get('is_anonymous')))
+        set_field(instance, 'can_manage_chat', bool(get('can_manage_chat')))
+        set_field(instance, 'can_delete_messages', bool(get('can_delete_messages')))
+        set_field(instance, 'can_manage_voice_chats', bool(get('can_manage_voice_chats')))
+        set_field(instance, 'can_restrict_members', bool(get('can_restrict_members')))
+        set_field(instance, 'can_promote_members', bool(get('can_promote_members')))
+        set_field(instance, 'can_change_info', bool(get('can_change_info')))
+        set_field(instance, 'can_invite_users', bool(get('can_invite_users')))
+        value = get('can_post_messages')
+        set_field(instance, 'can_post_messages', bool(value) if value is not None else None)
+        value = get('can_edit_messages')
+        set_field(instance, 'can_edit_messages', bool(value) if value is not None else None)
+        value = get('can_pin_messages')
+        set_field(instance, 'can_pin_messages', bool(value) if value is not None else None)
+        value = get('custom_title')
+        set_field(instance, 'custom_title', u(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class ChatMemberAdministrator
 
 
@@ -1440,6 +1326,14 @@ class ChatMemberMember(ChatMember):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('status', 'user')
+    _fields = ('status', 'user')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('status', 'status', u, False),
+        ('user', 'user', None, False),
+    )
+
     def __init__(self, status, user, _raw=None):
         """
         Represents a chat member that has no additional privileges or restrictions.
@@ -1462,35 +1356,16 @@ class ChatMemberMember(ChatMember):
         :type  _raw: None | dict
         """
         super(ChatMemberMember, self).__init__()
-        assert_type_or_raise(status, unicode_type, parameter_name="status")
+        if self._must_validate(_raw):
+            assert_type_or_raise(status, unicode_type, parameter_name="status")
+            assert_type_or_raise(user, User, parameter_name="user")
+        # end if
         self.status = status
-        assert_type_or_raise(user, User, parameter_name="user")
         self.user = user
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ChatMemberMember to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ChatMemberMember, self).to_array()
-
-        array['status'] = u(self.status)  # py2: type unicode, py3: type str
-        array['user'] = self.user.to_array()  # type User
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1517,39 +1392,35 @@ class ChatMemberMember(ChatMember):
         if not array:  # None or {}
             return None
         # end if
+        if ChatMemberMember._is_parsing_lazily():
+            return ChatMemberMember._from_array_lazily(array)
+        # end if
+        if not ChatMemberMember._must_validate(array):
+            return ChatMemberMember._from_array_trusted(array)
+        # end if
 
         data = ChatMemberMember.validate_array(array)
         data['_raw'] = array
         return ChatMemberMember(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(chatmembermember_instance)`
-        """
-        return "ChatMemberMember(status={self.status!r}, user={self.user!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(chatmembermember_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "ChatMemberMember.from_array({self._raw})".format(self=self)
-        # end if
-        return "ChatMemberMember(status={self.status!r}, user={self.user!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the ChatMemberMember without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in chatmembermember_instance`
+        :return: new ChatMemberMember instance.
+        :rtype: ChatMemberMember
         """
-        return (
-            key in ["status", "user"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = ChatMemberMember._set_field
+        instance = ChatMemberMember.__new__(ChatMemberMember)
+        set_field(instance, 'status', u(get('status')))
+        set_field(instance, 'user', User.from_array(get('user')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class ChatMemberMember
 
 
@@ -1606,6 +1477,24 @@ class ChatMemberRestricted(ChatMember):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('status', 'user', 'is_member', 'can_change_info', 'can_invite_users', 'can_pin_messages', 'can_send_messages', 'can_send_media_messages', 'can_send_polls', 'can_send_other_messages', 'can_add_web_page_previews', 'until_date')
+    _fields = ('status', 'user', 'is_member', 'can_change_info', 'can_invite_users', 'can_pin_messages', 'can_send_messages', 'can_send_media_messages', 'can_send_polls', 'can_send_other_messages', 'can_add_web_page_previews', 'until_date')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('status', 'status', u, False),
+        ('user', 'user', None, False),
+        ('is_member', 'is_member', bool, False),
+        ('can_change_info', 'can_change_info', bool, False),
+        ('can_invite_users', 'can_invite_users', bool, False),
+        ('can_pin_messages', 'can_pin_messages', bool, False),
+        ('can_send_messages', 'can_send_messages', bool, False),
+        ('can_send_media_messages', 'can_send_media_messages', bool, False),
+        ('can_send_polls', 'can_send_polls', bool, False),
+        ('can_send_other_messages', 'can_send_other_messages', bool, False),
+        ('can_add_web_page_previews', 'can_add_web_page_previews', bool, False),
+        ('until_date', 'until_date', int, False),
+    )
+
     def __init__(self, status, user, is_member, can_change_info, can_invite_users, can_pin_messages, can_send_messages, can_send_media_messages, can_send_polls, can_send_other_messages, can_add_web_page_previews, until_date, _raw=None):
         """
         Represents a chat member that is under certain restrictions in the chat.
@@ -1659,65 +1548,36 @@ class ChatMemberRestricted(ChatMember):
         :type  _raw: None | dict
         """
         super(ChatMemberRestricted, self).__init__()
-        assert_type_or_raise(status, unicode_type, parameter_name="status")
+        if self._must_validate(_raw):
+            assert_type_or_raise(status, unicode_type, parameter_name="status")
+            assert_type_or_raise(user, User, parameter_name="user")
+            assert_type_or_raise(is_member, bool, parameter_name="is_member")
+            assert_type_or_raise(can_change_info, bool, parameter_name="can_change_info")
+            assert_type_or_raise(can_invite_users, bool, parameter_name="can_invite_users")
+            assert_type_or_raise(can_pin_messages, bool, parameter_name="can_pin_messages")
+            assert_type_or_raise(can_send_messages, bool, parameter_name="can_send_messages")
+            assert_type_or_raise(can_send_media_messages, bool, parameter_name="can_send_media_messages")
+            assert_type_or_raise(can_send_polls, bool, parameter_name="can_send_polls")
+            assert_type_or_raise(can_send_other_messages, bool, parameter_name="can_send_other_messages")
+            assert_type_or_raise(can_add_web_page_previews, bool, parameter_name="can_add_web_page_previews")
+            assert_type_or_raise(until_date, int, parameter_name="until_date")
+        # end if
         self.status = status
-        assert_type_or_raise(user, User, parameter_name="user")
         self.user = user
-        assert_type_or_raise(is_member, bool, parameter_name="is_member")
         self.is_member = is_member
-        assert_type_or_raise(can_change_info, bool, parameter_name="can_change_info")
         self.can_change_info = can_change_info
-        assert_type_or_raise(can_invite_users, bool, parameter_name="can_invite_users")
         self.can_invite_users = can_invite_users
-        assert_type_or_raise(can_pin_messages, bool, parameter_name="can_pin_messages")
         self.can_pin_messages = can_pin_messages
-        assert_type_or_raise(can_send_messages, bool, parameter_name="can_send_messages")
         self.can_send_messages = can_send_messages
-        assert_type_or_raise(can_send_media_messages, bool, parameter_name="can_send_media_messages")
         self.can_send_media_messages = can_send_media_messages
-        assert_type_or_raise(can_send_polls, bool, parameter_name="can_send_polls")
         self.can_send_polls = can_send_polls
-        assert_type_or_raise(can_send_other_messages, bool, parameter_name="can_send_other_messages")
         self.can_send_other_messages = can_send_other_messages
-        assert_type_or_raise(can_add_web_page_previews, bool, parameter_name="can_add_web_page_previews")
         self.can_add_web_page_previews = can_add_web_page_previews
-        assert_type_or_raise(until_date, int, parameter_name="until_date")
         self.until_date = until_date
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ChatMemberRestricted to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ChatMemberRestricted, self).to_array()
-
-        array['status'] = u(self.status)  # py2: type unicode, py3: type str
-        array['user'] = self.user.to_array()  # type User
-        array['is_member'] = bool(self.is_member)  # type bool
-        array['can_change_info'] = bool(self.can_change_info)  # type bool
-        array['can_invite_users'] = bool(self.can_invite_users)  # type bool
-        array['can_pin_messages'] = bool(self.can_pin_messages)  # type bool
-        array['can_send_messages'] = bool(self.can_send_messages)  # type bool
-        array['can_send_media_messages'] = bool(self.can_send_media_messages)  # type bool
-        array['can_send_polls'] = bool(self.can_send_polls)  # type bool
-        array['can_send_other_messages'] = bool(self.can_send_other_messages)  # type bool
-        array['can_add_web_page_previews'] = bool(self.can_add_web_page_previews)  # type bool
-        array['until_date'] = int(self.until_date)  # type int
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1754,39 +1614,45 @@ class ChatMemberRestricted(ChatMember):
         if not array:  # None or {}
             return None
         # end if
+        if ChatMemberRestricted._is_parsing_lazily():
+            return ChatMemberRestricted._from_array_lazily(array)
+        # end if
+        if not ChatMemberRestricted._must_validate(array):
+            return ChatMemberRestricted._from_array_trusted(array)
+        # end if
 
         data = ChatMemberRestricted.validate_array(array)
         data['_raw'] = array
         return ChatMemberRestricted(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(chatmemberrestricted_instance)`
-        """
-        return "ChatMemberRestricted(status={self.status!r}, user={self.user!r}, is_member={self.is_member!r}, can_change_info={self.can_change_info!r}, can_invite_users={self.can_invite_users!r}, can_pin_messages={self.can_pin_messages!r}, can_send_messages={self.can_send_messages!r}, can_send_media_messages={self.can_send_media_messages!r}, can_send_polls={self.can_send_polls!r}, can_send_other_messages={self.can_send_other_messages!r}, can_add_web_page_previews={self.can_add_web_page_previews!r}, until_date={self.until_date!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(chatmemberrestricted_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "ChatMemberRestricted.from_array({self._raw})".format(self=self)
-        # end if
-        return "ChatMemberRestricted(status={self.status!r}, user={self.user!r}, is_member={self.is_member!r}, can_change_info={self.can_change_info!r}, can_invite_users={self.can_invite_users!r}, can_pin_messages={self.can_pin_messages!r}, can_send_messages={self.can_send_messages!r}, can_send_media_messages={self.can_send_media_messages!r}, can_send_polls={self.can_send_polls!r}, can_send_other_messages={self.can_send_other_messages!r}, can_add_web_page_previews={self.can_add_web_page_previews!r}, until_date={self.until_date!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the ChatMemberRestricted without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in chatmemberrestricted_instance`
+        :return: new ChatMemberRestricted instance.
+        :rtype: ChatMemberRestricted
         """
-        return (
-            key in ["status", "user", "is_member", "can_change_info", "can_invite_users", "can_pin_messages", "can_send_messages", "can_send_media_messages", "can_send_polls", "can_send_other_messages", "can_add_web_page_previews", "until_date"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = ChatMemberRestricted._set_field
+        instance = ChatMemberRestricted.__new__(ChatMemberRestricted)
+        set_field(instance, 'status', u(get('status')))
+        set_field(instance, 'user', User.from_array(get('user')))
+        set_field(instance, 'is_member', bool(get('is_member')))
+        set_field(instance, 'can_change_info', bool(get('can_change_info')))
+        set_field(instance, 'can_invite_users', bool(get('can_invite_users')))
+        set_field(instance, 'can_pin_messages', bool(get('can_pin_messages')))
+        set_field(instance, 'can_send_messages', bool(get('can_send_messages')))
+        set_field(instance, 'can_send_media_messages', bool(get('can_send_media_messages')))
+        set_field(instance, 'can_send_polls', bool(get('can_send_polls')))
+        set_field(instance, 'can_send_other_messages', bool(get('can_send_other_messages')))
+        set_field(instance, 'can_add_web_page_previews', bool(get('can_add_web_page_previews')))
+        set_field(instance, 'until_date', int(get('until_date')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class ChatMemberRestricted
 
 
@@ -1812,6 +1678,14 @@ class ChatMemberLeft(ChatMember):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('status', 'user')
+    _fields = ('status', 'user')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('status', 'status', u, False),
+        ('user', 'user', None, False),
+    )
+
     def __init__(self, status, user, _raw=None):
         """
         Represents a chat member that isn't currently a member of the chat, but may join it themselves.
@@ -1834,35 +1708,16 @@ class ChatMemberLeft(ChatMember):
         :type  _raw: None | dict
         """
         super(ChatMemberLeft, self).__init__()
-        assert_type_or_raise(status, unicode_type, parameter_name="status")
+        if self._must_validate(_raw):
+            assert_type_or_raise(status, unicode_type, parameter_name="status")
+            assert_type_or_raise(user, User, parameter_name="user")
+        # end if
         self.status = status
-        assert_type_or_raise(user, User, parameter_name="user")
         self.user = user
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ChatMemberLeft to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ChatMemberLeft, self).to_array()
-
-        array['status'] = u(self.status)  # py2: type unicode, py3: type str
-        array['user'] = self.user.to_array()  # type User
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1889,39 +1744,35 @@ class ChatMemberLeft(ChatMember):
         if not array:  # None or {}
             return None
         # end if
+        if ChatMemberLeft._is_parsing_lazily():
+            return ChatMemberLeft._from_array_lazily(array)
+        # end if
+        if not ChatMemberLeft._must_validate(array):
+            return ChatMemberLeft._from_array_trusted(array)
+        # end if
 
         data = ChatMemberLeft.validate_array(array)
         data['_raw'] = array
         return ChatMemberLeft(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(chatmemberleft_instance)`
-        """
-        return "ChatMemberLeft(status={self.status!r}, user={self.user!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(chatmemberleft_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "ChatMemberLeft.from_array({self._raw})".format(self=self)
-        # end if
-        return "ChatMemberLeft(status={self.status!r}, user={self.user!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the ChatMemberLeft without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in chatmemberleft_instance`
+        :return: new ChatMemberLeft instance.
+        :rtype: ChatMemberLeft
         """
-        return (
-            key in ["status", "user"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = ChatMemberLeft._set_field
+        instance = ChatMemberLeft.__new__(ChatMemberLeft)
+        set_field(instance, 'status', u(get('status')))
+        set_field(instance, 'user', User.from_array(get('user')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class ChatMemberLeft
 
 
@@ -1950,6 +1801,15 @@ class ChatMemberBanned(ChatMember):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('status', 'user', 'until_date')
+    _fields = ('status', 'user', 'until_date')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('status', 'status', u, False),
+        ('user', 'user', None, False),
+        ('until_date', 'until_date', int, False),
+    )
+
     def __init__(self, status, user, until_date, _raw=None):
         """
         Represents a chat member that was banned in the chat and can't return to the chat or view chat messages.
@@ -1975,38 +1835,18 @@ class ChatMemberBanned(ChatMember):
         :type  _raw: None | dict
         """
         super(ChatMemberBanned, self).__init__()
-        assert_type_or_raise(status, unicode_type, parameter_name="status")
+        if self._must_validate(_raw):
+            assert_type_or_raise(status, unicode_type, parameter_name="status")
+            assert_type_or_raise(user, User, parameter_name="user")
+            assert_type_or_raise(until_date, int, parameter_name="until_date")
+        # end if
         self.status = status
-        assert_type_or_raise(user, User, parameter_name="user")
         self.user = user
-        assert_type_or_raise(until_date, int, parameter_name="until_date")
         self.until_date = until_date
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ChatMemberBanned to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ChatMemberBanned, self).to_array()
-
-        array['status'] = u(self.status)  # py2: type unicode, py3: type str
-        array['user'] = self.user.to_array()  # type User
-        array['until_date'] = int(self.until_date)  # type int
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -2034,39 +1874,36 @@ class ChatMemberBanned(ChatMember):
         if not array:  # None or {}
             return None
         # end if
+        if ChatMemberBanned._is_parsing_lazily():
+            return ChatMemberBanned._from_array_lazily(array)
+        # end if
+        if not ChatMemberBanned._must_validate(array):
+            return ChatMemberBanned._from_array_trusted(array)
+        # end if
 
         data = ChatMemberBanned.validate_array(array)
         data['_raw'] = array
         return ChatMemberBanned(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(chatmemberbanned_instance)`
-        """
-        return "ChatMemberBanned(status={self.status!r}, user={self.user!r}, until_date={self.until_date!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(chatmemberbanned_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "ChatMemberBanned.from_array({self._raw})".format(self=self)
-        # end if
-        return "ChatMemberBanned(status={self.status!r}, user={self.user!r}, until_date={self.until_date!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the ChatMemberBanned without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in chatmemberbanned_instance`
+        :return: new ChatMemberBanned instance.
+        :rtype: ChatMemberBanned
         """
-        return (
-            key in ["status", "user", "until_date"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = ChatMemberBanned._set_field
+        instance = ChatMemberBanned.__new__(ChatMemberBanned)
+        set_field(instance, 'status', u(get('status')))
+        set_field(instance, 'user', User.from_array(get('user')))
+        set_field(instance, 'until_date', int(get('until_date')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class ChatMemberBanned
 
 
@@ -2104,6 +1941,19 @@ class ChatMemberUpdated(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('chat', 'from_peer', 'date', 'old_chat_member', 'new_chat_member', 'invite_link')
+    _fields = ('chat', 'from_peer', 'date', 'old_chat_member', 'new_chat_member', 'invite_link')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _api_names = {'from_peer': 'from'}  # the fields with a different name in the api data.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('chat', 'chat', None, False),
+        ('from_peer', 'from', None, False),
+        ('date', 'date', int, False),
+        ('old_chat_member', 'old_chat_member', None, False),
+        ('new_chat_member', 'new_chat_member', None, False),
+        ('invite_link', 'invite_link', None, True),
+    )
+
     def __init__(self, chat, from_peer, date, old_chat_member, new_chat_member, invite_link=None, _raw=None):
         """
         This object represents changes in the status of a chat member.
@@ -2138,49 +1988,24 @@ class ChatMemberUpdated(Result):
         :type  _raw: None | dict
         """
         super(ChatMemberUpdated, self).__init__()
-        assert_type_or_raise(chat, Chat, parameter_name="chat")
+        if self._must_validate(_raw):
+            assert_type_or_raise(chat, Chat, parameter_name="chat")
+            assert_type_or_raise(from_peer, User, parameter_name="from_peer")
+            assert_type_or_raise(date, int, parameter_name="date")
+            assert_type_or_raise(old_chat_member, ChatMember, parameter_name="old_chat_member")
+            assert_type_or_raise(new_chat_member, ChatMember, parameter_name="new_chat_member")
+            assert_type_or_raise(invite_link, None, ChatInviteLink, parameter_name="invite_link")
+        # end if
         self.chat = chat
-        assert_type_or_raise(from_peer, User, parameter_name="from_peer")
         self.from_peer = from_peer
-        assert_type_or_raise(date, int, parameter_name="date")
         self.date = date
-        assert_type_or_raise(old_chat_member, ChatMember, parameter_name="old_chat_member")
         self.old_chat_member = old_chat_member
-        assert_type_or_raise(new_chat_member, ChatMember, parameter_name="new_chat_member")
         self.new_chat_member = new_chat_member
-        assert_type_or_raise(invite_link, None, ChatInviteLink, parameter_name="invite_link")
         self.invite_link = invite_link
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ChatMemberUpdated to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ChatMemberUpdated, self).to_array()
-
-        array['chat'] = self.chat.to_array()  # type Chat
-        array['from'] = self.from_peer.to_array()  # type User
-        array['date'] = int(self.date)  # type int
-        array['old_chat_member'] = self.old_chat_member.to_array()  # type ChatMember
-        array['new_chat_member'] = self.new_chat_member.to_array()  # type ChatMember
-        if self.invite_link is not None:
-            array['invite_link'] = self.invite_link.to_array()  # type ChatInviteLink
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -2211,39 +2036,40 @@ class ChatMemberUpdated(Result):
         if not array:  # None or {}
             return None
         # end if
+        if ChatMemberUpdated._is_parsing_lazily():
+            return ChatMemberUpdated._from_array_lazily(array)
+        # end if
+        if not ChatMemberUpdated._must_validate(array):
+            return ChatMemberUpdated._from_array_trusted(array)
+        # end if
 
         data = ChatMemberUpdated.validate_array(array)
         data['_raw'] = array
         return ChatMemberUpdated(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(chatmemberupdated_instance)`
-        """
-        return "ChatMemberUpdated(chat={self.chat!r}, from_peer={self.from_peer!r}, date={self.date!r}, old_chat_member={self.old_chat_member!r}, new_chat_member={self.new_chat_member!r}, invite_link={self.invite_link!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(chatmemberupdated_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "ChatMemberUpdated.from_array({self._raw})".format(self=self)
-        # end if
-        return "ChatMemberUpdated(chat={self.chat!r}, from_peer={self.from_peer!r}, date={self.date!r}, old_chat_member={self.old_chat_member!r}, new_chat_member={self.new_chat_member!r}, invite_link={self.invite_link!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the ChatMemberUpdated without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in chatmemberupdated_instance`
+        :return: new ChatMemberUpdated instance.
+        :rtype: ChatMemberUpdated
         """
-        return (
-            key in ["chat", "from_peer", "date", "old_chat_member", "new_chat_member", "invite_link"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = ChatMemberUpdated._set_field
+        instance = ChatMemberUpdated.__new__(ChatMemberUpdated)
+        set_field(instance, 'chat', Chat.from_array(get('chat')))
+        set_field(instance, 'from_peer', User.from_array(get('from')))
+        set_field(instance, 'date', int(get('date')))
+        set_field(instance, 'old_chat_member', ChatMember.from_array(get('old_chat_member')))
+        set_field(instance, 'new_chat_member', ChatMember.from_array(get('new_chat_member')))
+        value = get('invite_link')
+        set_field(instance, 'invite_link', ChatInviteLink.from_array(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class ChatMemberUpdated
 
 
@@ -2278,6 +2104,18 @@ class ChatJoinRequest(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('chat', 'from_peer', 'date', 'bio', 'invite_link')
+    _fields = ('chat', 'from_peer', 'date', 'bio', 'invite_link')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _api_names = {'from_peer': 'from'}  # the fields with a different name in the api data.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('chat', 'chat', None, False),
+        ('from_peer', 'from', None, False),
+        ('date', 'date', int, False),
+        ('bio', 'bio', u, True),
+        ('invite_link', 'invite_link', None, True),
+    )
+
     def __init__(self, chat, from_peer, date, bio=None, invite_link=None, _raw=None):
         """
         Represents a join request sent to a chat.
@@ -2309,48 +2147,22 @@ class ChatJoinRequest(Result):
         :type  _raw: None | dict
         """
         super(ChatJoinRequest, self).__init__()
-        assert_type_or_raise(chat, Chat, parameter_name="chat")
+        if self._must_validate(_raw):
+            assert_type_or_raise(chat, Chat, parameter_name="chat")
+            assert_type_or_raise(from_peer, User, parameter_name="from_peer")
+            assert_type_or_raise(date, int, parameter_name="date")
+            assert_type_or_raise(bio, None, unicode_type, parameter_name="bio")
+            assert_type_or_raise(invite_link, None, ChatInviteLink, parameter_name="invite_link")
+        # end if
         self.chat = chat
-        assert_type_or_raise(from_peer, User, parameter_name="from_peer")
         self.from_peer = from_peer
-        assert_type_or_raise(date, int, parameter_name="date")
         self.date = date
-        assert_type_or_raise(bio, None, unicode_type, parameter_name="bio")
         self.bio = bio
-        assert_type_or_raise(invite_link, None, ChatInviteLink, parameter_name="invite_link")
         self.invite_link = invite_link
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ChatJoinRequest to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ChatJoinRequest, self).to_array()
-
-        array['chat'] = self.chat.to_array()  # type Chat
-        array['from'] = self.from_peer.to_array()  # type User
-        array['date'] = int(self.date)  # type int
-        if self.bio is not None:
-            array['bio'] = u(self.bio)  # py2: type unicode, py3: type str
-        # end if
-        if self.invite_link is not None:
-            array['invite_link'] = self.invite_link.to_array()  # type ChatInviteLink
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -2380,39 +2192,40 @@ class ChatJoinRequest(Result):
         if not array:  # None or {}
             return None
         # end if
+        if ChatJoinRequest._is_parsing_lazily():
+            return ChatJoinRequest._from_array_lazily(array)
+        # end if
+        if not ChatJoinRequest._must_validate(array):
+            return ChatJoinRequest._from_array_trusted(array)
+        # end if
 
         data = ChatJoinRequest.validate_array(array)
         data['_raw'] = array
         return ChatJoinRequest(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(chatjoinrequest_instance)`
-        """
-        return "ChatJoinRequest(chat={self.chat!r}, from_peer={self.from_peer!r}, date={self.date!r}, bio={self.bio!r}, invite_link={self.invite_link!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(chatjoinrequest_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "ChatJoinRequest.from_array({self._raw})".format(self=self)
-        # end if
-        return "ChatJoinRequest(chat={self.chat!r}, from_peer={self.from_peer!r}, date={self.date!r}, bio={self.bio!r}, invite_link={self.invite_link!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the ChatJoinRequest without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in chatjoinrequest_instance`
+        :return: new ChatJoinRequest instance.
+        :rtype: ChatJoinRequest
         """
-        return (
-            key in ["chat", "from_peer", "date", "bio", "invite_link"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = ChatJoinRequest._set_field
+        instance = ChatJoinRequest.__new__(ChatJoinRequest)
+        set_field(instance, 'chat', Chat.from_array(get('chat')))
+        set_field(instance, 'from_peer', User.from_array(get('from')))
+        set_field(instance, 'date', int(get('date')))
+        value = get('bio')
+        set_field(instance, 'bio', u(value) if value is not None else None)
+        value = get('invite_link')
+        set_field(instance, 'invite_link', ChatInviteLink.from_array(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class ChatJoinRequest
 
 
@@ -2454,6 +2267,20 @@ class ChatPermissions(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('can_send_messages', 'can_send_media_messages', 'can_send_polls', 'can_send_other_messages', 'can_add_web_page_previews', 'can_change_info', 'can_invite_users', 'can_pin_messages')
+    _fields = ('can_send_messages', 'can_send_media_messages', 'can_send_polls', 'can_send_other_messages', 'can_add_web_page_previews', 'can_change_info', 'can_invite_users', 'can_pin_messages')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('can_send_messages', 'can_send_messages', bool, True),
+        ('can_send_media_messages', 'can_send_media_messages', bool, True),
+        ('can_send_polls', 'can_send_polls', bool, True),
+        ('can_send_other_messages', 'can_send_other_messages', bool, True),
+        ('can_add_web_page_previews', 'can_add_web_page_previews', bool, True),
+        ('can_change_info', 'can_change_info', bool, True),
+        ('can_invite_users', 'can_invite_users', bool, True),
+        ('can_pin_messages', 'can_pin_messages', bool, True),
+    )
+
     def __init__(self, can_send_messages=None, can_send_media_messages=None, can_send_polls=None, can_send_other_messages=None, can_add_web_page_previews=None, can_change_info=None, can_invite_users=None, can_pin_messages=None, _raw=None):
         """
         Describes actions that a non-administrator user is allowed to take in a chat.
@@ -2492,69 +2319,28 @@ class ChatPermissions(Result):
         :type  _raw: None | dict
         """
         super(ChatPermissions, self).__init__()
-        assert_type_or_raise(can_send_messages, None, bool, parameter_name="can_send_messages")
+        if self._must_validate(_raw):
+            assert_type_or_raise(can_send_messages, None, bool, parameter_name="can_send_messages")
+            assert_type_or_raise(can_send_media_messages, None, bool, parameter_name="can_send_media_messages")
+            assert_type_or_raise(can_send_polls, None, bool, parameter_name="can_send_polls")
+            assert_type_or_raise(can_send_other_messages, None, bool, parameter_name="can_send_other_messages")
+            assert_type_or_raise(can_add_web_page_previews, None, bool, parameter_name="can_add_web_page_previews")
+            assert_type_or_raise(can_change_info, None, bool, parameter_name="can_change_info")
+            assert_type_or_raise(can_invite_users, None, bool, parameter_name="can_invite_users")
+            assert_type_or_raise(can_pin_messages, None, bool, parameter_name="can_pin_messages")
+        # end if
         self.can_send_messages = can_send_messages
-        assert_type_or_raise(can_send_media_messages, None, bool, parameter_name="can_send_media_messages")
         self.can_send_media_messages = can_send_media_messages
-        assert_type_or_raise(can_send_polls, None, bool, parameter_name="can_send_polls")
         self.can_send_polls = can_send_polls
-        assert_type_or_raise(can_send_other_messages, None, bool, parameter_name="can_send_other_messages")
         self.can_send_other_messages = can_send_other_messages
-        assert_type_or_raise(can_add_web_page_previews, None, bool, parameter_name="can_add_web_page_previews")
         self.can_add_web_page_previews = can_add_web_page_previews
-        assert_type_or_raise(can_change_info, None, bool, parameter_name="can_change_info")
         self.can_change_info = can_change_info
-        assert_type_or_raise(can_invite_users, None, bool, parameter_name="can_invite_users")
         self.can_invite_users = can_invite_users
-        assert_type_or_raise(can_pin_messages, None, bool, parameter_name="can_pin_messages")
         self.can_pin_messages = can_pin_messages
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ChatPermissions to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ChatPermissions, self).to_array()
-
-        if self.can_send_messages is not None:
-            array['can_send_messages'] = bool(self.can_send_messages)  # type bool
-        # end if
-        if self.can_send_media_messages is not None:
-            array['can_send_media_messages'] = bool(self.can_send_media_messages)  # type bool
-        # end if
-        if self.can_send_polls is not None:
-            array['can_send_polls'] = bool(self.can_send_polls)  # type bool
-        # end if
-        if self.can_send_other_messages is not None:
-            array['can_send_other_messages'] = bool(self.can_send_other_messages)  # type bool
-        # end if
-        if self.can_add_web_page_previews is not None:
-            array['can_add_web_page_previews'] = bool(self.can_add_web_page_previews)  # type bool
-        # end if
-        if self.can_change_info is not None:
-            array['can_change_info'] = bool(self.can_change_info)  # type bool
-        # end if
-        if self.can_invite_users is not None:
-            array['can_invite_users'] = bool(self.can_invite_users)  # type bool
-        # end if
-        if self.can_pin_messages is not None:
-            array['can_pin_messages'] = bool(self.can_pin_messages)  # type bool
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -2587,39 +2373,49 @@ class ChatPermissions(Result):
         if not array:  # None or {}
             return None
         # end if
+        if ChatPermissions._is_parsing_lazily():
+            return ChatPermissions._from_array_lazily(array)
+        # end if
+        if not ChatPermissions._must_validate(array):
+            return ChatPermissions._from_array_trusted(array)
+        # end if
 
         data = ChatPermissions.validate_array(array)
         data['_raw'] = array
         return ChatPermissions(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(chatpermissions_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        return "ChatPermissions(can_send_messages={self.can_send_messages!r}, can_send_media_messages={self.can_send_media_messages!r}, can_send_polls={self.can_send_polls!r}, can_send_other_messages={self.can_send_other_messages!r}, can_add_web_page_previews={self.can_add_web_page_previews!r}, can_change_info={self.can_change_info!r}, can_invite_users={self.can_invite_users!r}, can_pin_messages={self.can_pin_messages!r})".format(self=self)
-    # end def __str__
+        Single pass version of :meth:`from_array`, building the ChatPermissions without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __repr__(self):
-        """
-        Implements `repr(chatpermissions_instance)`
-        """
-        if self._raw:
-            return "ChatPermissions.from_array({self._raw})".format(self=self)
-        # end if
-        return "ChatPermissions(can_send_messages={self.can_send_messages!r}, can_send_media_messages={self.can_send_media_messages!r}, can_send_polls={self.can_send_polls!r}, can_send_other_messages={self.can_send_other_messages!r}, can_add_web_page_previews={self.can_add_web_page_previews!r}, can_change_info={self.can_change_info!r}, can_invite_users={self.can_invite_users!r}, can_pin_messages={self.can_pin_messages!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in chatpermissions_instance`
+        :return: new ChatPermissions instance.
+        :rtype: ChatPermissions
         """
-        return (
-            key in ["can_send_messages", "can_send_media_messages", "can_send_polls", "can_send_other_messages", "can_add_web_page_previews", "can_change_info", "can_invite_users", "can_pin_messages"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = ChatPermissions._set_field
+        instance = ChatPermissions.__new__(ChatPermissions)
+        value = get('can_send_messages')
+        set_field(instance, 'can_send_messages', bool(value) if value is not None else None)
+        value = get('can_send_media_messages')
+        set_field(instance, 'can_send_media_messages', bool(value) if value is not None else None)
+        value = get('can_send_polls')
+        set_field(instance, 'can_send_polls', bool(value) if value is not None else None)
+        value = get('can_send_other_messages')
+        set_field(instance, 'can_send_other_messages', bool(value) if value is not None else None)
+        value = get('can_add_web_page_previews')
+        set_field(instance, 'can_add_web_page_previews', bool(value) if value is not None else None)
+        value = get('can_change_info')
+        set_field(instance, 'can_change_info', bool(value) if value is not None else None)
+        value = get('can_invite_users')
+        set_field(instance, 'can_invite_users', bool(value) if value is not None else None)
+        value = get('can_pin_messages')
+        set_field(instance, 'can_pin_messages', bool(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class ChatPermissions
 
 
@@ -2645,6 +2441,14 @@ class ChatLocation(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('location', 'address')
+    _fields = ('location', 'address')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('location', 'location', None, False),
+        ('address', 'address', u, False),
+    )
+
     def __init__(self, location, address, _raw=None):
         """
         Represents a location to which a chat is connected.
@@ -2667,37 +2471,17 @@ class ChatLocation(Result):
         :type  _raw: None | dict
         """
         super(ChatLocation, self).__init__()
-        from .media import Location
-        assert_type_or_raise(location, Location, parameter_name="location")
+        if self._must_validate(_raw):
+            from .media import Location
+            assert_type_or_raise(location, Location, parameter_name="location")
+            assert_type_or_raise(address, unicode_type, parameter_name="address")
+        # end if
         self.location = location
-        assert_type_or_raise(address, unicode_type, parameter_name="address")
         self.address = address
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ChatLocation to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .media import Location
-        array = super(ChatLocation, self).to_array()
-
-        array['location'] = self.location.to_array()  # type Location
-        array['address'] = u(self.address)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -2725,37 +2509,50 @@ class ChatLocation(Result):
         if not array:  # None or {}
             return None
         # end if
+        if ChatLocation._is_parsing_lazily():
+            return ChatLocation._from_array_lazily(array)
+        # end if
+        if not ChatLocation._must_validate(array):
+            return ChatLocation._from_array_trusted(array)
+        # end if
 
         data = ChatLocation.validate_array(array)
         data['_raw'] = array
         return ChatLocation(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(chatlocation_instance)`
-        """
-        return "ChatLocation(location={self.location!r}, address={self.address!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(chatlocation_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "ChatLocation.from_array({self._raw})".format(self=self)
-        # end if
-        return "ChatLocation(location={self.location!r}, address={self.address!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the ChatLocation without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in chatlocation_instance`
+        :return: new ChatLocation instance.
+        :rtype: ChatLocation
         """
-        return (
-            key in ["location", "address"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = ChatLocation._set_field
+        instance = ChatLocation.__new__(ChatLocation)
+        set_field(instance, 'location', Location.from_array(get('location')))
+        set_field(instance, 'address', u(get('address')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class ChatLocation
+
+
+# the subclasses `ChatMember.from_array(…)` parses into, by `status`.
+ChatMember._subclasses = {
+    "creator": ChatMemberOwner,
+    "administrator": ChatMemberAdministrator,
+    "member": ChatMemberMember,
+    "restricted": ChatMemberRestricted,
+    "left": ChatMemberLeft,
+    "kicked": ChatMemberBanned,
+}
+
+
+# bottom of file, as those modules import this one too. Used by the `_from_array_trusted(…)` functions.
+from .media import ChatPhoto
+from .media import Location
+from .updates import Message
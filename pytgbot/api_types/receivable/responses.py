@@ -28,6 +28,13 @@ class MessageId(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('message_id',)
+    _fields = ('message_id',)  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('message_id', 'message_id', int, False),
+    )
+
     def __init__(self, message_id, _raw=None):
         """
         This object represents a unique message identifier.
@@ -47,32 +54,14 @@ class MessageId(Result):
         :type  _raw: None | dict
         """
         super(MessageId, self).__init__()
-        assert_type_or_raise(message_id, int, parameter_name="message_id")
+        if self._must_validate(_raw):
+            assert_type_or_raise(message_id, int, parameter_name="message_id")
+        # end if
         self.message_id = message_id
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this MessageId to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(MessageId, self).to_array()
-
-        array['message_id'] = int(self.message_id)  # type int
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -98,37 +87,32 @@ class MessageId(Result):
         if not array:  # None or {}
             return None
         # end if
+        if MessageId._is_parsing_lazily():
+            return MessageId._from_array_lazily(array)
+        # end if
+        if not MessageId._must_validate(array):
+            return MessageId._from_array_trusted(array)
+        # end if
 
         data = MessageId.validate_array(array)
         data['_raw'] = array
         return MessageId(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(messageid_instance)`
-        """
-        return "MessageId(message_id={self.message_id!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(messageid_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "MessageId.from_array({self._raw})".format(self=self)
-        # end if
-        return "MessageId(message_id={self.message_id!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the MessageId without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in messageid_instance`
+        :return: new MessageId instance.
+        :rtype: MessageId
         """
-        return (
-            key in ["message_id"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = MessageId._set_field
+        instance = MessageId.__new__(MessageId)
+        set_field(instance, 'message_id', int(get('message_id')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class MessageId
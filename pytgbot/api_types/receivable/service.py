@@ -25,6 +25,8 @@ class ServiceMessage(Receivable):
     :type  _raw: None | dict
     """
 
+    __slots__ = ()
+
     pass
 # end class ServiceMessage
 
@@ -54,6 +56,15 @@ class ProximityAlertTriggered(ServiceMessage):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('traveler', 'watcher', 'distance')
+    _fields = ('traveler', 'watcher', 'distance')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('traveler', 'traveler', None, False),
+        ('watcher', 'watcher', None, False),
+        ('distance', 'distance', int, False),
+    )
+
     def __init__(self, traveler, watcher, distance, _raw=None):
         """
         This object represents the content of a service message, sent whenever a user in the chat triggers a proximity alert set by another user.
@@ -79,40 +90,19 @@ class ProximityAlertTriggered(ServiceMessage):
         :type  _raw: None | dict
         """
         super(ProximityAlertTriggered, self).__init__()
-        from .peer import User
-        assert_type_or_raise(traveler, User, parameter_name="traveler")
+        if self._must_validate(_raw):
+            from .peer import User
+            assert_type_or_raise(traveler, User, parameter_name="traveler")
+            assert_type_or_raise(watcher, User, parameter_name="watcher")
+            assert_type_or_raise(distance, int, parameter_name="distance")
+        # end if
         self.traveler = traveler
-        assert_type_or_raise(watcher, User, parameter_name="watcher")
         self.watcher = watcher
-        assert_type_or_raise(distance, int, parameter_name="distance")
         self.distance = distance
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ProximityAlertTriggered to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .peer import User
-        array = super(ProximityAlertTriggered, self).to_array()
-
-        array['traveler'] = self.traveler.to_array()  # type User
-        array['watcher'] = self.watcher.to_array()  # type User
-        array['distance'] = int(self.distance)  # type int
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -141,39 +131,36 @@ class ProximityAlertTriggered(ServiceMessage):
         if not array:  # None or {}
             return None
         # end if
+        if ProximityAlertTriggered._is_parsing_lazily():
+            return ProximityAlertTriggered._from_array_lazily(array)
+        # end if
+        if not ProximityAlertTriggered._must_validate(array):
+            return ProximityAlertTriggered._from_array_trusted(array)
+        # end if
 
         data = ProximityAlertTriggered.validate_array(array)
         data['_raw'] = array
         return ProximityAlertTriggered(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(proximityalerttriggered_instance)`
-        """
-        return "ProximityAlertTriggered(traveler={self.traveler!r}, watcher={self.watcher!r}, distance={self.distance!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(proximityalerttriggered_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "ProximityAlertTriggered.from_array({self._raw})".format(self=self)
-        # end if
-        return "ProximityAlertTriggered(traveler={self.traveler!r}, watcher={self.watcher!r}, distance={self.distance!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the ProximityAlertTriggered without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in proximityalerttriggered_instance`
+        :return: new ProximityAlertTriggered instance.
+        :rtype: ProximityAlertTriggered
         """
-        return (
-            key in ["traveler", "watcher", "distance"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = ProximityAlertTriggered._set_field
+        instance = ProximityAlertTriggered.__new__(ProximityAlertTriggered)
+        set_field(instance, 'traveler', User.from_array(get('traveler')))
+        set_field(instance, 'watcher', User.from_array(get('watcher')))
+        set_field(instance, 'distance', int(get('distance')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class ProximityAlertTriggered
 
 
@@ -196,6 +183,13 @@ class MessageAutoDeleteTimerChanged(ServiceMessage):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('message_auto_delete_time',)
+    _fields = ('message_auto_delete_time',)  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('message_auto_delete_time', 'message_auto_delete_time', int, False),
+    )
+
     def __init__(self, message_auto_delete_time, _raw=None):
         """
         This object represents a service message about a change in auto-delete timer settings.
@@ -215,32 +209,14 @@ class MessageAutoDeleteTimerChanged(ServiceMessage):
         :type  _raw: None | dict
         """
         super(MessageAutoDeleteTimerChanged, self).__init__()
-        assert_type_or_raise(message_auto_delete_time, int, parameter_name="message_auto_delete_time")
+        if self._must_validate(_raw):
+            assert_type_or_raise(message_auto_delete_time, int, parameter_name="message_auto_delete_time")
+        # end if
         self.message_auto_delete_time = message_auto_delete_time
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this MessageAutoDeleteTimerChanged to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(MessageAutoDeleteTimerChanged, self).to_array()
-
-        array['message_auto_delete_time'] = int(self.message_auto_delete_time)  # type int
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -266,39 +242,34 @@ class MessageAutoDeleteTimerChanged(ServiceMessage):
         if not array:  # None or {}
             return None
         # end if
+        if MessageAutoDeleteTimerChanged._is_parsing_lazily():
+            return MessageAutoDeleteTimerChanged._from_array_lazily(array)
+        # end if
+        if not MessageAutoDeleteTimerChanged._must_validate(array):
+            return MessageAutoDeleteTimerChanged._from_array_trusted(array)
+        # end if
 
         data = MessageAutoDeleteTimerChanged.validate_array(array)
         data['_raw'] = array
         return MessageAutoDeleteTimerChanged(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(messageautodeletetimerchanged_instance)`
-        """
-        return "MessageAutoDeleteTimerChanged(message_auto_delete_time={self.message_auto_delete_time!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(messageautodeletetimerchanged_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "MessageAutoDeleteTimerChanged.from_array({self._raw})".format(self=self)
-        # end if
-        return "MessageAutoDeleteTimerChanged(message_auto_delete_time={self.message_auto_delete_time!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the MessageAutoDeleteTimerChanged without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in messageautodeletetimerchanged_instance`
+        :return: new MessageAutoDeleteTimerChanged instance.
+        :rtype: MessageAutoDeleteTimerChanged
         """
-        return (
-            key in ["message_auto_delete_time"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = MessageAutoDeleteTimerChanged._set_field
+        instance = MessageAutoDeleteTimerChanged.__new__(MessageAutoDeleteTimerChanged)
+        set_field(instance, 'message_auto_delete_time', int(get('message_auto_delete_time')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class MessageAutoDeleteTimerChanged
 
 
@@ -321,6 +292,13 @@ class VoiceChatScheduled(ServiceMessage):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('start_date',)
+    _fields = ('start_date',)  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('start_date', 'start_date', int, False),
+    )
+
     def __init__(self, start_date, _raw=None):
         """
         This object represents a service message about a voice chat scheduled in the chat.
@@ -340,32 +318,14 @@ class VoiceChatScheduled(ServiceMessage):
         :type  _raw: None | dict
         """
         super(VoiceChatScheduled, self).__init__()
-        assert_type_or_raise(start_date, int, parameter_name="start_date")
+        if self._must_validate(_raw):
+            assert_type_or_raise(start_date, int, parameter_name="start_date")
+        # end if
         self.start_date = start_date
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this VoiceChatScheduled to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(VoiceChatScheduled, self).to_array()
-
-        array['start_date'] = int(self.start_date)  # type int
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -391,39 +351,34 @@ class VoiceChatScheduled(ServiceMessage):
         if not array:  # None or {}
             return None
         # end if
+        if VoiceChatScheduled._is_parsing_lazily():
+            return VoiceChatScheduled._from_array_lazily(array)
+        # end if
+        if not VoiceChatScheduled._must_validate(array):
+            return VoiceChatScheduled._from_array_trusted(array)
+        # end if
 
         data = VoiceChatScheduled.validate_array(array)
         data['_raw'] = array
         return VoiceChatScheduled(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(voicechatscheduled_instance)`
-        """
-        return "VoiceChatScheduled(start_date={self.start_date!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(voicechatscheduled_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "VoiceChatScheduled.from_array({self._raw})".format(self=self)
-        # end if
-        return "VoiceChatScheduled(start_date={self.start_date!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the VoiceChatScheduled without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in voicechatscheduled_instance`
+        :return: new VoiceChatScheduled instance.
+        :rtype: VoiceChatScheduled
         """
-        return (
-            key in ["start_date"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = VoiceChatScheduled._set_field
+        instance = VoiceChatScheduled.__new__(VoiceChatScheduled)
+        set_field(instance, 'start_date', int(get('start_date')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class VoiceChatScheduled
 
 
@@ -440,6 +395,8 @@ class VoiceChatStarted(ServiceMessage):
     :type  _raw: None | dict
     """
 
+    __slots__ = ()
+
     def __init__(self, _raw=None):
         """
         This object represents a service message about a voice chat started in the chat.
@@ -457,25 +414,6 @@ class VoiceChatStarted(ServiceMessage):
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this VoiceChatStarted to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(VoiceChatStarted, self).to_array()
-
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -500,39 +438,14 @@ class VoiceChatStarted(ServiceMessage):
         if not array:  # None or {}
             return None
         # end if
+        if VoiceChatStarted._is_parsing_lazily():
+            return VoiceChatStarted._from_array_lazily(array)
+        # end if
 
         data = VoiceChatStarted.validate_array(array)
         data['_raw'] = array
         return VoiceChatStarted(**data)
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(voicechatstarted_instance)`
-        """
-        return "VoiceChatStarted()".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(voicechatstarted_instance)`
-        """
-        if self._raw:
-            return "VoiceChatStarted.from_array({self._raw})".format(self=self)
-        # end if
-        return "VoiceChatStarted()".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in voicechatstarted_instance`
-        """
-        return (
-            key in []
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class VoiceChatStarted
 
 
@@ -555,6 +468,13 @@ class VoiceChatEnded(ServiceMessage):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('duration',)
+    _fields = ('duration',)  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('duration', 'duration', int, False),
+    )
+
     def __init__(self, duration, _raw=None):
         """
         This object represents a service message about a voice chat ended in the chat.
@@ -574,32 +494,14 @@ class VoiceChatEnded(ServiceMessage):
         :type  _raw: None | dict
         """
         super(VoiceChatEnded, self).__init__()
-        assert_type_or_raise(duration, int, parameter_name="duration")
+        if self._must_validate(_raw):
+            assert_type_or_raise(duration, int, parameter_name="duration")
+        # end if
         self.duration = duration
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this VoiceChatEnded to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(VoiceChatEnded, self).to_array()
-
-        array['duration'] = int(self.duration)  # type int
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -625,39 +527,34 @@ class VoiceChatEnded(ServiceMessage):
         if not array:  # None or {}
             return None
         # end if
+        if VoiceChatEnded._is_parsing_lazily():
+            return VoiceChatEnded._from_array_lazily(array)
+        # end if
+        if not VoiceChatEnded._must_validate(array):
+            return VoiceChatEnded._from_array_trusted(array)
+        # end if
 
         data = VoiceChatEnded.validate_array(array)
         data['_raw'] = array
         return VoiceChatEnded(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(voicechatended_instance)`
-        """
-        return "VoiceChatEnded(duration={self.duration!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(voicechatended_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "VoiceChatEnded.from_array({self._raw})".format(self=self)
-        # end if
-        return "VoiceChatEnded(duration={self.duration!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the VoiceChatEnded without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in voicechatended_instance`
+        :return: new VoiceChatEnded instance.
+        :rtype: VoiceChatEnded
         """
-        return (
-            key in ["duration"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = VoiceChatEnded._set_field
+        instance = VoiceChatEnded.__new__(VoiceChatEnded)
+        set_field(instance, 'duration', int(get('duration')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class VoiceChatEnded
 
 
@@ -676,6 +573,13 @@ class VoiceChatParticipantsInvited(ServiceMessage):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('users',)
+    _fields = ('users',)  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('users', 'users', list, True),
+    )
+
     def __init__(self, users=None, _raw=None):
         """
         This object represents a service message about new members invited to a voice chat.
@@ -691,36 +595,15 @@ class VoiceChatParticipantsInvited(ServiceMessage):
         :type  _raw: None | dict
         """
         super(VoiceChatParticipantsInvited, self).__init__()
-        from .peer import User
-        assert_type_or_raise(users, None, list, parameter_name="users")
+        if self._must_validate(_raw):
+            from .peer import User
+            assert_type_or_raise(users, None, list, parameter_name="users")
+        # end if
         self.users = users
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this VoiceChatParticipantsInvited to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .peer import User
-        array = super(VoiceChatParticipantsInvited, self).to_array()
-
-        if self.users is not None:
-            array['users'] = self._as_array(self.users)  # type list of User
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -747,37 +630,37 @@ class VoiceChatParticipantsInvited(ServiceMessage):
         if not array:  # None or {}
             return None
         # end if
+        if VoiceChatParticipantsInvited._is_parsing_lazily():
+            return VoiceChatParticipantsInvited._from_array_lazily(array)
+        # end if
+        if not VoiceChatParticipantsInvited._must_validate(array):
+            return VoiceChatParticipantsInvited._from_array_trusted(array)
+        # end if
 
         data = VoiceChatParticipantsInvited.validate_array(array)
         data['_raw'] = array
         return VoiceChatParticipantsInvited(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(voicechatparticipantsinvited_instance)`
-        """
-        return "VoiceChatParticipantsInvited(users={self.users!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(voicechatparticipantsinvited_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "VoiceChatParticipantsInvited.from_array({self._raw})".format(self=self)
-        # end if
-        return "VoiceChatParticipantsInvited(users={self.users!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the VoiceChatParticipantsInvited without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in voicechatparticipantsinvited_instance`
+        :return: new VoiceChatParticipantsInvited instance.
+        :rtype: VoiceChatParticipantsInvited
         """
-        return (
-            key in ["users"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = VoiceChatParticipantsInvited._set_field
+        instance = VoiceChatParticipantsInvited.__new__(VoiceChatParticipantsInvited)
+        value = get('users')
+        set_field(instance, 'users', User.from_array_list(value, list_level=1) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class VoiceChatParticipantsInvited
+
+
+# bottom of file, as those modules import this one too. Used by the `_from_array_trusted(…)` functions.
+from .peer import User
@@ -47,6 +47,19 @@ class StickerSet(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('name', 'title', 'is_animated', 'is_video', 'contains_masks', 'stickers', 'thumb')
+    _fields = ('name', 'title', 'is_animated', 'is_video', 'contains_masks', 'stickers', 'thumb')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('name', 'name', u, False),
+        ('title', 'title', u, False),
+        ('is_animated', 'is_animated', bool, False),
+        ('is_video', 'is_video', bool, False),
+        ('contains_masks', 'contains_masks', bool, False),
+        ('stickers', 'stickers', list, False),
+        ('thumb', 'thumb', None, True),
+    )
+
     def __init__(self, name, title, is_animated, is_video, contains_masks, stickers, thumb=None, _raw=None):
         """
         This object represents a sticker set.
@@ -84,56 +97,28 @@ class StickerSet(Result):
         :type  _raw: None | dict
         """
         super(StickerSet, self).__init__()
-        from .media import PhotoSize
-        from .media import Sticker
-        assert_type_or_raise(name, unicode_type, parameter_name="name")
+        if self._must_validate(_raw):
+            from .media import PhotoSize
+            from .media import Sticker
+            assert_type_or_raise(name, unicode_type, parameter_name="name")
+            assert_type_or_raise(title, unicode_type, parameter_name="title")
+            assert_type_or_raise(is_animated, bool, parameter_name="is_animated")
+            assert_type_or_raise(is_video, bool, parameter_name="is_video")
+            assert_type_or_raise(contains_masks, bool, parameter_name="contains_masks")
+            assert_type_or_raise(stickers, list, parameter_name="stickers")
+            assert_type_or_raise(thumb, None, PhotoSize, parameter_name="thumb")
+        # end if
         self.name = name
-        assert_type_or_raise(title, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(is_animated, bool, parameter_name="is_animated")
         self.is_animated = is_animated
-        assert_type_or_raise(is_video, bool, parameter_name="is_video")
         self.is_video = is_video
-        assert_type_or_raise(contains_masks, bool, parameter_name="contains_masks")
         self.contains_masks = contains_masks
-        assert_type_or_raise(stickers, list, parameter_name="stickers")
         self.stickers = stickers
-        assert_type_or_raise(thumb, None, PhotoSize, parameter_name="thumb")
         self.thumb = thumb
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this StickerSet to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .media import PhotoSize
-        from .media import Sticker
-        array = super(StickerSet, self).to_array()
-
-        array['name'] = u(self.name)  # py2: type unicode, py3: type str
-        array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        array['is_animated'] = bool(self.is_animated)  # type bool
-        array['is_video'] = bool(self.is_video)  # type bool
-        array['contains_masks'] = bool(self.contains_masks)  # type bool
-        array['stickers'] = self._as_array(self.stickers)  # type list of Sticker
-        if self.thumb is not None:
-            array['thumb'] = self.thumb.to_array()  # type PhotoSize
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -167,39 +152,41 @@ class StickerSet(Result):
         if not array:  # None or {}
             return None
         # end if
+        if StickerSet._is_parsing_lazily():
+            return StickerSet._from_array_lazily(array)
+        # end if
+        if not StickerSet._must_validate(array):
+            return StickerSet._from_array_trusted(array)
+        # end if
 
         data = StickerSet.validate_array(array)
         data['_raw'] = array
         return StickerSet(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(stickerset_instance)`
-        """
-        return "StickerSet(name={self.name!r}, title={self.title!r}, is_animated={self.is_animated!r}, is_video={self.is_video!r}, contains_masks={self.contains_masks!r}, stickers={self.stickers!r}, thumb={self.thumb!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(stickerset_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "StickerSet.from_array({self._raw})".format(self=self)
-        # end if
-        return "StickerSet(name={self.name!r}, title={self.title!r}, is_animated={self.is_animated!r}, is_video={self.is_video!r}, contains_masks={self.contains_masks!r}, stickers={self.stickers!r}, thumb={self.thumb!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the StickerSet without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in stickerset_instance`
+        :return: new StickerSet instance.
+        :rtype: StickerSet
         """
-        return (
-            key in ["name", "title", "is_animated", "is_video", "contains_masks", "stickers", "thumb"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = StickerSet._set_field
+        instance = StickerSet.__new__(StickerSet)
+        set_field(instance, 'name', u(get('name')))
+        set_field(instance, 'title', u(get('title')))
+        set_field(instance, 'is_animated', bool(get('is_animated')))
+        set_field(instance, 'is_video', bool(get('is_video')))
+        set_field(instance, 'contains_masks', bool(get('contains_masks')))
+        set_field(instance, 'stickers', Sticker.from_array_list(get('stickers'), list_level=1))
+        value = get('thumb')
+        set_field(instance, 'thumb', PhotoSize.from_array(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class StickerSet
 
 
@@ -231,6 +218,16 @@ class MaskPosition(Result):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('point', 'x_shift', 'y_shift', 'scale')
+    _fields = ('point', 'x_shift', 'y_shift', 'scale')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('point', 'point', u, False),
+        ('x_shift', 'x_shift', float, False),
+        ('y_shift', 'y_shift', float, False),
+        ('scale', 'scale', float, False),
+    )
+
     def __init__(self, point, x_shift, y_shift, scale, _raw=None):
         """
         This object describes the position on faces where a mask should be placed by default.
@@ -259,41 +256,20 @@ class MaskPosition(Result):
         :type  _raw: None | dict
         """
         super(MaskPosition, self).__init__()
-        assert_type_or_raise(point, unicode_type, parameter_name="point")
+        if self._must_validate(_raw):
+            assert_type_or_raise(point, unicode_type, parameter_name="point")
+            assert_type_or_raise(x_shift, float, parameter_name="x_shift")
+            assert_type_or_raise(y_shift, float, parameter_name="y_shift")
+            assert_type_or_raise(scale, float, parameter_name="scale")
+        # end if
         self.point = point
-        assert_type_or_raise(x_shift, float, parameter_name="x_shift")
         self.x_shift = x_shift
-        assert_type_or_raise(y_shift, float, parameter_name="y_shift")
         self.y_shift = y_shift
-        assert_type_or_raise(scale, float, parameter_name="scale")
         self.scale = scale
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this MaskPosition to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(MaskPosition, self).to_array()
-
-        array['point'] = u(self.point)  # py2: type unicode, py3: type str
-        array['x_shift'] = float(self.x_shift)  # type float
-        array['y_shift'] = float(self.y_shift)  # type float
-        array['scale'] = float(self.scale)  # type float
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -322,37 +298,40 @@ class MaskPosition(Result):
         if not array:  # None or {}
             return None
         # end if
+        if MaskPosition._is_parsing_lazily():
+            return MaskPosition._from_array_lazily(array)
+        # end if
+        if not MaskPosition._must_validate(array):
+            return MaskPosition._from_array_trusted(array)
+        # end if
 
         data = MaskPosition.validate_array(array)
         data['_raw'] = array
         return MaskPosition(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(maskposition_instance)`
-        """
-        return "MaskPosition(point={self.point!r}, x_shift={self.x_shift!r}, y_shift={self.y_shift!r}, scale={self.scale!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(maskposition_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "MaskPosition.from_array({self._raw})".format(self=self)
-        # end if
-        return "MaskPosition(point={self.point!r}, x_shift={self.x_shift!r}, y_shift={self.y_shift!r}, scale={self.scale!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the MaskPosition without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in maskposition_instance`
+        :return: new MaskPosition instance.
+        :rtype: MaskPosition
         """
-        return (
-            key in ["point", "x_shift", "y_shift", "scale"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = MaskPosition._set_field
+        instance = MaskPosition.__new__(MaskPosition)
+        set_field(instance, 'point', u(get('point')))
+        set_field(instance, 'x_shift', float(get('x_shift')))
+        set_field(instance, 'y_shift', float(get('y_shift')))
+        set_field(instance, 'scale', float(get('scale')))
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class MaskPosition
+
+
+# bottom of file, as those modules import this one too. Used by the `_from_array_trusted(…)` functions.
+from .media import PhotoSize
+from .media import Sticker
@@ -27,6 +27,8 @@ class UpdateType(Receivable):
     :type  _raw: None | dict
     """
 
+    __slots__ = ()
+
     pass
 # end class UpdateType
 
@@ -44,6 +46,8 @@ class CallbackGame(UpdateType):
     :type  _raw: None | dict
     """
 
+    __slots__ = ()
+
     def __init__(self, _raw=None):
         """
         A placeholder, currently holds no information.
@@ -61,7 +65,7 @@ class CallbackGame(UpdateType):
         self._raw = _raw
     # end def __init__
 
-    def to_array(self):
+    def to_array(self, prefer_original=False):
         return {}
     # end def
 
@@ -81,39 +85,14 @@ class CallbackGame(UpdateType):
         if not array:  # None or {}
             return None
         # end if
+        if CallbackGame._is_parsing_lazily():
+            return CallbackGame._from_array_lazily(array)
+        # end if
 
         data = CallbackGame.validate_array(array)
         data['_raw'] = array
         return CallbackGame(**data)
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(callbackgame_instance)`
-        """
-        return "CallbackGame()".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(callbackgame_instance)`
-        """
-        if self._raw:
-            return "CallbackGame.from_array({self._raw})".format(self=self)
-        # end if
-        return "CallbackGame()".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in callbackgame_instance`
-        """
-        return (
-            key in []
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class CallbackGame
 
 
@@ -186,6 +165,27 @@ class Update(Receivable):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('update_id', 'message', 'edited_message', 'channel_post', 'edited_channel_post', 'inline_query', 'chosen_inline_result', 'callback_query', 'shipping_query', 'pre_checkout_query', 'poll', 'poll_answer', 'my_chat_member', 'chat_member', 'chat_join_request')
+    _fields = ('update_id', 'message', 'edited_message', 'channel_post', 'edited_channel_post', 'inline_query', 'chosen_inline_result', 'callback_query', 'shipping_query', 'pre_checkout_query', 'poll', 'poll_answer', 'my_chat_member', 'chat_member', 'chat_join_request')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('update_id', 'update_id', int, False),
+        ('message', 'message', None, True),
+        ('edited_message', 'edited_message', None, True),
+        ('channel_post', 'channel_post', None, True),
+        ('edited_channel_post', 'edited_channel_post', None, True),
+        ('inline_query', 'inline_query', None, True),
+        ('chosen_inline_result', 'chosen_inline_result', None, True),
+        ('callback_query', 'callback_query', None, True),
+        ('shipping_query', 'shipping_query', None, True),
+        ('pre_checkout_query', 'pre_checkout_query', None, True),
+        ('poll', 'poll', None, True),
+        ('poll_answer', 'poll_answer', None, True),
+        ('my_chat_member', 'my_chat_member', None, True),
+        ('chat_member', 'chat_member', None, True),
+        ('chat_join_request', 'chat_join_request', None, True),
+    )
+
     def __init__(self, update_id, message=None, edited_message=None, channel_post=None, edited_channel_post=None, inline_query=None, chosen_inline_result=None, callback_query=None, shipping_query=None, pre_checkout_query=None, poll=None, poll_answer=None, my_chat_member=None, chat_member=None, chat_join_request=None, _raw=None):
         """
         This object represents an incoming update.At most one of the optional parameters can be present in any given update.
@@ -255,118 +255,50 @@ class Update(Receivable):
         :type  _raw: None | dict
         """
         super(Update, self).__init__()
-        from .inline import ChosenInlineResult
-        from .inline import InlineQuery
-        from .media import Poll
-        from .media import PollAnswer
-        from .payments import PreCheckoutQuery
-        from .payments import ShippingQuery
-        from .peer import ChatJoinRequest
-        from .peer import ChatMemberUpdated
-        assert_type_or_raise(update_id, int, parameter_name="update_id")
+        if self._must_validate(_raw):
+            from .inline import ChosenInlineResult
+            from .inline import InlineQuery
+            from .media import Poll
+            from .media import PollAnswer
+            from .payments import PreCheckoutQuery
+            from .payments import ShippingQuery
+            from .peer import ChatJoinRequest
+            from .peer import ChatMemberUpdated
+            assert_type_or_raise(update_id, int, parameter_name="update_id")
+            assert_type_or_raise(message, None, Message, parameter_name="message")
+            assert_type_or_raise(edited_message, None, Message, parameter_name="edited_message")
+            assert_type_or_raise(channel_post, None, Message, parameter_name="channel_post")
+            assert_type_or_raise(edited_channel_post, None, Message, parameter_name="edited_channel_post")
+            assert_type_or_raise(inline_query, None, InlineQuery, parameter_name="inline_query")
+            assert_type_or_raise(chosen_inline_result, None, ChosenInlineResult, parameter_name="chosen_inline_result")
+            assert_type_or_raise(callback_query, None, CallbackQuery, parameter_name="callback_query")
+            assert_type_or_raise(shipping_query, None, ShippingQuery, parameter_name="shipping_query")
+            assert_type_or_raise(pre_checkout_query, None, PreCheckoutQuery, parameter_name="pre_checkout_query")
+            assert_type_or_raise(poll, None, Poll, parameter_name="poll")
+            assert_type_or_raise(poll_answer, None, PollAnswer, parameter_name="poll_answer")
+            assert_type_or_raise(my_chat_member, None, ChatMemberUpdated, parameter_name="my_chat_member")
+            assert_type_or_raise(chat_member, None, ChatMemberUpdated, parameter_name="chat_member")
+            assert_type_or_raise(chat_join_request, None, ChatJoinRequest, parameter_name="chat_join_request")
+        # end if
         self.update_id = update_id
-        assert_type_or_raise(message, None, Message, parameter_name="message")
         self.message = message
-        assert_type_or_raise(edited_message, None, Message, parameter_name="edited_message")
         self.edited_message = edited_message
-        assert_type_or_raise(channel_post, None, Message, parameter_name="channel_post")
         self.channel_post = channel_post
-        assert_type_or_raise(edited_channel_post, None, Message, parameter_name="edited_channel_post")
         self.edited_channel_post = edited_channel_post
-        assert_type_or_raise(inline_query, None, InlineQuery, parameter_name="inline_query")
         self.inline_query = inline_query
-        assert_type_or_raise(chosen_inline_result, None, ChosenInlineResult, parameter_name="chosen_inline_result")
         self.chosen_inline_result = chosen_inline_result
-        assert_type_or_raise(callback_query, None, CallbackQuery, parameter_name="callback_query")
         self.callback_query = callback_query
-        assert_type_or_raise(shipping_query, None, ShippingQuery, parameter_name="shipping_query")
         self.shipping_query = shipping_query
-        assert_type_or_raise(pre_checkout_query, None, PreCheckoutQuery, parameter_name="pre_checkout_query")
         self.pre_checkout_query = pre_checkout_query
-        assert_type_or_raise(poll, None, Poll, parameter_name="poll")
         self.poll = poll
-        assert_type_or_raise(poll_answer, None, PollAnswer, parameter_name="poll_answer")
         self.poll_answer = poll_answer
-        assert_type_or_raise(my_chat_member, None, ChatMemberUpdated, parameter_name="my_chat_member")
         self.my_chat_member = my_chat_member
-        assert_type_or_raise(chat_member, None, ChatMemberUpdated, parameter_name="chat_member")
         self.chat_member = chat_member
-        assert_type_or_raise(chat_join_request, None, ChatJoinRequest, parameter_name="chat_join_request")
         self.chat_join_request = chat_join_request
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this Update to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .inline import ChosenInlineResult
-        from .inline import InlineQuery
-        from .media import Poll
-        from .media import PollAnswer
-        from .payments import PreCheckoutQuery
-        from .payments import ShippingQuery
-        from .peer import ChatJoinRequest
-        from .peer import ChatMemberUpdated
-        array = super(Update, self).to_array()
-
-        array['update_id'] = int(self.update_id)  # type int
-        if self.message is not None:
-            array['message'] = self.message.to_array()  # type Message
-        # end if
-        if self.edited_message is not None:
-            array['edited_message'] = self.edited_message.to_array()  # type Message
-        # end if
-        if self.channel_post is not None:
-            array['channel_post'] = self.channel_post.to_array()  # type Message
-        # end if
-        if self.edited_channel_post is not None:
-            array['edited_channel_post'] = self.edited_channel_post.to_array()  # type Message
-        # end if
-        if self.inline_query is not None:
-            array['inline_query'] = self.inline_query.to_array()  # type InlineQuery
-        # end if
-        if self.chosen_inline_result is not None:
-            array['chosen_inline_result'] = self.chosen_inline_result.to_array()  # type ChosenInlineResult
-        # end if
-        if self.callback_query is not None:
-            array['callback_query'] = self.callback_query.to_array()  # type CallbackQuery
-        # end if
-        if self.shipping_query is not None:
-            array['shipping_query'] = self.shipping_query.to_array()  # type ShippingQuery
-        # end if
-        if self.pre_checkout_query is not None:
-            array['pre_checkout_query'] = self.pre_checkout_query.to_array()  # type PreCheckoutQuery
-        # end if
-        if self.poll is not None:
-            array['poll'] = self.poll.to_array()  # type Poll
-        # end if
-        if self.poll_answer is not None:
-            array['poll_answer'] = self.poll_answer.to_array()  # type PollAnswer
-        # end if
-        if self.my_chat_member is not None:
-            array['my_chat_member'] = self.my_chat_member.to_array()  # type ChatMemberUpdated
-        # end if
-        if self.chat_member is not None:
-            array['chat_member'] = self.chat_member.to_array()  # type ChatMemberUpdated
-        # end if
-        if self.chat_join_request is not None:
-            array['chat_join_request'] = self.chat_join_request.to_array()  # type ChatJoinRequest
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -414,39 +346,89 @@ class Update(Receivable):
         if not array:  # None or {}
             return None
         # end if
+        if Update._is_parsing_lazily():
+            return Update._from_array_lazily(array)
+        # end if
+        if not Update._must_validate(array):
+            return Update._from_array_trusted(array)
+        # end if
 
         data = Update.validate_array(array)
         data['_raw'] = array
         return Update(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(update_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        return "Update(update_id={self.update_id!r}, message={self.message!r}, edited_message={self.edited_message!r}, channel_post={self.channel_post!r}, edited_channel_post={self.edited_channel_post!r}, inline_query={self.inline_query!r}, chosen_inline_result={self.chosen_inline_result!r}, callback_query={self.callback_query!r}, shipping_query={self.shipping_query!r}, pre_checkout_query={self.pre_checkout_query!r}, poll={self.poll!r}, poll_answer={self.poll_answer!r}, my_chat_member={self.my_chat_member!r}, chat_member={self.chat_member!r}, chat_join_request={self.chat_join_request!r})".format(self=self)
-    # end def __str__
+        Single pass version of :meth:`from_array`, building the Update without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __repr__(self):
+        :return: new Update instance.
+        :rtype: Update
         """
-        Implements `repr(update_instance)`
+        get = array.get
+        set_field = Update._set_field
+        instance = Update.__new__(Update)
+        set_field(instance, 'update_id', int(get('update_id')))
+        value = get('message')
+        set_field(instance, 'message', Message.from_array(value) if value is not None else None)
+        value = get('edited_message')
+        set_field(instance, 'edited_message', Message.from_array(value) if value is not None else None)
+        value = get('channel_post')
+        set_field(instance, 'channel_post', Message.from_array(value) if value is not None else None)
+        value = get('edited_channel_post')
+        set_field(instance, 'edited_channel_post', Message.from_array(value) if value is not None else None)
+        value = get('inline_query')
+        set_field(instance, 'inline_query', InlineQuery.from_array(value) if value is not None else None)
+        value = get('chosen_inline_result')
+        set_field(instance, 'chosen_inline_result', ChosenInlineResult.from_array(value) if value is not None else None)
+        value = get('callback_query')
+        set_field(instance, 'callback_query', CallbackQuery.from_array(value) if value is not None else None)
+        value = get('shipping_query')
+        set_field(instance, 'shipping_query', ShippingQuery.from_array(value) if value is not None else None)
+        value = get('pre_checkout_query')
+        set_field(instance, 'pre_checkout_query', PreCheckoutQuery.from_array(value) if value is not None else None)
+        value = get('poll')
+        set_field(instance, 'poll', Poll.from_array(value) if value is not None else None)
+        value = get('poll_answer')
+        set_field(instance, 'poll_answer', PollAnswer.from_array(value) if value is not None else None)
+        value = get('my_chat_member')
+        set_field(instance, 'my_chat_member', ChatMemberUpdated.from_array(value) if value is not None else None)
+        value = get('chat_member')
+        set_field(instance, 'chat_member', ChatMemberUpdated.from_array(value) if value is not None else None)
+        value = get('chat_join_request')
+        set_field(instance, 'chat_join_request', ChatJoinRequest.from_array(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
+
+    @property
+    def update_type(self):
+        """
+        The type of this update, that's the name of the one optional field set, e.g. `"message"` or `"callback_query"`.
+        `None` if none is set.
+
+        Received updates take it from the data they were parsed from, which has only that key besides `update_id`,
+        instead of looking at every field. Lazily parsed updates aren't parsed for it.
+
+        :rtype: str | None
         """
         if self._raw:
-            return "Update.from_array({self._raw})".format(self=self)
+            for key in self._raw:
+                if key != 'update_id':
+                    return key
+                # end if
+            # end for
+            return None
         # end if
-        return "Update(update_id={self.update_id!r}, message={self.message!r}, edited_message={self.edited_message!r}, channel_post={self.channel_post!r}, edited_channel_post={self.edited_channel_post!r}, inline_query={self.inline_query!r}, chosen_inline_result={self.chosen_inline_result!r}, callback_query={self.callback_query!r}, shipping_query={self.shipping_query!r}, pre_checkout_query={self.pre_checkout_query!r}, poll={self.poll!r}, poll_answer={self.poll_answer!r}, my_chat_member={self.my_chat_member!r}, chat_member={self.chat_member!r}, chat_join_request={self.chat_join_request!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in update_instance`
-        """
-        return (
-            key in ["update_id", "message", "edited_message", "channel_post", "edited_channel_post", "inline_query", "chosen_inline_result", "callback_query", "shipping_query", "pre_checkout_query", "poll", "poll_answer", "my_chat_member", "chat_member", "chat_join_request"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        for key in Update.__slots__:
+            if key != 'update_id' and getattr(self, key) is not None:
+                return key
+            # end if
+        # end for
+        return None
+    # end def update_type
 # end class Update
 
 
@@ -491,6 +473,20 @@ class WebhookInfo(Receivable):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('url', 'has_custom_certificate', 'pending_update_count', 'ip_address', 'last_error_date', 'last_error_message', 'max_connections', 'allowed_updates')
+    _fields = ('url', 'has_custom_certificate', 'pending_update_count', 'ip_address', 'last_error_date', 'last_error_message', 'max_connections', 'allowed_updates')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('url', 'url', u, False),
+        ('has_custom_certificate', 'has_custom_certificate', bool, False),
+        ('pending_update_count', 'pending_update_count', int, False),
+        ('ip_address', 'ip_address', u, True),
+        ('last_error_date', 'last_error_date', int, True),
+        ('last_error_message', 'last_error_message', u, True),
+        ('max_connections', 'max_connections', int, True),
+        ('allowed_updates', 'allowed_updates', list, True),
+    )
+
     def __init__(self, url, has_custom_certificate, pending_update_count, ip_address=None, last_error_date=None, last_error_message=None, max_connections=None, allowed_updates=None, _raw=None):
         """
         Contains information about the current status of a webhook.
@@ -532,63 +528,28 @@ class WebhookInfo(Receivable):
         :type  _raw: None | dict
         """
         super(WebhookInfo, self).__init__()
-        assert_type_or_raise(url, unicode_type, parameter_name="url")
+        if self._must_validate(_raw):
+            assert_type_or_raise(url, unicode_type, parameter_name="url")
+            assert_type_or_raise(has_custom_certificate, bool, parameter_name="has_custom_certificate")
+            assert_type_or_raise(pending_update_count, int, parameter_name="pending_update_count")
+            assert_type_or_raise(ip_address, None, unicode_type, parameter_name="ip_address")
+            assert_type_or_raise(last_error_date, None, int, parameter_name="last_error_date")
+            assert_type_or_raise(last_error_message, None, unicode_type, parameter_name="last_error_message")
+            assert_type_or_raise(max_connections, None, int, parameter_name="max_connections")
+            assert_type_or_raise(allowed_updates, None, list, parameter_name="allowed_updates")
+        # end if
         self.url = url
-        assert_type_or_raise(has_custom_certificate, bool, parameter_name="has_custom_certificate")
         self.has_custom_certificate = has_custom_certificate
-        assert_type_or_raise(pending_update_count, int, parameter_name="pending_update_count")
         self.pending_update_count = pending_update_count
-        assert_type_or_raise(ip_address, None, unicode_type, parameter_name="ip_address")
         self.ip_address = ip_address
-        assert_type_or_raise(last_error_date, None, int, parameter_name="last_error_date")
         self.last_error_date = last_error_date
-        assert_type_or_raise(last_error_message, None, unicode_type, parameter_name="last_error_message")
         self.last_error_message = last_error_message
-        assert_type_or_raise(max_connections, None, int, parameter_name="max_connections")
         self.max_connections = max_connections
-        assert_type_or_raise(allowed_updates, None, list, parameter_name="allowed_updates")
         self.allowed_updates = allowed_updates
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this WebhookInfo to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(WebhookInfo, self).to_array()
-
-        array['url'] = u(self.url)  # py2: type unicode, py3: type str
-        array['has_custom_certificate'] = bool(self.has_custom_certificate)  # type bool
-        array['pending_update_count'] = int(self.pending_update_count)  # type int
-        if self.ip_address is not None:
-            array['ip_address'] = u(self.ip_address)  # py2: type unicode, py3: type str
-        # end if
-        if self.last_error_date is not None:
-            array['last_error_date'] = int(self.last_error_date)  # type int
-        # end if
-        if self.last_error_message is not None:
-            array['last_error_message'] = u(self.last_error_message)  # py2: type unicode, py3: type str
-        # end if
-        if self.max_connections is not None:
-            array['max_connections'] = int(self.max_connections)  # type int
-        # end if
-        if self.allowed_updates is not None:
-            array['allowed_updates'] = self._as_array(self.allowed_updates)  # type list of str
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -621,39 +582,46 @@ class WebhookInfo(Receivable):
         if not array:  # None or {}
             return None
         # end if
+        if WebhookInfo._is_parsing_lazily():
+            return WebhookInfo._from_array_lazily(array)
+        # end if
+        if not WebhookInfo._must_validate(array):
+            return WebhookInfo._from_array_trusted(array)
+        # end if
 
         data = WebhookInfo.validate_array(array)
         data['_raw'] = array
         return WebhookInfo(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(webhookinfo_instance)`
-        """
-        return "WebhookInfo(url={self.url!r}, has_custom_certificate={self.has_custom_certificate!r}, pending_update_count={self.pending_update_count!r}, ip_address={self.ip_address!r}, last_error_date={self.last_error_date!r}, last_error_message={self.last_error_message!r}, max_connections={self.max_connections!r}, allowed_updates={self.allowed_updates!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(webhookinfo_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "WebhookInfo.from_array({self._raw})".format(self=self)
-        # end if
-        return "WebhookInfo(url={self.url!r}, has_custom_certificate={self.has_custom_certificate!r}, pending_update_count={self.pending_update_count!r}, ip_address={self.ip_address!r}, last_error_date={self.last_error_date!r}, last_error_message={self.last_error_message!r}, max_connections={self.max_connections!r}, allowed_updates={self.allowed_updates!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the WebhookInfo without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in webhookinfo_instance`
+        :return: new WebhookInfo instance.
+        :rtype: WebhookInfo
         """
-        return (
-            key in ["url", "has_custom_certificate", "pending_update_count", "ip_address", "last_error_date", "last_error_message", "max_connections", "allowed_updates"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = WebhookInfo._set_field
+        instance = WebhookInfo.__new__(WebhookInfo)
+        set_field(instance, 'url', u(get('url')))
+        set_field(instance, 'has_custom_certificate', bool(get('has_custom_certificate')))
+        set_field(instance, 'pending_update_count', int(get('pending_update_count')))
+        value = get('ip_address')
+        set_field(instance, 'ip_address', u(value) if value is not None else None)
+        value = get('last_error_date')
+        set_field(instance, 'last_error_date', int(value) if value is not None else None)
+        value = get('last_error_message')
+        set_field(instance, 'last_error_message', u(value) if value is not None else None)
+        value = get('max_connections')
+        set_field(instance, 'max_connections', int(value) if value is not None else None)
+        value = get('allowed_updates')
+        set_field(instance, 'allowed_updates', WebhookInfo._builtin_from_array_list(required_type=unicode_type, value=value, list_level=1) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class WebhookInfo
 
 
@@ -868,6 +836,71 @@ class Message(UpdateType):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('message_id', 'date', 'chat', 'from_peer', 'sender_chat', 'forward_from', 'forward_from_chat', 'forward_from_message_id', 'forward_signature', 'forward_sender_name', 'forward_date', 'is_automatic_forward', 'reply_to_message', 'via_bot', 'edit_date', 'has_protected_content', 'media_group_id', 'author_signature', 'text', 'entities', 'animation', 'audio', 'document', 'photo', 'sticker', 'video', 'video_note', 'voice', 'caption', 'caption_entities', 'contact', 'dice', 'game', 'poll', 'venue', 'location', 'new_chat_members', 'left_chat_member', 'new_chat_title', 'new_chat_photo', 'delete_chat_photo', 'group_chat_created', 'supergroup_chat_created', 'channel_chat_created', 'message_auto_delete_timer_changed', 'migrate_to_chat_id', 'migrate_from_chat_id', 'pinned_message', 'invoice', 'successful_payment', 'connected_website', 'passport_data', 'proximity_alert_triggered', 'voice_chat_scheduled', 'voice_chat_started', 'voice_chat_ended', 'voice_chat_participants_invited', 'reply_markup')
+    _fields = ('message_id', 'date', 'chat', 'from_peer', 'sender_chat', 'forward_from', 'forward_from_chat', 'forward_from_message_id', 'forward_signature', 'forward_sender_name', 'forward_date', 'is_automatic_forward', 'reply_to_message', 'via_bot', 'edit_date', 'has_protected_content', 'media_group_id', 'author_signature', 'text', 'entities', 'animation', 'audio', 'document', 'photo', 'sticker', 'video', 'video_note', 'voice', 'caption', 'caption_entities', 'contact', 'dice', 'game', 'poll', 'venue', 'location', 'new_chat_members', 'left_chat_member', 'new_chat_title', 'new_chat_photo', 'delete_chat_photo', 'group_chat_created', 'supergroup_chat_created', 'channel_chat_created', 'message_auto_delete_timer_changed', 'migrate_to_chat_id', 'migrate_from_chat_id', 'pinned_message', 'invoice', 'successful_payment', 'connected_website', 'passport_data', 'proximity_alert_triggered', 'voice_chat_scheduled', 'voice_chat_started', 'voice_chat_ended', 'voice_chat_participants_invited', 'reply_markup')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _api_names = {'from_peer': 'from'}  # the fields with a different name in the api data.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('message_id', 'message_id', int, False),
+        ('date', 'date', int, False),
+        ('chat', 'chat', None, False),
+        ('from_peer', 'from', None, True),
+        ('sender_chat', 'sender_chat', None, True),
+        ('forward_from', 'forward_from', None, True),
+        ('forward_from_chat', 'forward_from_chat', None, True),
+        ('forward_from_message_id', 'forward_from_message_id', int, True),
+        ('forward_signature', 'forward_signature', u, True),
+        ('forward_sender_name', 'forward_sender_name', u, True),
+        ('forward_date', 'forward_date', int, True),
+        ('is_automatic_forward', 'is_automatic_forward', bool, True),
+        ('reply_to_message', 'reply_to_message', None, True),
+        ('via_bot', 'via_bot', None, True),
+        ('edit_date', 'edit_date', int, True),
+        ('has_protected_content', 'has_protected_content', bool, True),
+        ('media_group_id', 'media_group_id', u, True),
+        ('author_signature', 'author_signature', u, True),
+        ('text', 'text', u, True),
+        ('entities', 'entities', list, True),
+        ('animation', 'animation', None, True),
+        ('audio', 'audio', None, True),
+        ('document', 'document', None, True),
+        ('photo', 'photo', list, True),
+        ('sticker', 'sticker', None, True),
+        ('video', 'video', None, True),
+        ('video_note', 'video_note', None, True),
+        ('voice', 'voice', None, True),
+        ('caption', 'caption', u, True),
+        ('caption_entities', 'caption_entities', list, True),
+        ('contact', 'contact', None, True),
+        ('dice', 'dice', None, True),
+        ('game', 'game', None, True),
+        ('poll', 'poll', None, True),
+        ('venue', 'venue', None, True),
+        ('location', 'location', None, True),
+        ('new_chat_members', 'new_chat_members', list, True),
+        ('left_chat_member', 'left_chat_member', None, True),
+        ('new_chat_title', 'new_chat_title', u, True),
+        ('new_chat_photo', 'new_chat_photo', list, True),
+        ('delete_chat_photo', 'delete_chat_photo', bool, True),
+        ('group_chat_created', 'group_chat_created', bool, True),
+        ('supergroup_chat_created', 'supergroup_chat_created', bool, True),
+        ('channel_chat_created', 'channel_chat_created', bool, True),
+        ('message_auto_delete_timer_changed', 'message_auto_delete_timer_changed', None, True),
+        ('migrate_to_chat_id', 'migrate_to_chat_id', int, True),
+        ('migrate_from_chat_id', 'migrate_from_chat_id', int, True),
+        ('pinned_message', 'pinned_message', None, True),
+        ('invoice', 'invoice', None, True),
+        ('successful_payment', 'successful_payment', None, True),
+        ('connected_website', 'connected_website', u, True),
+        ('passport_data', 'passport_data', None, True),
+        ('proximity_alert_triggered', 'proximity_alert_triggered', None, True),
+        ('voice_chat_scheduled', 'voice_chat_scheduled', None, True),
+        ('voice_chat_started', 'voice_chat_started', None, True),
+        ('voice_chat_ended', 'voice_chat_ended', None, True),
+        ('voice_chat_participants_invited', 'voice_chat_participants_invited', None, True),
+        ('reply_markup', 'reply_markup', None, True),
+    )
+
     def __init__(self, message_id, date, chat, from_peer=None, sender_chat=None, forward_from=None, forward_from_chat=None, forward_from_message_id=None, forward_signature=None, forward_sender_name=None, forward_date=None, is_automatic_forward=None, reply_to_message=None, via_bot=None, edit_date=None, has_protected_content=None, media_group_id=None, author_signature=None, text=None, entities=None, animation=None, audio=None, document=None, photo=None, sticker=None, video=None, video_note=None, voice=None, caption=None, caption_entities=None, contact=None, dice=None, game=None, poll=None, venue=None, location=None, new_chat_members=None, left_chat_member=None, new_chat_title=None, new_chat_photo=None, delete_chat_photo=None, group_chat_created=None, supergroup_chat_created=None, channel_chat_created=None, message_auto_delete_timer_changed=None, migrate_to_chat_id=None, migrate_from_chat_id=None, pinned_message=None, invoice=None, successful_payment=None, connected_website=None, passport_data=None, proximity_alert_triggered=None, voice_chat_scheduled=None, voice_chat_started=None, voice_chat_ended=None, voice_chat_participants_invited=None, reply_markup=None, _raw=None):
         """
         This object represents a message.
@@ -1079,367 +1112,155 @@ class Message(UpdateType):
         :type  _raw: None | dict
         """
         super(Message, self).__init__()
-        from .media import Animation
-        from .media import Audio
-        from .media import Contact
-        from .media import Dice
-        from .media import Document
-        from .media import Game
-        from .media import Location
-        from .media import MessageEntity
-        from .media import PhotoSize
-        from .media import Poll
-        from .media import Sticker
-        from .media import Venue
-        from .media import Video
-        from .media import VideoNote
-        from .media import Voice
-        from .passport import PassportData
-        from .payments import Invoice
-        from .payments import SuccessfulPayment
-        from .peer import Chat
-        from .peer import User
-        from .service import MessageAutoDeleteTimerChanged
-        from .service import ProximityAlertTriggered
-        from .service import VoiceChatEnded
-        from .service import VoiceChatParticipantsInvited
-        from .service import VoiceChatScheduled
-        from .service import VoiceChatStarted
-        from ..sendable.reply_markup import InlineKeyboardMarkup
-        assert_type_or_raise(message_id, int, parameter_name="message_id")
+        if self._must_validate(_raw):
+            from .media import Animation
+            from .media import Audio
+            from .media import Contact
+            from .media import Dice
+            from .media import Document
+            from .media import Game
+            from .media import Location
+            from .media import MessageEntity
+            from .media import PhotoSize
+            from .media import Poll
+            from .media import Sticker
+            from .media import Venue
+            from .media import Video
+            from .media import VideoNote
+            from .media import Voice
+            from .passport import PassportData
+            from .payments import Invoice
+            from .payments import SuccessfulPayment
+            from .peer import Chat
+            from .peer import User
+            from .service import MessageAutoDeleteTimerChanged
+            from .service import ProximityAlertTriggered
+            from .service import VoiceChatEnded
+            from .service import VoiceChatParticipantsInvited
+            from .service import VoiceChatScheduled
+            from .service import VoiceChatStarted
+            from ..sendable.reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(message_id, int, parameter_name="message_id")
+            assert_type_or_raise(date, int, parameter_name="date")
+            assert_type_or_raise(chat, Chat, parameter_name="chat")
+            assert_type_or_raise(from_peer, None, User, parameter_name="from_peer")
+            assert_type_or_raise(sender_chat, None, Chat, parameter_name="sender_chat")
+            assert_type_or_raise(forward_from, None, User, parameter_name="forward_from")
+            assert_type_or_raise(forward_from_chat, None, Chat, parameter_name="forward_from_chat")
+            assert_type_or_raise(forward_from_message_id, None, int, parameter_name="forward_from_message_id")
+            assert_type_or_raise(forward_signature, None, unicode_type, parameter_name="forward_signature")
+            assert_type_or_raise(forward_sender_name, None, unicode_type, parameter_name="forward_sender_name")
+            assert_type_or_raise(forward_date, None, int, parameter_name="forward_date")
+            assert_type_or_raise(is_automatic_forward, None, bool, parameter_name="is_automatic_forward")
+            assert_type_or_raise(reply_to_message, None, Message, parameter_name="reply_to_message")
+            assert_type_or_raise(via_bot, None, User, parameter_name="via_bot")
+            assert_type_or_raise(edit_date, None, int, parameter_name="edit_date")
+            assert_type_or_raise(has_protected_content, None, bool, parameter_name="has_protected_content")
+            assert_type_or_raise(media_group_id, None, unicode_type, parameter_name="media_group_id")
+            assert_type_or_raise(author_signature, None, unicode_type, parameter_name="author_signature")
+            assert_type_or_raise(text, None, unicode_type, parameter_name="text")
+            assert_type_or_raise(entities, None, list, parameter_name="entities")
+            assert_type_or_raise(animation, None, Animation, parameter_name="animation")
+            assert_type_or_raise(audio, None, Audio, parameter_name="audio")
+            assert_type_or_raise(document, None, Document, parameter_name="document")
+            assert_type_or_raise(photo, None, list, parameter_name="photo")
+            assert_type_or_raise(sticker, None, Sticker, parameter_name="sticker")
+            assert_type_or_raise(video, None, Video, parameter_name="video")
+            assert_type_or_raise(video_note, None, VideoNote, parameter_name="video_note")
+            assert_type_or_raise(voice, None, Voice, parameter_name="voice")
+            assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
+            assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
+            assert_type_or_raise(contact, None, Contact, parameter_name="contact")
+            assert_type_or_raise(dice, None, Dice, parameter_name="dice")
+            assert_type_or_raise(game, None, Game, parameter_name="game")
+            assert_type_or_raise(poll, None, Poll, parameter_name="poll")
+            assert_type_or_raise(venue, None, Venue, parameter_name="venue")
+            assert_type_or_raise(location, None, Location, parameter_name="location")
+            assert_type_or_raise(new_chat_members, None, list, parameter_name="new_chat_members")
+            assert_type_or_raise(left_chat_member, None, User, parameter_name="left_chat_member")
+            assert_type_or_raise(new_chat_title, None, unicode_type, parameter_name="new_chat_title")
+            assert_type_or_raise(new_chat_photo, None, list, parameter_name="new_chat_photo")
+            assert_type_or_raise(delete_chat_photo, None, bool, parameter_name="delete_chat_photo")
+            assert_type_or_raise(group_chat_created, None, bool, parameter_name="group_chat_created")
+            assert_type_or_raise(supergroup_chat_created, None, bool, parameter_name="supergroup_chat_created")
+            assert_type_or_raise(channel_chat_created, None, bool, parameter_name="channel_chat_created")
+            assert_type_or_raise(message_auto_delete_timer_changed, None, MessageAutoDeleteTimerChanged, parameter_name="message_auto_delete_timer_changed")
+            assert_type_or_raise(migrate_to_chat_id, None, int, parameter_name="migrate_to_chat_id")
+            assert_type_or_raise(migrate_from_chat_id, None, int, parameter_name="migrate_from_chat_id")
+            assert_type_or_raise(pinned_message, None, Message, parameter_name="pinned_message")
+            assert_type_or_raise(invoice, None, Invoice, parameter_name="invoice")
+            assert_type_or_raise(successful_payment, None, SuccessfulPayment, parameter_name="successful_payment")
+            assert_type_or_raise(connected_website, None, unicode_type, parameter_name="connected_website")
+            assert_type_or_raise(passport_data, None, PassportData, parameter_name="passport_data")
+            assert_type_or_raise(proximity_alert_triggered, None, ProximityAlertTriggered, parameter_name="proximity_alert_triggered")
+            assert_type_or_raise(voice_chat_scheduled, None, VoiceChatScheduled, parameter_name="voice_chat_scheduled")
+            assert_type_or_raise(voice_chat_started, None, VoiceChatStarted, parameter_name="voice_chat_started")
+            assert_type_or_raise(voice_chat_ended, None, VoiceChatEnded, parameter_name="voice_chat_ended")
+            assert_type_or_raise(voice_chat_participants_invited, None, VoiceChatParticipantsInvited, parameter_name="voice_chat_participants_invited")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+        # end if
         self.message_id = message_id
-        assert_type_or_raise(date, int, parameter_name="date")
         self.date = date
-        assert_type_or_raise(chat, Chat, parameter_name="chat")
         self.chat = chat
-        assert_type_or_raise(from_peer, None, User, parameter_name="from_peer")
         self.from_peer = from_peer
-        assert_type_or_raise(sender_chat, None, Chat, parameter_name="sender_chat")
         self.sender_chat = sender_chat
-        assert_type_or_raise(forward_from, None, User, parameter_name="forward_from")
         self.forward_from = forward_from
-        assert_type_or_raise(forward_from_chat, None, Chat, parameter_name="forward_from_chat")
         self.forward_from_chat = forward_from_chat
-        assert_type_or_raise(forward_from_message_id, None, int, parameter_name="forward_from_message_id")
         self.forward_from_message_id = forward_from_message_id
-        assert_type_or_raise(forward_signature, None, unicode_type, parameter_name="forward_signature")
         self.forward_signature = forward_signature
-        assert_type_or_raise(forward_sender_name, None, unicode_type, parameter_name="forward_sender_name")
         self.forward_sender_name = forward_sender_name
-        assert_type_or_raise(forward_date, None, int, parameter_name="forward_date")
         self.forward_date = forward_date
-        assert_type_or_raise(is_automatic_forward, None, bool, parameter_name="is_automatic_forward")
         self.is_automatic_forward = is_automatic_forward
-        assert_type_or_raise(reply_to_message, None, Message, parameter_name="reply_to_message")
         self.reply_to_message = reply_to_message
-        assert_type_or_raise(via_bot, None, User, parameter_name="via_bot")
         self.via_bot = via_bot
-        assert_type_or_raise(edit_date, None, int, parameter_name="edit_date")
         self.edit_date = edit_date
-        assert_type_or_raise(has_protected_content, None, bool, parameter_name="has_protected_content")
         self.has_protected_content = has_protected_content
-        assert_type_or_raise(media_group_id, None, unicode_type, parameter_name="media_group_id")
         self.media_group_id = media_group_id
-        assert_type_or_raise(author_signature, None, unicode_type, parameter_name="author_signature")
         self.author_signature = author_signature
-        assert_type_or_raise(text, None, unicode_type, parameter_name="text")
         self.text = text
-        assert_type_or_raise(entities, None, list, parameter_name="entities")
         self.entities = entities
-        assert_type_or_raise(animation, None, Animation, parameter_name="animation")
         self.animation = animation
-        assert_type_or_raise(audio, None, Audio, parameter_name="audio")
         self.audio = audio
-        assert_type_or_raise(document, None, Document, parameter_name="document")
         self.document = document
-        assert_type_or_raise(photo, None, list, parameter_name="photo")
         self.photo = photo
-        assert_type_or_raise(sticker, None, Sticker, parameter_name="sticker")
         self.sticker = sticker
-        assert_type_or_raise(video, None, Video, parameter_name="video")
         self.video = video
-        assert_type_or_raise(video_note, None, VideoNote, parameter_name="video_note")
         self.video_note = video_note
-        assert_type_or_raise(voice, None, Voice, parameter_name="voice")
         self.voice = voice
-        assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
         self.caption = caption
-        assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
         self.caption_entities = caption_entities
-        assert_type_or_raise(contact, None, Contact, parameter_name="contact")
         self.contact = contact
-        assert_type_or_raise(dice, None, Dice, parameter_name="dice")
         self.dice = dice
-        assert_type_or_raise(game, None, Game, parameter_name="game")
         self.game = game
-        assert_type_or_raise(poll, None, Poll, parameter_name="poll")
         self.poll = poll
-        assert_type_or_raise(venue, None, Venue, parameter_name="venue")
         self.venue = venue
-        assert_type_or_raise(location, None, Location, parameter_name="location")
         self.location = location
-        assert_type_or_raise(new_chat_members, None, list, parameter_name="new_chat_members")
         self.new_chat_members = new_chat_members
-        assert_type_or_raise(left_chat_member, None, User, parameter_name="left_chat_member")
         self.left_chat_member = left_chat_member
-        assert_type_or_raise(new_chat_title, None, unicode_type, parameter_name="new_chat_title")
         self.new_chat_title = new_chat_title
-        assert_type_or_raise(new_chat_photo, None, list, parameter_name="new_chat_photo")
         self.new_chat_photo = new_chat_photo
-        assert_type_or_raise(delete_chat_photo, None, bool, parameter_name="delete_chat_photo")
         self.delete_chat_photo = delete_chat_photo
-        assert_type_or_raise(group_chat_created, None, bool, parameter_name="group_chat_created")
         self.group_chat_created = group_chat_created
-        assert_type_or_raise(supergroup_chat_created, None, bool, parameter_name="supergroup_chat_created")
         self.supergroup_chat_created = supergroup_chat_created
-        assert_type_or_raise(channel_chat_created, None, bool, parameter_name="channel_chat_created")
         self.channel_chat_created = channel_chat_created
-        assert_type_or_raise(message_auto_delete_timer_changed, None, MessageAutoDeleteTimerChanged, parameter_name="message_auto_delete_timer_changed")
         self.message_auto_delete_timer_changed = message_auto_delete_timer_changed
-        assert_type_or_raise(migrate_to_chat_id, None, int, parameter_name="migrate_to_chat_id")
         self.migrate_to_chat_id = migrate_to_chat_id
-        assert_type_or_raise(migrate_from_chat_id, None, int, parameter_name="migrate_from_chat_id")
         self.migrate_from_chat_id = migrate_from_chat_id
-        assert_type_or_raise(pinned_message, None, Message, parameter_name="pinned_message")
         self.pinned_message = pinned_message
-        assert_type_or_raise(invoice, None, Invoice, parameter_name="invoice")
         self.invoice = invoice
-        assert_type_or_raise(successful_payment, None, SuccessfulPayment, parameter_name="successful_payment")
         self.successful_payment = successful_payment
-        assert_type_or_raise(connected_website, None, unicode_type, parameter_name="connected_website")
         self.connected_website = connected_website
-        assert_type_or_raise(passport_data, None, PassportData, parameter_name="passport_data")
         self.passport_data = passport_data
-        assert_type_or_raise(proximity_alert_triggered, None, ProximityAlertTriggered, parameter_name="proximity_alert_triggered")
         self.proximity_alert_triggered = proximity_alert_triggered
-        assert_type_or_raise(voice_chat_scheduled, None, VoiceChatScheduled, parameter_name="voice_chat_scheduled")
         self.voice_chat_scheduled = voice_chat_scheduled
-        assert_type_or_raise(voice_chat_started, None, VoiceChatStarted, parameter_name="voice_chat_started")
         self.voice_chat_started = voice_chat_started
-        assert_type_or_raise(voice_chat_ended, None, VoiceChatEnded, parameter_name="voice_chat_ended")
         self.voice_chat_ended = voice_chat_ended
-        assert_type_or_raise(voice_chat_participants_invited, None, VoiceChatParticipantsInvited, parameter_name="voice_chat_participants_invited")
         self.voice_chat_participants_invited = voice_chat_participants_invited
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this Message to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .media import Animation
-        from .media import Audio
-        from .media import Contact
-        from .media import Dice
-        from .media import Document
-        from .media import Game
-        from .media import Location
-        from .media import MessageEntity
-        from .media import PhotoSize
-        from .media import Poll
-        from .media import Sticker
-        from .media import Venue
-        from .media import Video
-        from .media import VideoNote
-        from .media import Voice
-        from .passport import PassportData
-        from .payments import Invoice
-        from .payments import SuccessfulPayment
-        from .peer import Chat
-        from .peer import User
-        from .service import MessageAutoDeleteTimerChanged
-        from .service import ProximityAlertTriggered
-        from .service import VoiceChatEnded
-        from .service import VoiceChatParticipantsInvited
-        from .service import VoiceChatScheduled
-        from .service import VoiceChatStarted
-        from ..sendable.reply_markup import InlineKeyboardMarkup
-        array = super(Message, self).to_array()
-
-        array['message_id'] = int(self.message_id)  # type int
-        array['date'] = int(self.date)  # type int
-        array['chat'] = self.chat.to_array()  # type Chat
-        if self.from_peer is not None:
-            array['from'] = self.from_peer.to_array()  # type User
-        # end if
-        if self.sender_chat is not None:
-            array['sender_chat'] = self.sender_chat.to_array()  # type Chat
-        # end if
-        if self.forward_from is not None:
-            array['forward_from'] = self.forward_from.to_array()  # type User
-        # end if
-        if self.forward_from_chat is not None:
-            array['forward_from_chat'] = self.forward_from_chat.to_array()  # type Chat
-        # end if
-        if self.forward_from_message_id is not None:
-            array['forward_from_message_id'] = int(self.forward_from_message_id)  # type int
-        # end if
-        if self.forward_signature is not None:
-            array['forward_signature'] = u(self.forward_signature)  # py2: type unicode, py3: type str
-        # end if
-        if self.forward_sender_name is not None:
-            array['forward_sender_name'] = u(self.forward_sender_name)  # py2: type unicode, py3: type str
-        # end if
-        if self.forward_date is not None:
-            array['forward_date'] = int(self.forward_date)  # type int
-        # end if
-        if self.is_automatic_forward is not None:
-            array['is_automatic_forward'] = bool(self.is_automatic_forward)  # type bool
-        # end if
-        if self.reply_to_message is not None:
-            array['reply_to_message'] = self.reply_to_message.to_array()  # type Message
-        # end if
-        if self.via_bot is not None:
-            array['via_bot'] = self.via_bot.to_array()  # type User
-        # end if
-        if self.edit_date is not None:
-            array['edit_date'] = int(self.edit_date)  # type int
-        # end if
-        if self.has_protected_content is not None:
-            array['has_protected_content'] = bool(self.has_protected_content)  # type bool
-        # end if
-        if self.media_group_id is not None:
-            array['media_group_id'] = u(self.media_group_id)  # py2: type unicode, py3: type str
-        # end if
-        if self.author_signature is not None:
-            array['author_signature'] = u(self.author_signature)  # py2: type unicode, py3: type str
-        # end if
-        if self.text is not None:
-            array['text'] = u(self.text)  # py2: type unicode, py3: type str
-        # end if
-        if self.entities is not None:
-            array['entities'] = self._as_array(self.entities)  # type list of MessageEntity
-        # end if
-        if self.animation is not None:
-            array['animation'] = self.animation.to_array()  # type Animation
-        # end if
-        if self.audio is not None:
-            array['audio'] = self.audio.to_array()  # type Audio
-        # end if
-        if self.document is not None:
-            array['document'] = self.document.to_array()  # type Document
-        # end if
-        if self.photo is not None:
-            array['photo'] = self._as_array(self.photo)  # type list of PhotoSize
-        # end if
-        if self.sticker is not None:
-            array['sticker'] = self.sticker.to_array()  # type Sticker
-        # end if
-        if self.video is not None:
-            array['video'] = self.video.to_array()  # type Video
-        # end if
-        if self.video_note is not None:
-            array['video_note'] = self.video_note.to_array()  # type VideoNote
-        # end if
-        if self.voice is not None:
-            array['voice'] = self.voice.to_array()  # type Voice
-        # end if
-        if self.caption is not None:
-            array['caption'] = u(self.caption)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption_entities is not None:
-            array['caption_entities'] = self._as_array(self.caption_entities)  # type list of MessageEntity
-        # end if
-        if self.contact is not None:
-            array['contact'] = self.contact.to_array()  # type Contact
-        # end if
-        if self.dice is not None:
-            array['dice'] = self.dice.to_array()  # type Dice
-        # end if
-        if self.game is not None:
-            array['game'] = self.game.to_array()  # type Game
-        # end if
-        if self.poll is not None:
-            array['poll'] = self.poll.to_array()  # type Poll
-        # end if
-        if self.venue is not None:
-            array['venue'] = self.venue.to_array()  # type Venue
-        # end if
-        if self.location is not None:
-            array['location'] = self.location.to_array()  # type Location
-        # end if
-        if self.new_chat_members is not None:
-            array['new_chat_members'] = self._as_array(self.new_chat_members)  # type list of User
-        # end if
-        if self.left_chat_member is not None:
-            array['left_chat_member'] = self.left_chat_member.to_array()  # type User
-        # end if
-        if self.new_chat_title is not None:
-            array['new_chat_title'] = u(self.new_chat_title)  # py2: type unicode, py3: type str
-        # end if
-        if self.new_chat_photo is not None:
-            array['new_chat_photo'] = self._as_array(self.new_chat_photo)  # type list of PhotoSize
-        # end if
-        if self.delete_chat_photo is not None:
-            array['delete_chat_photo'] = bool(self.delete_chat_photo)  # type bool
-        # end if
-        if self.group_chat_created is not None:
-            array['group_chat_created'] = bool(self.group_chat_created)  # type bool
-        # end if
-        if self.supergroup_chat_created is not None:
-            array['supergroup_chat_created'] = bool(self.supergroup_chat_created)  # type bool
-        # end if
-        if self.channel_chat_created is not None:
-            array['channel_chat_created'] = bool(self.channel_chat_created)  # type bool
-        # end if
-        if self.message_auto_delete_timer_changed is not None:
-            array['message_auto_delete_timer_changed'] = self.message_auto_delete_timer_changed.to_array()  # type MessageAutoDeleteTimerChanged
-        # end if
-        if self.migrate_to_chat_id is not None:
-            array['migrate_to_chat_id'] = int(self.migrate_to_chat_id)  # type int
-        # end if
-        if self.migrate_from_chat_id is not None:
-            array['migrate_from_chat_id'] = int(self.migrate_from_chat_id)  # type int
-        # end if
-        if self.pinned_message is not None:
-            array['pinned_message'] = self.pinned_message.to_array()  # type Message
-        # end if
-        if self.invoice is not None:
-            array['invoice'] = self.invoice.to_array()  # type Invoice
-        # end if
-        if self.successful_payment is not None:
-            array['successful_payment'] = self.successful_payment.to_array()  # type SuccessfulPayment
-        # end if
-        if self.connected_website is not None:
-            array['connected_website'] = u(self.connected_website)  # py2: type unicode, py3: type str
-        # end if
-        if self.passport_data is not None:
-            array['passport_data'] = self.passport_data.to_array()  # type PassportData
-        # end if
-        if self.proximity_alert_triggered is not None:
-            array['proximity_alert_triggered'] = self.proximity_alert_triggered.to_array()  # type ProximityAlertTriggered
-        # end if
-        if self.voice_chat_scheduled is not None:
-            array['voice_chat_scheduled'] = self.voice_chat_scheduled.to_array()  # type VoiceChatScheduled
-        # end if
-        if self.voice_chat_started is not None:
-            array['voice_chat_started'] = self.voice_chat_started.to_array()  # type VoiceChatStarted
-        # end if
-        if self.voice_chat_ended is not None:
-            array['voice_chat_ended'] = self.voice_chat_ended.to_array()  # type VoiceChatEnded
-        # end if
-        if self.voice_chat_participants_invited is not None:
-            array['voice_chat_participants_invited'] = self.voice_chat_participants_invited.to_array()  # type VoiceChatParticipantsInvited
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1549,39 +1370,146 @@ class Message(UpdateType):
         if not array:  # None or {}
             return None
         # end if
+        if Message._is_parsing_lazily():
+            return Message._from_array_lazily(array)
+        # end if
+        if not Message._must_validate(array):
+            return Message._from_array_trusted(array)
+        # end if
 
         data = Message.validate_array(array)
         data['_raw'] = array
         return Message(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(message_instance)`
-        """
-        return "Message(message_id={self.message_id!r}, date={self.date!r}, chat={self.chat!r}, from_peer={self.from_peer!r}, sender_chat={self.sender_chat!r}, forward_from={self.forward_from!r}, forward_from_chat={self.forward_from_chat!r}, forward_from_message_id={self.forward_from_message_id!r}, forward_signature={self.forward_signature!r}, forward_sender_name={self.forward_sender_name!r}, forward_date={self.forward_date!r}, is_automatic_forward={self.is_automatic_forward!r}, reply_to_message={self.reply_to_message!r}, via_bot={self.via_bot!r}, edit_date={self.edit_date!r}, has_protected_content={self.has_protected_content!r}, media_group_id={self.media_group_id!r}, author_signature={self.author_signature!r}, text={self.text!r}, entities={self.entities!r}, animation={self.animation!r}, audio={self.audio!r}, document={self.document!r}, photo={self.photo!r}, sticker={self.sticker!r}, video={self.video!r}, video_note={self.video_note!r}, voice={self.voice!r}, caption={self.caption!r}, caption_entities={self.caption_entities!r}, contact={self.contact!r}, dice={self.dice!r}, game={self.game!r}, poll={self.poll!r}, venue={self.venue!r}, location={self.location!r}, new_chat_members={self.new_chat_members!r}, left_chat_member={self.left_chat_member!r}, new_chat_title={self.new_chat_title!r}, new_chat_photo={self.new_chat_photo!r}, delete_chat_photo={self.delete_chat_photo!r}, group_chat_created={self.group_chat_created!r}, supergroup_chat_created={self.supergroup_chat_created!r}, channel_chat_created={self.channel_chat_created!r}, message_auto_delete_timer_changed={self.message_auto_delete_timer_changed!r}, migrate_to_chat_id={self.migrate_to_chat_id!r}, migrate_from_chat_id={self.migrate_from_chat_id!r}, pinned_message={self.pinned_message!r}, invoice={self.invoice!r}, successful_payment={self.successful_payment!r}, connected_website={self.connected_website!r}, passport_data={self.passport_data!r}, proximity_alert_triggered={self.proximity_alert_triggered!r}, voice_chat_scheduled={self.voice_chat_scheduled!r}, voice_chat_started={self.voice_chat_started!r}, voice_chat_ended={self.voice_chat_ended!r}, voice_chat_participants_invited={self.voice_chat_participants_invited!r}, reply_markup={self.reply_markup!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(message_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "Message.from_array({self._raw})".format(self=self)
-        # end if
-        return "Message(message_id={self.message_id!r}, date={self.date!r}, chat={self.chat!r}, from_peer={self.from_peer!r}, sender_chat={self.sender_chat!r}, forward_from={self.forward_from!r}, forward_from_chat={self.forward_from_chat!r}, forward_from_message_id={self.forward_from_message_id!r}, forward_signature={self.forward_signature!r}, forward_sender_name={self.forward_sender_name!r}, forward_date={self.forward_date!r}, is_automatic_forward={self.is_automatic_forward!r}, reply_to_message={self.reply_to_message!r}, via_bot={self.via_bot!r}, edit_date={self.edit_date!r}, has_protected_content={self.has_protected_content!r}, media_group_id={self.media_group_id!r}, author_signature={self.author_signature!r}, text={self.text!r}, entities={self.entities!r}, animation={self.animation!r}, audio={self.audio!r}, document={self.document!r}, photo={self.photo!r}, sticker={self.sticker!r}, video={self.video!r}, video_note={self.video_note!r}, voice={self.voice!r}, caption={self.caption!r}, caption_entities={self.caption_entities!r}, contact={self.contact!r}, dice={self.dice!r}, game={self.game!r}, poll={self.poll!r}, venue={self.venue!r}, location={self.location!r}, new_chat_members={self.new_chat_members!r}, left_chat_member={self.left_chat_member!r}, new_chat_title={self.new_chat_title!r}, new_chat_photo={self.new_chat_photo!r}, delete_chat_photo={self.delete_chat_photo!r}, group_chat_created={self.group_chat_created!r}, supergroup_chat_created={self.supergroup_chat_created!r}, channel_chat_created={self.channel_chat_created!r}, message_auto_delete_timer_changed={self.message_auto_delete_timer_changed!r}, migrate_to_chat_id={self.migrate_to_chat_id!r}, migrate_from_chat_id={self.migrate_from_chat_id!r}, pinned_message={self.pinned_message!r}, invoice={self.invoice!r}, successful_payment={self.successful_payment!r}, connected_website={self.connected_website!r}, passport_data={self.passport_data!r}, proximity_alert_triggered={self.proximity_alert_triggered!r}, voice_chat_scheduled={self.voice_chat_scheduled!r}, voice_chat_started={self.voice_chat_started!r}, voice_chat_ended={self.voice_chat_ended!r}, voice_chat_participants_invited={self.voice_chat_participants_invited!r}, reply_markup={self.reply_markup!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the Message without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in message_instance`
+        :return: new Message instance.
+        :rtype: Message
         """
-        return (
-            key in ["message_id", "date", "chat", "from_peer", "sender_chat", "forward_from", "forward_from_chat", "forward_from_message_id", "forward_signature", "forward_sender_name", "forward_date", "is_automatic_forward", "reply_to_message", "via_bot", "edit_date", "has_protected_content", "media_group_id", "author_signature", "text", "entities", "animation", "audio", "document", "photo", "sticker", "video", "video_note", "voice", "caption", "caption_entities", "contact", "dice", "game", "poll", "venue", "location", "new_chat_members", "left_chat_member", "new_chat_title", "new_chat_photo", "delete_chat_photo", "group_chat_created", "supergroup_chat_created", "channel_chat_created", "message_auto_delete_timer_changed", "migrate_to_chat_id", "migrate_from_chat_id", "pinned_message", "invoice", "successful_payment", "connected_website", "passport_data", "proximity_alert_triggered", "voice_chat_scheduled", "voice_chat_started", "voice_chat_ended", "voice_chat_participants_invited", "reply_markup"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = Message._set_field
+        instance = Message.__new__(Message)
+        set_field(instance, 'message_id', int(get('message_id')))
+        set_field(instance, 'date', int(get('date')))
+        set_field(instance, 'chat', Chat.from_array(get('chat')))
+        value = get('from')
+        set_field(instance, 'from_peer', User.from_array(value) if value is not None else None)
+        value = get('sender_chat')
+        set_field(instance, 'sender_chat', Chat.from_array(value) if value is not None else None)
+        value = get('forward_from')
+        set_field(instance, 'forward_from', User.from_array(value) if value is not None else None)
+        value = get('forward_from_chat')
+        set_field(instance, 'forward_from_chat', Chat.from_array(value) if value is not None else None)
+        value = get('forward_from_message_id')
+        set_field(instance, 'forward_from_message_id', int(value) if value is not None else None)
+        value = get('forward_signature')
+        set_field(instance, 'forward_signature', u(value) if value is not None else None)
+        value = get('forward_sender_name')
+        set_field(instance, 'forward_sender_name', u(value) if value is not None else None)
+        value = get('forward_date')
+        set_field(instance, 'forward_date', int(value) if value is not None else None)
+        value = get('is_automatic_forward')
+        set_field(instance, 'is_automatic_forward', bool(value) if value is not None else None)
+        value = get('reply_to_message')
+        set_field(instance, 'reply_to_message', Message.from_array(value) if value is not None else None)
+        value = get('via_bot')
+        set_field(instance, 'via_bot', User.from_array(value) if value is not None else None)
+        value = get('edit_date')
+        set_field(instance, 'edit_date', int(value) if value is not None else None)
+        value = get('has_protected_content')
+        set_field(instance, 'has_protected_content', bool(value) if value is not None else None)
+        value = get('media_group_id')
+        set_field(instance, 'media_group_id', u(value) if value is not None else None)
+        value = get('author_signature')
+        set_field(instance, 'author_signature', u(value) if value is not None else None)
+        value = get('text')
+        set_field(instance, 'text', u(value) if value is not None else None)
+        value = get('entities')
+        set_field(instance, 'entities', MessageEntity.from_array_list(value, list_level=1) if value is not None else None)
+        value = get('animation')
+        set_field(instance, 'animation', Animation.from_array(value) if value is not None else None)
+        value = get('audio')
+        set_field(instance, 'audio', Audio.from_array(value) if value is not None else None)
+        value = get('document')
+        set_field(instance, 'document', Document.from_array(value) if value is not None else None)
+        value = get('photo')
+        set_field(instance, 'photo', PhotoSize.from_array_list(value, list_level=1) if value is not None else None)
+        value = get('sticker')
+        set_field(instance, 'sticker', Sticker.from_array(value) if value is not None else None)
+        value = get('video')
+        set_field(instance, 'video', Video.from_array(value) if value is not None else None)
+        value = get('video_note')
+        set_field(instance, 'video_note', VideoNote.from_array(value) if value is not None else None)
+        value = get('voice')
+        set_field(instance, 'voice', Voice.from_array(value) if value is not None else None)
+        value = get('caption')
+        set_field(instance, 'caption', u(value) if value is not None else None)
+        value = get('caption_entities')
+        set_field(instance, 'caption_entities', MessageEntity.from_array_list(value, list_level=1) if value is not None else None)
+        value = get('contact')
+        set_field(instance, 'contact', Contact.from_array(value) if value is not None else None)
+        value = get('dice')
+        set_field(instance, 'dice', Dice.from_array(value) if value is not None else None)
+        value = get('game')
+        set_field(instance, 'game', Game.from_array(value) if value is not None else None)
+        value = get('poll')
+        set_field(instance, 'poll', Poll.from_array(value) if value is not None else None)
+        value = get('venue')
+        set_field(instance, 'venue', Venue.from_array(value) if value is not None else None)
+        value = get('location')
+        set_field(instance, 'location', Location.from_array(value) if value is not None else None)
+        value = get('new_chat_members')
+        set_field(instance, 'new_chat_members', User.from_array_list(value, list_level=1) if value is not None else None)
+        value = get('left_chat_member')
+        set_field(instance, 'left_chat_member', User.from_array(value) if value is not None else None)
+        value = get('new_chat_title')
+        set_field(instance, 'new_chat_title', u(value) if value is not None else None)
+        value = get('new_chat_photo')
+        set_field(instance, 'new_chat_photo', PhotoSize.from_array_list(value, list_level=1) if value is not None else None)
+        value = get('delete_chat_photo')
+        set_field(instance, 'delete_chat_photo', bool(value) if value is not None else None)
+        value = get('group_chat_created')
+        set_field(instance, 'group_chat_created', bool(value) if value is not None else None)
+        value = get('supergroup_chat_created')
+        set_field(instance, 'supergroup_chat_created', bool(value) if value is not None else None)
+        value = get('channel_chat_created')
+        set_field(instance, 'channel_chat_created', bool(value) if value is not None else None)
+        value = get('message_auto_delete_timer_changed')
+        set_field(instance, 'message_auto_delete_timer_changed', MessageAutoDeleteTimerChanged.from_array(value) if value is not None else None)
+        value = get('migrate_to_chat_id')
+        set_field(instance, 'migrate_to_chat_id', int(value) if value is not None else None)
+        value = get('migrate_from_chat_id')
+        set_field(instance, 'migrate_from_chat_id', int(value) if value is not None else None)
+        value = get('pinned_message')
+        set_field(instance, 'pinned_message', Message.from_array(value) if value is not None else None)
+        value = get('invoice')
+        set_field(instance, 'invoice', Invoice.from_array(value) if value is not None else None)
+        value = get('successful_payment')
+        set_field(instance, 'successful_payment', SuccessfulPayment.from_array(value) if value is not None else None)
+        value = get('connected_website')
+        set_field(instance, 'connected_website', u(value) if value is not None else None)
+        value = get('passport_data')
+        set_field(instance, 'passport_data', PassportData.from_array(value) if value is not None else None)
+        value = get('proximity_alert_triggered')
+        set_field(instance, 'proximity_alert_triggered', ProximityAlertTriggered.from_array(value) if value is not None else None)
+        value = get('voice_chat_scheduled')
+        set_field(instance, 'voice_chat_scheduled', VoiceChatScheduled.from_array(value) if value is not None else None)
+        value = get('voice_chat_started')
+        set_field(instance, 'voice_chat_started', VoiceChatStarted.from_array(value) if value is not None else None)
+        value = get('voice_chat_ended')
+        set_field(instance, 'voice_chat_ended', VoiceChatEnded.from_array(value) if value is not None else None)
+        value = get('voice_chat_participants_invited')
+        set_field(instance, 'voice_chat_participants_invited', VoiceChatParticipantsInvited.from_array(value) if value is not None else None)
+        value = get('reply_markup')
+        set_field(instance, 'reply_markup', InlineKeyboardMarkup.from_array(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class Message
 
 
@@ -1631,6 +1559,20 @@ class CallbackQuery(UpdateType):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('id', 'from_peer', 'chat_instance', 'message', 'inline_message_id', 'data', 'game_short_name')
+    _fields = ('id', 'from_peer', 'chat_instance', 'message', 'inline_message_id', 'data', 'game_short_name')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _api_names = {'from_peer': 'from'}  # the fields with a different name in the api data.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('id', 'id', u, False),
+        ('from_peer', 'from', None, False),
+        ('chat_instance', 'chat_instance', u, False),
+        ('message', 'message', None, True),
+        ('inline_message_id', 'inline_message_id', u, True),
+        ('data', 'data', u, True),
+        ('game_short_name', 'game_short_name', u, True),
+    )
+
     def __init__(self, id, from_peer, chat_instance, message=None, inline_message_id=None, data=None, game_short_name=None, _raw=None):
         """
         This object represents an incoming callback query from a callback button in an inline keyboard.
@@ -1677,60 +1619,27 @@ class CallbackQuery(UpdateType):
         :type  _raw: None | dict
         """
         super(CallbackQuery, self).__init__()
-        from .peer import User
-        assert_type_or_raise(id, unicode_type, parameter_name="id")
+        if self._must_validate(_raw):
+            from .peer import User
+            assert_type_or_raise(id, unicode_type, parameter_name="id")
+            assert_type_or_raise(from_peer, User, parameter_name="from_peer")
+            assert_type_or_raise(chat_instance, unicode_type, parameter_name="chat_instance")
+            assert_type_or_raise(message, None, Message, parameter_name="message")
+            assert_type_or_raise(inline_message_id, None, unicode_type, parameter_name="inline_message_id")
+            assert_type_or_raise(data, None, unicode_type, parameter_name="data")
+            assert_type_or_raise(game_short_name, None, unicode_type, parameter_name="game_short_name")
+        # end if
         self.id = id
-        assert_type_or_raise(from_peer, User, parameter_name="from_peer")
         self.from_peer = from_peer
-        assert_type_or_raise(chat_instance, unicode_type, parameter_name="chat_instance")
         self.chat_instance = chat_instance
-        assert_type_or_raise(message, None, Message, parameter_name="message")
         self.message = message
-        assert_type_or_raise(inline_message_id, None, unicode_type, parameter_name="inline_message_id")
         self.inline_message_id = inline_message_id
-        assert_type_or_raise(data, None, unicode_type, parameter_name="data")
         self.data = data
-        assert_type_or_raise(game_short_name, None, unicode_type, parameter_name="game_short_name")
         self.game_short_name = game_short_name
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this CallbackQuery to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .peer import User
-        array = super(CallbackQuery, self).to_array()
-
-        array['id'] = u(self.id)  # py2: type unicode, py3: type str
-        array['from'] = self.from_peer.to_array()  # type User
-        array['chat_instance'] = u(self.chat_instance)  # py2: type unicode, py3: type str
-        if self.message is not None:
-            array['message'] = self.message.to_array()  # type Message
-        # end if
-        if self.inline_message_id is not None:
-            array['inline_message_id'] = u(self.inline_message_id)  # py2: type unicode, py3: type str
-        # end if
-        if self.data is not None:
-            array['data'] = u(self.data)  # py2: type unicode, py3: type str
-        # end if
-        if self.game_short_name is not None:
-            array['game_short_name'] = u(self.game_short_name)  # py2: type unicode, py3: type str
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1763,39 +1672,44 @@ class CallbackQuery(UpdateType):
         if not array:  # None or {}
             return None
         # end if
+        if CallbackQuery._is_parsing_lazily():
+            return CallbackQuery._from_array_lazily(array)
+        # end if
+        if not CallbackQuery._must_validate(array):
+            return CallbackQuery._from_array_trusted(array)
+        # end if
 
         data = CallbackQuery.validate_array(array)
         data['_raw'] = array
         return CallbackQuery(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(callbackquery_instance)`
-        """
-        return "CallbackQuery(id={self.id!r}, from_peer={self.from_peer!r}, chat_instance={self.chat_instance!r}, message={self.message!r}, inline_message_id={self.inline_message_id!r}, data={self.data!r}, game_short_name={self.game_short_name!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(callbackquery_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "CallbackQuery.from_array({self._raw})".format(self=self)
-        # end if
-        return "CallbackQuery(id={self.id!r}, from_peer={self.from_peer!r}, chat_instance={self.chat_instance!r}, message={self.message!r}, inline_message_id={self.inline_message_id!r}, data={self.data!r}, game_short_name={self.game_short_name!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the CallbackQuery without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in callbackquery_instance`
+        :return: new CallbackQuery instance.
+        :rtype: CallbackQuery
         """
-        return (
-            key in ["id", "from_peer", "chat_instance", "message", "inline_message_id", "data", "game_short_name"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = CallbackQuery._set_field
+        instance = CallbackQuery.__new__(CallbackQuery)
+        set_field(instance, 'id', u(get('id')))
+        set_field(instance, 'from_peer', User.from_array(get('from')))
+        set_field(instance, 'chat_instance', u(get('chat_instance')))
+        value = get('message')
+        set_field(instance, 'message', Message.from_array(value) if value is not None else None)
+        value = get('inline_message_id')
+        set_field(instance, 'inline_message_id', u(value) if value is not None else None)
+        value = get('data')
+        set_field(instance, 'data', u(value) if value is not None else None)
+        value = get('game_short_name')
+        set_field(instance, 'game_short_name', u(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class CallbackQuery
 
 
@@ -1819,6 +1733,14 @@ class ResponseParameters(Receivable):
     :type  _raw: None | dict
     """
 
+    __slots__ = ('migrate_to_chat_id', 'retry_after')
+    _fields = ('migrate_to_chat_id', 'retry_after')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('migrate_to_chat_id', 'migrate_to_chat_id', int, True),
+        ('retry_after', 'retry_after', int, True),
+    )
+
     def __init__(self, migrate_to_chat_id=None, retry_after=None, _raw=None):
         """
         Contains information about why a request was unsuccessful.
@@ -1839,39 +1761,16 @@ class ResponseParameters(Receivable):
         :type  _raw: None | dict
         """
         super(ResponseParameters, self).__init__()
-        assert_type_or_raise(migrate_to_chat_id, None, int, parameter_name="migrate_to_chat_id")
+        if self._must_validate(_raw):
+            assert_type_or_raise(migrate_to_chat_id, None, int, parameter_name="migrate_to_chat_id")
+            assert_type_or_raise(retry_after, None, int, parameter_name="retry_after")
+        # end if
         self.migrate_to_chat_id = migrate_to_chat_id
-        assert_type_or_raise(retry_after, None, int, parameter_name="retry_after")
         self.retry_after = retry_after
 
         self._raw = _raw
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ResponseParameters to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ResponseParameters, self).to_array()
-
-        if self.migrate_to_chat_id is not None:
-            array['migrate_to_chat_id'] = int(self.migrate_to_chat_id)  # type int
-        # end if
-        if self.retry_after is not None:
-            array['retry_after'] = int(self.retry_after)  # type int
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1898,37 +1797,72 @@ class ResponseParameters(Receivable):
         if not array:  # None or {}
             return None
         # end if
+        if ResponseParameters._is_parsing_lazily():
+            return ResponseParameters._from_array_lazily(array)
+        # end if
+        if not ResponseParameters._must_validate(array):
+            return ResponseParameters._from_array_trusted(array)
+        # end if
 
         data = ResponseParameters.validate_array(array)
         data['_raw'] = array
         return ResponseParameters(**data)
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(responseparameters_instance)`
-        """
-        return "ResponseParameters(migrate_to_chat_id={self.migrate_to_chat_id!r}, retry_after={self.retry_after!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(responseparameters_instance)`
+    @staticmethod
+    def _from_array_trusted(array):
         """
-        if self._raw:
-            return "ResponseParameters.from_array({self._raw})".format(self=self)
-        # end if
-        return "ResponseParameters(migrate_to_chat_id={self.migrate_to_chat_id!r}, retry_after={self.retry_after!r})".format(self=self)
-    # end def __repr__
+        Single pass version of :meth:`from_array`, building the ResponseParameters without any checks.
+        Used for data which needs none, see :func:`pytgbot.api_types.set_validation_mode`.
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in responseparameters_instance`
+        :return: new ResponseParameters instance.
+        :rtype: ResponseParameters
         """
-        return (
-            key in ["migrate_to_chat_id", "retry_after"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        get = array.get
+        set_field = ResponseParameters._set_field
+        instance = ResponseParameters.__new__(ResponseParameters)
+        value = get('migrate_to_chat_id')
+        set_field(instance, 'migrate_to_chat_id', int(value) if value is not None else None)
+        value = get('retry_after')
+        set_field(instance, 'retry_after', int(value) if value is not None else None)
+        set_field(instance, '_raw', array)
+        return instance
+    # end def _from_array_trusted
 # end class ResponseParameters
+
+
+# bottom of file, as those modules import this one too. Used by the `_from_array_trusted(…)` functions.
+from ..sendable.reply_markup import InlineKeyboardMarkup
+from .inline import ChosenInlineResult
+from .inline import InlineQuery
+from .media import Animation
+from .media import Audio
+from .media import Contact
+from .media import Dice
+from .media import Document
+from .media import Game
+from .media import Location
+from .media import MessageEntity
+from .media import PhotoSize
+from .media import Poll
+from .media import PollAnswer
+from .media import Sticker
+from .media import Venue
+from .media import Video
+from .media import VideoNote
+from .media import Voice
+from .passport import PassportData
+from .payments import Invoice
+from .payments import PreCheckoutQuery
+from .payments import ShippingQuery
+from .payments import SuccessfulPayment
+from .peer import Chat
+from .peer import ChatJoinRequest
+from .peer import ChatMemberUpdated
+from .peer import User
+from .service import MessageAutoDeleteTimerChanged
+from .service import ProximityAlertTriggered
+from .service import VoiceChatEnded
+from .service import VoiceChatParticipantsInvited
+from .service import VoiceChatScheduled
+from .service import VoiceChatStarted
@@ -108,6 +108,9 @@ class Update(Receivable):
     my_chat_member: ChatMemberUpdated
     chat_member: ChatMemberUpdated
     chat_join_request: ChatJoinRequest
+
+    @property
+    def update_type(self) -> Union[None, str]: pass
 # end class Update
 
 class WebhookInfo(Receivable):
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
+from importlib import import_module
 from luckydonaldUtils.encoding import unicode_type, to_unicode as u
 from luckydonaldUtils.exceptions import assert_type_or_raise
-from .. import TgBotApiObject
+from .. import TgBotApiObject, as_array, _set_attribute, _watch, _is_changed_since, _is_any_list_changed, _change_counter
+from ...json_codec import get_default_codec
 
 __author__ = 'luckydonald'
 __all__ = [
@@ -9,9 +11,6 @@ __all__ = [
 ]
 __all__ += ["files", "inline", "payments", "reply_markup"]
 
-# UPCOMING CHANGE IN v2.2.0:
-from . import files  # backwards compatibility, before v2.2.0
-
 
 class Sendable(TgBotApiObject):
     """
@@ -20,5 +19,51 @@ class Sendable(TgBotApiObject):
     Optional keyword parameters:
     """
 
-    pass
+    __slots__ = ('_json',)
+
+    def to_json(self, json_codec=None, prefer_original=False):
+        """
+        The json of this object, as sent to the api.
+
+        It is cached until this object, or any object or list in it, is changed, so sending the same keyboard
+        (or inline query results) over and over again only encodes it once.
+        Use :meth:`freeze` to also skip checking for changes at all.
+
+        :param json_codec: The codec to encode it with. `None` uses the default one, see :func:`pytgbot.json_codec.get_default_codec`.
+        :type  json_codec: None | pytgbot.json_codec.JsonCodec
+
+        :param prefer_original: See :func:`pytgbot.api_types.as_array`.
+        :type  prefer_original: bool
+
+        :rtype: str
+        """
+        codec = json_codec if json_codec is not None else get_default_codec()
+        cached = getattr(self, '_json', None)  # (codec, prefer_original, stamp, lists, json)
+        if (
+            cached is not None and cached[0] is codec and cached[1] == prefer_original
+            and not _is_any_list_changed(cached[3]) and not _is_changed_since(self, cached[2])
+        ):
+            return cached[4]
+        # end if
+        stamp = next(_change_counter)  # before encoding, so changes while doing so count as newer.
+        lists = []
+        _watch(self, lists)
+        json = codec.dumps(as_array(self, prefer_original=prefer_original))
+        _set_attribute(self, '_json', (codec, prefer_original, stamp, lists, json))
+        return json
+    # end def
 # end class Sendable
+
+
+_SUBMODULES = ("command", "files", "inline", "input_media", "passport", "payments", "reply_markup")
+
+
+def __getattr__(name):
+    """
+    Imports the submodules on first access only, like `sendable.files` (before v2.2.0 always imported).
+    """
+    if name in _SUBMODULES:
+        return import_module('.' + name, __name__)
+    # end if
+    raise AttributeError('module {module!r} has no attribute {name!r}'.format(module=__name__, name=name))
+# end def
@@ -3,6 +3,7 @@ from luckydonaldUtils.exceptions import assert_type_or_raise
 from luckydonaldUtils.encoding import unicode_type, to_unicode as u
 from typing import Any, Union, List
 from pytgbot.api_types import TgBotApiObject
+from pytgbot.json_codec import JsonCodec
 
 __author__ = 'luckydonald'
 
@@ -13,4 +14,5 @@ class Sendable(TgBotApiObject):
 
     Optional keyword parameters:
     """
+    def to_json(self, json_codec: Union[None, JsonCodec] = None, prefer_original: bool = False) -> str: pass
 # end class Sendable
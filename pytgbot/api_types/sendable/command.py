@@ -36,6 +36,14 @@ class BotCommand(Sendable):
     Optional keyword parameters:
     """
 
+    __slots__ = ('command', 'description')
+    _fields = ('command', 'description')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('command', 'command', u, False),
+        ('description', 'description', u, False),
+    )
+
     def __init__(self, command, description):
         """
         This object represents a bot command.
@@ -55,33 +63,14 @@ class BotCommand(Sendable):
         Optional keyword parameters:
         """
         super(BotCommand, self).__init__()
-        assert_type_or_raise(command, unicode_type, parameter_name="command")
+        if self._must_validate():
+            assert_type_or_raise(command, unicode_type, parameter_name="command")
+            assert_type_or_raise(description, unicode_type, parameter_name="description")
+        # end if
         self.command = command
-        assert_type_or_raise(description, unicode_type, parameter_name="description")
         self.description = description
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this BotCommand to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(BotCommand, self).to_array()
-
-        array['command'] = u(self.command)  # py2: type unicode, py3: type str
-        array['description'] = u(self.description)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -114,34 +103,6 @@ class BotCommand(Sendable):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(botcommand_instance)`
-        """
-        return "BotCommand(command={self.command!r}, description={self.description!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(botcommand_instance)`
-        """
-        if self._raw:
-            return "BotCommand.from_array({self._raw})".format(self=self)
-        # end if
-        return "BotCommand(command={self.command!r}, description={self.description!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in botcommand_instance`
-        """
-        return (
-            key in ["command", "description"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class BotCommand
 
 
@@ -155,6 +116,8 @@ class BotCommandScope(Sendable):
     Optional keyword parameters:
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """
         This object represents the scope to which bot commands are applied.
@@ -167,25 +130,6 @@ class BotCommandScope(Sendable):
         super(BotCommandScope, self).__init__()
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this BotCommandScope to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(BotCommandScope, self).to_array()
-
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -202,48 +146,22 @@ class BotCommandScope(Sendable):
     @staticmethod
     def from_array(array):
         """
-        Deserialize a new BotCommandScope from a given dictionary.
+        Deserialize the matching BotCommandScope subclass from a given dictionary, looked up by its `type`.
 
-        :return: new BotCommandScope instance.
+        :return: new BotCommandScope subclass instance.
         :rtype: BotCommandScope
         """
         if not array:  # None or {}
             return None
         # end if
 
-        data = BotCommandScope.validate_array(array)
-        instance = BotCommandScope(**data)
-        instance._raw = array
-        return instance
-    # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(botcommandscope_instance)`
-        """
-        return "BotCommandScope()".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(botcommandscope_instance)`
-        """
-        if self._raw:
-            return "BotCommandScope.from_array({self._raw})".format(self=self)
+        clazz = BotCommandScope._subclasses.get(array.get('type'))
+        if clazz is None:
+            from ...exceptions import TgApiParseException
+            raise TgApiParseException('Unknown BotCommandScope type {value!r}.'.format(value=array.get('type')))
         # end if
-        return "BotCommandScope()".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in botcommandscope_instance`
-        """
-        return (
-            key in []
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        return clazz.from_array(array)
+    # end def from_array
 # end class BotCommandScope
 
 
@@ -261,6 +179,13 @@ class BotCommandScopeDefault(BotCommandScope):
     Optional keyword parameters:
     """
 
+    __slots__ = ('type',)
+    _fields = ('type',)  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+    )
+
     def __init__(self):
         """
         Represents the default scope of bot commands.
@@ -278,26 +203,6 @@ class BotCommandScopeDefault(BotCommandScope):
         self.type = 'default'
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this BotCommandScopeDefault to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(BotCommandScopeDefault, self).to_array()
-
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -329,34 +234,6 @@ class BotCommandScopeDefault(BotCommandScope):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(botcommandscopedefault_instance)`
-        """
-        return "BotCommandScopeDefault(type={self.type!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(botcommandscopedefault_instance)`
-        """
-        if self._raw:
-            return "BotCommandScopeDefault.from_array({self._raw})".format(self=self)
-        # end if
-        return "BotCommandScopeDefault(type={self.type!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in botcommandscopedefault_instance`
-        """
-        return (
-            key in ["type"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class BotCommandScopeDefault
 
 
@@ -373,6 +250,13 @@ class BotCommandScopeAllPrivateChats(BotCommandScope):
     Optional keyword parameters:
     """
 
+    __slots__ = ('type',)
+    _fields = ('type',)  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+    )
+
     def __init__(self):
         """
         Represents the scope of bot commands, covering all private chats.
@@ -389,26 +273,6 @@ class BotCommandScopeAllPrivateChats(BotCommandScope):
         self.type = 'all_private_chats'
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this BotCommandScopeAllPrivateChats to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(BotCommandScopeAllPrivateChats, self).to_array()
-
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -440,34 +304,6 @@ class BotCommandScopeAllPrivateChats(BotCommandScope):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(botcommandscopeallprivatechats_instance)`
-        """
-        return "BotCommandScopeAllPrivateChats(type={self.type!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(botcommandscopeallprivatechats_instance)`
-        """
-        if self._raw:
-            return "BotCommandScopeAllPrivateChats.from_array({self._raw})".format(self=self)
-        # end if
-        return "BotCommandScopeAllPrivateChats(type={self.type!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in botcommandscopeallprivatechats_instance`
-        """
-        return (
-            key in ["type"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class BotCommandScopeAllPrivateChats
 
 
@@ -484,6 +320,13 @@ class BotCommandScopeAllGroupChats(BotCommandScope):
     Optional keyword parameters:
     """
 
+    __slots__ = ('type',)
+    _fields = ('type',)  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+    )
+
     def __init__(self):
         """
         Represents the scope of bot commands, covering all group and supergroup chats.
@@ -500,26 +343,6 @@ class BotCommandScopeAllGroupChats(BotCommandScope):
         self.type = 'all_group_chats'
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this BotCommandScopeAllGroupChats to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(BotCommandScopeAllGroupChats, self).to_array()
-
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -551,34 +374,6 @@ class BotCommandScopeAllGroupChats(BotCommandScope):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(botcommandscopeallgroupchats_instance)`
-        """
-        return "BotCommandScopeAllGroupChats(type={self.type!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(botcommandscopeallgroupchats_instance)`
-        """
-        if self._raw:
-            return "BotCommandScopeAllGroupChats.from_array({self._raw})".format(self=self)
-        # end if
-        return "BotCommandScopeAllGroupChats(type={self.type!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in botcommandscopeallgroupchats_instance`
-        """
-        return (
-            key in ["type"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class BotCommandScopeAllGroupChats
 
 
@@ -595,6 +390,13 @@ class BotCommandScopeAllChatAdministrators(BotCommandScope):
     Optional keyword parameters:
     """
 
+    __slots__ = ('type',)
+    _fields = ('type',)  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+    )
+
     def __init__(self):
         """
         Represents the scope of bot commands, covering all group and supergroup chat administrators.
@@ -611,26 +413,6 @@ class BotCommandScopeAllChatAdministrators(BotCommandScope):
         self.type = 'all_chat_administrators'
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this BotCommandScopeAllChatAdministrators to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(BotCommandScopeAllChatAdministrators, self).to_array()
-
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -662,34 +444,6 @@ class BotCommandScopeAllChatAdministrators(BotCommandScope):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(botcommandscopeallchatadministrators_instance)`
-        """
-        return "BotCommandScopeAllChatAdministrators(type={self.type!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(botcommandscopeallchatadministrators_instance)`
-        """
-        if self._raw:
-            return "BotCommandScopeAllChatAdministrators.from_array({self._raw})".format(self=self)
-        # end if
-        return "BotCommandScopeAllChatAdministrators(type={self.type!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in botcommandscopeallchatadministrators_instance`
-        """
-        return (
-            key in ["type"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class BotCommandScopeAllChatAdministrators
 
 
@@ -709,6 +463,10 @@ class BotCommandScopeChat(BotCommandScope):
     Optional keyword parameters:
     """
 
+    __slots__ = ('type', 'chat_id')
+    _fields = ('type', 'chat_id')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+
     def __init__(self, chat_id):
         """
         Represents the scope of bot commands, covering a specific chat.
@@ -725,8 +483,10 @@ class BotCommandScopeChat(BotCommandScope):
         Optional keyword parameters:
         """
         super(BotCommandScopeChat, self).__init__()
+        if self._must_validate():
+            assert_type_or_raise(chat_id, int, unicode_type, parameter_name="chat_id")
+        # end if
         self.type = 'chat'
-        assert_type_or_raise(chat_id, int, unicode_type, parameter_name="chat_id")
         self.chat_id = chat_id
     # end def __init__
 
@@ -740,7 +500,7 @@ class BotCommandScopeChat(BotCommandScope):
         :return: dictionary representation of this object.
         :rtype: dict
         """
-        if prefer_original and self._raw:
+        if prefer_original and self._raw and self._is_unmodified():
             return self._raw
         # end if
 
@@ -795,34 +555,6 @@ class BotCommandScopeChat(BotCommandScope):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(botcommandscopechat_instance)`
-        """
-        return "BotCommandScopeChat(type={self.type!r}, chat_id={self.chat_id!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(botcommandscopechat_instance)`
-        """
-        if self._raw:
-            return "BotCommandScopeChat.from_array({self._raw})".format(self=self)
-        # end if
-        return "BotCommandScopeChat(type={self.type!r}, chat_id={self.chat_id!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in botcommandscopechat_instance`
-        """
-        return (
-            key in ["type", "chat_id"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class BotCommandScopeChat
 
 
@@ -842,6 +574,10 @@ class BotCommandScopeChatAdministrators(BotCommandScope):
     Optional keyword parameters:
     """
 
+    __slots__ = ('type', 'chat_id')
+    _fields = ('type', 'chat_id')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+
     def __init__(self, chat_id):
         """
         Represents the scope of bot commands, covering all administrators of a specific group or supergroup chat.
@@ -858,8 +594,10 @@ class BotCommandScopeChatAdministrators(BotCommandScope):
         Optional keyword parameters:
         """
         super(BotCommandScopeChatAdministrators, self).__init__()
+        if self._must_validate():
+            assert_type_or_raise(chat_id, int, unicode_type, parameter_name="chat_id")
+        # end if
         self.type = 'chat_administrators'
-        assert_type_or_raise(chat_id, int, unicode_type, parameter_name="chat_id")
         self.chat_id = chat_id
     # end def __init__
 
@@ -873,7 +611,7 @@ class BotCommandScopeChatAdministrators(BotCommandScope):
         :return: dictionary representation of this object.
         :rtype: dict
         """
-        if prefer_original and self._raw:
+        if prefer_original and self._raw and self._is_unmodified():
             return self._raw
         # end if
 
@@ -928,34 +666,6 @@ class BotCommandScopeChatAdministrators(BotCommandScope):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(botcommandscopechatadministrators_instance)`
-        """
-        return "BotCommandScopeChatAdministrators(type={self.type!r}, chat_id={self.chat_id!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(botcommandscopechatadministrators_instance)`
-        """
-        if self._raw:
-            return "BotCommandScopeChatAdministrators.from_array({self._raw})".format(self=self)
-        # end if
-        return "BotCommandScopeChatAdministrators(type={self.type!r}, chat_id={self.chat_id!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in botcommandscopechatadministrators_instance`
-        """
-        return (
-            key in ["type", "chat_id"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class BotCommandScopeChatAdministrators
 
 
@@ -978,6 +688,10 @@ class BotCommandScopeChatMember(BotCommandScope):
     Optional keyword parameters:
     """
 
+    __slots__ = ('type', 'chat_id', 'user_id')
+    _fields = ('type', 'chat_id', 'user_id')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+
     def __init__(self, chat_id, user_id):
         """
         Represents the scope of bot commands, covering a specific member of a group or supergroup chat.
@@ -997,10 +711,12 @@ class BotCommandScopeChatMember(BotCommandScope):
         Optional keyword parameters:
         """
         super(BotCommandScopeChatMember, self).__init__()
+        if self._must_validate():
+            assert_type_or_raise(chat_id, int, unicode_type, parameter_name="chat_id")
+            assert_type_or_raise(user_id, int, parameter_name="user_id")
+        # end if
         self.type = 'chat_member'
-        assert_type_or_raise(chat_id, int, unicode_type, parameter_name="chat_id")
         self.chat_id = chat_id
-        assert_type_or_raise(user_id, int, parameter_name="user_id")
         self.user_id = user_id
     # end def __init__
 
@@ -1014,7 +730,7 @@ class BotCommandScopeChatMember(BotCommandScope):
         :return: dictionary representation of this object.
         :rtype: dict
         """
-        if prefer_original and self._raw:
+        if prefer_original and self._raw and self._is_unmodified():
             return self._raw
         # end if
 
@@ -1071,32 +787,16 @@ class BotCommandScopeChatMember(BotCommandScope):
         instance._raw = array
         return instance
     # end def from_array
+# end class BotCommandScopeChatMember
 
-    def __str__(self):
-        """
-        Implements `str(botcommandscopechatmember_instance)`
-        """
-        return "BotCommandScopeChatMember(type={self.type!r}, chat_id={self.chat_id!r}, user_id={self.user_id!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(botcommandscopechatmember_instance)`
-        """
-        if self._raw:
-            return "BotCommandScopeChatMember.from_array({self._raw})".format(self=self)
-        # end if
-        return "BotCommandScopeChatMember(type={self.type!r}, chat_id={self.chat_id!r}, user_id={self.user_id!r})".format(self=self)
-    # end def __repr__
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in botcommandscopechatmember_instance`
-        """
-        return (
-            key in ["type", "chat_id", "user_id"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
-# end class BotCommandScopeChatMember
+# the subclasses `BotCommandScope.from_array(…)` parses into, by `type`.
+BotCommandScope._subclasses = {
+    "default": BotCommandScopeDefault,
+    "all_private_chats": BotCommandScopeAllPrivateChats,
+    "all_group_chats": BotCommandScopeAllGroupChats,
+    "all_chat_administrators": BotCommandScopeAllChatAdministrators,
+    "chat": BotCommandScopeChat,
+    "chat_administrators": BotCommandScopeChatAdministrators,
+    "chat_member": BotCommandScopeChatMember,
+}
@@ -14,7 +14,7 @@ except ImportError:  # python 3:
 
 
 __author__ = 'luckydonald'
-__all__ = ["InputFile", "InputFileFromURL", "InputFileFromDisk", "InputFileFromBlob"]
+__all__ = ["InputFile", "InputFileFromURL", "InputFileFromDisk", "InputFileFromBlob", "InputFileFromStream"]
 logger = logging.getLogger(__name__)
 
 
@@ -340,7 +340,14 @@ class InputFileFromBlob(InputFile):
 
 
 class InputFileFromDisk(InputFile):
-    def __init__(self, path, name=None, mime=None, **kwargs):
+    """
+    Uploads a file from disk.
+
+    The file is only opened while it is uploaded, and closed again after the request.
+    With `use_mmap=True` the file is memory mapped instead of read, so even big files are sent
+    straight from the page cache, without being copied into python buffers first.
+    """
+    def __init__(self, path, name=None, mime=None, use_mmap=False, **kwargs):
         if not path:
             raise ValueError("The file path (path argument) is required to be non-empty.")
         # end if
@@ -352,6 +359,7 @@ class InputFileFromDisk(InputFile):
         # end if
 
         self.path = path
+        self.use_mmap = use_mmap
         super(InputFileFromDisk, self).__init__(name=name, mime=mime, **kwargs)
     # end def __init__
 
@@ -365,7 +373,26 @@ class InputFileFromDisk(InputFile):
         return magic.from_file(path, mime=True)
     # end def
 
+    def open_mmap(self):
+        """
+        Memory maps the file, read only.
+
+        :return: The mapped file. Can't be an empty file.
+        :rtype: mmap.mmap
+        """
+        import mmap
+        with open(self.path, 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)  # keeps a handle of it's own.
+        # end with
+    # end def
+
     def get_request_files(self, var_name):
+        """
+        Opens the file for uploading. Whoever sends it has to close it again, like the bots do after the request.
+        """
+        if self.use_mmap and os_path.getsize(self.path) > 0:  # empty files can't be mapped.
+            return {var_name: (self.name, self.open_mmap(), self.mime)}
+        # end if
         return {var_name: (self.name, open(self.path, 'rb'), self.mime)}
     # end def
 
@@ -377,19 +404,18 @@ class InputFileFromDisk(InputFile):
 
 
 class InputFileFromURL(InputFile):
-    def __init__(self, url, name=None, mime=None, **kwargs):
+    """
+    Downloads a file, to upload it to telegram.
+
+    By default the whole file is downloaded right away, and kept in memory (`blob`).
+    With `stream=True` it is only downloaded while being uploaded, passing it on chunk by chunk,
+    so even big files need hardly any memory. If no `mime` is given, it is guessed from the file name then.
+    """
+    def __init__(self, url, name=None, mime=None, stream=False, **kwargs):
         if not url:
             raise ValueError("The url (url argument) is required to be non-empty.")
         # end if
 
-        # BLOB
-        import requests
-        request = requests.get(url)
-        if not request.status_code == 200:
-            raise ValueError("Status code of request wasn't 200, but {!r}".format(request.status_code))
-        # end if
-        blob = request.content
-
         # NAME
         if name:
             name = name
@@ -397,20 +423,36 @@ class InputFileFromURL(InputFile):
             name = self.name_from_url(url)
         # end if
 
+        # BLOB
+        if stream:
+            request = None
+            blob = None
+        else:
+            import requests
+            request = requests.get(url)
+            if not request.status_code == 200:
+                raise ValueError("Status code of request wasn't 200, but {!r}".format(request.status_code))
+            # end if
+            blob = request.content
+        # end if
+
         # MIME
         if mime:
             mime = mime
+        elif stream:
+            mime = InputFileFromStream.mime_from_name(name)
         else:
             mime = InputFileFromBlob.mime_from_blob(blob)
         # end if
         self.url = url
+        self.stream = stream
         self.request = request
         self.blob = blob
         super(InputFileFromURL, self).__init__(name=name, mime=mime, **kwargs)
     # end def
 
     def __str__(self):
-        file_size = len(self.blob)
+        file_size = len(self.blob) if self.blob is not None else None
         return (
             "{clazz_name!s}("
             "url={self.url!r}, name={self.name!r}, mime={self.mime!r}, "
@@ -430,11 +472,109 @@ class InputFileFromURL(InputFile):
         # end if
     # end def
 
+    def open_download(self):
+        """
+        Starts the download of the file, to read it while uploading.
+
+        :return: The body of the response, as file-like object.
+        :rtype: urllib3.response.HTTPResponse
+        """
+        import requests
+        # no compression, so the length is known in advance, and the bytes read are the bytes of the file.
+        request = requests.get(self.url, stream=True, headers={'Accept-Encoding': 'identity'})
+        if not request.status_code == 200:
+            request.close()
+            raise ValueError("Status code of request wasn't 200, but {!r}".format(request.status_code))
+        # end if
+        return request.raw
+    # end def
+
     def get_request_files(self, var_name):
+        if self.stream:
+            return {var_name: (self.name, self.open_download(), self.mime)}
+        # end if
         return {var_name: (self.name, self.blob, self.mime)}
     # end def get_request_files
 
     def _calculate_size(self):
-        return len(self.blob)
+        if self.blob is not None:
+            return len(self.blob)
+        # end if
+        import requests
+        request = requests.head(self.url, allow_redirects=True, headers={'Accept-Encoding': 'identity'})
+        return int(request.headers['Content-Length'])
     # end def
 # end class InputFileFromURL
+
+
+class InputFileFromStream(InputFile):
+    """
+    Uploads the content of a file-like object, like an open file, a socket or a pipe, opened in binary mode.
+    It is read chunk by chunk while uploading, so it's never held in memory as a whole.
+
+    If the stream is seekable, it is read from the position it has now, and rewound there for every upload,
+    so the file can be sent multiple times, and failed requests can be retried.
+    A stream which can't seek can only be uploaded once.
+    The stream stays open, closing it is up to you.
+    """
+    def __init__(self, stream, name="file.unknown", mime=None, **kwargs):
+        if stream is None:
+            raise ValueError("The stream (stream argument) is required.")
+        # end if
+        if not mime:
+            mime = self.mime_from_name(name)
+        # end if
+
+        self.stream = stream
+        try:
+            self.start = stream.tell() if stream.seekable() else None
+        except (AttributeError, OSError, ValueError):
+            self.start = None
+        # end try
+        super(InputFileFromStream, self).__init__(name=name, mime=mime, **kwargs)
+    # end def
+
+    @staticmethod
+    def mime_from_name(name):
+        """
+        Guesses the mime type from the file extension, as we can't look into a stream without consuming it.
+        :return:
+        """
+        import mimetypes
+        mime, _ = mimetypes.guess_type(name or '')
+        return mime or 'application/octet-stream'
+    # end def
+
+    def get_request_files(self, var_name):
+        if self.start is not None:
+            self.stream.seek(self.start)
+        # end if
+        return {var_name: (self.name, _BorrowedStream(self.stream), self.mime)}
+    # end def
+
+    def _calculate_size(self):
+        from ...multipart import get_stream_size
+        if self.start is not None:
+            self.stream.seek(self.start)
+        # end if
+        return get_stream_size(self.stream)
+    # end def
+# end class
+
+
+class _BorrowedStream(object):
+    """
+    A stream only lent to the upload: Can be used like the stream itself, but isn't closed after the request.
+    """
+    def __init__(self, stream):
+        self._stream = stream
+    # end def
+
+    def __getattr__(self, item):
+        return getattr(self._stream, item)
+    # end def
+
+    def close(self):
+        pass
+    # end def
+# end class
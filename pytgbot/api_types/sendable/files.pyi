@@ -1,5 +1,6 @@
 from typing import Union, Tuple, Type, Dict, Optional, MutableMapping, Text, IO, BinaryIO
 from luckydonaldUtils.encoding import binary_type
+from mmap import mmap
 
 
 class InputFile(...):
@@ -7,7 +8,7 @@ class InputFile(...):
     def __new__(
         cls
     ) -> Union[
-        'InputFileFromBlob', 'InputFileFromDisk', 'InputFileFromURL',
+        'InputFileFromBlob', 'InputFileFromDisk', 'InputFileFromURL', 'InputFileFromStream',
         str,
     ]: ...
     # end def
@@ -153,12 +154,16 @@ class InputFileFromDisk(InputFile):
         path: str,
         name: Optional[str] = None,
         mime: Optional[str] = None,
+        use_mmap: bool = False,
         **kwargs,
     ) -> None:
         super(InputFileFromDisk, self).__init__(name=name, mime=mime)
         ...
     # end def __init__
 
+    def open_mmap(self) -> mmap: ...
+    # end def
+
     @staticmethod
     def mime_from_file(
         path: str
@@ -168,7 +173,7 @@ class InputFileFromDisk(InputFile):
     def get_request_files(
         self,
         var_name: str
-    ) -> Dict[str, Tuple[str, BinaryIO, str]]: ...
+    ) -> Dict[str, Tuple[str, Union[BinaryIO, mmap], str]]: ...
     # end def
 
     def _calculate_size(self) -> int: ...
@@ -181,6 +186,7 @@ class InputFileFromURL(InputFile):
         url: str,
         name: Optional[str] = None,
         mime: Optional[str] = None,
+        stream: bool = False,
     ) -> None:
         super(InputFileFromURL, self).__init__(name=name, mime=mime)
         ...
@@ -195,13 +201,45 @@ class InputFileFromURL(InputFile):
     ) -> str: ...
     # end def
 
+    def open_download(self) -> BinaryIO: ...
+    # end def
+
     def get_request_files(
         self,
         var_name: str
-    ) -> Dict[str, Tuple[str, binary_type, str]]: ...
+    ) -> Dict[str, Tuple[str, Union[binary_type, BinaryIO], str]]: ...
     # end def
 
     def _calculate_size(self) -> int: ...
     # end def
 # end class InputFileFromURL
 
+
+class InputFileFromStream(InputFile):
+    def __init__(
+        self,
+        stream: BinaryIO,
+        name: str = "file.unknown",
+        mime: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        super(InputFileFromStream, self).__init__(name=name, mime=mime)
+        ...
+    # end def
+
+    @staticmethod
+    def mime_from_name(
+        name: str
+    ) -> str: ...
+    # end def
+
+    def get_request_files(
+        self,
+        var_name: str
+    ) -> Dict[str, Tuple[str, BinaryIO, str]]: ...
+    # end def
+
+    def _calculate_size(self) -> Optional[int]: ...
+    # end def
+# end class
+
@@ -47,6 +47,8 @@ class InlineQueryResult(Sendable):
     Optional keyword parameters:
     """
 
+    __slots__ = ('id', 'type')
+
     def __init__(self, id, type):
         assert_type_or_raise(id, unicode_type, int, parameter_name="id")
         if not isinstance(id, unicode_type):
@@ -56,13 +58,6 @@ class InlineQueryResult(Sendable):
         self.type = type
         super(InlineQueryResult, self).__init__()
     # end def
-
-    def to_array(self):
-        return {
-            "type": u(self.type),
-            "id": u(self.id),
-        }
-    # end def to_array
 # end class InlineQueryResult
 
 
@@ -73,6 +68,8 @@ class InlineQueryCachedResult(InlineQueryResult):
     Optional keyword parameters:
     """
 
+    __slots__ = ()
+
     pass
 # end class InlineQueryCachedResult
 
@@ -84,6 +81,8 @@ class InputMessageContent(Sendable):
     Optional keyword parameters:
     """
 
+    __slots__ = ()
+
     pass
 # end class InputMessageContent
 
@@ -131,6 +130,23 @@ class InlineQueryResultArticle(InlineQueryResult):
     :type  thumb_height: int
     """
 
+    __slots__ = ('title', 'input_message_content', 'reply_markup', 'url', 'hide_url', 'description', 'thumb_url', 'thumb_width', 'thumb_height')
+    _fields = ('type', 'id', 'title', 'input_message_content', 'reply_markup', 'url', 'hide_url', 'description', 'thumb_url', 'thumb_width', 'thumb_height')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('title', 'title', u, False),
+        ('input_message_content', 'input_message_content', None, False),
+        ('reply_markup', 'reply_markup', None, True),
+        ('url', 'url', u, True),
+        ('hide_url', 'hide_url', bool, True),
+        ('description', 'description', u, True),
+        ('thumb_url', 'thumb_url', u, True),
+        ('thumb_width', 'thumb_width', int, True),
+        ('thumb_height', 'thumb_height', int, True),
+    )
+
     def __init__(self, id, title, input_message_content, reply_markup=None, url=None, hide_url=None, description=None, thumb_url=None, thumb_width=None, thumb_height=None):
         """
         Represents a link to an article or web page.
@@ -174,75 +190,32 @@ class InlineQueryResultArticle(InlineQueryResult):
         :type  thumb_height: int
         """
         super(InlineQueryResultArticle, self).__init__(id, "article")
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(title, unicode_type, parameter_name="title")
+            assert_type_or_raise(input_message_content, InputMessageContent, parameter_name="input_message_content")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(url, None, unicode_type, parameter_name="url")
+            assert_type_or_raise(hide_url, None, bool, parameter_name="hide_url")
+            assert_type_or_raise(description, None, unicode_type, parameter_name="description")
+            assert_type_or_raise(thumb_url, None, unicode_type, parameter_name="thumb_url")
+            assert_type_or_raise(thumb_width, None, int, parameter_name="thumb_width")
+            assert_type_or_raise(thumb_height, None, int, parameter_name="thumb_height")
+        # end if
 
         # 'type' is given by class type
         # 'id' is given by class type
-        assert_type_or_raise(title, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(input_message_content, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(url, None, unicode_type, parameter_name="url")
         self.url = url
-        assert_type_or_raise(hide_url, None, bool, parameter_name="hide_url")
         self.hide_url = hide_url
-        assert_type_or_raise(description, None, unicode_type, parameter_name="description")
         self.description = description
-        assert_type_or_raise(thumb_url, None, unicode_type, parameter_name="thumb_url")
         self.thumb_url = thumb_url
-        assert_type_or_raise(thumb_width, None, int, parameter_name="thumb_width")
         self.thumb_width = thumb_width
-        assert_type_or_raise(thumb_height, None, int, parameter_name="thumb_height")
         self.thumb_height = thumb_height
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultArticle to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultArticle, self).to_array()
-
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.url is not None:
-            array['url'] = u(self.url)  # py2: type unicode, py3: type str
-        # end if
-        if self.hide_url is not None:
-            array['hide_url'] = bool(self.hide_url)  # type bool
-        # end if
-        if self.description is not None:
-            array['description'] = u(self.description)  # py2: type unicode, py3: type str
-        # end if
-        if self.thumb_url is not None:
-            array['thumb_url'] = u(self.thumb_url)  # py2: type unicode, py3: type str
-        # end if
-        if self.thumb_width is not None:
-            array['thumb_width'] = int(self.thumb_width)  # type int
-        # end if
-        if self.thumb_height is not None:
-            array['thumb_height'] = int(self.thumb_height)  # type int
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -285,34 +258,6 @@ class InlineQueryResultArticle(InlineQueryResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultarticle_instance)`
-        """
-        return "InlineQueryResultArticle(type={self.type!r}, id={self.id!r}, title={self.title!r}, input_message_content={self.input_message_content!r}, reply_markup={self.reply_markup!r}, url={self.url!r}, hide_url={self.hide_url!r}, description={self.description!r}, thumb_url={self.thumb_url!r}, thumb_width={self.thumb_width!r}, thumb_height={self.thumb_height!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultarticle_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultArticle.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultArticle(type={self.type!r}, id={self.id!r}, title={self.title!r}, input_message_content={self.input_message_content!r}, reply_markup={self.reply_markup!r}, url={self.url!r}, hide_url={self.hide_url!r}, description={self.description!r}, thumb_url={self.thumb_url!r}, thumb_width={self.thumb_width!r}, thumb_height={self.thumb_height!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultarticle_instance`
-        """
-        return (
-            key in ["type", "id", "title", "input_message_content", "reply_markup", "url", "hide_url", "description", "thumb_url", "thumb_width", "thumb_height"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultArticle
 
 
@@ -368,6 +313,25 @@ class InlineQueryResultPhoto(InlineQueryResult):
     :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
     """
 
+    __slots__ = ('photo_url', 'thumb_url', 'photo_width', 'photo_height', 'title', 'description', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')
+    _fields = ('type', 'id', 'photo_url', 'thumb_url', 'photo_width', 'photo_height', 'title', 'description', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('photo_url', 'photo_url', u, False),
+        ('thumb_url', 'thumb_url', u, False),
+        ('photo_width', 'photo_width', int, True),
+        ('photo_height', 'photo_height', int, True),
+        ('title', 'title', u, True),
+        ('description', 'description', u, True),
+        ('caption', 'caption', u, True),
+        ('parse_mode', 'parse_mode', u, True),
+        ('caption_entities', 'caption_entities', list, True),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+    )
+
     def __init__(self, id, photo_url, thumb_url, photo_width=None, photo_height=None, title=None, description=None, caption=None, parse_mode=None, caption_entities=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a photo.
@@ -420,87 +384,37 @@ class InlineQueryResultPhoto(InlineQueryResult):
         :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
         """
         super(InlineQueryResultPhoto, self).__init__(id, "photo")
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(photo_url, unicode_type, parameter_name="photo_url")
+            assert_type_or_raise(thumb_url, unicode_type, parameter_name="thumb_url")
+            assert_type_or_raise(photo_width, None, int, parameter_name="photo_width")
+            assert_type_or_raise(photo_height, None, int, parameter_name="photo_height")
+            assert_type_or_raise(title, None, unicode_type, parameter_name="title")
+            assert_type_or_raise(description, None, unicode_type, parameter_name="description")
+            assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
+            assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
+            assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+        # end if
 
         # 'type' is given by class type
         # 'id' is given by class type
-        assert_type_or_raise(photo_url, unicode_type, parameter_name="photo_url")
         self.photo_url = photo_url
-        assert_type_or_raise(thumb_url, unicode_type, parameter_name="thumb_url")
         self.thumb_url = thumb_url
-        assert_type_or_raise(photo_width, None, int, parameter_name="photo_width")
         self.photo_width = photo_width
-        assert_type_or_raise(photo_height, None, int, parameter_name="photo_height")
         self.photo_height = photo_height
-        assert_type_or_raise(title, None, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(description, None, unicode_type, parameter_name="description")
         self.description = description
-        assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
         self.caption = caption
-        assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
         self.parse_mode = parse_mode
-        assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
         self.caption_entities = caption_entities
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultPhoto to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultPhoto, self).to_array()
-
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['photo_url'] = u(self.photo_url)  # py2: type unicode, py3: type str
-        array['thumb_url'] = u(self.thumb_url)  # py2: type unicode, py3: type str
-        if self.photo_width is not None:
-            array['photo_width'] = int(self.photo_width)  # type int
-        # end if
-        if self.photo_height is not None:
-            array['photo_height'] = int(self.photo_height)  # type int
-        # end if
-        if self.title is not None:
-            array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        # end if
-        if self.description is not None:
-            array['description'] = u(self.description)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption is not None:
-            array['caption'] = u(self.caption)  # py2: type unicode, py3: type str
-        # end if
-        if self.parse_mode is not None:
-            array['parse_mode'] = u(self.parse_mode)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption_entities is not None:
-            array['caption_entities'] = self._as_array(self.caption_entities)  # type list of MessageEntity
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -546,34 +460,6 @@ class InlineQueryResultPhoto(InlineQueryResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultphoto_instance)`
-        """
-        return "InlineQueryResultPhoto(type={self.type!r}, id={self.id!r}, photo_url={self.photo_url!r}, thumb_url={self.thumb_url!r}, photo_width={self.photo_width!r}, photo_height={self.photo_height!r}, title={self.title!r}, description={self.description!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultphoto_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultPhoto.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultPhoto(type={self.type!r}, id={self.id!r}, photo_url={self.photo_url!r}, thumb_url={self.thumb_url!r}, photo_width={self.photo_width!r}, photo_height={self.photo_height!r}, title={self.title!r}, description={self.description!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultphoto_instance`
-        """
-        return (
-            key in ["type", "id", "photo_url", "thumb_url", "photo_width", "photo_height", "title", "description", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultPhoto
 
 
@@ -633,6 +519,26 @@ class InlineQueryResultGif(InlineQueryResult):
     :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
     """
 
+    __slots__ = ('gif_url', 'thumb_url', 'gif_width', 'gif_height', 'gif_duration', 'thumb_mime_type', 'title', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')
+    _fields = ('type', 'id', 'gif_url', 'thumb_url', 'gif_width', 'gif_height', 'gif_duration', 'thumb_mime_type', 'title', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('gif_url', 'gif_url', u, False),
+        ('thumb_url', 'thumb_url', u, False),
+        ('gif_width', 'gif_width', int, True),
+        ('gif_height', 'gif_height', int, True),
+        ('gif_duration', 'gif_duration', int, True),
+        ('thumb_mime_type', 'thumb_mime_type', u, True),
+        ('title', 'title', u, True),
+        ('caption', 'caption', u, True),
+        ('parse_mode', 'parse_mode', u, True),
+        ('caption_entities', 'caption_entities', list, True),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+    )
+
     def __init__(self, id, gif_url, thumb_url, gif_width=None, gif_height=None, gif_duration=None, thumb_mime_type=None, title=None, caption=None, parse_mode=None, caption_entities=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to an animated GIF file.
@@ -689,92 +595,39 @@ class InlineQueryResultGif(InlineQueryResult):
         :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
         """
         super(InlineQueryResultGif, self).__init__(id, "gif")
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(gif_url, unicode_type, parameter_name="gif_url")
+            assert_type_or_raise(thumb_url, unicode_type, parameter_name="thumb_url")
+            assert_type_or_raise(gif_width, None, int, parameter_name="gif_width")
+            assert_type_or_raise(gif_height, None, int, parameter_name="gif_height")
+            assert_type_or_raise(gif_duration, None, int, parameter_name="gif_duration")
+            assert_type_or_raise(thumb_mime_type, None, unicode_type, parameter_name="thumb_mime_type")
+            assert_type_or_raise(title, None, unicode_type, parameter_name="title")
+            assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
+            assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
+            assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+        # end if
 
         # 'type' is given by class type
         # 'id' is given by class type
-        assert_type_or_raise(gif_url, unicode_type, parameter_name="gif_url")
         self.gif_url = gif_url
-        assert_type_or_raise(thumb_url, unicode_type, parameter_name="thumb_url")
         self.thumb_url = thumb_url
-        assert_type_or_raise(gif_width, None, int, parameter_name="gif_width")
         self.gif_width = gif_width
-        assert_type_or_raise(gif_height, None, int, parameter_name="gif_height")
         self.gif_height = gif_height
-        assert_type_or_raise(gif_duration, None, int, parameter_name="gif_duration")
         self.gif_duration = gif_duration
-        assert_type_or_raise(thumb_mime_type, None, unicode_type, parameter_name="thumb_mime_type")
         self.thumb_mime_type = thumb_mime_type
-        assert_type_or_raise(title, None, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
         self.caption = caption
-        assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
         self.parse_mode = parse_mode
-        assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
         self.caption_entities = caption_entities
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultGif to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultGif, self).to_array()
-
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['gif_url'] = u(self.gif_url)  # py2: type unicode, py3: type str
-        array['thumb_url'] = u(self.thumb_url)  # py2: type unicode, py3: type str
-        if self.gif_width is not None:
-            array['gif_width'] = int(self.gif_width)  # type int
-        # end if
-        if self.gif_height is not None:
-            array['gif_height'] = int(self.gif_height)  # type int
-        # end if
-        if self.gif_duration is not None:
-            array['gif_duration'] = int(self.gif_duration)  # type int
-        # end if
-        if self.thumb_mime_type is not None:
-            array['thumb_mime_type'] = u(self.thumb_mime_type)  # py2: type unicode, py3: type str
-        # end if
-        if self.title is not None:
-            array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption is not None:
-            array['caption'] = u(self.caption)  # py2: type unicode, py3: type str
-        # end if
-        if self.parse_mode is not None:
-            array['parse_mode'] = u(self.parse_mode)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption_entities is not None:
-            array['caption_entities'] = self._as_array(self.caption_entities)  # type list of MessageEntity
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -821,34 +674,6 @@ class InlineQueryResultGif(InlineQueryResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultgif_instance)`
-        """
-        return "InlineQueryResultGif(type={self.type!r}, id={self.id!r}, gif_url={self.gif_url!r}, thumb_url={self.thumb_url!r}, gif_width={self.gif_width!r}, gif_height={self.gif_height!r}, gif_duration={self.gif_duration!r}, thumb_mime_type={self.thumb_mime_type!r}, title={self.title!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultgif_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultGif.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultGif(type={self.type!r}, id={self.id!r}, gif_url={self.gif_url!r}, thumb_url={self.thumb_url!r}, gif_width={self.gif_width!r}, gif_height={self.gif_height!r}, gif_duration={self.gif_duration!r}, thumb_mime_type={self.thumb_mime_type!r}, title={self.title!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultgif_instance`
-        """
-        return (
-            key in ["type", "id", "gif_url", "thumb_url", "gif_width", "gif_height", "gif_duration", "thumb_mime_type", "title", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultGif
 
 
@@ -908,6 +733,26 @@ class InlineQueryResultMpeg4Gif(InlineQueryResult):
     :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
     """
 
+    __slots__ = ('mpeg4_url', 'thumb_url', 'mpeg4_width', 'mpeg4_height', 'mpeg4_duration', 'thumb_mime_type', 'title', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')
+    _fields = ('type', 'id', 'mpeg4_url', 'thumb_url', 'mpeg4_width', 'mpeg4_height', 'mpeg4_duration', 'thumb_mime_type', 'title', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('mpeg4_url', 'mpeg4_url', u, False),
+        ('thumb_url', 'thumb_url', u, False),
+        ('mpeg4_width', 'mpeg4_width', int, True),
+        ('mpeg4_height', 'mpeg4_height', int, True),
+        ('mpeg4_duration', 'mpeg4_duration', int, True),
+        ('thumb_mime_type', 'thumb_mime_type', u, True),
+        ('title', 'title', u, True),
+        ('caption', 'caption', u, True),
+        ('parse_mode', 'parse_mode', u, True),
+        ('caption_entities', 'caption_entities', list, True),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+    )
+
     def __init__(self, id, mpeg4_url, thumb_url, mpeg4_width=None, mpeg4_height=None, mpeg4_duration=None, thumb_mime_type=None, title=None, caption=None, parse_mode=None, caption_entities=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a video animation (H.264/MPEG-4 AVC video without sound).
@@ -964,91 +809,39 @@ class InlineQueryResultMpeg4Gif(InlineQueryResult):
         :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
         """
         super(InlineQueryResultMpeg4Gif, self).__init__(id, "mpeg4_gif")
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(mpeg4_url, unicode_type, parameter_name="mpeg4_url")
+            assert_type_or_raise(thumb_url, unicode_type, parameter_name="thumb_url")
+            assert_type_or_raise(mpeg4_width, None, int, parameter_name="mpeg4_width")
+            assert_type_or_raise(mpeg4_height, None, int, parameter_name="mpeg4_height")
+            assert_type_or_raise(mpeg4_duration, None, int, parameter_name="mpeg4_duration")
+            assert_type_or_raise(thumb_mime_type, None, unicode_type, parameter_name="thumb_mime_type")
+            assert_type_or_raise(title, None, unicode_type, parameter_name="title")
+            assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
+            assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
+            assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+        # end if
 
         # 'type' is given by class type
         # 'id' is given by class type
-        assert_type_or_raise(mpeg4_url, unicode_type, parameter_name="mpeg4_url")
         self.mpeg4_url = mpeg4_url
-        assert_type_or_raise(thumb_url, unicode_type, parameter_name="thumb_url")
         self.thumb_url = thumb_url
-        assert_type_or_raise(mpeg4_width, None, int, parameter_name="mpeg4_width")
         self.mpeg4_width = mpeg4_width
-        assert_type_or_raise(mpeg4_height, None, int, parameter_name="mpeg4_height")
         self.mpeg4_height = mpeg4_height
-        assert_type_or_raise(mpeg4_duration, None, int, parameter_name="mpeg4_duration")
         self.mpeg4_duration = mpeg4_duration
-        assert_type_or_raise(thumb_mime_type, None, unicode_type, parameter_name="thumb_mime_type")
         self.thumb_mime_type = thumb_mime_type
-        assert_type_or_raise(title, None, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
         self.caption = caption
-        assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
         self.parse_mode = parse_mode
-        assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
         self.caption_entities = caption_entities
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultMpeg4Gif to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultMpeg4Gif, self).to_array()
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['mpeg4_url'] = u(self.mpeg4_url)  # py2: type unicode, py3: type str
-        array['thumb_url'] = u(self.thumb_url)  # py2: type unicode, py3: type str
-        if self.mpeg4_width is not None:
-            array['mpeg4_width'] = int(self.mpeg4_width)  # type int
-        # end if
-        if self.mpeg4_height is not None:
-            array['mpeg4_height'] = int(self.mpeg4_height)  # type int
-        # end if
-        if self.mpeg4_duration is not None:
-            array['mpeg4_duration'] = int(self.mpeg4_duration)  # type int
-        # end if
-        if self.thumb_mime_type is not None:
-            array['thumb_mime_type'] = u(self.thumb_mime_type)  # py2: type unicode, py3: type str
-        # end if
-        if self.title is not None:
-            array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption is not None:
-            array['caption'] = u(self.caption)  # py2: type unicode, py3: type str
-        # end if
-        if self.parse_mode is not None:
-            array['parse_mode'] = u(self.parse_mode)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption_entities is not None:
-            array['caption_entities'] = self._as_array(self.caption_entities)  # type list of MessageEntity
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1095,34 +888,6 @@ class InlineQueryResultMpeg4Gif(InlineQueryResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultmpeg4gif_instance)`
-        """
-        return "InlineQueryResultMpeg4Gif(type={self.type!r}, id={self.id!r}, mpeg4_url={self.mpeg4_url!r}, thumb_url={self.thumb_url!r}, mpeg4_width={self.mpeg4_width!r}, mpeg4_height={self.mpeg4_height!r}, mpeg4_duration={self.mpeg4_duration!r}, thumb_mime_type={self.thumb_mime_type!r}, title={self.title!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultmpeg4gif_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultMpeg4Gif.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultMpeg4Gif(type={self.type!r}, id={self.id!r}, mpeg4_url={self.mpeg4_url!r}, thumb_url={self.thumb_url!r}, mpeg4_width={self.mpeg4_width!r}, mpeg4_height={self.mpeg4_height!r}, mpeg4_duration={self.mpeg4_duration!r}, thumb_mime_type={self.thumb_mime_type!r}, title={self.title!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultmpeg4gif_instance`
-        """
-        return (
-            key in ["type", "id", "mpeg4_url", "thumb_url", "mpeg4_width", "mpeg4_height", "mpeg4_duration", "thumb_mime_type", "title", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultMpeg4Gif
 
 
@@ -1187,6 +952,27 @@ class InlineQueryResultVideo(InlineQueryResult):
     :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
     """
 
+    __slots__ = ('id', 'video_url', 'mime_type', 'thumb_url', 'title', 'caption', 'parse_mode', 'caption_entities', 'video_width', 'video_height', 'video_duration', 'description', 'reply_markup', 'input_message_content')
+    _fields = ('type', 'id', 'video_url', 'mime_type', 'thumb_url', 'title', 'caption', 'parse_mode', 'caption_entities', 'video_width', 'video_height', 'video_duration', 'description', 'reply_markup', 'input_message_content')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('video_url', 'video_url', u, False),
+        ('mime_type', 'mime_type', u, False),
+        ('thumb_url', 'thumb_url', u, False),
+        ('title', 'title', u, False),
+        ('caption', 'caption', u, True),
+        ('parse_mode', 'parse_mode', u, True),
+        ('caption_entities', 'caption_entities', list, True),
+        ('video_width', 'video_width', int, True),
+        ('video_height', 'video_height', int, True),
+        ('video_duration', 'video_duration', int, True),
+        ('description', 'description', u, True),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+    )
+
     def __init__(self, id, video_url, mime_type, thumb_url, title, caption=None, parse_mode=None, caption_entities=None, video_width=None, video_height=None, video_duration=None, description=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a page containing an embedded video player or a video file.
@@ -1248,93 +1034,42 @@ class InlineQueryResultVideo(InlineQueryResult):
         :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
         """
         super(InlineQueryResultVideo, self).__init__(id, "video")
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(id, unicode_type, parameter_name="id")
+            assert_type_or_raise(video_url, unicode_type, parameter_name="video_url")
+            assert_type_or_raise(mime_type, unicode_type, parameter_name="mime_type")
+            assert_type_or_raise(thumb_url, unicode_type, parameter_name="thumb_url")
+            assert_type_or_raise(title, unicode_type, parameter_name="title")
+            assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
+            assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
+            assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
+            assert_type_or_raise(video_width, None, int, parameter_name="video_width")
+            assert_type_or_raise(video_height, None, int, parameter_name="video_height")
+            assert_type_or_raise(video_duration, None, int, parameter_name="video_duration")
+            assert_type_or_raise(description, None, unicode_type, parameter_name="description")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+        # end if
 
         # type is given by class type
-        assert_type_or_raise(id, unicode_type, parameter_name="id")
         self.id = id
-        assert_type_or_raise(video_url, unicode_type, parameter_name="video_url")
         self.video_url = video_url
-        assert_type_or_raise(mime_type, unicode_type, parameter_name="mime_type")
         self.mime_type = mime_type
-        assert_type_or_raise(thumb_url, unicode_type, parameter_name="thumb_url")
         self.thumb_url = thumb_url
-        assert_type_or_raise(title, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
         self.caption = caption
-        assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
         self.parse_mode = parse_mode
-        assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
         self.caption_entities = caption_entities
-        assert_type_or_raise(video_width, None, int, parameter_name="video_width")
         self.video_width = video_width
-        assert_type_or_raise(video_height, None, int, parameter_name="video_height")
         self.video_height = video_height
-        assert_type_or_raise(video_duration, None, int, parameter_name="video_duration")
         self.video_duration = video_duration
-        assert_type_or_raise(description, None, unicode_type, parameter_name="description")
         self.description = description
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultVideo to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultVideo, self).to_array()
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['video_url'] = u(self.video_url)  # py2: type unicode, py3: type str
-        array['mime_type'] = u(self.mime_type)  # py2: type unicode, py3: type str
-        array['thumb_url'] = u(self.thumb_url)  # py2: type unicode, py3: type str
-        array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        if self.caption is not None:
-            array['caption'] = u(self.caption)  # py2: type unicode, py3: type str
-        # end if
-        if self.parse_mode is not None:
-            array['parse_mode'] = u(self.parse_mode)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption_entities is not None:
-            array['caption_entities'] = self._as_array(self.caption_entities)  # type list of MessageEntity
-        # end if
-        if self.video_width is not None:
-            array['video_width'] = int(self.video_width)  # type int
-        # end if
-        if self.video_height is not None:
-            array['video_height'] = int(self.video_height)  # type int
-        # end if
-        if self.video_duration is not None:
-            array['video_duration'] = int(self.video_duration)  # type int
-        # end if
-        if self.description is not None:
-            array['description'] = u(self.description)  # py2: type unicode, py3: type str
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1382,34 +1117,6 @@ class InlineQueryResultVideo(InlineQueryResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultvideo_instance)`
-        """
-        return "InlineQueryResultVideo(type={self.type!r}, id={self.id!r}, video_url={self.video_url!r}, mime_type={self.mime_type!r}, thumb_url={self.thumb_url!r}, title={self.title!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, video_width={self.video_width!r}, video_height={self.video_height!r}, video_duration={self.video_duration!r}, description={self.description!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultvideo_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultVideo.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultVideo(type={self.type!r}, id={self.id!r}, video_url={self.video_url!r}, mime_type={self.mime_type!r}, thumb_url={self.thumb_url!r}, title={self.title!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, video_width={self.video_width!r}, video_height={self.video_height!r}, video_duration={self.video_duration!r}, description={self.description!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultvideo_instance`
-        """
-        return (
-            key in ["type", "id", "video_url", "mime_type", "thumb_url", "title", "caption", "parse_mode", "caption_entities", "video_width", "video_height", "video_duration", "description", "reply_markup", "input_message_content"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultVideo
 
 
@@ -1462,6 +1169,23 @@ class InlineQueryResultAudio(InlineQueryResult):
     :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
     """
 
+    __slots__ = ('audio_url', 'title', 'caption', 'parse_mode', 'caption_entities', 'performer', 'audio_duration', 'reply_markup', 'input_message_content')
+    _fields = ('type', 'id', 'audio_url', 'title', 'caption', 'parse_mode', 'caption_entities', 'performer', 'audio_duration', 'reply_markup', 'input_message_content')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('audio_url', 'audio_url', u, False),
+        ('title', 'title', u, False),
+        ('caption', 'caption', u, True),
+        ('parse_mode', 'parse_mode', u, True),
+        ('caption_entities', 'caption_entities', list, True),
+        ('performer', 'performer', u, True),
+        ('audio_duration', 'audio_duration', int, True),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+    )
+
     def __init__(self, id, audio_url, title, caption=None, parse_mode=None, caption_entities=None, performer=None, audio_duration=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to an MP3 audio file.
@@ -1511,76 +1235,33 @@ class InlineQueryResultAudio(InlineQueryResult):
         :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
         """
         super(InlineQueryResultAudio, self).__init__(id, "audio")
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(audio_url, unicode_type, parameter_name="audio_url")
+            assert_type_or_raise(title, unicode_type, parameter_name="title")
+            assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
+            assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
+            assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
+            assert_type_or_raise(performer, None, unicode_type, parameter_name="performer")
+            assert_type_or_raise(audio_duration, None, int, parameter_name="audio_duration")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+        # end if
 
         # type is given by class type
         # id is given by class type
-        assert_type_or_raise(audio_url, unicode_type, parameter_name="audio_url")
         self.audio_url = audio_url
-        assert_type_or_raise(title, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
         self.caption = caption
-        assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
         self.parse_mode = parse_mode
-        assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
         self.caption_entities = caption_entities
-        assert_type_or_raise(performer, None, unicode_type, parameter_name="performer")
         self.performer = performer
-        assert_type_or_raise(audio_duration, None, int, parameter_name="audio_duration")
         self.audio_duration = audio_duration
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultAudio to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultAudio, self).to_array()
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['audio_url'] = u(self.audio_url)  # py2: type unicode, py3: type str
-        array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        if self.caption is not None:
-            array['caption'] = u(self.caption)  # py2: type unicode, py3: type str
-        # end if
-        if self.parse_mode is not None:
-            array['parse_mode'] = u(self.parse_mode)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption_entities is not None:
-            array['caption_entities'] = self._as_array(self.caption_entities)  # type list of MessageEntity
-        # end if
-        if self.performer is not None:
-            array['performer'] = u(self.performer)  # py2: type unicode, py3: type str
-        # end if
-        if self.audio_duration is not None:
-            array['audio_duration'] = int(self.audio_duration)  # type int
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1624,34 +1305,6 @@ class InlineQueryResultAudio(InlineQueryResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultaudio_instance)`
-        """
-        return "InlineQueryResultAudio(type={self.type!r}, id={self.id!r}, audio_url={self.audio_url!r}, title={self.title!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, performer={self.performer!r}, audio_duration={self.audio_duration!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultaudio_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultAudio.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultAudio(type={self.type!r}, id={self.id!r}, audio_url={self.audio_url!r}, title={self.title!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, performer={self.performer!r}, audio_duration={self.audio_duration!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultaudio_instance`
-        """
-        return (
-            key in ["type", "id", "audio_url", "title", "caption", "parse_mode", "caption_entities", "performer", "audio_duration", "reply_markup", "input_message_content"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultAudio
 
 
@@ -1701,6 +1354,22 @@ class InlineQueryResultVoice(InlineQueryResult):
     :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
     """
 
+    __slots__ = ('type', 'voice_url', 'title', 'caption', 'parse_mode', 'caption_entities', 'voice_duration', 'reply_markup', 'input_message_content')
+    _fields = ('type', 'id', 'voice_url', 'title', 'caption', 'parse_mode', 'caption_entities', 'voice_duration', 'reply_markup', 'input_message_content')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('voice_url', 'voice_url', u, False),
+        ('title', 'title', u, False),
+        ('caption', 'caption', u, True),
+        ('parse_mode', 'parse_mode', u, True),
+        ('caption_entities', 'caption_entities', list, True),
+        ('voice_duration', 'voice_duration', int, True),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+    )
+
     def __init__(self, id, voice_url, title, caption=None, parse_mode=None, caption_entities=None, voice_duration=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a voice recording in an .OGG container encoded with OPUS.
@@ -1747,71 +1416,30 @@ class InlineQueryResultVoice(InlineQueryResult):
         :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
         """
         super(InlineQueryResultVoice, self).__init__(id, "voice")
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(voice_url, unicode_type, parameter_name="voice_url")
+            assert_type_or_raise(title, unicode_type, parameter_name="title")
+            assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
+            assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
+            assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
+            assert_type_or_raise(voice_duration, None, int, parameter_name="voice_duration")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+        # end if
         self.type = 'voice'
         # 'id' is given by class type
-        assert_type_or_raise(voice_url, unicode_type, parameter_name="voice_url")
         self.voice_url = voice_url
-        assert_type_or_raise(title, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
         self.caption = caption
-        assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
         self.parse_mode = parse_mode
-        assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
         self.caption_entities = caption_entities
-        assert_type_or_raise(voice_duration, None, int, parameter_name="voice_duration")
         self.voice_duration = voice_duration
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultVoice to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultVoice, self).to_array()
-
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        array['id'] = u(self.id)  # py2: type unicode, py3: type str
-        array['voice_url'] = u(self.voice_url)  # py2: type unicode, py3: type str
-        array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        if self.caption is not None:
-            array['caption'] = u(self.caption)  # py2: type unicode, py3: type str
-        # end if
-        if self.parse_mode is not None:
-            array['parse_mode'] = u(self.parse_mode)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption_entities is not None:
-            array['caption_entities'] = self._as_array(self.caption_entities)  # type list of MessageEntity
-        # end if
-        if self.voice_duration is not None:
-            array['voice_duration'] = int(self.voice_duration)  # type int
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1854,34 +1482,6 @@ class InlineQueryResultVoice(InlineQueryResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultvoice_instance)`
-        """
-        return "InlineQueryResultVoice(type={self.type!r}, id={self.id!r}, voice_url={self.voice_url!r}, title={self.title!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, voice_duration={self.voice_duration!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultvoice_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultVoice.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultVoice(type={self.type!r}, id={self.id!r}, voice_url={self.voice_url!r}, title={self.title!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, voice_duration={self.voice_duration!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultvoice_instance`
-        """
-        return (
-            key in ["type", "id", "voice_url", "title", "caption", "parse_mode", "caption_entities", "voice_duration", "reply_markup", "input_message_content"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultVoice
 
 
@@ -1944,6 +1544,26 @@ class InlineQueryResultDocument(InlineQueryResult):
     :type  thumb_height: int
     """
 
+    __slots__ = ('title', 'document_url', 'mime_type', 'caption', 'parse_mode', 'caption_entities', 'description', 'reply_markup', 'input_message_content', 'thumb_url', 'thumb_width', 'thumb_height')
+    _fields = ('type', 'id', 'title', 'document_url', 'mime_type', 'caption', 'parse_mode', 'caption_entities', 'description', 'reply_markup', 'input_message_content', 'thumb_url', 'thumb_width', 'thumb_height')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('title', 'title', u, False),
+        ('document_url', 'document_url', u, False),
+        ('mime_type', 'mime_type', u, False),
+        ('caption', 'caption', u, True),
+        ('parse_mode', 'parse_mode', u, True),
+        ('caption_entities', 'caption_entities', list, True),
+        ('description', 'description', u, True),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+        ('thumb_url', 'thumb_url', u, True),
+        ('thumb_width', 'thumb_width', int, True),
+        ('thumb_height', 'thumb_height', int, True),
+    )
+
     def __init__(self, id, title, document_url, mime_type, caption=None, parse_mode=None, caption_entities=None, description=None, reply_markup=None, input_message_content=None, thumb_url=None, thumb_width=None, thumb_height=None):
         """
         Represents a link to a file.
@@ -2003,89 +1623,39 @@ class InlineQueryResultDocument(InlineQueryResult):
         :type  thumb_height: int
         """
         super(InlineQueryResultDocument, self).__init__(id, "document")
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(title, unicode_type, parameter_name="title")
+            assert_type_or_raise(document_url, unicode_type, parameter_name="document_url")
+            assert_type_or_raise(mime_type, unicode_type, parameter_name="mime_type")
+            assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
+            assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
+            assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
+            assert_type_or_raise(description, None, unicode_type, parameter_name="description")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+            assert_type_or_raise(thumb_url, None, unicode_type, parameter_name="thumb_url")
+            assert_type_or_raise(thumb_width, None, int, parameter_name="thumb_width")
+            assert_type_or_raise(thumb_height, None, int, parameter_name="thumb_height")
+        # end if
 
         # 'type' is given by class type
         # 'id' is given by class type
-        assert_type_or_raise(title, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(document_url, unicode_type, parameter_name="document_url")
         self.document_url = document_url
-        assert_type_or_raise(mime_type, unicode_type, parameter_name="mime_type")
         self.mime_type = mime_type
-        assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
         self.caption = caption
-        assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
         self.parse_mode = parse_mode
-        assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
         self.caption_entities = caption_entities
-        assert_type_or_raise(description, None, unicode_type, parameter_name="description")
         self.description = description
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
-        assert_type_or_raise(thumb_url, None, unicode_type, parameter_name="thumb_url")
         self.thumb_url = thumb_url
-        assert_type_or_raise(thumb_width, None, int, parameter_name="thumb_width")
         self.thumb_width = thumb_width
-        assert_type_or_raise(thumb_height, None, int, parameter_name="thumb_height")
         self.thumb_height = thumb_height
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultDocument to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultDocument, self).to_array()
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        array['document_url'] = u(self.document_url)  # py2: type unicode, py3: type str
-        array['mime_type'] = u(self.mime_type)  # py2: type unicode, py3: type str
-        if self.caption is not None:
-            array['caption'] = u(self.caption)  # py2: type unicode, py3: type str
-        # end if
-        if self.parse_mode is not None:
-            array['parse_mode'] = u(self.parse_mode)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption_entities is not None:
-            array['caption_entities'] = self._as_array(self.caption_entities)  # type list of MessageEntity
-        # end if
-        if self.description is not None:
-            array['description'] = u(self.description)  # py2: type unicode, py3: type str
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        if self.thumb_url is not None:
-            array['thumb_url'] = u(self.thumb_url)  # py2: type unicode, py3: type str
-        # end if
-        if self.thumb_width is not None:
-            array['thumb_width'] = int(self.thumb_width)  # type int
-        # end if
-        if self.thumb_height is not None:
-            array['thumb_height'] = int(self.thumb_height)  # type int
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -2132,35 +1702,7 @@ class InlineQueryResultDocument(InlineQueryResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultdocument_instance)`
-        """
-        return "InlineQueryResultDocument(type={self.type!r}, id={self.id!r}, title={self.title!r}, document_url={self.document_url!r}, mime_type={self.mime_type!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, description={self.description!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r}, thumb_url={self.thumb_url!r}, thumb_width={self.thumb_width!r}, thumb_height={self.thumb_height!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultdocument_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultDocument.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultDocument(type={self.type!r}, id={self.id!r}, title={self.title!r}, document_url={self.document_url!r}, mime_type={self.mime_type!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, description={self.description!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r}, thumb_url={self.thumb_url!r}, thumb_width={self.thumb_width!r}, thumb_height={self.thumb_height!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultdocument_instance`
-        """
-        return (
-            key in ["type", "id", "title", "document_url", "mime_type", "caption", "parse_mode", "caption_entities", "description", "reply_markup", "input_message_content", "thumb_url", "thumb_width", "thumb_height"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
-# end class InlineQueryResultDocument
+# end class InlineQueryResultDocument
 
 
 class InlineQueryResultLocation(InlineQueryResult):
@@ -2222,6 +1764,26 @@ class InlineQueryResultLocation(InlineQueryResult):
     :type  thumb_height: int
     """
 
+    __slots__ = ('latitude', 'longitude', 'title', 'horizontal_accuracy', 'live_period', 'heading', 'proximity_alert_radius', 'reply_markup', 'input_message_content', 'thumb_url', 'thumb_width', 'thumb_height')
+    _fields = ('type', 'id', 'latitude', 'longitude', 'title', 'horizontal_accuracy', 'live_period', 'heading', 'proximity_alert_radius', 'reply_markup', 'input_message_content', 'thumb_url', 'thumb_width', 'thumb_height')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('latitude', 'latitude', float, False),
+        ('longitude', 'longitude', float, False),
+        ('title', 'title', u, False),
+        ('horizontal_accuracy', 'horizontal_accuracy', float, True),
+        ('live_period', 'live_period', int, True),
+        ('heading', 'heading', int, True),
+        ('proximity_alert_radius', 'proximity_alert_radius', int, True),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+        ('thumb_url', 'thumb_url', u, True),
+        ('thumb_width', 'thumb_width', int, True),
+        ('thumb_height', 'thumb_height', int, True),
+    )
+
     def __init__(self, id, latitude, longitude, title, horizontal_accuracy=None, live_period=None, heading=None, proximity_alert_radius=None, reply_markup=None, input_message_content=None, thumb_url=None, thumb_width=None, thumb_height=None):
         """
         Represents a location on a map.
@@ -2281,87 +1843,38 @@ class InlineQueryResultLocation(InlineQueryResult):
         :type  thumb_height: int
         """
         super(InlineQueryResultLocation, self).__init__(id, "location")
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(latitude, float, parameter_name="latitude")
+            assert_type_or_raise(longitude, float, parameter_name="longitude")
+            assert_type_or_raise(title, unicode_type, parameter_name="title")
+            assert_type_or_raise(horizontal_accuracy, None, float, parameter_name="horizontal_accuracy")
+            assert_type_or_raise(live_period, None, int, parameter_name="live_period")
+            assert_type_or_raise(heading, None, int, parameter_name="heading")
+            assert_type_or_raise(proximity_alert_radius, None, int, parameter_name="proximity_alert_radius")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+            assert_type_or_raise(thumb_url, None, unicode_type, parameter_name="thumb_url")
+            assert_type_or_raise(thumb_width, None, int, parameter_name="thumb_width")
+            assert_type_or_raise(thumb_height, None, int, parameter_name="thumb_height")
+        # end if
 
         # 'type' is given by class type
         # 'id' is given by class type
-        assert_type_or_raise(latitude, float, parameter_name="latitude")
         self.latitude = latitude
-        assert_type_or_raise(longitude, float, parameter_name="longitude")
         self.longitude = longitude
-        assert_type_or_raise(title, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(horizontal_accuracy, None, float, parameter_name="horizontal_accuracy")
         self.horizontal_accuracy = horizontal_accuracy
-        assert_type_or_raise(live_period, None, int, parameter_name="live_period")
         self.live_period = live_period
-        assert_type_or_raise(heading, None, int, parameter_name="heading")
         self.heading = heading
-        assert_type_or_raise(proximity_alert_radius, None, int, parameter_name="proximity_alert_radius")
         self.proximity_alert_radius = proximity_alert_radius
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
-        assert_type_or_raise(thumb_url, None, unicode_type, parameter_name="thumb_url")
         self.thumb_url = thumb_url
-        assert_type_or_raise(thumb_width, None, int, parameter_name="thumb_width")
         self.thumb_width = thumb_width
-        assert_type_or_raise(thumb_height, None, int, parameter_name="thumb_height")
         self.thumb_height = thumb_height
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultLocation to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultLocation, self).to_array()
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['latitude'] = float(self.latitude)  # type float
-        array['longitude'] = float(self.longitude)  # type float
-        array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        if self.horizontal_accuracy is not None:
-            array['horizontal_accuracy'] = float(self.horizontal_accuracy)  # type float
-        # end if
-        if self.live_period is not None:
-            array['live_period'] = int(self.live_period)  # type int
-        # end if
-        if self.heading is not None:
-            array['heading'] = int(self.heading)  # type int
-        # end if
-        if self.proximity_alert_radius is not None:
-            array['proximity_alert_radius'] = int(self.proximity_alert_radius)  # type int
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        if self.thumb_url is not None:
-            array['thumb_url'] = u(self.thumb_url)  # py2: type unicode, py3: type str
-        # end if
-        if self.thumb_width is not None:
-            array['thumb_width'] = int(self.thumb_width)  # type int
-        # end if
-        if self.thumb_height is not None:
-            array['thumb_height'] = int(self.thumb_height)  # type int
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -2407,34 +1920,6 @@ class InlineQueryResultLocation(InlineQueryResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultlocation_instance)`
-        """
-        return "InlineQueryResultLocation(type={self.type!r}, id={self.id!r}, latitude={self.latitude!r}, longitude={self.longitude!r}, title={self.title!r}, horizontal_accuracy={self.horizontal_accuracy!r}, live_period={self.live_period!r}, heading={self.heading!r}, proximity_alert_radius={self.proximity_alert_radius!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r}, thumb_url={self.thumb_url!r}, thumb_width={self.thumb_width!r}, thumb_height={self.thumb_height!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultlocation_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultLocation.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultLocation(type={self.type!r}, id={self.id!r}, latitude={self.latitude!r}, longitude={self.longitude!r}, title={self.title!r}, horizontal_accuracy={self.horizontal_accuracy!r}, live_period={self.live_period!r}, heading={self.heading!r}, proximity_alert_radius={self.proximity_alert_radius!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r}, thumb_url={self.thumb_url!r}, thumb_width={self.thumb_width!r}, thumb_height={self.thumb_height!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultlocation_instance`
-        """
-        return (
-            key in ["type", "id", "latitude", "longitude", "title", "horizontal_accuracy", "live_period", "heading", "proximity_alert_radius", "reply_markup", "input_message_content", "thumb_url", "thumb_width", "thumb_height"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultLocation
 
 
@@ -2500,6 +1985,27 @@ class InlineQueryResultVenue(InlineQueryResult):
     :type  thumb_height: int
     """
 
+    __slots__ = ('id', 'latitude', 'longitude', 'title', 'address', 'foursquare_id', 'foursquare_type', 'google_place_id', 'google_place_type', 'reply_markup', 'input_message_content', 'thumb_url', 'thumb_width', 'thumb_height')
+    _fields = ('type', 'id', 'latitude', 'longitude', 'title', 'address', 'foursquare_id', 'foursquare_type', 'google_place_id', 'google_place_type', 'reply_markup', 'input_message_content', 'thumb_url', 'thumb_width', 'thumb_height')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('latitude', 'latitude', float, False),
+        ('longitude', 'longitude', float, False),
+        ('title', 'title', u, False),
+        ('address', 'address', u, False),
+        ('foursquare_id', 'foursquare_id', u, True),
+        ('foursquare_type', 'foursquare_type', u, True),
+        ('google_place_id', 'google_place_id', u, True),
+        ('google_place_type', 'google_place_type', u, True),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+        ('thumb_url', 'thumb_url', u, True),
+        ('thumb_width', 'thumb_width', int, True),
+        ('thumb_height', 'thumb_height', int, True),
+    )
+
     def __init__(self, id, latitude, longitude, title, address, foursquare_id=None, foursquare_type=None, google_place_id=None, google_place_type=None, reply_markup=None, input_message_content=None, thumb_url=None, thumb_width=None, thumb_height=None):
         """
         Represents a venue.
@@ -2562,92 +2068,42 @@ class InlineQueryResultVenue(InlineQueryResult):
         :type  thumb_height: int
         """
         super(InlineQueryResultVenue, self).__init__(id, "venue")
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(id, unicode_type, parameter_name="id")
+            assert_type_or_raise(latitude, float, parameter_name="latitude")
+            assert_type_or_raise(longitude, float, parameter_name="longitude")
+            assert_type_or_raise(title, unicode_type, parameter_name="title")
+            assert_type_or_raise(address, unicode_type, parameter_name="address")
+            assert_type_or_raise(foursquare_id, None, unicode_type, parameter_name="foursquare_id")
+            assert_type_or_raise(foursquare_type, None, unicode_type, parameter_name="foursquare_type")
+            assert_type_or_raise(google_place_id, None, unicode_type, parameter_name="google_place_id")
+            assert_type_or_raise(google_place_type, None, unicode_type, parameter_name="google_place_type")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+            assert_type_or_raise(thumb_url, None, unicode_type, parameter_name="thumb_url")
+            assert_type_or_raise(thumb_width, None, int, parameter_name="thumb_width")
+            assert_type_or_raise(thumb_height, None, int, parameter_name="thumb_height")
+        # end if
 
         # 'type' is given by class type
         # 'id' is given by class type
-        assert_type_or_raise(id, unicode_type, parameter_name="id")
         self.id = id
-        assert_type_or_raise(latitude, float, parameter_name="latitude")
         self.latitude = latitude
-        assert_type_or_raise(longitude, float, parameter_name="longitude")
         self.longitude = longitude
-        assert_type_or_raise(title, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(address, unicode_type, parameter_name="address")
         self.address = address
-        assert_type_or_raise(foursquare_id, None, unicode_type, parameter_name="foursquare_id")
         self.foursquare_id = foursquare_id
-        assert_type_or_raise(foursquare_type, None, unicode_type, parameter_name="foursquare_type")
         self.foursquare_type = foursquare_type
-        assert_type_or_raise(google_place_id, None, unicode_type, parameter_name="google_place_id")
         self.google_place_id = google_place_id
-        assert_type_or_raise(google_place_type, None, unicode_type, parameter_name="google_place_type")
         self.google_place_type = google_place_type
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
-        assert_type_or_raise(thumb_url, None, unicode_type, parameter_name="thumb_url")
         self.thumb_url = thumb_url
-        assert_type_or_raise(thumb_width, None, int, parameter_name="thumb_width")
         self.thumb_width = thumb_width
-        assert_type_or_raise(thumb_height, None, int, parameter_name="thumb_height")
         self.thumb_height = thumb_height
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultVenue to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultVenue, self).to_array()
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['latitude'] = float(self.latitude)  # type float
-        array['longitude'] = float(self.longitude)  # type float
-        array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        array['address'] = u(self.address)  # py2: type unicode, py3: type str
-        if self.foursquare_id is not None:
-            array['foursquare_id'] = u(self.foursquare_id)  # py2: type unicode, py3: type str
-        # end if
-        if self.foursquare_type is not None:
-            array['foursquare_type'] = u(self.foursquare_type)  # py2: type unicode, py3: type str
-        # end if
-        if self.google_place_id is not None:
-            array['google_place_id'] = u(self.google_place_id)  # py2: type unicode, py3: type str
-        # end if
-        if self.google_place_type is not None:
-            array['google_place_type'] = u(self.google_place_type)  # py2: type unicode, py3: type str
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        if self.thumb_url is not None:
-            array['thumb_url'] = u(self.thumb_url)  # py2: type unicode, py3: type str
-        # end if
-        if self.thumb_width is not None:
-            array['thumb_width'] = int(self.thumb_width)  # type int
-        # end if
-        if self.thumb_height is not None:
-            array['thumb_height'] = int(self.thumb_height)  # type int
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -2694,34 +2150,6 @@ class InlineQueryResultVenue(InlineQueryResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultvenue_instance)`
-        """
-        return "InlineQueryResultVenue(type={self.type!r}, id={self.id!r}, latitude={self.latitude!r}, longitude={self.longitude!r}, title={self.title!r}, address={self.address!r}, foursquare_id={self.foursquare_id!r}, foursquare_type={self.foursquare_type!r}, google_place_id={self.google_place_id!r}, google_place_type={self.google_place_type!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r}, thumb_url={self.thumb_url!r}, thumb_width={self.thumb_width!r}, thumb_height={self.thumb_height!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultvenue_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultVenue.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultVenue(type={self.type!r}, id={self.id!r}, latitude={self.latitude!r}, longitude={self.longitude!r}, title={self.title!r}, address={self.address!r}, foursquare_id={self.foursquare_id!r}, foursquare_type={self.foursquare_type!r}, google_place_id={self.google_place_id!r}, google_place_type={self.google_place_type!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r}, thumb_url={self.thumb_url!r}, thumb_width={self.thumb_width!r}, thumb_height={self.thumb_height!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultvenue_instance`
-        """
-        return (
-            key in ["type", "id", "latitude", "longitude", "title", "address", "foursquare_id", "foursquare_type", "google_place_id", "google_place_type", "reply_markup", "input_message_content", "thumb_url", "thumb_width", "thumb_height"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultVenue
 
 
@@ -2773,6 +2201,23 @@ class InlineQueryResultContact(InlineQueryResult):
     :type  thumb_height: int
     """
 
+    __slots__ = ('phone_number', 'first_name', 'last_name', 'vcard', 'reply_markup', 'input_message_content', 'thumb_url', 'thumb_width', 'thumb_height')
+    _fields = ('type', 'id', 'phone_number', 'first_name', 'last_name', 'vcard', 'reply_markup', 'input_message_content', 'thumb_url', 'thumb_width', 'thumb_height')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('phone_number', 'phone_number', u, False),
+        ('first_name', 'first_name', u, False),
+        ('last_name', 'last_name', u, True),
+        ('vcard', 'vcard', u, True),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+        ('thumb_url', 'thumb_url', u, True),
+        ('thumb_width', 'thumb_width', int, True),
+        ('thumb_height', 'thumb_height', int, True),
+    )
+
     def __init__(self, id, phone_number, first_name, last_name=None, vcard=None, reply_markup=None, input_message_content=None, thumb_url=None, thumb_width=None, thumb_height=None):
         """
         Represents a contact with a phone number.
@@ -2821,74 +2266,32 @@ class InlineQueryResultContact(InlineQueryResult):
         :type  thumb_height: int
         """
         super(InlineQueryResultContact, self).__init__(id, "contact")
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(phone_number, unicode_type, parameter_name="phone_number")
+            assert_type_or_raise(first_name, unicode_type, parameter_name="first_name")
+            assert_type_or_raise(last_name, None, unicode_type, parameter_name="last_name")
+            assert_type_or_raise(vcard, None, unicode_type, parameter_name="vcard")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+            assert_type_or_raise(thumb_url, None, unicode_type, parameter_name="thumb_url")
+            assert_type_or_raise(thumb_width, None, int, parameter_name="thumb_width")
+            assert_type_or_raise(thumb_height, None, int, parameter_name="thumb_height")
+        # end if
 
         # 'type' is given by class type
         # 'id' is given by class type
-        assert_type_or_raise(phone_number, unicode_type, parameter_name="phone_number")
         self.phone_number = phone_number
-        assert_type_or_raise(first_name, unicode_type, parameter_name="first_name")
         self.first_name = first_name
-        assert_type_or_raise(last_name, None, unicode_type, parameter_name="last_name")
         self.last_name = last_name
-        assert_type_or_raise(vcard, None, unicode_type, parameter_name="vcard")
         self.vcard = vcard
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
-        assert_type_or_raise(thumb_url, None, unicode_type, parameter_name="thumb_url")
         self.thumb_url = thumb_url
-        assert_type_or_raise(thumb_width, None, int, parameter_name="thumb_width")
         self.thumb_width = thumb_width
-        assert_type_or_raise(thumb_height, None, int, parameter_name="thumb_height")
         self.thumb_height = thumb_height
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultContact to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultContact, self).to_array()
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['phone_number'] = u(self.phone_number)  # py2: type unicode, py3: type str
-        array['first_name'] = u(self.first_name)  # py2: type unicode, py3: type str
-        if self.last_name is not None:
-            array['last_name'] = u(self.last_name)  # py2: type unicode, py3: type str
-        # end if
-        if self.vcard is not None:
-            array['vcard'] = u(self.vcard)  # py2: type unicode, py3: type str
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        if self.thumb_url is not None:
-            array['thumb_url'] = u(self.thumb_url)  # py2: type unicode, py3: type str
-        # end if
-        if self.thumb_width is not None:
-            array['thumb_width'] = int(self.thumb_width)  # type int
-        # end if
-        if self.thumb_height is not None:
-            array['thumb_height'] = int(self.thumb_height)  # type int
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -2932,34 +2335,6 @@ class InlineQueryResultContact(InlineQueryResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultcontact_instance)`
-        """
-        return "InlineQueryResultContact(type={self.type!r}, id={self.id!r}, phone_number={self.phone_number!r}, first_name={self.first_name!r}, last_name={self.last_name!r}, vcard={self.vcard!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r}, thumb_url={self.thumb_url!r}, thumb_width={self.thumb_width!r}, thumb_height={self.thumb_height!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultcontact_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultContact.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultContact(type={self.type!r}, id={self.id!r}, phone_number={self.phone_number!r}, first_name={self.first_name!r}, last_name={self.last_name!r}, vcard={self.vcard!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r}, thumb_url={self.thumb_url!r}, thumb_width={self.thumb_width!r}, thumb_height={self.thumb_height!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultcontact_instance`
-        """
-        return (
-            key in ["type", "id", "phone_number", "first_name", "last_name", "vcard", "reply_markup", "input_message_content", "thumb_url", "thumb_width", "thumb_height"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultContact
 
 
@@ -2988,6 +2363,16 @@ class InlineQueryResultGame(InlineQueryResult):
     :type  reply_markup: pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup
     """
 
+    __slots__ = ('game_short_name', 'reply_markup')
+    _fields = ('type', 'id', 'game_short_name', 'reply_markup')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('game_short_name', 'game_short_name', u, False),
+        ('reply_markup', 'reply_markup', None, True),
+    )
+
     def __init__(self, id, game_short_name, reply_markup=None):
         """
         Represents a Game.
@@ -3013,41 +2398,18 @@ class InlineQueryResultGame(InlineQueryResult):
         :type  reply_markup: pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup
         """
         super(InlineQueryResultGame, self).__init__(id, "game")
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(game_short_name, unicode_type, parameter_name="game_short_name")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+        # end if
 
         # 'type' is given by class type
         # 'id' is given by class type
-        assert_type_or_raise(game_short_name, unicode_type, parameter_name="game_short_name")
         self.game_short_name = game_short_name
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultGame to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultGame, self).to_array()
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['game_short_name'] = u(self.game_short_name)  # py2: type unicode, py3: type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -3083,34 +2445,6 @@ class InlineQueryResultGame(InlineQueryResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultgame_instance)`
-        """
-        return "InlineQueryResultGame(type={self.type!r}, id={self.id!r}, game_short_name={self.game_short_name!r}, reply_markup={self.reply_markup!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultgame_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultGame.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultGame(type={self.type!r}, id={self.id!r}, game_short_name={self.game_short_name!r}, reply_markup={self.reply_markup!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultgame_instance`
-        """
-        return (
-            key in ["type", "id", "game_short_name", "reply_markup"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultGame
 
 
@@ -3157,6 +2491,22 @@ class InlineQueryResultCachedPhoto(InlineQueryCachedResult):
     :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
     """
 
+    __slots__ = ('photo_file_id', 'title', 'description', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')
+    _fields = ('type', 'id', 'photo_file_id', 'title', 'description', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('photo_file_id', 'photo_file_id', u, False),
+        ('title', 'title', u, True),
+        ('description', 'description', u, True),
+        ('caption', 'caption', u, True),
+        ('parse_mode', 'parse_mode', u, True),
+        ('caption_entities', 'caption_entities', list, True),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+    )
+
     def __init__(self, id, photo_file_id, title=None, description=None, caption=None, parse_mode=None, caption_entities=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a photo stored on the Telegram servers.
@@ -3200,74 +2550,31 @@ class InlineQueryResultCachedPhoto(InlineQueryCachedResult):
         :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
         """
         super(InlineQueryResultCachedPhoto, self).__init__(id, "photo")
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(photo_file_id, unicode_type, parameter_name="photo_file_id")
+            assert_type_or_raise(title, None, unicode_type, parameter_name="title")
+            assert_type_or_raise(description, None, unicode_type, parameter_name="description")
+            assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
+            assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
+            assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+        # end if
 
         # 'type' is given by class type
         # 'id' is given by class type
-        assert_type_or_raise(photo_file_id, unicode_type, parameter_name="photo_file_id")
         self.photo_file_id = photo_file_id
-        assert_type_or_raise(title, None, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(description, None, unicode_type, parameter_name="description")
         self.description = description
-        assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
         self.caption = caption
-        assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
         self.parse_mode = parse_mode
-        assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
         self.caption_entities = caption_entities
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultCachedPhoto to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultCachedPhoto, self).to_array()
-
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['photo_file_id'] = u(self.photo_file_id)  # py2: type unicode, py3: type str
-        if self.title is not None:
-            array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        # end if
-        if self.description is not None:
-            array['description'] = u(self.description)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption is not None:
-            array['caption'] = u(self.caption)  # py2: type unicode, py3: type str
-        # end if
-        if self.parse_mode is not None:
-            array['parse_mode'] = u(self.parse_mode)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption_entities is not None:
-            array['caption_entities'] = self._as_array(self.caption_entities)  # type list of MessageEntity
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -3310,34 +2617,6 @@ class InlineQueryResultCachedPhoto(InlineQueryCachedResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultcachedphoto_instance)`
-        """
-        return "InlineQueryResultCachedPhoto(type={self.type!r}, id={self.id!r}, photo_file_id={self.photo_file_id!r}, title={self.title!r}, description={self.description!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultcachedphoto_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultCachedPhoto.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultCachedPhoto(type={self.type!r}, id={self.id!r}, photo_file_id={self.photo_file_id!r}, title={self.title!r}, description={self.description!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultcachedphoto_instance`
-        """
-        return (
-            key in ["type", "id", "photo_file_id", "title", "description", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultCachedPhoto
 
 
@@ -3381,6 +2660,21 @@ class InlineQueryResultCachedGif(InlineQueryCachedResult):
     :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
     """
 
+    __slots__ = ('gif_file_id', 'title', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')
+    _fields = ('type', 'id', 'gif_file_id', 'title', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('gif_file_id', 'gif_file_id', u, False),
+        ('title', 'title', u, True),
+        ('caption', 'caption', u, True),
+        ('parse_mode', 'parse_mode', u, True),
+        ('caption_entities', 'caption_entities', list, True),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+    )
+
     def __init__(self, id, gif_file_id, title=None, caption=None, parse_mode=None, caption_entities=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to an animated GIF file stored on the Telegram servers.
@@ -3421,68 +2715,29 @@ class InlineQueryResultCachedGif(InlineQueryCachedResult):
         :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
         """
         super(InlineQueryResultCachedGif, self).__init__(id, "gif")
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(gif_file_id, unicode_type, parameter_name="gif_file_id")
+            assert_type_or_raise(title, None, unicode_type, parameter_name="title")
+            assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
+            assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
+            assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+        # end if
 
         # 'type' is given by class type
         # 'id' is given by class type
-        assert_type_or_raise(gif_file_id, unicode_type, parameter_name="gif_file_id")
         self.gif_file_id = gif_file_id
-        assert_type_or_raise(title, None, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
         self.caption = caption
-        assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
         self.parse_mode = parse_mode
-        assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
         self.caption_entities = caption_entities
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultCachedGif to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultCachedGif, self).to_array()
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['gif_file_id'] = u(self.gif_file_id)  # py2: type unicode, py3: type str
-        if self.title is not None:
-            array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption is not None:
-            array['caption'] = u(self.caption)  # py2: type unicode, py3: type str
-        # end if
-        if self.parse_mode is not None:
-            array['parse_mode'] = u(self.parse_mode)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption_entities is not None:
-            array['caption_entities'] = self._as_array(self.caption_entities)  # type list of MessageEntity
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -3524,34 +2779,6 @@ class InlineQueryResultCachedGif(InlineQueryCachedResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultcachedgif_instance)`
-        """
-        return "InlineQueryResultCachedGif(type={self.type!r}, id={self.id!r}, gif_file_id={self.gif_file_id!r}, title={self.title!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultcachedgif_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultCachedGif.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultCachedGif(type={self.type!r}, id={self.id!r}, gif_file_id={self.gif_file_id!r}, title={self.title!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultcachedgif_instance`
-        """
-        return (
-            key in ["type", "id", "gif_file_id", "title", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultCachedGif
 
 
@@ -3595,6 +2822,21 @@ class InlineQueryResultCachedMpeg4Gif(InlineQueryCachedResult):
     :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
     """
 
+    __slots__ = ('mpeg4_file_id', 'title', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')
+    _fields = ('type', 'id', 'mpeg4_file_id', 'title', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('mpeg4_file_id', 'mpeg4_file_id', u, False),
+        ('title', 'title', u, True),
+        ('caption', 'caption', u, True),
+        ('parse_mode', 'parse_mode', u, True),
+        ('caption_entities', 'caption_entities', list, True),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+    )
+
     def __init__(self, id, mpeg4_file_id, title=None, caption=None, parse_mode=None, caption_entities=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a video animation (H.264/MPEG-4 AVC video without sound) stored on the Telegram servers.
@@ -3635,68 +2877,29 @@ class InlineQueryResultCachedMpeg4Gif(InlineQueryCachedResult):
         :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
         """
         super(InlineQueryResultCachedMpeg4Gif, self).__init__()
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(mpeg4_file_id, unicode_type, parameter_name="mpeg4_file_id")
+            assert_type_or_raise(title, None, unicode_type, parameter_name="title")
+            assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
+            assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
+            assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+        # end if
 
         # 'type' is given by class type
         # 'id' is given by class type
-        assert_type_or_raise(mpeg4_file_id, unicode_type, parameter_name="mpeg4_file_id")
         self.mpeg4_file_id = mpeg4_file_id
-        assert_type_or_raise(title, None, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
         self.caption = caption
-        assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
         self.parse_mode = parse_mode
-        assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
         self.caption_entities = caption_entities
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultCachedMpeg4Gif to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultCachedMpeg4Gif, self).to_array()
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['mpeg4_file_id'] = u(self.mpeg4_file_id)  # py2: type unicode, py3: type str
-        if self.title is not None:
-            array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption is not None:
-            array['caption'] = u(self.caption)  # py2: type unicode, py3: type str
-        # end if
-        if self.parse_mode is not None:
-            array['parse_mode'] = u(self.parse_mode)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption_entities is not None:
-            array['caption_entities'] = self._as_array(self.caption_entities)  # type list of MessageEntity
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -3738,34 +2941,6 @@ class InlineQueryResultCachedMpeg4Gif(InlineQueryCachedResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultcachedmpeg4gif_instance)`
-        """
-        return "InlineQueryResultCachedMpeg4Gif(type={self.type!r}, id={self.id!r}, mpeg4_file_id={self.mpeg4_file_id!r}, title={self.title!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultcachedmpeg4gif_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultCachedMpeg4Gif.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultCachedMpeg4Gif(type={self.type!r}, id={self.id!r}, mpeg4_file_id={self.mpeg4_file_id!r}, title={self.title!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultcachedmpeg4gif_instance`
-        """
-        return (
-            key in ["type", "id", "mpeg4_file_id", "title", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultCachedMpeg4Gif
 
 
@@ -3799,6 +2974,17 @@ class InlineQueryResultCachedSticker(InlineQueryCachedResult):
     :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
     """
 
+    __slots__ = ('sticker_file_id', 'reply_markup', 'input_message_content')
+    _fields = ('type', 'id', 'sticker_file_id', 'reply_markup', 'input_message_content')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('sticker_file_id', 'sticker_file_id', u, False),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+    )
+
     def __init__(self, id, sticker_file_id, reply_markup=None, input_message_content=None):
         """
         Represents a link to a sticker stored on the Telegram servers.
@@ -3829,46 +3015,20 @@ class InlineQueryResultCachedSticker(InlineQueryCachedResult):
         :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
         """
         super(InlineQueryResultCachedSticker, self).__init__(id, "sticker")
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(sticker_file_id, unicode_type, parameter_name="sticker_file_id")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+        # end if
 
         # 'type' is given by class type
         # 'id' is given by class type
-        assert_type_or_raise(sticker_file_id, unicode_type, parameter_name="sticker_file_id")
         self.sticker_file_id = sticker_file_id
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultCachedSticker to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultCachedSticker, self).to_array()
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['sticker_file_id'] = u(self.sticker_file_id)  # py2: type unicode, py3: type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -3905,34 +3065,6 @@ class InlineQueryResultCachedSticker(InlineQueryCachedResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultcachedsticker_instance)`
-        """
-        return "InlineQueryResultCachedSticker(type={self.type!r}, id={self.id!r}, sticker_file_id={self.sticker_file_id!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultcachedsticker_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultCachedSticker.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultCachedSticker(type={self.type!r}, id={self.id!r}, sticker_file_id={self.sticker_file_id!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultcachedsticker_instance`
-        """
-        return (
-            key in ["type", "id", "sticker_file_id", "reply_markup", "input_message_content"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultCachedSticker
 
 
@@ -3982,6 +3114,22 @@ class InlineQueryResultCachedDocument(InlineQueryCachedResult):
     :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
     """
 
+    __slots__ = ('title', 'document_file_id', 'description', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')
+    _fields = ('type', 'id', 'title', 'document_file_id', 'description', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('title', 'title', u, False),
+        ('document_file_id', 'document_file_id', u, False),
+        ('description', 'description', u, True),
+        ('caption', 'caption', u, True),
+        ('parse_mode', 'parse_mode', u, True),
+        ('caption_entities', 'caption_entities', list, True),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+    )
+
     def __init__(self, id, title, document_file_id, description=None, caption=None, parse_mode=None, caption_entities=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a file stored on the Telegram servers.
@@ -4028,71 +3176,31 @@ class InlineQueryResultCachedDocument(InlineQueryCachedResult):
         :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
         """
         super(InlineQueryResultCachedDocument, self).__init__(id, "document")
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(title, unicode_type, parameter_name="title")
+            assert_type_or_raise(document_file_id, unicode_type, parameter_name="document_file_id")
+            assert_type_or_raise(description, None, unicode_type, parameter_name="description")
+            assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
+            assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
+            assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+        # end if
 
         # 'type' is given by class type
         # 'id' is given by class type
-        assert_type_or_raise(title, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(document_file_id, unicode_type, parameter_name="document_file_id")
         self.document_file_id = document_file_id
-        assert_type_or_raise(description, None, unicode_type, parameter_name="description")
         self.description = description
-        assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
         self.caption = caption
-        assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
         self.parse_mode = parse_mode
-        assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
         self.caption_entities = caption_entities
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultCachedDocument to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultCachedDocument, self).to_array()
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        array['document_file_id'] = u(self.document_file_id)  # py2: type unicode, py3: type str
-        if self.description is not None:
-            array['description'] = u(self.description)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption is not None:
-            array['caption'] = u(self.caption)  # py2: type unicode, py3: type str
-        # end if
-        if self.parse_mode is not None:
-            array['parse_mode'] = u(self.parse_mode)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption_entities is not None:
-            array['caption_entities'] = self._as_array(self.caption_entities)  # type list of MessageEntity
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -4135,34 +3243,6 @@ class InlineQueryResultCachedDocument(InlineQueryCachedResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultcacheddocument_instance)`
-        """
-        return "InlineQueryResultCachedDocument(type={self.type!r}, id={self.id!r}, title={self.title!r}, document_file_id={self.document_file_id!r}, description={self.description!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultcacheddocument_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultCachedDocument.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultCachedDocument(type={self.type!r}, id={self.id!r}, title={self.title!r}, document_file_id={self.document_file_id!r}, description={self.description!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultcacheddocument_instance`
-        """
-        return (
-            key in ["type", "id", "title", "document_file_id", "description", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultCachedDocument
 
 
@@ -4209,6 +3289,22 @@ class InlineQueryResultCachedVideo(InlineQueryCachedResult):
     :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
     """
 
+    __slots__ = ('video_file_id', 'title', 'description', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')
+    _fields = ('type', 'id', 'video_file_id', 'title', 'description', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('video_file_id', 'video_file_id', u, False),
+        ('title', 'title', u, False),
+        ('description', 'description', u, True),
+        ('caption', 'caption', u, True),
+        ('parse_mode', 'parse_mode', u, True),
+        ('caption_entities', 'caption_entities', list, True),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+    )
+
     def __init__(self, id, video_file_id, title, description=None, caption=None, parse_mode=None, caption_entities=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a video file stored on the Telegram servers.
@@ -4252,71 +3348,31 @@ class InlineQueryResultCachedVideo(InlineQueryCachedResult):
         :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
         """
         super(InlineQueryResultCachedVideo, self).__init__(id, "video")
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(video_file_id, unicode_type, parameter_name="video_file_id")
+            assert_type_or_raise(title, unicode_type, parameter_name="title")
+            assert_type_or_raise(description, None, unicode_type, parameter_name="description")
+            assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
+            assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
+            assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+        # end if
 
         # 'type' is given by class type
         # 'id' is given by class type
-        assert_type_or_raise(video_file_id, unicode_type, parameter_name="video_file_id")
         self.video_file_id = video_file_id
-        assert_type_or_raise(title, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(description, None, unicode_type, parameter_name="description")
         self.description = description
-        assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
         self.caption = caption
-        assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
         self.parse_mode = parse_mode
-        assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
         self.caption_entities = caption_entities
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultCachedVideo to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultCachedVideo, self).to_array()
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['video_file_id'] = u(self.video_file_id)  # py2: type unicode, py3: type str
-        array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        if self.description is not None:
-            array['description'] = u(self.description)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption is not None:
-            array['caption'] = u(self.caption)  # py2: type unicode, py3: type str
-        # end if
-        if self.parse_mode is not None:
-            array['parse_mode'] = u(self.parse_mode)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption_entities is not None:
-            array['caption_entities'] = self._as_array(self.caption_entities)  # type list of MessageEntity
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -4359,34 +3415,6 @@ class InlineQueryResultCachedVideo(InlineQueryCachedResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultcachedvideo_instance)`
-        """
-        return "InlineQueryResultCachedVideo(type={self.type!r}, id={self.id!r}, video_file_id={self.video_file_id!r}, title={self.title!r}, description={self.description!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultcachedvideo_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultCachedVideo.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultCachedVideo(type={self.type!r}, id={self.id!r}, video_file_id={self.video_file_id!r}, title={self.title!r}, description={self.description!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultcachedvideo_instance`
-        """
-        return (
-            key in ["type", "id", "video_file_id", "title", "description", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultCachedVideo
 
 
@@ -4433,6 +3461,21 @@ class InlineQueryResultCachedVoice(InlineQueryCachedResult):
     :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
     """
 
+    __slots__ = ('voice_file_id', 'title', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')
+    _fields = ('type', 'id', 'voice_file_id', 'title', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('voice_file_id', 'voice_file_id', u, False),
+        ('title', 'title', u, False),
+        ('caption', 'caption', u, True),
+        ('parse_mode', 'parse_mode', u, True),
+        ('caption_entities', 'caption_entities', list, True),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+    )
+
     def __init__(self, id, voice_file_id, title, caption=None, parse_mode=None, caption_entities=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a voice message stored on the Telegram servers.
@@ -4476,66 +3519,29 @@ class InlineQueryResultCachedVoice(InlineQueryCachedResult):
         :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
         """
         super(InlineQueryResultCachedVoice, self).__init__(id, "voice")
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(voice_file_id, unicode_type, parameter_name="voice_file_id")
+            assert_type_or_raise(title, unicode_type, parameter_name="title")
+            assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
+            assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
+            assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+        # end if
 
         # 'type' is given by class type
         # 'id' is given by class type
-        assert_type_or_raise(voice_file_id, unicode_type, parameter_name="voice_file_id")
         self.voice_file_id = voice_file_id
-        assert_type_or_raise(title, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
         self.caption = caption
-        assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
         self.parse_mode = parse_mode
-        assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
         self.caption_entities = caption_entities
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultCachedVoice to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultCachedVoice, self).to_array()
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['voice_file_id'] = u(self.voice_file_id)  # py2: type unicode, py3: type str
-        array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        if self.caption is not None:
-            array['caption'] = u(self.caption)  # py2: type unicode, py3: type str
-        # end if
-        if self.parse_mode is not None:
-            array['parse_mode'] = u(self.parse_mode)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption_entities is not None:
-            array['caption_entities'] = self._as_array(self.caption_entities)  # type list of MessageEntity
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -4577,34 +3583,6 @@ class InlineQueryResultCachedVoice(InlineQueryCachedResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultcachedvoice_instance)`
-        """
-        return "InlineQueryResultCachedVoice(type={self.type!r}, id={self.id!r}, voice_file_id={self.voice_file_id!r}, title={self.title!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultcachedvoice_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultCachedVoice.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultCachedVoice(type={self.type!r}, id={self.id!r}, voice_file_id={self.voice_file_id!r}, title={self.title!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultcachedvoice_instance`
-        """
-        return (
-            key in ["type", "id", "voice_file_id", "title", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultCachedVoice
 
 
@@ -4648,6 +3626,20 @@ class InlineQueryResultCachedAudio(InlineQueryCachedResult):
     :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
     """
 
+    __slots__ = ('audio_file_id', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')
+    _fields = ('type', 'id', 'audio_file_id', 'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, False),
+        ('id', 'id', u, False),
+        ('audio_file_id', 'audio_file_id', u, False),
+        ('caption', 'caption', u, True),
+        ('parse_mode', 'parse_mode', u, True),
+        ('caption_entities', 'caption_entities', list, True),
+        ('reply_markup', 'reply_markup', None, True),
+        ('input_message_content', 'input_message_content', None, True),
+    )
+
     def __init__(self, id, audio_file_id, caption=None, parse_mode=None, caption_entities=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to an MP3 audio file stored on the Telegram servers.
@@ -4688,64 +3680,27 @@ class InlineQueryResultCachedAudio(InlineQueryCachedResult):
         :type  input_message_content: pytgbot.api_types.sendable.inline.InputMessageContent
         """
         super(InlineQueryResultCachedAudio, self).__init__()
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            from .reply_markup import InlineKeyboardMarkup
+            assert_type_or_raise(audio_file_id, unicode_type, parameter_name="audio_file_id")
+            assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
+            assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
+            assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
+            assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
+            assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
+        # end if
 
         # 'type' is given by class type
         # 'id' is given by class type
-        assert_type_or_raise(audio_file_id, unicode_type, parameter_name="audio_file_id")
         self.audio_file_id = audio_file_id
-        assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
         self.caption = caption
-        assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
         self.parse_mode = parse_mode
-        assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
         self.caption_entities = caption_entities
-        assert_type_or_raise(reply_markup, None, InlineKeyboardMarkup, parameter_name="reply_markup")
         self.reply_markup = reply_markup
-        assert_type_or_raise(input_message_content, None, InputMessageContent, parameter_name="input_message_content")
         self.input_message_content = input_message_content
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineQueryResultCachedAudio to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from ..receivable.media import MessageEntity
-        from .reply_markup import InlineKeyboardMarkup
-        array = super(InlineQueryResultCachedAudio, self).to_array()
-
-        # 'type' given by superclass
-        # 'id' given by superclass
-        array['audio_file_id'] = u(self.audio_file_id)  # py2: type unicode, py3: type str
-        if self.caption is not None:
-            array['caption'] = u(self.caption)  # py2: type unicode, py3: type str
-        # end if
-        if self.parse_mode is not None:
-            array['parse_mode'] = u(self.parse_mode)  # py2: type unicode, py3: type str
-        # end if
-        if self.caption_entities is not None:
-            array['caption_entities'] = self._as_array(self.caption_entities)  # type list of MessageEntity
-        # end if
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        # end if
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -4786,34 +3741,6 @@ class InlineQueryResultCachedAudio(InlineQueryCachedResult):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinequeryresultcachedaudio_instance)`
-        """
-        return "InlineQueryResultCachedAudio(type={self.type!r}, id={self.id!r}, audio_file_id={self.audio_file_id!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinequeryresultcachedaudio_instance)`
-        """
-        if self._raw:
-            return "InlineQueryResultCachedAudio.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineQueryResultCachedAudio(type={self.type!r}, id={self.id!r}, audio_file_id={self.audio_file_id!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, reply_markup={self.reply_markup!r}, input_message_content={self.input_message_content!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinequeryresultcachedaudio_instance`
-        """
-        return (
-            key in ["type", "id", "audio_file_id", "caption", "parse_mode", "caption_entities", "reply_markup", "input_message_content"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineQueryResultCachedAudio
 
 
@@ -4843,6 +3770,16 @@ class InputTextMessageContent(InputMessageContent):
     :type  disable_web_page_preview: bool
     """
 
+    __slots__ = ('message_text', 'parse_mode', 'entities', 'disable_web_page_preview')
+    _fields = ('message_text', 'parse_mode', 'entities', 'disable_web_page_preview')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('message_text', 'message_text', u, False),
+        ('parse_mode', 'parse_mode', u, True),
+        ('entities', 'entities', list, True),
+        ('disable_web_page_preview', 'disable_web_page_preview', bool, True),
+    )
+
     def __init__(self, message_text, parse_mode=None, entities=None, disable_web_page_preview=False):
         """
         Represents the content of a text message to be sent as the result of an inline query.
@@ -4869,47 +3806,19 @@ class InputTextMessageContent(InputMessageContent):
         :type  disable_web_page_preview: bool
         """
         super(InputTextMessageContent, self).__init__()
-        from ..receivable.media import MessageEntity
-        assert_type_or_raise(message_text, unicode_type, parameter_name="message_text")
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            assert_type_or_raise(message_text, unicode_type, parameter_name="message_text")
+            assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
+            assert_type_or_raise(entities, None, list, parameter_name="entities")
+            assert_type_or_raise(disable_web_page_preview, None, bool, parameter_name="disable_web_page_preview")
+        # end if
         self.message_text = message_text
-        assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
         self.parse_mode = parse_mode
-        assert_type_or_raise(entities, None, list, parameter_name="entities")
         self.entities = entities
-        assert_type_or_raise(disable_web_page_preview, None, bool, parameter_name="disable_web_page_preview")
         self.disable_web_page_preview = disable_web_page_preview
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InputTextMessageContent to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from ..receivable.media import MessageEntity
-        array = super(InputTextMessageContent, self).to_array()
-
-        array['message_text'] = u(self.message_text)  # py2: type unicode, py3: type str
-        if self.parse_mode is not None:
-            array['parse_mode'] = u(self.parse_mode)  # py2: type unicode, py3: type str
-        # end if
-        if self.entities is not None:
-            array['entities'] = self._as_array(self.entities)  # type list of MessageEntity
-        # end if
-        if self.disable_web_page_preview is not None:
-            array['disable_web_page_preview'] = bool(self.disable_web_page_preview)  # type bool
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -4945,34 +3854,6 @@ class InputTextMessageContent(InputMessageContent):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inputtextmessagecontent_instance)`
-        """
-        return "InputTextMessageContent(message_text={self.message_text!r}, parse_mode={self.parse_mode!r}, entities={self.entities!r}, disable_web_page_preview={self.disable_web_page_preview!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inputtextmessagecontent_instance)`
-        """
-        if self._raw:
-            return "InputTextMessageContent.from_array({self._raw})".format(self=self)
-        # end if
-        return "InputTextMessageContent(message_text={self.message_text!r}, parse_mode={self.parse_mode!r}, entities={self.entities!r}, disable_web_page_preview={self.disable_web_page_preview!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inputtextmessagecontent_instance`
-        """
-        return (
-            key in ["message_text", "parse_mode", "entities", "disable_web_page_preview"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InputTextMessageContent
 
 
@@ -5010,6 +3891,18 @@ class InputLocationMessageContent(InputMessageContent):
     :type  proximity_alert_radius: int
     """
 
+    __slots__ = ('latitude', 'longitude', 'horizontal_accuracy', 'live_period', 'heading', 'proximity_alert_radius')
+    _fields = ('latitude', 'longitude', 'horizontal_accuracy', 'live_period', 'heading', 'proximity_alert_radius')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('latitude', 'latitude', float, False),
+        ('longitude', 'longitude', float, False),
+        ('horizontal_accuracy', 'horizontal_accuracy', float, True),
+        ('live_period', 'live_period', int, True),
+        ('heading', 'heading', int, True),
+        ('proximity_alert_radius', 'proximity_alert_radius', int, True),
+    )
+
     def __init__(self, latitude, longitude, horizontal_accuracy=None, live_period=None, heading=None, proximity_alert_radius=None):
         """
         Represents the content of a location message to be sent as the result of an inline query.
@@ -5044,53 +3937,22 @@ class InputLocationMessageContent(InputMessageContent):
         :type  proximity_alert_radius: int
         """
         super(InputLocationMessageContent, self).__init__()
-        assert_type_or_raise(latitude, float, parameter_name="latitude")
+        if self._must_validate():
+            assert_type_or_raise(latitude, float, parameter_name="latitude")
+            assert_type_or_raise(longitude, float, parameter_name="longitude")
+            assert_type_or_raise(horizontal_accuracy, None, float, parameter_name="horizontal_accuracy")
+            assert_type_or_raise(live_period, None, int, parameter_name="live_period")
+            assert_type_or_raise(heading, None, int, parameter_name="heading")
+            assert_type_or_raise(proximity_alert_radius, None, int, parameter_name="proximity_alert_radius")
+        # end if
         self.latitude = latitude
-        assert_type_or_raise(longitude, float, parameter_name="longitude")
         self.longitude = longitude
-        assert_type_or_raise(horizontal_accuracy, None, float, parameter_name="horizontal_accuracy")
         self.horizontal_accuracy = horizontal_accuracy
-        assert_type_or_raise(live_period, None, int, parameter_name="live_period")
         self.live_period = live_period
-        assert_type_or_raise(heading, None, int, parameter_name="heading")
         self.heading = heading
-        assert_type_or_raise(proximity_alert_radius, None, int, parameter_name="proximity_alert_radius")
         self.proximity_alert_radius = proximity_alert_radius
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InputLocationMessageContent to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(InputLocationMessageContent, self).to_array()
-
-        array['latitude'] = float(self.latitude)  # type float
-        array['longitude'] = float(self.longitude)  # type float
-        if self.horizontal_accuracy is not None:
-            array['horizontal_accuracy'] = float(self.horizontal_accuracy)  # type float
-        # end if
-        if self.live_period is not None:
-            array['live_period'] = int(self.live_period)  # type int
-        # end if
-        if self.heading is not None:
-            array['heading'] = int(self.heading)  # type int
-        # end if
-        if self.proximity_alert_radius is not None:
-            array['proximity_alert_radius'] = int(self.proximity_alert_radius)  # type int
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -5127,34 +3989,6 @@ class InputLocationMessageContent(InputMessageContent):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inputlocationmessagecontent_instance)`
-        """
-        return "InputLocationMessageContent(latitude={self.latitude!r}, longitude={self.longitude!r}, horizontal_accuracy={self.horizontal_accuracy!r}, live_period={self.live_period!r}, heading={self.heading!r}, proximity_alert_radius={self.proximity_alert_radius!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inputlocationmessagecontent_instance)`
-        """
-        if self._raw:
-            return "InputLocationMessageContent.from_array({self._raw})".format(self=self)
-        # end if
-        return "InputLocationMessageContent(latitude={self.latitude!r}, longitude={self.longitude!r}, horizontal_accuracy={self.horizontal_accuracy!r}, live_period={self.live_period!r}, heading={self.heading!r}, proximity_alert_radius={self.proximity_alert_radius!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inputlocationmessagecontent_instance`
-        """
-        return (
-            key in ["latitude", "longitude", "horizontal_accuracy", "live_period", "heading", "proximity_alert_radius"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InputLocationMessageContent
 
 
@@ -5198,6 +4032,20 @@ class InputVenueMessageContent(InputMessageContent):
     :type  google_place_type: str|unicode
     """
 
+    __slots__ = ('latitude', 'longitude', 'title', 'address', 'foursquare_id', 'foursquare_type', 'google_place_id', 'google_place_type')
+    _fields = ('latitude', 'longitude', 'title', 'address', 'foursquare_id', 'foursquare_type', 'google_place_id', 'google_place_type')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('latitude', 'latitude', float, False),
+        ('longitude', 'longitude', float, False),
+        ('title', 'title', u, False),
+        ('address', 'address', u, False),
+        ('foursquare_id', 'foursquare_id', u, True),
+        ('foursquare_type', 'foursquare_type', u, True),
+        ('google_place_id', 'google_place_id', u, True),
+        ('google_place_type', 'google_place_type', u, True),
+    )
+
     def __init__(self, latitude, longitude, title, address, foursquare_id=None, foursquare_type=None, google_place_id=None, google_place_type=None):
         """
         Represents the content of a venue message to be sent as the result of an inline query.
@@ -5238,59 +4086,26 @@ class InputVenueMessageContent(InputMessageContent):
         :type  google_place_type: str|unicode
         """
         super(InputVenueMessageContent, self).__init__()
-        assert_type_or_raise(latitude, float, parameter_name="latitude")
+        if self._must_validate():
+            assert_type_or_raise(latitude, float, parameter_name="latitude")
+            assert_type_or_raise(longitude, float, parameter_name="longitude")
+            assert_type_or_raise(title, unicode_type, parameter_name="title")
+            assert_type_or_raise(address, unicode_type, parameter_name="address")
+            assert_type_or_raise(foursquare_id, None, unicode_type, parameter_name="foursquare_id")
+            assert_type_or_raise(foursquare_type, None, unicode_type, parameter_name="foursquare_type")
+            assert_type_or_raise(google_place_id, None, unicode_type, parameter_name="google_place_id")
+            assert_type_or_raise(google_place_type, None, unicode_type, parameter_name="google_place_type")
+        # end if
         self.latitude = latitude
-        assert_type_or_raise(longitude, float, parameter_name="longitude")
         self.longitude = longitude
-        assert_type_or_raise(title, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(address, unicode_type, parameter_name="address")
         self.address = address
-        assert_type_or_raise(foursquare_id, None, unicode_type, parameter_name="foursquare_id")
         self.foursquare_id = foursquare_id
-        assert_type_or_raise(foursquare_type, None, unicode_type, parameter_name="foursquare_type")
         self.foursquare_type = foursquare_type
-        assert_type_or_raise(google_place_id, None, unicode_type, parameter_name="google_place_id")
         self.google_place_id = google_place_id
-        assert_type_or_raise(google_place_type, None, unicode_type, parameter_name="google_place_type")
         self.google_place_type = google_place_type
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InputVenueMessageContent to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(InputVenueMessageContent, self).to_array()
-
-        array['latitude'] = float(self.latitude)  # type float
-        array['longitude'] = float(self.longitude)  # type float
-        array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        array['address'] = u(self.address)  # py2: type unicode, py3: type str
-        if self.foursquare_id is not None:
-            array['foursquare_id'] = u(self.foursquare_id)  # py2: type unicode, py3: type str
-        # end if
-        if self.foursquare_type is not None:
-            array['foursquare_type'] = u(self.foursquare_type)  # py2: type unicode, py3: type str
-        # end if
-        if self.google_place_id is not None:
-            array['google_place_id'] = u(self.google_place_id)  # py2: type unicode, py3: type str
-        # end if
-        if self.google_place_type is not None:
-            array['google_place_type'] = u(self.google_place_type)  # py2: type unicode, py3: type str
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -5329,34 +4144,6 @@ class InputVenueMessageContent(InputMessageContent):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inputvenuemessagecontent_instance)`
-        """
-        return "InputVenueMessageContent(latitude={self.latitude!r}, longitude={self.longitude!r}, title={self.title!r}, address={self.address!r}, foursquare_id={self.foursquare_id!r}, foursquare_type={self.foursquare_type!r}, google_place_id={self.google_place_id!r}, google_place_type={self.google_place_type!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inputvenuemessagecontent_instance)`
-        """
-        if self._raw:
-            return "InputVenueMessageContent.from_array({self._raw})".format(self=self)
-        # end if
-        return "InputVenueMessageContent(latitude={self.latitude!r}, longitude={self.longitude!r}, title={self.title!r}, address={self.address!r}, foursquare_id={self.foursquare_id!r}, foursquare_type={self.foursquare_type!r}, google_place_id={self.google_place_id!r}, google_place_type={self.google_place_type!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inputvenuemessagecontent_instance`
-        """
-        return (
-            key in ["latitude", "longitude", "title", "address", "foursquare_id", "foursquare_type", "google_place_id", "google_place_type"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InputVenueMessageContent
 
 
@@ -5386,6 +4173,16 @@ class InputContactMessageContent(InputMessageContent):
     :type  vcard: str|unicode
     """
 
+    __slots__ = ('phone_number', 'first_name', 'last_name', 'vcard')
+    _fields = ('phone_number', 'first_name', 'last_name', 'vcard')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('phone_number', 'phone_number', u, False),
+        ('first_name', 'first_name', u, False),
+        ('last_name', 'last_name', u, True),
+        ('vcard', 'vcard', u, True),
+    )
+
     def __init__(self, phone_number, first_name, last_name=None, vcard=None):
         """
         Represents the content of a contact message to be sent as the result of an inline query.
@@ -5412,43 +4209,18 @@ class InputContactMessageContent(InputMessageContent):
         :type  vcard: str|unicode
         """
         super(InputContactMessageContent, self).__init__()
-        assert_type_or_raise(phone_number, unicode_type, parameter_name="phone_number")
+        if self._must_validate():
+            assert_type_or_raise(phone_number, unicode_type, parameter_name="phone_number")
+            assert_type_or_raise(first_name, unicode_type, parameter_name="first_name")
+            assert_type_or_raise(last_name, None, unicode_type, parameter_name="last_name")
+            assert_type_or_raise(vcard, None, unicode_type, parameter_name="vcard")
+        # end if
         self.phone_number = phone_number
-        assert_type_or_raise(first_name, unicode_type, parameter_name="first_name")
         self.first_name = first_name
-        assert_type_or_raise(last_name, None, unicode_type, parameter_name="last_name")
         self.last_name = last_name
-        assert_type_or_raise(vcard, None, unicode_type, parameter_name="vcard")
         self.vcard = vcard
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InputContactMessageContent to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(InputContactMessageContent, self).to_array()
-
-        array['phone_number'] = u(self.phone_number)  # py2: type unicode, py3: type str
-        array['first_name'] = u(self.first_name)  # py2: type unicode, py3: type str
-        if self.last_name is not None:
-            array['last_name'] = u(self.last_name)  # py2: type unicode, py3: type str
-        # end if
-        if self.vcard is not None:
-            array['vcard'] = u(self.vcard)  # py2: type unicode, py3: type str
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -5483,34 +4255,6 @@ class InputContactMessageContent(InputMessageContent):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inputcontactmessagecontent_instance)`
-        """
-        return "InputContactMessageContent(phone_number={self.phone_number!r}, first_name={self.first_name!r}, last_name={self.last_name!r}, vcard={self.vcard!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inputcontactmessagecontent_instance)`
-        """
-        if self._raw:
-            return "InputContactMessageContent.from_array({self._raw})".format(self=self)
-        # end if
-        return "InputContactMessageContent(phone_number={self.phone_number!r}, first_name={self.first_name!r}, last_name={self.last_name!r}, vcard={self.vcard!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inputcontactmessagecontent_instance`
-        """
-        return (
-            key in ["phone_number", "first_name", "last_name", "vcard"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InputContactMessageContent
 
 
@@ -5595,6 +4339,32 @@ class InputInvoiceMessageContent(InputMessageContent):
     :type  is_flexible: bool
     """
 
+    __slots__ = ('title', 'description', 'payload', 'provider_token', 'currency', 'prices', 'max_tip_amount', 'suggested_tip_amounts', 'provider_data', 'photo_url', 'photo_size', 'photo_width', 'photo_height', 'need_name', 'need_phone_number', 'need_email', 'need_shipping_address', 'send_phone_number_to_provider', 'send_email_to_provider', 'is_flexible')
+    _fields = ('title', 'description', 'payload', 'provider_token', 'currency', 'prices', 'max_tip_amount', 'suggested_tip_amounts', 'provider_data', 'photo_url', 'photo_size', 'photo_width', 'photo_height', 'need_name', 'need_phone_number', 'need_email', 'need_shipping_address', 'send_phone_number_to_provider', 'send_email_to_provider', 'is_flexible')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('title', 'title', u, False),
+        ('description', 'description', u, False),
+        ('payload', 'payload', u, False),
+        ('provider_token', 'provider_token', u, False),
+        ('currency', 'currency', u, False),
+        ('prices', 'prices', list, False),
+        ('max_tip_amount', 'max_tip_amount', int, True),
+        ('suggested_tip_amounts', 'suggested_tip_amounts', list, True),
+        ('provider_data', 'provider_data', u, True),
+        ('photo_url', 'photo_url', u, True),
+        ('photo_size', 'photo_size', int, True),
+        ('photo_width', 'photo_width', int, True),
+        ('photo_height', 'photo_height', int, True),
+        ('need_name', 'need_name', bool, True),
+        ('need_phone_number', 'need_phone_number', bool, True),
+        ('need_email', 'need_email', bool, True),
+        ('need_shipping_address', 'need_shipping_address', bool, True),
+        ('send_phone_number_to_provider', 'send_phone_number_to_provider', bool, True),
+        ('send_email_to_provider', 'send_email_to_provider', bool, True),
+        ('is_flexible', 'is_flexible', bool, True),
+    )
+
     def __init__(self, title, description, payload, provider_token, currency, prices, max_tip_amount=None, suggested_tip_amounts=None, provider_data=None, photo_url=None, photo_size=None, photo_width=None, photo_height=None, need_name=None, need_phone_number=None, need_email=None, need_shipping_address=None, send_phone_number_to_provider=None, send_email_to_provider=None, is_flexible=None):
         """
         Represents the content of an invoice message to be sent as the result of an inline query.
@@ -5676,117 +4446,51 @@ class InputInvoiceMessageContent(InputMessageContent):
         :type  is_flexible: bool
         """
         super(InputInvoiceMessageContent, self).__init__()
-        from .payments import LabeledPrice
-        assert_type_or_raise(title, unicode_type, parameter_name="title")
+        if self._must_validate():
+            from .payments import LabeledPrice
+            assert_type_or_raise(title, unicode_type, parameter_name="title")
+            assert_type_or_raise(description, unicode_type, parameter_name="description")
+            assert_type_or_raise(payload, unicode_type, parameter_name="payload")
+            assert_type_or_raise(provider_token, unicode_type, parameter_name="provider_token")
+            assert_type_or_raise(currency, unicode_type, parameter_name="currency")
+            assert_type_or_raise(prices, list, parameter_name="prices")
+            assert_type_or_raise(max_tip_amount, None, int, parameter_name="max_tip_amount")
+            assert_type_or_raise(suggested_tip_amounts, None, list, parameter_name="suggested_tip_amounts")
+            assert_type_or_raise(provider_data, None, unicode_type, parameter_name="provider_data")
+            assert_type_or_raise(photo_url, None, unicode_type, parameter_name="photo_url")
+            assert_type_or_raise(photo_size, None, int, parameter_name="photo_size")
+            assert_type_or_raise(photo_width, None, int, parameter_name="photo_width")
+            assert_type_or_raise(photo_height, None, int, parameter_name="photo_height")
+            assert_type_or_raise(need_name, None, bool, parameter_name="need_name")
+            assert_type_or_raise(need_phone_number, None, bool, parameter_name="need_phone_number")
+            assert_type_or_raise(need_email, None, bool, parameter_name="need_email")
+            assert_type_or_raise(need_shipping_address, None, bool, parameter_name="need_shipping_address")
+            assert_type_or_raise(send_phone_number_to_provider, None, bool, parameter_name="send_phone_number_to_provider")
+            assert_type_or_raise(send_email_to_provider, None, bool, parameter_name="send_email_to_provider")
+            assert_type_or_raise(is_flexible, None, bool, parameter_name="is_flexible")
+        # end if
         self.title = title
-        assert_type_or_raise(description, unicode_type, parameter_name="description")
         self.description = description
-        assert_type_or_raise(payload, unicode_type, parameter_name="payload")
         self.payload = payload
-        assert_type_or_raise(provider_token, unicode_type, parameter_name="provider_token")
         self.provider_token = provider_token
-        assert_type_or_raise(currency, unicode_type, parameter_name="currency")
         self.currency = currency
-        assert_type_or_raise(prices, list, parameter_name="prices")
         self.prices = prices
-        assert_type_or_raise(max_tip_amount, None, int, parameter_name="max_tip_amount")
         self.max_tip_amount = max_tip_amount
-        assert_type_or_raise(suggested_tip_amounts, None, list, parameter_name="suggested_tip_amounts")
         self.suggested_tip_amounts = suggested_tip_amounts
-        assert_type_or_raise(provider_data, None, unicode_type, parameter_name="provider_data")
         self.provider_data = provider_data
-        assert_type_or_raise(photo_url, None, unicode_type, parameter_name="photo_url")
         self.photo_url = photo_url
-        assert_type_or_raise(photo_size, None, int, parameter_name="photo_size")
         self.photo_size = photo_size
-        assert_type_or_raise(photo_width, None, int, parameter_name="photo_width")
         self.photo_width = photo_width
-        assert_type_or_raise(photo_height, None, int, parameter_name="photo_height")
         self.photo_height = photo_height
-        assert_type_or_raise(need_name, None, bool, parameter_name="need_name")
         self.need_name = need_name
-        assert_type_or_raise(need_phone_number, None, bool, parameter_name="need_phone_number")
         self.need_phone_number = need_phone_number
-        assert_type_or_raise(need_email, None, bool, parameter_name="need_email")
         self.need_email = need_email
-        assert_type_or_raise(need_shipping_address, None, bool, parameter_name="need_shipping_address")
         self.need_shipping_address = need_shipping_address
-        assert_type_or_raise(send_phone_number_to_provider, None, bool, parameter_name="send_phone_number_to_provider")
         self.send_phone_number_to_provider = send_phone_number_to_provider
-        assert_type_or_raise(send_email_to_provider, None, bool, parameter_name="send_email_to_provider")
         self.send_email_to_provider = send_email_to_provider
-        assert_type_or_raise(is_flexible, None, bool, parameter_name="is_flexible")
         self.is_flexible = is_flexible
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InputInvoiceMessageContent to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from .payments import LabeledPrice
-        array = super(InputInvoiceMessageContent, self).to_array()
-
-        array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        array['description'] = u(self.description)  # py2: type unicode, py3: type str
-        array['payload'] = u(self.payload)  # py2: type unicode, py3: type str
-        array['provider_token'] = u(self.provider_token)  # py2: type unicode, py3: type str
-        array['currency'] = u(self.currency)  # py2: type unicode, py3: type str
-        array['prices'] = self._as_array(self.prices)  # type list of LabeledPrice
-        if self.max_tip_amount is not None:
-            array['max_tip_amount'] = int(self.max_tip_amount)  # type int
-        # end if
-        if self.suggested_tip_amounts is not None:
-            array['suggested_tip_amounts'] = self._as_array(self.suggested_tip_amounts)  # type list of int
-        # end if
-        if self.provider_data is not None:
-            array['provider_data'] = u(self.provider_data)  # py2: type unicode, py3: type str
-        # end if
-        if self.photo_url is not None:
-            array['photo_url'] = u(self.photo_url)  # py2: type unicode, py3: type str
-        # end if
-        if self.photo_size is not None:
-            array['photo_size'] = int(self.photo_size)  # type int
-        # end if
-        if self.photo_width is not None:
-            array['photo_width'] = int(self.photo_width)  # type int
-        # end if
-        if self.photo_height is not None:
-            array['photo_height'] = int(self.photo_height)  # type int
-        # end if
-        if self.need_name is not None:
-            array['need_name'] = bool(self.need_name)  # type bool
-        # end if
-        if self.need_phone_number is not None:
-            array['need_phone_number'] = bool(self.need_phone_number)  # type bool
-        # end if
-        if self.need_email is not None:
-            array['need_email'] = bool(self.need_email)  # type bool
-        # end if
-        if self.need_shipping_address is not None:
-            array['need_shipping_address'] = bool(self.need_shipping_address)  # type bool
-        # end if
-        if self.send_phone_number_to_provider is not None:
-            array['send_phone_number_to_provider'] = bool(self.send_phone_number_to_provider)  # type bool
-        # end if
-        if self.send_email_to_provider is not None:
-            array['send_email_to_provider'] = bool(self.send_email_to_provider)  # type bool
-        # end if
-        if self.is_flexible is not None:
-            array['is_flexible'] = bool(self.is_flexible)  # type bool
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -5838,32 +4542,4 @@ class InputInvoiceMessageContent(InputMessageContent):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inputinvoicemessagecontent_instance)`
-        """
-        return "InputInvoiceMessageContent(title={self.title!r}, description={self.description!r}, payload={self.payload!r}, provider_token={self.provider_token!r}, currency={self.currency!r}, prices={self.prices!r}, max_tip_amount={self.max_tip_amount!r}, suggested_tip_amounts={self.suggested_tip_amounts!r}, provider_data={self.provider_data!r}, photo_url={self.photo_url!r}, photo_size={self.photo_size!r}, photo_width={self.photo_width!r}, photo_height={self.photo_height!r}, need_name={self.need_name!r}, need_phone_number={self.need_phone_number!r}, need_email={self.need_email!r}, need_shipping_address={self.need_shipping_address!r}, send_phone_number_to_provider={self.send_phone_number_to_provider!r}, send_email_to_provider={self.send_email_to_provider!r}, is_flexible={self.is_flexible!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inputinvoicemessagecontent_instance)`
-        """
-        if self._raw:
-            return "InputInvoiceMessageContent.from_array({self._raw})".format(self=self)
-        # end if
-        return "InputInvoiceMessageContent(title={self.title!r}, description={self.description!r}, payload={self.payload!r}, provider_token={self.provider_token!r}, currency={self.currency!r}, prices={self.prices!r}, max_tip_amount={self.max_tip_amount!r}, suggested_tip_amounts={self.suggested_tip_amounts!r}, provider_data={self.provider_data!r}, photo_url={self.photo_url!r}, photo_size={self.photo_size!r}, photo_width={self.photo_width!r}, photo_height={self.photo_height!r}, need_name={self.need_name!r}, need_phone_number={self.need_phone_number!r}, need_email={self.need_email!r}, need_shipping_address={self.need_shipping_address!r}, send_phone_number_to_provider={self.send_phone_number_to_provider!r}, send_email_to_provider={self.send_email_to_provider!r}, is_flexible={self.is_flexible!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inputinvoicemessagecontent_instance`
-        """
-        return (
-            key in ["title", "description", "payload", "provider_token", "currency", "prices", "max_tip_amount", "suggested_tip_amounts", "provider_data", "photo_url", "photo_size", "photo_width", "photo_height", "need_name", "need_phone_number", "need_email", "need_shipping_address", "send_phone_number_to_provider", "send_email_to_provider", "is_flexible"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InputInvoiceMessageContent
@@ -47,6 +47,10 @@ class InputMedia(Sendable):
     :type  caption_entities: list of pytgbot.api_types.receivable.media.MessageEntity
     """
 
+    __slots__ = ('type', 'media', 'caption', 'parse_mode', 'caption_entities')
+    _fields = ('type', 'media', 'caption', 'parse_mode', 'caption_entities')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+
     def __init__(self, type, media, caption=None, parse_mode=None, caption_entities=None):
         """
         This object represents the content of a media message to be sent.
@@ -76,17 +80,19 @@ class InputMedia(Sendable):
         :type  caption_entities: list of pytgbot.api_types.receivable.media.MessageEntity
         """
         super(InputMedia, self).__init__()
-        from .files import InputFile
-        from ..receivable.media import MessageEntity
-        assert_type_or_raise(type, unicode_type, parameter_name="type")
+        if self._must_validate():
+            from .files import InputFile
+            from ..receivable.media import MessageEntity
+            assert_type_or_raise(type, unicode_type, parameter_name="type")
+            assert_type_or_raise(media, InputFile, unicode_type, parameter_name="media")
+            assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
+            assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
+            assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
+        # end if
         self.type = type
-        assert_type_or_raise(media, InputFile, unicode_type, parameter_name="media")
         self.media = media
-        assert_type_or_raise(caption, None, unicode_type, parameter_name="caption")
         self.caption = caption
-        assert_type_or_raise(parse_mode, None, unicode_type, parameter_name="parse_mode")
         self.parse_mode = parse_mode
-        assert_type_or_raise(caption_entities, None, list, parameter_name="caption_entities")
         self.caption_entities = caption_entities
     # end def __init__
 
@@ -100,7 +106,7 @@ class InputMedia(Sendable):
         :return: dictionary representation of this object.
         :rtype: dict
         """
-        if prefer_original and self._raw:
+        if prefer_original and self._raw and self._is_unmodified():
             return self._raw
         # end if
 
@@ -110,7 +116,7 @@ class InputMedia(Sendable):
 
         array['type'] = u(self.type)  # py2: type unicode, py3: type str
         if isinstance(self.media, InputFile):
-            array['media'] = self.media.to_array()  # type InputFile
+            array['media'] = self.media.to_array(prefer_original=prefer_original)  # type InputFile
         elif isinstance(self.media, str):
             array['media'] = u(self.media)  # py2: type unicode, py3: type str
         else:
@@ -123,7 +129,7 @@ class InputMedia(Sendable):
             array['parse_mode'] = u(self.parse_mode)  # py2: type unicode, py3: type str
         # end if
         if self.caption_entities is not None:
-            array['caption_entities'] = self._as_array(self.caption_entities)  # type list of MessageEntity
+            array['caption_entities'] = self._as_array(self.caption_entities, prefer_original=prefer_original)  # type list of MessageEntity
         # end if
         return array
     # end def to_array
@@ -157,48 +163,22 @@ class InputMedia(Sendable):
     @staticmethod
     def from_array(array):
         """
-        Deserialize a new InputMedia from a given dictionary.
+        Deserialize the matching InputMedia subclass from a given dictionary, looked up by its `type`.
 
-        :return: new InputMedia instance.
+        :return: new InputMedia subclass instance.
         :rtype: InputMedia
         """
         if not array:  # None or {}
             return None
         # end if
 
-        data = InputMedia.validate_array(array)
-        instance = InputMedia(**data)
-        instance._raw = array
-        return instance
-    # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inputmedia_instance)`
-        """
-        return "InputMedia(type={self.type!r}, media={self.media!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inputmedia_instance)`
-        """
-        if self._raw:
-            return "InputMedia.from_array({self._raw})".format(self=self)
+        clazz = InputMedia._subclasses.get(array.get('type'))
+        if clazz is None:
+            from ...exceptions import TgApiParseException
+            raise TgApiParseException('Unknown InputMedia type {value!r}.'.format(value=array.get('type')))
         # end if
-        return "InputMedia(type={self.type!r}, media={self.media!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inputmedia_instance`
-        """
-        return (
-            key in ["type", "media", "caption", "parse_mode", "caption_entities"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
+        return clazz.from_array(array)
+    # end def from_array
 
     def get_request_data(self, var_name, full_data=False):
         """
@@ -264,6 +244,10 @@ class InputMediaWithThumb(InputMedia):
     :type  caption_entities: list of pytgbot.api_types.receivable.media.MessageEntity
     """
 
+    __slots__ = ('thumb',)
+    _fields = ('type', 'media', 'thumb', 'caption', 'parse_mode', 'caption_entities')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+
     def get_request_data(self, var_name, full_data=False):
         """
         :param var_name:
@@ -328,9 +312,11 @@ class InputMediaWithThumb(InputMedia):
         :type  caption_entities: list of pytgbot.api_types.receivable.media.MessageEntity
         """
         super(InputMediaWithThumb, self).__init__(type=type, media=media, caption=caption, parse_mode=parse_mode, caption_entities=caption_entities)
+        if self._must_validate():
+            assert_type_or_raise(thumb, None, InputFile, unicode_type, parameter_name="thumb")
+        # end if
         # 'type' is set by InputMedia base class
         # 'media' is set by InputMedia base class
-        assert_type_or_raise(thumb, None, InputFile, unicode_type, parameter_name="thumb")
         self.thumb = thumb
         # 'caption' is set by InputMedia base class
         # 'parse_mode' is set by InputMedia base class
@@ -347,11 +333,11 @@ class InputMediaWithThumb(InputMedia):
         :return: dictionary representation of this object.
         :rtype: dict
         """
-        if prefer_original and self._raw:
+        if prefer_original and self._raw and self._is_unmodified():
             return self._raw
         # end if
 
-        array = super(InputMediaWithThumb, self).to_array()
+        array = super(InputMediaWithThumb, self).to_array(prefer_original=prefer_original)
         # 'type' is handled by superclass
         array['media'] = u(self.media)  # py2: type unicode, py3: type str
         if self.caption is not None:
@@ -395,34 +381,6 @@ class InputMediaWithThumb(InputMedia):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inputmediawiththumb_instance)`
-        """
-        return "InputMediaWithThumb(type={self.type!r}, media={self.media!r}, thumb={self.thumb!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inputmediawiththumb_instance)`
-        """
-        if self._raw:
-            return "InputMediaWithThumb.from_array({self._raw})".format(self=self)
-        # end if
-        return "InputMediaWithThumb(type={self.type!r}, media={self.media!r}, thumb={self.thumb!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inputmediawiththumb_instance`
-        """
-        return (
-            key in ["type", "media", "thumb", "caption", "parse_mode", "caption_entities"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InputMediaWithThumb
 
 
@@ -461,6 +419,10 @@ class InputMediaPlayable(InputMediaWithThumb):
     :type  caption_entities: list of pytgbot.api_types.receivable.media.MessageEntity
     """
 
+    __slots__ = ('duration',)
+    _fields = ('type', 'media', 'thumb', 'duration', 'caption', 'parse_mode', 'caption_entities')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+
 
 
     # noinspection PyShadowingBuiltins
@@ -499,10 +461,12 @@ class InputMediaPlayable(InputMediaWithThumb):
         :type  caption_entities: list of pytgbot.api_types.receivable.media.MessageEntity
         """
         super(InputMediaPlayable, self).__init__(type=type, media=media, thumb=thumb, caption=caption, parse_mode=parse_mode, caption_entities=caption_entities)
+        if self._must_validate():
+            assert_type_or_raise(duration, None, int, parameter_name="duration")
+        # end if
         # 'type' is set by InputMediaWithThumb base class
         # 'media' is set by InputMediaWithThumb base class
         # 'thumb' is set by InputMediaWithThumb base class
-        assert_type_or_raise(duration, None, int, parameter_name="duration")
         self.duration = duration
         # 'caption' is set by InputMediaWithThumb base class
         # 'parse_mode' is set by InputMediaWithThumb base class
@@ -519,7 +483,7 @@ class InputMediaPlayable(InputMediaWithThumb):
         :return: dictionary representation of this object.
         :rtype: dict
         """
-        if prefer_original and self._raw:
+        if prefer_original and self._raw and self._is_unmodified():
             return self._raw
         # end if
 
@@ -575,34 +539,6 @@ class InputMediaPlayable(InputMediaWithThumb):
         return instance
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(inputmediaplayable_instance)`
-        """
-        return "InputMediaPlayable(type={self.type!r}, media={self.media!r}, thumb={self.thumb!r}, duration={self.duration!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inputmediaplayable_instance)`
-        """
-        if self._raw:
-            return "InputMediaPlayable.from_array({self._raw})".format(self=self)
-        # end if
-        return "InputMediaPlayable(type={self.type!r}, media={self.media!r}, thumb={self.thumb!r}, duration={self.duration!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inputmediaplayable_instance`
-        """
-        return (
-            key in ["type", "media", "thumb", "duration", "caption", "parse_mode", "caption_entities"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
-
 
 # end class InputMediaPlayable
 
@@ -648,6 +584,10 @@ class InputMediaVideolike(InputMediaPlayable):
     :type  caption_entities: list of pytgbot.api_types.receivable.media.MessageEntity
     """
 
+    __slots__ = ('width', 'height')
+    _fields = ('type', 'media', 'thumb', 'duration', 'width', 'height', 'caption', 'parse_mode', 'caption_entities')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+
 
 
     # noinspection PyShadowingBuiltins
@@ -692,13 +632,15 @@ class InputMediaVideolike(InputMediaPlayable):
         :type  caption_entities: list of pytgbot.api_types.receivable.media.MessageEntity
         """
         super(InputMediaVideolike, self).__init__(type=type, media=media, thumb=thumb, duration=duration, caption=caption, parse_mode=parse_mode, caption_entities=caption_entities)
+        if self._must_validate():
+            assert_type_or_raise(width, None, int, parameter_name="width")
+            assert_type_or_raise(height, None, int, parameter_name="height")
+        # end if
         # 'type' is set by InputMediaPlayable base class
         # 'media' is set by InputMediaPlayable base class
         # 'thumb' is set by InputMediaPlayable base class
         # 'duration' is set by InputMediaPlayable base class
-        assert_type_or_raise(width, None, int, parameter_name="width")
         self.width = width
-        assert_type_or_raise(height, None, int, parameter_name="height")
         self.height = height
         # 'caption' is set by InputMediaPlayable base class
         # 'parse_mode' is set by InputMediaPlayable base class
@@ -715,7 +657,7 @@ class InputMediaVideolike(InputMediaPlayable):
         :return: dictionary representation of this object.
         :rtype: dict
         """
-        if prefer_original and self._raw:
+        if prefer_original and self._raw and self._is_unmodified():
             return self._raw
         # end if
 
@@ -777,34 +719,6 @@ class InputMediaVideolike(InputMediaPlayable):
         return instance
     # end def from_array
 
-    def __str__(self):
-        """
-        Implements `str(inputmediavideolike_instance)`
-        """
-        return "InputMediaVideolike(type={self.type!r}, media={self.media!r}, thumb={self.thumb!r}, duration={self.duration!r}, width={self.width!r}, height={self.height!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inputmediavideolike_instance)`
-        """
-        if self._raw:
-            return "InputMediaVideolike.from_array({self._raw})".format(self=self)
-        # end if
-        return "InputMediaVideolike(type={self.type!r}, media={self.media!r}, thumb={self.thumb!r}, duration={self.duration!r}, width={self.width!r}, height={self.height!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inputmediavideolike_instance`
-        """
-        return (
-            key in ["type", "media", "thumb", "duration", "width", "height", "caption", "parse_mode", "caption_entities"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
-
 
 # end class InputMediaVideolike
 
@@ -835,6 +749,10 @@ class InputMediaPhoto(InputMedia):
     :type  caption_entities: list of pytgbot.api_types.receivable.media.MessageEntity
     """
 
+    __slots__ = ()
+    _fields = ('type', 'media', 'caption', 'parse_mode', 'caption_entities')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+
     # noinspection PyShadowingBuiltins
     def __init__(self, media, caption=None, parse_mode=None, caption_entities=None):
         """
@@ -880,7 +798,7 @@ class InputMediaPhoto(InputMedia):
         :return: dictionary representation of this object.
         :rtype: dict
         """
-        if prefer_original and self._raw:
+        if prefer_original and self._raw and self._is_unmodified():
             return self._raw
         # end if
 
@@ -906,7 +824,7 @@ class InputMediaPhoto(InputMedia):
         assert_type_or_raise(array, dict, parameter_name="array")
         from ..receivable.media import MessageEntity
         data = InputMedia.validate_array(array)
-        # 'type' is given by class type
+        data.pop('type', None)  # always photo, so not an argument of the constructor.
         # 'media' is given by class type
         # 'caption' is given by class type
         # 'parse_mode' is given by class type
@@ -931,34 +849,6 @@ class InputMediaPhoto(InputMedia):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inputmediaphoto_instance)`
-        """
-        return "InputMediaPhoto(type={self.type!r}, media={self.media!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inputmediaphoto_instance)`
-        """
-        if self._raw:
-            return "InputMediaPhoto.from_array({self._raw})".format(self=self)
-        # end if
-        return "InputMediaPhoto(type={self.type!r}, media={self.media!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inputmediaphoto_instance`
-        """
-        return (
-            key in ["type", "media", "caption", "parse_mode", "caption_entities"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InputMediaPhoto
 
 
@@ -1008,6 +898,10 @@ class InputMediaVideo(InputMediaVideolike):
     :type  supports_streaming: bool
     """
 
+    __slots__ = ('supports_streaming',)
+    _fields = ('type', 'media', 'thumb', 'caption', 'parse_mode', 'caption_entities', 'width', 'height', 'duration', 'supports_streaming')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+
     # noinspection PyShadowingBuiltins
     def __init__(self, media, thumb=None, caption=None, parse_mode=None, caption_entities=None, width=None, height=None, duration=None, supports_streaming=None):
         """
@@ -1055,8 +949,11 @@ class InputMediaVideo(InputMediaVideolike):
         :type  supports_streaming: bool
         """
         super(InputMediaVideo, self).__init__(type='video', media=media, thumb=thumb, caption=caption, parse_mode=parse_mode, caption_entities=caption_entities, width=width, height=height, duration=duration)
-        from ..receivable.media import MessageEntity
-        from .files import InputFile
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            from .files import InputFile
+            assert_type_or_raise(supports_streaming, None, bool, parameter_name="supports_streaming")
+        # end if
         # 'type' is set by InputMediaVideolike base class
         # 'media' is set by InputMediaVideolike base class
         # 'thumb' is set by InputMediaVideolike base class
@@ -1066,7 +963,6 @@ class InputMediaVideo(InputMediaVideolike):
         # 'width' is set by InputMediaVideolike base class
         # 'height' is set by InputMediaVideolike base class
         # 'duration' is set by InputMediaVideolike base class
-        assert_type_or_raise(supports_streaming, None, bool, parameter_name="supports_streaming")
         self.supports_streaming = supports_streaming
     # end def __init__
 
@@ -1080,7 +976,7 @@ class InputMediaVideo(InputMediaVideolike):
         :return: dictionary representation of this object.
         :rtype: dict
         """
-        if prefer_original and self._raw:
+        if prefer_original and self._raw and self._is_unmodified():
             return self._raw
         # end if
 
@@ -1115,7 +1011,7 @@ class InputMediaVideo(InputMediaVideolike):
         from ..receivable.media import MessageEntity
         from .files import InputFile
         data = InputMediaVideolike.validate_array(array)
-        # 'type' is given by class type
+        data.pop('type', None)  # always video, so not an argument of the constructor.
         # 'media' is given by class type
         # 'thumb' is given by class type
         # 'caption' is given by class type
@@ -1145,34 +1041,6 @@ class InputMediaVideo(InputMediaVideolike):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inputmediavideo_instance)`
-        """
-        return "InputMediaVideo(type={self.type!r}, media={self.media!r}, thumb={self.thumb!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, width={self.width!r}, height={self.height!r}, duration={self.duration!r}, supports_streaming={self.supports_streaming!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inputmediavideo_instance)`
-        """
-        if self._raw:
-            return "InputMediaVideo.from_array({self._raw})".format(self=self)
-        # end if
-        return "InputMediaVideo(type={self.type!r}, media={self.media!r}, thumb={self.thumb!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, width={self.width!r}, height={self.height!r}, duration={self.duration!r}, supports_streaming={self.supports_streaming!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inputmediavideo_instance`
-        """
-        return (
-            key in ["type", "media", "thumb", "caption", "parse_mode", "caption_entities", "width", "height", "duration", "supports_streaming"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InputMediaVideo
 
 
@@ -1219,6 +1087,10 @@ class InputMediaAnimation(InputMediaVideolike):
     :type  duration: int
     """
 
+    __slots__ = ()
+    _fields = ('type', 'media', 'thumb', 'caption', 'parse_mode', 'caption_entities', 'width', 'height', 'duration')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+
     # noinspection PyShadowingBuiltins
     def __init__(self, media, thumb=None, caption=None, parse_mode=None, caption_entities=None, width=None, height=None, duration=None):
         """
@@ -1263,7 +1135,6 @@ class InputMediaAnimation(InputMediaVideolike):
         :type  duration: int
         """
         super(InputMediaAnimation, self).__init__(type='animation', media=media, thumb=thumb, caption=caption, parse_mode=parse_mode, caption_entities=caption_entities, width=width, height=height, duration=duration)
-        from ..receivable.media import MessageEntity
         from .files import InputFile
         # 'type' is set by InputMediaVideolike base class
         # 'media' is set by InputMediaVideolike base class
@@ -1286,7 +1157,7 @@ class InputMediaAnimation(InputMediaVideolike):
         :return: dictionary representation of this object.
         :rtype: dict
         """
-        if prefer_original and self._raw:
+        if prefer_original and self._raw and self._is_unmodified():
             return self._raw
         # end if
 
@@ -1318,7 +1189,7 @@ class InputMediaAnimation(InputMediaVideolike):
         from ..receivable.media import MessageEntity
         from .files import InputFile
         data = InputMediaVideolike.validate_array(array)
-        # 'type' is given by class type
+        data.pop('type', None)  # always animation, so not an argument of the constructor.
         # 'media' is given by class type
         # 'thumb' is given by class type
         # 'caption' is given by class type
@@ -1347,34 +1218,6 @@ class InputMediaAnimation(InputMediaVideolike):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inputmediaanimation_instance)`
-        """
-        return "InputMediaAnimation(type={self.type!r}, media={self.media!r}, thumb={self.thumb!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, width={self.width!r}, height={self.height!r}, duration={self.duration!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inputmediaanimation_instance)`
-        """
-        if self._raw:
-            return "InputMediaAnimation.from_array({self._raw})".format(self=self)
-        # end if
-        return "InputMediaAnimation(type={self.type!r}, media={self.media!r}, thumb={self.thumb!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, width={self.width!r}, height={self.height!r}, duration={self.duration!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inputmediaanimation_instance`
-        """
-        return (
-            key in ["type", "media", "thumb", "caption", "parse_mode", "caption_entities", "width", "height", "duration"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InputMediaAnimation
 
 
@@ -1421,6 +1264,10 @@ class InputMediaAudio(InputMediaPlayable):
     :type  title: str|unicode
     """
 
+    __slots__ = ('performer', 'title')
+    _fields = ('type', 'media', 'thumb', 'caption', 'parse_mode', 'caption_entities', 'duration', 'performer', 'title')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+
     # noinspection PyShadowingBuiltins
     def __init__(self, media, thumb=None, caption=None, parse_mode=None, caption_entities=None, duration=None, performer=None, title=None):
         """
@@ -1465,8 +1312,12 @@ class InputMediaAudio(InputMediaPlayable):
         :type  title: str|unicode
         """
         super(InputMediaAudio, self).__init__(type='audio', media=media, thumb=thumb, caption=caption, parse_mode=parse_mode, caption_entities=caption_entities, duration=duration)
-        from ..receivable.media import MessageEntity
-        from .files import InputFile
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            from .files import InputFile
+            assert_type_or_raise(performer, None, unicode_type, parameter_name="performer")
+            assert_type_or_raise(title, None, unicode_type, parameter_name="title")
+        # end if
         # 'type' is set by InputMediaPlayable base class
         # 'media' is set by InputMediaPlayable base class
         # 'thumb' is set by InputMediaPlayable base class
@@ -1474,9 +1325,7 @@ class InputMediaAudio(InputMediaPlayable):
         # 'parse_mode' is set by InputMediaPlayable base class
         # 'caption_entities' is set by InputMediaPlayable base class
         # 'duration' is set by InputMediaPlayable base class
-        assert_type_or_raise(performer, None, unicode_type, parameter_name="performer")
         self.performer = performer
-        assert_type_or_raise(title, None, unicode_type, parameter_name="title")
         self.title = title
     # end def __init__
 
@@ -1490,7 +1339,7 @@ class InputMediaAudio(InputMediaPlayable):
         :return: dictionary representation of this object.
         :rtype: dict
         """
-        if prefer_original and self._raw:
+        if prefer_original and self._raw and self._is_unmodified():
             return self._raw
         # end if
 
@@ -1526,7 +1375,7 @@ class InputMediaAudio(InputMediaPlayable):
         from ..receivable.media import MessageEntity
         from .files import InputFile
         data = InputMediaPlayable.validate_array(array)
-        # 'type' is given by class type
+        data.pop('type', None)  # always audio, so not an argument of the constructor.
         # 'media' is given by class type
         # 'thumb' is given by class type
         # 'caption' is given by class type
@@ -1555,34 +1404,6 @@ class InputMediaAudio(InputMediaPlayable):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inputmediaaudio_instance)`
-        """
-        return "InputMediaAudio(type={self.type!r}, media={self.media!r}, thumb={self.thumb!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, duration={self.duration!r}, performer={self.performer!r}, title={self.title!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inputmediaaudio_instance)`
-        """
-        if self._raw:
-            return "InputMediaAudio.from_array({self._raw})".format(self=self)
-        # end if
-        return "InputMediaAudio(type={self.type!r}, media={self.media!r}, thumb={self.thumb!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, duration={self.duration!r}, performer={self.performer!r}, title={self.title!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inputmediaaudio_instance`
-        """
-        return (
-            key in ["type", "media", "thumb", "caption", "parse_mode", "caption_entities", "duration", "performer", "title"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InputMediaAudio
 
 
@@ -1624,6 +1445,10 @@ class InputMediaDocument(InputMediaWithThumb):
     :type  disable_content_type_detection: bool
     """
 
+    __slots__ = ('disable_content_type_detection',)
+    _fields = ('type', 'media', 'thumb', 'caption', 'parse_mode', 'caption_entities', 'disable_content_type_detection')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+
     # noinspection PyShadowingBuiltins
     def __init__(self, media, thumb=None, caption=None, parse_mode=None, caption_entities=None, disable_content_type_detection=None):
         """
@@ -1663,15 +1488,17 @@ class InputMediaDocument(InputMediaWithThumb):
         :type  disable_content_type_detection: bool
         """
         super(InputMediaDocument, self).__init__(type='document', media=media, thumb=thumb, caption=caption, parse_mode=parse_mode, caption_entities=caption_entities)
-        from ..receivable.media import MessageEntity
-        from .files import InputFile
+        if self._must_validate():
+            from ..receivable.media import MessageEntity
+            from .files import InputFile
+            assert_type_or_raise(disable_content_type_detection, None, bool, parameter_name="disable_content_type_detection")
+        # end if
         # 'type' is set by InputMediaWithThumb base class
         # 'media' is set by InputMediaWithThumb base class
         # 'thumb' is set by InputMediaWithThumb base class
         # 'caption' is set by InputMediaWithThumb base class
         # 'parse_mode' is set by InputMediaWithThumb base class
         # 'caption_entities' is set by InputMediaWithThumb base class
-        assert_type_or_raise(disable_content_type_detection, None, bool, parameter_name="disable_content_type_detection")
         self.disable_content_type_detection = disable_content_type_detection
     # end def __init__
 
@@ -1685,7 +1512,7 @@ class InputMediaDocument(InputMediaWithThumb):
         :return: dictionary representation of this object.
         :rtype: dict
         """
-        if prefer_original and self._raw:
+        if prefer_original and self._raw and self._is_unmodified():
             return self._raw
         # end if
 
@@ -1717,7 +1544,7 @@ class InputMediaDocument(InputMediaWithThumb):
         from ..receivable.media import MessageEntity
         from .files import InputFile
         data = InputMediaWithThumb.validate_array(array)
-        # 'type' is given by class type
+        data.pop('type', None)  # always document, so not an argument of the constructor.
         # 'media' is given by class type
         # 'thumb' is given by class type
         # 'caption' is given by class type
@@ -1744,32 +1571,14 @@ class InputMediaDocument(InputMediaWithThumb):
         instance._raw = array
         return instance
     # end def from_array
+# end class InputMediaDocument
 
-    def __str__(self):
-        """
-        Implements `str(inputmediadocument_instance)`
-        """
-        return "InputMediaDocument(type={self.type!r}, media={self.media!r}, thumb={self.thumb!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, disable_content_type_detection={self.disable_content_type_detection!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inputmediadocument_instance)`
-        """
-        if self._raw:
-            return "InputMediaDocument.from_array({self._raw})".format(self=self)
-        # end if
-        return "InputMediaDocument(type={self.type!r}, media={self.media!r}, thumb={self.thumb!r}, caption={self.caption!r}, parse_mode={self.parse_mode!r}, caption_entities={self.caption_entities!r}, disable_content_type_detection={self.disable_content_type_detection!r})".format(self=self)
-    # end def __repr__
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in inputmediadocument_instance`
-        """
-        return (
-            key in ["type", "media", "thumb", "caption", "parse_mode", "caption_entities", "disable_content_type_detection"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
-# end class InputMediaDocument
+# the subclasses `InputMedia.from_array(…)` parses into, by `type`.
+InputMedia._subclasses = {
+    "photo": InputMediaPhoto,
+    "video": InputMediaVideo,
+    "animation": InputMediaAnimation,
+    "audio": InputMediaAudio,
+    "document": InputMediaDocument,
+}
@@ -27,7 +27,27 @@ class PassportElementError(Sendable):
     Optional keyword parameters:
     """
 
-    pass
+    __slots__ = ()
+
+    @staticmethod
+    def from_array(array):
+        """
+        Deserialize the matching PassportElementError subclass from a given dictionary, looked up by its `source`.
+
+        :return: new PassportElementError subclass instance.
+        :rtype: PassportElementError
+        """
+        if not array:  # None or {}
+            return None
+        # end if
+
+        clazz = PassportElementError._subclasses.get(array.get('source'))
+        if clazz is None:
+            from ...exceptions import TgApiParseException
+            raise TgApiParseException('Unknown PassportElementError source {value!r}.'.format(value=array.get('source')))
+        # end if
+        return clazz.from_array(array)
+    # end def from_array
 # end class PassportElementError
 
 
@@ -57,6 +77,17 @@ class PassportElementErrorDataField(PassportElementError):
     Optional keyword parameters:
     """
 
+    __slots__ = ('source', 'type', 'field_name', 'data_hash', 'message')
+    _fields = ('source', 'type', 'field_name', 'data_hash', 'message')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('source', 'source', u, False),
+        ('type', 'type', u, False),
+        ('field_name', 'field_name', u, False),
+        ('data_hash', 'data_hash', u, False),
+        ('message', 'message', u, False),
+    )
+
     def __init__(self, type, field_name, data_hash, message):
         """
         Represents an issue in one of the data fields that was provided by the user.
@@ -83,41 +114,19 @@ class PassportElementErrorDataField(PassportElementError):
         Optional keyword parameters:
         """
         super(PassportElementErrorDataField, self).__init__()
+        if self._must_validate():
+            assert_type_or_raise(type, unicode_type, parameter_name="type")
+            assert_type_or_raise(field_name, unicode_type, parameter_name="field_name")
+            assert_type_or_raise(data_hash, unicode_type, parameter_name="data_hash")
+            assert_type_or_raise(message, unicode_type, parameter_name="message")
+        # end if
         self.source = 'data'
-        assert_type_or_raise(type, unicode_type, parameter_name="type")
         self.type = type
-        assert_type_or_raise(field_name, unicode_type, parameter_name="field_name")
         self.field_name = field_name
-        assert_type_or_raise(data_hash, unicode_type, parameter_name="data_hash")
         self.data_hash = data_hash
-        assert_type_or_raise(message, unicode_type, parameter_name="message")
         self.message = message
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this PassportElementErrorDataField to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(PassportElementErrorDataField, self).to_array()
-
-        array['source'] = u(self.source)  # py2: type unicode, py3: type str
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        array['field_name'] = u(self.field_name)  # py2: type unicode, py3: type str
-        array['data_hash'] = u(self.data_hash)  # py2: type unicode, py3: type str
-        array['message'] = u(self.message)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -153,34 +162,6 @@ class PassportElementErrorDataField(PassportElementError):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(passportelementerrordatafield_instance)`
-        """
-        return "PassportElementErrorDataField(source={self.source!r}, type={self.type!r}, field_name={self.field_name!r}, data_hash={self.data_hash!r}, message={self.message!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(passportelementerrordatafield_instance)`
-        """
-        if self._raw:
-            return "PassportElementErrorDataField.from_array({self._raw})".format(self=self)
-        # end if
-        return "PassportElementErrorDataField(source={self.source!r}, type={self.type!r}, field_name={self.field_name!r}, data_hash={self.data_hash!r}, message={self.message!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in passportelementerrordatafield_instance`
-        """
-        return (
-            key in ["source", "type", "field_name", "data_hash", "message"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class PassportElementErrorDataField
 
 
@@ -207,6 +188,16 @@ class PassportElementErrorFrontSide(PassportElementError):
     Optional keyword parameters:
     """
 
+    __slots__ = ('source', 'type', 'file_hash', 'message')
+    _fields = ('source', 'type', 'file_hash', 'message')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('source', 'source', u, False),
+        ('type', 'type', u, False),
+        ('file_hash', 'file_hash', u, False),
+        ('message', 'message', u, False),
+    )
+
     def __init__(self, type, file_hash, message):
         """
         Represents an issue with the front side of a document.
@@ -230,38 +221,17 @@ class PassportElementErrorFrontSide(PassportElementError):
         Optional keyword parameters:
         """
         super(PassportElementErrorFrontSide, self).__init__()
+        if self._must_validate():
+            assert_type_or_raise(type, unicode_type, parameter_name="type")
+            assert_type_or_raise(file_hash, unicode_type, parameter_name="file_hash")
+            assert_type_or_raise(message, unicode_type, parameter_name="message")
+        # end if
         self.source = 'front_side'
-        assert_type_or_raise(type, unicode_type, parameter_name="type")
         self.type = type
-        assert_type_or_raise(file_hash, unicode_type, parameter_name="file_hash")
         self.file_hash = file_hash
-        assert_type_or_raise(message, unicode_type, parameter_name="message")
         self.message = message
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this PassportElementErrorFrontSide to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(PassportElementErrorFrontSide, self).to_array()
-
-        array['source'] = u(self.source)  # py2: type unicode, py3: type str
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        array['file_hash'] = u(self.file_hash)  # py2: type unicode, py3: type str
-        array['message'] = u(self.message)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -296,34 +266,6 @@ class PassportElementErrorFrontSide(PassportElementError):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(passportelementerrorfrontside_instance)`
-        """
-        return "PassportElementErrorFrontSide(source={self.source!r}, type={self.type!r}, file_hash={self.file_hash!r}, message={self.message!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(passportelementerrorfrontside_instance)`
-        """
-        if self._raw:
-            return "PassportElementErrorFrontSide.from_array({self._raw})".format(self=self)
-        # end if
-        return "PassportElementErrorFrontSide(source={self.source!r}, type={self.type!r}, file_hash={self.file_hash!r}, message={self.message!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in passportelementerrorfrontside_instance`
-        """
-        return (
-            key in ["source", "type", "file_hash", "message"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class PassportElementErrorFrontSide
 
 
@@ -350,6 +292,16 @@ class PassportElementErrorReverseSide(PassportElementError):
     Optional keyword parameters:
     """
 
+    __slots__ = ('source', 'type', 'file_hash', 'message')
+    _fields = ('source', 'type', 'file_hash', 'message')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('source', 'source', u, False),
+        ('type', 'type', u, False),
+        ('file_hash', 'file_hash', u, False),
+        ('message', 'message', u, False),
+    )
+
     def __init__(self, type, file_hash, message):
         """
         Represents an issue with the reverse side of a document.
@@ -373,38 +325,17 @@ class PassportElementErrorReverseSide(PassportElementError):
         Optional keyword parameters:
         """
         super(PassportElementErrorReverseSide, self).__init__()
+        if self._must_validate():
+            assert_type_or_raise(type, unicode_type, parameter_name="type")
+            assert_type_or_raise(file_hash, unicode_type, parameter_name="file_hash")
+            assert_type_or_raise(message, unicode_type, parameter_name="message")
+        # end if
         self.source = 'reverse_side'
-        assert_type_or_raise(type, unicode_type, parameter_name="type")
         self.type = type
-        assert_type_or_raise(file_hash, unicode_type, parameter_name="file_hash")
         self.file_hash = file_hash
-        assert_type_or_raise(message, unicode_type, parameter_name="message")
         self.message = message
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this PassportElementErrorReverseSide to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(PassportElementErrorReverseSide, self).to_array()
-
-        array['source'] = u(self.source)  # py2: type unicode, py3: type str
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        array['file_hash'] = u(self.file_hash)  # py2: type unicode, py3: type str
-        array['message'] = u(self.message)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -439,34 +370,6 @@ class PassportElementErrorReverseSide(PassportElementError):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(passportelementerrorreverseside_instance)`
-        """
-        return "PassportElementErrorReverseSide(source={self.source!r}, type={self.type!r}, file_hash={self.file_hash!r}, message={self.message!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(passportelementerrorreverseside_instance)`
-        """
-        if self._raw:
-            return "PassportElementErrorReverseSide.from_array({self._raw})".format(self=self)
-        # end if
-        return "PassportElementErrorReverseSide(source={self.source!r}, type={self.type!r}, file_hash={self.file_hash!r}, message={self.message!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in passportelementerrorreverseside_instance`
-        """
-        return (
-            key in ["source", "type", "file_hash", "message"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class PassportElementErrorReverseSide
 
 
@@ -493,6 +396,16 @@ class PassportElementErrorSelfie(PassportElementError):
     Optional keyword parameters:
     """
 
+    __slots__ = ('source', 'type', 'file_hash', 'message')
+    _fields = ('source', 'type', 'file_hash', 'message')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('source', 'source', u, False),
+        ('type', 'type', u, False),
+        ('file_hash', 'file_hash', u, False),
+        ('message', 'message', u, False),
+    )
+
     def __init__(self, type, file_hash, message):
         """
         Represents an issue with the selfie with a document.
@@ -516,38 +429,17 @@ class PassportElementErrorSelfie(PassportElementError):
         Optional keyword parameters:
         """
         super(PassportElementErrorSelfie, self).__init__()
+        if self._must_validate():
+            assert_type_or_raise(type, unicode_type, parameter_name="type")
+            assert_type_or_raise(file_hash, unicode_type, parameter_name="file_hash")
+            assert_type_or_raise(message, unicode_type, parameter_name="message")
+        # end if
         self.source = 'selfie'
-        assert_type_or_raise(type, unicode_type, parameter_name="type")
         self.type = type
-        assert_type_or_raise(file_hash, unicode_type, parameter_name="file_hash")
         self.file_hash = file_hash
-        assert_type_or_raise(message, unicode_type, parameter_name="message")
         self.message = message
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this PassportElementErrorSelfie to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(PassportElementErrorSelfie, self).to_array()
-
-        array['source'] = u(self.source)  # py2: type unicode, py3: type str
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        array['file_hash'] = u(self.file_hash)  # py2: type unicode, py3: type str
-        array['message'] = u(self.message)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -582,34 +474,6 @@ class PassportElementErrorSelfie(PassportElementError):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(passportelementerrorselfie_instance)`
-        """
-        return "PassportElementErrorSelfie(source={self.source!r}, type={self.type!r}, file_hash={self.file_hash!r}, message={self.message!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(passportelementerrorselfie_instance)`
-        """
-        if self._raw:
-            return "PassportElementErrorSelfie.from_array({self._raw})".format(self=self)
-        # end if
-        return "PassportElementErrorSelfie(source={self.source!r}, type={self.type!r}, file_hash={self.file_hash!r}, message={self.message!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in passportelementerrorselfie_instance`
-        """
-        return (
-            key in ["source", "type", "file_hash", "message"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class PassportElementErrorSelfie
 
 
@@ -636,6 +500,16 @@ class PassportElementErrorFile(PassportElementError):
     Optional keyword parameters:
     """
 
+    __slots__ = ('source', 'type', 'file_hash', 'message')
+    _fields = ('source', 'type', 'file_hash', 'message')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('source', 'source', u, False),
+        ('type', 'type', u, False),
+        ('file_hash', 'file_hash', u, False),
+        ('message', 'message', u, False),
+    )
+
     def __init__(self, type, file_hash, message):
         """
         Represents an issue with a document scan.
@@ -659,38 +533,17 @@ class PassportElementErrorFile(PassportElementError):
         Optional keyword parameters:
         """
         super(PassportElementErrorFile, self).__init__()
+        if self._must_validate():
+            assert_type_or_raise(type, unicode_type, parameter_name="type")
+            assert_type_or_raise(file_hash, unicode_type, parameter_name="file_hash")
+            assert_type_or_raise(message, unicode_type, parameter_name="message")
+        # end if
         self.source = 'file'
-        assert_type_or_raise(type, unicode_type, parameter_name="type")
         self.type = type
-        assert_type_or_raise(file_hash, unicode_type, parameter_name="file_hash")
         self.file_hash = file_hash
-        assert_type_or_raise(message, unicode_type, parameter_name="message")
         self.message = message
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this PassportElementErrorFile to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(PassportElementErrorFile, self).to_array()
-
-        array['source'] = u(self.source)  # py2: type unicode, py3: type str
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        array['file_hash'] = u(self.file_hash)  # py2: type unicode, py3: type str
-        array['message'] = u(self.message)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -725,34 +578,6 @@ class PassportElementErrorFile(PassportElementError):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(passportelementerrorfile_instance)`
-        """
-        return "PassportElementErrorFile(source={self.source!r}, type={self.type!r}, file_hash={self.file_hash!r}, message={self.message!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(passportelementerrorfile_instance)`
-        """
-        if self._raw:
-            return "PassportElementErrorFile.from_array({self._raw})".format(self=self)
-        # end if
-        return "PassportElementErrorFile(source={self.source!r}, type={self.type!r}, file_hash={self.file_hash!r}, message={self.message!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in passportelementerrorfile_instance`
-        """
-        return (
-            key in ["source", "type", "file_hash", "message"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class PassportElementErrorFile
 
 
@@ -779,6 +604,16 @@ class PassportElementErrorFiles(PassportElementError):
     Optional keyword parameters:
     """
 
+    __slots__ = ('source', 'type', 'file_hashes', 'message')
+    _fields = ('source', 'type', 'file_hashes', 'message')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('source', 'source', u, False),
+        ('type', 'type', u, False),
+        ('file_hashes', 'file_hashes', list, False),
+        ('message', 'message', u, False),
+    )
+
     def __init__(self, type, file_hashes, message):
         """
         Represents an issue with a list of scans.
@@ -802,38 +637,17 @@ class PassportElementErrorFiles(PassportElementError):
         Optional keyword parameters:
         """
         super(PassportElementErrorFiles, self).__init__()
+        if self._must_validate():
+            assert_type_or_raise(type, unicode_type, parameter_name="type")
+            assert_type_or_raise(file_hashes, list, parameter_name="file_hashes")
+            assert_type_or_raise(message, unicode_type, parameter_name="message")
+        # end if
         self.source = 'files'
-        assert_type_or_raise(type, unicode_type, parameter_name="type")
         self.type = type
-        assert_type_or_raise(file_hashes, list, parameter_name="file_hashes")
         self.file_hashes = file_hashes
-        assert_type_or_raise(message, unicode_type, parameter_name="message")
         self.message = message
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this PassportElementErrorFiles to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(PassportElementErrorFiles, self).to_array()
-
-        array['source'] = u(self.source)  # py2: type unicode, py3: type str
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        array['file_hashes'] = self._as_array(self.file_hashes)  # type list of str
-        array['message'] = u(self.message)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -868,34 +682,6 @@ class PassportElementErrorFiles(PassportElementError):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(passportelementerrorfiles_instance)`
-        """
-        return "PassportElementErrorFiles(source={self.source!r}, type={self.type!r}, file_hashes={self.file_hashes!r}, message={self.message!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(passportelementerrorfiles_instance)`
-        """
-        if self._raw:
-            return "PassportElementErrorFiles.from_array({self._raw})".format(self=self)
-        # end if
-        return "PassportElementErrorFiles(source={self.source!r}, type={self.type!r}, file_hashes={self.file_hashes!r}, message={self.message!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in passportelementerrorfiles_instance`
-        """
-        return (
-            key in ["source", "type", "file_hashes", "message"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class PassportElementErrorFiles
 
 
@@ -922,6 +708,16 @@ class PassportElementErrorTranslationFile(PassportElementError):
     Optional keyword parameters:
     """
 
+    __slots__ = ('source', 'type', 'file_hash', 'message')
+    _fields = ('source', 'type', 'file_hash', 'message')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('source', 'source', u, False),
+        ('type', 'type', u, False),
+        ('file_hash', 'file_hash', u, False),
+        ('message', 'message', u, False),
+    )
+
     def __init__(self, type, file_hash, message):
         """
         Represents an issue with one of the files that constitute the translation of a document.
@@ -945,38 +741,17 @@ class PassportElementErrorTranslationFile(PassportElementError):
         Optional keyword parameters:
         """
         super(PassportElementErrorTranslationFile, self).__init__()
+        if self._must_validate():
+            assert_type_or_raise(type, unicode_type, parameter_name="type")
+            assert_type_or_raise(file_hash, unicode_type, parameter_name="file_hash")
+            assert_type_or_raise(message, unicode_type, parameter_name="message")
+        # end if
         self.source = 'translation_file'
-        assert_type_or_raise(type, unicode_type, parameter_name="type")
         self.type = type
-        assert_type_or_raise(file_hash, unicode_type, parameter_name="file_hash")
         self.file_hash = file_hash
-        assert_type_or_raise(message, unicode_type, parameter_name="message")
         self.message = message
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this PassportElementErrorTranslationFile to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(PassportElementErrorTranslationFile, self).to_array()
-
-        array['source'] = u(self.source)  # py2: type unicode, py3: type str
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        array['file_hash'] = u(self.file_hash)  # py2: type unicode, py3: type str
-        array['message'] = u(self.message)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1011,34 +786,6 @@ class PassportElementErrorTranslationFile(PassportElementError):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(passportelementerrortranslationfile_instance)`
-        """
-        return "PassportElementErrorTranslationFile(source={self.source!r}, type={self.type!r}, file_hash={self.file_hash!r}, message={self.message!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(passportelementerrortranslationfile_instance)`
-        """
-        if self._raw:
-            return "PassportElementErrorTranslationFile.from_array({self._raw})".format(self=self)
-        # end if
-        return "PassportElementErrorTranslationFile(source={self.source!r}, type={self.type!r}, file_hash={self.file_hash!r}, message={self.message!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in passportelementerrortranslationfile_instance`
-        """
-        return (
-            key in ["source", "type", "file_hash", "message"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class PassportElementErrorTranslationFile
 
 
@@ -1065,6 +812,16 @@ class PassportElementErrorTranslationFiles(PassportElementError):
     Optional keyword parameters:
     """
 
+    __slots__ = ('source', 'type', 'file_hashes', 'message')
+    _fields = ('source', 'type', 'file_hashes', 'message')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('source', 'source', u, False),
+        ('type', 'type', u, False),
+        ('file_hashes', 'file_hashes', list, False),
+        ('message', 'message', u, False),
+    )
+
     def __init__(self, type, file_hashes, message):
         """
         Represents an issue with the translated version of a document.
@@ -1088,38 +845,17 @@ class PassportElementErrorTranslationFiles(PassportElementError):
         Optional keyword parameters:
         """
         super(PassportElementErrorTranslationFiles, self).__init__()
+        if self._must_validate():
+            assert_type_or_raise(type, unicode_type, parameter_name="type")
+            assert_type_or_raise(file_hashes, list, parameter_name="file_hashes")
+            assert_type_or_raise(message, unicode_type, parameter_name="message")
+        # end if
         self.source = 'translation_files'
-        assert_type_or_raise(type, unicode_type, parameter_name="type")
         self.type = type
-        assert_type_or_raise(file_hashes, list, parameter_name="file_hashes")
         self.file_hashes = file_hashes
-        assert_type_or_raise(message, unicode_type, parameter_name="message")
         self.message = message
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this PassportElementErrorTranslationFiles to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(PassportElementErrorTranslationFiles, self).to_array()
-
-        array['source'] = u(self.source)  # py2: type unicode, py3: type str
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        array['file_hashes'] = self._as_array(self.file_hashes)  # type list of str
-        array['message'] = u(self.message)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1154,34 +890,6 @@ class PassportElementErrorTranslationFiles(PassportElementError):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(passportelementerrortranslationfiles_instance)`
-        """
-        return "PassportElementErrorTranslationFiles(source={self.source!r}, type={self.type!r}, file_hashes={self.file_hashes!r}, message={self.message!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(passportelementerrortranslationfiles_instance)`
-        """
-        if self._raw:
-            return "PassportElementErrorTranslationFiles.from_array({self._raw})".format(self=self)
-        # end if
-        return "PassportElementErrorTranslationFiles(source={self.source!r}, type={self.type!r}, file_hashes={self.file_hashes!r}, message={self.message!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in passportelementerrortranslationfiles_instance`
-        """
-        return (
-            key in ["source", "type", "file_hashes", "message"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class PassportElementErrorTranslationFiles
 
 
@@ -1208,6 +916,16 @@ class PassportElementErrorUnspecified(PassportElementError):
     Optional keyword parameters:
     """
 
+    __slots__ = ('source', 'type', 'element_hash', 'message')
+    _fields = ('source', 'type', 'element_hash', 'message')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('source', 'source', u, False),
+        ('type', 'type', u, False),
+        ('element_hash', 'element_hash', u, False),
+        ('message', 'message', u, False),
+    )
+
     def __init__(self, type, element_hash, message):
         """
         Represents an issue in an unspecified place.
@@ -1231,38 +949,17 @@ class PassportElementErrorUnspecified(PassportElementError):
         Optional keyword parameters:
         """
         super(PassportElementErrorUnspecified, self).__init__()
+        if self._must_validate():
+            assert_type_or_raise(type, unicode_type, parameter_name="type")
+            assert_type_or_raise(element_hash, unicode_type, parameter_name="element_hash")
+            assert_type_or_raise(message, unicode_type, parameter_name="message")
+        # end if
         self.source = 'unspecified'
-        assert_type_or_raise(type, unicode_type, parameter_name="type")
         self.type = type
-        assert_type_or_raise(element_hash, unicode_type, parameter_name="element_hash")
         self.element_hash = element_hash
-        assert_type_or_raise(message, unicode_type, parameter_name="message")
         self.message = message
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this PassportElementErrorUnspecified to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(PassportElementErrorUnspecified, self).to_array()
-
-        array['source'] = u(self.source)  # py2: type unicode, py3: type str
-        array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        array['element_hash'] = u(self.element_hash)  # py2: type unicode, py3: type str
-        array['message'] = u(self.message)  # py2: type unicode, py3: type str
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1297,32 +994,18 @@ class PassportElementErrorUnspecified(PassportElementError):
         instance._raw = array
         return instance
     # end def from_array
+# end class PassportElementErrorUnspecified
 
-    def __str__(self):
-        """
-        Implements `str(passportelementerrorunspecified_instance)`
-        """
-        return "PassportElementErrorUnspecified(source={self.source!r}, type={self.type!r}, element_hash={self.element_hash!r}, message={self.message!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(passportelementerrorunspecified_instance)`
-        """
-        if self._raw:
-            return "PassportElementErrorUnspecified.from_array({self._raw})".format(self=self)
-        # end if
-        return "PassportElementErrorUnspecified(source={self.source!r}, type={self.type!r}, element_hash={self.element_hash!r}, message={self.message!r})".format(self=self)
-    # end def __repr__
 
-    def __contains__(self, key):
-        """
-        Implements `"key" in passportelementerrorunspecified_instance`
-        """
-        return (
-            key in ["source", "type", "element_hash", "message"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
-# end class PassportElementErrorUnspecified
+# the subclasses `PassportElementError.from_array(…)` parses into, by `source`.
+PassportElementError._subclasses = {
+    "data": PassportElementErrorDataField,
+    "front_side": PassportElementErrorFrontSide,
+    "reverse_side": PassportElementErrorReverseSide,
+    "selfie": PassportElementErrorSelfie,
+    "file": PassportElementErrorFile,
+    "files": PassportElementErrorFiles,
+    "translation_file": PassportElementErrorTranslationFile,
+    "translation_files": PassportElementErrorTranslationFiles,
+    "unspecified": PassportElementErrorUnspecified,
+}
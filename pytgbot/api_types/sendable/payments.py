@@ -29,6 +29,14 @@ class LabeledPrice(Sendable):
     Optional keyword parameters:
     """
 
+    __slots__ = ('label', 'amount')
+    _fields = ('label', 'amount')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('label', 'label', u, False),
+        ('amount', 'amount', int, False),
+    )
+
     def __init__(self, label, amount):
         """
         This object represents a portion of the price for goods or services.
@@ -48,33 +56,14 @@ class LabeledPrice(Sendable):
         Optional keyword parameters:
         """
         super(LabeledPrice, self).__init__()
-        assert_type_or_raise(label, unicode_type, parameter_name="label")
+        if self._must_validate():
+            assert_type_or_raise(label, unicode_type, parameter_name="label")
+            assert_type_or_raise(amount, int, parameter_name="amount")
+        # end if
         self.label = label
-        assert_type_or_raise(amount, int, parameter_name="amount")
         self.amount = amount
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this LabeledPrice to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(LabeledPrice, self).to_array()
-
-        array['label'] = u(self.label)  # py2: type unicode, py3: type str
-        array['amount'] = int(self.amount)  # type int
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -107,34 +96,6 @@ class LabeledPrice(Sendable):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(labeledprice_instance)`
-        """
-        return "LabeledPrice(label={self.label!r}, amount={self.amount!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(labeledprice_instance)`
-        """
-        if self._raw:
-            return "LabeledPrice.from_array({self._raw})".format(self=self)
-        # end if
-        return "LabeledPrice(label={self.label!r}, amount={self.amount!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in labeledprice_instance`
-        """
-        return (
-            key in ["label", "amount"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class LabeledPrice
 
 
@@ -160,6 +121,15 @@ class ShippingOption(Sendable):
     Optional keyword parameters:
     """
 
+    __slots__ = ('id', 'title', 'prices')
+    _fields = ('id', 'title', 'prices')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('id', 'id', u, False),
+        ('title', 'title', u, False),
+        ('prices', 'prices', list, False),
+    )
+
     def __init__(self, id, title, prices):
         """
         This object represents one shipping option.
@@ -182,36 +152,16 @@ class ShippingOption(Sendable):
         Optional keyword parameters:
         """
         super(ShippingOption, self).__init__()
-        assert_type_or_raise(id, unicode_type, parameter_name="id")
+        if self._must_validate():
+            assert_type_or_raise(id, unicode_type, parameter_name="id")
+            assert_type_or_raise(title, unicode_type, parameter_name="title")
+            assert_type_or_raise(prices, list, parameter_name="prices")
+        # end if
         self.id = id
-        assert_type_or_raise(title, unicode_type, parameter_name="title")
         self.title = title
-        assert_type_or_raise(prices, list, parameter_name="prices")
         self.prices = prices
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ShippingOption to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ShippingOption, self).to_array()
-
-        array['id'] = u(self.id)  # py2: type unicode, py3: type str
-        array['title'] = u(self.title)  # py2: type unicode, py3: type str
-        array['prices'] = self._as_array(self.prices)  # type list of LabeledPrice
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -245,32 +195,4 @@ class ShippingOption(Sendable):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(shippingoption_instance)`
-        """
-        return "ShippingOption(id={self.id!r}, title={self.title!r}, prices={self.prices!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(shippingoption_instance)`
-        """
-        if self._raw:
-            return "ShippingOption.from_array({self._raw})".format(self=self)
-        # end if
-        return "ShippingOption(id={self.id!r}, title={self.title!r}, prices={self.prices!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in shippingoption_instance`
-        """
-        return (
-            key in ["id", "title", "prices"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class ShippingOption
@@ -25,6 +25,8 @@ class Button(Sendable):
     Optional keyword parameters:
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Button, self).__init__()
     # end def __init__
@@ -38,6 +40,8 @@ class ReplyMarkup(Sendable):
     Optional keyword parameters:
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(ReplyMarkup, self).__init__()
     # end def __init__
@@ -77,6 +81,17 @@ class ReplyKeyboardMarkup(ReplyMarkup):
     :type  selective: bool
     """
 
+    __slots__ = ('keyboard', 'resize_keyboard', 'one_time_keyboard', 'input_field_placeholder', 'selective')
+    _fields = ('keyboard', 'resize_keyboard', 'one_time_keyboard', 'input_field_placeholder', 'selective')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('keyboard', 'keyboard', list, False),
+        ('resize_keyboard', 'resize_keyboard', bool, True),
+        ('one_time_keyboard', 'one_time_keyboard', bool, True),
+        ('input_field_placeholder', 'input_field_placeholder', u, True),
+        ('selective', 'selective', bool, True),
+    )
+
     def __init__(self, keyboard, resize_keyboard=None, one_time_keyboard=None, input_field_placeholder=None, selective=None):
         """
         This object represents a custom keyboard with reply options (see Introduction to bots for details and examples).
@@ -110,50 +125,20 @@ class ReplyKeyboardMarkup(ReplyMarkup):
         :type  selective: bool
         """
         super(ReplyKeyboardMarkup, self).__init__()
-        assert_type_or_raise(keyboard, list, parameter_name="keyboard")
+        if self._must_validate():
+            assert_type_or_raise(keyboard, list, parameter_name="keyboard")
+            assert_type_or_raise(resize_keyboard, None, bool, parameter_name="resize_keyboard")
+            assert_type_or_raise(one_time_keyboard, None, bool, parameter_name="one_time_keyboard")
+            assert_type_or_raise(input_field_placeholder, None, unicode_type, parameter_name="input_field_placeholder")
+            assert_type_or_raise(selective, None, bool, parameter_name="selective")
+        # end if
         self.keyboard = keyboard
-        assert_type_or_raise(resize_keyboard, None, bool, parameter_name="resize_keyboard")
         self.resize_keyboard = resize_keyboard
-        assert_type_or_raise(one_time_keyboard, None, bool, parameter_name="one_time_keyboard")
         self.one_time_keyboard = one_time_keyboard
-        assert_type_or_raise(input_field_placeholder, None, unicode_type, parameter_name="input_field_placeholder")
         self.input_field_placeholder = input_field_placeholder
-        assert_type_or_raise(selective, None, bool, parameter_name="selective")
         self.selective = selective
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ReplyKeyboardMarkup to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ReplyKeyboardMarkup, self).to_array()
-
-        array['keyboard'] = self._as_array(self.keyboard)  # type list of list of KeyboardButton
-        if self.resize_keyboard is not None:
-            array['resize_keyboard'] = bool(self.resize_keyboard)  # type bool
-        # end if
-        if self.one_time_keyboard is not None:
-            array['one_time_keyboard'] = bool(self.one_time_keyboard)  # type bool
-        # end if
-        if self.input_field_placeholder is not None:
-            array['input_field_placeholder'] = u(self.input_field_placeholder)  # py2: type unicode, py3: type str
-        # end if
-        if self.selective is not None:
-            array['selective'] = bool(self.selective)  # type bool
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -189,34 +174,6 @@ class ReplyKeyboardMarkup(ReplyMarkup):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(replykeyboardmarkup_instance)`
-        """
-        return "ReplyKeyboardMarkup(keyboard={self.keyboard!r}, resize_keyboard={self.resize_keyboard!r}, one_time_keyboard={self.one_time_keyboard!r}, input_field_placeholder={self.input_field_placeholder!r}, selective={self.selective!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(replykeyboardmarkup_instance)`
-        """
-        if self._raw:
-            return "ReplyKeyboardMarkup.from_array({self._raw})".format(self=self)
-        # end if
-        return "ReplyKeyboardMarkup(keyboard={self.keyboard!r}, resize_keyboard={self.resize_keyboard!r}, one_time_keyboard={self.one_time_keyboard!r}, input_field_placeholder={self.input_field_placeholder!r}, selective={self.selective!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in replykeyboardmarkup_instance`
-        """
-        return (
-            key in ["keyboard", "resize_keyboard", "one_time_keyboard", "input_field_placeholder", "selective"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class ReplyKeyboardMarkup
 
 
@@ -255,6 +212,16 @@ class KeyboardButton(Button):
     :type  request_poll: pytgbot.api_types.sendable.reply_markup.KeyboardButtonPollType
     """
 
+    __slots__ = ('text', 'request_contact', 'request_location', 'request_poll')
+    _fields = ('text', 'request_contact', 'request_location', 'request_poll')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('text', 'text', u, False),
+        ('request_contact', 'request_contact', bool, True),
+        ('request_location', 'request_location', bool, True),
+        ('request_poll', 'request_poll', None, True),
+    )
+
     def __init__(self, text, request_contact=None, request_location=None, request_poll=None):
         """
         This object represents one button of the reply keyboard.
@@ -290,45 +257,18 @@ class KeyboardButton(Button):
         :type  request_poll: pytgbot.api_types.sendable.reply_markup.KeyboardButtonPollType
         """
         super(KeyboardButton, self).__init__()
-        assert_type_or_raise(text, unicode_type, parameter_name="text")
+        if self._must_validate():
+            assert_type_or_raise(text, unicode_type, parameter_name="text")
+            assert_type_or_raise(request_contact, None, bool, parameter_name="request_contact")
+            assert_type_or_raise(request_location, None, bool, parameter_name="request_location")
+            assert_type_or_raise(request_poll, None, KeyboardButtonPollType, parameter_name="request_poll")
+        # end if
         self.text = text
-        assert_type_or_raise(request_contact, None, bool, parameter_name="request_contact")
         self.request_contact = request_contact
-        assert_type_or_raise(request_location, None, bool, parameter_name="request_location")
         self.request_location = request_location
-        assert_type_or_raise(request_poll, None, KeyboardButtonPollType, parameter_name="request_poll")
         self.request_poll = request_poll
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this KeyboardButton to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(KeyboardButton, self).to_array()
-
-        array['text'] = u(self.text)  # py2: type unicode, py3: type str
-        if self.request_contact is not None:
-            array['request_contact'] = bool(self.request_contact)  # type bool
-        # end if
-        if self.request_location is not None:
-            array['request_location'] = bool(self.request_location)  # type bool
-        # end if
-        if self.request_poll is not None:
-            array['request_poll'] = self.request_poll.to_array()  # type KeyboardButtonPollType
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -363,34 +303,6 @@ class KeyboardButton(Button):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(keyboardbutton_instance)`
-        """
-        return "KeyboardButton(text={self.text!r}, request_contact={self.request_contact!r}, request_location={self.request_location!r}, request_poll={self.request_poll!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(keyboardbutton_instance)`
-        """
-        if self._raw:
-            return "KeyboardButton.from_array({self._raw})".format(self=self)
-        # end if
-        return "KeyboardButton(text={self.text!r}, request_contact={self.request_contact!r}, request_location={self.request_location!r}, request_poll={self.request_poll!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in keyboardbutton_instance`
-        """
-        return (
-            key in ["text", "request_contact", "request_location", "request_poll"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class KeyboardButton
 
 
@@ -408,6 +320,13 @@ class KeyboardButtonPollType(Button):
     :type  type: str|unicode
     """
 
+    __slots__ = ('type',)
+    _fields = ('type',)  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('type', 'type', u, True),
+    )
+
     def __init__(self, type=None):
         """
         This object represents type of a poll, which is allowed to be created and sent when the corresponding button is pressed.
@@ -422,32 +341,12 @@ class KeyboardButtonPollType(Button):
         :type  type: str|unicode
         """
         super(KeyboardButtonPollType, self).__init__()
-        assert_type_or_raise(type, None, unicode_type, parameter_name="type")
+        if self._must_validate():
+            assert_type_or_raise(type, None, unicode_type, parameter_name="type")
+        # end if
         self.type = type
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this KeyboardButtonPollType to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(KeyboardButtonPollType, self).to_array()
-
-        if self.type is not None:
-            array['type'] = u(self.type)  # py2: type unicode, py3: type str
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -479,34 +378,6 @@ class KeyboardButtonPollType(Button):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(keyboardbuttonpolltype_instance)`
-        """
-        return "KeyboardButtonPollType(type={self.type!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(keyboardbuttonpolltype_instance)`
-        """
-        if self._raw:
-            return "KeyboardButtonPollType.from_array({self._raw})".format(self=self)
-        # end if
-        return "KeyboardButtonPollType(type={self.type!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in keyboardbuttonpolltype_instance`
-        """
-        return (
-            key in ["type"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class KeyboardButtonPollType
 
 
@@ -529,6 +400,14 @@ class ReplyKeyboardRemove(ReplyMarkup):
     :type  selective: bool
     """
 
+    __slots__ = ('remove_keyboard', 'selective')
+    _fields = ('remove_keyboard', 'selective')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('remove_keyboard', 'remove_keyboard', bool, False),
+        ('selective', 'selective', bool, True),
+    )
+
     def __init__(self, selective=None):
         """
         Upon receiving a message with this object, Telegram clients will remove the current custom keyboard and display the default letter-keyboard.
@@ -556,34 +435,13 @@ class ReplyKeyboardRemove(ReplyMarkup):
         :type  selective: bool
         """
         super(ReplyKeyboardRemove, self).__init__()
+        if self._must_validate():
+            assert_type_or_raise(selective, None, bool, parameter_name="selective")
+        # end if
         self.remove_keyboard = True
-        assert_type_or_raise(selective, None, bool, parameter_name="selective")
         self.selective = selective
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ReplyKeyboardRemove to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ReplyKeyboardRemove, self).to_array()
-
-        array['remove_keyboard'] = bool(self.remove_keyboard)  # type bool
-        if self.selective is not None:
-            array['selective'] = bool(self.selective)  # type bool
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -616,34 +474,6 @@ class ReplyKeyboardRemove(ReplyMarkup):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(replykeyboardremove_instance)`
-        """
-        return "ReplyKeyboardRemove(remove_keyboard={self.remove_keyboard!r}, selective={self.selective!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(replykeyboardremove_instance)`
-        """
-        if self._raw:
-            return "ReplyKeyboardRemove.from_array({self._raw})".format(self=self)
-        # end if
-        return "ReplyKeyboardRemove(remove_keyboard={self.remove_keyboard!r}, selective={self.selective!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in replykeyboardremove_instance`
-        """
-        return (
-            key in ["remove_keyboard", "selective"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class ReplyKeyboardRemove
 
 
@@ -666,6 +496,13 @@ class InlineKeyboardMarkup(ReplyMarkup):
     Optional keyword parameters:
     """
 
+    __slots__ = ('inline_keyboard',)
+    _fields = ('inline_keyboard',)  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('inline_keyboard', 'inline_keyboard', list, False),
+    )
+
     def __init__(self, inline_keyboard):
         """
         This object represents an inline keyboard that appears right next to the message it belongs to.
@@ -685,30 +522,12 @@ class InlineKeyboardMarkup(ReplyMarkup):
         Optional keyword parameters:
         """
         super(InlineKeyboardMarkup, self).__init__()
-        assert_type_or_raise(inline_keyboard, list, parameter_name="inline_keyboard")
+        if self._must_validate():
+            assert_type_or_raise(inline_keyboard, list, parameter_name="inline_keyboard")
+        # end if
         self.inline_keyboard = inline_keyboard
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineKeyboardMarkup to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(InlineKeyboardMarkup, self).to_array()
-
-        array['inline_keyboard'] = self._as_array(self.inline_keyboard)  # type list of list of InlineKeyboardButton
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -740,34 +559,6 @@ class InlineKeyboardMarkup(ReplyMarkup):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinekeyboardmarkup_instance)`
-        """
-        return "InlineKeyboardMarkup(inline_keyboard={self.inline_keyboard!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinekeyboardmarkup_instance)`
-        """
-        if self._raw:
-            return "InlineKeyboardMarkup.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineKeyboardMarkup(inline_keyboard={self.inline_keyboard!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinekeyboardmarkup_instance`
-        """
-        return (
-            key in ["inline_keyboard"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineKeyboardMarkup
 
 
@@ -819,6 +610,20 @@ class InlineKeyboardButton(Button):
     :type  pay: bool
     """
 
+    __slots__ = ('text', 'url', 'login_url', 'callback_data', 'switch_inline_query', 'switch_inline_query_current_chat', 'callback_game', 'pay')
+    _fields = ('text', 'url', 'login_url', 'callback_data', 'switch_inline_query', 'switch_inline_query_current_chat', 'callback_game', 'pay')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('text', 'text', u, False),
+        ('url', 'url', u, True),
+        ('login_url', 'login_url', None, True),
+        ('callback_data', 'callback_data', u, True),
+        ('switch_inline_query', 'switch_inline_query', u, True),
+        ('switch_inline_query_current_chat', 'switch_inline_query_current_chat', u, True),
+        ('callback_game', 'callback_game', None, True),
+        ('pay', 'pay', bool, True),
+    )
+
     def __init__(self, text, url=None, login_url=None, callback_data=None, switch_inline_query=None, switch_inline_query_current_chat=None, callback_game=None, pay=None):
         """
         This object represents one button of an inline keyboard.
@@ -864,67 +669,27 @@ class InlineKeyboardButton(Button):
         :type  pay: bool
         """
         super(InlineKeyboardButton, self).__init__()
-        from ..receivable.updates import CallbackGame
-        assert_type_or_raise(text, unicode_type, parameter_name="text")
+        if self._must_validate():
+            from ..receivable.updates import CallbackGame
+            assert_type_or_raise(text, unicode_type, parameter_name="text")
+            assert_type_or_raise(url, None, unicode_type, parameter_name="url")
+            assert_type_or_raise(login_url, None, LoginUrl, parameter_name="login_url")
+            assert_type_or_raise(callback_data, None, unicode_type, parameter_name="callback_data")
+            assert_type_or_raise(switch_inline_query, None, unicode_type, parameter_name="switch_inline_query")
+            assert_type_or_raise(switch_inline_query_current_chat, None, unicode_type, parameter_name="switch_inline_query_current_chat")
+            assert_type_or_raise(callback_game, None, CallbackGame, parameter_name="callback_game")
+            assert_type_or_raise(pay, None, bool, parameter_name="pay")
+        # end if
         self.text = text
-        assert_type_or_raise(url, None, unicode_type, parameter_name="url")
         self.url = url
-        assert_type_or_raise(login_url, None, LoginUrl, parameter_name="login_url")
         self.login_url = login_url
-        assert_type_or_raise(callback_data, None, unicode_type, parameter_name="callback_data")
         self.callback_data = callback_data
-        assert_type_or_raise(switch_inline_query, None, unicode_type, parameter_name="switch_inline_query")
         self.switch_inline_query = switch_inline_query
-        assert_type_or_raise(switch_inline_query_current_chat, None, unicode_type, parameter_name="switch_inline_query_current_chat")
         self.switch_inline_query_current_chat = switch_inline_query_current_chat
-        assert_type_or_raise(callback_game, None, CallbackGame, parameter_name="callback_game")
         self.callback_game = callback_game
-        assert_type_or_raise(pay, None, bool, parameter_name="pay")
         self.pay = pay
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this InlineKeyboardButton to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        from ..receivable.updates import CallbackGame
-        array = super(InlineKeyboardButton, self).to_array()
-
-        array['text'] = u(self.text)  # py2: type unicode, py3: type str
-        if self.url is not None:
-            array['url'] = u(self.url)  # py2: type unicode, py3: type str
-        # end if
-        if self.login_url is not None:
-            array['login_url'] = self.login_url.to_array()  # type LoginUrl
-        # end if
-        if self.callback_data is not None:
-            array['callback_data'] = u(self.callback_data)  # py2: type unicode, py3: type str
-        # end if
-        if self.switch_inline_query is not None:
-            array['switch_inline_query'] = u(self.switch_inline_query)  # py2: type unicode, py3: type str
-        # end if
-        if self.switch_inline_query_current_chat is not None:
-            array['switch_inline_query_current_chat'] = u(self.switch_inline_query_current_chat)  # py2: type unicode, py3: type str
-        # end if
-        if self.callback_game is not None:
-            array['callback_game'] = self.callback_game.to_array()  # type CallbackGame
-        # end if
-        if self.pay is not None:
-            array['pay'] = bool(self.pay)  # type bool
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -964,34 +729,6 @@ class InlineKeyboardButton(Button):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(inlinekeyboardbutton_instance)`
-        """
-        return "InlineKeyboardButton(text={self.text!r}, url={self.url!r}, login_url={self.login_url!r}, callback_data={self.callback_data!r}, switch_inline_query={self.switch_inline_query!r}, switch_inline_query_current_chat={self.switch_inline_query_current_chat!r}, callback_game={self.callback_game!r}, pay={self.pay!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(inlinekeyboardbutton_instance)`
-        """
-        if self._raw:
-            return "InlineKeyboardButton.from_array({self._raw})".format(self=self)
-        # end if
-        return "InlineKeyboardButton(text={self.text!r}, url={self.url!r}, login_url={self.login_url!r}, callback_data={self.callback_data!r}, switch_inline_query={self.switch_inline_query!r}, switch_inline_query_current_chat={self.switch_inline_query_current_chat!r}, callback_game={self.callback_game!r}, pay={self.pay!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in inlinekeyboardbutton_instance`
-        """
-        return (
-            key in ["text", "url", "login_url", "callback_data", "switch_inline_query", "switch_inline_query_current_chat", "callback_game", "pay"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class InlineKeyboardButton
 
 
@@ -1030,6 +767,16 @@ class LoginUrl(Sendable):
     :type  request_write_access: bool
     """
 
+    __slots__ = ('url', 'forward_text', 'bot_username', 'request_write_access')
+    _fields = ('url', 'forward_text', 'bot_username', 'request_write_access')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('url', 'url', u, False),
+        ('forward_text', 'forward_text', u, True),
+        ('bot_username', 'bot_username', u, True),
+        ('request_write_access', 'request_write_access', bool, True),
+    )
+
     def __init__(self, url, forward_text=None, bot_username=None, request_write_access=None):
         """
         This object represents a parameter of the inline keyboard button used to automatically authorize a user.
@@ -1065,45 +812,18 @@ class LoginUrl(Sendable):
         :type  request_write_access: bool
         """
         super(LoginUrl, self).__init__()
-        assert_type_or_raise(url, unicode_type, parameter_name="url")
+        if self._must_validate():
+            assert_type_or_raise(url, unicode_type, parameter_name="url")
+            assert_type_or_raise(forward_text, None, unicode_type, parameter_name="forward_text")
+            assert_type_or_raise(bot_username, None, unicode_type, parameter_name="bot_username")
+            assert_type_or_raise(request_write_access, None, bool, parameter_name="request_write_access")
+        # end if
         self.url = url
-        assert_type_or_raise(forward_text, None, unicode_type, parameter_name="forward_text")
         self.forward_text = forward_text
-        assert_type_or_raise(bot_username, None, unicode_type, parameter_name="bot_username")
         self.bot_username = bot_username
-        assert_type_or_raise(request_write_access, None, bool, parameter_name="request_write_access")
         self.request_write_access = request_write_access
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this LoginUrl to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(LoginUrl, self).to_array()
-
-        array['url'] = u(self.url)  # py2: type unicode, py3: type str
-        if self.forward_text is not None:
-            array['forward_text'] = u(self.forward_text)  # py2: type unicode, py3: type str
-        # end if
-        if self.bot_username is not None:
-            array['bot_username'] = u(self.bot_username)  # py2: type unicode, py3: type str
-        # end if
-        if self.request_write_access is not None:
-            array['request_write_access'] = bool(self.request_write_access)  # type bool
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1138,34 +858,6 @@ class LoginUrl(Sendable):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(loginurl_instance)`
-        """
-        return "LoginUrl(url={self.url!r}, forward_text={self.forward_text!r}, bot_username={self.bot_username!r}, request_write_access={self.request_write_access!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(loginurl_instance)`
-        """
-        if self._raw:
-            return "LoginUrl.from_array({self._raw})".format(self=self)
-        # end if
-        return "LoginUrl(url={self.url!r}, forward_text={self.forward_text!r}, bot_username={self.bot_username!r}, request_write_access={self.request_write_access!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in loginurl_instance`
-        """
-        return (
-            key in ["url", "forward_text", "bot_username", "request_write_access"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class LoginUrl
 
 
@@ -1203,6 +895,15 @@ class ForceReply(ReplyMarkup):
     :type  selective: bool
     """
 
+    __slots__ = ('force_reply', 'input_field_placeholder', 'selective')
+    _fields = ('force_reply', 'input_field_placeholder', 'selective')  # all of them, in api order, also the ones of the parent class.
+    _field_set = frozenset(_fields)  # for `"key" in instance`, see `TgBotApiObject.__contains__`.
+    _array_fields = (  # for the shared `to_array()`: name, api name, conversion and if optional, see `TgBotApiObject.to_array`.
+        ('force_reply', 'force_reply', bool, False),
+        ('input_field_placeholder', 'input_field_placeholder', u, True),
+        ('selective', 'selective', bool, True),
+    )
+
     def __init__(self, input_field_placeholder=None, selective=None):
         """
         Upon receiving a message with this object, Telegram clients will display a reply interface to the user (act as if the user has selected the bot's message and tapped 'Reply').
@@ -1241,39 +942,15 @@ class ForceReply(ReplyMarkup):
         :type  selective: bool
         """
         super(ForceReply, self).__init__()
+        if self._must_validate():
+            assert_type_or_raise(input_field_placeholder, None, unicode_type, parameter_name="input_field_placeholder")
+            assert_type_or_raise(selective, None, bool, parameter_name="selective")
+        # end if
         self.force_reply = True
-        assert_type_or_raise(input_field_placeholder, None, unicode_type, parameter_name="input_field_placeholder")
         self.input_field_placeholder = input_field_placeholder
-        assert_type_or_raise(selective, None, bool, parameter_name="selective")
         self.selective = selective
     # end def __init__
 
-    def to_array(self, prefer_original=False):
-        """
-        Serializes this ForceReply to a dictionary.
-
-        :param prefer_original: If we should return the data this was constructed with if available. If it's not available, it will be constructed normally from the data of the object.
-        :type  prefer_original: bool
-
-        :return: dictionary representation of this object.
-        :rtype: dict
-        """
-        if prefer_original and self._raw:
-            return self._raw
-        # end if
-
-        array = super(ForceReply, self).to_array()
-
-        array['force_reply'] = bool(self.force_reply)  # type bool
-        if self.input_field_placeholder is not None:
-            array['input_field_placeholder'] = u(self.input_field_placeholder)  # py2: type unicode, py3: type str
-        # end if
-        if self.selective is not None:
-            array['selective'] = bool(self.selective)  # type bool
-        # end if
-        return array
-    # end def to_array
-
     @staticmethod
     def validate_array(array):
         """
@@ -1307,32 +984,4 @@ class ForceReply(ReplyMarkup):
         instance._raw = array
         return instance
     # end def from_array
-
-    def __str__(self):
-        """
-        Implements `str(forcereply_instance)`
-        """
-        return "ForceReply(force_reply={self.force_reply!r}, input_field_placeholder={self.input_field_placeholder!r}, selective={self.selective!r})".format(self=self)
-    # end def __str__
-
-    def __repr__(self):
-        """
-        Implements `repr(forcereply_instance)`
-        """
-        if self._raw:
-            return "ForceReply.from_array({self._raw})".format(self=self)
-        # end if
-        return "ForceReply(force_reply={self.force_reply!r}, input_field_placeholder={self.input_field_placeholder!r}, selective={self.selective!r})".format(self=self)
-    # end def __repr__
-
-    def __contains__(self, key):
-        """
-        Implements `"key" in forcereply_instance`
-        """
-        return (
-            key in ["force_reply", "input_field_placeholder", "selective"]
-            and hasattr(self, key)
-            and bool(getattr(self, key, None))
-        )
-    # end def __contains__
 # end class ForceReply
@@ -1,12 +1,30 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+from importlib import import_module
 from luckydonaldUtils.logger import logging
-from .synchronous import SyncBot as Bot
 
 __author__ = 'luckydonald'
 __all__ = ["Bot", "asynchronous", "synchronous"]
 
 logger = logging.getLogger(__name__)
+
+
+def __getattr__(name):
+    """
+    Imports the `SyncBot` as `Bot` on first access only,
+    so using `pytgbot.bot.asynchronous` doesn't load `requests` as well.
+    """
+    if name == 'Bot':
+        from .synchronous import SyncBot as Bot
+        globals()['Bot'] = Bot
+        return Bot
+    # end if
+    if name in ('asynchronous', 'synchronous', 'base'):
+        return import_module('.' + name, __name__)
+    # end if
+    raise AttributeError('module {module!r} has no attribute {name!r}'.format(module=__name__, name=name))
+# end def
+
 if __name__ == '__main__':
     logging.add_colored_handler(level=logging.DEBUG)
 # end if
@@ -2,7 +2,8 @@
 import json
 import re
 
-from datetime import timedelta, datetime
+from datetime import timedelta
+from time import monotonic
 from DictObject import DictObject
 from luckydonaldUtils.logger import logging
 from luckydonaldUtils.encoding import unicode_type, to_unicode as u, to_native as n
@@ -15,14 +16,15 @@ from ..exceptions import TgApiException
 
 from ..api_types.sendable.inline import InlineQueryResult
 from ..api_types import from_array_list
+from ..multipart import MultipartEncoder, close_files
 
-from .base import BotBase
+from .base import BotBase, DEFAULT_MAX_CONNECTIONS, DEFAULT_MAX_KEEPALIVE_CONNECTIONS
 
 
 # async imports
 from async_property import async_property
 from typing import Union, Optional, List, Any
-from asyncio import sleep
+from asyncio import sleep, get_running_loop
 import httpx
 
 
@@ -66,25 +68,140 @@ logger = logging.getLogger(__name__)
 
 
 class AsyncBot(BotBase):
+    def __init__(
+        self, api_key, return_python_objects=True, base_url=None, download_url=None, default_timeout=None,
+        scheduler=None, retry=None, file_id_cache=None, lazy_updates=False, validation_mode=None, json_codec=None,
+        prefer_original=True, trace=None,
+        max_connections=DEFAULT_MAX_CONNECTIONS, max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS, http2=None,
+    ):
+        """
+        An asynchronous Bot instance. From here you can call all the functions.
+        All the requests share a single long-lived :class:`httpx.AsyncClient`,
+        so connections, TLS sessions and HTTP/2 streams are reused between the requests.
+        Use `await bot.aclose()` or a `async with AsyncBot(…) as bot:` block to release those connections again.
+
+        See :class:`pytgbot.bot.base.BotBase` for the other parameters.
+
+        :param max_connections: The maximum number of concurrent connections.
+        :type  max_connections: int|None
+
+        :param max_keepalive_connections: The maximum number of idle connections to keep open.
+        :type  max_keepalive_connections: int|None
+
+        :param http2: If HTTP/2 should be used. Needs the `h2` package (`pip install httpx[http2]`).
+                      The default `None` uses HTTP/2 if that package is installed.
+        :type  http2: bool|None
+        """
+        super(AsyncBot, self).__init__(
+            api_key, return_python_objects=return_python_objects, base_url=base_url, download_url=download_url,
+            default_timeout=default_timeout, scheduler=scheduler, retry=retry,
+            file_id_cache=file_id_cache, lazy_updates=lazy_updates, validation_mode=validation_mode, json_codec=json_codec,
+            prefer_original=prefer_original, trace=trace,
+        )
+        if http2 is None:
+            try:
+                import h2  # pip install httpx[http2]
+                http2 = True
+            except ImportError:
+                http2 = False
+            # end try
+        # end if
+        self._limits = httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=max_keepalive_connections,
+        )
+        self._http2 = http2
+        self._client = None  # will be created with the first request, see `.client`.
+    # end def __init__
+
+    @property
+    def client(self):
+        """
+        The :class:`httpx.AsyncClient` used for all the requests of this bot.
+        It is created on first use, and again after `await bot.aclose()` was called.
+
+        :rtype: httpx.AsyncClient
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                verify=True,  # No self signed certificates. Telegram should be trustworthy anyway...
+                http2=self._http2,
+                limits=self._limits,
+            )
+        # end if
+        return self._client
+    # end def
+
+    async def aclose(self):
+        """
+        Closes all the pooled connections of this bot.
+        The bot can still be used afterwards, it will simply open new connections as needed.
+        """
+        if self._client is not None:
+            client = self._client
+            self._client = None
+            await client.aclose()
+        # end if
+    # end def aclose
+
+    async def __aenter__(self):
+        return self
+    # end def
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+    # end def
+
     def _load_info(self):
         """
         This functions stores the id and the username of the bot.
         Called by `.username` and `.id` properties.
 
-        This function is synchronous.
-        In fact, `AsyncBot` uses `SyncBot` to load those.
+        This function is synchronous, so it can't load anything without blocking the event loop.
+        Therefore inside of a running event loop you need to `await bot.load_info()` once first,
+        afterwards `bot.me`, `bot.username` and `bot.id` will use that cached value.
+        Outside of an event loop we're allowed to block, and use a `SyncBot` to load it.
         :return:
         """
+        try:
+            get_running_loop()
+        except RuntimeError:
+            pass  # no event loop running, we can block
+        else:
+            raise TgApiException(
+                "The bot info isn't loaded yet, and loading it now would block the event loop. "
+                "Call `await bot.load_info()` first."
+            )
+        # end try
 
         from .synchronous import SyncBot
-        bot = SyncBot(api_key=self.api_key, return_python_objects=True)
-        myself = bot.get_me()
-        self._me = myself
+        with SyncBot(
+            api_key=self.api_key, return_python_objects=True, base_url=self._base_url,
+            download_url=self._download_url, default_timeout=self._default_timeout,
+        ) as bot:
+            self._me = bot.get_me()
+        # end with
+    # end def
+
+    async def load_info(self):
+        """
+        Loads (again) the information about the bot itself, which is then cached as `bot.me`.
+
+        :return: the bot user
+        :rtype: pytgbot.api_types.receivable.peer.User
+        """
+        myself = await self.get_me()
+        if self.return_python_objects:
+            self._me = myself
+        else:
+            self._me = User.from_array(myself["result"])
+        # end if
+        return self._me
     # end def
 
     async def do(self, command, files=None, use_long_polling=False, request_timeout=None, **query):
         """
         Send a request to the api.
+        With a `retry` policy set (see :class:`pytgbot.retry.RetryPolicy`), failed requests may be sent again.
 
         If the bot is set to return the json objects, it will look like this:
 
@@ -117,26 +234,87 @@ class AsyncBot(BotBase):
         """
 
         request_timeout = self._default_timeout if request_timeout is None else request_timeout
+        attempt = 0
+        while True:
+            try:
+                result = await self._do_request(command, use_long_polling, request_timeout, query)
+                if self.retry is None or self.return_python_objects or result.get('ok') is not False:
+                    return result
+                # end if
+                error = result  # with `return_python_objects=False` failed requests are returned, not raised.
+            except (httpx.HTTPError, TgApiException) as e:
+                if self.retry is None:
+                    raise
+                # end if
+                error = e
+            # end try
+            delay = self.retry.get_delay(
+                command, query, error, attempt, scheduler=self.scheduler,
+                network_error=isinstance(error, httpx.TransportError),
+            )
+            if delay is None:
+                if isinstance(error, Exception):
+                    raise error
+                # end if
+                return error
+            # end if
+            attempt += 1
+            if delay:
+                await sleep(delay)
+            # end if
+        # end while
+    # end def do
+
+    async def _do_request(self, command, use_long_polling, request_timeout, query):
+        """
+        Sends a single request to the api, see :meth:`do`.
+        """
+        if self.scheduler is not None:
+            await self.scheduler.wait_async(command, query.get('chat_id'))
+        # end if
+        uploads = self.file_id_cache.prepare(query) if self.file_id_cache is not None else None
         url, params, files = self._prepare_request(command, query)
-        logger.debug('Sending async request to url {url!r} with params: {params!r}'.format(url=url, params=params))
-        async with httpx.AsyncClient(
-            verify=True,  # No self signed certificates. Telegram should be trustworthy anyway...
-        ) as client:
+        try:
+            body = MultipartEncoder(files) if files else None  # streams the files, instead of loading them into memory.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Sending async request to url {url!r} with params: {params!r}'.format(url=url, params=params))
+            # end if
+            client = self.client
+            content = body.aiter_chunks() if body is not None else None
+            headers = body.headers if body is not None else None
             if use_long_polling:
-                method = client.stream
+                # streaming: we only wait for the response to start, and read the body when it arrives.
+                async with client.stream(
+                    'POST',
+                    url=url, params=params, content=content, headers=headers,
+                    timeout=request_timeout
+                ) as r:
+                    await r.aread()
+                # end with
             else:
-                method = client.request
+                r = await client.request(
+                    'POST',
+                    url=url, params=params, content=content, headers=headers,
+                    timeout=request_timeout
+                )
             # end if
-            r = await method(
-                'POST',
-                url=url, params=params, files=files,
-                timeout=request_timeout
-            )
-        # end with
+        finally:
+            close_files(files)  # the files opened for this request, e.g. from disk.
+        # end try
 
-        json = r.json()
+        try:
+            json = self.json_codec.loads(r.content)
+        except ValueError as e:  # e.g. an html error page of a proxy
+            raise TgApiResponseException('Parsing answer as json failed.', r, e)
+        # end try
+        if self.trace is not None:
+            self.trace('response', {'command': command, 'json': json})
+        # end if
+        if uploads:
+            self.file_id_cache.store(uploads, query, json)
+        # end if
         return self._postprocess_request(r.request, response=r, json=json)
-    # end def do
+    # end def _do_request
 
     async def _do_fileupload(self, file_param_name, value, _command=None, **kwargs):
         """
@@ -164,7 +342,7 @@ class AsyncBot(BotBase):
         elif isinstance(value, unicode_type):
             kwargs[file_param_name] = n(value)
         elif isinstance(value, InputFile):
-            kwargs["files"] = value.get_request_files(file_param_name)
+            kwargs[file_param_name] = value  # uploaded by `do(…)`, streaming it's content.
         else:
             raise TgApiTypeError("Parameter {key} is not type (str, {text_type}, {input_file_type}), but type {type}".format(
                 key=file_param_name, type=type(value), input_file_type=InputFile, text_type=unicode_type))
@@ -239,7 +417,7 @@ class AsyncBot(BotBase):
         :type request_timeout: int
 
         :param delta: Wait minimal 'delta' seconds, between requests. Useful in a loop.
-        :type  delta: datetime.
+        :type  delta: datetime.timedelta
 
         :param error_as_empty: If errors which subclasses `requests.RequestException` will be logged but not raised.
                  Instead the returned DictObject will contain an "exception" field containing the exception occured,
@@ -257,29 +435,23 @@ class AsyncBot(BotBase):
         assert(limit is None or isinstance(limit, int))
         assert(poll_timeout is None or isinstance(poll_timeout, int))
         assert(allowed_updates is None or isinstance(allowed_updates, list))
-        if poll_timeout and not request_timeout is None:
+        if poll_timeout and request_timeout is None:
             request_timeout = poll_timeout + 2
         # end if
 
-        if delta.total_seconds() > poll_timeout:
-            now = datetime.now()
-            if self._last_update - now < delta:
-                wait = ((now - self._last_update) - delta).total_seconds()  # can be 0.2
-                wait = 0 if wait < 0 else wait
-                if wait != 0:
-                    logger.debug("Sleeping {i} seconds.".format(i=wait))
-                # end if
-                await sleep(wait)
-            # end if
+        wait = self._get_updates__delay(delta, poll_timeout)
+        if wait:
+            logger.debug("Sleeping {i} seconds.".format(i=wait))
+            await sleep(wait)
         # end if
-        self._last_update = datetime.now()
+        self._last_update = monotonic()
         use_long_polling = poll_timeout != 0
         try:
             result = await self.do(
                 "getUpdates", offset=offset, limit=limit, timeout=poll_timeout, allowed_updates=allowed_updates,
                 use_long_polling=use_long_polling, request_timeout=request_timeout
             )
-            return self._get_updates__process_result(result)
+            return self._get_updates__parse(result)
         except (httpx.HTTPError, TgApiException) as e:
             if error_as_empty:
                 if not isinstance(e, httpx.TimeoutException) or not use_long_polling:
@@ -288,7 +460,7 @@ class AsyncBot(BotBase):
                         exc_info=True
                     )
                 # end if
-                self._last_update = datetime.now()
+                self._last_update = monotonic()
                 return DictObject(result=[], exception=e)
             else:
                 raise
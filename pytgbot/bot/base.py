@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
-import json
 import re
 
 from abc import abstractmethod
 from warnings import warn
-from datetime import timedelta, datetime
+from datetime import timedelta
+from time import monotonic
 from urllib.parse import urlparse, urlunparse
 
 from luckydonaldUtils.logger import logging
@@ -15,9 +15,12 @@ from ..exceptions import TgApiServerException, TgApiParseException
 from ..exceptions import TgApiTypeError, TgApiResponseException
 from ..api_types.sendable.inline import InlineQueryResult
 from ..api_types.receivable.peer import User
-from ..api_types import from_array_list, as_array
+from ..api_types.receivable.updates import ResponseParameters
+from ..api_types import from_array_list, as_array, lazy_parsing, validation_mode, VALIDATION_MODES
 from ..api_types.sendable.files import InputFile
 from ..api_types.sendable import Sendable
+from ..multipart import close_files
+from ..json_codec import get_default_codec
 
 
 __author__ = 'luckydonald'
@@ -29,10 +32,14 @@ logger = logging.getLogger(__name__)
 DEFAULT_BASE_URL = "https://api.telegram.org/bot{api_key}/{command}"
 DEFAULT_DOWNLOAD_URL = "https://api.telegram.org/file/bot{api_key}/{file}"
 DEFAULT_TIMEOUT = 60.0  # a int or float for seconds or None to not specify any.
+DEFAULT_POOL_CONNECTIONS = 10  # how many hosts to keep connection pools for.
+DEFAULT_POOL_MAXSIZE = 10  # how many connections to keep per host.
+DEFAULT_MAX_CONNECTIONS = 100  # how many concurrent connections the async client may open.
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20  # how many idle connections the async client keeps open.
 
 
 class BotBase(object):
-    def __init__(self, api_key, return_python_objects=True, base_url=None, download_url=None, default_timeout=None):
+    def __init__(self, api_key, return_python_objects=True, base_url=None, download_url=None, default_timeout=None, scheduler=None, retry=None, file_id_cache=None, lazy_updates=False, validation_mode=None, json_codec=None, prefer_original=True, trace=None):
         """
         A Bot instance. From here you can call all the functions.
         The api key can be obtained from @BotFather, see https://core.telegram.org/bots#6-botfather
@@ -60,17 +67,67 @@ class BotBase(object):
 
         :param default_timeout: The default timeout to use for requests to the telegram api.
     :type  return_python_objects: None|float|int
+
+        :param scheduler: Makes requests sending messages wait, so the rate limits of telegram are not exceeded.
+                          Use a :class:`pytgbot.rate_limit.RateScheduler`, or `None` (default) to send right away.
+        :type  scheduler: None|pytgbot.rate_limit.RateScheduler
+
+        :param retry: Retries failed requests, waiting out flood control and following migrated groups.
+                      Use a :class:`pytgbot.retry.RetryPolicy`, or `None` (default) to raise every error right away.
+        :type  retry: None|pytgbot.retry.RetryPolicy
+
+        :param file_id_cache: Remembers the `file_id`s of uploaded files, to send those instead of uploading them again.
+                              Use a :class:`pytgbot.file_cache.FileIdCache`, or `None` (default) to always upload.
+        :type  file_id_cache: None|pytgbot.file_cache.FileIdCache
+
+        :param lazy_updates: If the updates from `get_updates(…)` should only be parsed as far as they are used,
+                             see :meth:`pytgbot.api_types.TgBotApiObject.from_array_lazy`.
+                             Speeds up handlers which look only at a few fields, like `update.message.text`.
+        :type  lazy_updates: bool
+
+        :param validation_mode: How much to check the types of the objects parsed from the results of this bot,
+                                see :func:`pytgbot.api_types.set_validation_mode`.
+                                With `"trusted"` the results are trusted to be valid, skipping all those checks.
+                                `None` (default) uses the global mode.
+                                With `lazy_updates` the fields are parsed later, with the mode active at that time.
+        :type  validation_mode: None | str
+
+        :param json_codec: Encodes the parameters and decodes the responses.
+                           `None` (default) uses the fastest library installed, see :func:`pytgbot.json_codec.get_default_codec`.
+        :type  json_codec: None | pytgbot.json_codec.JsonCodec
+
+        :param prefer_original: If received objects passed back to the api unchanged (like forwarding a `Message.entities`)
+                                should be sent as the data they were parsed from, instead of serializing them again.
+                                See :func:`pytgbot.api_types.as_array`.
+        :type  prefer_original: bool
+
+        :param trace: Called as `trace(event, data)` with every request and response, to inspect or record the payloads,
+                      without having to debug log (and thus format) them all.
+                      The `"request"` events have the `command` and the encoded `params` as data,
+                      the `"response"` events the `command` and the decoded `json`.
+        :type  trace: None | callable
         """
         if api_key is None or not api_key:
             raise ValueError("No api_key given.")
         # end if
+        if validation_mode is not None and validation_mode not in VALIDATION_MODES:
+            raise ValueError("Unknown validation_mode {mode!r}, must be one of {modes!r}.".format(mode=validation_mode, modes=VALIDATION_MODES))
+        # end if
         self.api_key = api_key
         self.return_python_objects = return_python_objects
-        self._last_update = datetime.now()
+        self.scheduler = scheduler
+        self.retry = retry
+        self.file_id_cache = file_id_cache
+        self.lazy_updates = lazy_updates
+        self.validation_mode = validation_mode
+        self.json_codec = json_codec if json_codec is not None else get_default_codec()
+        self.prefer_original = prefer_original
+        self.trace = trace
+        self._last_update = None  # `time.monotonic()` of the last `get_updates` call.
         self._base_url = DEFAULT_BASE_URL if base_url is None else base_url
         self._download_url = self.calculate_download_url(self._base_url, download_url)
         self._default_timeout = DEFAULT_TIMEOUT if default_timeout is None else default_timeout
-        self._me = None        # will be filled when using the property .id or .username, or when calling ._load_info()
+        self._me = None        # will be filled when using the property .id or .username, or when calling .load_info()
     # end def __init__
 
     @classmethod
@@ -143,25 +200,52 @@ class BotBase(object):
         """
         params = {}
         files = {}
-        for key in query.keys():
-            element = query[key]
-            if element is not None:
-                if isinstance(element, (str, int, float, bool)):
-                    params[key] = element
-                elif isinstance(element, InputFile):
-                    params[key], file_info = element.get_input_media_referenced_files(key)
-                    if file_info is not None:
-                        files.update(file_info)
+        try:
+            for key in query.keys():
+                element = query[key]
+                if element is not None:
+                    if isinstance(element, (str, int, float, bool)):
+                        params[key] = element
+                    elif isinstance(element, InputFile):
+                        params[key], file_info = element.get_input_media_referenced_files(key)
+                        if file_info is not None:
+                            files.update(file_info)
+                        # end if
+                    else:
+                        params[key] = self._encode_json(element)
                     # end if
-                else:
-                    params[key] = json.dumps(as_array(element))
                 # end if
-            # end if
-        # end for
+            # end for
+        except Exception:
+            close_files(files)  # the ones already opened wouldn't be closed by the failed request.
+            raise
+        # end try
+        if self.trace is not None:
+            self.trace('request', {'command': command, 'params': params})
+        # end if
         url = self._base_url.format(api_key=n(self.api_key), command=n(command))
         return url, params, files
     # end def _prepare_request
 
+    def _encode_json(self, element):
+        """
+        Encodes a parameter with the `json_codec` of this bot.
+        Sendable objects (and lists of them, like inline query results) use their cached json, see :meth:`pytgbot.api_types.sendable.Sendable.to_json`.
+
+        :param element: The parameter.
+        :type  element: Sendable | list | dict
+
+        :rtype: str
+        """
+        if isinstance(element, Sendable):
+            return element.to_json(self.json_codec, prefer_original=self.prefer_original)
+        # end if
+        if isinstance(element, (list, tuple)) and element and all(isinstance(item, Sendable) for item in element):
+            return '[' + ','.join(item.to_json(self.json_codec, prefer_original=self.prefer_original) for item in element) + ']'
+        # end if
+        return self.json_codec.dumps(as_array(element, prefer_original=self.prefer_original))
+    # end def _encode_json
+
     def _postprocess_request(self, request, response, json):
         """
         This converts the response to either the response or a parsed :class:`pytgbot.api_types.receivable.Receivable`.
@@ -175,33 +259,36 @@ class BotBase(object):
         :param json: the parsed json array
         :type  json: dict
 
-        :return: The json response from the server, or, if `self.return_python_objects` is `True`, a parsed return type.
-        :rtype:  DictObject.DictObject | pytgbot.api_types.receivable.Receivable
+        :return: The json response from the server, or, if `self.return_python_objects` is `True`, the plain `result` of it,
+                 still to be parsed into the return type by the `_…__process_result` functions.
+        :rtype:  DictObject.DictObject | dict | list | str | int | float | bool
         """
-        from DictObject import DictObject
-
-        try:
-            logger.debug(json)
-            res = DictObject.objectify(json)
-        except Exception as e:
-            raise TgApiResponseException('Parsing answer as json failed.', response, e)
-        # end if
-        # TG should always return an dict, with at least a status or something.
-        if self.return_python_objects:
-            if res.ok is not True:
-                raise TgApiServerException(
-                    error_code=res.error_code if "error_code" in res or hasattr(res, "error_code") else None,
-                    response=response,
-                    description=res.description if "description" in res or hasattr(res, "description") else None,
-                    request=request
-                )
-            # end if not ok
-            if "result" not in res:
-                raise TgApiParseException('Key "result" is missing.')
-            # end if no result
-            return res.result
-        # end if return_python_objects
-        return res
+        logger.debug(json)
+        if not self.return_python_objects:
+            from DictObject import DictObject
+            try:
+                return DictObject.objectify(json)
+            except Exception as e:
+                raise TgApiResponseException('Parsing answer as json failed.', response, e)
+            # end try
+        # end if
+        # the plain json, as the result will be converted into the api types anyway, no need to wrap it all first.
+        if not isinstance(json, dict):  # TG should always return an dict, with at least a status or something.
+            raise TgApiResponseException('Parsing answer as json failed.', response, TypeError('Not a json object: {!r}'.format(json)))
+        # end if
+        if json.get('ok') is not True:
+            raise TgApiServerException(
+                error_code=json.get('error_code'),
+                response=response,
+                description=json.get('description'),
+                request=request,
+                parameters=ResponseParameters.from_array(json.get("parameters")),
+            )
+        # end if not ok
+        if "result" not in json:
+            raise TgApiParseException('Key "result" is missing.')
+        # end if no result
+        return json["result"]
     # end def _postprocess_request
 
     def _do_fileupload(self, file_param_name, value, _command=None, _file_is_optional=False, **kwargs):
@@ -241,18 +328,7 @@ class BotBase(object):
         elif isinstance(value, unicode_type):
             kwargs[file_param_name] = n(value)
         elif isinstance(value, InputFile):
-            files = value.get_request_files(file_param_name)
-            if "files" in kwargs and kwargs["files"]:
-                # already are some files there, merge them.
-                assert isinstance(kwargs["files"], dict), 'The files should be of type dict, but are of type {}.'.format(type(kwargs["files"]))
-                for key in files.keys():
-                    assert key not in kwargs["files"], '{key} would be overwritten!'
-                    kwargs["files"][key] = files[key]
-                # end for
-            else:
-                # no files so far
-                kwargs["files"] = files
-            # end if
+            kwargs[file_param_name] = value  # uploaded by `do(…)`, streaming it's content.
         else:
             raise TgApiTypeError("Parameter {key} is not type (str, {text_type}, {input_file_type}), but type {type}".format(
                 key=file_param_name, type=type(value), input_file_type=InputFile, text_type=unicode_type))
@@ -326,6 +402,41 @@ class BotBase(object):
         return "{s.__class__.__name__}(username={s.username!r}, id={s.id!r})".format(s=self)
     # end def
 
+    def _get_updates__delay(self, delta, poll_timeout):
+        """
+        How long `get_updates` has to wait, so at least `delta` passed since the previous call.
+        Long polling is not throttled, if it waits longer than `delta` anyway.
+
+        :param delta: The minimal time between two calls.
+        :type  delta: datetime.timedelta
+
+        :param poll_timeout: Timeout in seconds for long polling.
+        :type  poll_timeout: None|int
+
+        :return: The seconds to wait.
+        :rtype: float
+        """
+        delta = delta.total_seconds()
+        if self._last_update is None or delta <= (poll_timeout or 0):
+            return 0.0
+        # end if
+        return max(0.0, delta - (monotonic() - self._last_update))
+    # end def
+
+    def _get_updates__parse(self, result):
+        """
+        Parses the result of `getUpdates`, only as far as it's used later if `lazy_updates` is set.
+
+        :rtype:  list of pytgbot.api_types.receivable.updates.Update
+        """
+        if self.lazy_updates:
+            with lazy_parsing():
+                return self._get_updates__process_result(result)
+            # end with
+        # end if
+        return self._get_updates__process_result(result)
+    # end def
+
     @abstractmethod
     def get_updates(self, offset=None, limit=100, poll_timeout=0, allowed_updates=None, request_timeout=None, delta=timedelta(milliseconds=100), error_as_empty=False):
         raise NotImplementedError('subclass needs to overwrite this.')
@@ -379,10 +490,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Update
         try:
-            return Update.from_array_list(result, list_level=1)
+            with validation_mode(self.validation_mode):
+                return Update.from_array_list(result, list_level=1)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Update", exc_info=True)
         # end try
@@ -445,7 +560,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -486,7 +603,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -521,10 +640,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import WebhookInfo
         try:
-            return WebhookInfo.from_array(result)
+            with validation_mode(self.validation_mode):
+                return WebhookInfo.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type WebhookInfo", exc_info=True)
         # end try
@@ -557,10 +680,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.peer import User
         try:
-            return User.from_array(result)
+            with validation_mode(self.validation_mode):
+                return User.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type User", exc_info=True)
         # end try
@@ -593,7 +720,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -678,10 +807,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -739,10 +872,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -829,10 +966,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.responses import MessageId
         try:
-            return MessageId.from_array(result)
+            with validation_mode(self.validation_mode):
+                return MessageId.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type MessageId", exc_info=True)
         # end try
@@ -916,10 +1057,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -1019,10 +1164,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -1114,10 +1263,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -1221,10 +1374,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -1324,10 +1481,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -1415,10 +1576,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -1501,10 +1666,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -1570,10 +1739,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array_list(result, list_level=1)
+            with validation_mode(self.validation_mode):
+                return Message.from_array_list(result, list_level=1)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -1663,10 +1836,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -1741,10 +1918,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -1802,10 +1983,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -1909,10 +2094,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -1994,10 +2183,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -2112,10 +2305,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -2185,10 +2382,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -2232,7 +2433,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -2284,10 +2487,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.media import UserProfilePhotos
         try:
-            return UserProfilePhotos.from_array(result)
+            with validation_mode(self.validation_mode):
+                return UserProfilePhotos.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type UserProfilePhotos", exc_info=True)
         # end try
@@ -2327,10 +2534,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.media import File
         try:
-            return File.from_array(result)
+            with validation_mode(self.validation_mode):
+                return File.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type File", exc_info=True)
         # end try
@@ -2384,7 +2595,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -2436,7 +2649,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -2493,7 +2708,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -2585,7 +2802,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -2635,7 +2854,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -2681,7 +2902,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -2727,7 +2950,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -2774,7 +2999,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -2816,7 +3043,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(str, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -2876,10 +3105,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.peer import ChatInviteLink
         try:
-            return ChatInviteLink.from_array(result)
+            with validation_mode(self.validation_mode):
+                return ChatInviteLink.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type ChatInviteLink", exc_info=True)
         # end try
@@ -2941,10 +3174,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.peer import ChatInviteLink
         try:
-            return ChatInviteLink.from_array(result)
+            with validation_mode(self.validation_mode):
+                return ChatInviteLink.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type ChatInviteLink", exc_info=True)
         # end try
@@ -2988,10 +3225,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.peer import ChatInviteLink
         try:
-            return ChatInviteLink.from_array(result)
+            with validation_mode(self.validation_mode):
+                return ChatInviteLink.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type ChatInviteLink", exc_info=True)
         # end try
@@ -3035,7 +3276,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -3081,7 +3324,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -3128,7 +3373,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -3170,7 +3417,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -3216,7 +3465,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -3264,7 +3515,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -3316,7 +3569,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -3364,7 +3619,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -3406,7 +3663,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -3448,7 +3707,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -3490,10 +3751,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.peer import Chat
         try:
-            return Chat.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Chat.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Chat", exc_info=True)
         # end try
@@ -3533,10 +3798,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.peer import ChatMember
         try:
-            return ChatMember.from_array_list(result, list_level=1)
+            with validation_mode(self.validation_mode):
+                return ChatMember.from_array_list(result, list_level=1)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type ChatMember", exc_info=True)
         # end try
@@ -3576,7 +3845,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(int, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -3622,10 +3893,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.peer import ChatMember
         try:
-            return ChatMember.from_array(result)
+            with validation_mode(self.validation_mode):
+                return ChatMember.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type ChatMember", exc_info=True)
         # end try
@@ -3669,7 +3944,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -3711,7 +3988,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -3771,7 +4050,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -3825,7 +4106,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -3871,7 +4154,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -3917,10 +4202,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.sendable.command import BotCommand
         try:
-            return BotCommand.from_array_list(result, list_level=1)
+            with validation_mode(self.validation_mode):
+                return BotCommand.from_array_list(result, list_level=1)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type BotCommand", exc_info=True)
         # end try
@@ -3992,10 +4281,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -4066,10 +4359,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -4135,10 +4432,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -4196,10 +4497,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -4256,10 +4561,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.media import Poll
         try:
-            return Poll.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Poll.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Poll", exc_info=True)
         # end try
@@ -4303,7 +4612,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -4376,10 +4687,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -4419,10 +4734,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.stickers import StickerSet
         try:
-            return StickerSet.from_array(result)
+            with validation_mode(self.validation_mode):
+                return StickerSet.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type StickerSet", exc_info=True)
         # end try
@@ -4467,10 +4786,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.media import File
         try:
-            return File.from_array(result)
+            with validation_mode(self.validation_mode):
+                return File.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type File", exc_info=True)
         # end try
@@ -4546,7 +4869,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -4616,7 +4941,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -4662,7 +4989,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -4704,7 +5033,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -4757,7 +5088,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -4826,7 +5159,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -4976,10 +5311,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -5034,7 +5373,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -5086,7 +5427,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -5133,7 +5476,9 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         try:
             return from_array_list(bool, result, list_level=0, is_builtin=True)
         except TgApiParseException:
@@ -5202,10 +5547,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -5271,10 +5620,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.updates import Message
         try:
-            return Message.from_array(result)
+            with validation_mode(self.validation_mode):
+                return Message.from_array(result)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type Message", exc_info=True)
         # end try
@@ -5334,10 +5687,14 @@ class BotBase(object):
             return result
         # end if
 
-        logger.debug("Trying to parse {data}".format(data=repr(result)))
+        if logger.isEnabledFor(logging.DEBUG):  # not building the string for nothing, as that's the whole result.
+            logger.debug("Trying to parse {data}".format(data=repr(result)))
+        # end if
         from pytgbot.api_types.receivable.game import GameHighScore
         try:
-            return GameHighScore.from_array_list(result, list_level=1)
+            with validation_mode(self.validation_mode):
+                return GameHighScore.from_array_list(result, list_level=1)
+            # end with
         except TgApiParseException:
             logger.debug("Failed parsing as api_type GameHighScore", exc_info=True)
         # end try
@@ -2,7 +2,8 @@
 import json
 import re
 
-from datetime import timedelta, datetime
+from datetime import timedelta
+from time import monotonic
 from DictObject import DictObject
 from luckydonaldUtils.logger import logging
 from luckydonaldUtils.encoding import unicode_type, to_unicode as u, to_native as n
@@ -15,8 +16,9 @@ from ..exceptions import TgApiException
 
 from ..api_types.sendable.inline import InlineQueryResult
 from ..api_types import from_array_list
+from ..multipart import MultipartEncoder, close_files
 
-from .base import BotBase
+from .base import BotBase, DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE
 
 
 from ..api_types.sendable.files import InputFile
@@ -24,6 +26,7 @@ from ..api_types.sendable.files import InputFile
 # sync imports
 from time import sleep
 import requests.exceptions
+import requests.adapters
 import requests
 
 
@@ -35,13 +38,83 @@ logger = logging.getLogger(__name__)
 
 
 class SyncBot(BotBase):
+    def __init__(
+        self, api_key, return_python_objects=True, base_url=None, download_url=None, default_timeout=None,
+        scheduler=None, retry=None, file_id_cache=None, lazy_updates=False, validation_mode=None, json_codec=None,
+        prefer_original=True, trace=None,
+        pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+    ):
+        """
+        A synchronous Bot instance. From here you can call all the functions.
+        All the requests share a single keep-alive connection pool (a :class:`requests.Session`),
+        so only the first request to the api has to pay for the TCP and TLS handshake.
+        Use `bot.close()` or a `with SyncBot(…) as bot:` block to release those connections again.
+
+        See :class:`pytgbot.bot.base.BotBase` for the other parameters.
+
+        :param pool_connections: The number of different hosts to cache connection pools for.
+        :type  pool_connections: int
+
+        :param pool_maxsize: The maximum number of connections to keep open per host.
+                             Should be at least the number of threads using this bot at the same time.
+        :type  pool_maxsize: int
+        """
+        super(SyncBot, self).__init__(
+            api_key, return_python_objects=return_python_objects, base_url=base_url, download_url=download_url,
+            default_timeout=default_timeout, scheduler=scheduler, retry=retry,
+            file_id_cache=file_id_cache, lazy_updates=lazy_updates, validation_mode=validation_mode, json_codec=json_codec,
+            prefer_original=prefer_original, trace=trace,
+        )
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._session = None  # will be created with the first request, see `.session`.
+    # end def __init__
+
+    @property
+    def session(self):
+        """
+        The :class:`requests.Session` used for all the requests of this bot.
+        It is created on first use, and again after `bot.close()` was called.
+
+        :rtype: requests.Session
+        """
+        if self._session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=self._pool_connections, pool_maxsize=self._pool_maxsize,
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._session = session
+        # end if
+        return self._session
+    # end def
+
+    def close(self):
+        """
+        Closes all the pooled connections of this bot.
+        The bot can still be used afterwards, it will simply open new connections as needed.
+        """
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        # end if
+    # end def close
+
+    def __enter__(self):
+        return self
+    # end def
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    # end def
+
     def _load_info(self):
         """
         This functions stores the id and the username of the bot.
         Called by `.username` and `.id` properties.
 
         This function is synchronous.
-        In fact, `AsyncBot` uses `SyncBot` to load those.
         :return:
         """
 
@@ -54,9 +127,21 @@ class SyncBot(BotBase):
         # end if
     # end def
 
+    def load_info(self):
+        """
+        Loads (again) the information about the bot itself, which is then cached as `bot.me`.
+
+        :return: the bot user
+        :rtype: pytgbot.api_types.receivable.peer.User
+        """
+        self._load_info()
+        return self._me
+    # end def
+
     def do(self, command, files=None, use_long_polling=False, request_timeout=None, **query):
         """
         Send a request to the api.
+        With a `retry` policy set (see :class:`pytgbot.retry.RetryPolicy`), failed requests may be sent again.
 
         If the bot is set to return the json objects, it will look like this:
 
@@ -89,19 +174,74 @@ class SyncBot(BotBase):
         """
 
         request_timeout = self._default_timeout if request_timeout is None else request_timeout
+        attempt = 0
+        while True:
+            try:
+                result = self._do_request(command, use_long_polling, request_timeout, query)
+                if self.retry is None or self.return_python_objects or result.get('ok') is not False:
+                    return result
+                # end if
+                error = result  # with `return_python_objects=False` failed requests are returned, not raised.
+            except (requests.exceptions.RequestException, TgApiException) as e:
+                if self.retry is None:
+                    raise
+                # end if
+                error = e
+            # end try
+            delay = self.retry.get_delay(
+                command, query, error, attempt, scheduler=self.scheduler,
+                network_error=isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)),
+            )
+            if delay is None:
+                if isinstance(error, Exception):
+                    raise error
+                # end if
+                return error
+            # end if
+            attempt += 1
+            if delay:
+                sleep(delay)
+            # end if
+        # end while
+    # end def do
+
+    def _do_request(self, command, use_long_polling, request_timeout, query):
+        """
+        Sends a single request to the api, see :meth:`do`.
+        """
+        if self.scheduler is not None:
+            self.scheduler.wait(command, query.get('chat_id'))
+        # end if
+        uploads = self.file_id_cache.prepare(query) if self.file_id_cache is not None else None
         url, params, files = self._prepare_request(command, query)
-        r = requests.post(
-            url,
-            params=params,
-            files=files,
-            stream=use_long_polling,
-            verify=True,  # No self signed certificates. Telegram should be trustworthy anyway...
-            timeout=request_timeout
-        )
+        try:
+            body = MultipartEncoder(files) if files else None  # streams the files, instead of loading them into memory.
+            r = self.session.post(
+                url,
+                params=params,
+                data=body,
+                headers=body.headers if body is not None else None,
+                stream=use_long_polling,
+                verify=True,  # No self signed certificates. Telegram should be trustworthy anyway...
+                timeout=request_timeout
+            )
+        finally:
+            close_files(files)  # the files opened for this request, e.g. from disk.
+        # end try
 
-        json = r.json()
+        try:
+            json = self.json_codec.loads(r.content)
+        except ValueError as e:  # e.g. an html error page of a proxy
+            raise TgApiResponseException('Parsing answer as json failed.', r, e)
+        # end try
+        if self.trace is not None:
+            self.trace('response', {'command': command, 'json': json})
+        # end if
+        if uploads:
+            self.file_id_cache.store(uploads, query, json)
+        # end if
         return self._postprocess_request(r.request, response=r, json=json)
-    # end def do
+    # end def _do_request
 
     def _do_fileupload(self, file_param_name, value, _command=None, **kwargs):
         """
@@ -129,7 +269,7 @@ class SyncBot(BotBase):
         elif isinstance(value, unicode_type):
             kwargs[file_param_name] = n(value)
         elif isinstance(value, InputFile):
-            kwargs["files"] = value.get_request_files(file_param_name)
+            kwargs[file_param_name] = value  # uploaded by `do(…)`, streaming it's content.
         else:
             raise TgApiTypeError("Parameter {key} is not type (str, {text_type}, {input_file_type}), but type {type}".format(
                 key=file_param_name, type=type(value), input_file_type=InputFile, text_type=unicode_type))
@@ -207,7 +347,7 @@ class SyncBot(BotBase):
         :type request_timeout: int
 
         :param delta: Wait minimal 'delta' seconds, between requests. Useful in a loop.
-        :type  delta: datetime.
+        :type  delta: datetime.timedelta
 
         :param error_as_empty: If errors which subclasses `requests.RequestException` will be logged but not raised.
                  Instead the returned DictObject will contain an "exception" field containing the exception occured,
@@ -225,29 +365,23 @@ class SyncBot(BotBase):
         assert(limit is None or isinstance(limit, int))
         assert(poll_timeout is None or isinstance(poll_timeout, int))
         assert(allowed_updates is None or isinstance(allowed_updates, list))
-        if poll_timeout and not request_timeout is None:
+        if poll_timeout and request_timeout is None:
             request_timeout = poll_timeout + 2
         # end if
 
-        if delta.total_seconds() > poll_timeout:
-            now = datetime.now()
-            if self._last_update - now < delta:
-                wait = ((now - self._last_update) - delta).total_seconds()  # can be 0.2
-                wait = 0 if wait < 0 else wait
-                if wait != 0:
-                    logger.debug("Sleeping {i} seconds.".format(i=wait))
-                # end if
-                sleep(wait)
-            # end if
+        wait = self._get_updates__delay(delta, poll_timeout)
+        if wait:
+            logger.debug("Sleeping {i} seconds.".format(i=wait))
+            sleep(wait)
         # end if
-        self._last_update = datetime.now()
+        self._last_update = monotonic()
         use_long_polling = poll_timeout != 0
         try:
             result = self.do(
                 "getUpdates", offset=offset, limit=limit, timeout=poll_timeout, allowed_updates=allowed_updates,
                 use_long_polling=use_long_polling, request_timeout=request_timeout
             )
-            return self._get_updates__process_result(result)
+            return self._get_updates__parse(result)
         except (requests.exceptions.RequestException, TgApiException) as e:
             if error_as_empty:
                 if not isinstance(e, requests.exceptions.Timeout) or not use_long_polling:
@@ -256,7 +390,7 @@ class SyncBot(BotBase):
                         exc_info=True
                     )
                 # end if
-                self._last_update = datetime.now()
+                self._last_update = monotonic()
                 return DictObject(result=[], exception=e)
             else:
                 raise
@@ -0,0 +1,407 @@
+# -*- coding: utf-8 -*-
+import os
+from copy import copy
+from inspect import isawaitable
+from time import monotonic
+
+from luckydonaldUtils.logger import logging
+
+from .exceptions import TgApiServerException, TgApiException
+from .rate_limit import RateScheduler
+from .retry import RetryPolicy
+
+__author__ = 'luckydonald'
+__all__ = ["broadcast", "Broadcaster", "BroadcastResult", "MessageSpec", "FileCheckpoint"]
+logger = logging.getLogger(__name__)
+
+
+SENT = 'sent'
+BLOCKED = 'blocked'  # the user blocked the bot, or the bot was kicked from the group.
+DEACTIVATED = 'deactivated'  # the user deleted their account.
+NOT_FOUND = 'not_found'  # the chat doesn't exist, or the bot never talked to that user.
+FAILED = 'failed'  # anything else.
+
+SCHEDULER_COMMAND = 'sendMessage'  # every message counts the same towards the limits.
+
+
+class MessageSpec(object):
+    """
+    What to broadcast: The bot method to call, and all its arguments but the `chat_id`.
+
+        MessageSpec('send_message', text='Hello!', parse_mode='HTML')
+        MessageSpec('send_photo', photo='<file_id>', caption='Look at that')
+
+    Instead of a :class:`MessageSpec` you can use teleflask style messages (`TextMessage(…)`, `PhotoMessage(…)`, …),
+    or any function `(bot, chat_id)` doing the sending.
+    """
+
+    def __init__(self, method, **kwargs):
+        """
+        :param method: Name of the bot method to call, like `"send_message"`.
+        :type  method: str
+
+        :param kwargs: The arguments for that method, except `chat_id`.
+        """
+        if 'chat_id' in kwargs:
+            raise ValueError("The chat_id is set by the broadcast.")
+        # end if
+        self.method = method
+        self.kwargs = kwargs
+    # end def
+
+    def send(self, bot, chat_id):
+        """
+        :return: Whatever the bot method returns, with the :class:`AsyncBot` a coroutine.
+        """
+        return getattr(bot, self.method)(chat_id=chat_id, **self.kwargs)
+    # end def
+
+    def __repr__(self):
+        return "{cls}({method!r}, {kwargs})".format(
+            cls=self.__class__.__name__, method=self.method,
+            kwargs=", ".join("{k}={v!r}".format(k=k, v=v) for k, v in self.kwargs.items()),
+        )
+    # end def
+# end class
+
+
+def _send(message, bot, chat_id):
+    """
+    Sends a message spec (see :class:`MessageSpec`) to a single chat.
+    """
+    if isinstance(message, MessageSpec):
+        return message.send(bot, chat_id)
+    # end if
+    if hasattr(message, 'actual_send') and hasattr(message, 'receiver'):
+        # teleflask's messages: they store the receiver in the object, so every chat gets its own copy.
+        message = copy(message)
+        message.receiver = chat_id
+        message.reply_id = None
+        return message.actual_send(bot)
+    # end if
+    if callable(message):
+        return message(bot, chat_id)
+    # end if
+    raise TypeError("Can't send a {type}, use a MessageSpec.".format(type=type(message)))
+# end def
+
+
+class BroadcastResult(object):
+    """
+    The outcome of sending to one chat.
+
+    - `status`: One of `"sent"`, `"blocked"`, `"deactivated"`, `"not_found"` or `"failed"`.
+    - `result`: What the bot returned, e.g. the sent :class:`pytgbot.api_types.receivable.updates.Message`.
+    - `error`: The exception if it wasn't sent.
+    - `migrated_to`: The new id of the chat, if the group became a supergroup.
+    """
+    __slots__ = ('chat_id', 'status', 'result', 'error', 'migrated_to')
+
+    def __init__(self, chat_id, status, result=None, error=None, migrated_to=None):
+        self.chat_id = chat_id
+        self.status = status
+        self.result = result
+        self.error = error
+        self.migrated_to = migrated_to
+    # end def
+
+    @property
+    def ok(self):
+        return self.status == SENT
+    # end def
+
+    def __repr__(self):
+        return "{cls}(chat_id={s.chat_id!r}, status={s.status!r}, error={s.error!r})".format(
+            cls=self.__class__.__name__, s=self,
+        )
+    # end def
+# end class
+
+
+def get_failure_status(error):
+    """
+    Tells apart the errors of chats we can't ever send to, like blocked users,
+    so you can clean them from your database.
+
+    :param error: The error of the send request.
+    :type  error: Exception
+
+    :rtype: str
+    """
+    if not isinstance(error, TgApiServerException):
+        return FAILED
+    # end if
+    description = (error.description or '').lower()
+    if error.error_code == 403:
+        return DEACTIVATED if 'deactivated' in description else BLOCKED
+    # end if
+    if error.error_code == 400 and 'chat not found' in description:
+        return NOT_FOUND
+    # end if
+    return FAILED
+# end def
+
+
+class FileCheckpoint(object):
+    """
+    Remembers which chats are done in a text file, one chat id and status per line,
+    so an interrupted broadcast can be continued with the same file and only the missing chats are sent.
+    Every line is written right away, so even a killed process loses at most the requests still running.
+    """
+
+    def __init__(self, path):
+        """
+        :param path: The file to store the progress in. Created if missing.
+        :type  path: str
+        """
+        self.path = path
+        self.done = set()
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        self.done.add(line.split('\t', 1)[0])
+                    # end if
+                # end for
+            # end with
+        # end if
+        self._file = None
+    # end def
+
+    def is_done(self, chat_id):
+        return str(chat_id) in self.done
+    # end def
+
+    def mark(self, result):
+        """
+        :type result: BroadcastResult
+        """
+        if self._file is None:
+            self._file = open(self.path, 'a', buffering=1)  # line buffered
+        # end if
+        self.done.add(str(result.chat_id))
+        self._file.write("{chat_id}\t{status}\n".format(chat_id=result.chat_id, status=result.status))
+    # end def
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        # end if
+    # end def
+# end class
+
+
+class Broadcaster(object):
+    """
+    Sends one message to a lot of chats, as fast as the rate limits of telegram allow.
+    Needs an :class:`pytgbot.bot.asynchronous.AsyncBot`.
+
+        broadcaster = Broadcaster(bot, chat_ids, MessageSpec('send_message', text='Big news!'), checkpoint='news.progress')
+        async for result in broadcaster:
+            if result.status in ('blocked', 'deactivated'):
+                forget_user(result.chat_id)
+            # end if
+        # end for
+        print(broadcaster.counts)
+
+    Messages are paced by the bot's :class:`pytgbot.rate_limit.RateScheduler`, or a new one if it doesn't have one.
+    Failed sends are retried with the bot's :class:`pytgbot.retry.RetryPolicy`, or by the broadcast if it doesn't have one.
+    Flood control (429) pauses only the affected chat, and migrated groups are followed.
+    An error outside of sending, like failing to write the `checkpoint`, stops the broadcast and is raised by the iterator.
+    The results are yielded as they come in, so not in the order of `chat_ids`.
+    To stop early, `await results.aclose()` the async iterator, instead of only leaving the `async for` loop.
+    """
+
+    def __init__(self, bot, chat_ids, message, concurrency=30, checkpoint=None, scheduler=None, retry=None):
+        """
+        :param bot: The bot to send with.
+        :type  bot: pytgbot.bot.asynchronous.AsyncBot
+
+        :param chat_ids: The chats to send to. Can be a generator, it is only read as needed.
+        :type  chat_ids: collections.abc.Iterable of (int | str)
+
+        :param message: What to send, see :class:`MessageSpec`.
+        :type  message: MessageSpec | callable
+
+        :param concurrency: How many requests to have running at the same time.
+        :type  concurrency: int
+
+        :param checkpoint: Keeps track of the chats already done, to continue an interrupted broadcast.
+                           A file path to use a :class:`FileCheckpoint`, or `None` to not keep track.
+        :type  checkpoint: None | str | FileCheckpoint
+
+        :param scheduler: Rate limits to use, if the bot has none itself. Defaults to telegram's limits.
+        :type  scheduler: None | pytgbot.rate_limit.RateScheduler
+
+        :param retry: When to retry failed sends, if the bot doesn't retry itself. Defaults to a :class:`pytgbot.retry.RetryPolicy`.
+        :type  retry: None | pytgbot.retry.RetryPolicy
+        """
+        if concurrency < 1:
+            raise ValueError("Need a concurrency of at least one.")
+        # end if
+        self.bot = bot
+        self.chat_ids = chat_ids
+        self.message = message
+        self.concurrency = concurrency
+        self.checkpoint = FileCheckpoint(checkpoint) if isinstance(checkpoint, str) else checkpoint
+        bot_scheduler = getattr(bot, 'scheduler', None)
+        # if the bot schedules itself, we must not count the requests twice.
+        self._own_scheduler = None if bot_scheduler is not None else (scheduler or RateScheduler())
+        self.scheduler = bot_scheduler or self._own_scheduler
+        # same for retrying, otherwise every retry of the broadcast would be retried by the bot again.
+        self.retry = None if getattr(bot, 'retry', None) is not None else (retry or RetryPolicy())
+        self.counts = {}
+        self.started = None
+        self.finished = None
+    # end def
+
+    @property
+    def sent(self):
+        return self.counts.get(SENT, 0)
+    # end def
+
+    @property
+    def messages_per_second(self):
+        if self.started is None:
+            return 0.0
+        # end if
+        duration = (self.finished or monotonic()) - self.started
+        return self.sent / duration if duration > 0 else 0.0
+    # end def
+
+    async def send_to(self, chat_id):
+        """
+        Sends the message to one chat, retrying where it makes sense.
+
+        :rtype: BroadcastResult
+        """
+        from asyncio import sleep
+        query = {'chat_id': chat_id}
+        attempt = 0
+        while True:
+            if self._own_scheduler is not None:
+                await self._own_scheduler.wait_async(SCHEDULER_COMMAND, query['chat_id'])
+            # end if
+            try:
+                result = _send(self.message, self.bot, query['chat_id'])
+                if isawaitable(result):
+                    result = await result
+                # end if
+                return BroadcastResult(chat_id, SENT, result=result, migrated_to=self._get_migration(chat_id, query))
+            except TgApiException as e:
+                status = get_failure_status(e)
+                delay = None
+                if status == FAILED and self.retry is not None:  # the others won't get better by retrying.
+                    delay = self.retry.get_delay(SCHEDULER_COMMAND, query, e, attempt, scheduler=self.scheduler)
+                # end if
+                if delay is None:
+                    return BroadcastResult(chat_id, status, error=e, migrated_to=self._get_migration(chat_id, query))
+                # end if
+            except Exception as e:
+                logger.exception("Sending to {chat!r} failed.".format(chat=chat_id))
+                return BroadcastResult(chat_id, FAILED, error=e)
+            # end try
+            attempt += 1
+            if delay:
+                await sleep(delay)
+            # end if
+        # end while
+    # end def
+
+    @staticmethod
+    def _get_migration(chat_id, query):
+        return query['chat_id'] if query['chat_id'] != chat_id else None
+    # end def
+
+    def _pending_chat_ids(self):
+        for chat_id in self.chat_ids:
+            if self.checkpoint is not None and self.checkpoint.is_done(chat_id):
+                continue
+            # end if
+            yield chat_id
+        # end for
+    # end def
+
+    async def __aiter__(self):
+        """
+        Runs the broadcast, yielding a :class:`BroadcastResult` for every chat as soon as it's done.
+        """
+        from asyncio import Queue, ensure_future, gather
+        results = Queue(maxsize=self.concurrency * 2)
+        chat_ids = self._pending_chat_ids()
+        done_marker = object()
+        errors = []  # of the workers, raised here instead.
+
+        async def work():
+            try:
+                for chat_id in chat_ids:  # shared by all the workers, so every chat is taken just once.
+                    result = await self.send_to(chat_id)
+                    # recorded right away, even if nobody reads the results anymore.
+                    self.counts[result.status] = self.counts.get(result.status, 0) + 1
+                    if self.checkpoint is not None:
+                        self.checkpoint.mark(result)
+                    # end if
+                    await results.put(result)
+                # end for
+            except Exception as e:  # like the `chat_ids` or the checkpoint failing, `send_to(…)` catches the rest.
+                errors.append(e)
+            # end try
+            await results.put(done_marker)
+        # end def
+
+        self.started = monotonic()
+        workers = [ensure_future(work()) for _ in range(self.concurrency)]
+        running = len(workers)
+        try:
+            while running:
+                result = await results.get()
+                if result is done_marker:
+                    if errors:
+                        raise errors[0]  # stopping the other workers too.
+                    # end if
+                    running -= 1
+                    continue
+                # end if
+                yield result
+            # end while
+            await gather(*workers)
+        finally:
+            self.finished = monotonic()
+            for worker in workers:
+                worker.cancel()
+            # end for
+            if self.checkpoint is not None:
+                self.checkpoint.close()
+            # end if
+        # end try
+    # end def
+
+    async def run(self):
+        """
+        Runs the whole broadcast without looking at the single results.
+
+        :return: How many chats ended up with each status, e.g. `{"sent": 99120, "blocked": 880}`.
+        :rtype: dict
+        """
+        async for _ in self:
+            pass
+        # end for
+        return self.counts
+    # end def
+# end class
+
+
+def broadcast(bot, chat_ids, message, **kwargs):
+    """
+    Sends a message to all the given chats, see :class:`Broadcaster` for all the options.
+
+        async for result in broadcast(bot, chat_ids, MessageSpec('send_message', text='Hi!'), checkpoint='hi.progress'):
+            print(result.chat_id, result.status)
+        # end for
+
+    :rtype: Broadcaster
+    """
+    return Broadcaster(bot, chat_ids, message, **kwargs)
+# end def
@@ -0,0 +1,440 @@
+# -*- coding: utf-8 -*-
+import threading
+from inspect import isawaitable
+
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = ["UpdateDispatcher", "AsyncUpdateDispatcher", "get_update_chat_id"]
+logger = logging.getLogger(__name__)
+
+
+# update types where the chat is `update.<type>.chat.id`
+CHAT_UPDATE_TYPES = (
+    "message", "edited_message", "channel_post", "edited_channel_post",
+    "my_chat_member", "chat_member", "chat_join_request",
+)
+# update types where the "chat" is the user, `update.<type>.from.id`
+USER_UPDATE_TYPES = ("inline_query", "chosen_inline_result", "shipping_query", "pre_checkout_query")
+
+
+def get_update_chat_id(update):
+    """
+    Returns the id of the chat an update belongs to.
+    For updates not happening in a chat, like inline queries, that's the id of the user instead.
+    Updates with the same chat id are handled in the order they arrived by the dispatchers.
+
+    Works with both :class:`pytgbot.api_types.receivable.updates.Update` objects
+    and the plain json dicts you get with `return_python_objects=False`.
+
+    :param update: The update
+    :type  update: pytgbot.api_types.receivable.updates.Update | dict
+
+    :return: The chat id, or `None` if there's no such chat (e.g. for `poll` updates).
+    :rtype: int | str | None
+    """
+    if isinstance(update, dict):
+        def get(obj, key):
+            return obj.get(key) if obj else None
+        # end def
+        peer_key = 'from'
+    else:
+        def get(obj, key):
+            return getattr(obj, key, None) if obj else None
+        # end def
+        peer_key = 'from_peer'
+    # end if
+    for update_type in CHAT_UPDATE_TYPES:
+        content = get(update, update_type)
+        if content:
+            return get(get(content, 'chat'), 'id')
+        # end if
+    # end for
+    content = get(update, 'callback_query')
+    if content:
+        chat_id = get(get(get(content, 'message'), 'chat'), 'id')
+        return chat_id if chat_id is not None else get(get(content, peer_key), 'id')
+    # end if
+    for update_type in USER_UPDATE_TYPES:
+        content = get(update, update_type)
+        if content:
+            return get(get(content, peer_key), 'id')
+        # end if
+    # end for
+    content = get(update, 'poll_answer')
+    if content:
+        return get(get(content, 'user'), 'id')
+    # end if
+    return None
+# end def
+
+
+def _unpack_updates(result):
+    """
+    `get_updates(…)` returns a list of updates, but a dict with a `"result"` key for `return_python_objects=False`,
+    or if `error_as_empty=True` swallowed an error.
+    """
+    if isinstance(result, dict):
+        return result.get('result') or []
+    # end if
+    return result
+# end def
+
+
+def _get_error(result):
+    """
+    The exception `get_updates(…)` swallowed with `error_as_empty=True`, if any.
+    """
+    if isinstance(result, dict):
+        return result.get('exception')
+    # end if
+    return None
+# end def
+
+
+def _get_update_id(update):
+    return update['update_id'] if isinstance(update, dict) else update.update_id
+# end def
+
+
+class UpdateDispatcher(object):
+    """
+    Long polls the updates of a :class:`pytgbot.bot.synchronous.SyncBot`,
+    and hands every update to `handler(update)` in a pool of worker threads.
+
+    Updates of the same chat (see :func:`get_update_chat_id`) are always given to the same worker,
+    so within a chat they are processed one after another, in the order they arrived.
+    If the queue of a worker is full, the polling waits until there is space again,
+    so a slow handler leads to fewer updates being fetched instead of ever growing memory.
+
+    Note: An update counts as received as soon as it is queued, so updates still waiting in the queues are lost
+    if the process is killed. A `stop()` will still process everything already queued.
+
+        dispatcher = UpdateDispatcher(bot, handle_update, workers=8)
+        dispatcher.run()  # blocks, or use `dispatcher.start()` to run in the background.
+    """
+
+    def __init__(
+        self, bot, handler, workers=8, queue_size=100, poll_timeout=30, limit=100, allowed_updates=None,
+        offset=None, key=get_update_chat_id, error_delay=1.0,
+    ):
+        """
+        :param bot: The bot to get the updates with.
+        :type  bot: pytgbot.bot.synchronous.SyncBot
+
+        :param handler: Function called with every update.
+        :type  handler: callable
+
+        :param workers: Number of worker threads calling `handler`.
+        :type  workers: int
+
+        :param queue_size: How many updates can wait for each worker before we stop fetching new ones.
+        :type  queue_size: int
+
+        :param poll_timeout: Timeout in seconds for long polling, see :meth:`SyncBot.get_updates`.
+        :type  poll_timeout: int
+
+        :param limit: How many updates to fetch at once, 1-100.
+        :type  limit: int
+
+        :param allowed_updates: The types of updates to receive, see :meth:`SyncBot.get_updates`.
+        :type  allowed_updates: None | list of str
+
+        :param offset: The update id to start with. `None` starts with the earliest unconfirmed update.
+        :type  offset: None | int
+
+        :param key: Function returning the key of an update. Updates with the same key keep their order.
+        :type  key: callable
+
+        :param error_delay: How many seconds to wait before polling again after an error,
+                            so a lasting one (like a second bot polling with the same token) doesn't make it spin.
+        :type  error_delay: float
+        """
+        if workers < 1:
+            raise ValueError("Need at least one worker.")
+        # end if
+        self.bot = bot
+        self.handler = handler
+        self.workers = workers
+        self.queue_size = queue_size
+        self.poll_timeout = poll_timeout
+        self.limit = limit
+        self.allowed_updates = allowed_updates
+        self.offset = offset
+        self.key = key
+        self.error_delay = error_delay
+        self._queues = []
+        self._threads = []
+        self._poll_thread = None
+        self._running = threading.Event()
+    # end def __init__
+
+    @property
+    def is_running(self):
+        return self._running.is_set()
+    # end def
+
+    def get_worker_index(self, update):
+        """
+        :return: The index of the worker handling this update.
+        :rtype: int
+        """
+        key = self.key(update)
+        if key is None:
+            key = _get_update_id(update)  # no ordering needed, so spread them evenly.
+        # end if
+        return hash(key) % self.workers
+    # end def
+
+    def dispatch(self, update):
+        """
+        Queues a single update for handling, waiting if that worker's queue is full.
+        Can be used to feed in updates received otherwise, e.g. by a webhook.
+        """
+        self._queues[self.get_worker_index(update)].put(update)
+    # end def
+
+    def poll_once(self):
+        """
+        Does a single `get_updates` call, and queues the received updates.
+        After an error it waits `error_delay` seconds.
+
+        :return: The number of received updates.
+        :rtype: int
+        """
+        result = self.bot.get_updates(
+            offset=self.offset, limit=self.limit, poll_timeout=self.poll_timeout,
+            allowed_updates=self.allowed_updates, error_as_empty=True,
+        )
+        if _get_error(result) is not None:
+            from time import sleep
+            sleep(self.error_delay)  # `get_updates(…)` logged it already.
+            return 0
+        # end if
+        updates = _unpack_updates(result)
+        for update in updates:
+            self.dispatch(update)
+            self.offset = _get_update_id(update) + 1
+        # end for
+        return len(updates)
+    # end def
+
+    def start(self):
+        """
+        Starts the workers and the polling in background threads.
+        """
+        if self.is_running:
+            raise RuntimeError("The dispatcher is already running.")
+        # end if
+        self._start_workers()
+        self._poll_thread = threading.Thread(target=self._poll_loop, name="pytgbot update polling", daemon=True)
+        self._poll_thread.start()
+    # end def
+
+    def run(self):
+        """
+        Starts the workers and polls for updates until :meth:`stop` is called.
+        Blocks until all the queued updates are processed.
+        """
+        if self.is_running:
+            raise RuntimeError("The dispatcher is already running.")
+        # end if
+        self._start_workers()
+        self._poll_loop()
+    # end def
+
+    def stop(self):
+        """
+        Stops polling after the currently running long poll.
+        The updates already queued are still processed.
+        """
+        self._running.clear()
+    # end def
+
+    def join(self, timeout=None):
+        """
+        Waits for the background polling started with :meth:`start` to finish after a :meth:`stop`.
+        """
+        if self._poll_thread is not None:
+            self._poll_thread.join(timeout)
+        # end if
+    # end def
+
+    def _start_workers(self):
+        from queue import Queue
+        self._running.set()
+        self._queues = [Queue(maxsize=self.queue_size) for _ in range(self.workers)]
+        self._threads = [
+            threading.Thread(target=self._work, args=(queue,), name="pytgbot update worker {}".format(i), daemon=True)
+            for i, queue in enumerate(self._queues)
+        ]
+        for thread in self._threads:
+            thread.start()
+        # end for
+    # end def
+
+    def _poll_loop(self):
+        try:
+            while self.is_running:
+                self.poll_once()
+            # end while
+        finally:
+            self._running.clear()
+            for queue in self._queues:
+                queue.put(None)  # tells the worker to quit
+            # end for
+            for thread in self._threads:
+                thread.join()
+            # end for
+        # end try
+    # end def
+
+    def _work(self, queue):
+        while True:
+            update = queue.get()
+            if update is None:
+                return
+            # end if
+            try:
+                self.handler(update)
+            except Exception:
+                logger.exception("Handler failed for update {id!r}.".format(id=_get_update_id(update)))
+            # end try
+        # end while
+    # end def
+# end class
+
+
+class AsyncUpdateDispatcher(object):
+    """
+    Long polls the updates of a :class:`pytgbot.bot.asynchronous.AsyncBot`,
+    and hands every update to `await handler(update)` in a fixed number of worker tasks.
+
+    It works like the :class:`UpdateDispatcher`, with asyncio tasks instead of threads:
+    Updates of the same chat keep their order, and full queues pause the polling.
+
+        dispatcher = AsyncUpdateDispatcher(bot, handle_update, workers=100)
+        await dispatcher.run()
+    """
+
+    def __init__(
+        self, bot, handler, workers=100, queue_size=100, poll_timeout=30, limit=100, allowed_updates=None,
+        offset=None, key=get_update_chat_id, error_delay=1.0,
+    ):
+        """
+        See :class:`UpdateDispatcher` for the parameters.
+
+        :param bot: The bot to get the updates with.
+        :type  bot: pytgbot.bot.asynchronous.AsyncBot
+
+        :param handler: Coroutine function (or plain function) called with every update.
+        :type  handler: callable
+        """
+        if workers < 1:
+            raise ValueError("Need at least one worker.")
+        # end if
+        self.bot = bot
+        self.handler = handler
+        self.workers = workers
+        self.queue_size = queue_size
+        self.poll_timeout = poll_timeout
+        self.limit = limit
+        self.allowed_updates = allowed_updates
+        self.offset = offset
+        self.key = key
+        self.error_delay = error_delay
+        self._queues = []
+        self._tasks = []
+        self._running = False
+    # end def __init__
+
+    @property
+    def is_running(self):
+        return self._running
+    # end def
+
+    get_worker_index = UpdateDispatcher.get_worker_index
+
+    async def dispatch(self, update):
+        """
+        Queues a single update for handling, waiting if that worker's queue is full.
+        Can be used to feed in updates received otherwise, e.g. by a webhook.
+        """
+        await self._queues[self.get_worker_index(update)].put(update)
+    # end def
+
+    async def poll_once(self):
+        """
+        Does a single `get_updates` call, and queues the received updates.
+        After an error it waits `error_delay` seconds.
+
+        :return: The number of received updates.
+        :rtype: int
+        """
+        result = await self.bot.get_updates(
+            offset=self.offset, limit=self.limit, poll_timeout=self.poll_timeout,
+            allowed_updates=self.allowed_updates, error_as_empty=True,
+        )
+        if _get_error(result) is not None:
+            from asyncio import sleep
+            await sleep(self.error_delay)  # `get_updates(…)` logged it already.
+            return 0
+        # end if
+        updates = _unpack_updates(result)
+        for update in updates:
+            await self.dispatch(update)
+            self.offset = _get_update_id(update) + 1
+        # end for
+        return len(updates)
+    # end def
+
+    async def run(self):
+        """
+        Starts the workers and polls for updates until :meth:`stop` is called.
+        Returns after all the queued updates are processed.
+        """
+        from asyncio import Queue, ensure_future, gather
+        if self._running:
+            raise RuntimeError("The dispatcher is already running.")
+        # end if
+        self._running = True
+        self._queues = [Queue(maxsize=self.queue_size) for _ in range(self.workers)]
+        self._tasks = [ensure_future(self._work(queue)) for queue in self._queues]
+        try:
+            while self._running:
+                await self.poll_once()
+            # end while
+        finally:
+            self._running = False
+            for queue in self._queues:
+                await queue.put(None)  # tells the worker to quit
+            # end for
+            await gather(*self._tasks)
+        # end try
+    # end def
+
+    def stop(self):
+        """
+        Stops polling after the currently running long poll.
+        The updates already queued are still processed.
+        """
+        self._running = False
+    # end def
+
+    async def _work(self, queue):
+        while True:
+            update = await queue.get()
+            if update is None:
+                return
+            # end if
+            try:
+                result = self.handler(update)
+                if isawaitable(result):
+                    await result
+                # end if
+            except Exception:
+                logger.exception("Handler failed for update {id!r}.".format(id=_get_update_id(update)))
+            # end try
+        # end while
+    # end def
+# end class
@@ -59,15 +59,43 @@ class TgApiResponseException(TgApiException):
 class TgApiServerException(TgApiException):
     """
     Raised if the api returns "ok" == false
+
+    If telegram told us more, like how long to wait because of flood control,
+    that's in `parameters`, and also directly accessible as `retry_after` and `migrate_to_chat_id`.
     """
-    def __init__(self, error_code=None, response=None, description=None, request=None):
+    def __init__(self, error_code=None, response=None, description=None, request=None, parameters=None):
+        """
+        :param parameters: Why the request failed, the `"parameters"` of the response.
+        :type  parameters: pytgbot.api_types.receivable.updates.ResponseParameters | None
+        """
         super(TgApiServerException, self).__init__(description)
         self.error_code = error_code
         self.response = response
         self.description = description
         self.request=request
+        self.parameters = parameters
     # end def __init__
 
+    @property
+    def retry_after(self):
+        """
+        In case of exceeding flood control (`error_code` 429), the number of seconds to wait before trying again.
+
+        :rtype: int | None
+        """
+        return self.parameters.retry_after if self.parameters is not None else None
+    # end def
+
+    @property
+    def migrate_to_chat_id(self):
+        """
+        The new id of the chat, if the group was migrated to a supergroup.
+
+        :rtype: int | None
+        """
+        return self.parameters.migrate_to_chat_id if self.parameters is not None else None
+    # end def
+
     def __str__(self, *args, **kwargs):
         return "TgApiServerException(error_code={self.error_code!r}, response={self.response!r}, " \
                "description={self.description!r}, request={self.request!r})".format(self=self)
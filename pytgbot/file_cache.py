@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import threading
+from collections import OrderedDict
+from hashlib import sha256
+from time import time
+
+from luckydonaldUtils.logger import logging
+
+from .api_types.sendable.files import InputFile, BaseInputFileUse, InputFileFromDisk
+
+__author__ = 'luckydonald'
+__all__ = ["FileIdCache", "MemoryCacheBackend", "SQLiteCacheBackend", "JsonFileCacheBackend", "get_message_file_id"]
+logger = logging.getLogger(__name__)
+
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_message_file_id(result, field):
+    """
+    Finds the `file_id` telegram assigned to an uploaded file in the result of the request.
+
+    :param result: The `"result"` of the api response, usually the sent message.
+    :type  result: dict
+
+    :param field: The parameter the file was uploaded as, like `"photo"` or `"document"`.
+    :type  field: str
+
+    :return: The file_id, or `None` if it's not in there.
+    :rtype: str | None
+    """
+    if not isinstance(result, dict):
+        return None
+    # end if
+    if 'file_id' in result:  # e.g. `uploadStickerFile` returns the file itself.
+        return result['file_id']
+    # end if
+    media = result.get(field)
+    if isinstance(media, list):  # photos come in all sizes, the biggest (the one we uploaded) last.
+        media = media[-1] if media else None
+    # end if
+    if isinstance(media, dict):
+        return media.get('file_id')
+    # end if
+    return None
+# end def
+
+
+class MemoryCacheBackend(object):
+    """
+    Keeps the file_ids in memory, forgetting the least recently used ones when `maxsize` is reached.
+    """
+
+    def __init__(self, maxsize=1000):
+        """
+        :param maxsize: How many file_ids to keep at most. `None` for no limit.
+        :type  maxsize: int | None
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    # end def
+
+    def get(self, key):
+        with self._lock:
+            file_id = self._data.get(key)
+            if file_id is not None:
+                self._data.move_to_end(key)
+            # end if
+            return file_id
+        # end with
+    # end def
+
+    def set(self, key, file_id):
+        with self._lock:
+            self._data[key] = file_id
+            self._data.move_to_end(key)
+            while self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            # end while
+        # end with
+    # end def
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+        # end with
+    # end def
+
+    def __len__(self):
+        return len(self._data)
+    # end def
+# end class
+
+
+class SQLiteCacheBackend(object):
+    """
+    Keeps the file_ids in a SQLite database, so they survive restarts and can be shared between processes.
+    Entries are evicted by age (`max_age`), and by least recent use if there are more than `maxsize`.
+    """
+
+    def __init__(self, path, maxsize=None, max_age=None, table='pytgbot_file_ids'):
+        """
+        :param path: The database file.
+        :type  path: str
+
+        :param maxsize: How many file_ids to keep at most. `None` for no limit.
+        :type  maxsize: int | None
+
+        :param max_age: After how many seconds without being used an entry is forgotten. `None` for never.
+        :type  max_age: float | None
+
+        :param table: The name of the table to use.
+        :type  table: str
+        """
+        import sqlite3
+        self.path = path
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self.table = table
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS "{table}" (key TEXT PRIMARY KEY, file_id TEXT NOT NULL, last_used REAL NOT NULL)'.format(table=table)
+        )
+    # end def
+
+    def get(self, key):
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT file_id, last_used FROM "{table}" WHERE key = ?'.format(table=self.table), (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            # end if
+            file_id, last_used = row
+            now = time()
+            if self.max_age is not None and last_used < now - self.max_age:
+                self._connection.execute('DELETE FROM "{table}" WHERE key = ?'.format(table=self.table), (key,))
+                return None
+            # end if
+            self._connection.execute(
+                'UPDATE "{table}" SET last_used = ? WHERE key = ?'.format(table=self.table), (now, key),
+            )
+            return file_id
+        # end with
+    # end def
+
+    def set(self, key, file_id):
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO "{table}" (key, file_id, last_used) VALUES (?, ?, ?)'.format(table=self.table),
+                (key, file_id, time()),
+            )
+            self._evict()
+        # end with
+    # end def
+
+    def delete(self, key):
+        with self._lock:
+            self._connection.execute('DELETE FROM "{table}" WHERE key = ?'.format(table=self.table), (key,))
+        # end with
+    # end def
+
+    def _evict(self):
+        """
+        Must be called holding the lock.
+        """
+        if self.max_age is not None:
+            self._connection.execute(
+                'DELETE FROM "{table}" WHERE last_used < ?'.format(table=self.table), (time() - self.max_age,),
+            )
+        # end if
+        if self.maxsize is not None:
+            self._connection.execute(
+                'DELETE FROM "{table}" WHERE key NOT IN (SELECT key FROM "{table}" ORDER BY last_used DESC LIMIT ?)'.format(table=self.table),
+                (self.maxsize,),
+            )
+        # end if
+    # end def
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM "{table}"'.format(table=self.table)).fetchone()[0]
+        # end with
+    # end def
+
+    def close(self):
+        self._connection.close()
+    # end def
+# end class
+
+
+class JsonFileCacheBackend(MemoryCacheBackend):
+    """
+    Keeps the file_ids in memory like :class:`MemoryCacheBackend`, but also stores them in a json file,
+    which is loaded again on the next start.
+    The file is rewritten on every change, so this is meant for a moderate amount of files.
+    """
+
+    def __init__(self, path, maxsize=1000):
+        """
+        :param path: The json file.
+        :type  path: str
+
+        :param maxsize: How many file_ids to keep at most. `None` for no limit.
+        :type  maxsize: int | None
+        """
+        super(JsonFileCacheBackend, self).__init__(maxsize=maxsize)
+        self.path = path
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                self._data.update(json.load(f))
+            # end with
+        # end if
+    # end def
+
+    def set(self, key, file_id):
+        super(JsonFileCacheBackend, self).set(key, file_id)
+        self._save()
+    # end def
+
+    def delete(self, key):
+        super(JsonFileCacheBackend, self).delete(key)
+        self._save()
+    # end def
+
+    def _save(self):
+        with self._lock:
+            data = list(self._data.items())
+        # end with
+        temp_path = "{path}.{pid}.tmp".format(path=self.path, pid=os.getpid())
+        with open(temp_path, 'w') as f:
+            json.dump(OrderedDict(data), f)
+        # end with
+        os.replace(temp_path, self.path)  # atomic, so a crash never leaves a broken file.
+    # end def
+# end class
+
+
+class FileIdCache(object):
+    """
+    Uploads every file only once: Remembers the `file_id` telegram gives an uploaded file,
+    and sends that instead of the file the next time.
+
+        bot = SyncBot(API_KEY, file_id_cache=FileIdCache())
+        bot.send_photo(chat_id, InputFileFromDisk('cat.jpg'))  # uploads the file
+        bot.send_photo(chat_id, InputFileFromDisk('cat.jpg'))  # sends the file_id
+
+    Files on disk are recognized by path, modification time and size, all the other files by a hash of their content.
+    With `hash_files=True` the files on disk are hashed as well, so copies of the same file share the file_id.
+    As a file_id only works for the kind of media it was uploaded as, a photo is cached separately from a document.
+    """
+
+    def __init__(self, backend=None, hash_files=False):
+        """
+        :param backend: Where to store the file_ids.
+                        :class:`MemoryCacheBackend`, :class:`SQLiteCacheBackend`, :class:`JsonFileCacheBackend`,
+                        or anything with `get(key)`, `set(key, file_id)` and `delete(key)` methods.
+                        Defaults to a :class:`MemoryCacheBackend`.
+
+        :param hash_files: If files on disk should be recognized by their content, instead of their path.
+        :type  hash_files: bool
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.hash_files = hash_files
+        self.hits = 0
+        self.misses = 0
+    # end def
+
+    def get_key(self, field, input_file):
+        """
+        :param field: The parameter the file is sent as, like `"photo"`.
+        :type  field: str
+
+        :param input_file: The file.
+        :type  input_file: pytgbot.api_types.sendable.files.InputFile
+
+        :return: The cache key, or `None` if that file can't be cached.
+        :rtype: str | None
+        """
+        if isinstance(input_file, InputFileFromDisk):
+            if self.hash_files:
+                digest = sha256()
+                with open(input_file.path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                        digest.update(chunk)
+                    # end for
+                # end with
+                return "{field}:sha256:{hash}".format(field=field, hash=digest.hexdigest())
+            # end if
+            stat = os.stat(input_file.path)
+            return "{field}:path:{path}:{mtime}:{size}".format(
+                field=field, path=os.path.abspath(input_file.path), mtime=stat.st_mtime_ns, size=stat.st_size,
+            )
+        # end if
+        blob = getattr(input_file, 'blob', None)
+        if isinstance(blob, (bytes, bytearray)):
+            return "{field}:sha256:{hash}".format(field=field, hash=sha256(blob).hexdigest())
+        # end if
+        return None
+    # end def
+
+    def prepare(self, query):
+        """
+        Replaces the files in the request parameters we already know the `file_id` of.
+
+        :param query: The request parameters. Changed in place.
+        :type  query: dict
+
+        :return: What to give to :meth:`store` after the request,
+                 a dict of `{field: (key, original file, if the file_id came from the cache)}`.
+        :rtype: dict
+        """
+        pending = {}
+        for field, value in query.items():
+            if not isinstance(value, InputFile) or isinstance(value, BaseInputFileUse):
+                continue
+            # end if
+            key = self.get_key(field, value)
+            if key is None:
+                continue
+            # end if
+            file_id = self.backend.get(key)
+            if file_id is not None:
+                self.hits += 1
+                query[field] = file_id
+            else:
+                self.misses += 1
+            # end if
+            pending[field] = (key, value, file_id is not None)
+        # end for
+        return pending
+    # end def
+
+    def store(self, pending, query, response):
+        """
+        Remembers the file_ids of the uploaded files.
+        If telegram didn't like a cached file_id, that one is forgotten, and the file is put back into `query`,
+        so it is uploaded again when the request is repeated.
+
+        :param pending: What :meth:`prepare` returned.
+        :type  pending: dict
+
+        :param query: The request parameters.
+        :type  query: dict
+
+        :param response: The json response of the api.
+        :type  response: dict
+        """
+        if not pending or not isinstance(response, dict):
+            return
+        # end if
+        if response.get('ok') is not True:
+            if 'file' not in (response.get('description') or '').lower():
+                return
+            # end if
+            for field, (key, original, cached) in pending.items():
+                if cached:
+                    logger.debug("Forgetting the file_id of {key!r}, as the request failed.".format(key=key))
+                    self.backend.delete(key)
+                    query[field] = original
+                # end if
+            # end for
+            return
+        # end if
+        for field, (key, original, cached) in pending.items():
+            if cached:
+                continue
+            # end if
+            file_id = get_message_file_id(response.get('result'), field)
+            if file_id is not None:
+                self.backend.set(key, file_id)
+            # end if
+        # end for
+    # end def
+# end class
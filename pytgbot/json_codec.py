@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+import json
+
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = ["JsonCodec", "StdlibJsonCodec", "OrjsonCodec", "UjsonCodec", "get_default_codec", "set_default_codec"]
+logger = logging.getLogger(__name__)
+
+
+class JsonCodec(object):
+    """
+    Encodes the parameters of the requests, and decodes the responses.
+    All the codecs give the same compact json, without escaping non-ascii characters.
+
+    Subclass it to use any other json library:
+
+        class MyCodec(JsonCodec):
+            name = 'my_json'
+
+            def dumps(self, obj):
+                return my_json.dumps(obj)
+            # end def
+
+            def loads(self, data):
+                return my_json.loads(data)
+            # end def
+        # end class
+
+        bot = SyncBot(API_KEY, json_codec=MyCodec())
+    """
+    name = None
+
+    def dumps(self, obj):
+        """
+        :param obj: The json-like value to encode, see :func:`pytgbot.api_types.as_array`.
+        :type  obj: dict|list|str|int|float|bool|None
+
+        :return: The json.
+        :rtype: str
+        """
+        raise NotImplementedError('subclass needs to overwrite this.')
+    # end def
+
+    def loads(self, data):
+        """
+        :param data: The json, as returned by the server.
+        :type  data: bytes|str
+
+        :return: The decoded value.
+        :raises ValueError: If it isn't valid json.
+        """
+        raise NotImplementedError('subclass needs to overwrite this.')
+    # end def
+
+    def __repr__(self):
+        return "{cls}()".format(cls=self.__class__.__name__)
+    # end def
+# end class
+
+
+class StdlibJsonCodec(JsonCodec):
+    """
+    The `json` module of the standard library. Always available.
+    """
+    name = 'json'
+
+    def dumps(self, obj):
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+    # end def
+
+    def loads(self, data):
+        return json.loads(data)
+    # end def
+# end class
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Uses `orjson`, the fastest of them. Install with `pip install orjson`.
+    """
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+    # end def
+
+    def dumps(self, obj):
+        return self._dumps(obj).decode('utf-8')  # bytes, always compact and utf-8.
+    # end def
+
+    def loads(self, data):
+        return self._loads(data)  # its `JSONDecodeError` is a `ValueError`, too.
+    # end def
+# end class
+
+
+class UjsonCodec(JsonCodec):
+    """
+    Uses `ujson`. Install with `pip install ujson`.
+    """
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._dumps = ujson.dumps
+        self._loads = ujson.loads
+    # end def
+
+    def dumps(self, obj):
+        return self._dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+    # end def
+
+    def loads(self, data):
+        return self._loads(data)
+    # end def
+# end class
+
+
+_default_codec = None  # see `get_default_codec()`.
+
+
+def get_default_codec():
+    """
+    The codec used by the bots without a `json_codec` of their own.
+    Unless set with :func:`set_default_codec`, that's the fastest one installed: `orjson`, `ujson` or the standard library.
+
+    :rtype: JsonCodec
+    """
+    global _default_codec
+    if _default_codec is None:
+        for codec_class in (OrjsonCodec, UjsonCodec):
+            try:
+                _default_codec = codec_class()
+                break
+            except ImportError:
+                continue
+            # end try
+        else:
+            _default_codec = StdlibJsonCodec()
+        # end for
+        logger.debug("Using {name} to en- and decode json.".format(name=_default_codec.name))
+    # end if
+    return _default_codec
+# end def
+
+
+def set_default_codec(codec):
+    """
+    Sets the codec used by the bots without a `json_codec` of their own.
+
+    :param codec: The codec, or `None` to pick the fastest one installed again.
+    :type  codec: JsonCodec | None
+    """
+    global _default_codec
+    _default_codec = codec
+# end def
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+import io
+import mmap
+import os
+import stat
+from uuid import uuid4
+
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = ["MultipartEncoder", "get_stream_size", "close_files"]
+logger = logging.getLogger(__name__)
+
+
+CHUNK_SIZE = 64 * 1024  # how much of a file is read at once.
+
+
+def get_stream_size(content):
+    """
+    Finds out how many bytes are left to read, without reading them.
+
+    :param content: The file content, either as bytes, or a file-like object opened in binary mode.
+    :type  content: bytes | io.IOBase
+
+    :return: The remaining size in bytes, or `None` if that can't be known in advance.
+    :rtype: int | None
+    """
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return len(content)
+    # end if
+    if isinstance(content, mmap.mmap):
+        return len(content) - content.tell()
+    # end if
+    length = getattr(content, 'length_remaining', None)  # a streamed urllib3 response, e.g. `requests.get(…).raw`.
+    if isinstance(length, int):
+        return length
+    # end if
+    try:
+        file_stat = os.fstat(content.fileno())
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        file_stat = None
+    # end try
+    if file_stat is not None and stat.S_ISREG(file_stat.st_mode):
+        return file_stat.st_size - content.tell()
+    # end if
+    try:
+        if not content.seekable():
+            return None
+        # end if
+        position = content.tell()
+        end = content.seek(0, io.SEEK_END)
+        content.seek(position)
+        return end - position
+    except (AttributeError, OSError, ValueError):
+        return None
+    # end try
+# end def
+
+
+def close_files(files):
+    """
+    Closes the file-like objects of the files of a request, after the request is done.
+
+    :param files: The files, as `{field: (filename, content, mime)}`.
+    :type  files: dict
+    """
+    for file_info in files.values():
+        close = getattr(file_info[1], 'close', None)
+        if close is None:
+            continue
+        # end if
+        try:
+            close()
+        except BufferError:  # a memory map still has a chunk referenced somewhere, it's closed as soon that's gone.
+            logger.debug('Could not close the memory map of {name!r} yet.'.format(name=file_info[0]))
+        # end try
+    # end for
+# end def
+
+
+def _quote(value):
+    """
+    Escapes a field or file name for the `Content-Disposition` header, the way browsers do.
+    """
+    return value.replace('"', '%22').replace('\r', '%0D').replace('\n', '%0A')
+# end def
+
+
+class _Part(object):
+    __slots__ = ('header', 'content', 'size')
+
+    def __init__(self, header, content, size):
+        self.header = header
+        self.content = content
+        self.size = size
+    # end def
+# end class
+
+
+class MultipartEncoder(object):
+    """
+    Builds a `multipart/form-data` request body from the files to upload, reading them chunk by chunk while it's sent.
+    So even a 50 MB document is never held in memory as a whole, unlike with `requests.post(…, files=…)`.
+
+    The files are given in the format of :meth:`pytgbot.api_types.sendable.files.InputFile.get_request_files`,
+    `{field: (filename, content, mime)}`, where the content can be `bytes` or any file-like object opened in binary mode,
+    like an open file or a streamed download.
+
+        body = MultipartEncoder({'document': ('big.zip', open('big.zip', 'rb'), 'application/zip')})
+        requests.post(url, data=body, headers=body.headers)  # requests
+        await client.post(url, content=body.aiter_chunks(), headers=body.headers)  # httpx
+
+    A memory map (`mmap.mmap`) is sent in slices of the mapped memory, without copying it at all.
+
+    If all the sizes are known, a `Content-Length` is sent, otherwise the body is sent with chunked transfer encoding.
+    The file-like objects are read from their current position. Call :meth:`close` after the request to close them.
+    """
+
+    def __init__(self, files, boundary=None, chunk_size=CHUNK_SIZE):
+        """
+        :param files: The files to upload, as `{field: (filename, content, mime)}`.
+        :type  files: dict
+
+        :param boundary: The boundary separating the parts. Defaults to a random one.
+        :type  boundary: None | str
+
+        :param chunk_size: How many bytes to read from a file at once.
+        :type  chunk_size: int
+        """
+        self.boundary = boundary or uuid4().hex
+        self.chunk_size = chunk_size
+        self._parts = []
+        for field, file_info in files.items():
+            filename, content, mime = file_info[:3]
+            header = 'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'.format(
+                field=_quote(field), filename=_quote(filename or field),
+            )
+            if mime:
+                header += 'Content-Type: {mime}\r\n'.format(mime=mime)
+            # end if
+            header = '--{boundary}\r\n{header}\r\n'.format(boundary=self.boundary, header=header).encode('utf-8')
+            if isinstance(content, str):
+                content = content.encode('utf-8')
+            # end if
+            self._parts.append(_Part(header, content, get_stream_size(content)))
+        # end for
+        self._footer = '--{boundary}--\r\n'.format(boundary=self.boundary).encode('utf-8')
+        self._files = files
+    # end def
+
+    @property
+    def content_type(self):
+        return 'multipart/form-data; boundary={boundary}'.format(boundary=self.boundary)
+    # end def
+
+    @property
+    def len(self):
+        """
+        The size of the whole body in bytes, or `None` if a file's size is unknown.
+        Named like this (and not `__len__`) for requests, which takes it as `Content-Length`.
+
+        :rtype: int | None
+        """
+        total = len(self._footer)
+        for part in self._parts:
+            if part.size is None:
+                return None
+            # end if
+            total += len(part.header) + part.size + 2  # the CRLF after the content
+        # end for
+        return total
+    # end def
+
+    @property
+    def headers(self):
+        """
+        The headers to send along with the body.
+
+        :rtype: dict
+        """
+        headers = {'Content-Type': self.content_type}
+        length = self.len
+        if length is not None:
+            headers['Content-Length'] = str(length)
+        # end if
+        return headers
+    # end def
+
+    @staticmethod
+    def _check_size(part, read):
+        if part.size is not None and read != part.size:
+            raise IOError('Expected {size} bytes of file content, but got {read}.'.format(size=part.size, read=read))
+        # end if
+    # end def
+
+    def _read_chunk(self, part, remaining):
+        """
+        :return: The next chunk of the part's content, `b''` at the end.
+        """
+        size = self.chunk_size if remaining is None else min(self.chunk_size, remaining)
+        if size <= 0:
+            return b''
+        # end if
+        return part.content.read(size)
+    # end def
+
+    def iter_chunks(self):
+        """
+        Yields the body piece by piece, never an empty one.
+        """
+        for part in self._parts:
+            yield part.header
+            if isinstance(part.content, (bytes, bytearray, memoryview)):
+                if part.content:
+                    yield part.content
+                # end if
+            elif isinstance(part.content, mmap.mmap):
+                view = memoryview(part.content)
+                try:
+                    for start in range(part.content.tell(), len(view), self.chunk_size):
+                        yield view[start:start + self.chunk_size]
+                    # end for
+                finally:
+                    view.release()
+                # end try
+            else:
+                read = 0
+                remaining = part.size
+                while True:
+                    chunk = self._read_chunk(part, remaining)
+                    if not chunk:
+                        break
+                    # end if
+                    read += len(chunk)
+                    remaining = None if remaining is None else remaining - len(chunk)
+                    yield chunk
+                # end while
+                self._check_size(part, read)
+            # end if
+            yield b'\r\n'
+        # end for
+        yield self._footer
+    # end def
+
+    async def aiter_chunks(self):
+        """
+        Like :meth:`iter_chunks`, but reads the files in a thread, so a slow disk or download doesn't block the event loop.
+        """
+        from asyncio import get_running_loop
+        loop = get_running_loop()
+        for part in self._parts:
+            yield part.header
+            if isinstance(part.content, (bytes, bytearray, memoryview)):
+                if part.content:
+                    yield bytes(part.content)
+                # end if
+            else:
+                # memory maps are read too, as touching their pages may have to wait for the disk.
+                read = 0
+                remaining = part.size
+                in_memory = isinstance(part.content, io.BytesIO)
+                while True:
+                    if in_memory:
+                        chunk = self._read_chunk(part, remaining)
+                    else:
+                        chunk = await loop.run_in_executor(None, self._read_chunk, part, remaining)
+                    # end if
+                    if not chunk:
+                        break
+                    # end if
+                    read += len(chunk)
+                    remaining = None if remaining is None else remaining - len(chunk)
+                    yield chunk
+                # end while
+                self._check_size(part, read)
+            # end if
+            yield b'\r\n'
+        # end for
+        yield self._footer
+    # end def
+
+    def __iter__(self):
+        """
+        Iterating is how `http.client` sends the body, passing the chunks to the socket as they are.
+        There's deliberately no `read(…)`, which it would prefer, copying everything into new blocks.
+        """
+        return self.iter_chunks()
+    # end def
+
+    def close(self):
+        """
+        Closes all the files of this upload, see :func:`close_files`.
+        """
+        close_files(self._files)
+    # end def
+# end class
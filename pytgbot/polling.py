@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+from time import monotonic
+
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = ["PipelinedPoller", "AsyncPipelinedPoller", "PollingStats"]
+logger = logging.getLogger(__name__)
+
+
+class PollingStats(object):
+    """
+    Timing of a :class:`PipelinedPoller`, all in seconds.
+
+    - `fetch_seconds`: Time the `getUpdates` requests took in total, including the long polling itself.
+    - `wait_seconds`: Time the consumer actually had to wait for a batch.
+    - `handle_seconds`: Time the consumer spent handling the batches.
+    - `overlap_seconds`: Time fetching happened while the consumer was busy handling the previous batch,
+                         meaning that latency was saved compared to serial polling.
+    - `last_latency`: How long the last batch waited between being received and the consumer picking it up,
+                      which is the part of the end-to-end latency caused by us.
+    """
+
+    def __init__(self):
+        self.batches = 0
+        self.updates = 0
+        self.errors = 0
+        self.fetch_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.handle_seconds = 0.0
+        self.overlap_seconds = 0.0
+        self.last_latency = 0.0
+    # end def
+
+    def add_batch(self, size, fetch_started, fetch_finished, wait_started, handle_started, previous_handle_started):
+        """
+        Records the timings (`time.monotonic()`) of a received batch.
+        """
+        self.batches += 1
+        self.updates += size
+        self.fetch_seconds += fetch_finished - fetch_started
+        self.wait_seconds += handle_started - wait_started
+        if previous_handle_started is not None:
+            # the fetch ran in parallel with handling the previous batch, from `fetch_started` until `wait_started`.
+            self.overlap_seconds += max(0.0, min(fetch_finished, wait_started) - max(fetch_started, previous_handle_started))
+        # end if
+        self.last_latency = max(0.0, handle_started - fetch_finished)
+    # end def
+
+    def as_dict(self):
+        return {
+            "batches": self.batches, "updates": self.updates, "errors": self.errors,
+            "fetch_seconds": self.fetch_seconds, "wait_seconds": self.wait_seconds,
+            "handle_seconds": self.handle_seconds, "overlap_seconds": self.overlap_seconds,
+            "last_latency": self.last_latency,
+        }
+    # end def
+
+    def __repr__(self):
+        return "{cls}({values})".format(
+            cls=self.__class__.__name__,
+            values=", ".join("{k}={v!r}".format(k=k, v=v) for k, v in self.as_dict().items()),
+        )
+    # end def
+# end class
+
+
+class _PollerBase(object):
+    def __init__(self, bot, poll_timeout=30, limit=100, allowed_updates=None, offset=None, error_delay=1.0):
+        """
+        :param bot: The bot to get the updates with.
+
+        :param poll_timeout: Timeout in seconds for long polling.
+                             Must be lower than the request timeout of the bot (`default_timeout`).
+        :type  poll_timeout: int
+
+        :param limit: How many updates to fetch at once, 1-100.
+        :type  limit: int
+
+        :param allowed_updates: The types of updates to receive, see `bot.get_updates(…)`.
+        :type  allowed_updates: None | list of str
+
+        :param offset: The update id to start with. `None` starts with the earliest unconfirmed update.
+        :type  offset: None | int
+
+        :param error_delay: How many seconds to wait before polling again after an error.
+        :type  error_delay: float
+        """
+        self.bot = bot
+        self.poll_timeout = poll_timeout
+        self.limit = limit
+        self.allowed_updates = allowed_updates
+        self.offset = offset
+        self.error_delay = error_delay
+        self.stats = PollingStats()
+        self._running = False
+    # end def
+
+    @property
+    def is_running(self):
+        return self._running
+    # end def
+
+    def stop(self):
+        """
+        Stops after the batch currently handled. The already prefetched batch is dropped,
+        but as it's offset was not confirmed yet, those updates will be delivered again to the next poll,
+        also when iterating this poller again.
+        """
+        self._running = False
+    # end def
+
+    def _process(self, result, offset):
+        """
+        Parses the raw `getUpdates` result.
+        `self.offset` is only advanced once the batch is actually yielded, so a batch dropped by :meth:`stop` is polled again.
+
+        :param offset: The offset the updates were requested with.
+        :type  offset: None | int
+
+        :return: list of updates, and the offset to request the next batch with.
+        :rtype: (list, None | int)
+        """
+        if isinstance(result, dict):  # `return_python_objects=False` gives the full response.
+            result = result.get('result') or []
+        # end if
+        updates = self.bot._get_updates__parse(result)
+        if updates:
+            last = updates[-1]
+            offset = (last['update_id'] if isinstance(last, dict) else last.update_id) + 1
+        # end if
+        return updates, offset
+    # end def
+# end class
+
+
+class PipelinedPoller(_PollerBase):
+    """
+    Long polls the updates of a :class:`pytgbot.bot.synchronous.SyncBot`, batch by batch.
+    As soon as a batch arrives, the next `getUpdates` with the advanced offset is already sent in a background thread,
+    while you handle the current batch. So the time spent in your handlers no longer adds to the latency of the next batch.
+
+        poller = PipelinedPoller(bot, poll_timeout=30)
+        for update in poller:
+            handle(update)
+        # end for
+        print(poller.stats)
+
+    Note that requesting the next batch confirms the current one to telegram,
+    so if the process is killed, the updates of the batch being handled are lost.
+    """
+
+    def _fetch(self, offset):
+        fetch_started = monotonic()
+        try:
+            result = self.bot._get_updates__make_request(
+                offset=offset, limit=self.limit, timeout=self.poll_timeout, allowed_updates=self.allowed_updates,
+            )
+            updates, next_offset = self._process(result, offset)
+        except Exception:
+            logger.warning("Fetching updates failed, will retry in {}s.".format(self.error_delay), exc_info=True)
+            self.stats.errors += 1
+            from time import sleep
+            sleep(self.error_delay)
+            updates, next_offset = [], offset
+        # end try
+        return updates, next_offset, fetch_started, monotonic()
+    # end def
+
+    def iter_batches(self):
+        """
+        Yields the lists of updates as they come in, never an empty one.
+        """
+        self._running = True
+        previous_handle_started = None
+        future = self._prefetch(self.offset)
+        try:
+            while self._running:
+                wait_started = monotonic()
+                updates, next_offset, fetch_started, fetch_finished = future.result()
+                if not self._running:
+                    break
+                # end if
+                # with the offset after this batch we can request the next one right away.
+                future = self._prefetch(next_offset)
+                if not updates:
+                    continue
+                # end if
+                self.offset = next_offset
+                handle_started = monotonic()
+                self.stats.add_batch(
+                    len(updates), fetch_started, fetch_finished, wait_started, handle_started,
+                    previous_handle_started,
+                )
+                previous_handle_started = handle_started
+                yield updates
+                self.stats.handle_seconds += monotonic() - handle_started
+            # end while
+        finally:
+            self._running = False
+            # don't wait for a running long poll, it's result isn't needed anymore.
+        # end try
+    # end def
+
+    def _prefetch(self, offset):
+        """
+        Runs :meth:`_fetch` in a daemon thread, so a long poll still running after we stopped doesn't keep the process alive.
+
+        :rtype: concurrent.futures.Future
+        """
+        from concurrent.futures import Future
+        from threading import Thread
+        future = Future()
+
+        def fetch():
+            try:
+                future.set_result(self._fetch(offset))
+            except BaseException as e:
+                future.set_exception(e)
+            # end try
+        # end def
+
+        Thread(target=fetch, name="pytgbot prefetch", daemon=True).start()
+        return future
+    # end def
+
+    def __iter__(self):
+        for updates in self.iter_batches():
+            for update in updates:
+                yield update
+            # end for
+        # end for
+    # end def
+# end class
+
+
+class AsyncPipelinedPoller(_PollerBase):
+    """
+    Long polls the updates of a :class:`pytgbot.bot.asynchronous.AsyncBot`, batch by batch,
+    with the next `getUpdates` request already running in a task while you handle the current batch.
+
+    See :class:`PipelinedPoller`.
+
+        poller = AsyncPipelinedPoller(bot, poll_timeout=30)
+        async for update in poller:
+            await handle(update)
+        # end for
+    """
+
+    async def _fetch(self, offset):
+        fetch_started = monotonic()
+        try:
+            result = await self.bot._get_updates__make_request(
+                offset=offset, limit=self.limit, timeout=self.poll_timeout, allowed_updates=self.allowed_updates,
+            )
+            updates, next_offset = self._process(result, offset)
+        except Exception:
+            logger.warning("Fetching updates failed, will retry in {}s.".format(self.error_delay), exc_info=True)
+            self.stats.errors += 1
+            from asyncio import sleep
+            await sleep(self.error_delay)
+            updates, next_offset = [], offset
+        # end try
+        return updates, next_offset, fetch_started, monotonic()
+    # end def
+
+    async def iter_batches(self):
+        """
+        Yields the lists of updates as they come in, never an empty one.
+        """
+        from asyncio import ensure_future
+        self._running = True
+        previous_handle_started = None
+        task = ensure_future(self._fetch(self.offset))
+        try:
+            while self._running:
+                wait_started = monotonic()
+                updates, next_offset, fetch_started, fetch_finished = await task
+                if not self._running:
+                    break
+                # end if
+                task = ensure_future(self._fetch(next_offset))
+                if not updates:
+                    continue
+                # end if
+                self.offset = next_offset
+                handle_started = monotonic()
+                self.stats.add_batch(
+                    len(updates), fetch_started, fetch_finished, wait_started, handle_started,
+                    previous_handle_started,
+                )
+                previous_handle_started = handle_started
+                yield updates
+                self.stats.handle_seconds += monotonic() - handle_started
+            # end while
+        finally:
+            self._running = False
+            task.cancel()
+        # end try
+    # end def
+
+    async def __aiter__(self):
+        async for updates in self.iter_batches():
+            for update in updates:
+                yield update
+            # end for
+        # end for
+    # end def
+# end class
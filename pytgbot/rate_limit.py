@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+import threading
+from time import monotonic
+
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = ["RateLimit", "RateScheduler", "is_rate_limited_command"]
+logger = logging.getLogger(__name__)
+
+
+# https://core.telegram.org/bots/faq#my-bot-is-hitting-limits-how-do-i-avoid-this
+GLOBAL_LIMIT = (30, 1.0)  # about 30 messages per second in total,
+PRIVATE_CHAT_LIMIT = (1, 1.0)  # one message per second in a single chat,
+GROUP_CHAT_LIMIT = (20, 60.0)  # and 20 messages per minute in the same group.
+
+# how many chats may be tracked before the ones with no pending limits are forgotten.
+PRUNE_CHATS_AFTER = 10000
+
+
+def is_rate_limited_command(command):
+    """
+    Whether the api command sends a message, and therefore counts towards the rate limits.
+
+    :param command: The api command, like `"sendMessage"`.
+    :type  command: str
+
+    :rtype: bool
+    """
+    return command.startswith(('send', 'forward', 'copy')) and command != 'sendChatAction'
+# end def
+
+
+class RateLimit(object):
+    """
+    Allows at most `amount` events in any `per` seconds long window.
+
+    It has `amount` slots, each of which can be used again `per` seconds after its last use.
+    Times are from `time.monotonic()`, so changing the wall clock doesn't matter.
+    """
+    __slots__ = ('per', 'free_at')
+
+    def __init__(self, amount, per):
+        """
+        :param amount: How many events are allowed …
+        :type  amount: int
+
+        :param per: … in this many seconds.
+        :type  per: float
+        """
+        if amount < 1 or per <= 0:
+            raise ValueError("Need a positive amount and duration.")
+        # end if
+        self.per = float(per)
+        self.free_at = [float('-inf')] * amount  # when each slot can be used again.
+    # end def
+
+    def earliest(self, now):
+        """
+        :return: The earliest time the next event is allowed.
+        :rtype: float
+        """
+        return max(now, min(self.free_at))
+    # end def
+
+    def take(self, at):
+        """
+        Records an event happening at `at`, which must not be before `earliest(…)`.
+        Uses the slot which became free last, keeping the earlier ones for other events.
+        """
+        index = max((i for i, free_at in enumerate(self.free_at) if free_at <= at), key=self.free_at.__getitem__)
+        self.free_at[index] = at + self.per
+    # end def
+
+    def block_until(self, at):
+        """
+        Makes sure no event happens before `at`, e.g. because telegram told us to wait.
+        """
+        self.free_at = [max(free_at, at) for free_at in self.free_at]
+    # end def
+
+    def is_idle(self, now):
+        """
+        :return: If all the slots are free, so the limit could be forgotten.
+        :rtype: bool
+        """
+        return max(self.free_at) <= now
+    # end def
+# end class
+
+
+class RateScheduler(object):
+    """
+    Schedules the message sending requests of a bot, so the limits of telegram are not exceeded:
+    About 30 messages per second in total, one per second in the same private chat, and 20 per minute in the same group.
+
+    Excess requests are not rejected, but queued: every call reserves the next free slot and waits for it,
+    so requests are sent in the order they came in.
+    This works for threads (`wait(…)`) and asyncio (`await wait_async(…)`) alike, even mixed.
+
+        bot = SyncBot(API_KEY, scheduler=RateScheduler())
+
+    Use :attr:`queue_depth` and :meth:`get_queue_depth` to see how many requests are currently waiting.
+    """
+
+    def __init__(
+        self, global_limit=GLOBAL_LIMIT, private_chat_limit=PRIVATE_CHAT_LIMIT, group_chat_limit=GROUP_CHAT_LIMIT,
+        clock=monotonic,
+    ):
+        """
+        All the limits are tuples of `(amount, per_seconds)`, or `None` to disable that limit.
+
+        :param global_limit: Limit of messages to all chats together.
+        :type  global_limit: None | tuple of (int, float)
+
+        :param private_chat_limit: Limit of messages to a single user.
+        :type  private_chat_limit: None | tuple of (int, float)
+
+        :param group_chat_limit: Limit of messages to a single group or channel.
+        :type  group_chat_limit: None | tuple of (int, float)
+
+        :param clock: Function returning the current time in seconds. Must never go backwards.
+        :type  clock: callable
+        """
+        self.global_limit = global_limit
+        self.private_chat_limit = private_chat_limit
+        self.group_chat_limit = group_chat_limit
+        self.clock = clock
+        self._global = RateLimit(*global_limit) if global_limit else None
+        self._chats = {}  # chat_id -> RateLimit
+        self._waiting = {}  # chat_id -> number of requests waiting
+        self._queue_depth = 0
+        self._lock = threading.Lock()
+    # end def
+
+    @property
+    def queue_depth(self):
+        """
+        The number of requests currently waiting for their slot.
+
+        :rtype: int
+        """
+        return self._queue_depth
+    # end def
+
+    def get_queue_depth(self, chat_id=None):
+        """
+        :param chat_id: The chat to get the number of waiting requests for. `None` counts all of them.
+        :type  chat_id: None | int | str
+
+        :rtype: int
+        """
+        if chat_id is None:
+            return self._queue_depth
+        # end if
+        return self._waiting.get(chat_id, 0)
+    # end def
+
+    def get_chat_limit(self, chat_id):
+        """
+        :return: The `(amount, per_seconds)` limit for that chat, or `None` for no limit.
+                 Positive ids are private chats with users, negative ids and `@username`s are groups and channels.
+        :rtype: None | tuple of (int, float)
+        """
+        if chat_id is None:
+            return None
+        # end if
+        if isinstance(chat_id, int) and chat_id > 0:
+            return self.private_chat_limit
+        # end if
+        return self.group_chat_limit
+    # end def
+
+    def reserve(self, command, chat_id=None):
+        """
+        Reserves the next free slot for that request, and counts it as queued.
+        You have to call :meth:`release` after waiting for it.
+
+        :return: The delay in seconds until the request may be sent, or `None` if it is not limited.
+        :rtype: None | float
+        """
+        if not is_rate_limited_command(command):
+            return None
+        # end if
+        with self._lock:
+            now = self.clock()
+            chat_limit = self._get_chat(chat_id, now)
+            at = now
+            if self._global is not None:
+                at = self._global.earliest(at)
+            # end if
+            if chat_limit is not None:
+                at = chat_limit.earliest(at)
+            # end if
+            if self._global is not None:
+                self._global.take(at)
+            # end if
+            if chat_limit is not None:
+                chat_limit.take(at)
+            # end if
+            self._queue_depth += 1
+            self._waiting[chat_id] = self._waiting.get(chat_id, 0) + 1
+        # end with
+        return at - now
+    # end def
+
+    def release(self, chat_id=None):
+        """
+        Marks a request reserved with :meth:`reserve` as no longer waiting.
+        """
+        with self._lock:
+            self._queue_depth -= 1
+            waiting = self._waiting.get(chat_id, 0) - 1
+            if waiting > 0:
+                self._waiting[chat_id] = waiting
+            else:
+                self._waiting.pop(chat_id, None)
+            # end if
+        # end with
+    # end def
+
+    def pause(self, chat_id, seconds):
+        """
+        Holds back all requests to that chat for the given time, e.g. after telegram answered with a `retry_after`.
+        Requests to other chats are not affected.
+
+        :param chat_id: The chat to pause.
+        :type  chat_id: int | str
+
+        :param seconds: How long to pause.
+        :type  seconds: float
+
+        :return: If the chat could be paused. `False` if that chat has no limit, so the scheduler doesn't hold it back.
+        :rtype: bool
+        """
+        with self._lock:
+            now = self.clock()
+            chat_limit = self._get_chat(chat_id, now)
+            if chat_limit is None:
+                return False
+            # end if
+            chat_limit.block_until(now + seconds)
+        # end with
+        return True
+    # end def
+
+    def wait(self, command, chat_id=None):
+        """
+        Blocks until the request may be sent.
+
+        :param command: The api command, like `"sendMessage"`. Only commands sending messages are limited.
+        :type  command: str
+
+        :param chat_id: The chat the request goes to.
+        :type  chat_id: None | int | str
+        """
+        delay = self.reserve(command, chat_id)
+        if delay is None:
+            return
+        # end if
+        try:
+            if delay > 0:
+                logger.debug("Rate limit: waiting {d:.3f}s to {cmd} to {chat!r}.".format(d=delay, cmd=command, chat=chat_id))
+                from time import sleep
+                sleep(delay)
+            # end if
+        finally:
+            self.release(chat_id)
+        # end try
+    # end def
+
+    async def wait_async(self, command, chat_id=None):
+        """
+        Like :meth:`wait`, but waits with `asyncio.sleep`, not blocking the event loop.
+        """
+        delay = self.reserve(command, chat_id)
+        if delay is None:
+            return
+        # end if
+        try:
+            if delay > 0:
+                logger.debug("Rate limit: waiting {d:.3f}s to {cmd} to {chat!r}.".format(d=delay, cmd=command, chat=chat_id))
+                from asyncio import sleep
+                await sleep(delay)
+            # end if
+        finally:
+            self.release(chat_id)
+        # end try
+    # end def
+
+    def _get_chat(self, chat_id, now):
+        """
+        Must be called holding the lock.
+
+        :rtype: None | RateLimit
+        """
+        limit = self.get_chat_limit(chat_id)
+        if limit is None:
+            return None
+        # end if
+        chat = self._chats.get(chat_id)
+        if chat is None:
+            if len(self._chats) >= PRUNE_CHATS_AFTER:
+                self._prune(now)
+            # end if
+            chat = self._chats[chat_id] = RateLimit(*limit)
+        # end if
+        return chat
+    # end def
+
+    def _prune(self, now):
+        """
+        Forgets the chats which are back to a clean state anyway. Must be called holding the lock.
+        """
+        for chat_id in [chat_id for chat_id, limit in self._chats.items() if limit.is_idle(now)]:
+            del self._chats[chat_id]
+        # end for
+    # end def
+# end class
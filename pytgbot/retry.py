@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+import random
+
+from luckydonaldUtils.logger import logging
+
+from .exceptions import TgApiServerException, TgApiResponseException
+from .rate_limit import is_rate_limited_command
+
+__author__ = 'luckydonald'
+__all__ = ["RetryPolicy", "is_idempotent_command"]
+logger = logging.getLogger(__name__)
+
+
+FLOOD_ERROR_CODE = 429  # Too Many Requests: retry after X
+
+
+def is_idempotent_command(command):
+    """
+    Whether doing the api command twice does no harm, so it can be retried even if we don't know if it got through.
+    That's all the `get…` and `set…` commands, except `getUpdates`, which handles errors itself.
+
+    :param command: The api command, like `"getChat"`.
+    :type  command: str
+
+    :rtype: bool
+    """
+    return command.startswith(('get', 'set')) and command != 'getUpdates'
+# end def
+
+
+def get_error_info(error):
+    """
+    Extracts the interesting bits of a failed request.
+
+    :param error: The exception raised, or for `return_python_objects=False` the response with `"ok": false`.
+    :type  error: Exception | dict
+
+    :return: tuple of (error code, http status code, retry after, migrate to chat id), each of which could be `None`.
+    :rtype: tuple of (int|None, int|None, int|None, int|None)
+    """
+    if isinstance(error, dict):
+        parameters = error.get('parameters') or {}
+        return error.get('error_code'), None, parameters.get('retry_after'), parameters.get('migrate_to_chat_id')
+    # end if
+    if isinstance(error, TgApiServerException):
+        status_code = getattr(error.response, 'status_code', None)
+        return error.error_code, status_code, error.retry_after, error.migrate_to_chat_id
+    # end if
+    if isinstance(error, TgApiResponseException):
+        return None, error.status_code, None, None
+    # end if
+    return None, None, None, None
+# end def
+
+
+class RetryPolicy(object):
+    """
+    Decides if and when a failed request is sent again. Give it to the bot, and `bot.do(…)` uses it for every request:
+
+        bot = SyncBot(API_KEY, retry=RetryPolicy(), scheduler=RateScheduler())
+
+    - Flood control (error 429): Waits the `retry_after` telegram sent, and tries again.
+      If the bot has a :class:`pytgbot.rate_limit.RateScheduler`, only that chat is paused,
+      so other chats continue to get their messages in the meantime.
+    - Migrated groups: The request is sent again to the new supergroup (`migrate_to_chat_id`).
+    - Server errors (5xx) and network errors: Tried again with exponential backoff and jitter,
+      but only for idempotent commands (see :func:`is_idempotent_command`),
+      as we don't know if e.g. a message was already sent.
+    """
+
+    def __init__(
+        self, max_retries=5, backoff_base=0.5, backoff_max=30.0, max_retry_after=None, follow_migration=True,
+        is_idempotent=is_idempotent_command,
+    ):
+        """
+        :param max_retries: How often a single request is tried again at most.
+        :type  max_retries: int
+
+        :param backoff_base: The maximum delay in seconds of the first retry. It doubles with every further retry.
+        :type  backoff_base: float
+
+        :param backoff_max: The upper limit of the backoff delay in seconds.
+        :type  backoff_max: float
+
+        :param max_retry_after: If telegram wants us to wait longer than this many seconds, we give up instead.
+                                `None` always waits.
+        :type  max_retry_after: None | float
+
+        :param follow_migration: If requests to a group migrated to a supergroup should be sent to the supergroup.
+        :type  follow_migration: bool
+
+        :param is_idempotent: Function telling if a command may be retried after server or network errors.
+        :type  is_idempotent: callable
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+        self.follow_migration = follow_migration
+        self.is_idempotent = is_idempotent
+    # end def
+
+    def get_backoff(self, attempt):
+        """
+        The "full jitter" exponential backoff: A random delay between 0 and `backoff_base * 2^attempt`.
+
+        :param attempt: The number of retries done so far.
+        :type  attempt: int
+
+        :rtype: float
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+    # end def
+
+    def get_delay(self, command, query, error, attempt, network_error=False, scheduler=None):
+        """
+        Decides if a failed request should be retried.
+        A migrated `chat_id` is changed in `query` directly.
+
+        :param command: The api command, like `"sendMessage"`.
+        :type  command: str
+
+        :param query: The parameters of the request.
+        :type  query: dict
+
+        :param error: The exception raised, or for `return_python_objects=False` the response with `"ok": false`.
+        :type  error: Exception | dict
+
+        :param attempt: The number of retries done so far.
+        :type  attempt: int
+
+        :param network_error: If the error is a connection problem or timeout of the http library.
+        :type  network_error: bool
+
+        :param scheduler: The scheduler of the bot, to pause only the affected chat.
+        :type  scheduler: None | pytgbot.rate_limit.RateScheduler
+
+        :return: The seconds to wait before sending the request again, or `None` to not retry.
+        :rtype: None | float
+        """
+        if attempt >= self.max_retries:
+            return None
+        # end if
+        error_code, status_code, retry_after, migrate_to_chat_id = get_error_info(error)
+        chat_id = query.get('chat_id')
+        if error_code == FLOOD_ERROR_CODE or status_code == FLOOD_ERROR_CODE:
+            retry_after = retry_after if retry_after is not None else self.get_backoff(attempt)
+            if self.max_retry_after is not None and retry_after > self.max_retry_after:
+                return None
+            # end if
+            logger.warning("Flood control on {cmd} to {chat!r}, retrying in {s}s.".format(
+                cmd=command, chat=chat_id, s=retry_after,
+            ))
+            if scheduler is not None and chat_id is not None and scheduler.pause(chat_id, retry_after) and is_rate_limited_command(command):
+                return 0.0  # the scheduler will hold back the request, together with all the others to that chat.
+            # end if
+            return retry_after
+        # end if
+        if migrate_to_chat_id is not None and self.follow_migration and chat_id is not None:
+            logger.info("Chat {old!r} was migrated to {new!r}, retrying {cmd} there.".format(
+                old=chat_id, new=migrate_to_chat_id, cmd=command,
+            ))
+            query['chat_id'] = migrate_to_chat_id
+            return 0.0
+        # end if
+        server_error = any(code is not None and code >= 500 for code in (error_code, status_code))
+        if (server_error or network_error) and self.is_idempotent(command):
+            delay = self.get_backoff(attempt)
+            logger.warning("Request {cmd} failed, retrying in {s:.2f}s: {e!s}".format(cmd=command, s=delay, e=error))
+            return delay
+        # end if
+        return None
+    # end def
+# end class
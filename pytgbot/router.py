@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = ["UpdateRouter", "get_update_type", "get_message_content_type", "get_message_command", "MESSAGE_UPDATE_TYPES", "MESSAGE_CONTENT_TYPES"]
+logger = logging.getLogger(__name__)
+
+
+# update types containing a `Message`, which can be routed by content type and command too.
+MESSAGE_UPDATE_TYPES = frozenset(("message", "edited_message", "channel_post", "edited_channel_post"))
+
+# the fields holding the content of a message, most specific first:
+# Animations are also sent as `document`, and venues also have a `location`.
+MESSAGE_CONTENT_TYPES = (
+    "text", "animation", "audio", "document", "photo", "sticker", "video", "video_note", "voice",
+    "contact", "dice", "game", "poll", "venue", "location", "invoice", "successful_payment", "passport_data",
+    "new_chat_members", "left_chat_member", "new_chat_title", "new_chat_photo", "delete_chat_photo",
+    "group_chat_created", "supergroup_chat_created", "channel_chat_created", "message_auto_delete_timer_changed",
+    "migrate_to_chat_id", "migrate_from_chat_id", "pinned_message", "connected_website", "proximity_alert_triggered",
+    "voice_chat_scheduled", "voice_chat_started", "voice_chat_ended", "voice_chat_participants_invited",
+)
+_CONTENT_TYPE_ORDER = {content_type: i for i, content_type in enumerate(MESSAGE_CONTENT_TYPES)}
+
+
+def get_update_type(update):
+    """
+    Returns the type of an update, like `"message"` or `"callback_query"`.
+
+    Works with both :class:`pytgbot.api_types.receivable.updates.Update` objects (see `update.update_type`)
+    and the plain json dicts you get with `return_python_objects=False`.
+
+    :param update: The update
+    :type  update: pytgbot.api_types.receivable.updates.Update | dict
+
+    :rtype: str | None
+    """
+    if isinstance(update, dict):
+        for key in update:
+            if key != 'update_id':
+                return key
+            # end if
+        # end for
+        return None
+    # end if
+    return update.update_type
+# end def
+
+
+def get_message_content_type(message):
+    """
+    Returns the content type of a message, that's the name of the field holding the content, like `"text"` or `"photo"`.
+    For received messages only the keys of the data they were parsed from are looked at, not every field.
+
+    :param message: The message
+    :type  message: pytgbot.api_types.receivable.updates.Message | dict
+
+    :return: The content type, or `None` for an unknown one.
+    :rtype: str | None
+    """
+    keys = message if isinstance(message, dict) else message._raw
+    if keys:
+        found = None
+        for key in keys:
+            order = _CONTENT_TYPE_ORDER.get(key)
+            if order is not None and (found is None or order < found):
+                found = order
+            # end if
+        # end for
+        return MESSAGE_CONTENT_TYPES[found] if found is not None else None
+    # end if
+    for content_type in MESSAGE_CONTENT_TYPES:
+        if getattr(message, content_type, None) is not None:
+            return content_type
+        # end if
+    # end for
+    return None
+# end def
+
+
+def get_message_command(message, bot_username=None):
+    """
+    Returns the command of a message, like `"start"` for `/start` or `/Start@ExampleBot foo`.
+
+    :param message: The message
+    :type  message: pytgbot.api_types.receivable.updates.Message | dict
+
+    :param bot_username: The username of the bot. If given, commands addressed to other bots (`/start@OtherBot`) are ignored.
+    :type  bot_username: str | None
+
+    :return: The command in lower case, without the `/`. `None` if the text isn't a command.
+    :rtype: str | None
+    """
+    text = message.get('text') if isinstance(message, dict) else message.text
+    if not text or text[0] != '/' or len(text) == 1 or text[1].isspace():
+        return None
+    # end if
+    command, _, username = text[1:].split(None, 1)[0].partition('@')
+    if username and bot_username and username.lower() != bot_username.lower():
+        return None
+    # end if
+    return command.lower()
+# end def
+
+
+class UpdateRouter(object):
+    """
+    Calls the handler registered for an update.
+    The handler is found with a few dictionary lookups, by the update type (`"callback_query"`, …),
+    and for messages the command (`/start`) and content type (`"text"`, `"photo"`, …).
+    So it takes the same time with 3 or 300 handlers, unlike a chain of `if "callback_query" in update: …` checks.
+
+    The most specific handler wins: a command handler before a content type handler before an update type handler.
+    If there's none, the `default` handler is called, if any.
+
+        router = UpdateRouter(bot_username='ExampleBot')
+
+        @router.command('start')
+        def start(update):
+            ...
+        # end def
+
+        @router.on('message', content_type='photo')
+        def photo(update):
+            ...
+        # end def
+
+        @router.on('callback_query')
+        def button(update):
+            ...
+        # end def
+
+        UpdateDispatcher(bot, router).run()  # calling the router routes the update.
+
+    Handlers can be coroutine functions too, the router returns whatever the handler returns.
+    So it works with the :class:`pytgbot.dispatcher.AsyncUpdateDispatcher` as well.
+    """
+
+    def __init__(self, default=None, bot_username=None):
+        """
+        :param default: Handler for updates without any other handler. `None` ignores those.
+        :type  default: None | callable
+
+        :param bot_username: The username of the bot, to ignore commands for other bots, like `/start@OtherBot`.
+        :type  bot_username: None | str
+        """
+        self.default = default
+        self.bot_username = bot_username
+        self._by_update_type = {}  # update_type: handler
+        self._by_content_type = {}  # (update_type, content_type): handler
+        self._by_command = {}  # (update_type, command): handler
+    # end def __init__
+
+    def add_handler(self, handler, update_type, content_type=None, command=None):
+        """
+        Registers a handler, replacing the one registered for the same thing before.
+
+        :param handler: Function called with the update.
+        :type  handler: callable
+
+        :param update_type: The type of update, like `"message"`, see :attr:`pytgbot.api_types.receivable.updates.Update.update_type`.
+        :type  update_type: str
+
+        :param content_type: Only messages with that content, like `"text"` or `"photo"`, see :data:`MESSAGE_CONTENT_TYPES`.
+        :type  content_type: None | str
+
+        :param command: Only messages with that command, like `"start"` for `/start`.
+        :type  command: None | str
+        """
+        if (content_type is not None or command is not None) and update_type not in MESSAGE_UPDATE_TYPES:
+            raise ValueError("{update_type!r} updates have no messages to check the content type or command of.".format(update_type=update_type))
+        # end if
+        if content_type is not None and content_type not in _CONTENT_TYPE_ORDER:
+            raise ValueError("Unknown content_type {content_type!r}, must be one of {types!r}.".format(content_type=content_type, types=MESSAGE_CONTENT_TYPES))
+        # end if
+        if command is not None:
+            self._by_command[(update_type, command.lstrip('/').lower())] = handler
+        elif content_type is not None:
+            self._by_content_type[(update_type, content_type)] = handler
+        else:
+            self._by_update_type[update_type] = handler
+        # end if
+    # end def
+
+    def on(self, update_type, content_type=None, command=None):
+        """
+        Decorator registering a handler, see :meth:`add_handler`.
+
+            @router.on('message', content_type='sticker')
+            def sticker(update):
+                ...
+            # end def
+        """
+        def decorator(handler):
+            self.add_handler(handler, update_type, content_type=content_type, command=command)
+            return handler
+        # end def
+        return decorator
+    # end def
+
+    def command(self, command, update_type='message'):
+        """
+        Decorator registering a handler for a command, see :meth:`add_handler`.
+
+            @router.command('start')
+            def start(update):
+                ...
+            # end def
+        """
+        return self.on(update_type, command=command)
+    # end def
+
+    def get_handler(self, update):
+        """
+        :return: The handler for this update, or `default` if there's none.
+        :rtype: None | callable
+        """
+        update_type = get_update_type(update)
+        if update_type in MESSAGE_UPDATE_TYPES and (self._by_command or self._by_content_type):
+            message = update[update_type] if isinstance(update, dict) else getattr(update, update_type)
+            if self._by_command:
+                command = get_message_command(message, self.bot_username)
+                if command is not None:
+                    handler = self._by_command.get((update_type, command))
+                    if handler is not None:
+                        return handler
+                    # end if
+                # end if
+            # end if
+            if self._by_content_type:
+                handler = self._by_content_type.get((update_type, get_message_content_type(message)))
+                if handler is not None:
+                    return handler
+                # end if
+            # end if
+        # end if
+        return self._by_update_type.get(update_type, self.default)
+    # end def
+
+    def __call__(self, update):
+        """
+        Calls the handler for this update, see :meth:`get_handler`.
+
+        :return: What the handler returned, or `None` if there was none.
+        """
+        handler = self.get_handler(update)
+        if handler is None:
+            if logger.isEnabledFor(logging.DEBUG):  # unhandled updates can be most of them.
+                logger.debug("No handler for update {id!r}.".format(id=update['update_id'] if isinstance(update, dict) else update.update_id))
+            # end if
+            return None
+        # end if
+        return handler(update)
+    # end def
+# end class
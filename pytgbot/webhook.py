@@ -29,16 +29,14 @@ class Webhook(Bot):
         """
         from luckydonaldUtils.encoding import to_native as n
         from pytgbot.api_types.sendable import Sendable
-        from pytgbot.api_types import as_array
         from DictObject import DictObject
-        import json
 
         params = {}
         for key in query.keys():
             element = query[key]
             if element is not None:
                 if isinstance(element, Sendable):
-                    params[key] = json.dumps(as_array(element))
+                    params[key] = self._encode_json(element)
                 else:
                     params[key] = element
         url = self._base_url.format(api_key=n(self.api_key), command=n(command))
@@ -60,6 +60,7 @@ setup(
     extras_require={
       'sync': sync_requirements,
       'async': ["httpx", "async-property"],
+      'orjson': ["orjson"],
       'dev': ["luckydonaldUtils>=0.77"],
     },
     # If there are data files included in your packages that need to be
@@ -0,0 +1,77 @@
+import json
+import os
+import unittest
+
+from pytgbot.api_types import lazy_parsing
+from pytgbot.api_types.receivable.media import MessageEntity
+from pytgbot.api_types.receivable.updates import Update, Message
+from pytgbot.api_types.sendable.reply_markup import InlineKeyboardButton
+
+
+with open(os.path.join(os.path.dirname(__file__), '..', 'data', 'updates.json'), 'r') as f:
+    UPDATES = json.load(f)
+# end with
+
+
+class ContainsTestCase(unittest.TestCase):
+    def test_update(self):
+        update = Update.from_array(UPDATES[0])
+        self.assertIn('message', update)
+        self.assertIn('update_id', update)
+        self.assertNotIn('edited_message', update)
+        self.assertNotIn('callback_query', Update.from_array(UPDATES[4]))
+        self.assertIn('edited_message', Update.from_array(UPDATES[4]))
+    # end def
+
+    def test_unknown(self):
+        message = Update.from_array(UPDATES[0]).message
+        self.assertNotIn('nope', message)
+        self.assertNotIn('_raw', message, 'not a field')
+        self.assertNotIn('to_array', message)
+        self.assertNotIn(None, message)
+    # end def
+
+    def test_falsy(self):
+        self.assertNotIn('offset', MessageEntity('bold', 0, 2))
+        self.assertIn('length', MessageEntity('bold', 0, 2))
+        self.assertNotIn('text', Message.from_array({"message_id": 1, "date": 0, "chat": {"id": 1234, "type": "private"}, "text": ""}))
+        self.assertNotIn('callback_data', InlineKeyboardButton('text'))
+    # end def
+
+    def test_renamed(self):
+        message = Update.from_array(UPDATES[0]).message
+        self.assertIn('from_peer', message)
+        self.assertNotIn('from', message, 'the python name')
+        self.assertEqual(Message._api_names, {'from_peer': 'from'})
+        self.assertEqual(Update._api_names, {})
+    # end def
+
+    def test_lazy(self):
+        for data in UPDATES:
+            with lazy_parsing():
+                lazy = Update.from_array(data)
+            # end with
+            update = Update.from_array(data)
+            self.assertEqual([key for key in Update._fields if key in lazy], [key for key in Update._fields if key in update])
+            self.assertTrue(lazy._lazy, 'not parsed for that')
+        # end for
+        with lazy_parsing():
+            message = Message.from_array(UPDATES[0]['message'])
+        # end with
+        self.assertIn('from_peer', message)
+        self.assertNotIn('from', message)
+        self.assertTrue(message._lazy)
+    # end def
+
+    def test_field_set(self):
+        for clazz in (Update, Message, MessageEntity, InlineKeyboardButton):
+            self.assertIsInstance(clazz._field_set, frozenset)
+            self.assertEqual(clazz._field_set, frozenset(clazz._fields))
+        # end for
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
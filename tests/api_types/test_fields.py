@@ -0,0 +1,81 @@
+import importlib
+import inspect
+import pkgutil
+import unittest
+
+from pytgbot.api_types import TgBotApiObject, lazy_parsing, _get_field_names
+from pytgbot.api_types.receivable.media import MessageEntity
+from pytgbot.api_types.receivable.updates import Message
+from pytgbot.api_types.sendable.input_media import InputMediaPhoto
+
+
+def all_api_types():
+    for package in ('receivable', 'sendable'):
+        package = importlib.import_module('pytgbot.api_types.' + package)
+        for module in pkgutil.iter_modules(package.__path__):
+            module = importlib.import_module(package.__name__ + '.' + module.name)
+            for clazz in vars(module).values():
+                if inspect.isclass(clazz) and issubclass(clazz, TgBotApiObject) and clazz.__module__ == module.__name__:
+                    yield clazz
+                # end if
+            # end for
+        # end for
+    # end for
+# end def
+
+
+class FieldsTestCase(unittest.TestCase):
+    def test_fields(self):
+        self.assertEqual(MessageEntity._fields, ('type', 'offset', 'length', 'url', 'user', 'language'))
+        self.assertEqual(InputMediaPhoto._fields, ('type', 'media', 'caption', 'parse_mode', 'caption_entities'), 'with the ones of the parent')
+        for clazz in all_api_types():
+            self.assertEqual(set(clazz._fields) - set(_get_field_names(clazz)), set(), clazz.__name__)
+        # end for
+    # end def
+
+    def test_array_fields(self):
+        for clazz in all_api_types():
+            if '_array_fields' in vars(clazz):
+                self.assertEqual(tuple(key for key, _, _, _ in clazz._array_fields), clazz._fields, clazz.__name__)
+                self.assertNotIn('to_array', vars(clazz), 'uses the shared one: ' + clazz.__name__)
+            # end if
+        # end for
+        self.assertIn('to_array', vars(InputMediaPhoto), 'media can be a file or a string, that one is still generated')
+    # end def
+
+    def test_to_array(self):
+        message = Message.from_array({
+            "message_id": 1, "date": 0, "chat": {"id": 1234, "type": "private"}, "from": {"id": 1234, "is_bot": False, "first_name": "a"},
+            "text": "/start", "entities": [{"type": "bot_command", "offset": 0, "length": 6}],
+        })
+        message.text = "/stop"
+        self.assertEqual(message.to_array(), {
+            "message_id": 1, "date": 0, "chat": {"id": 1234, "type": "private"}, "from": {"id": 1234, "is_bot": False, "first_name": "a"},
+            "text": "/stop", "entities": [{"type": "bot_command", "offset": 0, "length": 6}],
+        })
+        self.assertEqual(list(MessageEntity('bold', 0, 4).to_array()), ['type', 'offset', 'length'], 'in api order, without the unset ones')
+    # end def
+
+    def test_str(self):
+        entity = MessageEntity('bold', 0, 4)
+        self.assertEqual(str(entity), "MessageEntity(type='bold', offset=0, length=4, url=None, user=None, language=None)")
+        self.assertEqual(repr(entity), str(entity))
+        self.assertEqual(str(InputMediaPhoto('file-id')), "InputMediaPhoto(type='photo', media='file-id', caption=None, parse_mode=None, caption_entities=None)")
+    # end def
+
+    def test_repr(self):
+        data = {"type": "bold", "offset": 0, "length": 4}
+        self.assertEqual(repr(MessageEntity.from_array(data)), "MessageEntity.from_array({'type': 'bold', 'offset': 0, 'length': 4})")
+        with lazy_parsing():
+            message = Message.from_array({"message_id": 1, "date": 0, "chat": {"id": 1234, "type": "private"}})
+        # end with
+        self.assertEqual(repr(message), "Message.from_array({'message_id': 1, 'date': 0, 'chat': {'id': 1234, 'type': 'private'}})")
+        self.assertTrue(message._lazy, 'not parsed for that')
+        self.assertIn("chat=Chat.from_array({'id': 1234, 'type': 'private'})", str(message))
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
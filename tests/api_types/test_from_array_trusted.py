@@ -0,0 +1,117 @@
+import inspect
+import json
+import os
+import re
+import unittest
+from unittest import mock
+
+from pytgbot.api_types import TgBotApiObject, validation_mode, VALIDATION_TRUSTED
+from pytgbot.api_types.receivable import game, inline, media, passport, payments, peer, responses, service, stickers, updates
+from pytgbot.api_types.receivable.media import Location
+from pytgbot.api_types.receivable.peer import User
+from pytgbot.api_types.receivable.updates import Update
+
+
+MODULES = [game, inline, media, passport, payments, peer, responses, service, stickers, updates]
+with open(os.path.join(os.path.dirname(__file__), '..', 'data', 'updates.json'), 'r') as f:
+    UPDATES = json.load(f)
+# end with
+
+
+def get_fields(obj):
+    """
+    All the values of an object, and of the objects (and lists) in there, as `{path: (type, value)}`.
+    """
+    fields = {}
+    for cls in type(obj).__mro__:
+        for name in cls.__dict__.get('__slots__', ()):
+            if name not in ('_lazy', '_changed', '_json'):
+                fields.update(get_values(name, getattr(obj, name)))
+            # end if
+        # end for
+    # end for
+    return fields
+# end def
+
+
+def get_values(path, value):
+    if isinstance(value, TgBotApiObject):
+        return {path + '.' + key: field for key, field in get_fields(value).items()}
+    # end if
+    if isinstance(value, list):
+        values = {path: (list, len(value))}
+        for i, item in enumerate(value):
+            values.update(get_values('{}[{}]'.format(path, i), item))
+        # end for
+        return values
+    # end if
+    return {path: (type(value), value)}
+# end def
+
+
+class FromArrayTrustedTestCase(unittest.TestCase):
+    def test_same_objects(self):
+        for data in UPDATES:
+            expected = Update.from_array(data)
+            with validation_mode(VALIDATION_TRUSTED):
+                update = Update.from_array(data)
+            # end with
+            self.assertEqual(get_fields(update), get_fields(expected), data['update_id'])
+            self.assertEqual(update.to_array(), data)
+            self.assertIs(update._raw, data)
+        # end for
+    # end def
+
+    def test_single_pass(self):
+        with mock.patch.object(User, 'validate_array') as validate_array:
+            with validation_mode(VALIDATION_TRUSTED):
+                user = User.from_array({"id": 1234, "is_bot": False, "first_name": "Test"})
+            # end with
+        # end with
+        validate_array.assert_not_called()
+        self.assertEqual(str(user), str(User(id=1234, is_bot=False, first_name="Test")))
+    # end def
+
+    def test_converted(self):
+        with validation_mode(VALIDATION_TRUSTED):
+            location = Location.from_array({"longitude": 13, "latitude": 52.5})
+        # end with
+        self.assertIsInstance(location.longitude, float)
+        self.assertIsNone(location.horizontal_accuracy)
+    # end def
+
+    def test_set_attribute(self):
+        data = {"id": 1234, "is_bot": False, "first_name": "Test"}
+        with validation_mode(VALIDATION_TRUSTED):
+            user = User.from_array(data)
+        # end with
+        user.first_name = "Changed"
+        self.assertIsNone(user._raw)
+        self.assertEqual(user.to_array(prefer_original=True)['first_name'], "Changed")
+    # end def
+
+    def test_all_fields_set(self):
+        """
+        The single pass parsers must set all the fields the constructor sets.
+        """
+        count = 0
+        for module in MODULES:
+            for name, cls in vars(module).items():
+                if not (inspect.isclass(cls) and cls.__module__ == module.__name__ and '_from_array_trusted' in vars(cls)):
+                    continue
+                # end if
+                source = inspect.getsource(cls._from_array_trusted)
+                fields = set(re.findall(r"set_field\(instance, '(\w+)'", source))
+                expected = {field for parent in cls.__mro__ for field in vars(parent).get('__slots__', ())} - {'_lazy', '_changed'}
+                self.assertEqual(fields, expected, name)
+                count += 1
+            # end for
+        # end for
+        self.assertGreater(count, 50)
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
@@ -0,0 +1,143 @@
+import json
+import unittest
+from urllib.parse import urlparse, parse_qs
+
+from pytgbot.api_types import as_array, lazy_parsing, validation_mode, VALIDATION_TRUSTED
+from pytgbot.api_types.receivable.media import MessageEntity
+from pytgbot.api_types.receivable.updates import Message
+from pytgbot.api_types.sendable.reply_markup import InlineKeyboardButton
+from pytgbot.bot.synchronous import SyncBot
+from tests.fake_api_server import FakeApiServer
+
+
+def get_message():
+    return {
+        "message_id": 1, "date": 0, "chat": {"id": 1234, "type": "private"}, "text": "Hi there",
+        "entities": [{"type": "bold", "offset": 0, "length": 2}],
+        "reply_markup": {"inline_keyboard": [[{"text": "👍", "callback_data": "vote:up"}]]},
+    }
+# end def
+
+
+class PreferOriginalTestCase(unittest.TestCase):
+    def test_unmodified(self):
+        data = get_message()
+        message = Message.from_array(data)
+        self.assertTrue(message._is_unmodified())
+        self.assertIs(message.to_array(prefer_original=True), data)
+        self.assertIs(as_array(message, prefer_original=True), data)
+        self.assertIsNot(as_array(message), data)
+        self.assertEqual(as_array(message), data)
+        entities = as_array(message.entities, prefer_original=True)
+        self.assertIs(entities[0], data['entities'][0])
+    # end def
+
+    def test_set_field(self):
+        data = get_message()
+        message = Message.from_array(data)
+        message.text = "Bye there"
+        self.assertIsNone(message._raw)
+        self.assertEqual(as_array(message, prefer_original=True)['text'], "Bye there")
+        self.assertEqual(data['text'], "Hi there", 'the original stays as it was')
+    # end def
+
+    def test_nested_change(self):
+        data = get_message()
+        message = Message.from_array(data)
+        message.reply_markup.inline_keyboard[0][0].text = "👎"
+        self.assertFalse(message._is_unmodified())
+        self.assertIsNotNone(message._raw)
+        self.assertEqual(message.to_array(prefer_original=True)['reply_markup']['inline_keyboard'][0][0]['text'], "👎")
+        self.assertEqual(as_array(message, prefer_original=True)['reply_markup']['inline_keyboard'][0][0]['text'], "👎")
+        self.assertEqual(data['reply_markup']['inline_keyboard'][0][0]['text'], "👍")
+    # end def
+
+    def test_list_changed_in_place(self):
+        for mode in ('strict', 'trusted', 'lazy'):
+            data = get_message()
+            data['reply_markup']['inline_keyboard'].append([{"text": "👎", "callback_data": "vote:down"}])
+            with lazy_parsing() if mode == 'lazy' else validation_mode(VALIDATION_TRUSTED if mode == 'trusted' else 'strict'):
+                markup = Message.from_array(data).reply_markup
+            # end with
+            self.assertTrue(markup._is_unmodified(), mode)
+            markup.inline_keyboard.pop()  # removing the button clicked
+            self.assertFalse(markup._is_unmodified(), mode)
+            self.assertEqual(len(as_array(markup, prefer_original=True)['inline_keyboard']), 1, mode)
+            self.assertEqual(len(json.loads(markup.to_json(prefer_original=True))['inline_keyboard']), 1, mode)
+            markup.inline_keyboard[0].append(InlineKeyboardButton("🤷", callback_data="vote:meh"))
+            self.assertEqual(as_array(markup, prefer_original=True)['inline_keyboard'][0][1]['text'], "🤷", mode)
+            markup.inline_keyboard[0].reverse()
+            self.assertEqual(as_array(markup, prefer_original=True)['inline_keyboard'][0][0]['text'], "🤷", mode)
+            self.assertEqual(len(data['reply_markup']['inline_keyboard']), 2, 'the original stays as it was')
+        # end for
+    # end def
+
+    def test_bot_edits_keyboard(self):
+        data = get_message()
+        data['reply_markup']['inline_keyboard'].append([{"text": "👎", "callback_data": "vote:down"}])
+        markup = Message.from_array(data).reply_markup
+        markup.inline_keyboard.pop()
+        bot = SyncBot('123:ABC')
+        self.assertTrue(bot.prefer_original)
+        _, params, _ = bot._prepare_request('editMessageReplyMarkup', {'chat_id': 1234, 'message_id': 1, 'reply_markup': markup})
+        self.assertEqual(json.loads(params['reply_markup']), {"inline_keyboard": [[{"text": "👍", "callback_data": "vote:up"}]]})
+    # end def
+
+    def test_nested_unchanged(self):
+        data = get_message()
+        message = Message.from_array(data)
+        message.text = "Bye there"
+        array = as_array(message, prefer_original=True)
+        self.assertIsNot(array, data)
+        self.assertIs(array['chat'], data['chat'], 'the unchanged objects in there are still passed through')
+        self.assertIs(array['entities'][0], data['entities'][0])
+        self.assertIs(array['reply_markup'], data['reply_markup'])
+        self.assertIs(message.to_array(prefer_original=True)['reply_markup'], data['reply_markup'])
+        self.assertIsNot(as_array(message)['chat'], data['chat'])
+    # end def
+
+    def test_reassigned_list(self):
+        data = get_message()
+        message = Message.from_array(data)
+        entities = message.entities
+        entities.append(MessageEntity('italic', 3, 5))
+        message.entities = entities
+        self.assertEqual(len(as_array(message, prefer_original=True)['entities']), 2)
+    # end def
+
+    def test_own_objects(self):
+        entity = MessageEntity('bold', 0, 2)
+        self.assertFalse(entity._is_unmodified(), 'nothing to prefer')
+        self.assertEqual(as_array(entity, prefer_original=True), {"type": "bold", "offset": 0, "length": 2})
+    # end def
+
+    def test_lazy(self):
+        data = get_message()
+        with lazy_parsing():
+            message = Message.from_array(data)
+        # end with
+        self.assertIs(as_array(message, prefer_original=True), data)
+        self.assertTrue(message._lazy, 'not parsed just for sending it again')
+    # end def
+
+    def test_bot(self):
+        data = get_message()
+        message = Message.from_array(data)
+        with FakeApiServer(results={"sendMessage": data}) as server:
+            for prefer_original in (True, False):
+                with SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url, prefer_original=prefer_original) as bot:
+                    self.assertEqual(bot.prefer_original, prefer_original)
+                    bot.send_message(1234, message.text, entities=message.entities, reply_markup=message.reply_markup)
+                # end with
+                query = parse_qs(urlparse(server.requests[-1][1]).query)
+                self.assertEqual(json.loads(query['entities'][0]), data['entities'])
+                self.assertEqual(json.loads(query['reply_markup'][0]), data['reply_markup'])
+            # end for
+        # end with
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
@@ -0,0 +1,142 @@
+import threading
+import unittest
+
+from pytgbot.api_types.receivable.updates import Message
+from pytgbot.api_types.sendable.inline import InlineQueryResultArticle, InputTextMessageContent
+from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup, InlineKeyboardButton, ReplyKeyboardMarkup, KeyboardButton
+from pytgbot.bot.synchronous import SyncBot
+from pytgbot.json_codec import StdlibJsonCodec
+
+
+def keyboard():
+    return InlineKeyboardMarkup([[InlineKeyboardButton('👍', callback_data='vote:up'), InlineKeyboardButton('👎', callback_data='vote:down')]])
+# end def
+
+
+class SendableJsonTestCase(unittest.TestCase):
+    def test_cached(self):
+        markup = keyboard()
+        json = markup.to_json()
+        self.assertEqual(json, '{"inline_keyboard":[[{"text":"👍","callback_data":"vote:up"},{"text":"👎","callback_data":"vote:down"}]]}')
+        self.assertIs(markup.to_json(), json)
+        self.assertIsNot(markup.to_json(StdlibJsonCodec()), json, 'other codec')
+    # end def
+
+    def test_changed(self):
+        markup = keyboard()
+        markup.to_json()
+        markup.inline_keyboard[0][1].text = '👀'
+        self.assertIn('"text":"👀"', markup.to_json())
+        button = InlineKeyboardButton('new', callback_data='new')
+        markup.inline_keyboard = [[button]]
+        self.assertIn('"text":"new"', markup.to_json())
+        button.callback_data = 'newer'
+        self.assertIn('"callback_data":"newer"', markup.to_json())
+    # end def
+
+    def test_changed_list(self):
+        codec = StdlibJsonCodec()
+        first, second = InlineKeyboardButton('a', callback_data='a'), InlineKeyboardButton('b', callback_data='b')
+        markup = InlineKeyboardMarkup([[first], [second]])
+        self.assertEqual(markup.to_json(codec), '{"inline_keyboard":[[{"text":"a","callback_data":"a"}],[{"text":"b","callback_data":"b"}]]}')
+        markup.inline_keyboard.reverse()
+        self.assertEqual(markup.to_json(codec), '{"inline_keyboard":[[{"text":"b","callback_data":"b"}],[{"text":"a","callback_data":"a"}]]}')
+        markup.inline_keyboard.pop()
+        self.assertEqual(markup.to_json(codec), '{"inline_keyboard":[[{"text":"b","callback_data":"b"}]]}')
+        markup.inline_keyboard[0][0] = first
+        self.assertEqual(markup.to_json(codec), '{"inline_keyboard":[[{"text":"a","callback_data":"a"}]]}')
+        markup.inline_keyboard[0].append(second)
+        self.assertEqual(markup.to_json(codec), '{"inline_keyboard":[[{"text":"a","callback_data":"a"},{"text":"b","callback_data":"b"}]]}')
+        del markup.inline_keyboard[0][:]
+        self.assertEqual(markup.to_json(codec), '{"inline_keyboard":[[]]}')
+        self.assertIs(markup.to_json(codec), markup.to_json(codec))
+    # end def
+
+    def test_prefer_original(self):
+        data = {"inline_keyboard": [[{"text": "a", "callback_data": "b"}]], "some_future_field": True}
+        message = Message.from_array({"message_id": 1, "date": 0, "chat": {"id": 1234, "type": "private"}, "reply_markup": data})
+        codec = StdlibJsonCodec()
+        original = message.reply_markup.to_json(codec, prefer_original=True)
+        self.assertIn('some_future_field', original)
+        self.assertNotIn('some_future_field', message.reply_markup.to_json(codec))
+        self.assertIs(message.reply_markup.to_json(codec, prefer_original=True), message.reply_markup.to_json(codec, prefer_original=True))
+    # end def
+
+    def test_shared(self):
+        button = InlineKeyboardButton('shared', callback_data='a')
+        first = InlineKeyboardMarkup([[button]])
+        second = InlineKeyboardMarkup([[button]])
+        first.to_json()
+        button.callback_data = 'b'
+        second.to_json()
+        self.assertIn('"callback_data":"b"', first.to_json())
+    # end def
+
+    def test_freeze(self):
+        markup = keyboard().freeze()
+        self.assertIs(markup.freeze(), markup)
+        self.assertIsInstance(markup.inline_keyboard, tuple)
+        self.assertIsInstance(markup.inline_keyboard[0], tuple)
+        with self.assertRaises(AttributeError):
+            markup.inline_keyboard = []
+        # end with
+        with self.assertRaises(AttributeError):
+            markup.inline_keyboard[0][0].text = 'changed'
+        # end with
+        self.assertEqual(markup.to_json(), keyboard().to_json())
+        self.assertIs(markup.to_json(), markup.to_json())
+    # end def
+
+    def test_hash(self):
+        self.assertEqual(keyboard().freeze(), keyboard().freeze())
+        self.assertEqual(hash(keyboard().freeze()), hash(keyboard().freeze()))
+        self.assertEqual(len({keyboard().freeze(), keyboard().freeze(), ReplyKeyboardMarkup([[KeyboardButton('👍')]]).freeze()}), 2)
+        self.assertNotEqual(keyboard(), keyboard(), 'only frozen objects compare by value')
+        markup = keyboard()
+        self.assertEqual(markup, markup)
+        self.assertNotEqual(markup.freeze(), InlineKeyboardMarkup([[InlineKeyboardButton('👍', callback_data='vote:up')]]).freeze())
+    # end def
+
+    def test_received(self):
+        data = {"message_id": 1, "date": 0, "chat": {"id": 1234, "type": "private"}, "reply_markup": {"inline_keyboard": [[{"text": "a", "callback_data": "b"}]]}}
+        markup = Message.from_array(data).reply_markup.freeze()
+        self.assertEqual(markup.to_json(prefer_original=True), '{"inline_keyboard":[[{"text":"a","callback_data":"b"}]]}')
+    # end def
+
+    def test_threads(self):
+        markup = keyboard().freeze()
+        results = []
+
+        def encode():
+            for _ in range(100):
+                results.append(markup.to_json())
+            # end for
+        # end def
+
+        threads = [threading.Thread(target=encode) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        # end for
+        for thread in threads:
+            thread.join()
+        # end for
+        self.assertEqual(set(results), {keyboard().to_json()})
+    # end def
+
+    def test_bot(self):
+        bot = SyncBot('123:ABC')
+        results = [
+            InlineQueryResultArticle(id=str(i), title=str(i), input_message_content=InputTextMessageContent(str(i)), reply_markup=keyboard())
+            for i in range(3)
+        ]
+        _, params, _ = bot._prepare_request('answerInlineQuery', {'inline_query_id': '1', 'results': results, 'cache_time': 300})
+        self.assertEqual(params['results'], bot.json_codec.dumps([result.to_array() for result in results]))
+        _, params, _ = bot._prepare_request('sendMessage', {'chat_id': 1, 'text': 'Hi', 'reply_markup': results[0].reply_markup})
+        self.assertIs(params['reply_markup'], results[0].reply_markup.to_json(bot.json_codec, prefer_original=bot.prefer_original))
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
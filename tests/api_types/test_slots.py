@@ -0,0 +1,92 @@
+import copy
+import inspect
+import json
+import os
+import pickle
+import unittest
+
+from pytgbot.api_types import TgBotApiObject
+from pytgbot.api_types.receivable import game, inline, media, passport, payments, peer, responses, service, stickers, updates
+from pytgbot.api_types.sendable import command, input_media, reply_markup
+from pytgbot.api_types.sendable import inline as sendable_inline, passport as sendable_passport, payments as sendable_payments
+from pytgbot.api_types.receivable.updates import Update
+from pytgbot.api_types.sendable.inline import InlineQueryResultArticle, InputTextMessageContent
+
+
+MODULES = [
+    game, inline, media, passport, payments, peer, responses, service, stickers, updates,
+    command, input_media, reply_markup, sendable_inline, sendable_passport, sendable_payments,
+]
+with open(os.path.join(os.path.dirname(__file__), '..', 'data', 'updates.json'), 'r') as f:
+    UPDATES = json.load(f)
+# end with
+
+
+def get_api_classes():
+    for module in MODULES:
+        for name, cls in vars(module).items():
+            if inspect.isclass(cls) and issubclass(cls, TgBotApiObject) and cls.__module__ == module.__name__:
+                yield cls
+            # end if
+        # end for
+    # end for
+# end def
+
+
+class SlotsTestCase(unittest.TestCase):
+    def test_no_dict(self):
+        for cls in get_api_classes():
+            for parent in cls.__mro__[:-1]:  # all but `object`
+                self.assertIn('__slots__', parent.__dict__, '{parent} in the bases of {cls}'.format(parent=parent, cls=cls))
+            # end for
+            self.assertEqual(cls.__dictoffset__, 0, cls)
+        # end for
+    # end def
+
+    def test_unknown_attribute(self):
+        update = Update.from_array(UPDATES[0])
+        with self.assertRaises(AttributeError):
+            update.message.foo = 'bar'
+        # end with
+    # end def
+
+    def test_raw_invalidation(self):
+        update = Update.from_array(UPDATES[0])
+        self.assertIs(update.message._raw, UPDATES[0]['message'])
+        update.message.text = '/help'
+        self.assertIsNone(update.message._raw)
+        self.assertIsNotNone(update._raw, 'only the changed object')
+        self.assertEqual(update.message.to_array()['text'], '/help')
+    # end def
+
+    def test_copy_and_pickle(self):
+        for data in UPDATES:
+            update = Update.from_array(data)
+            for clone in (copy.copy(update), copy.deepcopy(update), pickle.loads(pickle.dumps(update))):
+                self.assertEqual(clone.to_array(), data)
+                self.assertEqual(clone._raw, data)
+            # end for
+        # end for
+    # end def
+
+    def test_sendable(self):
+        result = InlineQueryResultArticle(id=1, title='Cat', input_message_content=InputTextMessageContent('Meow'))
+        self.assertEqual(pickle.loads(pickle.dumps(result)).to_array(), result.to_array())
+        self.assertEqual(result.to_array()['id'], '1')
+    # end def
+
+    def test_subclass(self):
+        class MyUpdate(Update):  # user subclasses without `__slots__` still get a `__dict__`.
+            pass
+        # end class
+
+        update = MyUpdate(update_id=1)
+        update.handled = True
+        self.assertEqual(update.to_array(), {'update_id': 1})
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
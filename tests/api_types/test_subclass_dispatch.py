@@ -0,0 +1,75 @@
+import unittest
+
+from pytgbot.api_types import lazy_parsing, validation_mode, VALIDATION_TRUSTED
+from pytgbot.api_types.receivable.peer import ChatMember, ChatMemberOwner, ChatMemberAdministrator, ChatMemberMember, ChatMemberBanned
+from pytgbot.api_types.sendable.command import BotCommandScope, BotCommandScopeDefault, BotCommandScopeChatMember
+from pytgbot.api_types.sendable.input_media import InputMedia, InputMediaPhoto, InputMediaDocument
+from pytgbot.api_types.sendable.passport import PassportElementError, PassportElementErrorFiles
+from pytgbot.bot.synchronous import SyncBot
+from pytgbot.exceptions import TgApiParseException
+
+
+USER = {"id": 1234, "is_bot": False, "first_name": "Test"}
+ADMINISTRATORS = [
+    {"user": USER, "status": "creator", "is_anonymous": False},
+    {
+        "user": USER, "status": "administrator", "can_be_edited": False, "is_anonymous": False, "can_manage_chat": True,
+        "can_delete_messages": True, "can_manage_voice_chats": True, "can_restrict_members": True, "can_promote_members": False,
+        "can_change_info": True, "can_invite_users": True,
+    },
+]
+
+
+class SubclassDispatchTestCase(unittest.TestCase):
+    def test_chat_member(self):
+        self.assertIsInstance(ChatMember.from_array({"user": USER, "status": "member"}), ChatMemberMember)
+        self.assertIsInstance(ChatMember.from_array({"user": USER, "status": "kicked", "until_date": 0}), ChatMemberBanned)
+        self.assertIsNone(ChatMember.from_array(None))
+    # end def
+
+    def test_chat_administrators(self):
+        bot = SyncBot('123:ABC')
+        for mode in ('normal', 'lazy', 'trusted'):
+            with lazy_parsing() if mode == 'lazy' else validation_mode(VALIDATION_TRUSTED if mode == 'trusted' else 'strict'):
+                owner, admin = bot._get_chat_administrators__process_result(ADMINISTRATORS)
+            # end with
+            self.assertIs(type(owner), ChatMemberOwner, mode)
+            self.assertIs(type(admin), ChatMemberAdministrator, mode)
+            self.assertTrue(admin.can_manage_chat, mode)
+            self.assertEqual(owner.user.first_name, "Test", mode)
+        # end for
+    # end def
+
+    def test_sendables(self):
+        self.assertIsInstance(BotCommandScope.from_array({"type": "default"}), BotCommandScopeDefault)
+        scope = BotCommandScope.from_array({"type": "chat_member", "chat_id": 1, "user_id": 2})
+        self.assertIsInstance(scope, BotCommandScopeChatMember)
+        self.assertEqual(scope.user_id, 2)
+        media = InputMedia.from_array({"type": "photo", "media": "abc", "caption": "Hi"})
+        self.assertIs(type(media), InputMediaPhoto)
+        self.assertEqual((media.type, media.media, media.caption), ("photo", "abc", "Hi"))
+        self.assertEqual(media.to_array(), {"type": "photo", "media": "abc", "caption": "Hi"})
+        self.assertIs(type(InputMedia.from_array({"type": "document", "media": "abc"})), InputMediaDocument)
+        self.assertIs(type(InputMediaPhoto.from_array({"type": "photo", "media": "abc"})), InputMediaPhoto)
+        error = PassportElementError.from_array({"source": "files", "type": "utility_bill", "file_hashes": ["abc"], "message": "blurry"})
+        self.assertIsInstance(error, PassportElementErrorFiles)
+        self.assertEqual(error.file_hashes, ["abc"])
+    # end def
+
+    def test_unknown(self):
+        with self.assertRaises(TgApiParseException):
+            ChatMember.from_array({"user": USER, "status": "some_future_status"})
+        # end with
+        with self.assertRaises(TgApiParseException):
+            BotCommandScope.from_array({"no": "type"})
+        # end with
+        with self.assertRaises(TgApiParseException):
+            InputMedia.from_array({"type": "hologram", "media": "abc"})
+        # end with
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
@@ -0,0 +1,124 @@
+import json
+import os
+import unittest
+from unittest import mock
+
+from pytgbot.api_types import set_validation_mode, get_validation_mode, validation_mode
+from pytgbot.api_types import VALIDATION_STRICT, VALIDATION_TRUSTED, VALIDATION_OFF
+from pytgbot.api_types.receivable import peer
+from pytgbot.api_types.receivable.peer import User
+from pytgbot.api_types.receivable.updates import Update
+from pytgbot.api_types.sendable.reply_markup import KeyboardButton
+from pytgbot.bot.synchronous import SyncBot
+from tests.fake_api_server import FakeApiServer
+
+
+with open(os.path.join(os.path.dirname(__file__), '..', 'data', 'updates.json'), 'r') as f:
+    UPDATES = json.load(f)
+# end with
+USER = {"id": 1234, "is_bot": True, "first_name": "Test Bot", "username": "test_bot"}
+
+
+def count_value_checks(check):
+    """
+    :return: How often the values of the constructors were checked, ignoring the check of `validate_array`'s input.
+    """
+    return len([call for call in check.call_args_list if call[1].get('parameter_name') != 'array'])
+# end def
+
+
+class ValidationModeTestCase(unittest.TestCase):
+    def tearDown(self):
+        set_validation_mode(VALIDATION_STRICT)
+    # end def
+
+    def test_strict(self):
+        self.assertEqual(get_validation_mode(), VALIDATION_STRICT)
+        with self.assertRaises(TypeError):
+            User(id='1234', is_bot=True, first_name='Test')
+        # end with
+        with self.assertRaises(TypeError):
+            User(id='1234', is_bot=True, first_name='Test', _raw={})
+        # end with
+    # end def
+
+    def test_trusted(self):
+        set_validation_mode(VALIDATION_TRUSTED)
+        with self.assertRaises(TypeError, msg='objects created by hand are still checked'):
+            User(id='1234', is_bot=True, first_name='Test')
+        # end with
+        with self.assertRaises(TypeError):
+            KeyboardButton(text=1234)
+        # end with
+        self.assertEqual(User(id='1234', is_bot=True, first_name='Test', _raw={}).id, '1234')
+        with mock.patch.object(peer, 'assert_type_or_raise') as check:
+            self.assertEqual(User.from_array(USER).to_array(), USER)
+        # end with
+        self.assertEqual(count_value_checks(check), 0)
+    # end def
+
+    def test_off(self):
+        set_validation_mode(VALIDATION_OFF)
+        self.assertEqual(User(id='1234', is_bot=True, first_name='Test').id, '1234')
+        self.assertEqual(KeyboardButton(text=1234).text, 1234)
+    # end def
+
+    def test_same_result(self):
+        expected = [update.to_array() for update in Update.from_array_list(UPDATES, list_level=1)]
+        for mode in (VALIDATION_TRUSTED, VALIDATION_OFF):
+            with validation_mode(mode):
+                self.assertEqual([update.to_array() for update in Update.from_array_list(UPDATES, list_level=1)], expected, mode)
+            # end with
+        # end for
+    # end def
+
+    def test_context(self):
+        with validation_mode(VALIDATION_OFF):
+            self.assertEqual(get_validation_mode(), VALIDATION_OFF)
+            with validation_mode(None):
+                self.assertEqual(get_validation_mode(), VALIDATION_OFF)
+            # end with
+            with validation_mode(VALIDATION_STRICT):
+                self.assertEqual(get_validation_mode(), VALIDATION_STRICT)
+            # end with
+            User(id='1234', is_bot=True, first_name='Test')
+        # end with
+        self.assertEqual(get_validation_mode(), VALIDATION_STRICT)
+    # end def
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            set_validation_mode('lenient')
+        # end with
+        with self.assertRaises(ValueError):
+            with validation_mode('lenient'):
+                pass
+            # end with
+        # end with
+        with self.assertRaises(ValueError):
+            SyncBot('123:ABC', validation_mode='lenient')
+        # end with
+    # end def
+
+    def test_bot(self):
+        checks = {}
+        with FakeApiServer(results={"getMe": USER}) as server:
+            for mode in (None, VALIDATION_TRUSTED):
+                with SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url, validation_mode=mode) as bot:
+                    with mock.patch.object(peer, 'assert_type_or_raise') as check:
+                        self.assertEqual(bot.get_me().to_array(), USER)
+                    # end with
+                # end with
+                checks[mode] = count_value_checks(check)
+            # end for
+        # end with
+        self.assertGreater(checks[None], 0)
+        self.assertEqual(checks[VALIDATION_TRUSTED], 0)
+        self.assertEqual(get_validation_mode(), VALIDATION_STRICT, 'the mode of the bot is only used by the bot')
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+__author__ = 'luckydonald'
+__all__ = ["FakeApiServer"]
+
+
+class FakeApiRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real api.
+    disable_nagle_algorithm = True  # headers and body are written separately.
+
+    def setup(self):
+        super(FakeApiRequestHandler, self).setup()
+        with self.server.lock:
+            self.server.connection_count += 1
+        # end with
+    # end def
+
+    def read_body(self):
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            body = b''
+            while True:
+                size = int(self.rfile.readline().split(b';', 1)[0], 16)
+                chunk = self.rfile.read(size + 2)  # with the CRLF at the end
+                if size == 0:
+                    return body
+                # end if
+                body += chunk[:-2]
+            # end while
+        # end if
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+    # end def
+
+    def do_POST(self):
+        body = self.read_body()
+        command = self.path.rstrip('/').rsplit('/', 1)[-1].split('?', 1)[0]
+        with self.server.lock:
+            self.server.request_count += 1
+            self.server.requests.append((command, self.path, body))
+            self.server.last_headers = self.headers
+        # end with
+        status, answer = self.server.answer(command, self.path, body)
+        if self.server.delay:
+            self.server.sleep(self.server.delay)
+        # end if
+        if isinstance(answer, bytes):  # e.g. an html error page
+            data, content_type = answer, 'text/html'
+        else:
+            data, content_type = json.dumps(answer).encode('utf-8'), 'application/json'
+        # end if
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    # end def
+
+    def do_GET(self):
+        data = self.server.files.get(self.path.split('?', 1)[0])
+        self.send_response(200 if data is not None else 404)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(len(data or b'')))
+        self.end_headers()
+        self.wfile.write(data or b'')
+    # end def
+
+    def log_message(self, format, *args):
+        pass  # keep the test output clean.
+    # end def
+# end class
+
+
+class FakeApiServer(ThreadingHTTPServer):
+    """
+    A tiny stand-in for the telegram api server, listening on localhost.
+    Every request is answered with `{"ok": true, "result": …}`,
+    where the result is looked up by command in `results`, defaulting to `True`.
+    A result can also be a function `(command, path, body)` returning a tuple of `(http status, json or bytes)`.
+    GET requests download the `files`, given as `{"/path": b"content"}`.
+
+    Use it as context manager to have it serve in a background thread:
+
+        with FakeApiServer() as server:
+            bot = Bot('123:ABC', base_url=server.base_url, download_url=server.download_url)
+    """
+    daemon_threads = True
+    GET_ME = {"id": 123, "is_bot": True, "first_name": "Fake", "username": "FakeBot"}
+
+    def __init__(self, results=None, delay=0.0, files=None):
+        super(FakeApiServer, self).__init__(('127.0.0.1', 0), FakeApiRequestHandler)
+        self.results = {"getMe": self.GET_ME}
+        self.results.update(results or {})
+        self.delay = delay
+        self.files = files or {}
+        self.last_headers = None
+        self.lock = threading.Lock()
+        self.connection_count = 0
+        self.request_count = 0
+        self.requests = []
+        self._thread = None
+    # end def
+
+    @staticmethod
+    def sleep(seconds):
+        from time import sleep
+        sleep(seconds)
+    # end def
+
+    def answer(self, command, path, body):
+        """
+        :return: tuple of (http status code, json answer)
+        """
+        result = self.results.get(command, True)
+        if callable(result):
+            return result(command, path, body)
+        # end if
+        return 200, {"ok": True, "result": result}
+    # end def
+
+    @property
+    def base_url(self):
+        return "http://127.0.0.1:{port}/bot{{api_key}}/{{command}}".format(port=self.server_address[1])
+    # end def
+
+    def get_file_url(self, path):
+        return "http://127.0.0.1:{port}{path}".format(port=self.server_address[1], path=path)
+    # end def
+
+    @property
+    def download_url(self):
+        return "http://127.0.0.1:{port}/file/bot{{api_key}}/{{file}}".format(port=self.server_address[1])
+    # end def
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    # end def
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+    # end def
+# end class
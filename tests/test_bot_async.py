@@ -0,0 +1,57 @@
+import asyncio
+import unittest
+
+from pytgbot.exceptions import TgApiException
+from tests.fake_api_server import FakeApiServer
+
+try:
+    from pytgbot.bot.asynchronous import AsyncBot
+except ImportError:  # pip install pytgbot[async]
+    AsyncBot = None
+# end try
+
+
+@unittest.skipIf(AsyncBot is None, 'needs the async requirements (pip install pytgbot[async])')
+class AsyncBotTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_long_polling_does_not_block_the_loop(self):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+            # end while
+        # end def
+
+        with FakeApiServer(results={"getUpdates": []}, delay=0.5) as server:
+            async with AsyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url) as bot:
+                task = asyncio.ensure_future(ticker())
+                updates = await bot.get_updates(poll_timeout=1)
+                task.cancel()
+            # end with
+        # end with
+        self.assertEqual(updates, [])
+        self.assertGreater(ticks, 10, 'the event loop should keep running while we wait for the server')
+    # end def
+
+    async def test_load_info(self):
+        with FakeApiServer() as server:
+            async with AsyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url) as bot:
+                with self.assertRaises(TgApiException, msg='would need to block the event loop'):
+                    bot.username
+                # end with
+                me = await bot.load_info()
+                self.assertEqual(me.username, 'FakeBot')
+                self.assertEqual(bot.username, 'FakeBot')
+                self.assertEqual(bot.id, 123)
+            # end with
+            self.assertEqual(server.request_count, 1, 'bot.me should be cached')
+        # end with
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
@@ -1,7 +1,10 @@
 import unittest
 
+from DictObject import DictObject
+
 from pytgbot.api_types.receivable.peer import ChatMember, ChatMemberOwner
 from pytgbot.bot.synchronous import Bot
+from pytgbot.exceptions import TgApiServerException, TgApiResponseException, TgApiParseException
 
 
 class MyTestCase(unittest.TestCase):
@@ -21,5 +24,48 @@ class MyTestCase(unittest.TestCase):
     # end def
 # end class
 
+
+class PostprocessRequestTestCase(unittest.TestCase):
+    MESSAGE = {"message_id": 1, "date": 0, "chat": {"id": 1234, "type": "private"}, "entities": [{"type": "bold", "offset": 0, "length": 1}]}
+
+    def test_plain_result(self):
+        bot = Bot('not-a-real-api-key')
+        result = bot._postprocess_request(None, None, {"ok": True, "result": self.MESSAGE})
+        self.assertIs(result, self.MESSAGE, 'no need to wrap it, it gets parsed into a Message anyway')
+        self.assertIs(type(result['entities'][0]), dict)
+        self.assertEqual(bot._send_message__process_result(result).entities[0].length, 1)
+    # end def
+
+    def test_dict_object(self):
+        bot = Bot('not-a-real-api-key', return_python_objects=False)
+        result = bot._postprocess_request(None, None, {"ok": True, "result": self.MESSAGE})
+        self.assertIsInstance(result, DictObject)
+        self.assertEqual(result.result.chat.id, 1234)
+    # end def
+
+    def test_errors(self):
+        bot = Bot('not-a-real-api-key')
+        with self.assertRaises(TgApiServerException) as context:
+            bot._postprocess_request(None, None, {
+                "ok": False, "error_code": 429, "description": "Too Many Requests: retry after 5", "parameters": {"retry_after": 5},
+            })
+        # end with
+        self.assertEqual(context.exception.error_code, 429)
+        self.assertEqual(context.exception.description, "Too Many Requests: retry after 5")
+        self.assertEqual(context.exception.retry_after, 5)
+        with self.assertRaises(TgApiServerException) as context:
+            bot._postprocess_request(None, None, {"ok": False})
+        # end with
+        self.assertIsNone(context.exception.error_code)
+        with self.assertRaises(TgApiResponseException):
+            bot._postprocess_request(None, None, ["not", "an", "object"])
+        # end with
+        with self.assertRaises(TgApiParseException):
+            bot._postprocess_request(None, None, {"ok": True})
+        # end with
+    # end def
+# end class
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+from pytgbot.bot.synchronous import SyncBot
+from tests.fake_api_server import FakeApiServer
+
+
+class SyncBotSessionTestCase(unittest.TestCase):
+    def test_connection_is_reused(self):
+        with FakeApiServer() as server:
+            with SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url) as bot:
+                for i in range(20):
+                    self.assertTrue(bot.send_chat_action(1234, 'typing'))
+                # end for
+            # end with
+            self.assertEqual(server.request_count, 20)
+            self.assertEqual(server.connection_count, 1, 'all requests should share one keep-alive connection')
+        # end with
+    # end def
+
+    def test_close_and_reopen(self):
+        with FakeApiServer() as server:
+            bot = SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url)
+            self.assertEqual(bot.username, 'FakeBot')
+            bot.close()
+            self.assertIsNone(bot._session)
+            self.assertTrue(bot.send_chat_action(1234, 'typing'))
+            bot.close()
+            self.assertEqual(server.connection_count, 2)
+        # end with
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
@@ -0,0 +1,66 @@
+import logging
+import unittest
+
+from pytgbot.bot.synchronous import SyncBot
+from tests.fake_api_server import FakeApiServer
+
+
+class ReprCountingDict(dict):
+    def __init__(self, *args, **kwargs):
+        super(ReprCountingDict, self).__init__(*args, **kwargs)
+        self.repr_calls = 0
+    # end def
+
+    def __repr__(self):
+        self.repr_calls += 1
+        return super(ReprCountingDict, self).__repr__()
+    # end def
+# end class
+
+
+MESSAGE = {"message_id": 1, "date": 0, "chat": {"id": 1234, "type": "private"}, "text": "Hi"}
+
+
+class BotTraceTestCase(unittest.TestCase):
+    def test_trace(self):
+        events = []
+        with FakeApiServer(results={"sendMessage": MESSAGE}) as server:
+            with SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url, trace=lambda event, data: events.append((event, data))) as bot:
+                bot.send_message(1234, 'Hi')
+            # end with
+        # end with
+        self.assertEqual([event for event, data in events], ['request', 'response'])
+        self.assertEqual(events[0][1]['command'], 'sendMessage')
+        self.assertEqual(events[0][1]['params']['text'], 'Hi')
+        self.assertEqual(events[1][1], {'command': 'sendMessage', 'json': {'ok': True, 'result': MESSAGE}})
+    # end def
+
+    def test_no_trace(self):
+        bot = SyncBot('123:ABC')
+        self.assertIsNone(bot.trace)
+        _, params, _ = bot._prepare_request('sendMessage', {'chat_id': 1234, 'text': 'Hi'})
+        self.assertEqual(params['text'], 'Hi')
+    # end def
+
+    def test_debug_message_only_built_for_debug_logging(self):
+        bot = SyncBot('123:ABC')
+        logger = logging.getLogger('pytgbot.bot.base')
+        level = logger.level
+        try:
+            result = ReprCountingDict(FakeApiServer.GET_ME)
+            logger.setLevel(logging.INFO)
+            self.assertEqual(bot._get_me__process_result(result).username, 'FakeBot')
+            self.assertEqual(result.repr_calls, 0)
+            logger.setLevel(logging.DEBUG)
+            bot._get_me__process_result(result)
+            self.assertEqual(result.repr_calls, 1)
+        finally:
+            logger.setLevel(level)
+        # end try
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
@@ -0,0 +1,187 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+from pytgbot.broadcast import Broadcaster, MessageSpec, FileCheckpoint, broadcast
+from pytgbot.exceptions import TgApiServerException
+from pytgbot.api_types.receivable.updates import ResponseParameters
+from pytgbot.rate_limit import RateScheduler
+from pytgbot.retry import RetryPolicy
+
+UNLIMITED = dict(global_limit=None, private_chat_limit=None, group_chat_limit=None)
+
+
+class StubAsyncBot(object):
+    """
+    Pretends to be an `AsyncBot`, answering from a table of errors.
+    """
+    scheduler = None
+
+    def __init__(self, errors=None):
+        self.errors = errors or {}  # chat_id -> list of exceptions to raise, one per call.
+        self.sent = []
+    # end def
+
+    async def send_message(self, chat_id, text, parse_mode=None):
+        await asyncio.sleep(0.001)
+        errors = self.errors.get(chat_id)
+        if errors:
+            raise errors.pop(0)
+        # end if
+        self.sent.append((chat_id, text))
+        return {"message_id": len(self.sent), "chat": {"id": chat_id}, "text": text}
+    # end def
+# end class
+
+
+def server_error(code, description, **parameters):
+    return TgApiServerException(
+        error_code=code, description=description, parameters=ResponseParameters(**parameters) if parameters else None,
+    )
+# end def
+
+
+class TeleflaskStyleMessage(object):
+    def __init__(self, text, receiver=None, reply_id=None):
+        self.text = text
+        self.receiver = receiver
+        self.reply_id = reply_id
+    # end def
+
+    def actual_send(self, sender, ignore_reply=False):
+        return sender.send_message(chat_id=self.receiver, text=self.text)
+    # end def
+# end class
+
+
+class BroadcastTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_statuses(self):
+        bot = StubAsyncBot(errors={
+            2: [server_error(403, "Forbidden: bot was blocked by the user")],
+            3: [server_error(403, "Forbidden: user is deactivated")],
+            4: [server_error(400, "Bad Request: chat not found")],
+            5: [server_error(429, "Too Many Requests: retry after 0", retry_after=0)] * 2,
+            -6: [server_error(400, "Bad Request: group chat was upgraded to a supergroup chat", migrate_to_chat_id=-1006)],
+            7: [server_error(400, "Bad Request: message text is empty")],
+        })
+        chat_ids = [1, 2, 3, 4, 5, -6, 7] + list(range(100, 200))
+        broadcaster = broadcast(bot, chat_ids, MessageSpec('send_message', text='Hi'), scheduler=RateScheduler(**UNLIMITED))
+        results = {}
+        async for result in broadcaster:
+            results[result.chat_id] = result
+        # end for
+        self.assertEqual(len(results), len(chat_ids))
+        self.assertEqual(results[1].status, 'sent')
+        self.assertEqual(results[1].result['text'], 'Hi')
+        self.assertEqual(results[2].status, 'blocked')
+        self.assertEqual(results[3].status, 'deactivated')
+        self.assertEqual(results[4].status, 'not_found')
+        self.assertEqual(results[5].status, 'sent')
+        self.assertEqual(results[-6].status, 'sent')
+        self.assertEqual(results[-6].migrated_to, -1006)
+        self.assertEqual(results[7].status, 'failed')
+        self.assertEqual(broadcaster.counts, {'sent': 103, 'blocked': 1, 'deactivated': 1, 'not_found': 1, 'failed': 1})
+        self.assertEqual(len(bot.sent), 103)
+    # end def
+
+    async def test_rate_limited(self):
+        bot = StubAsyncBot()
+        scheduler = RateScheduler(global_limit=(20, 0.2), **{k: v for k, v in UNLIMITED.items() if k != 'global_limit'})
+        started = time.monotonic()
+        counts = await Broadcaster(bot, range(1, 61), MessageSpec('send_message', text='Hi'), scheduler=scheduler).run()
+        self.assertEqual(counts, {'sent': 60})
+        self.assertGreaterEqual(time.monotonic() - started, 0.4)
+    # end def
+
+    async def test_teleflask_style_message(self):
+        bot = StubAsyncBot()
+        message = TeleflaskStyleMessage('Hello')
+        await Broadcaster(bot, [1, 2, 3], message, scheduler=RateScheduler(**UNLIMITED)).run()
+        self.assertEqual(sorted(bot.sent), [(1, 'Hello'), (2, 'Hello'), (3, 'Hello')])
+        self.assertIsNone(message.receiver, 'the original message is not changed')
+    # end def
+
+    async def test_resume(self):
+        bot = StubAsyncBot()
+        path = os.path.join(tempfile.mkdtemp(), 'broadcast.progress')
+        spec = MessageSpec('send_message', text='Hi')
+        results = Broadcaster(bot, range(1, 101), spec, checkpoint=path, scheduler=RateScheduler(**UNLIMITED)).__aiter__()
+        try:
+            for _ in range(30):
+                await results.__anext__()
+            # end for
+        finally:
+            await results.aclose()  # stops it, like the process got killed.
+        # end try
+        first_run = len(bot.sent)
+        self.assertGreaterEqual(first_run, 30)
+        self.assertEqual(len(FileCheckpoint(path).done), first_run, 'everything sent is remembered')
+        await Broadcaster(bot, range(1, 101), spec, checkpoint=path, scheduler=RateScheduler(**UNLIMITED)).run()
+        self.assertEqual(len(FileCheckpoint(path).done), 100)
+        sent_ids = [chat_id for chat_id, text in bot.sent]
+        self.assertEqual(sorted(set(sent_ids)), list(range(1, 101)))
+        self.assertEqual(len(sent_ids), 100, 'nothing was sent twice')
+    # end def
+
+    async def test_checkpoint_fails(self):
+        class FailingCheckpoint(FileCheckpoint):
+            def mark(self, result):
+                if len(self.done) >= 10:
+                    raise IOError(28, "No space left on device")
+                # end if
+                super(FailingCheckpoint, self).mark(result)
+            # end def
+        # end class
+
+        checkpoint = FailingCheckpoint(os.path.join(tempfile.mkdtemp(), 'broadcast.progress'))
+        broadcaster = Broadcaster(StubAsyncBot(), range(1, 101), MessageSpec('send_message', text='Hi'), checkpoint=checkpoint, scheduler=RateScheduler(**UNLIMITED))
+        with self.assertRaises(OSError) as context:
+            await asyncio.wait_for(broadcaster.run(), 5)
+        # end with
+        self.assertEqual(context.exception.errno, 28, 'not the timeout')
+        self.assertIsNone(checkpoint._file, 'closed')
+    # end def
+
+    async def test_chat_ids_fail(self):
+        def chat_ids():
+            yield from range(1, 6)
+            raise ValueError("database gone")
+        # end def
+
+        results = []
+
+        async def collect():
+            async for result in Broadcaster(StubAsyncBot(), chat_ids(), MessageSpec('send_message', text='Hi'), scheduler=RateScheduler(**UNLIMITED)):
+                results.append(result)
+            # end for
+        # end def
+
+        with self.assertRaises(ValueError):
+            await asyncio.wait_for(collect(), 5)
+        # end with
+        self.assertLessEqual(len(results), 5)
+    # end def
+
+    async def test_bot_retries(self):
+        bot = StubAsyncBot(errors={1: [server_error(500, "Internal Server Error")] * 10})
+        bot.retry = RetryPolicy()
+        broadcaster = Broadcaster(bot, [1], MessageSpec('send_message', text='Hi'), scheduler=RateScheduler(**UNLIMITED))
+        self.assertIsNone(broadcaster.retry, 'the bot retries already')
+        self.assertEqual(await broadcaster.run(), {'failed': 1})
+        self.assertEqual(len(bot.errors[1]), 9, 'sent once, the stub bot has no retries of its own')
+        self.assertIsNotNone(Broadcaster(StubAsyncBot(), [1], MessageSpec('send_message', text='Hi')).retry)
+    # end def
+
+    def test_chat_id_in_spec(self):
+        with self.assertRaises(ValueError):
+            MessageSpec('send_message', chat_id=1, text='Hi')
+        # end with
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
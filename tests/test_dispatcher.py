@@ -0,0 +1,197 @@
+import asyncio
+import random
+import threading
+import time
+import unittest
+
+from pytgbot.api_types.receivable.updates import Update
+from pytgbot.dispatcher import UpdateDispatcher, AsyncUpdateDispatcher, get_update_chat_id
+
+
+def make_update(update_id, chat_id):
+    return Update.from_array({
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id, "date": 0, "text": str(update_id),
+            "chat": {"id": chat_id, "type": "private"},
+            "from": {"id": chat_id, "is_bot": False, "first_name": "User"},
+        },
+    })
+# end def
+
+
+class RecordedUpdatesBot(object):
+    """ Serves prepared updates in batches, like the telegram server would. """
+    def __init__(self, updates, dispatcher_getter):
+        self.updates = updates
+        self.dispatcher_getter = dispatcher_getter
+        self.offsets = []
+    # end def
+
+    def get_updates(self, offset=None, limit=100, poll_timeout=None, allowed_updates=None, error_as_empty=False):
+        self.offsets.append(offset)
+        batch = [u for u in self.updates if offset is None or u.update_id >= offset][:limit]
+        if not batch:
+            self.dispatcher_getter().stop()
+        # end if
+        return batch
+    # end def
+# end class
+
+
+class AsyncRecordedUpdatesBot(RecordedUpdatesBot):
+    async def get_updates(self, *args, **kwargs):
+        await asyncio.sleep(0)
+        return super(AsyncRecordedUpdatesBot, self).get_updates(*args, **kwargs)
+    # end def
+# end class
+
+
+class FailingBot(object):
+    """ Fails like `get_updates(…, error_as_empty=True)` does, for the first few calls. """
+    def __init__(self, errors, dispatcher_getter):
+        self.errors = errors
+        self.dispatcher_getter = dispatcher_getter
+        self.calls = []
+    # end def
+
+    def get_updates(self, offset=None, limit=100, poll_timeout=None, allowed_updates=None, error_as_empty=False):
+        self.calls.append(time.monotonic())
+        if len(self.calls) <= self.errors:
+            return {"result": [], "exception": ConnectionRefusedError("Connection refused")}
+        # end if
+        self.dispatcher_getter().stop()
+        return []
+    # end def
+# end class
+
+
+class AsyncFailingBot(FailingBot):
+    async def get_updates(self, *args, **kwargs):
+        return super(AsyncFailingBot, self).get_updates(*args, **kwargs)
+    # end def
+# end class
+
+
+class UpdateDispatcherTestCase(unittest.TestCase):
+    def test_per_chat_ordering(self):
+        chats = [1000 + i for i in range(20)]
+        updates = [make_update(i, random.choice(chats)) for i in range(1, 2001)]
+        handled = {}
+        lock = threading.Lock()
+
+        def handler(update):
+            time.sleep(random.random() / 10000)
+            with lock:
+                handled.setdefault(update.message.chat.id, []).append(update.update_id)
+            # end with
+        # end def
+
+        dispatcher = None
+        bot = RecordedUpdatesBot(updates, lambda: dispatcher)
+        dispatcher = UpdateDispatcher(bot, handler, workers=4, queue_size=10)
+        dispatcher.run()
+
+        self.assertEqual(sum(len(ids) for ids in handled.values()), len(updates), 'every update handled once')
+        for chat_id, ids in handled.items():
+            self.assertEqual(ids, sorted(ids), 'order within chat {} must be kept'.format(chat_id))
+        # end for
+        self.assertEqual(bot.offsets[:2], [None, 101], 'offset must advance after every batch')
+        self.assertEqual(dispatcher.offset, 2001)
+    # end def
+
+    def test_handler_error_does_not_stop_worker(self):
+        updates = [make_update(i, 1) for i in range(1, 6)]
+        handled = []
+
+        def handler(update):
+            if update.update_id == 2:
+                raise ValueError('broken handler')
+            # end if
+            handled.append(update.update_id)
+        # end def
+
+        dispatcher = None
+        dispatcher = UpdateDispatcher(RecordedUpdatesBot(updates, lambda: dispatcher), handler, workers=1)
+        dispatcher.run()
+        self.assertEqual(handled, [1, 3, 4, 5])
+    # end def
+
+    def test_per_chat_ordering_async(self):
+        chats = [1000 + i for i in range(20)]
+        updates = [make_update(i, random.choice(chats)) for i in range(1, 2001)]
+        handled = {}
+        queued = []
+
+        async def handler(update):
+            queued.append(max(queue.qsize() for queue in dispatcher._queues))
+            await asyncio.sleep(random.random() / 10000)
+            handled.setdefault(update.message.chat.id, []).append(update.update_id)
+        # end def
+
+        dispatcher = None
+        bot = AsyncRecordedUpdatesBot(updates, lambda: dispatcher)
+        dispatcher = AsyncUpdateDispatcher(bot, handler, workers=4, queue_size=10)
+        asyncio.run(dispatcher.run())
+
+        self.assertEqual(sum(len(ids) for ids in handled.values()), len(updates), 'every update handled once, also the ones queued at stop()')
+        for chat_id, ids in handled.items():
+            self.assertEqual(ids, sorted(ids), 'order within chat {} must be kept'.format(chat_id))
+        # end for
+        self.assertLessEqual(max(queued), 10, 'full queues pause the polling')
+        self.assertEqual(bot.offsets[:2], [None, 101], 'offset must advance after every batch')
+        self.assertEqual(dispatcher.offset, 2001)
+        self.assertFalse(dispatcher.is_running)
+    # end def
+
+    def test_handler_error_does_not_stop_worker_async(self):
+        updates = [make_update(i, 1) for i in range(1, 6)]
+        handled = []
+
+        async def handler(update):
+            if update.update_id == 2:
+                raise ValueError('broken handler')
+            # end if
+            handled.append(update.update_id)
+        # end def
+
+        dispatcher = None
+        dispatcher = AsyncUpdateDispatcher(AsyncRecordedUpdatesBot(updates, lambda: dispatcher), handler, workers=1)
+        asyncio.run(dispatcher.run())
+        self.assertEqual(handled, [1, 3, 4, 5])
+    # end def
+
+    def test_error_delay(self):
+        dispatcher = None
+        bot = FailingBot(3, lambda: dispatcher)
+        dispatcher = UpdateDispatcher(bot, lambda update: None, workers=1, error_delay=0.05)
+        dispatcher.run()
+        self.assertEqual(len(bot.calls), 4)
+        for before, after in zip(bot.calls, bot.calls[1:]):
+            self.assertGreaterEqual(after - before, 0.045, 'waits after every error')
+        # end for
+    # end def
+
+    def test_error_delay_async(self):
+        dispatcher = None
+        bot = AsyncFailingBot(3, lambda: dispatcher)
+        dispatcher = AsyncUpdateDispatcher(bot, lambda update: None, workers=1, error_delay=0.05)
+        asyncio.run(dispatcher.run())
+        self.assertEqual(len(bot.calls), 4)
+        for before, after in zip(bot.calls, bot.calls[1:]):
+            self.assertGreaterEqual(after - before, 0.045, 'waits after every error')
+        # end for
+    # end def
+
+    def test_get_update_chat_id(self):
+        raw = {"update_id": 1, "callback_query": {"id": "1", "from": {"id": 12}, "chat_instance": "x"}}
+        self.assertEqual(get_update_chat_id(raw), 12, 'callback query without message uses the user')
+        self.assertEqual(get_update_chat_id(make_update(1, 42)), 42)
+        self.assertIsNone(get_update_chat_id({"update_id": 2}))
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
@@ -0,0 +1,173 @@
+import os
+import tempfile
+import unittest
+from urllib.parse import urlparse, parse_qs
+
+from pytgbot.api_types.sendable.files import InputFileFromDisk, InputFileFromBlob
+from pytgbot.bot.synchronous import SyncBot
+from pytgbot.exceptions import TgApiServerException
+from pytgbot.file_cache import (
+    FileIdCache, MemoryCacheBackend, SQLiteCacheBackend, JsonFileCacheBackend, get_message_file_id,
+)
+from tests.fake_api_server import FakeApiServer
+
+
+class PhotoServer(object):
+    """
+    Answers `sendPhoto` with a new file_id for every upload, and rejects unknown file_ids.
+    """
+    def __init__(self):
+        self.uploads = 0
+        self.known = set()
+    # end def
+
+    def __call__(self, command, path, body):
+        photo = parse_qs(urlparse(path).query).get('photo', [''])[0]
+        if photo.startswith('attach://'):
+            self.uploads += 1
+            photo = 'FILE_ID_{}'.format(self.uploads)
+            self.known.add(photo)
+        elif photo not in self.known:
+            return 400, {"ok": False, "error_code": 400, "description": "Bad Request: wrong file identifier/HTTP URL specified"}
+        # end if
+        return 200, {"ok": True, "result": {
+            "message_id": 1, "date": 0, "chat": {"id": 1234, "type": "private"},
+            "photo": [
+                {"file_id": photo + "_small", "file_unique_id": "a", "width": 90, "height": 90},
+                {"file_id": photo, "file_unique_id": "b", "width": 800, "height": 800},
+            ],
+        }}
+    # end def
+# end class
+
+
+class FileIdCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'cat.png')
+        with open(self.path, 'wb') as f:
+            f.write(b'\x89PNG not really')
+        # end with
+    # end def
+
+    def test_upload_once(self):
+        photos = PhotoServer()
+        cache = FileIdCache()
+        with FakeApiServer(results={"sendPhoto": photos}) as server:
+            with SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url, file_id_cache=cache) as bot:
+                for i in range(5):
+                    message = bot.send_photo(1234, InputFileFromDisk(self.path, mime='image/png'))
+                    self.assertEqual(message.photo[-1].file_id, 'FILE_ID_1')
+                # end for
+                # a changed file has to be uploaded again
+                os.utime(self.path, ns=(0, 0))
+                bot.send_photo(1234, InputFileFromDisk(self.path, mime='image/png'))
+            # end with
+        # end with
+        self.assertEqual(photos.uploads, 2)
+        self.assertEqual((cache.hits, cache.misses), (4, 2))
+    # end def
+
+    def test_blob(self):
+        photos = PhotoServer()
+        cache = FileIdCache()
+        with FakeApiServer(results={"sendPhoto": photos}) as server:
+            with SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url, file_id_cache=cache) as bot:
+                bot.send_photo(1234, InputFileFromBlob(b'same content', mime='image/png'))
+                bot.send_photo(1234, InputFileFromBlob(b'same content', name='other.png', mime='image/png'))
+                bot.send_photo(1234, InputFileFromBlob(b'other content', mime='image/png'))
+            # end with
+        # end with
+        self.assertEqual(photos.uploads, 2)
+    # end def
+
+    def test_stale_file_id(self):
+        photos = PhotoServer()
+        cache = FileIdCache()
+        key = cache.get_key('photo', InputFileFromDisk(self.path, mime='image/png'))
+        cache.backend.set(key, 'EXPIRED')
+        with FakeApiServer(results={"sendPhoto": photos}) as server:
+            with SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url, file_id_cache=cache) as bot:
+                with self.assertRaises(TgApiServerException):
+                    bot.send_photo(1234, InputFileFromDisk(self.path, mime='image/png'))
+                # end with
+                self.assertIsNone(cache.backend.get(key), 'the broken file_id is forgotten')
+                bot.send_photo(1234, InputFileFromDisk(self.path, mime='image/png'))
+            # end with
+        # end with
+        self.assertEqual(photos.uploads, 1)
+        self.assertEqual(cache.backend.get(key), 'FILE_ID_1')
+    # end def
+
+    def test_kinds_are_separate(self):
+        cache = FileIdCache()
+        input_file = InputFileFromDisk(self.path, mime='image/png')
+        self.assertNotEqual(cache.get_key('photo', input_file), cache.get_key('document', input_file))
+    # end def
+
+    def test_hash_files(self):
+        copy = os.path.join(self.folder, 'copy.png')
+        with open(copy, 'wb') as f:
+            f.write(b'\x89PNG not really')
+        # end with
+        cache = FileIdCache(hash_files=True)
+        self.assertEqual(
+            cache.get_key('photo', InputFileFromDisk(self.path, mime='image/png')),
+            cache.get_key('photo', InputFileFromDisk(copy, mime='image/png')),
+        )
+    # end def
+
+    def test_message_file_id(self):
+        self.assertEqual(get_message_file_id({"document": {"file_id": "DOC"}}, 'document'), 'DOC')
+        self.assertEqual(get_message_file_id({"file_id": "STICKER"}, 'png_sticker'), 'STICKER')
+        self.assertIsNone(get_message_file_id(True, 'photo'))
+    # end def
+# end class
+
+
+class BackendTestCase(unittest.TestCase):
+    def check_lru(self, backend):
+        backend.set('a', '1')
+        backend.set('b', '2')
+        self.assertEqual(backend.get('a'), '1')  # now b is the least recently used
+        backend.set('c', '3')
+        self.assertIsNone(backend.get('b'))
+        self.assertEqual(backend.get('a'), '1')
+        self.assertEqual(backend.get('c'), '3')
+        backend.delete('c')
+        self.assertIsNone(backend.get('c'))
+    # end def
+
+    def test_memory(self):
+        self.check_lru(MemoryCacheBackend(maxsize=2))
+    # end def
+
+    def test_sqlite(self):
+        path = os.path.join(tempfile.mkdtemp(), 'cache.sqlite')
+        backend = SQLiteCacheBackend(path, maxsize=2)
+        self.check_lru(backend)
+        backend.close()
+        backend = SQLiteCacheBackend(path, maxsize=2)
+        self.assertEqual(backend.get('a'), '1', 'survives a restart')
+        backend.close()
+    # end def
+
+    def test_sqlite_max_age(self):
+        backend = SQLiteCacheBackend(':memory:', max_age=-1)
+        backend.set('a', '1')
+        self.assertIsNone(backend.get('a'))
+    # end def
+
+    def test_json_file(self):
+        path = os.path.join(tempfile.mkdtemp(), 'cache.json')
+        self.check_lru(JsonFileCacheBackend(path, maxsize=2))
+        backend = JsonFileCacheBackend(path, maxsize=2)
+        self.assertEqual(backend.get('a'), '1', 'survives a restart')
+        self.assertEqual(len(backend), 1)
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+import warnings
+
+from pytgbot.api_types.sendable.files import InputFileFromDisk
+from pytgbot.bot.synchronous import SyncBot
+from tests.fake_api_server import FakeApiServer
+
+
+FD_FOLDER = '/proc/self/fd'
+
+
+def count_open_files():
+    return len(os.listdir(FD_FOLDER))
+# end def
+
+
+@unittest.skipUnless(os.path.isdir(FD_FOLDER), "needs /proc to count the open file descriptors")
+class FileHandleTestCase(unittest.TestCase):
+    UPLOADS = 10000
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.paths = []
+        for i in range(100):
+            path = os.path.join(self.folder, '{}.txt'.format(i))
+            with open(path, 'wb') as f:
+                f.write('file {}\n'.format(i).encode() * 100)
+            # end with
+            self.paths.append(path)
+        # end for
+    # end def
+
+    def upload(self, bot, i):
+        path = self.paths[i % len(self.paths)]
+        # every other upload memory maps the file.
+        bot.do('sendDocument', chat_id=1234, document=InputFileFromDisk(path, mime='text/plain', use_mmap=i % 2 == 1))
+    # end def
+
+    def test_no_leak(self):
+        with FakeApiServer(results={"sendDocument": True}) as server:
+            with SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url) as bot:
+                self.upload(bot, 0)  # the connection is open from now on.
+                before = count_open_files()
+                with warnings.catch_warnings(record=True) as caught:
+                    warnings.simplefilter('always', ResourceWarning)
+                    for i in range(self.UPLOADS):
+                        self.upload(bot, i)
+                    # end for
+                # end with
+                after = count_open_files()
+            # end with
+            self.assertEqual(server.request_count, self.UPLOADS + 1)
+        # end with
+        self.assertEqual(after, before)
+        self.assertEqual([w for w in caught if issubclass(w.category, ResourceWarning)], [], 'every file was closed')
+    # end def
+
+    def test_failing_request(self):
+        server = FakeApiServer()
+        base_url, download_url = server.base_url, server.download_url
+        server.server_close()  # nobody's listening anymore.
+        with SyncBot('123:ABC', base_url=base_url, download_url=download_url) as bot:
+            before = count_open_files()
+            for i in range(100):
+                with self.assertRaises(Exception):
+                    self.upload(bot, i)
+                # end with
+            # end for
+            self.assertEqual(count_open_files(), before)
+        # end with
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
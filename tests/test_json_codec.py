@@ -0,0 +1,151 @@
+import asyncio
+import unittest
+from enum import IntEnum
+from urllib.parse import urlparse, parse_qs
+
+from pytgbot.api_types import as_array
+from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup, InlineKeyboardButton
+from pytgbot.bot.synchronous import SyncBot
+from pytgbot.exceptions import TgApiResponseException
+from pytgbot.json_codec import JsonCodec, StdlibJsonCodec, OrjsonCodec, UjsonCodec, get_default_codec, set_default_codec
+from tests.fake_api_server import FakeApiServer
+
+try:
+    from pytgbot.bot.asynchronous import AsyncBot
+except ImportError:  # pip install pytgbot[async]
+    AsyncBot = None
+# end try
+
+
+MESSAGE = {"message_id": 1, "date": 0, "chat": {"id": 1234, "type": "private"}, "text": "Ünïcödé 👍"}
+MARKUP = InlineKeyboardMarkup([[InlineKeyboardButton('👍 "yes"', callback_data='vote:up')]])
+
+
+def get_codecs():
+    codecs = [StdlibJsonCodec()]
+    for codec_class in (OrjsonCodec, UjsonCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            pass
+        # end try
+    # end for
+    return codecs
+# end def
+
+
+class RecordingCodec(StdlibJsonCodec):
+    name = 'recording'
+
+    def __init__(self):
+        self.calls = []
+    # end def
+
+    def dumps(self, obj):
+        self.calls.append('dumps')
+        return super(RecordingCodec, self).dumps(obj)
+    # end def
+
+    def loads(self, data):
+        self.calls.append('loads')
+        return super(RecordingCodec, self).loads(data)
+    # end def
+# end class
+
+
+class JsonCodecTestCase(unittest.TestCase):
+    def tearDown(self):
+        set_default_codec(None)
+    # end def
+
+    def test_same_output(self):
+        value = {"text": "Ünïcödé 👍 </b>", "list": [1, 2.5, True, None], "nested": {"a": "b\n\"c\""}}
+        for codec in get_codecs():
+            self.assertEqual(codec.dumps(value), '{"text":"Ünïcödé 👍 </b>","list":[1,2.5,true,null],"nested":{"a":"b\\n\\"c\\""}}', codec.name)
+            self.assertEqual(codec.loads(codec.dumps(value).encode('utf-8')), value, codec.name)
+            with self.assertRaises(ValueError):
+                codec.loads(b'<html>Bad Gateway</html>')
+            # end with
+        # end for
+    # end def
+
+    def test_default(self):
+        default = get_default_codec()
+        self.assertIs(get_default_codec(), default)
+        self.assertEqual(default.name, get_codecs()[1].name if len(get_codecs()) > 1 else 'json', 'the fastest installed')
+        codec = RecordingCodec()
+        set_default_codec(codec)
+        self.assertIs(SyncBot('123:ABC').json_codec, codec)
+    # end def
+
+    def test_sync_bot(self):
+        codec = RecordingCodec()
+        with FakeApiServer(results={"sendMessage": MESSAGE}) as server:
+            with SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url, json_codec=codec) as bot:
+                message = bot.send_message(1234, 'Hi', reply_markup=MARKUP)
+            # end with
+            query = parse_qs(urlparse(server.requests[-1][1]).query)
+        # end with
+        self.assertEqual(message.text, MESSAGE['text'])
+        self.assertEqual(codec.calls, ['dumps', 'loads'])
+        self.assertEqual(query['reply_markup'], [codec.dumps(MARKUP.to_array())])
+    # end def
+
+    @unittest.skipIf(AsyncBot is None, 'needs the async requirements (pip install pytgbot[async])')
+    def test_async_bot(self):
+        codec = RecordingCodec()
+
+        async def send(server):
+            async with AsyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url, json_codec=codec) as bot:
+                return await bot.send_message(1234, 'Hi', reply_markup=MARKUP)
+            # end with
+        # end def
+
+        with FakeApiServer(results={"sendMessage": MESSAGE}) as server:
+            message = asyncio.run(send(server))
+        # end with
+        self.assertEqual(message.text, MESSAGE['text'])
+        self.assertEqual(codec.calls, ['dumps', 'loads'])
+    # end def
+
+    def test_invalid_response(self):
+        def bad_gateway(command, path, body):
+            return 502, b'<html>Bad Gateway</html>'
+        # end def
+
+        with FakeApiServer(results={"sendMessage": bad_gateway}) as server:
+            for codec in get_codecs():
+                with SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url, json_codec=codec) as bot:
+                    with self.assertRaises(TgApiResponseException, msg=codec.name):
+                        bot.send_message(1234, 'Hi')
+                    # end with
+                # end with
+            # end for
+        # end with
+    # end def
+
+    def test_as_array_leaves(self):
+        class Answer(IntEnum):
+            YES = 1
+        # end class
+
+        self.assertEqual(as_array({"a": ["b", 1, 2.5, False, None, Answer.YES]}), {"a": ["b", 1, 2.5, False, None, Answer.YES]})
+        with self.assertRaises(TypeError):
+            as_array({"a": [object()]})
+        # end with
+        with self.assertRaises(TypeError):
+            as_array(b'bytes')
+        # end with
+    # end def
+
+    def test_custom_codec(self):
+        with self.assertRaises(NotImplementedError):
+            JsonCodec().dumps({})
+        # end with
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
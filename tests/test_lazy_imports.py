@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+import unittest
+
+
+def imported_after(code):
+    """ Runs `code` in a new interpreter, returning the pytgbot modules and transports imported afterwards. """
+    output = subprocess.check_output([
+        sys.executable, "-c",
+        code + "\nimport sys; print(' '.join(m for m in sys.modules if m.startswith('pytgbot') or m in ('requests', 'httpx')))",
+    ], cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return set(output.decode().split())
+# end def
+
+
+class LazyImportsTestCase(unittest.TestCase):
+    def test_import_pytgbot(self):
+        modules = imported_after("import pytgbot")
+        self.assertNotIn('requests', modules)
+        self.assertNotIn('pytgbot.bot', modules)
+        self.assertNotIn('pytgbot.api_types', modules)
+    # end def
+
+    def test_api_types(self):
+        modules = imported_after("from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup")
+        self.assertNotIn('requests', modules)
+        self.assertNotIn('pytgbot.bot.base', modules)
+        self.assertNotIn('pytgbot.api_types.receivable.updates', modules)
+        modules = imported_after("from pytgbot.api_types.receivable.updates import Update")
+        self.assertNotIn('requests', modules)
+        self.assertNotIn('pytgbot.bot.base', modules)
+    # end def
+
+    def test_attributes(self):
+        import pytgbot
+        from pytgbot.bot.synchronous import SyncBot
+        from pytgbot.api_types.receivable.updates import WebhookInfo
+        from pytgbot.api_types.sendable.files import InputFile
+        self.assertIs(pytgbot.Bot, SyncBot)
+        self.assertIs(pytgbot.bot.Bot, SyncBot)
+        self.assertIs(pytgbot.api_types.receivable.WebhookInfo, WebhookInfo)
+        self.assertIs(pytgbot.api_types.sendable.files.InputFile, InputFile)
+        with self.assertRaises(AttributeError):
+            pytgbot.api_types.receivable.not_there
+        # end with
+        with self.assertRaises(ImportError):
+            from pytgbot import not_there
+        # end with
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
@@ -0,0 +1,124 @@
+import json
+import os
+import unittest
+
+from pytgbot.api_types import lazy_parsing
+from pytgbot.api_types.receivable.peer import ChatMemberAdministrator, User
+from pytgbot.api_types.receivable.updates import Update, Message
+from pytgbot.bot.synchronous import SyncBot
+from tests.fake_api_server import FakeApiServer
+
+
+with open(os.path.join(os.path.dirname(__file__), 'data', 'updates.json'), 'r') as f:
+    UPDATES = json.load(f)
+# end with
+
+
+def is_parsed(obj):
+    return not getattr(obj, '_lazy', False)
+# end def
+
+
+def get_set_fields(obj):
+    """
+    The names of the fields holding a value, looking at the slots directly so nothing is parsed by looking.
+    """
+    return {
+        name for cls in type(obj).__mro__ for name in cls.__dict__.get('__slots__', ())
+        if _has_slot_value(cls.__dict__[name], obj)
+    }
+# end def
+
+
+def _has_slot_value(descriptor, obj):
+    try:
+        descriptor.__get__(obj, type(obj))
+    except AttributeError:
+        return False
+    # end try
+    return True
+# end def
+
+
+class LazyParsingTestCase(unittest.TestCase):
+    def test_same_result(self):
+        for data in UPDATES:
+            lazy = Update.from_array_lazy(data)
+            self.assertEqual(lazy.to_array(), Update.from_array(data).to_array())
+            self.assertEqual(lazy.to_array(), data)
+        # end for
+    # end def
+
+    def test_nothing_parsed(self):
+        update = Update.from_array_lazy(UPDATES[0])
+        self.assertIsInstance(update, Update)
+        self.assertEqual(get_set_fields(update), {'_raw', '_lazy'})
+        self.assertEqual(update.update_id, 100001)
+        self.assertTrue(is_parsed(update))
+        message = update.message
+        self.assertIsInstance(message, Message)
+        self.assertFalse(is_parsed(message), 'contained objects are only parsed when used')
+        self.assertEqual(message.text, '/start')
+        self.assertFalse(is_parsed(message.chat))
+        self.assertFalse(is_parsed(message.from_peer))
+        self.assertFalse(is_parsed(message.entities[0]))
+        self.assertEqual(message.chat.id, 1111101)
+        self.assertTrue(is_parsed(message.chat))
+        self.assertFalse(is_parsed(message.from_peer))
+    # end def
+
+    def test_subclasses(self):
+        update = Update.from_array_lazy(UPDATES[8])
+        member = update.my_chat_member.new_chat_member
+        self.assertIsInstance(member, ChatMemberAdministrator)
+        self.assertFalse(is_parsed(member))
+        self.assertTrue(member.can_restrict_members)
+        self.assertIsInstance(member.user, User)
+    # end def
+
+    def test_set_attribute(self):
+        update = Update.from_array_lazy(UPDATES[0])
+        message = update.message
+        message.text = '/help'
+        self.assertEqual(message.text, '/help')
+        self.assertEqual(message.chat.id, 1111101, 'the other fields are still there')
+        self.assertIsNone(message._raw, 'it was changed, so the raw data is outdated')
+    # end def
+
+    def test_context(self):
+        with lazy_parsing():
+            updates = Update.from_array_list(UPDATES, list_level=1)
+        # end with
+        self.assertFalse(any(is_parsed(update) for update in updates))
+        self.assertTrue(is_parsed(Update.from_array(UPDATES[0])), 'only lazy within the context')
+        self.assertEqual([update.update_id for update in updates], [data['update_id'] for data in UPDATES])
+    # end def
+
+    def test_invalid(self):
+        update = Update.from_array_lazy({"update_id": 1, "message": {"message_id": 2}})
+        message = update.message  # fine, as long as nobody looks inside.
+        with self.assertRaises(TypeError):
+            message.chat
+        # end with
+        with self.assertRaises(TypeError):
+            message.chat  # still lazy, so it fails again instead of missing attributes.
+        # end with
+    # end def
+
+    def test_get_updates(self):
+        with FakeApiServer(results={"getUpdates": UPDATES}) as server:
+            with SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url, lazy_updates=True) as bot:
+                updates = bot.get_updates()
+            # end with
+        # end with
+        self.assertEqual(len(updates), len(UPDATES))
+        self.assertFalse(is_parsed(updates[0]))
+        self.assertEqual(updates[5].callback_query.data, 'cats:yes')
+        self.assertEqual([update.to_array() for update in updates], UPDATES)
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
@@ -0,0 +1,232 @@
+import asyncio
+import io
+import os
+import tempfile
+import tracemalloc
+import unittest
+from email.parser import BytesParser
+from email.policy import HTTP
+
+from pytgbot.api_types.sendable.files import InputFileFromDisk, InputFileFromStream, InputFileFromURL
+from pytgbot.bot.synchronous import SyncBot
+from pytgbot.multipart import MultipartEncoder, get_stream_size
+from tests.fake_api_server import FakeApiServer
+
+
+MESSAGE = {
+    "message_id": 1, "date": 0, "chat": {"id": 1234, "type": "private"},
+    "document": {"file_id": "DOC", "file_unique_id": "a"},
+}
+
+
+class NonSeekable(io.RawIOBase):
+    """
+    Like a pipe: can only be read once, and the size isn't known in advance.
+    """
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+    # end def
+
+    def readable(self):
+        return True
+    # end def
+
+    def readinto(self, buffer):
+        chunk = self._data.read(len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+    # end def
+# end class
+
+
+def parse_multipart(content_type, body):
+    """
+    :return: dict of `{field: (filename, mime, content)}`
+    """
+    message = BytesParser(policy=HTTP).parsebytes(b'Content-Type: ' + content_type.encode() + b'\r\n\r\n' + body)
+    return {
+        part.get_param('name', header='content-disposition'): (
+            part.get_filename(), part.get_content_type(), part.get_payload(decode=True),
+        ) for part in message.iter_parts()
+    }
+# end def
+
+
+class MultipartEncoderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'big.bin')
+        with open(self.path, 'wb') as f:
+            for i in range(256):
+                f.write(bytes([i]) * 64 * 1024)  # 16 MB
+            # end for
+        # end with
+    # end def
+
+    def test_body(self):
+        with open(self.path, 'rb') as f:
+            body = MultipartEncoder({
+                'document': ('big.bin', f, 'application/octet-stream'),
+                'thumb': ('thumb "1".jpg', b'\xff\xd8 thumb', 'image/jpeg'),
+            }, chunk_size=1000)
+            data = b''.join(body)
+        # end with
+        self.assertEqual(len(data), body.len)
+        parts = parse_multipart(body.content_type, data)
+        self.assertEqual(parts['thumb'], ('thumb %221%22.jpg', 'image/jpeg', b'\xff\xd8 thumb'))
+        with open(self.path, 'rb') as f:
+            self.assertEqual(parts['document'], ('big.bin', 'application/octet-stream', f.read()))
+        # end with
+    # end def
+
+    def test_mmap(self):
+        input_file = InputFileFromDisk(self.path, mime='application/octet-stream', use_mmap=True)
+        files = input_file.get_request_files('document')
+        body = MultipartEncoder(files)
+        tracemalloc.start()
+        try:
+            chunks = [len(chunk) for chunk in body]
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            body.close()
+        # end try
+        self.assertTrue(files['document'][1].closed)
+        self.assertEqual(sum(chunks), body.len)
+        self.assertLess(peak, 1024 * 1024, 'the mapped file is sent without copying it')
+        body = MultipartEncoder(input_file.get_request_files('document'), boundary='b')
+        with open(self.path, 'rb') as f:
+            expected = b''.join(MultipartEncoder({'document': ('big.bin', f, 'application/octet-stream')}, boundary='b'))
+        # end with
+        self.assertEqual(b''.join(bytes(chunk) for chunk in body), expected)
+        body.close()
+    # end def
+
+    def test_unknown_size(self):
+        body = MultipartEncoder({'document': ('pipe.txt', NonSeekable(b'x' * 100000), 'text/plain')})
+        self.assertIsNone(body.len)
+        self.assertNotIn('Content-Length', body.headers)
+        chunks = list(body)
+        self.assertNotIn(b'', chunks, 'an empty chunk would end a chunked transfer')
+        self.assertEqual(parse_multipart(body.content_type, b''.join(chunks))['document'][2], b'x' * 100000)
+    # end def
+
+    def test_stream_size(self):
+        stream = io.BytesIO(b'0123456789')
+        stream.seek(4)
+        self.assertEqual(get_stream_size(stream), 6)
+        self.assertEqual(stream.tell(), 4)
+        self.assertIsNone(get_stream_size(NonSeekable(b'1234')))
+    # end def
+
+    def test_shrunk_file(self):
+        stream = io.BytesIO(b'0123456789')
+        body = MultipartEncoder({'document': ('file.txt', stream, 'text/plain')})
+        stream.truncate(5)  # changed after the Content-Length was calculated
+        with self.assertRaises(IOError):
+            list(body)
+        # end with
+    # end def
+
+    def test_memory(self):
+        with open(self.path, 'rb') as f:
+            body = MultipartEncoder({'document': ('big.bin', f, 'application/octet-stream')})
+            tracemalloc.start()
+            try:
+                sent = 0
+                for chunk in body:  # like http.client does
+                    sent += len(chunk)
+                # end for
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            # end try
+        # end with
+        self.assertEqual(sent, body.len)
+        self.assertLess(peak, 1024 * 1024, 'the 16 MB file should never be in memory')
+    # end def
+
+    def test_async(self):
+        async def read_all(body):
+            return b''.join([chunk async for chunk in body.aiter_chunks()])
+        # end def
+
+        with open(self.path, 'rb') as f:
+            expected = b''.join(MultipartEncoder({'document': ('big.bin', f, None)}, boundary='b'))
+            f.seek(0)
+            data = asyncio.run(read_all(MultipartEncoder({'document': ('big.bin', f, None)}, boundary='b')))
+        # end with
+        self.assertEqual(data, expected)
+    # end def
+# end class
+
+
+class StreamingUploadTestCase(unittest.TestCase):
+    CONTENT = os.urandom(3 * 1024 * 1024)
+
+    def send(self, input_file, **server_kwargs):
+        with FakeApiServer(results={"sendDocument": MESSAGE}, **server_kwargs) as server:
+            if callable(input_file):
+                input_file = input_file(server)
+            # end if
+            with SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url) as bot:
+                message = bot.send_document(1234, input_file, caption='big')
+            # end with
+            self.assertEqual(message.document.file_id, 'DOC')
+            command, path, body = server.requests[-1]
+            self.assertIn('caption=big', path)
+            return server.last_headers, parse_multipart(server.last_headers['Content-Type'], body)
+        # end with
+    # end def
+
+    def test_disk(self):
+        path = os.path.join(tempfile.mkdtemp(), 'random.bin')
+        with open(path, 'wb') as f:
+            f.write(self.CONTENT)
+        # end with
+        headers, parts = self.send(InputFileFromDisk(path, mime='application/zip'))
+        self.assertEqual(parts['document'], ('random.bin', 'application/zip', self.CONTENT))
+        self.assertIsNotNone(headers['Content-Length'])
+    # end def
+
+    def test_stream(self):
+        headers, parts = self.send(InputFileFromStream(NonSeekable(self.CONTENT), name='random.zip'))
+        self.assertEqual(parts['document'], ('random.zip', 'application/zip', self.CONTENT))
+        self.assertEqual(headers['Transfer-Encoding'], 'chunked')
+    # end def
+
+    def test_seekable_stream(self):
+        stream = io.BytesIO(b'header' + self.CONTENT)
+        stream.seek(6)
+        input_file = InputFileFromStream(stream, name='random.bin')
+        self.assertEqual(input_file.size, len(self.CONTENT))
+        for _ in range(2):  # can be sent more than once
+            headers, parts = self.send(input_file)
+            self.assertEqual(parts['document'][2], self.CONTENT)
+        # end for
+    # end def
+
+    def test_url(self):
+        def input_file(server):
+            return InputFileFromURL(server.get_file_url('/files/random.bin'), stream=True)
+        # end def
+        headers, parts = self.send(input_file, files={'/files/random.bin': self.CONTENT})
+        self.assertEqual(parts['document'], ('random.bin', 'application/octet-stream', self.CONTENT))
+        self.assertIn('Content-Length', headers, 'the size is known from the download')
+    # end def
+
+    def test_fileupload(self):
+        with FakeApiServer(results={"sendDocument": MESSAGE}) as server:
+            with SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url) as bot:
+                bot._do_fileupload('document', InputFileFromStream(io.BytesIO(b'content'), name='a.txt'), chat_id=1234)
+            # end with
+            parts = parse_multipart(server.last_headers['Content-Type'], server.requests[-1][2])
+        # end with
+        self.assertEqual(parts['document'], ('a.txt', 'text/plain', b'content'))
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
@@ -0,0 +1,123 @@
+import asyncio
+import time
+import unittest
+from urllib.parse import urlparse, parse_qs
+
+from pytgbot.bot.synchronous import SyncBot
+from pytgbot.polling import PipelinedPoller, AsyncPipelinedPoller
+from tests.fake_api_server import FakeApiServer
+
+BATCHES = 5
+BATCH_SIZE = 3
+DELAY = 0.1
+
+
+def get_updates(command, path, body):
+    offset = int(parse_qs(urlparse(path).query).get('offset', ['1'])[0])
+    last = BATCHES * BATCH_SIZE
+    result = [
+        {"update_id": update_id, "message": {"message_id": update_id, "date": 0, "chat": {"id": 1, "type": "private"}}}
+        for update_id in range(offset, min(offset + BATCH_SIZE, last + 1))
+    ]
+    return 200, {"ok": True, "result": result}
+# end def
+
+
+class RecordedUpdatesBot(object):
+    """ Serves the updates one per request, with the `_get_updates__…` functions the pollers use. """
+    def __init__(self, update_ids):
+        self.update_ids = update_ids
+        self.offsets = []
+    # end def
+
+    def _get_updates__make_request(self, offset=None, limit=100, timeout=None, allowed_updates=None):
+        self.offsets.append(offset)
+        return [{"update_id": update_id} for update_id in self.update_ids if offset is None or update_id >= offset][:1]
+    # end def
+
+    def _get_updates__parse(self, result):
+        return result
+    # end def
+# end class
+
+
+class AsyncRecordedUpdatesBot(RecordedUpdatesBot):
+    async def _get_updates__make_request(self, *args, **kwargs):
+        return super(AsyncRecordedUpdatesBot, self)._get_updates__make_request(*args, **kwargs)
+    # end def
+# end class
+
+
+class PipelinedPollerTestCase(unittest.TestCase):
+    def test_prefetch_overlaps_handling(self):
+        with FakeApiServer(results={"getUpdates": get_updates}, delay=DELAY) as server:
+            with SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url) as bot:
+                poller = PipelinedPoller(bot, poll_timeout=1, offset=1)
+                seen = []
+                started = time.monotonic()
+                for batch in poller.iter_batches():
+                    seen.extend(update.update_id for update in batch)
+                    time.sleep(DELAY)  # a slow handler
+                    if len(seen) == BATCHES * BATCH_SIZE:
+                        poller.stop()
+                    # end if
+                # end for
+                duration = time.monotonic() - started
+            # end with
+        # end with
+        self.assertEqual(seen, list(range(1, BATCHES * BATCH_SIZE + 1)))
+        self.assertEqual(poller.stats.batches, BATCHES)
+        self.assertEqual(poller.offset, BATCHES * BATCH_SIZE + 1)
+        # serial polling would need 2 * DELAY per batch.
+        self.assertLess(duration, BATCHES * 2 * DELAY * 0.8, 'fetching should overlap with handling')
+        self.assertGreater(poller.stats.overlap_seconds, (BATCHES - 1) * DELAY * 0.5)
+    # end def
+
+    def test_stop_and_restart(self):
+        bot = RecordedUpdatesBot([1, 2, 3])
+        poller = PipelinedPoller(bot, error_delay=0)
+        handled = []
+        for update in poller:
+            handled.append(update['update_id'])
+            poller.stop()
+            time.sleep(0.05)  # update 2 is prefetched meanwhile, and dropped.
+        # end for
+        self.assertEqual(poller.offset, 2)
+        for update in poller:
+            handled.append(update['update_id'])
+            if update['update_id'] == 3:
+                poller.stop()
+            # end if
+        # end for
+        self.assertEqual(handled, [1, 2, 3], 'nothing skipped')
+        self.assertEqual(poller.offset, 4)
+        self.assertEqual(bot.offsets[:2], [None, 2])
+    # end def
+
+    def test_stop_and_restart_async(self):
+        bot = AsyncRecordedUpdatesBot([1, 2, 3])
+        poller = AsyncPipelinedPoller(bot, error_delay=0)
+        handled = []
+
+        async def poll(stop_at):
+            async for update in poller:
+                handled.append(update['update_id'])
+                if update['update_id'] >= stop_at:
+                    poller.stop()
+                    await asyncio.sleep(0.05)  # the next update is prefetched meanwhile, and dropped.
+                # end if
+            # end for
+        # end def
+
+        asyncio.run(poll(1))
+        self.assertEqual(poller.offset, 2)
+        asyncio.run(poll(3))
+        self.assertEqual(handled, [1, 2, 3], 'nothing skipped')
+        self.assertEqual(poller.offset, 4)
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
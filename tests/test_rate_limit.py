@@ -0,0 +1,139 @@
+import threading
+import time
+import unittest
+from datetime import timedelta
+
+from pytgbot.bot.synchronous import SyncBot
+from pytgbot.rate_limit import RateLimit, RateScheduler, is_rate_limited_command
+from tests.fake_api_server import FakeApiServer
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+    # end def
+
+    def __call__(self):
+        return self.now
+    # end def
+# end class
+
+
+class RateLimitTestCase(unittest.TestCase):
+    def test_window(self):
+        limit = RateLimit(3, 1.0)
+        at = []
+        for i in range(6):
+            slot = limit.earliest(0.0)
+            limit.take(slot)
+            at.append(round(slot, 6))
+        # end for
+        self.assertEqual(at, [0.0, 0.0, 0.0, 1.0, 1.0, 1.0])
+    # end def
+
+    def test_commands(self):
+        self.assertTrue(is_rate_limited_command('sendMessage'))
+        self.assertTrue(is_rate_limited_command('forwardMessage'))
+        self.assertTrue(is_rate_limited_command('copyMessage'))
+        self.assertFalse(is_rate_limited_command('sendChatAction'))
+        self.assertFalse(is_rate_limited_command('getUpdates'))
+        self.assertFalse(is_rate_limited_command('answerCallbackQuery'))
+    # end def
+# end class
+
+
+class RateSchedulerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = RateScheduler(clock=self.clock)
+    # end def
+
+    def test_private_chat(self):
+        delays = [self.scheduler.reserve('sendMessage', 1234) for _ in range(3)]
+        self.assertEqual(delays, [0.0, 1.0, 2.0])
+        self.assertEqual(self.scheduler.queue_depth, 3)
+        self.assertEqual(self.scheduler.get_queue_depth(1234), 3)
+        self.assertEqual(self.scheduler.get_queue_depth(5678), 0)
+        for _ in range(3):
+            self.scheduler.release(1234)
+        # end for
+        self.assertEqual(self.scheduler.queue_depth, 0)
+        self.assertEqual(self.scheduler.get_queue_depth(1234), 0)
+    # end def
+
+    def test_group_chat(self):
+        delays = [self.scheduler.reserve('sendMessage', -100123) for _ in range(21)]
+        self.assertEqual(delays[:20], [0.0] * 20)
+        self.assertAlmostEqual(delays[20], 60.0)
+        self.assertEqual(self.scheduler.reserve('sendMessage', '@channel'), 0.0)
+    # end def
+
+    def test_global(self):
+        delays = [self.scheduler.reserve('sendMessage', chat_id) for chat_id in range(1, 61)]
+        self.assertEqual(delays[:30], [0.0] * 30)
+        self.assertAlmostEqual(delays[30], 1.0)
+        self.assertEqual(delays[30:], [1.0] * 30)
+    # end def
+
+    def test_not_limited(self):
+        self.assertIsNone(self.scheduler.reserve('getMe'))
+        self.assertIsNone(self.scheduler.reserve('sendChatAction', 1234))
+        self.assertEqual(self.scheduler.queue_depth, 0)
+    # end def
+
+    def test_clock_advancing(self):
+        self.assertEqual(self.scheduler.reserve('sendMessage', 1234), 0.0)
+        self.clock.now += 5
+        self.assertEqual(self.scheduler.reserve('sendMessage', 1234), 0.0)
+    # end def
+
+    def test_wait_queues_threads(self):
+        scheduler = RateScheduler(private_chat_limit=(1, 0.05))
+        depths = []
+        threads = [threading.Thread(target=scheduler.wait, args=('sendMessage', 1234)) for _ in range(5)]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        # end for
+        time.sleep(0.02)
+        depths.append(scheduler.queue_depth)
+        for thread in threads:
+            thread.join()
+        # end for
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+        self.assertEqual(depths, [4])
+        self.assertEqual(scheduler.queue_depth, 0)
+    # end def
+# end class
+
+
+class BotSchedulerTestCase(unittest.TestCase):
+    def test_bot_uses_scheduler(self):
+        scheduler = RateScheduler(private_chat_limit=(1, 0.05))
+        with FakeApiServer(results={"sendMessage": {"message_id": 1, "date": 0, "chat": {"id": 1234, "type": "private"}}}) as server:
+            with SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url, scheduler=scheduler) as bot:
+                started = time.monotonic()
+                for i in range(4):
+                    bot.send_message(1234, 'hey')
+                # end for
+                self.assertGreaterEqual(time.monotonic() - started, 0.15)
+            # end with
+        # end with
+    # end def
+
+    def test_get_updates_delay(self):
+        bot = SyncBot('123:ABC')
+        delta = timedelta(milliseconds=100)
+        self.assertEqual(bot._get_updates__delay(delta, None), 0.0)
+        bot._last_update = time.monotonic()
+        self.assertGreater(bot._get_updates__delay(delta, None), 0.05)
+        self.assertEqual(bot._get_updates__delay(delta, 30), 0.0, 'long polling is not throttled')
+        bot._last_update = time.monotonic() - 1
+        self.assertEqual(bot._get_updates__delay(delta, 0), 0.0)
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
@@ -0,0 +1,172 @@
+import unittest
+from time import monotonic
+from urllib.parse import urlparse, parse_qs
+
+from pytgbot.bot.synchronous import SyncBot
+from pytgbot.exceptions import TgApiServerException, TgApiResponseException
+from pytgbot.rate_limit import RateScheduler
+from pytgbot.retry import RetryPolicy, is_idempotent_command
+from tests.fake_api_server import FakeApiServer
+
+MESSAGE = {"message_id": 1, "date": 0, "chat": {"id": 1234, "type": "private"}}
+
+
+def failing(*answers):
+    """
+    Answers with the given `(status, json)` tuples one after another, and with a success afterwards.
+    """
+    answers = list(answers)
+
+    def answer(command, path, body):
+        if answers:
+            return answers.pop(0)
+        # end if
+        return 200, {"ok": True, "result": MESSAGE if command == 'sendMessage' else True}
+    # end def
+    return answer
+# end def
+
+
+def flood(retry_after):
+    return 429, {
+        "ok": False, "error_code": 429, "description": "Too Many Requests: retry after {}".format(retry_after),
+        "parameters": {"retry_after": retry_after},
+    }
+# end def
+
+
+BAD_GATEWAY = (502, b"<html>Bad Gateway</html>")
+
+
+class RetryTestCase(unittest.TestCase):
+    def get_bot(self, server, **kwargs):
+        return SyncBot('123:ABC', base_url=server.base_url, download_url=server.download_url, **kwargs)
+    # end def
+
+    def test_no_retry_by_default(self):
+        with FakeApiServer(results={"sendMessage": failing(flood(3))}) as server:
+            with self.get_bot(server) as bot:
+                with self.assertRaises(TgApiServerException) as context:
+                    bot.send_message(1234, 'hey')
+                # end with
+            # end with
+        # end with
+        self.assertEqual(context.exception.error_code, 429)
+        self.assertEqual(context.exception.retry_after, 3)
+        self.assertIsNone(context.exception.migrate_to_chat_id)
+    # end def
+
+    def test_flood(self):
+        with FakeApiServer(results={"sendMessage": failing(flood(0), flood(0))}) as server:
+            with self.get_bot(server, retry=RetryPolicy()) as bot:
+                message = bot.send_message(1234, 'hey')
+            # end with
+            self.assertEqual(server.request_count, 3)
+        # end with
+        self.assertEqual(message.message_id, 1)
+    # end def
+
+    def test_flood_raw(self):
+        with FakeApiServer(results={"sendMessage": failing(flood(0))}) as server:
+            with self.get_bot(server, retry=RetryPolicy(), return_python_objects=False) as bot:
+                response = bot.send_message(1234, 'hey')
+            # end with
+            self.assertEqual(server.request_count, 2)
+        # end with
+        self.assertTrue(response['ok'])
+    # end def
+
+    def test_flood_too_long(self):
+        with FakeApiServer(results={"sendMessage": failing(flood(600))}) as server:
+            with self.get_bot(server, retry=RetryPolicy(max_retry_after=60)) as bot:
+                with self.assertRaises(TgApiServerException):
+                    bot.send_message(1234, 'hey')
+                # end with
+            # end with
+        # end with
+    # end def
+
+    def test_migration(self):
+        migrated = 400, {
+            "ok": False, "error_code": 400, "description": "Bad Request: group chat was upgraded to a supergroup chat",
+            "parameters": {"migrate_to_chat_id": -1001234},
+        }
+        with FakeApiServer(results={"sendMessage": failing(migrated)}) as server:
+            with self.get_bot(server, retry=RetryPolicy()) as bot:
+                bot.send_message(-1234, 'hey')
+            # end with
+            chat_ids = [parse_qs(urlparse(path).query)['chat_id'][0] for command, path, body in server.requests]
+        # end with
+        self.assertEqual(chat_ids, ['-1234', '-1001234'])
+    # end def
+
+    def test_server_error_idempotent(self):
+        with FakeApiServer(results={"getChat": failing(BAD_GATEWAY, BAD_GATEWAY)}) as server:
+            with self.get_bot(server, retry=RetryPolicy(backoff_base=0.01), return_python_objects=False) as bot:
+                self.assertTrue(bot.get_chat(1234)['ok'])
+            # end with
+            self.assertEqual(server.request_count, 3)
+        # end with
+    # end def
+
+    def test_server_error_not_idempotent(self):
+        with FakeApiServer(results={"sendMessage": failing(BAD_GATEWAY)}) as server:
+            with self.get_bot(server, retry=RetryPolicy(backoff_base=0.01)) as bot:
+                with self.assertRaises(TgApiResponseException) as context:
+                    bot.send_message(1234, 'hey')
+                # end with
+            # end with
+            self.assertEqual(server.request_count, 1, 'the message might already be sent')
+        # end with
+        self.assertEqual(context.exception.status_code, 502)
+    # end def
+
+    def test_max_retries(self):
+        with FakeApiServer(results={"getChat": failing(*[BAD_GATEWAY] * 10)}) as server:
+            with self.get_bot(server, retry=RetryPolicy(max_retries=2, backoff_base=0.01)) as bot:
+                with self.assertRaises(TgApiResponseException):
+                    bot.get_chat(1234)
+                # end with
+            # end with
+            self.assertEqual(server.request_count, 3)
+        # end with
+    # end def
+
+    def test_flood_pauses_chat_only(self):
+        now = [100.0]
+        scheduler = RateScheduler(clock=lambda: now[0])
+        policy = RetryPolicy()
+        delay = policy.get_delay('sendMessage', {'chat_id': 1234}, flood(5)[1], 0, scheduler=scheduler)
+        self.assertEqual(delay, 0.0, 'the scheduler does the waiting')
+        self.assertEqual(scheduler.reserve('sendMessage', 1234), 5.0)
+        self.assertEqual(scheduler.reserve('sendMessage', 5678), 0.0)
+        self.assertEqual(policy.get_delay('sendMessage', {'chat_id': 1234}, flood(5)[1], 0), 5)
+    # end def
+
+    def test_flood_not_rate_limited_command(self):
+        scheduler = RateScheduler()
+        policy = RetryPolicy()
+        delay = policy.get_delay('editMessageText', {'chat_id': 1234}, flood(5)[1], 0, scheduler=scheduler)
+        self.assertEqual(delay, 5, 'the scheduler only holds back sending messages')
+        with FakeApiServer(results={"deleteMessage": failing(flood(1))}) as server:
+            with self.get_bot(server, retry=RetryPolicy(), scheduler=RateScheduler()) as bot:
+                started = monotonic()
+                self.assertTrue(bot.delete_message(1234, 1))
+                self.assertGreaterEqual(monotonic() - started, 0.9)
+            # end with
+            self.assertEqual(server.request_count, 2)
+        # end with
+    # end def
+
+    def test_idempotent(self):
+        self.assertTrue(is_idempotent_command('getChat'))
+        self.assertTrue(is_idempotent_command('setWebhook'))
+        self.assertFalse(is_idempotent_command('getUpdates'))
+        self.assertFalse(is_idempotent_command('sendMessage'))
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
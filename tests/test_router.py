@@ -0,0 +1,140 @@
+import json
+import os
+import unittest
+
+from pytgbot.api_types import lazy_parsing, validation_mode, VALIDATION_TRUSTED
+from pytgbot.api_types.receivable.updates import Update, Message
+from pytgbot.router import UpdateRouter, get_update_type, get_message_content_type, get_message_command
+
+
+with open(os.path.join(os.path.dirname(__file__), 'data', 'updates.json'), 'r') as f:
+    UPDATES = json.load(f)
+# end with
+
+
+def message(**fields):
+    return dict({"message_id": 1, "date": 0, "chat": {"id": 1234, "type": "private"}}, **fields)
+# end def
+
+
+class UpdateTypeTestCase(unittest.TestCase):
+    def test_update_type(self):
+        expected = [
+            'message', 'message', 'message', 'message', 'edited_message',
+            'callback_query', 'inline_query', 'message', 'my_chat_member', 'channel_post',
+        ]
+        self.assertEqual([Update.from_array(data).update_type for data in UPDATES], expected)
+        with validation_mode(VALIDATION_TRUSTED):
+            self.assertEqual([Update.from_array(data).update_type for data in UPDATES], expected)
+        # end with
+        self.assertEqual([get_update_type(data) for data in UPDATES], expected)
+    # end def
+
+    def test_lazy(self):
+        with lazy_parsing():
+            update = Update.from_array(UPDATES[5])
+        # end with
+        self.assertEqual(update.update_type, 'callback_query')
+        self.assertTrue(update._lazy, 'not parsed for that')
+    # end def
+
+    def test_created(self):
+        update = Update(update_id=1, message=Message.from_array(message(text="Hi")))
+        self.assertEqual(update.update_type, 'message')
+        update.message = None
+        update.edited_message = Message.from_array(message(text="Hi"))
+        self.assertEqual(update.update_type, 'edited_message')
+        self.assertIsNone(Update(update_id=1).update_type)
+    # end def
+
+    def test_content_type(self):
+        self.assertEqual(get_message_content_type(message(text="Hi")), 'text')
+        self.assertEqual(get_message_content_type(message(document={}, animation={})), 'animation')
+        self.assertEqual(get_message_content_type(message(location={}, venue={})), 'venue')
+        self.assertEqual(get_message_content_type(Message.from_array(message(photo=[], caption="Hi"))), 'photo')
+        self.assertIsNone(get_message_content_type(message(some_future_content={})))
+    # end def
+
+    def test_command(self):
+        self.assertEqual(get_message_command(message(text="/start")), 'start')
+        self.assertEqual(get_message_command(message(text="/Start@ExampleBot foo bar"), 'examplebot'), 'start')
+        self.assertIsNone(get_message_command(message(text="/start@OtherBot"), 'ExampleBot'))
+        self.assertIsNone(get_message_command(message(text="start")))
+        self.assertIsNone(get_message_command(message(text="/ start")))
+        self.assertIsNone(get_message_command(message(text="/")))
+        self.assertIsNone(get_message_command(message(photo=[])))
+    # end def
+# end class
+
+
+class UpdateRouterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.router = UpdateRouter(default=self.handler('default'), bot_username='ExampleBot')
+        self.router.add_handler(self.handler('start'), 'message', command='start')
+        self.router.add_handler(self.handler('text'), 'message', content_type='text')
+        self.router.add_handler(self.handler('photo'), 'message', content_type='photo')
+        self.router.add_handler(self.handler('message'), 'message')
+        self.router.add_handler(self.handler('callback_query'), 'callback_query')
+    # end def
+
+    def handler(self, name):
+        def handle(update):
+            self.calls.append(name)
+            return name
+        # end def
+        return handle
+    # end def
+
+    def test_route(self):
+        for data in UPDATES:
+            self.router(Update.from_array(data))
+        # end for
+        self.assertEqual(self.calls, ['start', 'text', 'photo', 'text', 'default', 'callback_query', 'default', 'message', 'default', 'default'])
+    # end def
+
+    def test_dicts(self):
+        for data in UPDATES:
+            self.router(data)
+        # end for
+        self.assertEqual(self.calls, ['start', 'text', 'photo', 'text', 'default', 'callback_query', 'default', 'message', 'default', 'default'])
+    # end def
+
+    def test_other_bot(self):
+        self.assertEqual(self.router({"update_id": 1, "message": message(text="/start@OtherBot")}), 'text')
+        self.assertEqual(self.router({"update_id": 1, "message": message(text="/unknown")}), 'text')
+    # end def
+
+    def test_decorators(self):
+        router = UpdateRouter()
+
+        @router.command('/Help')
+        def help_command(update):
+            return 'help'
+        # end def
+
+        @router.on('edited_message', content_type='text')
+        def edited(update):
+            return 'edited'
+        # end def
+
+        self.assertIs(help_command(None), 'help', 'returns the function itself')
+        self.assertEqual(router({"update_id": 1, "message": message(text="/help")}), 'help')
+        self.assertEqual(router({"update_id": 1, "edited_message": message(text="/help")}), 'edited')
+        self.assertIsNone(router({"update_id": 1, "poll": {}}), 'no default')
+    # end def
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.router.add_handler(self.handler('x'), 'callback_query', content_type='text')
+        # end with
+        with self.assertRaises(ValueError):
+            self.router.add_handler(self.handler('x'), 'message', content_type='txt')
+        # end with
+    # end def
+# end class
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if